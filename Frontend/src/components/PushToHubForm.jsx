@@ -111,7 +111,7 @@ const PushToHubForm = ({ model, onClose, onPush }) => {
         },
         body: JSON.stringify({
           repo_name: repoName,
-          model_path: model.model_path,
+          model_path: model.path,
           private: isPrivate,
         }),
       });
@@ -229,7 +229,7 @@ const PushToHubForm = ({ model, onClose, onPush }) => {
                 <div>
                   <label className="block text-gray-300 font-medium mb-1">Model Name</label>
                   <div className="px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200">
-                    {model.model_name}
+                    {model.name}
                   </div>
                 </div>
 
@@ -250,7 +250,7 @@ const PushToHubForm = ({ model, onClose, onPush }) => {
                 <div>
                   <label className="block text-gray-300 font-medium mb-1">Local Model Path</label>
                   <div className="px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200 break-all text-sm">
-                    {model.model_path}
+                    {model.path}
                   </div>
                 </div>
 
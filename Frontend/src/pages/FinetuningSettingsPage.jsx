@@ -233,7 +233,7 @@ const FinetuneSettings = ({ defaultValues, updateSettings }) => {
     task: "What you want your AI to be good at doing",
     model_name: "The base AI model you're customizing",
     provider: "Model provider (HuggingFace for standard, Unsloth for 2x faster training)",
-    strategy: "Training method (SFT for basic, RLHF for preference learning, DPO for direct optimization, QLoRA for memory efficiency)",
+    strategy: "Training method (SFT for basic, RLHF for preference learning, DPO for direct optimization, ORPO/SimPO for reference-free preference training, QLoRA for memory efficiency)",
     gpu: "The graphics card that will run your training",
     ram: "Computer memory available for training",
     num_train_epochs: "How many times the AI will see your training data",
@@ -262,6 +262,8 @@ const FinetuneSettings = ({ defaultValues, updateSettings }) => {
     sft: "Supervised Fine-Tuning - Standard approach with LoRA",
     rlhf: "Reinforcement Learning from Human Feedback - Preference-based training",
     dpo: "Direct Preference Optimization - Simpler alternative to RLHF",
+    orpo: "Odds Ratio Preference Optimization - Preference training without a reference model",
+    simpo: "Simple Preference Optimization - Reference-free, length-normalized preference training",
     qlora: "Quantized LoRA - Memory-efficient training with 4-bit quantization"
   };
 
@@ -521,7 +523,7 @@ const FinetuneSettings = ({ defaultValues, updateSettings }) => {
                     type="file"
                     id="dataset_file"
                     name="dataset_file"
-                    accept=".json,.jsonl"
+                    accept=".json,.jsonl,.gz,.zst,.parquet,.arrow,.feather"
                     className="hidden"
                     onChange={handleFileChange}
                   />
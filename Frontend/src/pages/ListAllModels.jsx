@@ -13,15 +13,26 @@ const ListAllModels = () => {
   const [errorDetails, setErrorDetails] = useState(null);
 
   useEffect(() => {
-    fetch(config.baseURL + "/models/")
-      .then((res) => {
+    const fetchAllPages = async () => {
+      const allModels = [];
+      let cursor = null;
+      do {
+        const params = new URLSearchParams({ limit: "500" });
+        if (cursor) params.set("cursor", cursor);
+        const res = await fetch(`${config.baseURL}/models/?${params}`);
         if (!res.ok) {
           throw new Error(`Failed to fetch models: HTTP ${res.status} ${res.statusText}`);
         }
-        return res.json();
-      })
-      .then((data) => {
-        setModels(data.models || []);
+        const data = await res.json();
+        allModels.push(...(data.models || []));
+        cursor = data.next_cursor;
+      } while (cursor);
+      return allModels;
+    };
+
+    fetchAllPages()
+      .then((allModels) => {
+        setModels(allModels);
         setLoading(false);
       })
       .catch((err) => {
@@ -115,14 +126,14 @@ const ListAllModels = () => {
                     models.map((model, idx) => (
                       <tr key={model.id} className={idx % 2 === 0 ? "bg-gray-900/60" : "bg-gray-800/80"}>
                         <td className="px-4 py-3 text-gray-200">{model.id}</td>
-                        <td className="px-4 py-3 text-orange-300 break-all">{model.model_name}</td>
+                        <td className="px-4 py-3 text-orange-300 break-all">{model.name}</td>
                         <td className="px-4 py-3 text-gray-300 break-all">{model.base_model}</td>
                         <td className="px-4 py-3 text-gray-300">{model.task}</td>
                         <td className="px-4 py-3 text-gray-400">{model.description}</td>
                         <td className="px-4 py-3 text-gray-400">{new Date(model.creation_date).toLocaleString()}</td>
-                        <td className="px-4 py-3 text-gray-400 break-all max-w-xs">{model.model_path}</td>
+                        <td className="px-4 py-3 text-gray-400 break-all max-w-xs">{model.path}</td>
                         <td className="px-4 py-3">
-                          <button onClick={() => handleOpenPlayground(model.model_path)} className="text-orange-400 underline hover:text-orange-300 transition cursor-pointer">
+                          <button onClick={() => handleOpenPlayground(model.path)} className="text-orange-400 underline hover:text-orange-300 transition cursor-pointer">
                             Open
                           </button>
                         </td>
@@ -145,16 +156,16 @@ const ListAllModels = () => {
               ) : (
                 models.map((model) => (
                   <div key={model.id} className="bg-gray-800 rounded-xl p-4 shadow-md">
-                    <div className="text-orange-300 font-semibold text-lg break-all">{model.model_name}</div>
+                    <div className="text-orange-300 font-semibold text-lg break-all">{model.name}</div>
                     <div className="text-gray-400 text-sm mb-2">{model.description}</div>
                     <div className="text-sm text-gray-300">
                       <div><span className="font-medium text-orange-400">Base:</span> {model.base_model}</div>
                       <div><span className="font-medium text-orange-400">Task:</span> {model.task}</div>
                       <div><span className="font-medium text-orange-400">Created:</span> {new Date(model.creation_date).toLocaleString()}</div>
-                      <div className="break-all"><span className="font-medium text-orange-400">Path:</span> {model.model_path}</div>
+                      <div className="break-all"><span className="font-medium text-orange-400">Path:</span> {model.path}</div>
                     </div>
                     <div className="mt-4 flex flex-wrap gap-2">
-                      <button onClick={() => handleOpenPlayground(model.model_path)} className="text-sm bg-transparent text-orange-400 underline hover:text-orange-300">
+                      <button onClick={() => handleOpenPlayground(model.path)} className="text-sm bg-transparent text-orange-400 underline hover:text-orange-300">
                         Open Playground
                       </button>
                       <button onClick={() => { setSelectedModel(model); setShowPushForm(true); }} className="text-sm bg-orange-500 text-white rounded-md px-3 py-1 hover:bg-orange-400">
@@ -10,12 +10,21 @@ const ListModelsPage = () => {
   useEffect(() => {
     const fetchModels = async () => {
       try {
-        const response = await fetch('/api/models/all');
-        if (!response.ok) {
-          throw new Error('Failed to fetch models');
-        }
-        const data = await response.json();
-        setModels(data.models);
+        // The endpoint is paginated; follow next_cursor until the last page
+        const allModels = [];
+        let cursor = null;
+        do {
+          const params = new URLSearchParams({ limit: '500' });
+          if (cursor) params.set('cursor', cursor);
+          const response = await fetch(`/api/models/all?${params}`);
+          if (!response.ok) {
+            throw new Error('Failed to fetch models');
+          }
+          const data = await response.json();
+          allModels.push(...(data.models || []));
+          cursor = data.next_cursor;
+        } while (cursor);
+        setModels(allModels);
       } catch (err) {
         setError(err.message);
       } finally {
@@ -29,26 +29,66 @@ export const getSystemInfo = async () => {
     }
 };
 
+const UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024;
+const UPLOAD_RETRIES = 3;
+
 /**
- * Upload dataset file
+ * Upload dataset file in resumable chunks
  * @param {File} file - Dataset file (JSON/JSONL)
  * @param {Object} settings - Training settings
  * @returns {Promise<Object>} Upload response
  */
 export const uploadDataset = async (file, settings) => {
-    try {
-        const formData = new FormData();
-        formData.append('json_file', file, file.name);
-        formData.append('settings', JSON.stringify(settings));
+    const readError = async (response, action) => {
+        const errorData = await response.json().catch(() => ({}));
+        const error = new Error(errorData.detail || `${action} failed: ${response.status}`);
+        // Rejected chunks are not retried; 409 means the offset is out of sync
+        error.retry = response.status === 409 || response.status >= 500;
+        return error;
+    };
 
-        const response = await fetch(`${config.baseURL}/finetune/load_settings`, {
+    try {
+        const uploadsURL = `${config.baseURL}/finetune/uploads`;
+        const startResponse = await fetch(uploadsURL, {
             method: 'POST',
-            body: formData,
+            headers: config.headers,
+            body: JSON.stringify({ filename: file.name, total_size: file.size }),
         });
+        if (!startResponse.ok) {
+            throw await readError(startResponse, 'Upload');
+        }
+        const upload = await startResponse.json();
+        const uploadURL = `${uploadsURL}/${upload.upload_id}`;
+
+        let offset = 0;
+        let retries = 0;
+        while (offset < file.size) {
+            try {
+                const response = await fetch(`${uploadURL}?offset=${offset}`, {
+                    method: 'PUT',
+                    body: file.slice(offset, offset + UPLOAD_CHUNK_SIZE),
+                });
+                if (!response.ok) {
+                    throw await readError(response, 'Upload');
+                }
+                offset = (await response.json()).offset;
+                retries = 0;
+            } catch (error) {
+                if (error.retry === false || ++retries > UPLOAD_RETRIES) {
+                    throw error;
+                }
+                // Resume from what the server has received
+                const state = await fetch(uploadURL);
+                if (!state.ok) {
+                    throw await readError(state, 'Upload');
+                }
+                offset = (await state.json()).offset;
+            }
+        }
 
+        const response = await fetch(`${uploadURL}/complete`, { method: 'POST' });
         if (!response.ok) {
-            const errorData = await response.json().catch(() => ({}));
-            throw new Error(errorData.detail || `Upload failed: ${response.status}`);
+            throw await readError(response, 'Upload');
         }
 
         return await response.json();
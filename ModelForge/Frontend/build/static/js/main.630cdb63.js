@@ -1,3 +1,3 @@
 /*! For license information please see main.630cdb63.js.LICENSE.txt */
-(()=>{"use strict";var e={4:(e,t,n)=>{var r=n(853),a=n(43),l=n(950);function o(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function i(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function s(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function c(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function u(e){if(s(e)!==e)throw Error(o(188))}function d(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e;for(e=e.child;null!==e;){if(null!==(t=d(e)))return t;e=e.sibling}return null}var f=Object.assign,m=Symbol.for("react.element"),p=Symbol.for("react.transitional.element"),h=Symbol.for("react.portal"),g=Symbol.for("react.fragment"),v=Symbol.for("react.strict_mode"),b=Symbol.for("react.profiler"),y=Symbol.for("react.provider"),x=Symbol.for("react.consumer"),w=Symbol.for("react.context"),k=Symbol.for("react.forward_ref"),j=Symbol.for("react.suspense"),N=Symbol.for("react.suspense_list"),S=Symbol.for("react.memo"),_=Symbol.for("react.lazy");Symbol.for("react.scope");var C=Symbol.for("react.activity");Symbol.for("react.legacy_hidden"),Symbol.for("react.tracing_marker");var E=Symbol.for("react.memo_cache_sentinel");Symbol.for("react.view_transition");var P=Symbol.iterator;function L(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=P&&e[P]||e["@@iterator"])?e:null}var z=Symbol.for("react.client.reference");function T(e){if(null==e)return null;if("function"===typeof e)return e.$$typeof===z?null:e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case g:return"Fragment";case b:return"Profiler";case v:return"StrictMode";case j:return"Suspense";case N:return"SuspenseList";case C:return"Activity"}if("object"===typeof e)switch(e.$$typeof){case h:return"Portal";case w:return(e.displayName||"Context")+".Provider";case x:return(e._context.displayName||"Context")+".Consumer";case k:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case S:return null!==(t=e.displayName||null)?t:T(e.type)||"Memo";case _:t=e._payload,e=e._init;try{return T(e(t))}catch(n){}}return null}var M=Array.isArray,R=a.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,O=l.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,A={pending:!1,data:null,method:null,action:null},F=[],D=-1;function H(e){return{current:e}}function I(e){0>D||(e.current=F[D],F[D]=null,D--)}function U(e,t){D++,F[D]=e.current,e.current=t}var B=H(null),V=H(null),W=H(null),q=H(null);function $(e,t){switch(U(W,t),U(V,e),U(B,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?ad(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)e=ld(t=ad(t),e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}I(B),U(B,e)}function Q(){I(B),I(V),I(W)}function G(e){null!==e.memoizedState&&U(q,e);var t=B.current,n=ld(t,e.type);t!==n&&(U(V,e),U(B,n))}function Y(e){V.current===e&&(I(B),I(V)),q.current===e&&(I(q),Gd._currentValue=A)}var K=Object.prototype.hasOwnProperty,J=r.unstable_scheduleCallback,X=r.unstable_cancelCallback,Z=r.unstable_shouldYield,ee=r.unstable_requestPaint,te=r.unstable_now,ne=r.unstable_getCurrentPriorityLevel,re=r.unstable_ImmediatePriority,ae=r.unstable_UserBlockingPriority,le=r.unstable_NormalPriority,oe=r.unstable_LowPriority,ie=r.unstable_IdlePriority,se=r.log,ce=r.unstable_setDisableYieldValue,ue=null,de=null;function fe(e){if("function"===typeof se&&ce(e),de&&"function"===typeof de.setStrictMode)try{de.setStrictMode(ue,e)}catch(t){}}var me=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(pe(e)/he|0)|0},pe=Math.log,he=Math.LN2;var ge=256,ve=4194304;function be(e){var t=42&e;if(0!==t)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194048&e;case 4194304:case 8388608:case 16777216:case 33554432:return 62914560&e;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function ye(e,t,n){var r=e.pendingLanes;if(0===r)return 0;var a=0,l=e.suspendedLanes,o=e.pingedLanes;e=e.warmLanes;var i=134217727&r;return 0!==i?0!==(r=i&~l)?a=be(r):0!==(o&=i)?a=be(o):n||0!==(n=i&~e)&&(a=be(n)):0!==(i=r&~l)?a=be(i):0!==o?a=be(o):n||0!==(n=r&~e)&&(a=be(n)),0===a?0:0!==t&&t!==a&&0===(t&l)&&((l=a&-a)>=(n=t&-t)||32===l&&0!==(4194048&n))?t:a}function xe(e,t){return 0===(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)}function we(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function ke(){var e=ge;return 0===(4194048&(ge<<=1))&&(ge=256),e}function je(){var e=ve;return 0===(62914560&(ve<<=1))&&(ve=4194304),e}function Ne(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Se(e,t){e.pendingLanes|=t,268435456!==t&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function _e(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var r=31-me(t);e.entangledLanes|=t,e.entanglements[r]=1073741824|e.entanglements[r]|4194090&n}function Ce(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-me(n),a=1<<r;a&t|e[r]&t&&(e[r]|=t),n&=~a}}function Ee(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function Pe(e){return 2<(e&=-e)?8<e?0!==(134217727&e)?32:268435456:8:2}function Le(){var e=O.p;return 0!==e?e:void 0===(e=window.event)?32:uf(e.type)}var ze=Math.random().toString(36).slice(2),Te="__reactFiber$"+ze,Me="__reactProps$"+ze,Re="__reactContainer$"+ze,Oe="__reactEvents$"+ze,Ae="__reactListeners$"+ze,Fe="__reactHandles$"+ze,De="__reactResources$"+ze,He="__reactMarker$"+ze;function Ie(e){delete e[Te],delete e[Me],delete e[Oe],delete e[Ae],delete e[Fe]}function Ue(e){var t=e[Te];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Re]||n[Te]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=yd(e);null!==e;){if(n=e[Te])return n;e=yd(e)}return t}n=(e=n).parentNode}return null}function Be(e){if(e=e[Te]||e[Re]){var t=e.tag;if(5===t||6===t||13===t||26===t||27===t||3===t)return e}return null}function Ve(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e.stateNode;throw Error(o(33))}function We(e){var t=e[De];return t||(t=e[De]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function qe(e){e[He]=!0}var $e=new Set,Qe={};function Ge(e,t){Ye(e,t),Ye(e+"Capture",t)}function Ye(e,t){for(Qe[e]=t,e=0;e<t.length;e++)$e.add(t[e])}var Ke,Je,Xe=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Ze={},et={};function tt(e,t,n){if(a=t,K.call(et,a)||!K.call(Ze,a)&&(Xe.test(a)?et[a]=!0:(Ze[a]=!0,0)))if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":return void e.removeAttribute(t);case"boolean":var r=t.toLowerCase().slice(0,5);if("data-"!==r&&"aria-"!==r)return void e.removeAttribute(t)}e.setAttribute(t,""+n)}var a}function nt(e,t,n){if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(t)}e.setAttribute(t,""+n)}}function rt(e,t,n,r){if(null===r)e.removeAttribute(n);else{switch(typeof r){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(n)}e.setAttributeNS(t,n,""+r)}}function at(e){if(void 0===Ke)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ke=t&&t[1]||"",Je=-1<n.stack.indexOf("\n    at")?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return"\n"+Ke+e+Je}var lt=!1;function ot(e,t){if(!e||lt)return"";lt=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var r={DetermineComponentFrameRoot:function(){try{if(t){var n=function(){throw Error()};if(Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(a){var r=a}Reflect.construct(e,[],n)}else{try{n.call()}catch(l){r=l}e.call(n.prototype)}}else{try{throw Error()}catch(o){r=o}(n=e())&&"function"===typeof n.catch&&n.catch((function(){}))}}catch(i){if(i&&r&&"string"===typeof i.stack)return[i.stack,r.stack]}return[null,null]}};r.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var a=Object.getOwnPropertyDescriptor(r.DetermineComponentFrameRoot,"name");a&&a.configurable&&Object.defineProperty(r.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var l=r.DetermineComponentFrameRoot(),o=l[0],i=l[1];if(o&&i){var s=o.split("\n"),c=i.split("\n");for(a=r=0;r<s.length&&!s[r].includes("DetermineComponentFrameRoot");)r++;for(;a<c.length&&!c[a].includes("DetermineComponentFrameRoot");)a++;if(r===s.length||a===c.length)for(r=s.length-1,a=c.length-1;1<=r&&0<=a&&s[r]!==c[a];)a--;for(;1<=r&&0<=a;r--,a--)if(s[r]!==c[a]){if(1!==r||1!==a)do{if(r--,0>--a||s[r]!==c[a]){var u="\n"+s[r].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}}while(1<=r&&0<=a);break}}}finally{lt=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?at(n):""}function it(e){switch(e.tag){case 26:case 27:case 5:return at(e.type);case 16:return at("Lazy");case 13:return at("Suspense");case 19:return at("SuspenseList");case 0:case 15:return ot(e.type,!1);case 11:return ot(e.type.render,!1);case 1:return ot(e.type,!0);case 31:return at("Activity");default:return""}}function st(e){try{var t="";do{t+=it(e),e=e.return}while(e);return t}catch(n){return"\nError generating stack: "+n.message+"\n"+n.stack}}function ct(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function ut(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function dt(e){e._valueTracker||(e._valueTracker=function(e){var t=ut(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var a=n.get,l=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return a.call(this)},set:function(e){r=""+e,l.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function ft(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ut(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function mt(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}var pt=/[\n"\\]/g;function ht(e){return e.replace(pt,(function(e){return"\\"+e.charCodeAt(0).toString(16)+" "}))}function gt(e,t,n,r,a,l,o,i){e.name="",null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o?e.type=o:e.removeAttribute("type"),null!=t?"number"===o?(0===t&&""===e.value||e.value!=t)&&(e.value=""+ct(t)):e.value!==""+ct(t)&&(e.value=""+ct(t)):"submit"!==o&&"reset"!==o||e.removeAttribute("value"),null!=t?bt(e,o,ct(t)):null!=n?bt(e,o,ct(n)):null!=r&&e.removeAttribute("value"),null==a&&null!=l&&(e.defaultChecked=!!l),null!=a&&(e.checked=a&&"function"!==typeof a&&"symbol"!==typeof a),null!=i&&"function"!==typeof i&&"symbol"!==typeof i&&"boolean"!==typeof i?e.name=""+ct(i):e.removeAttribute("name")}function vt(e,t,n,r,a,l,o,i){if(null!=l&&"function"!==typeof l&&"symbol"!==typeof l&&"boolean"!==typeof l&&(e.type=l),null!=t||null!=n){if(!("submit"!==l&&"reset"!==l||void 0!==t&&null!==t))return;n=null!=n?""+ct(n):"",t=null!=t?""+ct(t):n,i||t===e.value||(e.value=t),e.defaultValue=t}r="function"!==typeof(r=null!=r?r:a)&&"symbol"!==typeof r&&!!r,e.checked=i?e.checked:!!r,e.defaultChecked=!!r,null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o&&(e.name=o)}function bt(e,t,n){"number"===t&&mt(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function yt(e,t,n,r){if(e=e.options,t){t={};for(var a=0;a<n.length;a++)t["$"+n[a]]=!0;for(n=0;n<e.length;n++)a=t.hasOwnProperty("$"+e[n].value),e[n].selected!==a&&(e[n].selected=a),a&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ct(n),t=null,a=0;a<e.length;a++){if(e[a].value===n)return e[a].selected=!0,void(r&&(e[a].defaultSelected=!0));null!==t||e[a].disabled||(t=e[a])}null!==t&&(t.selected=!0)}}function xt(e,t,n){null==t||((t=""+ct(t))!==e.value&&(e.value=t),null!=n)?e.defaultValue=null!=n?""+ct(n):"":e.defaultValue!==t&&(e.defaultValue=t)}function wt(e,t,n,r){if(null==t){if(null!=r){if(null!=n)throw Error(o(92));if(M(r)){if(1<r.length)throw Error(o(93));r=r[0]}n=r}null==n&&(n=""),t=n}n=ct(t),e.defaultValue=n,(r=e.textContent)===n&&""!==r&&null!==r&&(e.value=r)}function kt(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var jt=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Nt(e,t,n){var r=0===t.indexOf("--");null==n||"boolean"===typeof n||""===n?r?e.setProperty(t,""):"float"===t?e.cssFloat="":e[t]="":r?e.setProperty(t,n):"number"!==typeof n||0===n||jt.has(t)?"float"===t?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function St(e,t,n){if(null!=t&&"object"!==typeof t)throw Error(o(62));if(e=e.style,null!=n){for(var r in n)!n.hasOwnProperty(r)||null!=t&&t.hasOwnProperty(r)||(0===r.indexOf("--")?e.setProperty(r,""):"float"===r?e.cssFloat="":e[r]="");for(var a in t)r=t[a],t.hasOwnProperty(a)&&n[a]!==r&&Nt(e,a,r)}else for(var l in t)t.hasOwnProperty(l)&&Nt(e,l,t[l])}function _t(e){if(-1===e.indexOf("-"))return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Ct=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Et=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Pt(e){return Et.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var Lt=null;function zt(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Tt=null,Mt=null;function Rt(e){var t=Be(e);if(t&&(e=t.stateNode)){var n=e[Me]||null;e:switch(e=t.stateNode,t.type){case"input":if(gt(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+ht(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var a=r[Me]||null;if(!a)throw Error(o(90));gt(r,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name)}}for(t=0;t<n.length;t++)(r=n[t]).form===e.form&&ft(r)}break e;case"textarea":xt(e,n.value,n.defaultValue);break e;case"select":null!=(t=n.value)&&yt(e,!!n.multiple,t,!1)}}}var Ot=!1;function At(e,t,n){if(Ot)return e(t,n);Ot=!0;try{return e(t)}finally{if(Ot=!1,(null!==Tt||null!==Mt)&&(Uc(),Tt&&(t=Tt,e=Mt,Mt=Tt=null,Rt(t),e)))for(t=0;t<e.length;t++)Rt(e[t])}}function Ft(e,t){var n=e.stateNode;if(null===n)return null;var r=n[Me]||null;if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(o(231,t,typeof n));return n}var Dt=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),Ht=!1;if(Dt)try{var It={};Object.defineProperty(It,"passive",{get:function(){Ht=!0}}),window.addEventListener("test",It,It),window.removeEventListener("test",It,It)}catch(Rf){Ht=!1}var Ut=null,Bt=null,Vt=null;function Wt(){if(Vt)return Vt;var e,t,n=Bt,r=n.length,a="value"in Ut?Ut.value:Ut.textContent,l=a.length;for(e=0;e<r&&n[e]===a[e];e++);var o=r-e;for(t=1;t<=o&&n[r-t]===a[l-t];t++);return Vt=a.slice(e,1<t?1-t:void 0)}function qt(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function $t(){return!0}function Qt(){return!1}function Gt(e){function t(t,n,r,a,l){for(var o in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=a,this.target=l,this.currentTarget=null,e)e.hasOwnProperty(o)&&(t=e[o],this[o]=t?t(a):a[o]);return this.isDefaultPrevented=(null!=a.defaultPrevented?a.defaultPrevented:!1===a.returnValue)?$t:Qt,this.isPropagationStopped=Qt,this}return f(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=$t)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=$t)},persist:function(){},isPersistent:$t}),t}var Yt,Kt,Jt,Xt={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Zt=Gt(Xt),en=f({},Xt,{view:0,detail:0}),tn=Gt(en),nn=f({},en,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:pn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Jt&&(Jt&&"mousemove"===e.type?(Yt=e.screenX-Jt.screenX,Kt=e.screenY-Jt.screenY):Kt=Yt=0,Jt=e),Yt)},movementY:function(e){return"movementY"in e?e.movementY:Kt}}),rn=Gt(nn),an=Gt(f({},nn,{dataTransfer:0})),ln=Gt(f({},en,{relatedTarget:0})),on=Gt(f({},Xt,{animationName:0,elapsedTime:0,pseudoElement:0})),sn=Gt(f({},Xt,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),cn=Gt(f({},Xt,{data:0})),un={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},dn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function mn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=fn[e])&&!!t[e]}function pn(){return mn}var hn=Gt(f({},en,{key:function(e){if(e.key){var t=un[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=qt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?dn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:pn,charCode:function(e){return"keypress"===e.type?qt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?qt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),gn=Gt(f({},nn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),vn=Gt(f({},en,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:pn})),bn=Gt(f({},Xt,{propertyName:0,elapsedTime:0,pseudoElement:0})),yn=Gt(f({},nn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),xn=Gt(f({},Xt,{newState:0,oldState:0})),wn=[9,13,27,32],kn=Dt&&"CompositionEvent"in window,jn=null;Dt&&"documentMode"in document&&(jn=document.documentMode);var Nn=Dt&&"TextEvent"in window&&!jn,Sn=Dt&&(!kn||jn&&8<jn&&11>=jn),_n=String.fromCharCode(32),Cn=!1;function En(e,t){switch(e){case"keyup":return-1!==wn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Pn(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var Ln=!1;var zn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Tn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!zn[e.type]:"textarea"===t}function Mn(e,t,n,r){Tt?Mt?Mt.push(r):Mt=[r]:Tt=r,0<(t=Wu(t,"onChange")).length&&(n=new Zt("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Rn=null,On=null;function An(e){Au(e,0)}function Fn(e){if(ft(Ve(e)))return e}function Dn(e,t){if("change"===e)return t}var Hn=!1;if(Dt){var In;if(Dt){var Un="oninput"in document;if(!Un){var Bn=document.createElement("div");Bn.setAttribute("oninput","return;"),Un="function"===typeof Bn.oninput}In=Un}else In=!1;Hn=In&&(!document.documentMode||9<document.documentMode)}function Vn(){Rn&&(Rn.detachEvent("onpropertychange",Wn),On=Rn=null)}function Wn(e){if("value"===e.propertyName&&Fn(On)){var t=[];Mn(t,On,e,zt(e)),At(An,t)}}function qn(e,t,n){"focusin"===e?(Vn(),On=n,(Rn=t).attachEvent("onpropertychange",Wn)):"focusout"===e&&Vn()}function $n(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Fn(On)}function Qn(e,t){if("click"===e)return Fn(t)}function Gn(e,t){if("input"===e||"change"===e)return Fn(t)}var Yn="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function Kn(e,t){if(Yn(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var a=n[r];if(!K.call(t,a)||!Yn(e[a],t[a]))return!1}return!0}function Jn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Xn(e,t){var n,r=Jn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Jn(r)}}function Zn(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?Zn(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function er(e){for(var t=mt((e=null!=e&&null!=e.ownerDocument&&null!=e.ownerDocument.defaultView?e.ownerDocument.defaultView:window).document);t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=mt((e=t.contentWindow).document)}return t}function tr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var nr=Dt&&"documentMode"in document&&11>=document.documentMode,rr=null,ar=null,lr=null,or=!1;function ir(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;or||null==rr||rr!==mt(r)||("selectionStart"in(r=rr)&&tr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},lr&&Kn(lr,r)||(lr=r,0<(r=Wu(ar,"onSelect")).length&&(t=new Zt("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=rr)))}function sr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var cr={animationend:sr("Animation","AnimationEnd"),animationiteration:sr("Animation","AnimationIteration"),animationstart:sr("Animation","AnimationStart"),transitionrun:sr("Transition","TransitionRun"),transitionstart:sr("Transition","TransitionStart"),transitioncancel:sr("Transition","TransitionCancel"),transitionend:sr("Transition","TransitionEnd")},ur={},dr={};function fr(e){if(ur[e])return ur[e];if(!cr[e])return e;var t,n=cr[e];for(t in n)if(n.hasOwnProperty(t)&&t in dr)return ur[e]=n[t];return e}Dt&&(dr=document.createElement("div").style,"AnimationEvent"in window||(delete cr.animationend.animation,delete cr.animationiteration.animation,delete cr.animationstart.animation),"TransitionEvent"in window||delete cr.transitionend.transition);var mr=fr("animationend"),pr=fr("animationiteration"),hr=fr("animationstart"),gr=fr("transitionrun"),vr=fr("transitionstart"),br=fr("transitioncancel"),yr=fr("transitionend"),xr=new Map,wr="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function kr(e,t){xr.set(e,t),Ge(t,[e])}wr.push("scrollEnd");var jr=new WeakMap;function Nr(e,t){if("object"===typeof e&&null!==e){var n=jr.get(e);return void 0!==n?n:(t={value:e,source:t,stack:st(t)},jr.set(e,t),t)}return{value:e,source:t,stack:st(t)}}var Sr=[],_r=0,Cr=0;function Er(){for(var e=_r,t=Cr=_r=0;t<e;){var n=Sr[t];Sr[t++]=null;var r=Sr[t];Sr[t++]=null;var a=Sr[t];Sr[t++]=null;var l=Sr[t];if(Sr[t++]=null,null!==r&&null!==a){var o=r.pending;null===o?a.next=a:(a.next=o.next,o.next=a),r.pending=a}0!==l&&Tr(n,a,l)}}function Pr(e,t,n,r){Sr[_r++]=e,Sr[_r++]=t,Sr[_r++]=n,Sr[_r++]=r,Cr|=r,e.lanes|=r,null!==(e=e.alternate)&&(e.lanes|=r)}function Lr(e,t,n,r){return Pr(e,t,n,r),Mr(e)}function zr(e,t){return Pr(e,null,null,t),Mr(e)}function Tr(e,t,n){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n);for(var a=!1,l=e.return;null!==l;)l.childLanes|=n,null!==(r=l.alternate)&&(r.childLanes|=n),22===l.tag&&(null===(e=l.stateNode)||1&e._visibility||(a=!0)),e=l,l=l.return;return 3===e.tag?(l=e.stateNode,a&&null!==t&&(a=31-me(n),null===(r=(e=l.hiddenUpdates)[a])?e[a]=[t]:r.push(t),t.lane=536870912|n),l):null}function Mr(e){if(50<Tc)throw Tc=0,Mc=null,Error(o(185));for(var t=e.return;null!==t;)t=(e=t).return;return 3===e.tag?e.stateNode:null}var Rr={};function Or(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ar(e,t,n,r){return new Or(e,t,n,r)}function Fr(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Dr(e,t){var n=e.alternate;return null===n?((n=Ar(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=65011712&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function Hr(e,t){e.flags&=65011714;var n=e.alternate;return null===n?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Ir(e,t,n,r,a,l){var i=0;if(r=e,"function"===typeof e)Fr(e)&&(i=1);else if("string"===typeof e)i=function(e,t,n){if(1===n||null!=t.itemProp)return!1;switch(e){case"meta":case"title":return!0;case"style":if("string"!==typeof t.precedence||"string"!==typeof t.href||""===t.href)break;return!0;case"link":if("string"!==typeof t.rel||"string"!==typeof t.href||""===t.href||t.onLoad||t.onError)break;return"stylesheet"!==t.rel||(e=t.disabled,"string"===typeof t.precedence&&null==e);case"script":if(t.async&&"function"!==typeof t.async&&"symbol"!==typeof t.async&&!t.onLoad&&!t.onError&&t.src&&"string"===typeof t.src)return!0}return!1}(e,n,B.current)?26:"html"===e||"head"===e||"body"===e?27:5;else e:switch(e){case C:return(e=Ar(31,n,t,a)).elementType=C,e.lanes=l,e;case g:return Ur(n.children,a,l,t);case v:i=8,a|=24;break;case b:return(e=Ar(12,n,t,2|a)).elementType=b,e.lanes=l,e;case j:return(e=Ar(13,n,t,a)).elementType=j,e.lanes=l,e;case N:return(e=Ar(19,n,t,a)).elementType=N,e.lanes=l,e;default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case y:case w:i=10;break e;case x:i=9;break e;case k:i=11;break e;case S:i=14;break e;case _:i=16,r=null;break e}i=29,n=Error(o(130,null===e?"null":typeof e,"")),r=null}return(t=Ar(i,n,t,a)).elementType=e,t.type=r,t.lanes=l,t}function Ur(e,t,n,r){return(e=Ar(7,e,r,t)).lanes=n,e}function Br(e,t,n){return(e=Ar(6,e,null,t)).lanes=n,e}function Vr(e,t,n){return(t=Ar(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var Wr=[],qr=0,$r=null,Qr=0,Gr=[],Yr=0,Kr=null,Jr=1,Xr="";function Zr(e,t){Wr[qr++]=Qr,Wr[qr++]=$r,$r=e,Qr=t}function ea(e,t,n){Gr[Yr++]=Jr,Gr[Yr++]=Xr,Gr[Yr++]=Kr,Kr=e;var r=Jr;e=Xr;var a=32-me(r)-1;r&=~(1<<a),n+=1;var l=32-me(t)+a;if(30<l){var o=a-a%5;l=(r&(1<<o)-1).toString(32),r>>=o,a-=o,Jr=1<<32-me(t)+a|n<<a|r,Xr=l+e}else Jr=1<<l|n<<a|r,Xr=e}function ta(e){null!==e.return&&(Zr(e,1),ea(e,1,0))}function na(e){for(;e===$r;)$r=Wr[--qr],Wr[qr]=null,Qr=Wr[--qr],Wr[qr]=null;for(;e===Kr;)Kr=Gr[--Yr],Gr[Yr]=null,Xr=Gr[--Yr],Gr[Yr]=null,Jr=Gr[--Yr],Gr[Yr]=null}var ra=null,aa=null,la=!1,oa=null,ia=!1,sa=Error(o(519));function ca(e){throw ha(Nr(Error(o(418,"")),e)),sa}function ua(e){var t=e.stateNode,n=e.type,r=e.memoizedProps;switch(t[Te]=e,t[Me]=r,n){case"dialog":Fu("cancel",t),Fu("close",t);break;case"iframe":case"object":case"embed":Fu("load",t);break;case"video":case"audio":for(n=0;n<Ru.length;n++)Fu(Ru[n],t);break;case"source":Fu("error",t);break;case"img":case"image":case"link":Fu("error",t),Fu("load",t);break;case"details":Fu("toggle",t);break;case"input":Fu("invalid",t),vt(t,r.value,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name,!0),dt(t);break;case"select":Fu("invalid",t);break;case"textarea":Fu("invalid",t),wt(t,r.value,r.defaultValue,r.children),dt(t)}"string"!==typeof(n=r.children)&&"number"!==typeof n&&"bigint"!==typeof n||t.textContent===""+n||!0===r.suppressHydrationWarning||Ku(t.textContent,n)?(null!=r.popover&&(Fu("beforetoggle",t),Fu("toggle",t)),null!=r.onScroll&&Fu("scroll",t),null!=r.onScrollEnd&&Fu("scrollend",t),null!=r.onClick&&(t.onclick=Ju),t=!0):t=!1,t||ca(e)}function da(e){for(ra=e.return;ra;)switch(ra.tag){case 5:case 13:return void(ia=!1);case 27:case 3:return void(ia=!0);default:ra=ra.return}}function fa(e){if(e!==ra)return!1;if(!la)return da(e),la=!0,!1;var t,n=e.tag;if((t=3!==n&&27!==n)&&((t=5===n)&&(t=!("form"!==(t=e.type)&&"button"!==t)||od(e.type,e.memoizedProps)),t=!t),t&&aa&&ca(e),da(e),13===n){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType)if("/$"===(t=e.data)){if(0===n){aa=vd(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++;e=e.nextSibling}aa=null}}else 27===n?(n=aa,md(e.type)?(e=bd,bd=null,aa=e):aa=n):aa=ra?vd(e.stateNode.nextSibling):null;return!0}function ma(){aa=ra=null,la=!1}function pa(){var e=oa;return null!==e&&(null===yc?yc=e:yc.push.apply(yc,e),oa=null),e}function ha(e){null===oa?oa=[e]:oa.push(e)}var ga=H(null),va=null,ba=null;function ya(e,t,n){U(ga,t._currentValue),t._currentValue=n}function xa(e){e._currentValue=ga.current,I(ga)}function wa(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function ka(e,t,n,r){var a=e.child;for(null!==a&&(a.return=e);null!==a;){var l=a.dependencies;if(null!==l){var i=a.child;l=l.firstContext;e:for(;null!==l;){var s=l;l=a;for(var c=0;c<t.length;c++)if(s.context===t[c]){l.lanes|=n,null!==(s=l.alternate)&&(s.lanes|=n),wa(l.return,n,e),r||(i=null);break e}l=s.next}}else if(18===a.tag){if(null===(i=a.return))throw Error(o(341));i.lanes|=n,null!==(l=i.alternate)&&(l.lanes|=n),wa(i,n,e),i=null}else i=a.child;if(null!==i)i.return=a;else for(i=a;null!==i;){if(i===e){i=null;break}if(null!==(a=i.sibling)){a.return=i.return,i=a;break}i=i.return}a=i}}function ja(e,t,n,r){e=null;for(var a=t,l=!1;null!==a;){if(!l)if(0!==(524288&a.flags))l=!0;else if(0!==(262144&a.flags))break;if(10===a.tag){var i=a.alternate;if(null===i)throw Error(o(387));if(null!==(i=i.memoizedProps)){var s=a.type;Yn(a.pendingProps.value,i.value)||(null!==e?e.push(s):e=[s])}}else if(a===q.current){if(null===(i=a.alternate))throw Error(o(387));i.memoizedState.memoizedState!==a.memoizedState.memoizedState&&(null!==e?e.push(Gd):e=[Gd])}a=a.return}null!==e&&ka(t,e,n,r),t.flags|=262144}function Na(e){for(e=e.firstContext;null!==e;){if(!Yn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Sa(e){va=e,ba=null,null!==(e=e.dependencies)&&(e.firstContext=null)}function _a(e){return Ea(va,e)}function Ca(e,t){return null===va&&Sa(e),Ea(e,t)}function Ea(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},null===ba){if(null===e)throw Error(o(308));ba=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else ba=ba.next=t;return n}var Pa="undefined"!==typeof AbortController?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(t,n){e.push(n)}};this.abort=function(){t.aborted=!0,e.forEach((function(e){return e()}))}},La=r.unstable_scheduleCallback,za=r.unstable_NormalPriority,Ta={$$typeof:w,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Ma(){return{controller:new Pa,data:new Map,refCount:0}}function Ra(e){e.refCount--,0===e.refCount&&La(za,(function(){e.controller.abort()}))}var Oa=null,Aa=0,Fa=0,Da=null;function Ha(){if(0===--Aa&&null!==Oa){null!==Da&&(Da.status="fulfilled");var e=Oa;Oa=null,Fa=0,Da=null;for(var t=0;t<e.length;t++)(0,e[t])()}}var Ia=R.S;R.S=function(e,t){"object"===typeof t&&null!==t&&"function"===typeof t.then&&function(e,t){if(null===Oa){var n=Oa=[];Aa=0,Fa=Pu(),Da={status:"pending",value:void 0,then:function(e){n.push(e)}}}Aa++,t.then(Ha,Ha)}(0,t),null!==Ia&&Ia(e,t)};var Ua=H(null);function Ba(){var e=Ua.current;return null!==e?e:rc.pooledCache}function Va(e,t){U(Ua,null===t?Ua.current:t.pool)}function Wa(){var e=Ba();return null===e?null:{parent:Ta._currentValue,pool:e}}var qa=Error(o(460)),$a=Error(o(474)),Qa=Error(o(542)),Ga={then:function(){}};function Ya(e){return"fulfilled"===(e=e.status)||"rejected"===e}function Ka(){}function Ja(e,t,n){switch(void 0===(n=e[n])?e.push(t):n!==t&&(t.then(Ka,Ka),t=n),t.status){case"fulfilled":return t.value;case"rejected":throw el(e=t.reason),e;default:if("string"===typeof t.status)t.then(Ka,Ka);else{if(null!==(e=rc)&&100<e.shellSuspendCounter)throw Error(o(482));(e=t).status="pending",e.then((function(e){if("pending"===t.status){var n=t;n.status="fulfilled",n.value=e}}),(function(e){if("pending"===t.status){var n=t;n.status="rejected",n.reason=e}}))}switch(t.status){case"fulfilled":return t.value;case"rejected":throw el(e=t.reason),e}throw Xa=t,qa}}var Xa=null;function Za(){if(null===Xa)throw Error(o(459));var e=Xa;return Xa=null,e}function el(e){if(e===qa||e===Qa)throw Error(o(483))}var tl=!1;function nl(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function rl(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function al(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function ll(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&nc)){var a=r.pending;return null===a?t.next=t:(t.next=a.next,a.next=t),r.pending=t,t=Mr(e),Tr(e,null,n),t}return Pr(e,r,t,n),Mr(e)}function ol(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194048&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ce(e,n)}}function il(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var a=null,l=null;if(null!==(n=n.firstBaseUpdate)){do{var o={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};null===l?a=l=o:l=l.next=o,n=n.next}while(null!==n);null===l?a=l=t:l=l.next=t}else a=l=t;return n={baseState:r.baseState,firstBaseUpdate:a,lastBaseUpdate:l,shared:r.shared,callbacks:r.callbacks},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var sl=!1;function cl(){if(sl){if(null!==Da)throw Da}}function ul(e,t,n,r){sl=!1;var a=e.updateQueue;tl=!1;var l=a.firstBaseUpdate,o=a.lastBaseUpdate,i=a.shared.pending;if(null!==i){a.shared.pending=null;var s=i,c=s.next;s.next=null,null===o?l=c:o.next=c,o=s;var u=e.alternate;null!==u&&((i=(u=u.updateQueue).lastBaseUpdate)!==o&&(null===i?u.firstBaseUpdate=c:i.next=c,u.lastBaseUpdate=s))}if(null!==l){var d=a.baseState;for(o=0,u=c=s=null,i=l;;){var m=-536870913&i.lane,p=m!==i.lane;if(p?(lc&m)===m:(r&m)===m){0!==m&&m===Fa&&(sl=!0),null!==u&&(u=u.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});e:{var h=e,g=i;m=t;var v=n;switch(g.tag){case 1:if("function"===typeof(h=g.payload)){d=h.call(v,d,m);break e}d=h;break e;case 3:h.flags=-65537&h.flags|128;case 0:if(null===(m="function"===typeof(h=g.payload)?h.call(v,d,m):h)||void 0===m)break e;d=f({},d,m);break e;case 2:tl=!0}}null!==(m=i.callback)&&(e.flags|=64,p&&(e.flags|=8192),null===(p=a.callbacks)?a.callbacks=[m]:p.push(m))}else p={lane:m,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===u?(c=u=p,s=d):u=u.next=p,o|=m;if(null===(i=i.next)){if(null===(i=a.shared.pending))break;i=(p=i).next,p.next=null,a.lastBaseUpdate=p,a.shared.pending=null}}null===u&&(s=d),a.baseState=s,a.firstBaseUpdate=c,a.lastBaseUpdate=u,null===l&&(a.shared.lanes=0),mc|=o,e.lanes=o,e.memoizedState=d}}function dl(e,t){if("function"!==typeof e)throw Error(o(191,e));e.call(t)}function fl(e,t){var n=e.callbacks;if(null!==n)for(e.callbacks=null,e=0;e<n.length;e++)dl(n[e],t)}var ml=H(null),pl=H(0);function hl(e,t){U(pl,e=dc),U(ml,t),dc=e|t.baseLanes}function gl(){U(pl,dc),U(ml,ml.current)}function vl(){dc=pl.current,I(ml),I(pl)}var bl=0,yl=null,xl=null,wl=null,kl=!1,jl=!1,Nl=!1,Sl=0,_l=0,Cl=null,El=0;function Pl(){throw Error(o(321))}function Ll(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Yn(e[n],t[n]))return!1;return!0}function zl(e,t,n,r,a,l){return bl=l,yl=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,R.H=null===e||null===e.memoizedState?$o:Qo,Nl=!1,l=n(r,a),Nl=!1,jl&&(l=Ml(t,n,r,a)),Tl(e),l}function Tl(e){R.H=qo;var t=null!==xl&&null!==xl.next;if(bl=0,wl=xl=yl=null,kl=!1,_l=0,Cl=null,t)throw Error(o(300));null===e||Ci||null!==(e=e.dependencies)&&Na(e)&&(Ci=!0)}function Ml(e,t,n,r){yl=e;var a=0;do{if(jl&&(Cl=null),_l=0,jl=!1,25<=a)throw Error(o(301));if(a+=1,wl=xl=null,null!=e.updateQueue){var l=e.updateQueue;l.lastEffect=null,l.events=null,l.stores=null,null!=l.memoCache&&(l.memoCache.index=0)}R.H=Go,l=t(n,r)}while(jl);return l}function Rl(){var e=R.H,t=e.useState()[0];return t="function"===typeof t.then?Il(t):t,e=e.useState()[0],(null!==xl?xl.memoizedState:null)!==e&&(yl.flags|=1024),t}function Ol(){var e=0!==Sl;return Sl=0,e}function Al(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function Fl(e){if(kl){for(e=e.memoizedState;null!==e;){var t=e.queue;null!==t&&(t.pending=null),e=e.next}kl=!1}bl=0,wl=xl=yl=null,jl=!1,_l=Sl=0,Cl=null}function Dl(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===wl?yl.memoizedState=wl=e:wl=wl.next=e,wl}function Hl(){if(null===xl){var e=yl.alternate;e=null!==e?e.memoizedState:null}else e=xl.next;var t=null===wl?yl.memoizedState:wl.next;if(null!==t)wl=t,xl=e;else{if(null===e){if(null===yl.alternate)throw Error(o(467));throw Error(o(310))}e={memoizedState:(xl=e).memoizedState,baseState:xl.baseState,baseQueue:xl.baseQueue,queue:xl.queue,next:null},null===wl?yl.memoizedState=wl=e:wl=wl.next=e}return wl}function Il(e){var t=_l;return _l+=1,null===Cl&&(Cl=[]),e=Ja(Cl,e,t),t=yl,null===(null===wl?t.memoizedState:wl.next)&&(t=t.alternate,R.H=null===t||null===t.memoizedState?$o:Qo),e}function Ul(e){if(null!==e&&"object"===typeof e){if("function"===typeof e.then)return Il(e);if(e.$$typeof===w)return _a(e)}throw Error(o(438,String(e)))}function Bl(e){var t=null,n=yl.updateQueue;if(null!==n&&(t=n.memoCache),null==t){var r=yl.alternate;null!==r&&(null!==(r=r.updateQueue)&&(null!=(r=r.memoCache)&&(t={data:r.data.map((function(e){return e.slice()})),index:0})))}if(null==t&&(t={data:[],index:0}),null===n&&(n={lastEffect:null,events:null,stores:null,memoCache:null},yl.updateQueue=n),n.memoCache=t,void 0===(n=t.data[t.index]))for(n=t.data[t.index]=Array(e),r=0;r<e;r++)n[r]=E;return t.index++,n}function Vl(e,t){return"function"===typeof t?t(e):t}function Wl(e){return ql(Hl(),xl,e)}function ql(e,t,n){var r=e.queue;if(null===r)throw Error(o(311));r.lastRenderedReducer=n;var a=e.baseQueue,l=r.pending;if(null!==l){if(null!==a){var i=a.next;a.next=l.next,l.next=i}t.baseQueue=a=l,r.pending=null}if(l=e.baseState,null===a)e.memoizedState=l;else{var s=i=null,c=null,u=t=a.next,d=!1;do{var f=-536870913&u.lane;if(f!==u.lane?(lc&f)===f:(bl&f)===f){var m=u.revertLane;if(0===m)null!==c&&(c=c.next={lane:0,revertLane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),f===Fa&&(d=!0);else{if((bl&m)===m){u=u.next,m===Fa&&(d=!0);continue}f={lane:0,revertLane:u.revertLane,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null},null===c?(s=c=f,i=l):c=c.next=f,yl.lanes|=m,mc|=m}f=u.action,Nl&&n(l,f),l=u.hasEagerState?u.eagerState:n(l,f)}else m={lane:f,revertLane:u.revertLane,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null},null===c?(s=c=m,i=l):c=c.next=m,yl.lanes|=f,mc|=f;u=u.next}while(null!==u&&u!==t);if(null===c?i=l:c.next=s,!Yn(l,e.memoizedState)&&(Ci=!0,d&&null!==(n=Da)))throw n;e.memoizedState=l,e.baseState=i,e.baseQueue=c,r.lastRenderedState=l}return null===a&&(r.lanes=0),[e.memoizedState,r.dispatch]}function $l(e){var t=Hl(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,a=n.pending,l=t.memoizedState;if(null!==a){n.pending=null;var i=a=a.next;do{l=e(l,i.action),i=i.next}while(i!==a);Yn(l,t.memoizedState)||(Ci=!0),t.memoizedState=l,null===t.baseQueue&&(t.baseState=l),n.lastRenderedState=l}return[l,r]}function Ql(e,t,n){var r=yl,a=Hl(),l=la;if(l){if(void 0===n)throw Error(o(407));n=n()}else n=t();var i=!Yn((xl||a).memoizedState,n);if(i&&(a.memoizedState=n,Ci=!0),a=a.queue,vo(2048,8,Kl.bind(null,r,a,e),[e]),a.getSnapshot!==t||i||null!==wl&&1&wl.memoizedState.tag){if(r.flags|=2048,po(9,{destroy:void 0,resource:void 0},Yl.bind(null,r,a,n,t),null),null===rc)throw Error(o(349));l||0!==(124&bl)||Gl(r,t,n)}return n}function Gl(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=yl.updateQueue)?(t={lastEffect:null,events:null,stores:null,memoCache:null},yl.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Yl(e,t,n,r){t.value=n,t.getSnapshot=r,Jl(t)&&Xl(e)}function Kl(e,t,n){return n((function(){Jl(t)&&Xl(e)}))}function Jl(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Yn(e,n)}catch(r){return!0}}function Xl(e){var t=zr(e,2);null!==t&&Ac(t,e,2)}function Zl(e){var t=Dl();if("function"===typeof e){var n=e;if(e=n(),Nl){fe(!0);try{n()}finally{fe(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Vl,lastRenderedState:e},t}function eo(e,t,n,r){return e.baseState=n,ql(e,xl,"function"===typeof r?r:Vl)}function to(e,t,n,r,a){if(Bo(e))throw Error(o(485));if(null!==(e=t.action)){var l={payload:a,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(e){l.listeners.push(e)}};null!==R.T?n(!0):l.isTransition=!1,r(l),null===(n=t.pending)?(l.next=t.pending=l,no(t,l)):(l.next=n.next,t.pending=n.next=l)}}function no(e,t){var n=t.action,r=t.payload,a=e.state;if(t.isTransition){var l=R.T,o={};R.T=o;try{var i=n(a,r),s=R.S;null!==s&&s(o,i),ro(e,t,i)}catch(c){lo(e,t,c)}finally{R.T=l}}else try{ro(e,t,l=n(a,r))}catch(u){lo(e,t,u)}}function ro(e,t,n){null!==n&&"object"===typeof n&&"function"===typeof n.then?n.then((function(n){ao(e,t,n)}),(function(n){return lo(e,t,n)})):ao(e,t,n)}function ao(e,t,n){t.status="fulfilled",t.value=n,oo(t),e.state=n,null!==(t=e.pending)&&((n=t.next)===t?e.pending=null:(n=n.next,t.next=n,no(e,n)))}function lo(e,t,n){var r=e.pending;if(e.pending=null,null!==r){r=r.next;do{t.status="rejected",t.reason=n,oo(t),t=t.next}while(t!==r)}e.action=null}function oo(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function io(e,t){return t}function so(e,t){if(la){var n=rc.formState;if(null!==n){e:{var r=yl;if(la){if(aa){t:{for(var a=aa,l=ia;8!==a.nodeType;){if(!l){a=null;break t}if(null===(a=vd(a.nextSibling))){a=null;break t}}a="F!"===(l=a.data)||"F"===l?a:null}if(a){aa=vd(a.nextSibling),r="F!"===a.data;break e}}ca(r)}r=!1}r&&(t=n[0])}}return(n=Dl()).memoizedState=n.baseState=t,r={pending:null,lanes:0,dispatch:null,lastRenderedReducer:io,lastRenderedState:t},n.queue=r,n=Ho.bind(null,yl,r),r.dispatch=n,r=Zl(!1),l=Uo.bind(null,yl,!1,r.queue),a={state:t,dispatch:null,action:e,pending:null},(r=Dl()).queue=a,n=to.bind(null,yl,a,l,n),a.dispatch=n,r.memoizedState=e,[t,n,!1]}function co(e){return uo(Hl(),xl,e)}function uo(e,t,n){if(t=ql(e,t,io)[0],e=Wl(Vl)[0],"object"===typeof t&&null!==t&&"function"===typeof t.then)try{var r=Il(t)}catch(o){if(o===qa)throw Qa;throw o}else r=t;var a=(t=Hl()).queue,l=a.dispatch;return n!==t.memoizedState&&(yl.flags|=2048,po(9,{destroy:void 0,resource:void 0},fo.bind(null,a,n),null)),[r,l,e]}function fo(e,t){e.action=t}function mo(e){var t=Hl(),n=xl;if(null!==n)return uo(t,n,e);Hl(),t=t.memoizedState;var r=(n=Hl()).queue.dispatch;return n.memoizedState=e,[t,r,!1]}function po(e,t,n,r){return e={tag:e,create:n,deps:r,inst:t,next:null},null===(t=yl.updateQueue)&&(t={lastEffect:null,events:null,stores:null,memoCache:null},yl.updateQueue=t),null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function ho(){return Hl().memoizedState}function go(e,t,n,r){var a=Dl();r=void 0===r?null:r,yl.flags|=e,a.memoizedState=po(1|t,{destroy:void 0,resource:void 0},n,r)}function vo(e,t,n,r){var a=Hl();r=void 0===r?null:r;var l=a.memoizedState.inst;null!==xl&&null!==r&&Ll(r,xl.memoizedState.deps)?a.memoizedState=po(t,l,n,r):(yl.flags|=e,a.memoizedState=po(1|t,l,n,r))}function bo(e,t){go(8390656,8,e,t)}function yo(e,t){vo(2048,8,e,t)}function xo(e,t){return vo(4,2,e,t)}function wo(e,t){return vo(4,4,e,t)}function ko(e,t){if("function"===typeof t){e=e();var n=t(e);return function(){"function"===typeof n?n():t(null)}}if(null!==t&&void 0!==t)return e=e(),t.current=e,function(){t.current=null}}function jo(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,vo(4,4,ko.bind(null,t,e),n)}function No(){}function So(e,t){var n=Hl();t=void 0===t?null:t;var r=n.memoizedState;return null!==t&&Ll(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function _o(e,t){var n=Hl();t=void 0===t?null:t;var r=n.memoizedState;if(null!==t&&Ll(t,r[1]))return r[0];if(r=e(),Nl){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r}function Co(e,t,n){return void 0===n||0!==(1073741824&bl)?e.memoizedState=t:(e.memoizedState=n,e=Oc(),yl.lanes|=e,mc|=e,n)}function Eo(e,t,n,r){return Yn(n,t)?n:null!==ml.current?(e=Co(e,n,r),Yn(e,t)||(Ci=!0),e):0===(42&bl)?(Ci=!0,e.memoizedState=n):(e=Oc(),yl.lanes|=e,mc|=e,t)}function Po(e,t,n,r,a){var l=O.p;O.p=0!==l&&8>l?l:8;var o=R.T,i={};R.T=i,Uo(e,!1,t,n);try{var s=a(),c=R.S;if(null!==c&&c(i,s),null!==s&&"object"===typeof s&&"function"===typeof s.then)Io(e,t,function(e,t){var n=[],r={status:"pending",value:null,reason:null,then:function(e){n.push(e)}};return e.then((function(){r.status="fulfilled",r.value=t;for(var e=0;e<n.length;e++)(0,n[e])(t)}),(function(e){for(r.status="rejected",r.reason=e,e=0;e<n.length;e++)(0,n[e])(void 0)})),r}(s,r),Rc());else Io(e,t,r,Rc())}catch(u){Io(e,t,{then:function(){},status:"rejected",reason:u},Rc())}finally{O.p=l,R.T=o}}function Lo(){}function zo(e,t,n,r){if(5!==e.tag)throw Error(o(476));var a=To(e).queue;Po(e,a,t,A,null===n?Lo:function(){return Mo(e),n(r)})}function To(e){var t=e.memoizedState;if(null!==t)return t;var n={};return(t={memoizedState:A,baseState:A,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Vl,lastRenderedState:A},next:null}).next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Vl,lastRenderedState:n},next:null},e.memoizedState=t,null!==(e=e.alternate)&&(e.memoizedState=t),t}function Mo(e){Io(e,To(e).next.queue,{},Rc())}function Ro(){return _a(Gd)}function Oo(){return Hl().memoizedState}function Ao(){return Hl().memoizedState}function Fo(e){for(var t=e.return;null!==t;){switch(t.tag){case 24:case 3:var n=Rc(),r=ll(t,e=al(n),n);return null!==r&&(Ac(r,t,n),ol(r,t,n)),t={cache:Ma()},void(e.payload=t)}t=t.return}}function Do(e,t,n){var r=Rc();n={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},Bo(e)?Vo(t,n):null!==(n=Lr(e,t,n,r))&&(Ac(n,e,r),Wo(n,t,r))}function Ho(e,t,n){Io(e,t,n,Rc())}function Io(e,t,n,r){var a={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(Bo(e))Vo(t,a);else{var l=e.alternate;if(0===e.lanes&&(null===l||0===l.lanes)&&null!==(l=t.lastRenderedReducer))try{var o=t.lastRenderedState,i=l(o,n);if(a.hasEagerState=!0,a.eagerState=i,Yn(i,o))return Pr(e,t,a,0),null===rc&&Er(),!1}catch(s){}if(null!==(n=Lr(e,t,a,r)))return Ac(n,e,r),Wo(n,t,r),!0}return!1}function Uo(e,t,n,r){if(r={lane:2,revertLane:Pu(),action:r,hasEagerState:!1,eagerState:null,next:null},Bo(e)){if(t)throw Error(o(479))}else null!==(t=Lr(e,n,r,2))&&Ac(t,e,2)}function Bo(e){var t=e.alternate;return e===yl||null!==t&&t===yl}function Vo(e,t){jl=kl=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Wo(e,t,n){if(0!==(4194048&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ce(e,n)}}var qo={readContext:_a,use:Ul,useCallback:Pl,useContext:Pl,useEffect:Pl,useImperativeHandle:Pl,useLayoutEffect:Pl,useInsertionEffect:Pl,useMemo:Pl,useReducer:Pl,useRef:Pl,useState:Pl,useDebugValue:Pl,useDeferredValue:Pl,useTransition:Pl,useSyncExternalStore:Pl,useId:Pl,useHostTransitionStatus:Pl,useFormState:Pl,useActionState:Pl,useOptimistic:Pl,useMemoCache:Pl,useCacheRefresh:Pl},$o={readContext:_a,use:Ul,useCallback:function(e,t){return Dl().memoizedState=[e,void 0===t?null:t],e},useContext:_a,useEffect:bo,useImperativeHandle:function(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,go(4194308,4,ko.bind(null,t,e),n)},useLayoutEffect:function(e,t){return go(4194308,4,e,t)},useInsertionEffect:function(e,t){go(4,2,e,t)},useMemo:function(e,t){var n=Dl();t=void 0===t?null:t;var r=e();if(Nl){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r},useReducer:function(e,t,n){var r=Dl();if(void 0!==n){var a=n(t);if(Nl){fe(!0);try{n(t)}finally{fe(!1)}}}else a=t;return r.memoizedState=r.baseState=a,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:a},r.queue=e,e=e.dispatch=Do.bind(null,yl,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Dl().memoizedState=e},useState:function(e){var t=(e=Zl(e)).queue,n=Ho.bind(null,yl,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:No,useDeferredValue:function(e,t){return Co(Dl(),e,t)},useTransition:function(){var e=Zl(!1);return e=Po.bind(null,yl,e.queue,!0,!1),Dl().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var r=yl,a=Dl();if(la){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===rc)throw Error(o(349));0!==(124&lc)||Gl(r,t,n)}a.memoizedState=n;var l={value:n,getSnapshot:t};return a.queue=l,bo(Kl.bind(null,r,l,e),[e]),r.flags|=2048,po(9,{destroy:void 0,resource:void 0},Yl.bind(null,r,l,n,t),null),n},useId:function(){var e=Dl(),t=rc.identifierPrefix;if(la){var n=Xr;t="\xab"+t+"R"+(n=(Jr&~(1<<32-me(Jr)-1)).toString(32)+n),0<(n=Sl++)&&(t+="H"+n.toString(32)),t+="\xbb"}else t="\xab"+t+"r"+(n=El++).toString(32)+"\xbb";return e.memoizedState=t},useHostTransitionStatus:Ro,useFormState:so,useActionState:so,useOptimistic:function(e){var t=Dl();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=Uo.bind(null,yl,!0,n),n.dispatch=t,[e,t]},useMemoCache:Bl,useCacheRefresh:function(){return Dl().memoizedState=Fo.bind(null,yl)}},Qo={readContext:_a,use:Ul,useCallback:So,useContext:_a,useEffect:yo,useImperativeHandle:jo,useInsertionEffect:xo,useLayoutEffect:wo,useMemo:_o,useReducer:Wl,useRef:ho,useState:function(){return Wl(Vl)},useDebugValue:No,useDeferredValue:function(e,t){return Eo(Hl(),xl.memoizedState,e,t)},useTransition:function(){var e=Wl(Vl)[0],t=Hl().memoizedState;return["boolean"===typeof e?e:Il(e),t]},useSyncExternalStore:Ql,useId:Oo,useHostTransitionStatus:Ro,useFormState:co,useActionState:co,useOptimistic:function(e,t){return eo(Hl(),0,e,t)},useMemoCache:Bl,useCacheRefresh:Ao},Go={readContext:_a,use:Ul,useCallback:So,useContext:_a,useEffect:yo,useImperativeHandle:jo,useInsertionEffect:xo,useLayoutEffect:wo,useMemo:_o,useReducer:$l,useRef:ho,useState:function(){return $l(Vl)},useDebugValue:No,useDeferredValue:function(e,t){var n=Hl();return null===xl?Co(n,e,t):Eo(n,xl.memoizedState,e,t)},useTransition:function(){var e=$l(Vl)[0],t=Hl().memoizedState;return["boolean"===typeof e?e:Il(e),t]},useSyncExternalStore:Ql,useId:Oo,useHostTransitionStatus:Ro,useFormState:mo,useActionState:mo,useOptimistic:function(e,t){var n=Hl();return null!==xl?eo(n,0,e,t):(n.baseState=e,[e,n.queue.dispatch])},useMemoCache:Bl,useCacheRefresh:Ao},Yo=null,Ko=0;function Jo(e){var t=Ko;return Ko+=1,null===Yo&&(Yo=[]),Ja(Yo,e,t)}function Xo(e,t){t=t.props.ref,e.ref=void 0!==t?t:null}function Zo(e,t){if(t.$$typeof===m)throw Error(o(525));throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ei(e){return(0,e._init)(e._payload)}function ti(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e){for(var t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function a(e,t){return(e=Dr(e,t)).index=0,e.sibling=null,e}function l(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=67108866,n):r:(t.flags|=67108866,n):(t.flags|=1048576,n)}function i(t){return e&&null===t.alternate&&(t.flags|=67108866),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Br(n,e.mode,r)).return=e,t):((t=a(t,n)).return=e,t)}function c(e,t,n,r){var l=n.type;return l===g?d(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===l||"object"===typeof l&&null!==l&&l.$$typeof===_&&ei(l)===t.type)?(Xo(t=a(t,n.props),n),t.return=e,t):(Xo(t=Ir(n.type,n.key,n.props,null,e.mode,r),n),t.return=e,t)}function u(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Vr(n,e.mode,r)).return=e,t):((t=a(t,n.children||[])).return=e,t)}function d(e,t,n,r,l){return null===t||7!==t.tag?((t=Ur(n,e.mode,r,l)).return=e,t):((t=a(t,n)).return=e,t)}function f(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t||"bigint"===typeof t)return(t=Br(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case p:return Xo(n=Ir(t.type,t.key,t.props,null,e.mode,n),t),n.return=e,n;case h:return(t=Vr(t,e.mode,n)).return=e,t;case _:return f(e,t=(0,t._init)(t._payload),n)}if(M(t)||L(t))return(t=Ur(t,e.mode,n,null)).return=e,t;if("function"===typeof t.then)return f(e,Jo(t),n);if(t.$$typeof===w)return f(e,Ca(e,t),n);Zo(e,t)}return null}function m(e,t,n,r){var a=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n||"bigint"===typeof n)return null!==a?null:s(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case p:return n.key===a?c(e,t,n,r):null;case h:return n.key===a?u(e,t,n,r):null;case _:return m(e,t,n=(a=n._init)(n._payload),r)}if(M(n)||L(n))return null!==a?null:d(e,t,n,r,null);if("function"===typeof n.then)return m(e,t,Jo(n),r);if(n.$$typeof===w)return m(e,t,Ca(e,n),r);Zo(e,n)}return null}function v(e,t,n,r,a){if("string"===typeof r&&""!==r||"number"===typeof r||"bigint"===typeof r)return s(t,e=e.get(n)||null,""+r,a);if("object"===typeof r&&null!==r){switch(r.$$typeof){case p:return c(t,e=e.get(null===r.key?n:r.key)||null,r,a);case h:return u(t,e=e.get(null===r.key?n:r.key)||null,r,a);case _:return v(e,t,n,r=(0,r._init)(r._payload),a)}if(M(r)||L(r))return d(t,e=e.get(n)||null,r,a,null);if("function"===typeof r.then)return v(e,t,n,Jo(r),a);if(r.$$typeof===w)return v(e,t,n,Ca(t,r),a);Zo(t,r)}return null}function b(s,c,u,d){if("object"===typeof u&&null!==u&&u.type===g&&null===u.key&&(u=u.props.children),"object"===typeof u&&null!==u){switch(u.$$typeof){case p:e:{for(var y=u.key;null!==c;){if(c.key===y){if((y=u.type)===g){if(7===c.tag){n(s,c.sibling),(d=a(c,u.props.children)).return=s,s=d;break e}}else if(c.elementType===y||"object"===typeof y&&null!==y&&y.$$typeof===_&&ei(y)===c.type){n(s,c.sibling),Xo(d=a(c,u.props),u),d.return=s,s=d;break e}n(s,c);break}t(s,c),c=c.sibling}u.type===g?((d=Ur(u.props.children,s.mode,d,u.key)).return=s,s=d):(Xo(d=Ir(u.type,u.key,u.props,null,s.mode,d),u),d.return=s,s=d)}return i(s);case h:e:{for(y=u.key;null!==c;){if(c.key===y){if(4===c.tag&&c.stateNode.containerInfo===u.containerInfo&&c.stateNode.implementation===u.implementation){n(s,c.sibling),(d=a(c,u.children||[])).return=s,s=d;break e}n(s,c);break}t(s,c),c=c.sibling}(d=Vr(u,s.mode,d)).return=s,s=d}return i(s);case _:return b(s,c,u=(y=u._init)(u._payload),d)}if(M(u))return function(a,o,i,s){for(var c=null,u=null,d=o,p=o=0,h=null;null!==d&&p<i.length;p++){d.index>p?(h=d,d=null):h=d.sibling;var g=m(a,d,i[p],s);if(null===g){null===d&&(d=h);break}e&&d&&null===g.alternate&&t(a,d),o=l(g,o,p),null===u?c=g:u.sibling=g,u=g,d=h}if(p===i.length)return n(a,d),la&&Zr(a,p),c;if(null===d){for(;p<i.length;p++)null!==(d=f(a,i[p],s))&&(o=l(d,o,p),null===u?c=d:u.sibling=d,u=d);return la&&Zr(a,p),c}for(d=r(d);p<i.length;p++)null!==(h=v(d,a,p,i[p],s))&&(e&&null!==h.alternate&&d.delete(null===h.key?p:h.key),o=l(h,o,p),null===u?c=h:u.sibling=h,u=h);return e&&d.forEach((function(e){return t(a,e)})),la&&Zr(a,p),c}(s,c,u,d);if(L(u)){if("function"!==typeof(y=L(u)))throw Error(o(150));return function(a,i,s,c){if(null==s)throw Error(o(151));for(var u=null,d=null,p=i,h=i=0,g=null,b=s.next();null!==p&&!b.done;h++,b=s.next()){p.index>h?(g=p,p=null):g=p.sibling;var y=m(a,p,b.value,c);if(null===y){null===p&&(p=g);break}e&&p&&null===y.alternate&&t(a,p),i=l(y,i,h),null===d?u=y:d.sibling=y,d=y,p=g}if(b.done)return n(a,p),la&&Zr(a,h),u;if(null===p){for(;!b.done;h++,b=s.next())null!==(b=f(a,b.value,c))&&(i=l(b,i,h),null===d?u=b:d.sibling=b,d=b);return la&&Zr(a,h),u}for(p=r(p);!b.done;h++,b=s.next())null!==(b=v(p,a,h,b.value,c))&&(e&&null!==b.alternate&&p.delete(null===b.key?h:b.key),i=l(b,i,h),null===d?u=b:d.sibling=b,d=b);return e&&p.forEach((function(e){return t(a,e)})),la&&Zr(a,h),u}(s,c,u=y.call(u),d)}if("function"===typeof u.then)return b(s,c,Jo(u),d);if(u.$$typeof===w)return b(s,c,Ca(s,u),d);Zo(s,u)}return"string"===typeof u&&""!==u||"number"===typeof u||"bigint"===typeof u?(u=""+u,null!==c&&6===c.tag?(n(s,c.sibling),(d=a(c,u)).return=s,s=d):(n(s,c),(d=Br(u,s.mode,d)).return=s,s=d),i(s)):n(s,c)}return function(e,t,n,r){try{Ko=0;var a=b(e,t,n,r);return Yo=null,a}catch(o){if(o===qa||o===Qa)throw o;var l=Ar(29,o,null,e.mode);return l.lanes=r,l.return=e,l}}}var ni=ti(!0),ri=ti(!1),ai=H(null),li=null;function oi(e){var t=e.alternate;U(ui,1&ui.current),U(ai,e),null===li&&(null===t||null!==ml.current||null!==t.memoizedState)&&(li=e)}function ii(e){if(22===e.tag){if(U(ui,ui.current),U(ai,e),null===li){var t=e.alternate;null!==t&&null!==t.memoizedState&&(li=e)}}else si()}function si(){U(ui,ui.current),U(ai,ai.current)}function ci(e){I(ai),li===e&&(li=null),I(ui)}var ui=H(0);function di(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||gd(n)))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function fi(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:f({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var mi={enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Rc(),a=al(r);a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=ll(e,a,r))&&(Ac(t,e,r),ol(t,e,r))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Rc(),a=al(r);a.tag=1,a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=ll(e,a,r))&&(Ac(t,e,r),ol(t,e,r))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Rc(),r=al(n);r.tag=2,void 0!==t&&null!==t&&(r.callback=t),null!==(t=ll(e,r,n))&&(Ac(t,e,n),ol(t,e,n))}};function pi(e,t,n,r,a,l,o){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,l,o):!t.prototype||!t.prototype.isPureReactComponent||(!Kn(n,r)||!Kn(a,l))}function hi(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&mi.enqueueReplaceState(t,t.state,null)}function gi(e,t){var n=t;if("ref"in t)for(var r in n={},t)"ref"!==r&&(n[r]=t[r]);if(e=e.defaultProps)for(var a in n===t&&(n=f({},n)),e)void 0===n[a]&&(n[a]=e[a]);return n}var vi="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function bi(e){vi(e)}function yi(e){console.error(e)}function xi(e){vi(e)}function wi(e,t){try{(0,e.onUncaughtError)(t.value,{componentStack:t.stack})}catch(n){setTimeout((function(){throw n}))}}function ki(e,t,n){try{(0,e.onCaughtError)(n.value,{componentStack:n.stack,errorBoundary:1===t.tag?t.stateNode:null})}catch(r){setTimeout((function(){throw r}))}}function ji(e,t,n){return(n=al(n)).tag=3,n.payload={element:null},n.callback=function(){wi(e,t)},n}function Ni(e){return(e=al(e)).tag=3,e}function Si(e,t,n,r){var a=n.type.getDerivedStateFromError;if("function"===typeof a){var l=r.value;e.payload=function(){return a(l)},e.callback=function(){ki(t,n,r)}}var o=n.stateNode;null!==o&&"function"===typeof o.componentDidCatch&&(e.callback=function(){ki(t,n,r),"function"!==typeof a&&(null===Nc?Nc=new Set([this]):Nc.add(this));var e=r.stack;this.componentDidCatch(r.value,{componentStack:null!==e?e:""})})}var _i=Error(o(461)),Ci=!1;function Ei(e,t,n,r){t.child=null===e?ri(t,null,n,r):ni(t,e.child,n,r)}function Pi(e,t,n,r,a){n=n.render;var l=t.ref;if("ref"in r){var o={};for(var i in r)"ref"!==i&&(o[i]=r[i])}else o=r;return Sa(t),r=zl(e,t,n,o,l,a),i=Ol(),null===e||Ci?(la&&i&&ta(t),t.flags|=1,Ei(e,t,r,a),t.child):(Al(e,t,a),Yi(e,t,a))}function Li(e,t,n,r,a){if(null===e){var l=n.type;return"function"!==typeof l||Fr(l)||void 0!==l.defaultProps||null!==n.compare?((e=Ir(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=l,zi(e,t,l,r,a))}if(l=e.child,!Ki(e,a)){var o=l.memoizedProps;if((n=null!==(n=n.compare)?n:Kn)(o,r)&&e.ref===t.ref)return Yi(e,t,a)}return t.flags|=1,(e=Dr(l,r)).ref=t.ref,e.return=t,t.child=e}function zi(e,t,n,r,a){if(null!==e){var l=e.memoizedProps;if(Kn(l,r)&&e.ref===t.ref){if(Ci=!1,t.pendingProps=r=l,!Ki(e,a))return t.lanes=e.lanes,Yi(e,t,a);0!==(131072&e.flags)&&(Ci=!0)}}return Oi(e,t,n,r,a)}function Ti(e,t,n){var r=t.pendingProps,a=r.children,l=null!==e?e.memoizedState:null;if("hidden"===r.mode){if(0!==(128&t.flags)){if(r=null!==l?l.baseLanes|n:n,null!==e){for(a=t.child=e.child,l=0;null!==a;)l=l|a.lanes|a.childLanes,a=a.sibling;t.childLanes=l&~r}else t.childLanes=0,t.child=null;return Mi(e,t,r,n)}if(0===(536870912&n))return t.lanes=t.childLanes=536870912,Mi(e,t,null!==l?l.baseLanes|n:n,n);t.memoizedState={baseLanes:0,cachePool:null},null!==e&&Va(0,null!==l?l.cachePool:null),null!==l?hl(t,l):gl(),ii(t)}else null!==l?(Va(0,l.cachePool),hl(t,l),si(),t.memoizedState=null):(null!==e&&Va(0,null),gl(),si());return Ei(e,t,a,n),t.child}function Mi(e,t,n,r){var a=Ba();return a=null===a?null:{parent:Ta._currentValue,pool:a},t.memoizedState={baseLanes:n,cachePool:a},null!==e&&Va(0,null),gl(),ii(t),null!==e&&ja(e,t,r,!0),null}function Ri(e,t){var n=t.ref;if(null===n)null!==e&&null!==e.ref&&(t.flags|=4194816);else{if("function"!==typeof n&&"object"!==typeof n)throw Error(o(284));null!==e&&e.ref===n||(t.flags|=4194816)}}function Oi(e,t,n,r,a){return Sa(t),n=zl(e,t,n,r,void 0,a),r=Ol(),null===e||Ci?(la&&r&&ta(t),t.flags|=1,Ei(e,t,n,a),t.child):(Al(e,t,a),Yi(e,t,a))}function Ai(e,t,n,r,a,l){return Sa(t),t.updateQueue=null,n=Ml(t,r,n,a),Tl(e),r=Ol(),null===e||Ci?(la&&r&&ta(t),t.flags|=1,Ei(e,t,n,l),t.child):(Al(e,t,l),Yi(e,t,l))}function Fi(e,t,n,r,a){if(Sa(t),null===t.stateNode){var l=Rr,o=n.contextType;"object"===typeof o&&null!==o&&(l=_a(o)),l=new n(r,l),t.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,l.updater=mi,t.stateNode=l,l._reactInternals=t,(l=t.stateNode).props=r,l.state=t.memoizedState,l.refs={},nl(t),o=n.contextType,l.context="object"===typeof o&&null!==o?_a(o):Rr,l.state=t.memoizedState,"function"===typeof(o=n.getDerivedStateFromProps)&&(fi(t,n,o,r),l.state=t.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof l.getSnapshotBeforeUpdate||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||(o=l.state,"function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),o!==l.state&&mi.enqueueReplaceState(l,l.state,null),ul(t,r,l,a),cl(),l.state=t.memoizedState),"function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!0}else if(null===e){l=t.stateNode;var i=t.memoizedProps,s=gi(n,i);l.props=s;var c=l.context,u=n.contextType;o=Rr,"object"===typeof u&&null!==u&&(o=_a(u));var d=n.getDerivedStateFromProps;u="function"===typeof d||"function"===typeof l.getSnapshotBeforeUpdate,i=t.pendingProps!==i,u||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(i||c!==o)&&hi(t,l,r,o),tl=!1;var f=t.memoizedState;l.state=f,ul(t,r,l,a),cl(),c=t.memoizedState,i||f!==c||tl?("function"===typeof d&&(fi(t,n,d,r),c=t.memoizedState),(s=tl||pi(t,n,s,r,f,c,o))?(u||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||("function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount()),"function"===typeof l.componentDidMount&&(t.flags|=4194308)):("function"===typeof l.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=c),l.props=r,l.state=c,l.context=o,r=s):("function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!1)}else{l=t.stateNode,rl(e,t),u=gi(n,o=t.memoizedProps),l.props=u,d=t.pendingProps,f=l.context,c=n.contextType,s=Rr,"object"===typeof c&&null!==c&&(s=_a(c)),(c="function"===typeof(i=n.getDerivedStateFromProps)||"function"===typeof l.getSnapshotBeforeUpdate)||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(o!==d||f!==s)&&hi(t,l,r,s),tl=!1,f=t.memoizedState,l.state=f,ul(t,r,l,a),cl();var m=t.memoizedState;o!==d||f!==m||tl||null!==e&&null!==e.dependencies&&Na(e.dependencies)?("function"===typeof i&&(fi(t,n,i,r),m=t.memoizedState),(u=tl||pi(t,n,u,r,f,m,s)||null!==e&&null!==e.dependencies&&Na(e.dependencies))?(c||"function"!==typeof l.UNSAFE_componentWillUpdate&&"function"!==typeof l.componentWillUpdate||("function"===typeof l.componentWillUpdate&&l.componentWillUpdate(r,m,s),"function"===typeof l.UNSAFE_componentWillUpdate&&l.UNSAFE_componentWillUpdate(r,m,s)),"function"===typeof l.componentDidUpdate&&(t.flags|=4),"function"===typeof l.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=m),l.props=r,l.state=m,l.context=s,r=u):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),r=!1)}return l=r,Ri(e,t),r=0!==(128&t.flags),l||r?(l=t.stateNode,n=r&&"function"!==typeof n.getDerivedStateFromError?null:l.render(),t.flags|=1,null!==e&&r?(t.child=ni(t,e.child,null,a),t.child=ni(t,null,n,a)):Ei(e,t,n,a),t.memoizedState=l.state,e=t.child):e=Yi(e,t,a),e}function Di(e,t,n,r){return ma(),t.flags|=256,Ei(e,t,n,r),t.child}var Hi={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Ii(e){return{baseLanes:e,cachePool:Wa()}}function Ui(e,t,n){return e=null!==e?e.childLanes&~n:0,t&&(e|=gc),e}function Bi(e,t,n){var r,a=t.pendingProps,l=!1,i=0!==(128&t.flags);if((r=i)||(r=(null===e||null!==e.memoizedState)&&0!==(2&ui.current)),r&&(l=!0,t.flags&=-129),r=0!==(32&t.flags),t.flags&=-33,null===e){if(la){if(l?oi(t):si(),la){var s,c=aa;if(s=c){e:{for(s=c,c=ia;8!==s.nodeType;){if(!c){c=null;break e}if(null===(s=vd(s.nextSibling))){c=null;break e}}c=s}null!==c?(t.memoizedState={dehydrated:c,treeContext:null!==Kr?{id:Jr,overflow:Xr}:null,retryLane:536870912,hydrationErrors:null},(s=Ar(18,null,null,0)).stateNode=c,s.return=t,t.child=s,ra=t,aa=null,s=!0):s=!1}s||ca(t)}if(null!==(c=t.memoizedState)&&null!==(c=c.dehydrated))return gd(c)?t.lanes=32:t.lanes=536870912,null;ci(t)}return c=a.children,a=a.fallback,l?(si(),c=Wi({mode:"hidden",children:c},l=t.mode),a=Ur(a,l,n,null),c.return=t,a.return=t,c.sibling=a,t.child=c,(l=t.child).memoizedState=Ii(n),l.childLanes=Ui(e,r,n),t.memoizedState=Hi,a):(oi(t),Vi(t,c))}if(null!==(s=e.memoizedState)&&null!==(c=s.dehydrated)){if(i)256&t.flags?(oi(t),t.flags&=-257,t=qi(e,t,n)):null!==t.memoizedState?(si(),t.child=e.child,t.flags|=128,t=null):(si(),l=a.fallback,c=t.mode,a=Wi({mode:"visible",children:a.children},c),(l=Ur(l,c,n,null)).flags|=2,a.return=t,l.return=t,a.sibling=l,t.child=a,ni(t,e.child,null,n),(a=t.child).memoizedState=Ii(n),a.childLanes=Ui(e,r,n),t.memoizedState=Hi,t=l);else if(oi(t),gd(c)){if(r=c.nextSibling&&c.nextSibling.dataset)var u=r.dgst;r=u,(a=Error(o(419))).stack="",a.digest=r,ha({value:a,source:null,stack:null}),t=qi(e,t,n)}else if(Ci||ja(e,t,n,!1),r=0!==(n&e.childLanes),Ci||r){if(null!==(r=rc)&&(0!==(a=0!==((a=0!==(42&(a=n&-n))?1:Ee(a))&(r.suspendedLanes|n))?0:a)&&a!==s.retryLane))throw s.retryLane=a,zr(e,a),Ac(r,e,a),_i;"$?"===c.data||Qc(),t=qi(e,t,n)}else"$?"===c.data?(t.flags|=192,t.child=e.child,t=null):(e=s.treeContext,aa=vd(c.nextSibling),ra=t,la=!0,oa=null,ia=!1,null!==e&&(Gr[Yr++]=Jr,Gr[Yr++]=Xr,Gr[Yr++]=Kr,Jr=e.id,Xr=e.overflow,Kr=t),(t=Vi(t,a.children)).flags|=4096);return t}return l?(si(),l=a.fallback,c=t.mode,u=(s=e.child).sibling,(a=Dr(s,{mode:"hidden",children:a.children})).subtreeFlags=65011712&s.subtreeFlags,null!==u?l=Dr(u,l):(l=Ur(l,c,n,null)).flags|=2,l.return=t,a.return=t,a.sibling=l,t.child=a,a=l,l=t.child,null===(c=e.child.memoizedState)?c=Ii(n):(null!==(s=c.cachePool)?(u=Ta._currentValue,s=s.parent!==u?{parent:u,pool:u}:s):s=Wa(),c={baseLanes:c.baseLanes|n,cachePool:s}),l.memoizedState=c,l.childLanes=Ui(e,r,n),t.memoizedState=Hi,a):(oi(t),e=(n=e.child).sibling,(n=Dr(n,{mode:"visible",children:a.children})).return=t,n.sibling=null,null!==e&&(null===(r=t.deletions)?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n)}function Vi(e,t){return(t=Wi({mode:"visible",children:t},e.mode)).return=e,e.child=t}function Wi(e,t){return(e=Ar(22,e,null,t)).lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function qi(e,t,n){return ni(t,e.child,null,n),(e=Vi(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function $i(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),wa(e.return,t,n)}function Qi(e,t,n,r,a){var l=e.memoizedState;null===l?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:a}:(l.isBackwards=t,l.rendering=null,l.renderingStartTime=0,l.last=r,l.tail=n,l.tailMode=a)}function Gi(e,t,n){var r=t.pendingProps,a=r.revealOrder,l=r.tail;if(Ei(e,t,r.children,n),0!==(2&(r=ui.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&$i(e,n,t);else if(19===e.tag)$i(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}switch(U(ui,r),a){case"forwards":for(n=t.child,a=null;null!==n;)null!==(e=n.alternate)&&null===di(e)&&(a=n),n=n.sibling;null===(n=a)?(a=t.child,t.child=null):(a=n.sibling,n.sibling=null),Qi(t,!1,a,n,l);break;case"backwards":for(n=null,a=t.child,t.child=null;null!==a;){if(null!==(e=a.alternate)&&null===di(e)){t.child=a;break}e=a.sibling,a.sibling=n,n=a,a=e}Qi(t,!0,n,null,l);break;case"together":Qi(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Yi(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),mc|=t.lanes,0===(n&t.childLanes)){if(null===e)return null;if(ja(e,t,n,!1),0===(n&t.childLanes))return null}if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=Dr(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Dr(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Ki(e,t){return 0!==(e.lanes&t)||!(null===(e=e.dependencies)||!Na(e))}function Ji(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps)Ci=!0;else{if(!Ki(e,n)&&0===(128&t.flags))return Ci=!1,function(e,t,n){switch(t.tag){case 3:$(t,t.stateNode.containerInfo),ya(0,Ta,e.memoizedState.cache),ma();break;case 27:case 5:G(t);break;case 4:$(t,t.stateNode.containerInfo);break;case 10:ya(0,t.type,t.memoizedProps.value);break;case 13:var r=t.memoizedState;if(null!==r)return null!==r.dehydrated?(oi(t),t.flags|=128,null):0!==(n&t.child.childLanes)?Bi(e,t,n):(oi(t),null!==(e=Yi(e,t,n))?e.sibling:null);oi(t);break;case 19:var a=0!==(128&e.flags);if((r=0!==(n&t.childLanes))||(ja(e,t,n,!1),r=0!==(n&t.childLanes)),a){if(r)return Gi(e,t,n);t.flags|=128}if(null!==(a=t.memoizedState)&&(a.rendering=null,a.tail=null,a.lastEffect=null),U(ui,ui.current),r)break;return null;case 22:case 23:return t.lanes=0,Ti(e,t,n);case 24:ya(0,Ta,e.memoizedState.cache)}return Yi(e,t,n)}(e,t,n);Ci=0!==(131072&e.flags)}else Ci=!1,la&&0!==(1048576&t.flags)&&ea(t,Qr,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var r=t.elementType,a=r._init;if(r=a(r._payload),t.type=r,"function"!==typeof r){if(void 0!==r&&null!==r){if((a=r.$$typeof)===k){t.tag=11,t=Pi(null,t,r,e,n);break e}if(a===S){t.tag=14,t=Li(null,t,r,e,n);break e}}throw t=T(r)||r,Error(o(306,t,""))}Fr(r)?(e=gi(r,e),t.tag=1,t=Fi(null,t,r,e,n)):(t.tag=0,t=Oi(null,t,r,e,n))}return t;case 0:return Oi(e,t,t.type,t.pendingProps,n);case 1:return Fi(e,t,r=t.type,a=gi(r,t.pendingProps),n);case 3:e:{if($(t,t.stateNode.containerInfo),null===e)throw Error(o(387));r=t.pendingProps;var l=t.memoizedState;a=l.element,rl(e,t),ul(t,r,null,n);var i=t.memoizedState;if(r=i.cache,ya(0,Ta,r),r!==l.cache&&ka(t,[Ta],n,!0),cl(),r=i.element,l.isDehydrated){if(l={element:r,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=l,t.memoizedState=l,256&t.flags){t=Di(e,t,r,n);break e}if(r!==a){ha(a=Nr(Error(o(424)),t)),t=Di(e,t,r,n);break e}if(9===(e=t.stateNode.containerInfo).nodeType)e=e.body;else e="HTML"===e.nodeName?e.ownerDocument.body:e;for(aa=vd(e.firstChild),ra=t,la=!0,oa=null,ia=!0,n=ri(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(ma(),r===a){t=Yi(e,t,n);break e}Ei(e,t,r,n)}t=t.child}return t;case 26:return Ri(e,t),null===e?(n=Ed(t.type,null,t.pendingProps,null))?t.memoizedState=n:la||(n=t.type,e=t.pendingProps,(r=rd(W.current).createElement(n))[Te]=t,r[Me]=e,ed(r,n,e),qe(r),t.stateNode=r):t.memoizedState=Ed(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return G(t),null===e&&la&&(r=t.stateNode=xd(t.type,t.pendingProps,W.current),ra=t,ia=!0,a=aa,md(t.type)?(bd=a,aa=vd(r.firstChild)):aa=a),Ei(e,t,t.pendingProps.children,n),Ri(e,t),null===e&&(t.flags|=4194304),t.child;case 5:return null===e&&la&&((a=r=aa)&&(null!==(r=function(e,t,n,r){for(;1===e.nodeType;){var a=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!r&&("INPUT"!==e.nodeName||"hidden"!==e.type))break}else if(r){if(!e[He])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if("stylesheet"===(l=e.getAttribute("rel"))&&e.hasAttribute("data-precedence"))break;if(l!==a.rel||e.getAttribute("href")!==(null==a.href||""===a.href?null:a.href)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin)||e.getAttribute("title")!==(null==a.title?null:a.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(((l=e.getAttribute("src"))!==(null==a.src?null:a.src)||e.getAttribute("type")!==(null==a.type?null:a.type)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin))&&l&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else{if("input"!==t||"hidden"!==e.type)return e;var l=null==a.name?null:""+a.name;if("hidden"===a.type&&e.getAttribute("name")===l)return e}if(null===(e=vd(e.nextSibling)))break}return null}(r,t.type,t.pendingProps,ia))?(t.stateNode=r,ra=t,aa=vd(r.firstChild),ia=!1,a=!0):a=!1),a||ca(t)),G(t),a=t.type,l=t.pendingProps,i=null!==e?e.memoizedProps:null,r=l.children,od(a,l)?r=null:null!==i&&od(a,i)&&(t.flags|=32),null!==t.memoizedState&&(a=zl(e,t,Rl,null,null,n),Gd._currentValue=a),Ri(e,t),Ei(e,t,r,n),t.child;case 6:return null===e&&la&&((e=n=aa)&&(null!==(n=function(e,t,n){if(""===t)return null;for(;3!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!n)return null;if(null===(e=vd(e.nextSibling)))return null}return e}(n,t.pendingProps,ia))?(t.stateNode=n,ra=t,aa=null,e=!0):e=!1),e||ca(t)),null;case 13:return Bi(e,t,n);case 4:return $(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=ni(t,null,r,n):Ei(e,t,r,n),t.child;case 11:return Pi(e,t,t.type,t.pendingProps,n);case 7:return Ei(e,t,t.pendingProps,n),t.child;case 8:case 12:return Ei(e,t,t.pendingProps.children,n),t.child;case 10:return r=t.pendingProps,ya(0,t.type,r.value),Ei(e,t,r.children,n),t.child;case 9:return a=t.type._context,r=t.pendingProps.children,Sa(t),r=r(a=_a(a)),t.flags|=1,Ei(e,t,r,n),t.child;case 14:return Li(e,t,t.type,t.pendingProps,n);case 15:return zi(e,t,t.type,t.pendingProps,n);case 19:return Gi(e,t,n);case 31:return r=t.pendingProps,n=t.mode,r={mode:r.mode,children:r.children},null===e?((n=Wi(r,n)).ref=t.ref,t.child=n,n.return=t,t=n):((n=Dr(e.child,r)).ref=t.ref,t.child=n,n.return=t,t=n),t;case 22:return Ti(e,t,n);case 24:return Sa(t),r=_a(Ta),null===e?(null===(a=Ba())&&(a=rc,l=Ma(),a.pooledCache=l,l.refCount++,null!==l&&(a.pooledCacheLanes|=n),a=l),t.memoizedState={parent:r,cache:a},nl(t),ya(0,Ta,a)):(0!==(e.lanes&n)&&(rl(e,t),ul(t,null,null,n),cl()),a=e.memoizedState,l=t.memoizedState,a.parent!==r?(a={parent:r,cache:r},t.memoizedState=a,0===t.lanes&&(t.memoizedState=t.updateQueue.baseState=a),ya(0,Ta,r)):(r=l.cache,ya(0,Ta,r),r!==a.cache&&ka(t,[Ta],n,!0))),Ei(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(o(156,t.tag))}function Xi(e){e.flags|=4}function Zi(e,t){if("stylesheet"!==t.type||0!==(4&t.state.loading))e.flags&=-16777217;else if(e.flags|=16777216,!Ud(t)){if(null!==(t=ai.current)&&((4194048&lc)===lc?null!==li:(62914560&lc)!==lc&&0===(536870912&lc)||t!==li))throw Xa=Ga,$a;e.flags|=8192}}function es(e,t){null!==t&&(e.flags|=4),16384&e.flags&&(t=22!==e.tag?je():536870912,e.lanes|=t,vc|=t)}function ts(e,t){if(!la)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ns(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=65011712&a.subtreeFlags,r|=65011712&a.flags,a.return=e,a=a.sibling;else for(a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=a.subtreeFlags,r|=a.flags,a.return=e,a=a.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function rs(e,t,n){var r=t.pendingProps;switch(na(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:case 1:return ns(t),null;case 3:return n=t.stateNode,r=null,null!==e&&(r=e.memoizedState.cache),t.memoizedState.cache!==r&&(t.flags|=2048),xa(Ta),Q(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||(fa(t)?Xi(t):null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,pa())),ns(t),null;case 26:return n=t.memoizedState,null===e?(Xi(t),null!==n?(ns(t),Zi(t,n)):(ns(t),t.flags&=-16777217)):n?n!==e.memoizedState?(Xi(t),ns(t),Zi(t,n)):(ns(t),t.flags&=-16777217):(e.memoizedProps!==r&&Xi(t),ns(t),t.flags&=-16777217),null;case 27:Y(t),n=W.current;var a=t.type;if(null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Xi(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return ns(t),null}e=B.current,fa(t)?ua(t):(e=xd(a,r,n),t.stateNode=e,Xi(t))}return ns(t),null;case 5:if(Y(t),n=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Xi(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return ns(t),null}if(e=B.current,fa(t))ua(t);else{switch(a=rd(W.current),e){case 1:e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":(e=a.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e="string"===typeof r.is?a.createElement("select",{is:r.is}):a.createElement("select"),r.multiple?e.multiple=!0:r.size&&(e.size=r.size);break;default:e="string"===typeof r.is?a.createElement(n,{is:r.is}):a.createElement(n)}}e[Te]=t,e[Me]=r;e:for(a=t.child;null!==a;){if(5===a.tag||6===a.tag)e.appendChild(a.stateNode);else if(4!==a.tag&&27!==a.tag&&null!==a.child){a.child.return=a,a=a.child;continue}if(a===t)break e;for(;null===a.sibling;){if(null===a.return||a.return===t)break e;a=a.return}a.sibling.return=a.return,a=a.sibling}t.stateNode=e;e:switch(ed(e,n,r),n){case"button":case"input":case"select":case"textarea":e=!!r.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&Xi(t)}}return ns(t),t.flags&=-16777217,null;case 6:if(e&&null!=t.stateNode)e.memoizedProps!==r&&Xi(t);else{if("string"!==typeof r&&null===t.stateNode)throw Error(o(166));if(e=W.current,fa(t)){if(e=t.stateNode,n=t.memoizedProps,r=null,null!==(a=ra))switch(a.tag){case 27:case 5:r=a.memoizedProps}e[Te]=t,(e=!!(e.nodeValue===n||null!==r&&!0===r.suppressHydrationWarning||Ku(e.nodeValue,n)))||ca(t)}else(e=rd(e).createTextNode(r))[Te]=t,t.stateNode=e}return ns(t),null;case 13:if(r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(a=fa(t),null!==r&&null!==r.dehydrated){if(null===e){if(!a)throw Error(o(318));if(!(a=null!==(a=t.memoizedState)?a.dehydrated:null))throw Error(o(317));a[Te]=t}else ma(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;ns(t),a=!1}else a=pa(),null!==e&&null!==e.memoizedState&&(e.memoizedState.hydrationErrors=a),a=!0;if(!a)return 256&t.flags?(ci(t),t):(ci(t),null)}if(ci(t),0!==(128&t.flags))return t.lanes=n,t;if(n=null!==r,e=null!==e&&null!==e.memoizedState,n){a=null,null!==(r=t.child).alternate&&null!==r.alternate.memoizedState&&null!==r.alternate.memoizedState.cachePool&&(a=r.alternate.memoizedState.cachePool.pool);var l=null;null!==r.memoizedState&&null!==r.memoizedState.cachePool&&(l=r.memoizedState.cachePool.pool),l!==a&&(r.flags|=2048)}return n!==e&&n&&(t.child.flags|=8192),es(t,t.updateQueue),ns(t),null;case 4:return Q(),null===e&&Iu(t.stateNode.containerInfo),ns(t),null;case 10:return xa(t.type),ns(t),null;case 19:if(I(ui),null===(a=t.memoizedState))return ns(t),null;if(r=0!==(128&t.flags),null===(l=a.rendering))if(r)ts(a,!1);else{if(0!==fc||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(l=di(e))){for(t.flags|=128,ts(a,!1),e=l.updateQueue,t.updateQueue=e,es(t,e),t.subtreeFlags=0,e=n,n=t.child;null!==n;)Hr(n,e),n=n.sibling;return U(ui,1&ui.current|2),t.child}e=e.sibling}null!==a.tail&&te()>kc&&(t.flags|=128,r=!0,ts(a,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=di(l))){if(t.flags|=128,r=!0,e=e.updateQueue,t.updateQueue=e,es(t,e),ts(a,!0),null===a.tail&&"hidden"===a.tailMode&&!l.alternate&&!la)return ns(t),null}else 2*te()-a.renderingStartTime>kc&&536870912!==n&&(t.flags|=128,r=!0,ts(a,!1),t.lanes=4194304);a.isBackwards?(l.sibling=t.child,t.child=l):(null!==(e=a.last)?e.sibling=l:t.child=l,a.last=l)}return null!==a.tail?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=te(),t.sibling=null,e=ui.current,U(ui,r?1&e|2:1&e),t):(ns(t),null);case 22:case 23:return ci(t),vl(),r=null!==t.memoizedState,null!==e?null!==e.memoizedState!==r&&(t.flags|=8192):r&&(t.flags|=8192),r?0!==(536870912&n)&&0===(128&t.flags)&&(ns(t),6&t.subtreeFlags&&(t.flags|=8192)):ns(t),null!==(n=t.updateQueue)&&es(t,n.retryQueue),n=null,null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),r=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(r=t.memoizedState.cachePool.pool),r!==n&&(t.flags|=2048),null!==e&&I(Ua),null;case 24:return n=null,null!==e&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),xa(Ta),ns(t),null;case 25:case 30:return null}throw Error(o(156,t.tag))}function as(e,t){switch(na(t),t.tag){case 1:return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return xa(Ta),Q(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 26:case 27:case 5:return Y(t),null;case 13:if(ci(t),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));ma()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return I(ui),null;case 4:return Q(),null;case 10:return xa(t.type),null;case 22:case 23:return ci(t),vl(),null!==e&&I(Ua),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 24:return xa(Ta),null;default:return null}}function ls(e,t){switch(na(t),t.tag){case 3:xa(Ta),Q();break;case 26:case 27:case 5:Y(t);break;case 4:Q();break;case 13:ci(t);break;case 19:I(ui);break;case 10:xa(t.type);break;case 22:case 23:ci(t),vl(),null!==e&&I(Ua);break;case 24:xa(Ta)}}function os(e,t){try{var n=t.updateQueue,r=null!==n?n.lastEffect:null;if(null!==r){var a=r.next;n=a;do{if((n.tag&e)===e){r=void 0;var l=n.create,o=n.inst;r=l(),o.destroy=r}n=n.next}while(n!==a)}}catch(i){uu(t,t.return,i)}}function is(e,t,n){try{var r=t.updateQueue,a=null!==r?r.lastEffect:null;if(null!==a){var l=a.next;r=l;do{if((r.tag&e)===e){var o=r.inst,i=o.destroy;if(void 0!==i){o.destroy=void 0,a=t;var s=n,c=i;try{c()}catch(u){uu(a,s,u)}}}r=r.next}while(r!==l)}}catch(u){uu(t,t.return,u)}}function ss(e){var t=e.updateQueue;if(null!==t){var n=e.stateNode;try{fl(t,n)}catch(r){uu(e,e.return,r)}}}function cs(e,t,n){n.props=gi(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(r){uu(e,t,r)}}function us(e,t){try{var n=e.ref;if(null!==n){switch(e.tag){case 26:case 27:case 5:var r=e.stateNode;break;default:r=e.stateNode}"function"===typeof n?e.refCleanup=n(r):n.current=r}}catch(a){uu(e,t,a)}}function ds(e,t){var n=e.ref,r=e.refCleanup;if(null!==n)if("function"===typeof r)try{r()}catch(a){uu(e,t,a)}finally{e.refCleanup=null,null!=(e=e.alternate)&&(e.refCleanup=null)}else if("function"===typeof n)try{n(null)}catch(l){uu(e,t,l)}else n.current=null}function fs(e){var t=e.type,n=e.memoizedProps,r=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&r.focus();break e;case"img":n.src?r.src=n.src:n.srcSet&&(r.srcset=n.srcSet)}}catch(a){uu(e,e.return,a)}}function ms(e,t,n){try{var r=e.stateNode;!function(e,t,n,r){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var a=null,l=null,i=null,s=null,c=null,u=null,d=null;for(p in n){var f=n[p];if(n.hasOwnProperty(p)&&null!=f)switch(p){case"checked":case"value":break;case"defaultValue":c=f;default:r.hasOwnProperty(p)||Xu(e,t,p,null,r,f)}}for(var m in r){var p=r[m];if(f=n[m],r.hasOwnProperty(m)&&(null!=p||null!=f))switch(m){case"type":l=p;break;case"name":a=p;break;case"checked":u=p;break;case"defaultChecked":d=p;break;case"value":i=p;break;case"defaultValue":s=p;break;case"children":case"dangerouslySetInnerHTML":if(null!=p)throw Error(o(137,t));break;default:p!==f&&Xu(e,t,m,p,r,f)}}return void gt(e,i,s,c,u,d,l,a);case"select":for(l in p=i=s=m=null,n)if(c=n[l],n.hasOwnProperty(l)&&null!=c)switch(l){case"value":break;case"multiple":p=c;default:r.hasOwnProperty(l)||Xu(e,t,l,null,r,c)}for(a in r)if(l=r[a],c=n[a],r.hasOwnProperty(a)&&(null!=l||null!=c))switch(a){case"value":m=l;break;case"defaultValue":s=l;break;case"multiple":i=l;default:l!==c&&Xu(e,t,a,l,r,c)}return t=s,n=i,r=p,void(null!=m?yt(e,!!n,m,!1):!!r!==!!n&&(null!=t?yt(e,!!n,t,!0):yt(e,!!n,n?[]:"",!1)));case"textarea":for(s in p=m=null,n)if(a=n[s],n.hasOwnProperty(s)&&null!=a&&!r.hasOwnProperty(s))switch(s){case"value":case"children":break;default:Xu(e,t,s,null,r,a)}for(i in r)if(a=r[i],l=n[i],r.hasOwnProperty(i)&&(null!=a||null!=l))switch(i){case"value":m=a;break;case"defaultValue":p=a;break;case"children":break;case"dangerouslySetInnerHTML":if(null!=a)throw Error(o(91));break;default:a!==l&&Xu(e,t,i,a,r,l)}return void xt(e,m,p);case"option":for(var h in n)if(m=n[h],n.hasOwnProperty(h)&&null!=m&&!r.hasOwnProperty(h))if("selected"===h)e.selected=!1;else Xu(e,t,h,null,r,m);for(c in r)if(m=r[c],p=n[c],r.hasOwnProperty(c)&&m!==p&&(null!=m||null!=p))if("selected"===c)e.selected=m&&"function"!==typeof m&&"symbol"!==typeof m;else Xu(e,t,c,m,r,p);return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var g in n)m=n[g],n.hasOwnProperty(g)&&null!=m&&!r.hasOwnProperty(g)&&Xu(e,t,g,null,r,m);for(u in r)if(m=r[u],p=n[u],r.hasOwnProperty(u)&&m!==p&&(null!=m||null!=p))switch(u){case"children":case"dangerouslySetInnerHTML":if(null!=m)throw Error(o(137,t));break;default:Xu(e,t,u,m,r,p)}return;default:if(_t(t)){for(var v in n)m=n[v],n.hasOwnProperty(v)&&void 0!==m&&!r.hasOwnProperty(v)&&Zu(e,t,v,void 0,r,m);for(d in r)m=r[d],p=n[d],!r.hasOwnProperty(d)||m===p||void 0===m&&void 0===p||Zu(e,t,d,m,r,p);return}}for(var b in n)m=n[b],n.hasOwnProperty(b)&&null!=m&&!r.hasOwnProperty(b)&&Xu(e,t,b,null,r,m);for(f in r)m=r[f],p=n[f],!r.hasOwnProperty(f)||m===p||null==m&&null==p||Xu(e,t,f,m,r,p)}(r,e.type,n,t),r[Me]=t}catch(a){uu(e,e.return,a)}}function ps(e){return 5===e.tag||3===e.tag||26===e.tag||27===e.tag&&md(e.type)||4===e.tag}function hs(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||ps(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(27===e.tag&&md(e.type))continue e;if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function gs(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?(9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).insertBefore(e,t):((t=9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Ju));else if(4!==r&&(27===r&&md(e.type)&&(n=e.stateNode,t=null),null!==(e=e.child)))for(gs(e,t,n),e=e.sibling;null!==e;)gs(e,t,n),e=e.sibling}function vs(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&(27===r&&md(e.type)&&(n=e.stateNode),null!==(e=e.child)))for(vs(e,t,n),e=e.sibling;null!==e;)vs(e,t,n),e=e.sibling}function bs(e){var t=e.stateNode,n=e.memoizedProps;try{for(var r=e.type,a=t.attributes;a.length;)t.removeAttributeNode(a[0]);ed(t,r,n),t[Te]=e,t[Me]=n}catch(l){uu(e,e.return,l)}}var ys=!1,xs=!1,ws=!1,ks="function"===typeof WeakSet?WeakSet:Set,js=null;function Ns(e,t,n){var r=n.flags;switch(n.tag){case 0:case 11:case 15:Fs(e,n),4&r&&os(5,n);break;case 1:if(Fs(e,n),4&r)if(e=n.stateNode,null===t)try{e.componentDidMount()}catch(o){uu(n,n.return,o)}else{var a=gi(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(a,t,e.__reactInternalSnapshotBeforeUpdate)}catch(i){uu(n,n.return,i)}}64&r&&ss(n),512&r&&us(n,n.return);break;case 3:if(Fs(e,n),64&r&&null!==(e=n.updateQueue)){if(t=null,null!==n.child)switch(n.child.tag){case 27:case 5:case 1:t=n.child.stateNode}try{fl(e,t)}catch(o){uu(n,n.return,o)}}break;case 27:null===t&&4&r&&bs(n);case 26:case 5:Fs(e,n),null===t&&4&r&&fs(n),512&r&&us(n,n.return);break;case 12:Fs(e,n);break;case 13:Fs(e,n),4&r&&Ls(e,n),64&r&&(null!==(e=n.memoizedState)&&(null!==(e=e.dehydrated)&&function(e,t){var n=e.ownerDocument;if("$?"!==e.data||"complete"===n.readyState)t();else{var r=function(){t(),n.removeEventListener("DOMContentLoaded",r)};n.addEventListener("DOMContentLoaded",r),e._reactRetry=r}}(e,n=pu.bind(null,n))));break;case 22:if(!(r=null!==n.memoizedState||ys)){t=null!==t&&null!==t.memoizedState||xs,a=ys;var l=xs;ys=r,(xs=t)&&!l?Hs(e,n,0!==(8772&n.subtreeFlags)):Fs(e,n),ys=a,xs=l}break;case 30:break;default:Fs(e,n)}}function Ss(e){var t=e.alternate;null!==t&&(e.alternate=null,Ss(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&Ie(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var _s=null,Cs=!1;function Es(e,t,n){for(n=n.child;null!==n;)Ps(e,t,n),n=n.sibling}function Ps(e,t,n){if(de&&"function"===typeof de.onCommitFiberUnmount)try{de.onCommitFiberUnmount(ue,n)}catch(l){}switch(n.tag){case 26:xs||ds(n,t),Es(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode).parentNode.removeChild(n);break;case 27:xs||ds(n,t);var r=_s,a=Cs;md(n.type)&&(_s=n.stateNode,Cs=!1),Es(e,t,n),wd(n.stateNode),_s=r,Cs=a;break;case 5:xs||ds(n,t);case 6:if(r=_s,a=Cs,_s=null,Es(e,t,n),Cs=a,null!==(_s=r))if(Cs)try{(9===_s.nodeType?_s.body:"HTML"===_s.nodeName?_s.ownerDocument.body:_s).removeChild(n.stateNode)}catch(o){uu(n,t,o)}else try{_s.removeChild(n.stateNode)}catch(o){uu(n,t,o)}break;case 18:null!==_s&&(Cs?(pd(9===(e=_s).nodeType?e.body:"HTML"===e.nodeName?e.ownerDocument.body:e,n.stateNode),Ef(e)):pd(_s,n.stateNode));break;case 4:r=_s,a=Cs,_s=n.stateNode.containerInfo,Cs=!0,Es(e,t,n),_s=r,Cs=a;break;case 0:case 11:case 14:case 15:xs||is(2,n,t),xs||is(4,n,t),Es(e,t,n);break;case 1:xs||(ds(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount&&cs(n,t,r)),Es(e,t,n);break;case 21:Es(e,t,n);break;case 22:xs=(r=xs)||null!==n.memoizedState,Es(e,t,n),xs=r;break;default:Es(e,t,n)}}function Ls(e,t){if(null===t.memoizedState&&(null!==(e=t.alternate)&&(null!==(e=e.memoizedState)&&null!==(e=e.dehydrated))))try{Ef(e)}catch(n){uu(t,t.return,n)}}function zs(e,t){var n=function(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return null===t&&(t=e.stateNode=new ks),t;case 22:return null===(t=(e=e.stateNode)._retryCache)&&(t=e._retryCache=new ks),t;default:throw Error(o(435,e.tag))}}(e);t.forEach((function(t){var r=hu.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}function Ts(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var a=n[r],l=e,i=t,s=i;e:for(;null!==s;){switch(s.tag){case 27:if(md(s.type)){_s=s.stateNode,Cs=!1;break e}break;case 5:_s=s.stateNode,Cs=!1;break e;case 3:case 4:_s=s.stateNode.containerInfo,Cs=!0;break e}s=s.return}if(null===_s)throw Error(o(160));Ps(l,i,a),_s=null,Cs=!1,null!==(l=a.alternate)&&(l.return=null),a.return=null}if(13878&t.subtreeFlags)for(t=t.child;null!==t;)Rs(t,e),t=t.sibling}var Ms=null;function Rs(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:Ts(t,e),Os(e),4&r&&(is(3,e,e.return),os(3,e),is(5,e,e.return));break;case 1:Ts(t,e),Os(e),512&r&&(xs||null===n||ds(n,n.return)),64&r&&ys&&(null!==(e=e.updateQueue)&&(null!==(r=e.callbacks)&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=null===n?r:n.concat(r))));break;case 26:var a=Ms;if(Ts(t,e),Os(e),512&r&&(xs||null===n||ds(n,n.return)),4&r){var l=null!==n?n.memoizedState:null;if(r=e.memoizedState,null===n)if(null===r)if(null===e.stateNode){e:{r=e.type,n=e.memoizedProps,a=a.ownerDocument||a;t:switch(r){case"title":(!(l=a.getElementsByTagName("title")[0])||l[He]||l[Te]||"http://www.w3.org/2000/svg"===l.namespaceURI||l.hasAttribute("itemprop"))&&(l=a.createElement(r),a.head.insertBefore(l,a.querySelector("head > title"))),ed(l,r,n),l[Te]=e,qe(l),r=l;break e;case"link":var i=Hd("link","href",a).get(r+(n.href||""));if(i)for(var s=0;s<i.length;s++)if((l=i[s]).getAttribute("href")===(null==n.href||""===n.href?null:n.href)&&l.getAttribute("rel")===(null==n.rel?null:n.rel)&&l.getAttribute("title")===(null==n.title?null:n.title)&&l.getAttribute("crossorigin")===(null==n.crossOrigin?null:n.crossOrigin)){i.splice(s,1);break t}ed(l=a.createElement(r),r,n),a.head.appendChild(l);break;case"meta":if(i=Hd("meta","content",a).get(r+(n.content||"")))for(s=0;s<i.length;s++)if((l=i[s]).getAttribute("content")===(null==n.content?null:""+n.content)&&l.getAttribute("name")===(null==n.name?null:n.name)&&l.getAttribute("property")===(null==n.property?null:n.property)&&l.getAttribute("http-equiv")===(null==n.httpEquiv?null:n.httpEquiv)&&l.getAttribute("charset")===(null==n.charSet?null:n.charSet)){i.splice(s,1);break t}ed(l=a.createElement(r),r,n),a.head.appendChild(l);break;default:throw Error(o(468,r))}l[Te]=e,qe(l),r=l}e.stateNode=r}else Id(a,e.type,e.stateNode);else e.stateNode=Rd(a,r,e.memoizedProps);else l!==r?(null===l?null!==n.stateNode&&(n=n.stateNode).parentNode.removeChild(n):l.count--,null===r?Id(a,e.type,e.stateNode):Rd(a,r,e.memoizedProps)):null===r&&null!==e.stateNode&&ms(e,e.memoizedProps,n.memoizedProps)}break;case 27:Ts(t,e),Os(e),512&r&&(xs||null===n||ds(n,n.return)),null!==n&&4&r&&ms(e,e.memoizedProps,n.memoizedProps);break;case 5:if(Ts(t,e),Os(e),512&r&&(xs||null===n||ds(n,n.return)),32&e.flags){a=e.stateNode;try{kt(a,"")}catch(p){uu(e,e.return,p)}}4&r&&null!=e.stateNode&&ms(e,a=e.memoizedProps,null!==n?n.memoizedProps:a),1024&r&&(ws=!0);break;case 6:if(Ts(t,e),Os(e),4&r){if(null===e.stateNode)throw Error(o(162));r=e.memoizedProps,n=e.stateNode;try{n.nodeValue=r}catch(p){uu(e,e.return,p)}}break;case 3:if(Dd=null,a=Ms,Ms=Nd(t.containerInfo),Ts(t,e),Ms=a,Os(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Ef(t.containerInfo)}catch(p){uu(e,e.return,p)}ws&&(ws=!1,As(e));break;case 4:r=Ms,Ms=Nd(e.stateNode.containerInfo),Ts(t,e),Os(e),Ms=r;break;case 12:default:Ts(t,e),Os(e);break;case 13:Ts(t,e),Os(e),8192&e.child.flags&&null!==e.memoizedState!==(null!==n&&null!==n.memoizedState)&&(wc=te()),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,zs(e,r)));break;case 22:a=null!==e.memoizedState;var c=null!==n&&null!==n.memoizedState,u=ys,d=xs;if(ys=u||a,xs=d||c,Ts(t,e),xs=d,ys=u,Os(e),8192&r)e:for(t=e.stateNode,t._visibility=a?-2&t._visibility:1|t._visibility,a&&(null===n||c||ys||xs||Ds(e)),n=null,t=e;;){if(5===t.tag||26===t.tag){if(null===n){c=n=t;try{if(l=c.stateNode,a)"function"===typeof(i=l.style).setProperty?i.setProperty("display","none","important"):i.display="none";else{s=c.stateNode;var f=c.memoizedProps.style,m=void 0!==f&&null!==f&&f.hasOwnProperty("display")?f.display:null;s.style.display=null==m||"boolean"===typeof m?"":(""+m).trim()}}catch(p){uu(c,c.return,p)}}}else if(6===t.tag){if(null===n){c=t;try{c.stateNode.nodeValue=a?"":c.memoizedProps}catch(p){uu(c,c.return,p)}}}else if((22!==t.tag&&23!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;null===t.sibling;){if(null===t.return||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}4&r&&(null!==(r=e.updateQueue)&&(null!==(n=r.retryQueue)&&(r.retryQueue=null,zs(e,n))));break;case 19:Ts(t,e),Os(e),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,zs(e,r)));case 30:case 21:}}function Os(e){var t=e.flags;if(2&t){try{for(var n,r=e.return;null!==r;){if(ps(r)){n=r;break}r=r.return}if(null==n)throw Error(o(160));switch(n.tag){case 27:var a=n.stateNode;vs(e,hs(e),a);break;case 5:var l=n.stateNode;32&n.flags&&(kt(l,""),n.flags&=-33),vs(e,hs(e),l);break;case 3:case 4:var i=n.stateNode.containerInfo;gs(e,hs(e),i);break;default:throw Error(o(161))}}catch(s){uu(e,e.return,s)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function As(e){if(1024&e.subtreeFlags)for(e=e.child;null!==e;){var t=e;As(t),5===t.tag&&1024&t.flags&&t.stateNode.reset(),e=e.sibling}}function Fs(e,t){if(8772&t.subtreeFlags)for(t=t.child;null!==t;)Ns(e,t.alternate,t),t=t.sibling}function Ds(e){for(e=e.child;null!==e;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:is(4,t,t.return),Ds(t);break;case 1:ds(t,t.return);var n=t.stateNode;"function"===typeof n.componentWillUnmount&&cs(t,t.return,n),Ds(t);break;case 27:wd(t.stateNode);case 26:case 5:ds(t,t.return),Ds(t);break;case 22:null===t.memoizedState&&Ds(t);break;default:Ds(t)}e=e.sibling}}function Hs(e,t,n){for(n=n&&0!==(8772&t.subtreeFlags),t=t.child;null!==t;){var r=t.alternate,a=e,l=t,o=l.flags;switch(l.tag){case 0:case 11:case 15:Hs(a,l,n),os(4,l);break;case 1:if(Hs(a,l,n),"function"===typeof(a=(r=l).stateNode).componentDidMount)try{a.componentDidMount()}catch(c){uu(r,r.return,c)}if(null!==(a=(r=l).updateQueue)){var i=r.stateNode;try{var s=a.shared.hiddenCallbacks;if(null!==s)for(a.shared.hiddenCallbacks=null,a=0;a<s.length;a++)dl(s[a],i)}catch(c){uu(r,r.return,c)}}n&&64&o&&ss(l),us(l,l.return);break;case 27:bs(l);case 26:case 5:Hs(a,l,n),n&&null===r&&4&o&&fs(l),us(l,l.return);break;case 12:Hs(a,l,n);break;case 13:Hs(a,l,n),n&&4&o&&Ls(a,l);break;case 22:null===l.memoizedState&&Hs(a,l,n),us(l,l.return);break;case 30:break;default:Hs(a,l,n)}t=t.sibling}}function Is(e,t){var n=null;null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),e=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(e=t.memoizedState.cachePool.pool),e!==n&&(null!=e&&e.refCount++,null!=n&&Ra(n))}function Us(e,t){e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&Ra(e))}function Bs(e,t,n,r){if(10256&t.subtreeFlags)for(t=t.child;null!==t;)Vs(e,t,n,r),t=t.sibling}function Vs(e,t,n,r){var a=t.flags;switch(t.tag){case 0:case 11:case 15:Bs(e,t,n,r),2048&a&&os(9,t);break;case 1:case 13:default:Bs(e,t,n,r);break;case 3:Bs(e,t,n,r),2048&a&&(e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&Ra(e)));break;case 12:if(2048&a){Bs(e,t,n,r),e=t.stateNode;try{var l=t.memoizedProps,o=l.id,i=l.onPostCommit;"function"===typeof i&&i(o,null===t.alternate?"mount":"update",e.passiveEffectDuration,-0)}catch(s){uu(t,t.return,s)}}else Bs(e,t,n,r);break;case 23:break;case 22:l=t.stateNode,o=t.alternate,null!==t.memoizedState?2&l._visibility?Bs(e,t,n,r):qs(e,t):2&l._visibility?Bs(e,t,n,r):(l._visibility|=2,Ws(e,t,n,r,0!==(10256&t.subtreeFlags))),2048&a&&Is(o,t);break;case 24:Bs(e,t,n,r),2048&a&&Us(t.alternate,t)}}function Ws(e,t,n,r,a){for(a=a&&0!==(10256&t.subtreeFlags),t=t.child;null!==t;){var l=e,o=t,i=n,s=r,c=o.flags;switch(o.tag){case 0:case 11:case 15:Ws(l,o,i,s,a),os(8,o);break;case 23:break;case 22:var u=o.stateNode;null!==o.memoizedState?2&u._visibility?Ws(l,o,i,s,a):qs(l,o):(u._visibility|=2,Ws(l,o,i,s,a)),a&&2048&c&&Is(o.alternate,o);break;case 24:Ws(l,o,i,s,a),a&&2048&c&&Us(o.alternate,o);break;default:Ws(l,o,i,s,a)}t=t.sibling}}function qs(e,t){if(10256&t.subtreeFlags)for(t=t.child;null!==t;){var n=e,r=t,a=r.flags;switch(r.tag){case 22:qs(n,r),2048&a&&Is(r.alternate,r);break;case 24:qs(n,r),2048&a&&Us(r.alternate,r);break;default:qs(n,r)}t=t.sibling}}var $s=8192;function Qs(e){if(e.subtreeFlags&$s)for(e=e.child;null!==e;)Gs(e),e=e.sibling}function Gs(e){switch(e.tag){case 26:Qs(e),e.flags&$s&&null!==e.memoizedState&&function(e,t,n){if(null===Bd)throw Error(o(475));var r=Bd;if("stylesheet"===t.type&&("string"!==typeof n.media||!1!==matchMedia(n.media).matches)&&0===(4&t.state.loading)){if(null===t.instance){var a=Pd(n.href),l=e.querySelector(Ld(a));if(l)return null!==(e=l._p)&&"object"===typeof e&&"function"===typeof e.then&&(r.count++,r=Wd.bind(r),e.then(r,r)),t.state.loading|=4,t.instance=l,void qe(l);l=e.ownerDocument||e,n=zd(n),(a=kd.get(a))&&Ad(n,a),qe(l=l.createElement("link"));var i=l;i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),ed(l,"link",n),t.instance=l}null===r.stylesheets&&(r.stylesheets=new Map),r.stylesheets.set(t,e),(e=t.state.preload)&&0===(3&t.state.loading)&&(r.count++,t=Wd.bind(r),e.addEventListener("load",t),e.addEventListener("error",t))}}(Ms,e.memoizedState,e.memoizedProps);break;case 5:default:Qs(e);break;case 3:case 4:var t=Ms;Ms=Nd(e.stateNode.containerInfo),Qs(e),Ms=t;break;case 22:null===e.memoizedState&&(null!==(t=e.alternate)&&null!==t.memoizedState?(t=$s,$s=16777216,Qs(e),$s=t):Qs(e))}}function Ys(e){var t=e.alternate;if(null!==t&&null!==(e=t.child)){t.child=null;do{t=e.sibling,e.sibling=null,e=t}while(null!==e)}}function Ks(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];js=r,Zs(r,e)}Ys(e)}if(10256&e.subtreeFlags)for(e=e.child;null!==e;)Js(e),e=e.sibling}function Js(e){switch(e.tag){case 0:case 11:case 15:Ks(e),2048&e.flags&&is(9,e,e.return);break;case 3:case 12:default:Ks(e);break;case 22:var t=e.stateNode;null!==e.memoizedState&&2&t._visibility&&(null===e.return||13!==e.return.tag)?(t._visibility&=-3,Xs(e)):Ks(e)}}function Xs(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];js=r,Zs(r,e)}Ys(e)}for(e=e.child;null!==e;){switch((t=e).tag){case 0:case 11:case 15:is(8,t,t.return),Xs(t);break;case 22:2&(n=t.stateNode)._visibility&&(n._visibility&=-3,Xs(t));break;default:Xs(t)}e=e.sibling}}function Zs(e,t){for(;null!==js;){var n=js;switch(n.tag){case 0:case 11:case 15:is(8,n,t);break;case 23:case 22:if(null!==n.memoizedState&&null!==n.memoizedState.cachePool){var r=n.memoizedState.cachePool.pool;null!=r&&r.refCount++}break;case 24:Ra(n.memoizedState.cache)}if(null!==(r=n.child))r.return=n,js=r;else e:for(n=e;null!==js;){var a=(r=js).sibling,l=r.return;if(Ss(r),r===n){js=null;break e}if(null!==a){a.return=l,js=a;break e}js=l}}}var ec={getCacheForType:function(e){var t=_a(Ta),n=t.data.get(e);return void 0===n&&(n=e(),t.data.set(e,n)),n}},tc="function"===typeof WeakMap?WeakMap:Map,nc=0,rc=null,ac=null,lc=0,oc=0,ic=null,sc=!1,cc=!1,uc=!1,dc=0,fc=0,mc=0,pc=0,hc=0,gc=0,vc=0,bc=null,yc=null,xc=!1,wc=0,kc=1/0,jc=null,Nc=null,Sc=0,_c=null,Cc=null,Ec=0,Pc=0,Lc=null,zc=null,Tc=0,Mc=null;function Rc(){if(0!==(2&nc)&&0!==lc)return lc&-lc;if(null!==R.T){return 0!==Fa?Fa:Pu()}return Le()}function Oc(){0===gc&&(gc=0===(536870912&lc)||la?ke():536870912);var e=ai.current;return null!==e&&(e.flags|=32),gc}function Ac(e,t,n){(e!==rc||2!==oc&&9!==oc)&&null===e.cancelPendingCommit||(Vc(e,0),Ic(e,lc,gc,!1)),Se(e,n),0!==(2&nc)&&e===rc||(e===rc&&(0===(2&nc)&&(pc|=n),4===fc&&Ic(e,lc,gc,!1)),ku(e))}function Fc(e,t,n){if(0!==(6&nc))throw Error(o(327));for(var r=!n&&0===(124&t)&&0===(t&e.expiredLanes)||xe(e,t),a=r?function(e,t){var n=nc;nc|=2;var r=qc(),a=$c();rc!==e||lc!==t?(jc=null,kc=te()+500,Vc(e,t)):cc=xe(e,t);e:for(;;)try{if(0!==oc&&null!==ac){t=ac;var l=ic;t:switch(oc){case 1:oc=0,ic=null,Zc(e,t,l,1);break;case 2:case 9:if(Ya(l)){oc=0,ic=null,Xc(t);break}t=function(){2!==oc&&9!==oc||rc!==e||(oc=7),ku(e)},l.then(t,t);break e;case 3:oc=7;break e;case 4:oc=5;break e;case 7:Ya(l)?(oc=0,ic=null,Xc(t)):(oc=0,ic=null,Zc(e,t,l,7));break;case 5:var i=null;switch(ac.tag){case 26:i=ac.memoizedState;case 5:case 27:var s=ac;if(!i||Ud(i)){oc=0,ic=null;var c=s.sibling;if(null!==c)ac=c;else{var u=s.return;null!==u?(ac=u,eu(u)):ac=null}break t}}oc=0,ic=null,Zc(e,t,l,5);break;case 6:oc=0,ic=null,Zc(e,t,l,6);break;case 8:Bc(),fc=6;break e;default:throw Error(o(462))}}Kc();break}catch(d){Wc(e,d)}return ba=va=null,R.H=r,R.A=a,nc=n,null!==ac?0:(rc=null,lc=0,Er(),fc)}(e,t):Gc(e,t,!0),l=r;;){if(0===a){cc&&!r&&Ic(e,t,0,!1);break}if(n=e.current.alternate,!l||Hc(n)){if(2===a){if(l=t,e.errorRecoveryDisabledLanes&l)var i=0;else i=0!==(i=-536870913&e.pendingLanes)?i:536870912&i?536870912:0;if(0!==i){t=i;e:{var s=e;a=bc;var c=s.current.memoizedState.isDehydrated;if(c&&(Vc(s,i).flags|=256),2!==(i=Gc(s,i,!1))){if(uc&&!c){s.errorRecoveryDisabledLanes|=l,pc|=l,a=4;break e}l=yc,yc=a,null!==l&&(null===yc?yc=l:yc.push.apply(yc,l))}a=i}if(l=!1,2!==a)continue}}if(1===a){Vc(e,0),Ic(e,t,0,!0);break}e:{switch(r=e,l=a){case 0:case 1:throw Error(o(345));case 4:if((4194048&t)!==t)break;case 6:Ic(r,t,gc,!sc);break e;case 2:yc=null;break;case 3:case 5:break;default:throw Error(o(329))}if((62914560&t)===t&&10<(a=wc+300-te())){if(Ic(r,t,gc,!sc),0!==ye(r,0,!0))break e;r.timeoutHandle=sd(Dc.bind(null,r,n,yc,jc,xc,t,gc,pc,vc,sc,l,2,-0,0),a)}else Dc(r,n,yc,jc,xc,t,gc,pc,vc,sc,l,0,-0,0)}break}a=Gc(e,t,!1),l=!1}ku(e)}function Dc(e,t,n,r,a,l,i,s,c,u,d,f,m,p){if(e.timeoutHandle=-1,(8192&(f=t.subtreeFlags)||16785408===(16785408&f))&&(Bd={stylesheets:null,count:0,unsuspend:Vd},Gs(t),null!==(f=function(){if(null===Bd)throw Error(o(475));var e=Bd;return e.stylesheets&&0===e.count&&$d(e,e.stylesheets),0<e.count?function(t){var n=setTimeout((function(){if(e.stylesheets&&$d(e,e.stylesheets),e.unsuspend){var t=e.unsuspend;e.unsuspend=null,t()}}),6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(n)}}:null}())))return e.cancelPendingCommit=f(nu.bind(null,e,t,l,n,r,a,i,s,c,d,1,m,p)),void Ic(e,l,i,!u);nu(e,t,l,n,r,a,i,s,c)}function Hc(e){for(var t=e;;){var n=t.tag;if((0===n||11===n||15===n)&&16384&t.flags&&(null!==(n=t.updateQueue)&&null!==(n=n.stores)))for(var r=0;r<n.length;r++){var a=n[r],l=a.getSnapshot;a=a.value;try{if(!Yn(l(),a))return!1}catch(o){return!1}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ic(e,t,n,r){t&=~hc,t&=~pc,e.suspendedLanes|=t,e.pingedLanes&=~t,r&&(e.warmLanes|=t),r=e.expirationTimes;for(var a=t;0<a;){var l=31-me(a),o=1<<l;r[l]=-1,a&=~o}0!==n&&_e(e,n,t)}function Uc(){return 0!==(6&nc)||(ju(0,!1),!1)}function Bc(){if(null!==ac){if(0===oc)var e=ac.return;else ba=va=null,Fl(e=ac),Yo=null,Ko=0,e=ac;for(;null!==e;)ls(e.alternate,e),e=e.return;ac=null}}function Vc(e,t){var n=e.timeoutHandle;-1!==n&&(e.timeoutHandle=-1,cd(n)),null!==(n=e.cancelPendingCommit)&&(e.cancelPendingCommit=null,n()),Bc(),rc=e,ac=n=Dr(e.current,null),lc=t,oc=0,ic=null,sc=!1,cc=xe(e,t),uc=!1,vc=gc=hc=pc=mc=fc=0,yc=bc=null,xc=!1,0!==(8&t)&&(t|=32&t);var r=e.entangledLanes;if(0!==r)for(e=e.entanglements,r&=t;0<r;){var a=31-me(r),l=1<<a;t|=e[a],r&=~l}return dc=t,Er(),n}function Wc(e,t){yl=null,R.H=qo,t===qa||t===Qa?(t=Za(),oc=3):t===$a?(t=Za(),oc=4):oc=t===_i?8:null!==t&&"object"===typeof t&&"function"===typeof t.then?6:1,ic=t,null===ac&&(fc=1,wi(e,Nr(t,e.current)))}function qc(){var e=R.H;return R.H=qo,null===e?qo:e}function $c(){var e=R.A;return R.A=ec,e}function Qc(){fc=4,sc||(4194048&lc)!==lc&&null!==ai.current||(cc=!0),0===(134217727&mc)&&0===(134217727&pc)||null===rc||Ic(rc,lc,gc,!1)}function Gc(e,t,n){var r=nc;nc|=2;var a=qc(),l=$c();rc===e&&lc===t||(jc=null,Vc(e,t)),t=!1;var o=fc;e:for(;;)try{if(0!==oc&&null!==ac){var i=ac,s=ic;switch(oc){case 8:Bc(),o=6;break e;case 3:case 2:case 9:case 6:null===ai.current&&(t=!0);var c=oc;if(oc=0,ic=null,Zc(e,i,s,c),n&&cc){o=0;break e}break;default:c=oc,oc=0,ic=null,Zc(e,i,s,c)}}Yc(),o=fc;break}catch(u){Wc(e,u)}return t&&e.shellSuspendCounter++,ba=va=null,nc=r,R.H=a,R.A=l,null===ac&&(rc=null,lc=0,Er()),o}function Yc(){for(;null!==ac;)Jc(ac)}function Kc(){for(;null!==ac&&!Z();)Jc(ac)}function Jc(e){var t=Ji(e.alternate,e,dc);e.memoizedProps=e.pendingProps,null===t?eu(e):ac=t}function Xc(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=Ai(n,t,t.pendingProps,t.type,void 0,lc);break;case 11:t=Ai(n,t,t.pendingProps,t.type.render,t.ref,lc);break;case 5:Fl(t);default:ls(n,t),t=Ji(n,t=ac=Hr(t,dc),dc)}e.memoizedProps=e.pendingProps,null===t?eu(e):ac=t}function Zc(e,t,n,r){ba=va=null,Fl(t),Yo=null,Ko=0;var a=t.return;try{if(function(e,t,n,r,a){if(n.flags|=32768,null!==r&&"object"===typeof r&&"function"===typeof r.then){if(null!==(t=n.alternate)&&ja(t,n,a,!0),null!==(n=ai.current)){switch(n.tag){case 13:return null===li?Qc():null===n.alternate&&0===fc&&(fc=3),n.flags&=-257,n.flags|=65536,n.lanes=a,r===Ga?n.flags|=16384:(null===(t=n.updateQueue)?n.updateQueue=new Set([r]):t.add(r),du(e,r,a)),!1;case 22:return n.flags|=65536,r===Ga?n.flags|=16384:(null===(t=n.updateQueue)?(t={transitions:null,markerInstances:null,retryQueue:new Set([r])},n.updateQueue=t):null===(n=t.retryQueue)?t.retryQueue=new Set([r]):n.add(r),du(e,r,a)),!1}throw Error(o(435,n.tag))}return du(e,r,a),Qc(),!1}if(la)return null!==(t=ai.current)?(0===(65536&t.flags)&&(t.flags|=256),t.flags|=65536,t.lanes=a,r!==sa&&ha(Nr(e=Error(o(422),{cause:r}),n))):(r!==sa&&ha(Nr(t=Error(o(423),{cause:r}),n)),(e=e.current.alternate).flags|=65536,a&=-a,e.lanes|=a,r=Nr(r,n),il(e,a=ji(e.stateNode,r,a)),4!==fc&&(fc=2)),!1;var l=Error(o(520),{cause:r});if(l=Nr(l,n),null===bc?bc=[l]:bc.push(l),4!==fc&&(fc=2),null===t)return!0;r=Nr(r,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=a&-a,n.lanes|=e,il(n,e=ji(n.stateNode,r,e)),!1;case 1:if(t=n.type,l=n.stateNode,0===(128&n.flags)&&("function"===typeof t.getDerivedStateFromError||null!==l&&"function"===typeof l.componentDidCatch&&(null===Nc||!Nc.has(l))))return n.flags|=65536,a&=-a,n.lanes|=a,Si(a=Ni(a),e,n,r),il(n,a),!1}n=n.return}while(null!==n);return!1}(e,a,t,n,lc))return fc=1,wi(e,Nr(n,e.current)),void(ac=null)}catch(l){if(null!==a)throw ac=a,l;return fc=1,wi(e,Nr(n,e.current)),void(ac=null)}32768&t.flags?(la||1===r?e=!0:cc||0!==(536870912&lc)?e=!1:(sc=e=!0,(2===r||9===r||3===r||6===r)&&(null!==(r=ai.current)&&13===r.tag&&(r.flags|=16384))),tu(t,e)):eu(t)}function eu(e){var t=e;do{if(0!==(32768&t.flags))return void tu(t,sc);e=t.return;var n=rs(t.alternate,t,dc);if(null!==n)return void(ac=n);if(null!==(t=t.sibling))return void(ac=t);ac=t=e}while(null!==t);0===fc&&(fc=5)}function tu(e,t){do{var n=as(e.alternate,e);if(null!==n)return n.flags&=32767,void(ac=n);if(null!==(n=e.return)&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&null!==(e=e.sibling))return void(ac=e);ac=e=n}while(null!==e);fc=6,ac=null}function nu(e,t,n,r,a,l,i,s,c){e.cancelPendingCommit=null;do{iu()}while(0!==Sc);if(0!==(6&nc))throw Error(o(327));if(null!==t){if(t===e.current)throw Error(o(177));if(l=t.lanes|t.childLanes,function(e,t,n,r,a,l){var o=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var i=e.entanglements,s=e.expirationTimes,c=e.hiddenUpdates;for(n=o&~n;0<n;){var u=31-me(n),d=1<<u;i[u]=0,s[u]=-1;var f=c[u];if(null!==f)for(c[u]=null,u=0;u<f.length;u++){var m=f[u];null!==m&&(m.lane&=-536870913)}n&=~d}0!==r&&_e(e,r,0),0!==l&&0===a&&0!==e.tag&&(e.suspendedLanes|=l&~(o&~t))}(e,n,l|=Cr,i,s,c),e===rc&&(ac=rc=null,lc=0),Cc=t,_c=e,Ec=n,Pc=l,Lc=a,zc=r,0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?(e.callbackNode=null,e.callbackPriority=0,J(le,(function(){return su(),null}))):(e.callbackNode=null,e.callbackPriority=0),r=0!==(13878&t.flags),0!==(13878&t.subtreeFlags)||r){r=R.T,R.T=null,a=O.p,O.p=2,i=nc,nc|=4;try{!function(e,t){if(e=e.containerInfo,td=nf,tr(e=er(e))){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var a=r.anchorOffset,l=r.focusNode;r=r.focusOffset;try{n.nodeType,l.nodeType}catch(g){n=null;break e}var i=0,s=-1,c=-1,u=0,d=0,f=e,m=null;t:for(;;){for(var p;f!==n||0!==a&&3!==f.nodeType||(s=i+a),f!==l||0!==r&&3!==f.nodeType||(c=i+r),3===f.nodeType&&(i+=f.nodeValue.length),null!==(p=f.firstChild);)m=f,f=p;for(;;){if(f===e)break t;if(m===n&&++u===a&&(s=i),m===l&&++d===r&&(c=i),null!==(p=f.nextSibling))break;m=(f=m).parentNode}f=p}n=-1===s||-1===c?null:{start:s,end:c}}else n=null}n=n||{start:0,end:0}}else n=null;for(nd={focusedElem:e,selectionRange:n},nf=!1,js=t;null!==js;)if(e=(t=js).child,0!==(1024&t.subtreeFlags)&&null!==e)e.return=t,js=e;else for(;null!==js;){switch(l=(t=js).alternate,e=t.flags,t.tag){case 0:case 11:case 15:case 5:case 26:case 27:case 6:case 4:case 17:break;case 1:if(0!==(1024&e)&&null!==l){e=void 0,n=t,a=l.memoizedProps,l=l.memoizedState,r=n.stateNode;try{var h=gi(n.type,a,(n.elementType,n.type));e=r.getSnapshotBeforeUpdate(h,l),r.__reactInternalSnapshotBeforeUpdate=e}catch(v){uu(n,n.return,v)}}break;case 3:if(0!==(1024&e))if(9===(n=(e=t.stateNode.containerInfo).nodeType))hd(e);else if(1===n)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":hd(e);break;default:e.textContent=""}break;default:if(0!==(1024&e))throw Error(o(163))}if(null!==(e=t.sibling)){e.return=t.return,js=e;break}js=t.return}}(e,t)}finally{nc=i,O.p=a,R.T=r}}Sc=1,ru(),au(),lu()}}function ru(){if(1===Sc){Sc=0;var e=_c,t=Cc,n=0!==(13878&t.flags);if(0!==(13878&t.subtreeFlags)||n){n=R.T,R.T=null;var r=O.p;O.p=2;var a=nc;nc|=4;try{Rs(t,e);var l=nd,o=er(e.containerInfo),i=l.focusedElem,s=l.selectionRange;if(o!==i&&i&&i.ownerDocument&&Zn(i.ownerDocument.documentElement,i)){if(null!==s&&tr(i)){var c=s.start,u=s.end;if(void 0===u&&(u=c),"selectionStart"in i)i.selectionStart=c,i.selectionEnd=Math.min(u,i.value.length);else{var d=i.ownerDocument||document,f=d&&d.defaultView||window;if(f.getSelection){var m=f.getSelection(),p=i.textContent.length,h=Math.min(s.start,p),g=void 0===s.end?h:Math.min(s.end,p);!m.extend&&h>g&&(o=g,g=h,h=o);var v=Xn(i,h),b=Xn(i,g);if(v&&b&&(1!==m.rangeCount||m.anchorNode!==v.node||m.anchorOffset!==v.offset||m.focusNode!==b.node||m.focusOffset!==b.offset)){var y=d.createRange();y.setStart(v.node,v.offset),m.removeAllRanges(),h>g?(m.addRange(y),m.extend(b.node,b.offset)):(y.setEnd(b.node,b.offset),m.addRange(y))}}}}for(d=[],m=i;m=m.parentNode;)1===m.nodeType&&d.push({element:m,left:m.scrollLeft,top:m.scrollTop});for("function"===typeof i.focus&&i.focus(),i=0;i<d.length;i++){var x=d[i];x.element.scrollLeft=x.left,x.element.scrollTop=x.top}}nf=!!td,nd=td=null}finally{nc=a,O.p=r,R.T=n}}e.current=t,Sc=2}}function au(){if(2===Sc){Sc=0;var e=_c,t=Cc,n=0!==(8772&t.flags);if(0!==(8772&t.subtreeFlags)||n){n=R.T,R.T=null;var r=O.p;O.p=2;var a=nc;nc|=4;try{Ns(e,t.alternate,t)}finally{nc=a,O.p=r,R.T=n}}Sc=3}}function lu(){if(4===Sc||3===Sc){Sc=0,ee();var e=_c,t=Cc,n=Ec,r=zc;0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?Sc=5:(Sc=0,Cc=_c=null,ou(e,e.pendingLanes));var a=e.pendingLanes;if(0===a&&(Nc=null),Pe(n),t=t.stateNode,de&&"function"===typeof de.onCommitFiberRoot)try{de.onCommitFiberRoot(ue,t,void 0,128===(128&t.current.flags))}catch(s){}if(null!==r){t=R.T,a=O.p,O.p=2,R.T=null;try{for(var l=e.onRecoverableError,o=0;o<r.length;o++){var i=r[o];l(i.value,{componentStack:i.stack})}}finally{R.T=t,O.p=a}}0!==(3&Ec)&&iu(),ku(e),a=e.pendingLanes,0!==(4194090&n)&&0!==(42&a)?e===Mc?Tc++:(Tc=0,Mc=e):Tc=0,ju(0,!1)}}function ou(e,t){0===(e.pooledCacheLanes&=t)&&(null!=(t=e.pooledCache)&&(e.pooledCache=null,Ra(t)))}function iu(e){return ru(),au(),lu(),su()}function su(){if(5!==Sc)return!1;var e=_c,t=Pc;Pc=0;var n=Pe(Ec),r=R.T,a=O.p;try{O.p=32>n?32:n,R.T=null,n=Lc,Lc=null;var l=_c,i=Ec;if(Sc=0,Cc=_c=null,Ec=0,0!==(6&nc))throw Error(o(331));var s=nc;if(nc|=4,Js(l.current),Vs(l,l.current,i,n),nc=s,ju(0,!1),de&&"function"===typeof de.onPostCommitFiberRoot)try{de.onPostCommitFiberRoot(ue,l)}catch(c){}return!0}finally{O.p=a,R.T=r,ou(e,t)}}function cu(e,t,n){t=Nr(n,t),null!==(e=ll(e,t=ji(e.stateNode,t,2),2))&&(Se(e,2),ku(e))}function uu(e,t,n){if(3===e.tag)cu(e,e,n);else for(;null!==t;){if(3===t.tag){cu(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Nc||!Nc.has(r))){e=Nr(n,e),null!==(r=ll(t,n=Ni(2),2))&&(Si(n,r,t,e),Se(r,2),ku(r));break}}t=t.return}}function du(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new tc;var a=new Set;r.set(t,a)}else void 0===(a=r.get(t))&&(a=new Set,r.set(t,a));a.has(n)||(uc=!0,a.add(n),e=fu.bind(null,e,t,n),t.then(e,e))}function fu(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,rc===e&&(lc&n)===n&&(4===fc||3===fc&&(62914560&lc)===lc&&300>te()-wc?0===(2&nc)&&Vc(e,0):hc|=n,vc===lc&&(vc=0)),ku(e)}function mu(e,t){0===t&&(t=je()),null!==(e=zr(e,t))&&(Se(e,t),ku(e))}function pu(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),mu(e,n)}function hu(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,a=e.memoizedState;null!==a&&(n=a.retryLane);break;case 19:r=e.stateNode;break;case 22:r=e.stateNode._retryCache;break;default:throw Error(o(314))}null!==r&&r.delete(t),mu(e,n)}var gu=null,vu=null,bu=!1,yu=!1,xu=!1,wu=0;function ku(e){e!==vu&&null===e.next&&(null===vu?gu=vu=e:vu=vu.next=e),yu=!0,bu||(bu=!0,dd((function(){0!==(6&nc)?J(re,Nu):Su()})))}function ju(e,t){if(!xu&&yu){xu=!0;do{for(var n=!1,r=gu;null!==r;){if(!t)if(0!==e){var a=r.pendingLanes;if(0===a)var l=0;else{var o=r.suspendedLanes,i=r.pingedLanes;l=(1<<31-me(42|e)+1)-1,l=201326741&(l&=a&~(o&~i))?201326741&l|1:l?2|l:0}0!==l&&(n=!0,Eu(r,l))}else l=lc,0===(3&(l=ye(r,r===rc?l:0,null!==r.cancelPendingCommit||-1!==r.timeoutHandle)))||xe(r,l)||(n=!0,Eu(r,l));r=r.next}}while(n);xu=!1}}function Nu(){Su()}function Su(){yu=bu=!1;var e=0;0!==wu&&(function(){var e=window.event;if(e&&"popstate"===e.type)return e!==id&&(id=e,!0);return id=null,!1}()&&(e=wu),wu=0);for(var t=te(),n=null,r=gu;null!==r;){var a=r.next,l=_u(r,t);0===l?(r.next=null,null===n?gu=a:n.next=a,null===a&&(vu=n)):(n=r,(0!==e||0!==(3&l))&&(yu=!0)),r=a}ju(e,!1)}function _u(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,a=e.expirationTimes,l=-62914561&e.pendingLanes;0<l;){var o=31-me(l),i=1<<o,s=a[o];-1===s?0!==(i&n)&&0===(i&r)||(a[o]=we(i,t)):s<=t&&(e.expiredLanes|=i),l&=~i}if(n=lc,n=ye(e,e===(t=rc)?n:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle),r=e.callbackNode,0===n||e===t&&(2===oc||9===oc)||null!==e.cancelPendingCommit)return null!==r&&null!==r&&X(r),e.callbackNode=null,e.callbackPriority=0;if(0===(3&n)||xe(e,n)){if((t=n&-n)===e.callbackPriority)return t;switch(null!==r&&X(r),Pe(n)){case 2:case 8:n=ae;break;case 32:default:n=le;break;case 268435456:n=ie}return r=Cu.bind(null,e),n=J(n,r),e.callbackPriority=t,e.callbackNode=n,t}return null!==r&&null!==r&&X(r),e.callbackPriority=2,e.callbackNode=null,2}function Cu(e,t){if(0!==Sc&&5!==Sc)return e.callbackNode=null,e.callbackPriority=0,null;var n=e.callbackNode;if(iu()&&e.callbackNode!==n)return null;var r=lc;return 0===(r=ye(e,e===rc?r:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle))?null:(Fc(e,r,t),_u(e,te()),null!=e.callbackNode&&e.callbackNode===n?Cu.bind(null,e):null)}function Eu(e,t){if(iu())return null;Fc(e,t,!0)}function Pu(){return 0===wu&&(wu=ke()),wu}function Lu(e){return null==e||"symbol"===typeof e||"boolean"===typeof e?null:"function"===typeof e?e:Pt(""+e)}function zu(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}for(var Tu=0;Tu<wr.length;Tu++){var Mu=wr[Tu];kr(Mu.toLowerCase(),"on"+(Mu[0].toUpperCase()+Mu.slice(1)))}kr(mr,"onAnimationEnd"),kr(pr,"onAnimationIteration"),kr(hr,"onAnimationStart"),kr("dblclick","onDoubleClick"),kr("focusin","onFocus"),kr("focusout","onBlur"),kr(gr,"onTransitionRun"),kr(vr,"onTransitionStart"),kr(br,"onTransitionCancel"),kr(yr,"onTransitionEnd"),Ye("onMouseEnter",["mouseout","mouseover"]),Ye("onMouseLeave",["mouseout","mouseover"]),Ye("onPointerEnter",["pointerout","pointerover"]),Ye("onPointerLeave",["pointerout","pointerover"]),Ge("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ge("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ge("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ge("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ge("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ge("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ru="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Ou=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Ru));function Au(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],a=r.event;r=r.listeners;e:{var l=void 0;if(t)for(var o=r.length-1;0<=o;o--){var i=r[o],s=i.instance,c=i.currentTarget;if(i=i.listener,s!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=c;try{l(a)}catch(u){vi(u)}a.currentTarget=null,l=s}else for(o=0;o<r.length;o++){if(s=(i=r[o]).instance,c=i.currentTarget,i=i.listener,s!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=c;try{l(a)}catch(u){vi(u)}a.currentTarget=null,l=s}}}}function Fu(e,t){var n=t[Oe];void 0===n&&(n=t[Oe]=new Set);var r=e+"__bubble";n.has(r)||(Uu(t,e,2,!1),n.add(r))}function Du(e,t,n){var r=0;t&&(r|=4),Uu(n,e,r,t)}var Hu="_reactListening"+Math.random().toString(36).slice(2);function Iu(e){if(!e[Hu]){e[Hu]=!0,$e.forEach((function(t){"selectionchange"!==t&&(Ou.has(t)||Du(t,!1,e),Du(t,!0,e))}));var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Hu]||(t[Hu]=!0,Du("selectionchange",!1,t))}}function Uu(e,t,n,r){switch(uf(t)){case 2:var a=rf;break;case 8:a=af;break;default:a=lf}n=a.bind(null,t,n,e),a=void 0,!Ht||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(a=!0),r?void 0!==a?e.addEventListener(t,n,{capture:!0,passive:a}):e.addEventListener(t,n,!0):void 0!==a?e.addEventListener(t,n,{passive:a}):e.addEventListener(t,n,!1)}function Bu(e,t,n,r,a){var l=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===a)break;if(4===o)for(o=r.return;null!==o;){var c=o.tag;if((3===c||4===c)&&o.stateNode.containerInfo===a)return;o=o.return}for(;null!==i;){if(null===(o=Ue(i)))return;if(5===(c=o.tag)||6===c||26===c||27===c){r=l=o;continue e}i=i.parentNode}}r=r.return}At((function(){var r=l,a=zt(n),o=[];e:{var i=xr.get(e);if(void 0!==i){var c=Zt,u=e;switch(e){case"keypress":if(0===qt(n))break e;case"keydown":case"keyup":c=hn;break;case"focusin":u="focus",c=ln;break;case"focusout":u="blur",c=ln;break;case"beforeblur":case"afterblur":c=ln;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":c=rn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":c=an;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":c=vn;break;case mr:case pr:case hr:c=on;break;case yr:c=bn;break;case"scroll":case"scrollend":c=tn;break;case"wheel":c=yn;break;case"copy":case"cut":case"paste":c=sn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":c=gn;break;case"toggle":case"beforetoggle":c=xn}var d=0!==(4&t),f=!d&&("scroll"===e||"scrollend"===e),m=d?null!==i?i+"Capture":null:i;d=[];for(var p,h=r;null!==h;){var g=h;if(p=g.stateNode,5!==(g=g.tag)&&26!==g&&27!==g||null===p||null===m||null!=(g=Ft(h,m))&&d.push(Vu(h,g,p)),f)break;h=h.return}0<d.length&&(i=new c(i,u,null,n,a),o.push({event:i,listeners:d}))}}if(0===(7&t)){if(c="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||n===Lt||!(u=n.relatedTarget||n.fromElement)||!Ue(u)&&!u[Re])&&(c||i)&&(i=a.window===a?a:(i=a.ownerDocument)?i.defaultView||i.parentWindow:window,c?(c=r,null!==(u=(u=n.relatedTarget||n.toElement)?Ue(u):null)&&(f=s(u),d=u.tag,u!==f||5!==d&&27!==d&&6!==d)&&(u=null)):(c=null,u=r),c!==u)){if(d=rn,g="onMouseLeave",m="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(d=gn,g="onPointerLeave",m="onPointerEnter",h="pointer"),f=null==c?i:Ve(c),p=null==u?i:Ve(u),(i=new d(g,h+"leave",c,n,a)).target=f,i.relatedTarget=p,g=null,Ue(a)===r&&((d=new d(m,h+"enter",u,n,a)).target=p,d.relatedTarget=f,g=d),f=g,c&&u)e:{for(m=u,h=0,p=d=c;p;p=qu(p))h++;for(p=0,g=m;g;g=qu(g))p++;for(;0<h-p;)d=qu(d),h--;for(;0<p-h;)m=qu(m),p--;for(;h--;){if(d===m||null!==m&&d===m.alternate)break e;d=qu(d),m=qu(m)}d=null}else d=null;null!==c&&$u(o,i,c,d,!1),null!==u&&null!==f&&$u(o,f,u,d,!0)}if("select"===(c=(i=r?Ve(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===c&&"file"===i.type)var v=Dn;else if(Tn(i))if(Hn)v=Gn;else{v=$n;var b=qn}else!(c=i.nodeName)||"input"!==c.toLowerCase()||"checkbox"!==i.type&&"radio"!==i.type?r&&_t(r.elementType)&&(v=Dn):v=Qn;switch(v&&(v=v(e,r))?Mn(o,v,n,a):(b&&b(e,i,r),"focusout"===e&&r&&"number"===i.type&&null!=r.memoizedProps.value&&bt(i,"number",i.value)),b=r?Ve(r):window,e){case"focusin":(Tn(b)||"true"===b.contentEditable)&&(rr=b,ar=r,lr=null);break;case"focusout":lr=ar=rr=null;break;case"mousedown":or=!0;break;case"contextmenu":case"mouseup":case"dragend":or=!1,ir(o,n,a);break;case"selectionchange":if(nr)break;case"keydown":case"keyup":ir(o,n,a)}var y;if(kn)e:{switch(e){case"compositionstart":var x="onCompositionStart";break e;case"compositionend":x="onCompositionEnd";break e;case"compositionupdate":x="onCompositionUpdate";break e}x=void 0}else Ln?En(e,n)&&(x="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(x="onCompositionStart");x&&(Sn&&"ko"!==n.locale&&(Ln||"onCompositionStart"!==x?"onCompositionEnd"===x&&Ln&&(y=Wt()):(Bt="value"in(Ut=a)?Ut.value:Ut.textContent,Ln=!0)),0<(b=Wu(r,x)).length&&(x=new cn(x,e,null,n,a),o.push({event:x,listeners:b}),y?x.data=y:null!==(y=Pn(n))&&(x.data=y))),(y=Nn?function(e,t){switch(e){case"compositionend":return Pn(t);case"keypress":return 32!==t.which?null:(Cn=!0,_n);case"textInput":return(e=t.data)===_n&&Cn?null:e;default:return null}}(e,n):function(e,t){if(Ln)return"compositionend"===e||!kn&&En(e,t)?(e=Wt(),Vt=Bt=Ut=null,Ln=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Sn&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(x=Wu(r,"onBeforeInput")).length&&(b=new cn("onBeforeInput","beforeinput",null,n,a),o.push({event:b,listeners:x}),b.data=y)),function(e,t,n,r,a){if("submit"===t&&n&&n.stateNode===a){var l=Lu((a[Me]||null).action),o=r.submitter;o&&null!==(t=(t=o[Me]||null)?Lu(t.formAction):o.getAttribute("formAction"))&&(l=t,o=null);var i=new Zt("action","action",null,r,a);e.push({event:i,listeners:[{instance:null,listener:function(){if(r.defaultPrevented){if(0!==wu){var e=o?zu(a,o):new FormData(a);zo(n,{pending:!0,data:e,method:a.method,action:l},null,e)}}else"function"===typeof l&&(i.preventDefault(),e=o?zu(a,o):new FormData(a),zo(n,{pending:!0,data:e,method:a.method,action:l},l,e))},currentTarget:a}]})}}(o,e,r,n,a)}Au(o,t)}))}function Vu(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Wu(e,t){for(var n=t+"Capture",r=[];null!==e;){var a=e,l=a.stateNode;if(5!==(a=a.tag)&&26!==a&&27!==a||null===l||(null!=(a=Ft(e,n))&&r.unshift(Vu(e,a,l)),null!=(a=Ft(e,t))&&r.push(Vu(e,a,l))),3===e.tag)return r;e=e.return}return[]}function qu(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag&&27!==e.tag);return e||null}function $u(e,t,n,r,a){for(var l=t._reactName,o=[];null!==n&&n!==r;){var i=n,s=i.alternate,c=i.stateNode;if(i=i.tag,null!==s&&s===r)break;5!==i&&26!==i&&27!==i||null===c||(s=c,a?null!=(c=Ft(n,l))&&o.unshift(Vu(n,c,s)):a||null!=(c=Ft(n,l))&&o.push(Vu(n,c,s))),n=n.return}0!==o.length&&e.push({event:t,listeners:o})}var Qu=/\r\n?/g,Gu=/\u0000|\uFFFD/g;function Yu(e){return("string"===typeof e?e:""+e).replace(Qu,"\n").replace(Gu,"")}function Ku(e,t){return t=Yu(t),Yu(e)===t}function Ju(){}function Xu(e,t,n,r,a,l){switch(n){case"children":"string"===typeof r?"body"===t||"textarea"===t&&""===r||kt(e,r):("number"===typeof r||"bigint"===typeof r)&&"body"!==t&&kt(e,""+r);break;case"className":nt(e,"class",r);break;case"tabIndex":nt(e,"tabindex",r);break;case"dir":case"role":case"viewBox":case"width":case"height":nt(e,n,r);break;case"style":St(e,r,l);break;case"data":if("object"!==t){nt(e,"data",r);break}case"src":case"href":if(""===r&&("a"!==t||"href"!==n)){e.removeAttribute(n);break}if(null==r||"function"===typeof r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Pt(""+r),e.setAttribute(n,r);break;case"action":case"formAction":if("function"===typeof r){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}if("function"===typeof l&&("formAction"===n?("input"!==t&&Xu(e,t,"name",a.name,a,null),Xu(e,t,"formEncType",a.formEncType,a,null),Xu(e,t,"formMethod",a.formMethod,a,null),Xu(e,t,"formTarget",a.formTarget,a,null)):(Xu(e,t,"encType",a.encType,a,null),Xu(e,t,"method",a.method,a,null),Xu(e,t,"target",a.target,a,null))),null==r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Pt(""+r),e.setAttribute(n,r);break;case"onClick":null!=r&&(e.onclick=Ju);break;case"onScroll":null!=r&&Fu("scroll",e);break;case"onScrollEnd":null!=r&&Fu("scrollend",e);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"multiple":e.multiple=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"muted":e.muted=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":case"autoFocus":break;case"xlinkHref":if(null==r||"function"===typeof r||"boolean"===typeof r||"symbol"===typeof r){e.removeAttribute("xlink:href");break}n=Pt(""+r),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""+r):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":!0===r?e.setAttribute(n,""):!1!==r&&null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,r):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":null!=r&&"function"!==typeof r&&"symbol"!==typeof r&&!isNaN(r)&&1<=r?e.setAttribute(n,r):e.removeAttribute(n);break;case"rowSpan":case"start":null==r||"function"===typeof r||"symbol"===typeof r||isNaN(r)?e.removeAttribute(n):e.setAttribute(n,r);break;case"popover":Fu("beforetoggle",e),Fu("toggle",e),tt(e,"popover",r);break;case"xlinkActuate":rt(e,"http://www.w3.org/1999/xlink","xlink:actuate",r);break;case"xlinkArcrole":rt(e,"http://www.w3.org/1999/xlink","xlink:arcrole",r);break;case"xlinkRole":rt(e,"http://www.w3.org/1999/xlink","xlink:role",r);break;case"xlinkShow":rt(e,"http://www.w3.org/1999/xlink","xlink:show",r);break;case"xlinkTitle":rt(e,"http://www.w3.org/1999/xlink","xlink:title",r);break;case"xlinkType":rt(e,"http://www.w3.org/1999/xlink","xlink:type",r);break;case"xmlBase":rt(e,"http://www.w3.org/XML/1998/namespace","xml:base",r);break;case"xmlLang":rt(e,"http://www.w3.org/XML/1998/namespace","xml:lang",r);break;case"xmlSpace":rt(e,"http://www.w3.org/XML/1998/namespace","xml:space",r);break;case"is":tt(e,"is",r);break;case"innerText":case"textContent":break;default:(!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&tt(e,n=Ct.get(n)||n,r)}}function Zu(e,t,n,r,a,l){switch(n){case"style":St(e,r,l);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"children":"string"===typeof r?kt(e,r):("number"===typeof r||"bigint"===typeof r)&&kt(e,""+r);break;case"onScroll":null!=r&&Fu("scroll",e);break;case"onScrollEnd":null!=r&&Fu("scrollend",e);break;case"onClick":null!=r&&(e.onclick=Ju);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":case"innerText":case"textContent":break;default:Qe.hasOwnProperty(n)||("o"!==n[0]||"n"!==n[1]||(a=n.endsWith("Capture"),t=n.slice(2,a?n.length-7:void 0),"function"===typeof(l=null!=(l=e[Me]||null)?l[n]:null)&&e.removeEventListener(t,l,a),"function"!==typeof r)?n in e?e[n]=r:!0===r?e.setAttribute(n,""):tt(e,n,r):("function"!==typeof l&&null!==l&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,r,a)))}}function ed(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Fu("error",e),Fu("load",e);var r,a=!1,l=!1;for(r in n)if(n.hasOwnProperty(r)){var i=n[r];if(null!=i)switch(r){case"src":a=!0;break;case"srcSet":l=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:Xu(e,t,r,i,n,null)}}return l&&Xu(e,t,"srcSet",n.srcSet,n,null),void(a&&Xu(e,t,"src",n.src,n,null));case"input":Fu("invalid",e);var s=r=i=l=null,c=null,u=null;for(a in n)if(n.hasOwnProperty(a)){var d=n[a];if(null!=d)switch(a){case"name":l=d;break;case"type":i=d;break;case"checked":c=d;break;case"defaultChecked":u=d;break;case"value":r=d;break;case"defaultValue":s=d;break;case"children":case"dangerouslySetInnerHTML":if(null!=d)throw Error(o(137,t));break;default:Xu(e,t,a,d,n,null)}}return vt(e,r,s,c,u,i,l,!1),void dt(e);case"select":for(l in Fu("invalid",e),a=i=r=null,n)if(n.hasOwnProperty(l)&&null!=(s=n[l]))switch(l){case"value":r=s;break;case"defaultValue":i=s;break;case"multiple":a=s;default:Xu(e,t,l,s,n,null)}return t=r,n=i,e.multiple=!!a,void(null!=t?yt(e,!!a,t,!1):null!=n&&yt(e,!!a,n,!0));case"textarea":for(i in Fu("invalid",e),r=l=a=null,n)if(n.hasOwnProperty(i)&&null!=(s=n[i]))switch(i){case"value":a=s;break;case"defaultValue":l=s;break;case"children":r=s;break;case"dangerouslySetInnerHTML":if(null!=s)throw Error(o(91));break;default:Xu(e,t,i,s,n,null)}return wt(e,a,l,r),void dt(e);case"option":for(c in n)if(n.hasOwnProperty(c)&&null!=(a=n[c]))if("selected"===c)e.selected=a&&"function"!==typeof a&&"symbol"!==typeof a;else Xu(e,t,c,a,n,null);return;case"dialog":Fu("beforetoggle",e),Fu("toggle",e),Fu("cancel",e),Fu("close",e);break;case"iframe":case"object":Fu("load",e);break;case"video":case"audio":for(a=0;a<Ru.length;a++)Fu(Ru[a],e);break;case"image":Fu("error",e),Fu("load",e);break;case"details":Fu("toggle",e);break;case"embed":case"source":case"link":Fu("error",e),Fu("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(u in n)if(n.hasOwnProperty(u)&&null!=(a=n[u]))switch(u){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:Xu(e,t,u,a,n,null)}return;default:if(_t(t)){for(d in n)n.hasOwnProperty(d)&&(void 0!==(a=n[d])&&Zu(e,t,d,a,n,void 0));return}}for(s in n)n.hasOwnProperty(s)&&(null!=(a=n[s])&&Xu(e,t,s,a,n,null))}var td=null,nd=null;function rd(e){return 9===e.nodeType?e:e.ownerDocument}function ad(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function ld(e,t){if(0===e)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return 1===e&&"foreignObject"===t?0:e}function od(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"bigint"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var id=null;var sd="function"===typeof setTimeout?setTimeout:void 0,cd="function"===typeof clearTimeout?clearTimeout:void 0,ud="function"===typeof Promise?Promise:void 0,dd="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof ud?function(e){return ud.resolve(null).then(e).catch(fd)}:sd;function fd(e){setTimeout((function(){throw e}))}function md(e){return"head"===e}function pd(e,t){var n=t,r=0,a=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&8===l.nodeType)if("/$"===(n=l.data)){if(0<r&&8>r){n=r;var o=e.ownerDocument;if(1&n&&wd(o.documentElement),2&n&&wd(o.body),4&n)for(wd(n=o.head),o=n.firstChild;o;){var i=o.nextSibling,s=o.nodeName;o[He]||"SCRIPT"===s||"STYLE"===s||"LINK"===s&&"stylesheet"===o.rel.toLowerCase()||n.removeChild(o),o=i}}if(0===a)return e.removeChild(l),void Ef(t);a--}else"$"===n||"$?"===n||"$!"===n?a++:r=n.charCodeAt(0)-48;else r=0;n=l}while(n);Ef(t)}function hd(e){var t=e.firstChild;for(t&&10===t.nodeType&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":hd(n),Ie(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if("stylesheet"===n.rel.toLowerCase())continue}e.removeChild(n)}}function gd(e){return"$!"===e.data||"$?"===e.data&&"complete"===e.ownerDocument.readyState}function vd(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t||"F!"===t||"F"===t)break;if("/$"===t)return null}}return e}var bd=null;function yd(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}function xd(e,t,n){switch(t=rd(n),e){case"html":if(!(e=t.documentElement))throw Error(o(452));return e;case"head":if(!(e=t.head))throw Error(o(453));return e;case"body":if(!(e=t.body))throw Error(o(454));return e;default:throw Error(o(451))}}function wd(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);Ie(e)}var kd=new Map,jd=new Set;function Nd(e){return"function"===typeof e.getRootNode?e.getRootNode():9===e.nodeType?e:e.ownerDocument}var Sd=O.d;O.d={f:function(){var e=Sd.f(),t=Uc();return e||t},r:function(e){var t=Be(e);null!==t&&5===t.tag&&"form"===t.type?Mo(t):Sd.r(e)},D:function(e){Sd.D(e),Cd("dns-prefetch",e,null)},C:function(e,t){Sd.C(e,t),Cd("preconnect",e,t)},L:function(e,t,n){Sd.L(e,t,n);var r=_d;if(r&&e&&t){var a='link[rel="preload"][as="'+ht(t)+'"]';"image"===t&&n&&n.imageSrcSet?(a+='[imagesrcset="'+ht(n.imageSrcSet)+'"]',"string"===typeof n.imageSizes&&(a+='[imagesizes="'+ht(n.imageSizes)+'"]')):a+='[href="'+ht(e)+'"]';var l=a;switch(t){case"style":l=Pd(e);break;case"script":l=Td(e)}kd.has(l)||(e=f({rel:"preload",href:"image"===t&&n&&n.imageSrcSet?void 0:e,as:t},n),kd.set(l,e),null!==r.querySelector(a)||"style"===t&&r.querySelector(Ld(l))||"script"===t&&r.querySelector(Md(l))||(ed(t=r.createElement("link"),"link",e),qe(t),r.head.appendChild(t)))}},m:function(e,t){Sd.m(e,t);var n=_d;if(n&&e){var r=t&&"string"===typeof t.as?t.as:"script",a='link[rel="modulepreload"][as="'+ht(r)+'"][href="'+ht(e)+'"]',l=a;switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":l=Td(e)}if(!kd.has(l)&&(e=f({rel:"modulepreload",href:e},t),kd.set(l,e),null===n.querySelector(a))){switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(Md(l)))return}ed(r=n.createElement("link"),"link",e),qe(r),n.head.appendChild(r)}}},X:function(e,t){Sd.X(e,t);var n=_d;if(n&&e){var r=We(n).hoistableScripts,a=Td(e),l=r.get(a);l||((l=n.querySelector(Md(a)))||(e=f({src:e,async:!0},t),(t=kd.get(a))&&Fd(e,t),qe(l=n.createElement("script")),ed(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}},S:function(e,t,n){Sd.S(e,t,n);var r=_d;if(r&&e){var a=We(r).hoistableStyles,l=Pd(e);t=t||"default";var o=a.get(l);if(!o){var i={loading:0,preload:null};if(o=r.querySelector(Ld(l)))i.loading=5;else{e=f({rel:"stylesheet",href:e,"data-precedence":t},n),(n=kd.get(l))&&Ad(e,n);var s=o=r.createElement("link");qe(s),ed(s,"link",e),s._p=new Promise((function(e,t){s.onload=e,s.onerror=t})),s.addEventListener("load",(function(){i.loading|=1})),s.addEventListener("error",(function(){i.loading|=2})),i.loading|=4,Od(o,t,r)}o={type:"stylesheet",instance:o,count:1,state:i},a.set(l,o)}}},M:function(e,t){Sd.M(e,t);var n=_d;if(n&&e){var r=We(n).hoistableScripts,a=Td(e),l=r.get(a);l||((l=n.querySelector(Md(a)))||(e=f({src:e,async:!0,type:"module"},t),(t=kd.get(a))&&Fd(e,t),qe(l=n.createElement("script")),ed(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}}};var _d="undefined"===typeof document?null:document;function Cd(e,t,n){var r=_d;if(r&&"string"===typeof t&&t){var a=ht(t);a='link[rel="'+e+'"][href="'+a+'"]',"string"===typeof n&&(a+='[crossorigin="'+n+'"]'),jd.has(a)||(jd.add(a),e={rel:e,crossOrigin:n,href:t},null===r.querySelector(a)&&(ed(t=r.createElement("link"),"link",e),qe(t),r.head.appendChild(t)))}}function Ed(e,t,n,r){var a,l,i,s,c=(c=W.current)?Nd(c):null;if(!c)throw Error(o(446));switch(e){case"meta":case"title":return null;case"style":return"string"===typeof n.precedence&&"string"===typeof n.href?(t=Pd(n.href),(r=(n=We(c).hoistableStyles).get(t))||(r={type:"style",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};case"link":if("stylesheet"===n.rel&&"string"===typeof n.href&&"string"===typeof n.precedence){e=Pd(n.href);var u=We(c).hoistableStyles,d=u.get(e);if(d||(c=c.ownerDocument||c,d={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},u.set(e,d),(u=c.querySelector(Ld(e)))&&!u._p&&(d.instance=u,d.state.loading=5),kd.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},kd.set(e,n),u||(a=c,l=e,i=n,s=d.state,a.querySelector('link[rel="preload"][as="style"]['+l+"]")?s.loading=1:(l=a.createElement("link"),s.preload=l,l.addEventListener("load",(function(){return s.loading|=1})),l.addEventListener("error",(function(){return s.loading|=2})),ed(l,"link",i),qe(l),a.head.appendChild(l))))),t&&null===r)throw Error(o(528,""));return d}if(t&&null!==r)throw Error(o(529,""));return null;case"script":return t=n.async,"string"===typeof(n=n.src)&&t&&"function"!==typeof t&&"symbol"!==typeof t?(t=Td(n),(r=(n=We(c).hoistableScripts).get(t))||(r={type:"script",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,e))}}function Pd(e){return'href="'+ht(e)+'"'}function Ld(e){return'link[rel="stylesheet"]['+e+"]"}function zd(e){return f({},e,{"data-precedence":e.precedence,precedence:null})}function Td(e){return'[src="'+ht(e)+'"]'}function Md(e){return"script[async]"+e}function Rd(e,t,n){if(t.count++,null===t.instance)switch(t.type){case"style":var r=e.querySelector('style[data-href~="'+ht(n.href)+'"]');if(r)return t.instance=r,qe(r),r;var a=f({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return qe(r=(e.ownerDocument||e).createElement("style")),ed(r,"style",a),Od(r,n.precedence,e),t.instance=r;case"stylesheet":a=Pd(n.href);var l=e.querySelector(Ld(a));if(l)return t.state.loading|=4,t.instance=l,qe(l),l;r=zd(n),(a=kd.get(a))&&Ad(r,a),qe(l=(e.ownerDocument||e).createElement("link"));var i=l;return i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),ed(l,"link",r),t.state.loading|=4,Od(l,n.precedence,e),t.instance=l;case"script":return l=Td(n.src),(a=e.querySelector(Md(l)))?(t.instance=a,qe(a),a):(r=n,(a=kd.get(l))&&Fd(r=f({},n),a),qe(a=(e=e.ownerDocument||e).createElement("script")),ed(a,"link",r),e.head.appendChild(a),t.instance=a);case"void":return null;default:throw Error(o(443,t.type))}else"stylesheet"===t.type&&0===(4&t.state.loading)&&(r=t.instance,t.state.loading|=4,Od(r,n.precedence,e));return t.instance}function Od(e,t,n){for(var r=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),a=r.length?r[r.length-1]:null,l=a,o=0;o<r.length;o++){var i=r[o];if(i.dataset.precedence===t)l=i;else if(l!==a)break}l?l.parentNode.insertBefore(e,l.nextSibling):(t=9===n.nodeType?n.head:n).insertBefore(e,t.firstChild)}function Ad(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.title&&(e.title=t.title)}function Fd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.integrity&&(e.integrity=t.integrity)}var Dd=null;function Hd(e,t,n){if(null===Dd){var r=new Map,a=Dd=new Map;a.set(n,r)}else(r=(a=Dd).get(n))||(r=new Map,a.set(n,r));if(r.has(e))return r;for(r.set(e,null),n=n.getElementsByTagName(e),a=0;a<n.length;a++){var l=n[a];if(!(l[He]||l[Te]||"link"===e&&"stylesheet"===l.getAttribute("rel"))&&"http://www.w3.org/2000/svg"!==l.namespaceURI){var o=l.getAttribute(t)||"";o=e+o;var i=r.get(o);i?i.push(l):r.set(o,[l])}}return r}function Id(e,t,n){(e=e.ownerDocument||e).head.insertBefore(n,"title"===t?e.querySelector("head > title"):null)}function Ud(e){return"stylesheet"!==e.type||0!==(3&e.state.loading)}var Bd=null;function Vd(){}function Wd(){if(this.count--,0===this.count)if(this.stylesheets)$d(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}var qd=null;function $d(e,t){e.stylesheets=null,null!==e.unsuspend&&(e.count++,qd=new Map,t.forEach(Qd,e),qd=null,Wd.call(e))}function Qd(e,t){if(!(4&t.state.loading)){var n=qd.get(e);if(n)var r=n.get(null);else{n=new Map,qd.set(e,n);for(var a=e.querySelectorAll("link[data-precedence],style[data-precedence]"),l=0;l<a.length;l++){var o=a[l];"LINK"!==o.nodeName&&"not all"===o.getAttribute("media")||(n.set(o.dataset.precedence,o),r=o)}r&&n.set(null,r)}o=(a=t.instance).getAttribute("data-precedence"),(l=n.get(o)||r)===r&&n.set(null,a),n.set(o,a),this.count++,r=Wd.bind(this),a.addEventListener("load",r),a.addEventListener("error",r),l?l.parentNode.insertBefore(a,l.nextSibling):(e=9===e.nodeType?e.head:e).insertBefore(a,e.firstChild),t.state.loading|=4}}var Gd={$$typeof:w,Provider:null,Consumer:null,_currentValue:A,_currentValue2:A,_threadCount:0};function Yd(e,t,n,r,a,l,o,i){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Ne(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ne(0),this.hiddenUpdates=Ne(null),this.identifierPrefix=r,this.onUncaughtError=a,this.onCaughtError=l,this.onRecoverableError=o,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function Kd(e,t,n,r,a,l,o,i,s,c,u,d){return e=new Yd(e,t,n,o,i,s,c,d),t=1,!0===l&&(t|=24),l=Ar(3,null,null,t),e.current=l,l.stateNode=e,(t=Ma()).refCount++,e.pooledCache=t,t.refCount++,l.memoizedState={element:r,isDehydrated:n,cache:t},nl(l),e}function Jd(e){return e?e=Rr:Rr}function Xd(e,t,n,r,a,l){a=Jd(a),null===r.context?r.context=a:r.pendingContext=a,(r=al(t)).payload={element:n},null!==(l=void 0===l?null:l)&&(r.callback=l),null!==(n=ll(e,r,t))&&(Ac(n,0,t),ol(n,e,t))}function Zd(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function ef(e,t){Zd(e,t),(e=e.alternate)&&Zd(e,t)}function tf(e){if(13===e.tag){var t=zr(e,67108864);null!==t&&Ac(t,0,67108864),ef(e,67108864)}}var nf=!0;function rf(e,t,n,r){var a=R.T;R.T=null;var l=O.p;try{O.p=2,lf(e,t,n,r)}finally{O.p=l,R.T=a}}function af(e,t,n,r){var a=R.T;R.T=null;var l=O.p;try{O.p=8,lf(e,t,n,r)}finally{O.p=l,R.T=a}}function lf(e,t,n,r){if(nf){var a=of(r);if(null===a)Bu(e,t,r,sf,n),yf(e,r);else if(function(e,t,n,r,a){switch(t){case"focusin":return ff=xf(ff,e,t,n,r,a),!0;case"dragenter":return mf=xf(mf,e,t,n,r,a),!0;case"mouseover":return pf=xf(pf,e,t,n,r,a),!0;case"pointerover":var l=a.pointerId;return hf.set(l,xf(hf.get(l)||null,e,t,n,r,a)),!0;case"gotpointercapture":return l=a.pointerId,gf.set(l,xf(gf.get(l)||null,e,t,n,r,a)),!0}return!1}(a,e,t,n,r))r.stopPropagation();else if(yf(e,r),4&t&&-1<bf.indexOf(e)){for(;null!==a;){var l=Be(a);if(null!==l)switch(l.tag){case 3:if((l=l.stateNode).current.memoizedState.isDehydrated){var o=be(l.pendingLanes);if(0!==o){var i=l;for(i.pendingLanes|=2,i.entangledLanes|=2;o;){var s=1<<31-me(o);i.entanglements[1]|=s,o&=~s}ku(l),0===(6&nc)&&(kc=te()+500,ju(0,!1))}}break;case 13:null!==(i=zr(l,2))&&Ac(i,0,2),Uc(),ef(l,2)}if(null===(l=of(r))&&Bu(e,t,r,sf,n),l===a)break;a=l}null!==a&&r.stopPropagation()}else Bu(e,t,r,null,n)}}function of(e){return cf(e=zt(e))}var sf=null;function cf(e){if(sf=null,null!==(e=Ue(e))){var t=s(e);if(null===t)e=null;else{var n=t.tag;if(13===n){if(null!==(e=c(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return sf=e,null}function uf(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(ne()){case re:return 2;case ae:return 8;case le:case oe:return 32;case ie:return 268435456;default:return 32}default:return 32}}var df=!1,ff=null,mf=null,pf=null,hf=new Map,gf=new Map,vf=[],bf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function yf(e,t){switch(e){case"focusin":case"focusout":ff=null;break;case"dragenter":case"dragleave":mf=null;break;case"mouseover":case"mouseout":pf=null;break;case"pointerover":case"pointerout":hf.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":gf.delete(t.pointerId)}}function xf(e,t,n,r,a,l){return null===e||e.nativeEvent!==l?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:l,targetContainers:[a]},null!==t&&(null!==(t=Be(t))&&tf(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==a&&-1===t.indexOf(a)&&t.push(a),e)}function wf(e){var t=Ue(e.target);if(null!==t){var n=s(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=c(n)))return e.blockedOn=t,void function(e,t){var n=O.p;try{return O.p=e,t()}finally{O.p=n}}(e.priority,(function(){if(13===n.tag){var e=Rc();e=Ee(e);var t=zr(n,e);null!==t&&Ac(t,0,e),ef(n,e)}}))}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function kf(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=of(e.nativeEvent);if(null!==n)return null!==(t=Be(n))&&tf(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);Lt=r,n.target.dispatchEvent(r),Lt=null,t.shift()}return!0}function jf(e,t,n){kf(e)&&n.delete(t)}function Nf(){df=!1,null!==ff&&kf(ff)&&(ff=null),null!==mf&&kf(mf)&&(mf=null),null!==pf&&kf(pf)&&(pf=null),hf.forEach(jf),gf.forEach(jf)}function Sf(e,t){e.blockedOn===t&&(e.blockedOn=null,df||(df=!0,r.unstable_scheduleCallback(r.unstable_NormalPriority,Nf)))}var _f=null;function Cf(e){_f!==e&&(_f=e,r.unstable_scheduleCallback(r.unstable_NormalPriority,(function(){_f===e&&(_f=null);for(var t=0;t<e.length;t+=3){var n=e[t],r=e[t+1],a=e[t+2];if("function"!==typeof r){if(null===cf(r||n))continue;break}var l=Be(n);null!==l&&(e.splice(t,3),t-=3,zo(l,{pending:!0,data:a,method:n.method,action:r},r,a))}})))}function Ef(e){function t(t){return Sf(t,e)}null!==ff&&Sf(ff,e),null!==mf&&Sf(mf,e),null!==pf&&Sf(pf,e),hf.forEach(t),gf.forEach(t);for(var n=0;n<vf.length;n++){var r=vf[n];r.blockedOn===e&&(r.blockedOn=null)}for(;0<vf.length&&null===(n=vf[0]).blockedOn;)wf(n),null===n.blockedOn&&vf.shift();if(null!=(n=(e.ownerDocument||e).$$reactFormReplay))for(r=0;r<n.length;r+=3){var a=n[r],l=n[r+1],o=a[Me]||null;if("function"===typeof l)o||Cf(n);else if(o){var i=null;if(l&&l.hasAttribute("formAction")){if(a=l,o=l[Me]||null)i=o.formAction;else if(null!==cf(a))continue}else i=o.action;"function"===typeof i?n[r+1]=i:(n.splice(r,3),r-=3),Cf(n)}}}function Pf(e){this._internalRoot=e}function Lf(e){this._internalRoot=e}Lf.prototype.render=Pf.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));Xd(t.current,Rc(),e,t,null,null)},Lf.prototype.unmount=Pf.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;Xd(e.current,2,null,e,null,null),Uc(),t[Re]=null}},Lf.prototype.unstable_scheduleHydration=function(e){if(e){var t=Le();e={blockedOn:null,target:e,priority:t};for(var n=0;n<vf.length&&0!==t&&t<vf[n].priority;n++);vf.splice(n,0,e),0===n&&wf(e)}};var zf=a.version;if("19.1.0"!==zf)throw Error(o(527,zf,"19.1.0"));O.findDOMNode=function(e){var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return e=function(e){var t=e.alternate;if(!t){if(null===(t=s(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var a=n.return;if(null===a)break;var l=a.alternate;if(null===l){if(null!==(r=a.return)){n=r;continue}break}if(a.child===l.child){for(l=a.child;l;){if(l===n)return u(a),e;if(l===r)return u(a),t;l=l.sibling}throw Error(o(188))}if(n.return!==r.return)n=a,r=l;else{for(var i=!1,c=a.child;c;){if(c===n){i=!0,n=a,r=l;break}if(c===r){i=!0,r=a,n=l;break}c=c.sibling}if(!i){for(c=l.child;c;){if(c===n){i=!0,n=l,r=a;break}if(c===r){i=!0,r=l,n=a;break}c=c.sibling}if(!i)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(t),e=null===(e=null!==e?d(e):null)?null:e.stateNode};var Tf={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:R,reconcilerVersion:"19.1.0"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var Mf=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Mf.isDisabled&&Mf.supportsFiber)try{ue=Mf.inject(Tf),de=Mf}catch(Of){}}t.createRoot=function(e,t){if(!i(e))throw Error(o(299));var n=!1,r="",a=bi,l=yi,s=xi;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onUncaughtError&&(a=t.onUncaughtError),void 0!==t.onCaughtError&&(l=t.onCaughtError),void 0!==t.onRecoverableError&&(s=t.onRecoverableError),void 0!==t.unstable_transitionCallbacks&&t.unstable_transitionCallbacks),t=Kd(e,1,!1,null,0,n,r,a,l,s,0,null),e[Re]=t.current,Iu(e),new Pf(t)},t.hydrateRoot=function(e,t,n){if(!i(e))throw Error(o(299));var r=!1,a="",l=bi,s=yi,c=xi,u=null;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(r=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onUncaughtError&&(l=n.onUncaughtError),void 0!==n.onCaughtError&&(s=n.onCaughtError),void 0!==n.onRecoverableError&&(c=n.onRecoverableError),void 0!==n.unstable_transitionCallbacks&&n.unstable_transitionCallbacks,void 0!==n.formState&&(u=n.formState)),(t=Kd(e,1,!0,t,0,r,a,l,s,c,0,u)).context=Jd(null),n=t.current,(a=al(r=Ee(r=Rc()))).callback=null,ll(n,a,r),n=r,t.current.lanes=n,Se(t,n),ku(t),e[Re]=t.current,Iu(e),new Lf(t)},t.version="19.1.0"},43:(e,t,n)=>{e.exports=n(288)},175:(e,t)=>{const n=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,r=/^[\u0021-\u003A\u003C-\u007E]*$/,a=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,l=/^[\u0020-\u003A\u003D-\u007E]*$/,o=Object.prototype.toString,i=(()=>{const e=function(){};return e.prototype=Object.create(null),e})();function s(e,t,n){do{const n=e.charCodeAt(t);if(32!==n&&9!==n)return t}while(++t<n);return n}function c(e,t,n){for(;t>n;){const n=e.charCodeAt(--t);if(32!==n&&9!==n)return t+1}return n}function u(e){if(-1===e.indexOf("%"))return e;try{return decodeURIComponent(e)}catch(t){return e}}},288:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),a=Symbol.for("react.fragment"),l=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.consumer"),s=Symbol.for("react.context"),c=Symbol.for("react.forward_ref"),u=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),m=Symbol.iterator;var p={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},h=Object.assign,g={};function v(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||p}function b(){}function y(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||p}v.prototype.isReactComponent={},v.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},v.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},b.prototype=v.prototype;var x=y.prototype=new b;x.constructor=y,h(x,v.prototype),x.isPureReactComponent=!0;var w=Array.isArray,k={H:null,A:null,T:null,S:null,V:null},j=Object.prototype.hasOwnProperty;function N(e,t,r,a,l,o){return r=o.ref,{$$typeof:n,type:e,key:t,ref:void 0!==r?r:null,props:o}}function S(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var _=/\/+/g;function C(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function E(){}function P(e,t,a,l,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var s,c,u=!1;if(null===e)u=!0;else switch(i){case"bigint":case"string":case"number":u=!0;break;case"object":switch(e.$$typeof){case n:case r:u=!0;break;case f:return P((u=e._init)(e._payload),t,a,l,o)}}if(u)return o=o(e),u=""===l?"."+C(e,0):l,w(o)?(a="",null!=u&&(a=u.replace(_,"$&/")+"/"),P(o,t,a,"",(function(e){return e}))):null!=o&&(S(o)&&(s=o,c=a+(null==o.key||e&&e.key===o.key?"":(""+o.key).replace(_,"$&/")+"/")+u,o=N(s.type,c,void 0,0,0,s.props)),t.push(o)),1;u=0;var d,p=""===l?".":l+":";if(w(e))for(var h=0;h<e.length;h++)u+=P(l=e[h],t,a,i=p+C(l,h),o);else if("function"===typeof(h=null===(d=e)||"object"!==typeof d?null:"function"===typeof(d=m&&d[m]||d["@@iterator"])?d:null))for(e=h.call(e),h=0;!(l=e.next()).done;)u+=P(l=l.value,t,a,i=p+C(l,h++),o);else if("object"===i){if("function"===typeof e.then)return P(function(e){switch(e.status){case"fulfilled":return e.value;case"rejected":throw e.reason;default:switch("string"===typeof e.status?e.then(E,E):(e.status="pending",e.then((function(t){"pending"===e.status&&(e.status="fulfilled",e.value=t)}),(function(t){"pending"===e.status&&(e.status="rejected",e.reason=t)}))),e.status){case"fulfilled":return e.value;case"rejected":throw e.reason}}throw e}(e),t,a,l,o);throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.")}return u}function L(e,t,n){if(null==e)return e;var r=[],a=0;return P(e,r,"","",(function(e){return t.call(n,e,a++)})),r}function z(e){if(-1===e._status){var t=e._result;(t=t()).then((function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)}),(function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)})),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var T="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function M(){}t.Children={map:L,forEach:function(e,t,n){L(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return L(e,(function(){t++})),t},toArray:function(e){return L(e,(function(e){return e}))||[]},only:function(e){if(!S(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=v,t.Fragment=a,t.Profiler=o,t.PureComponent=y,t.StrictMode=l,t.Suspense=u,t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=k,t.__COMPILER_RUNTIME={__proto__:null,c:function(e){return k.H.useMemoCache(e)}},t.cache=function(e){return function(){return e.apply(null,arguments)}},t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error("The argument must be a React element, but you passed "+e+".");var r=h({},e.props),a=e.key;if(null!=t)for(l in void 0!==t.ref&&void 0,void 0!==t.key&&(a=""+t.key),t)!j.call(t,l)||"key"===l||"__self"===l||"__source"===l||"ref"===l&&void 0===t.ref||(r[l]=t[l]);var l=arguments.length-2;if(1===l)r.children=n;else if(1<l){for(var o=Array(l),i=0;i<l;i++)o[i]=arguments[i+2];r.children=o}return N(e.type,a,void 0,0,0,r)},t.createContext=function(e){return(e={$$typeof:s,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider=e,e.Consumer={$$typeof:i,_context:e},e},t.createElement=function(e,t,n){var r,a={},l=null;if(null!=t)for(r in void 0!==t.key&&(l=""+t.key),t)j.call(t,r)&&"key"!==r&&"__self"!==r&&"__source"!==r&&(a[r]=t[r]);var o=arguments.length-2;if(1===o)a.children=n;else if(1<o){for(var i=Array(o),s=0;s<o;s++)i[s]=arguments[s+2];a.children=i}if(e&&e.defaultProps)for(r in o=e.defaultProps)void 0===a[r]&&(a[r]=o[r]);return N(e,l,void 0,0,0,a)},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:c,render:e}},t.isValidElement=S,t.lazy=function(e){return{$$typeof:f,_payload:{_status:-1,_result:e},_init:z}},t.memo=function(e,t){return{$$typeof:d,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=k.T,n={};k.T=n;try{var r=e(),a=k.S;null!==a&&a(n,r),"object"===typeof r&&null!==r&&"function"===typeof r.then&&r.then(M,T)}catch(l){T(l)}finally{k.T=t}},t.unstable_useCacheRefresh=function(){return k.H.useCacheRefresh()},t.use=function(e){return k.H.use(e)},t.useActionState=function(e,t,n){return k.H.useActionState(e,t,n)},t.useCallback=function(e,t){return k.H.useCallback(e,t)},t.useContext=function(e){return k.H.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e,t){return k.H.useDeferredValue(e,t)},t.useEffect=function(e,t,n){var r=k.H;if("function"===typeof n)throw Error("useEffect CRUD overload is not enabled in this build of React.");return r.useEffect(e,t)},t.useId=function(){return k.H.useId()},t.useImperativeHandle=function(e,t,n){return k.H.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return k.H.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return k.H.useLayoutEffect(e,t)},t.useMemo=function(e,t){return k.H.useMemo(e,t)},t.useOptimistic=function(e,t){return k.H.useOptimistic(e,t)},t.useReducer=function(e,t,n){return k.H.useReducer(e,t,n)},t.useRef=function(e){return k.H.useRef(e)},t.useState=function(e){return k.H.useState(e)},t.useSyncExternalStore=function(e,t,n){return k.H.useSyncExternalStore(e,t,n)},t.useTransition=function(){return k.H.useTransition()},t.version="19.1.0"},391:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(4)},579:(e,t,n)=>{e.exports=n(799)},672:(e,t,n)=>{var r=n(43);function a(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function l(){}var o={d:{f:l,r:function(){throw Error(a(522))},D:l,C:l,L:l,m:l,X:l,S:l,M:l},p:0,findDOMNode:null},i=Symbol.for("react.portal");var s=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function c(e,t){return"font"===e?"":"string"===typeof t?"use-credentials"===t?t:"":void 0}t.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=o,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)throw Error(a(299));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:i,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.flushSync=function(e){var t=s.T,n=o.p;try{if(s.T=null,o.p=2,e)return e()}finally{s.T=t,o.p=n,o.d.f()}},t.preconnect=function(e,t){"string"===typeof e&&(t?t="string"===typeof(t=t.crossOrigin)?"use-credentials"===t?t:"":void 0:t=null,o.d.C(e,t))},t.prefetchDNS=function(e){"string"===typeof e&&o.d.D(e)},t.preinit=function(e,t){if("string"===typeof e&&t&&"string"===typeof t.as){var n=t.as,r=c(n,t.crossOrigin),a="string"===typeof t.integrity?t.integrity:void 0,l="string"===typeof t.fetchPriority?t.fetchPriority:void 0;"style"===n?o.d.S(e,"string"===typeof t.precedence?t.precedence:void 0,{crossOrigin:r,integrity:a,fetchPriority:l}):"script"===n&&o.d.X(e,{crossOrigin:r,integrity:a,fetchPriority:l,nonce:"string"===typeof t.nonce?t.nonce:void 0})}},t.preinitModule=function(e,t){if("string"===typeof e)if("object"===typeof t&&null!==t){if(null==t.as||"script"===t.as){var n=c(t.as,t.crossOrigin);o.d.M(e,{crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0})}}else null==t&&o.d.M(e)},t.preload=function(e,t){if("string"===typeof e&&"object"===typeof t&&null!==t&&"string"===typeof t.as){var n=t.as,r=c(n,t.crossOrigin);o.d.L(e,n,{crossOrigin:r,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0,type:"string"===typeof t.type?t.type:void 0,fetchPriority:"string"===typeof t.fetchPriority?t.fetchPriority:void 0,referrerPolicy:"string"===typeof t.referrerPolicy?t.referrerPolicy:void 0,imageSrcSet:"string"===typeof t.imageSrcSet?t.imageSrcSet:void 0,imageSizes:"string"===typeof t.imageSizes?t.imageSizes:void 0,media:"string"===typeof t.media?t.media:void 0})}},t.preloadModule=function(e,t){if("string"===typeof e)if(t){var n=c(t.as,t.crossOrigin);o.d.m(e,{as:"string"===typeof t.as&&"script"!==t.as?t.as:void 0,crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0})}else o.d.m(e)},t.requestFormReset=function(e){o.d.r(e)},t.unstable_batchedUpdates=function(e,t){return e(t)},t.useFormState=function(e,t,n){return s.H.useFormState(e,t,n)},t.useFormStatus=function(){return s.H.useHostTransitionStatus()},t.version="19.1.0"},799:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.fragment");function a(e,t,r){var a=null;if(void 0!==r&&(a=""+r),void 0!==t.key&&(a=""+t.key),"key"in t)for(var l in r={},t)"key"!==l&&(r[l]=t[l]);else r=t;return t=r.ref,{$$typeof:n,type:e,key:a,ref:void 0!==t?t:null,props:r}}t.Fragment=r,t.jsx=a,t.jsxs=a},853:(e,t,n)=>{e.exports=n(896)},896:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,a=e[r];if(!(0<l(a,t)))break e;e[r]=t,e[n]=a,n=r}}function r(e){return 0===e.length?null:e[0]}function a(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,a=e.length,o=a>>>1;r<o;){var i=2*(r+1)-1,s=e[i],c=i+1,u=e[c];if(0>l(s,n))c<a&&0>l(u,s)?(e[r]=u,e[c]=n,r=c):(e[r]=s,e[i]=n,r=i);else{if(!(c<a&&0>l(u,n)))break e;e[r]=u,e[c]=n,r=c}}}return t}function l(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if(t.unstable_now=void 0,"object"===typeof performance&&"function"===typeof performance.now){var o=performance;t.unstable_now=function(){return o.now()}}else{var i=Date,s=i.now();t.unstable_now=function(){return i.now()-s}}var c=[],u=[],d=1,f=null,m=3,p=!1,h=!1,g=!1,v=!1,b="function"===typeof setTimeout?setTimeout:null,y="function"===typeof clearTimeout?clearTimeout:null,x="undefined"!==typeof setImmediate?setImmediate:null;function w(e){for(var t=r(u);null!==t;){if(null===t.callback)a(u);else{if(!(t.startTime<=e))break;a(u),t.sortIndex=t.expirationTime,n(c,t)}t=r(u)}}function k(e){if(g=!1,w(e),!h)if(null!==r(c))h=!0,N||(N=!0,j());else{var t=r(u);null!==t&&T(k,t.startTime-e)}}var j,N=!1,S=-1,_=5,C=-1;function E(){return!!v||!(t.unstable_now()-C<_)}function P(){if(v=!1,N){var e=t.unstable_now();C=e;var n=!0;try{e:{h=!1,g&&(g=!1,y(S),S=-1),p=!0;var l=m;try{t:{for(w(e),f=r(c);null!==f&&!(f.expirationTime>e&&E());){var o=f.callback;if("function"===typeof o){f.callback=null,m=f.priorityLevel;var i=o(f.expirationTime<=e);if(e=t.unstable_now(),"function"===typeof i){f.callback=i,w(e),n=!0;break t}f===r(c)&&a(c),w(e)}else a(c);f=r(c)}if(null!==f)n=!0;else{var s=r(u);null!==s&&T(k,s.startTime-e),n=!1}}break e}finally{f=null,m=l,p=!1}n=void 0}}finally{n?j():N=!1}}}if("function"===typeof x)j=function(){x(P)};else if("undefined"!==typeof MessageChannel){var L=new MessageChannel,z=L.port2;L.port1.onmessage=P,j=function(){z.postMessage(null)}}else j=function(){b(P,0)};function T(e,n){S=b((function(){e(t.unstable_now())}),n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):_=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return m},t.unstable_next=function(e){switch(m){case 1:case 2:case 3:var t=3;break;default:t=m}var n=m;m=t;try{return e()}finally{m=n}},t.unstable_requestPaint=function(){v=!0},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=m;m=e;try{return t()}finally{m=n}},t.unstable_scheduleCallback=function(e,a,l){var o=t.unstable_now();switch("object"===typeof l&&null!==l?l="number"===typeof(l=l.delay)&&0<l?o+l:o:l=o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:d++,callback:a,priorityLevel:e,startTime:l,expirationTime:i=l+i,sortIndex:-1},l>o?(e.sortIndex=l,n(u,e),null===r(c)&&e===r(u)&&(g?(y(S),S=-1):g=!0,T(k,l-o))):(e.sortIndex=i,n(c,e),h||p||(h=!0,N||(N=!0,j()))),e},t.unstable_shouldYield=E,t.unstable_wrapCallback=function(e){var t=m;return function(){var n=m;m=t;try{return e.apply(this,arguments)}finally{m=n}}}},950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(672)}},t={};function n(r){var a=t[r];if(void 0!==a)return a.exports;var l=t[r]={exports:{}};return e[r](l,l.exports,n),l.exports}n.m=e,n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.f={},n.e=e=>Promise.all(Object.keys(n.f).reduce(((t,r)=>(n.f[r](e,t),t)),[])),n.u=e=>"static/js/"+e+".ad6eb26e.chunk.js",n.miniCssF=e=>{},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),(()=>{var e={},t="my-react-app:";n.l=(r,a,l,o)=>{if(e[r])e[r].push(a);else{var i,s;if(void 0!==l)for(var c=document.getElementsByTagName("script"),u=0;u<c.length;u++){var d=c[u];if(d.getAttribute("src")==r||d.getAttribute("data-webpack")==t+l){i=d;break}}i||(s=!0,(i=document.createElement("script")).charset="utf-8",i.timeout=120,n.nc&&i.setAttribute("nonce",n.nc),i.setAttribute("data-webpack",t+l),i.src=r),e[r]=[a];var f=(t,n)=>{i.onerror=i.onload=null,clearTimeout(m);var a=e[r];if(delete e[r],i.parentNode&&i.parentNode.removeChild(i),a&&a.forEach((e=>e(n))),t)return t(n)},m=setTimeout(f.bind(null,void 0,{type:"timeout",target:i}),12e4);i.onerror=f.bind(null,i.onerror),i.onload=f.bind(null,i.onload),s&&document.head.appendChild(i)}}})(),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},n.p="/",(()=>{var e={792:0};n.f.j=(t,r)=>{var a=n.o(e,t)?e[t]:void 0;if(0!==a)if(a)r.push(a[2]);else{var l=new Promise(((n,r)=>a=e[t]=[n,r]));r.push(a[2]=l);var o=n.p+n.u(t),i=new Error;n.l(o,(r=>{if(n.o(e,t)&&(0!==(a=e[t])&&(e[t]=void 0),a)){var l=r&&("load"===r.type?"missing":r.type),o=r&&r.target&&r.target.src;i.message="Loading chunk "+t+" failed.\n("+l+": "+o+")",i.name="ChunkLoadError",i.type=l,i.request=o,a[1](i)}}),"chunk-"+t,t)}};var t=(t,r)=>{var a,l,o=r[0],i=r[1],s=r[2],c=0;if(o.some((t=>0!==e[t]))){for(a in i)n.o(i,a)&&(n.m[a]=i[a]);if(s)s(n)}for(t&&t(r);c<o.length;c++)l=o[c],n.o(e,l)&&e[l]&&e[l][0](),e[l]=0},r=self.webpackChunkmy_react_app=self.webpackChunkmy_react_app||[];r.forEach(t.bind(null,0)),r.push=t.bind(null,r.push.bind(r))})();var r=n(43),a=n(391);function l(e){return l="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},l(e)}function o(e){var t=function(e,t){if("object"!=l(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=l(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==l(t)?t:t+""}function i(e,t,n){return(t=o(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function s(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function c(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?s(Object(n),!0).forEach((function(t){i(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):s(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function u(e,t){if(null==e)return{};var n,r,a=function(e,t){if(null==e)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==t.indexOf(r))continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(r=0;r<l.length;r++)n=l[r],-1===t.indexOf(n)&&{}.propertyIsEnumerable.call(e,n)&&(a[n]=e[n])}return a}n(175);const d=["sri"],f=["page"],m=["page","matches"],p=["onClick","discover","prefetch","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],h=["aria-current","caseSensitive","className","end","style","to","viewTransition","children"],g=["discover","fetcherKey","navigate","reloadDocument","replace","state","method","action","onSubmit","relative","preventScrollReset","viewTransition"];var v="popstate";function b(){return S((function(e,t){let{pathname:n,search:r,hash:a}=e.location;return k("",{pathname:n,search:r,hash:a},t.state&&t.state.usr||null,t.state&&t.state.key||"default")}),(function(e,t){return"string"===typeof t?t:j(t)}),null,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{})}function y(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}function x(e,t){if(!e){"undefined"!==typeof console&&console.warn(t);try{throw new Error(t)}catch(n){}}}function w(e,t){return{usr:e.state,key:e.key,idx:t}}function k(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,r=arguments.length>3?arguments[3]:void 0;return c(c({pathname:"string"===typeof e?e:e.pathname,search:"",hash:""},"string"===typeof t?N(t):t),{},{state:n,key:t&&t.key||r||Math.random().toString(36).substring(2,10)})}function j(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&"?"!==n&&(t+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(t+="#"===r.charAt(0)?r:"#"+r),t}function N(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function S(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},{window:a=document.defaultView,v5Compat:l=!1}=r,o=a.history,i="POP",s=null,u=d();function d(){return(o.state||{idx:null}).idx}function f(){i="POP";let e=d(),t=null==e?null:e-u;u=e,s&&s({action:i,location:p.location,delta:t})}function m(e){return _(e)}null==u&&(u=0,o.replaceState(c(c({},o.state),{},{idx:u}),""));let p={get action(){return i},get location(){return e(a,o)},listen(e){if(s)throw new Error("A history only accepts one active listener");return a.addEventListener(v,f),s=e,()=>{a.removeEventListener(v,f),s=null}},createHref:e=>t(a,e),createURL:m,encodeLocation(e){let t=m(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:function(e,t){i="PUSH";let r=k(p.location,e,t);n&&n(r,e),u=d()+1;let c=w(r,u),f=p.createHref(r);try{o.pushState(c,"",f)}catch(m){if(m instanceof DOMException&&"DataCloneError"===m.name)throw m;a.location.assign(f)}l&&s&&s({action:i,location:p.location,delta:1})},replace:function(e,t){i="REPLACE";let r=k(p.location,e,t);n&&n(r,e),u=d();let a=w(r,u),c=p.createHref(r);o.replaceState(a,"",c),l&&s&&s({action:i,location:p.location,delta:0})},go:e=>o.go(e)};return p}function _(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n="http://localhost";"undefined"!==typeof window&&(n="null"!==window.location.origin?window.location.origin:window.location.href),y(n,"No window.location.(origin|href) available to create URL");let r="string"===typeof e?e:j(e);return r=r.replace(/ $/,"%20"),!t&&r.startsWith("//")&&(r=n+r),new URL(r,n)}new WeakMap;function C(e,t){return E(e,t,arguments.length>2&&void 0!==arguments[2]?arguments[2]:"/",!1)}function E(e,t,n,r){let a=V(("string"===typeof t?N(t):t).pathname||"/",n);if(null==a)return null;let l=P(e);!function(e){e.sort(((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){let n=e.length===t.length&&e.slice(0,-1).every(((e,n)=>e===t[n]));return n?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map((e=>e.childrenIndex)),t.routesMeta.map((e=>e.childrenIndex)))))}(l);let o=null;for(let i=0;null==o&&i<l.length;++i){let e=B(a);o=H(l[i],e,r)}return o}function P(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[],r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"",a=(e,a,l)=>{let o={relativePath:void 0===l?e.path||"":l,caseSensitive:!0===e.caseSensitive,childrenIndex:a,route:e};o.relativePath.startsWith("/")&&(y(o.relativePath.startsWith(r),'Absolute route path "'.concat(o.relativePath,'" nested under path "').concat(r,'" is not valid. An absolute child route path must start with the combined path of all its parent routes.')),o.relativePath=o.relativePath.slice(r.length));let i=G([r,o.relativePath]),s=n.concat(o);e.children&&e.children.length>0&&(y(!0!==e.index,'Index routes must not have child routes. Please remove all child routes from route path "'.concat(i,'".')),P(e.children,t,s,i)),(null!=e.path||e.index)&&t.push({path:i,score:D(i,e.index),routesMeta:s})};return e.forEach(((e,t)=>{var n;if(""!==e.path&&null!==(n=e.path)&&void 0!==n&&n.includes("?"))for(let r of L(e.path))a(e,t,r);else a(e,t)})),t}function L(e){let t=e.split("/");if(0===t.length)return[];let[n,...r]=t,a=n.endsWith("?"),l=n.replace(/\?$/,"");if(0===r.length)return a?[l,""]:[l];let o=L(r.join("/")),i=[];return i.push(...o.map((e=>""===e?l:[l,e].join("/")))),a&&i.push(...o),i.map((t=>e.startsWith("/")&&""===t?"/":t))}var z=/^:[\w-]+$/,T=3,M=2,R=1,O=10,A=-2,F=e=>"*"===e;function D(e,t){let n=e.split("/"),r=n.length;return n.some(F)&&(r+=A),t&&(r+=M),n.filter((e=>!F(e))).reduce(((e,t)=>e+(z.test(t)?T:""===t?R:O)),r)}function H(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],{routesMeta:r}=e,a={},l="/",o=[];for(let i=0;i<r.length;++i){let e=r[i],s=i===r.length-1,c="/"===l?t:t.slice(l.length)||"/",u=I({path:e.relativePath,caseSensitive:e.caseSensitive,end:s},c),d=e.route;if(!u&&s&&n&&!r[r.length-1].route.index&&(u=I({path:e.relativePath,caseSensitive:e.caseSensitive,end:!1},c)),!u)return null;Object.assign(a,u.params),o.push({params:a,pathname:G([l,u.pathname]),pathnameBase:Y(G([l,u.pathnameBase])),route:d}),"/"!==u.pathnameBase&&(l=G([l,u.pathnameBase]))}return o}function I(e,t){"string"===typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=U(e.path,e.caseSensitive,e.end),a=t.match(n);if(!a)return null;let l=a[0],o=l.replace(/(.)\/+$/,"$1"),i=a.slice(1);return{params:r.reduce(((e,t,n)=>{let{paramName:r,isOptional:a}=t;if("*"===r){let e=i[n]||"";o=l.slice(0,l.length-e.length).replace(/(.)\/+$/,"$1")}const s=i[n];return e[r]=a&&!s?void 0:(s||"").replace(/%2F/g,"/"),e}),{}),pathname:l,pathnameBase:o,pattern:e}}function U(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];x("*"===e||!e.endsWith("*")||e.endsWith("/*"),'Route path "'.concat(e,'" will be treated as if it were "').concat(e.replace(/\*$/,"/*"),'" because the `*` character must always follow a `/` in the pattern. To get rid of this warning, please change the route path to "').concat(e.replace(/\*$/,"/*"),'".'));let r=[],a="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,((e,t,n)=>(r.push({paramName:t,isOptional:null!=n}),n?"/?([^\\/]+)?":"/([^\\/]+)")));return e.endsWith("*")?(r.push({paramName:"*"}),a+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?a+="\\/*$":""!==e&&"/"!==e&&(a+="(?:(?=\\/|$))"),[new RegExp(a,t?void 0:"i"),r]}function B(e){try{return e.split("/").map((e=>decodeURIComponent(e).replace(/\//g,"%2F"))).join("/")}catch(t){return x(!1,'The URL path "'.concat(e,'" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (').concat(t,").")),e}}function V(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&"/"!==r?null:e.slice(n)||"/"}function W(e,t,n,r){return"Cannot include a '".concat(e,"' character in a manually specified `to.").concat(t,"` field [").concat(JSON.stringify(r),"].  Please separate it out to the `to.").concat(n,'` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.')}function q(e){return e.filter(((e,t)=>0===t||e.route.path&&e.route.path.length>0))}function $(e){let t=q(e);return t.map(((e,n)=>n===t.length-1?e.pathname:e.pathnameBase))}function Q(e,t,n){let r,a=arguments.length>3&&void 0!==arguments[3]&&arguments[3];"string"===typeof e?r=N(e):(r=c({},e),y(!r.pathname||!r.pathname.includes("?"),W("?","pathname","search",r)),y(!r.pathname||!r.pathname.includes("#"),W("#","pathname","hash",r)),y(!r.search||!r.search.includes("#"),W("#","search","hash",r)));let l,o=""===e||""===r.pathname,i=o?"/":r.pathname;if(null==i)l=n;else{let e=t.length-1;if(!a&&i.startsWith("..")){let t=i.split("/");for(;".."===t[0];)t.shift(),e-=1;r.pathname=t.join("/")}l=e>=0?t[e]:"/"}let s=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"/",{pathname:n,search:r="",hash:a=""}="string"===typeof e?N(e):e,l=n?n.startsWith("/")?n:function(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach((e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)})),n.length>1?n.join("/"):"/"}(n,t):t;return{pathname:l,search:K(r),hash:J(a)}}(r,l),u=i&&"/"!==i&&i.endsWith("/"),d=(o||"."===i)&&n.endsWith("/");return s.pathname.endsWith("/")||!u&&!d||(s.pathname+="/"),s}var G=e=>e.join("/").replace(/\/\/+/g,"/"),Y=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),K=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",J=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";function X(e){return null!=e&&"number"===typeof e.status&&"string"===typeof e.statusText&&"boolean"===typeof e.internal&&"data"in e}var Z=["POST","PUT","PATCH","DELETE"],ee=(new Set(Z),["GET",...Z]);new Set(ee),Symbol("ResetLoaderData");var te=r.createContext(null);te.displayName="DataRouter";var ne=r.createContext(null);ne.displayName="DataRouterState";var re=r.createContext({isTransitioning:!1});re.displayName="ViewTransition";var ae=r.createContext(new Map);ae.displayName="Fetchers";var le=r.createContext(null);le.displayName="Await";var oe=r.createContext(null);oe.displayName="Navigation";var ie=r.createContext(null);ie.displayName="Location";var se=r.createContext({outlet:null,matches:[],isDataRoute:!1});se.displayName="Route";var ce=r.createContext(null);ce.displayName="RouteError";function ue(){return null!=r.useContext(ie)}function de(){return y(ue(),"useLocation() may be used only in the context of a <Router> component."),r.useContext(ie).location}var fe="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function me(e){r.useContext(oe).static||r.useLayoutEffect(e)}function pe(){let{isDataRoute:e}=r.useContext(se);return e?function(){let{router:e}=je("useNavigate"),t=Se("useNavigate"),n=r.useRef(!1);me((()=>{n.current=!0}));let a=r.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};x(n.current,fe),n.current&&("number"===typeof r?e.navigate(r):await e.navigate(r,c({fromRouteId:t},a)))}),[e,t]);return a}():function(){y(ue(),"useNavigate() may be used only in the context of a <Router> component.");let e=r.useContext(te),{basename:t,navigator:n}=r.useContext(oe),{matches:a}=r.useContext(se),{pathname:l}=de(),o=JSON.stringify($(a)),i=r.useRef(!1);me((()=>{i.current=!0}));let s=r.useCallback((function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(x(i.current,fe),!i.current)return;if("number"===typeof r)return void n.go(r);let s=Q(r,JSON.parse(o),l,"path"===a.relative);null==e&&"/"!==t&&(s.pathname="/"===s.pathname?t:G([t,s.pathname])),(a.replace?n.replace:n.push)(s,a.state,a)}),[t,n,o,l,e]);return s}()}r.createContext(null);function he(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{matches:n}=r.useContext(se),{pathname:a}=de(),l=JSON.stringify($(n));return r.useMemo((()=>Q(e,JSON.parse(l),a,"path"===t)),[e,l,a,t])}function ge(e,t,n,a){y(ue(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:l}=r.useContext(oe),{matches:o}=r.useContext(se),i=o[o.length-1],s=i?i.params:{},u=i?i.pathname:"/",d=i?i.pathnameBase:"/",f=i&&i.route;{let e=f&&f.path||"";Ee(u,!f||e.endsWith("*")||e.endsWith("*?"),'You rendered descendant <Routes> (or called `useRoutes()`) at "'.concat(u,'" (under <Route path="').concat(e,'">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won\'t match anymore and therefore the child routes will never render.\n\nPlease change the parent <Route path="').concat(e,'"> to <Route path="').concat("/"===e?"*":"".concat(e,"/*"),'">.'))}let m,p=de();if(t){var h;let e="string"===typeof t?N(t):t;y("/"===d||(null===(h=e.pathname)||void 0===h?void 0:h.startsWith(d)),'When overriding the location using `<Routes location>` or `useRoutes(routes, location)`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "'.concat(d,'" but pathname "').concat(e.pathname,'" was given in the `location` prop.')),m=e}else m=p;let g=m.pathname||"/",v=g;if("/"!==d){let e=d.replace(/^\//,"").split("/");v="/"+g.replace(/^\//,"").split("/").slice(e.length).join("/")}let b=C(e,{pathname:v});x(f||null!=b,'No routes matched location "'.concat(m.pathname).concat(m.search).concat(m.hash,'" ')),x(null==b||void 0!==b[b.length-1].route.element||void 0!==b[b.length-1].route.Component||void 0!==b[b.length-1].route.lazy,'Matched leaf route at location "'.concat(m.pathname).concat(m.search).concat(m.hash,'" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.'));let w=we(b&&b.map((e=>Object.assign({},e,{params:Object.assign({},s,e.params),pathname:G([d,l.encodeLocation?l.encodeLocation(e.pathname).pathname:e.pathname]),pathnameBase:"/"===e.pathnameBase?d:G([d,l.encodeLocation?l.encodeLocation(e.pathnameBase).pathname:e.pathnameBase])}))),o,n,a);return t&&w?r.createElement(ie.Provider,{value:{location:c({pathname:"/",search:"",hash:"",state:null,key:"default"},m),navigationType:"POP"}},w):w}function ve(){let e=_e(),t=X(e)?"".concat(e.status," ").concat(e.statusText):e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,a="rgba(200,200,200, 0.5)",l={padding:"0.5rem",backgroundColor:a},o={padding:"2px 4px",backgroundColor:a},i=null;return console.error("Error handled by React Router default ErrorBoundary:",e),i=r.createElement(r.Fragment,null,r.createElement("p",null,"\ud83d\udcbf Hey developer \ud83d\udc4b"),r.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",r.createElement("code",{style:o},"ErrorBoundary")," or"," ",r.createElement("code",{style:o},"errorElement")," prop on your route.")),r.createElement(r.Fragment,null,r.createElement("h2",null,"Unexpected Application Error!"),r.createElement("h3",{style:{fontStyle:"italic"}},t),n?r.createElement("pre",{style:l},n):null,i)}var be=r.createElement(ve,null),ye=class extends r.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||"idle"!==t.revalidation&&"idle"===e.revalidation?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:void 0!==e.error?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){console.error("React Router caught the following error during render",e,t)}render(){return void 0!==this.state.error?r.createElement(se.Provider,{value:this.props.routeContext},r.createElement(ce.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function xe(e){let{routeContext:t,match:n,children:a}=e,l=r.useContext(te);return l&&l.static&&l.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(l.staticContext._deepestRenderedBoundaryId=n.route.id),r.createElement(se.Provider,{value:t},a)}function we(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null;if(null==e){if(!n)return null;if(n.errors)e=n.matches;else{if(0!==t.length||n.initialized||!(n.matches.length>0))return null;e=n.matches}}let a=e,l=null===n||void 0===n?void 0:n.errors;if(null!=l){let e=a.findIndex((e=>e.route.id&&void 0!==(null===l||void 0===l?void 0:l[e.route.id])));y(e>=0,"Could not find a matching route for errors on route IDs: ".concat(Object.keys(l).join(","))),a=a.slice(0,Math.min(a.length,e+1))}let o=!1,i=-1;if(n)for(let r=0;r<a.length;r++){let e=a[r];if((e.route.HydrateFallback||e.route.hydrateFallbackElement)&&(i=r),e.route.id){let{loaderData:t,errors:r}=n,l=e.route.loader&&!t.hasOwnProperty(e.route.id)&&(!r||void 0===r[e.route.id]);if(e.route.lazy||l){o=!0,a=i>=0?a.slice(0,i+1):[a[0]];break}}}return a.reduceRight(((e,s,c)=>{let u,d=!1,f=null,m=null;n&&(u=l&&s.route.id?l[s.route.id]:void 0,f=s.route.errorElement||be,o&&(i<0&&0===c?(Ee("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),d=!0,m=null):i===c&&(d=!0,m=s.route.hydrateFallbackElement||null)));let p=t.concat(a.slice(0,c+1)),h=()=>{let t;return t=u?f:d?m:s.route.Component?r.createElement(s.route.Component,null):s.route.element?s.route.element:e,r.createElement(xe,{match:s,routeContext:{outlet:e,matches:p,isDataRoute:null!=n},children:t})};return n&&(s.route.ErrorBoundary||s.route.errorElement||0===c)?r.createElement(ye,{location:n.location,revalidation:n.revalidation,component:f,error:u,children:h(),routeContext:{outlet:null,matches:p,isDataRoute:!0}}):h()}),null)}function ke(e){return"".concat(e," must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.")}function je(e){let t=r.useContext(te);return y(t,ke(e)),t}function Ne(e){let t=r.useContext(ne);return y(t,ke(e)),t}function Se(e){let t=function(e){let t=r.useContext(se);return y(t,ke(e)),t}(e),n=t.matches[t.matches.length-1];return y(n.route.id,"".concat(e,' can only be used on routes that contain a unique "id"')),n.route.id}function _e(){var e;let t=r.useContext(ce),n=Ne("useRouteError"),a=Se("useRouteError");return void 0!==t?t:null===(e=n.errors)||void 0===e?void 0:e[a]}var Ce={};function Ee(e,t,n){t||Ce[e]||(Ce[e]=!0,x(!1,n))}r.memo((function(e){let{routes:t,future:n,state:r}=e;return ge(t,void 0,r,n)}));function Pe(e){y(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function Le(e){let{basename:t="/",children:n=null,location:a,navigationType:l="POP",navigator:o,static:i=!1}=e;y(!ue(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let s=t.replace(/^\/*/,"/"),c=r.useMemo((()=>({basename:s,navigator:o,static:i,future:{}})),[s,o,i]);"string"===typeof a&&(a=N(a));let{pathname:u="/",search:d="",hash:f="",state:m=null,key:p="default"}=a,h=r.useMemo((()=>{let e=V(u,s);return null==e?null:{location:{pathname:e,search:d,hash:f,state:m,key:p},navigationType:l}}),[s,u,d,f,m,p,l]);return x(null!=h,'<Router basename="'.concat(s,'"> is not able to match the URL "').concat(u).concat(d).concat(f,"\" because it does not start with the basename, so the <Router> won't render anything.")),null==h?null:r.createElement(oe.Provider,{value:c},r.createElement(ie.Provider,{children:n,value:h}))}function ze(e){let{children:t,location:n}=e;return ge(Te(t),n)}r.Component;function Te(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=[];return r.Children.forEach(e,((e,a)=>{if(!r.isValidElement(e))return;let l=[...t,a];if(e.type===r.Fragment)return void n.push.apply(n,Te(e.props.children,l));y(e.type===Pe,"[".concat("string"===typeof e.type?e.type:e.type.name,"] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>")),y(!e.props.index||!e.props.children,"An index route cannot have child routes.");let o={id:e.props.id||l.join("-"),caseSensitive:e.props.caseSensitive,element:e.props.element,Component:e.props.Component,index:e.props.index,path:e.props.path,loader:e.props.loader,action:e.props.action,hydrateFallbackElement:e.props.hydrateFallbackElement,HydrateFallback:e.props.HydrateFallback,errorElement:e.props.errorElement,ErrorBoundary:e.props.ErrorBoundary,hasErrorBoundary:!0===e.props.hasErrorBoundary||null!=e.props.ErrorBoundary||null!=e.props.errorElement,shouldRevalidate:e.props.shouldRevalidate,handle:e.props.handle,lazy:e.props.lazy};e.props.children&&(o.children=Te(e.props.children,l)),n.push(o)})),n}var Me="get",Re="application/x-www-form-urlencoded";function Oe(e){return null!=e&&"string"===typeof e.tagName}var Ae=null;var Fe=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function De(e){return null==e||Fe.has(e)?e:(x(!1,'"'.concat(e,'" is not a valid `encType` for `<Form>`/`<fetcher.Form>` and will default to "').concat(Re,'"')),null)}function He(e,t){let n,r,a,l,o;if(Oe(i=e)&&"form"===i.tagName.toLowerCase()){let o=e.getAttribute("action");r=o?V(o,t):null,n=e.getAttribute("method")||Me,a=De(e.getAttribute("enctype"))||Re,l=new FormData(e)}else if(function(e){return Oe(e)&&"button"===e.tagName.toLowerCase()}(e)||function(e){return Oe(e)&&"input"===e.tagName.toLowerCase()}(e)&&("submit"===e.type||"image"===e.type)){let o=e.form;if(null==o)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let i=e.getAttribute("formaction")||o.getAttribute("action");if(r=i?V(i,t):null,n=e.getAttribute("formmethod")||o.getAttribute("method")||Me,a=De(e.getAttribute("formenctype"))||De(o.getAttribute("enctype"))||Re,l=new FormData(o,e),!function(){if(null===Ae)try{new FormData(document.createElement("form"),0),Ae=!1}catch(e){Ae=!0}return Ae}()){let{name:t,type:n,value:r}=e;if("image"===n){let e=t?"".concat(t,"."):"";l.append("".concat(e,"x"),"0"),l.append("".concat(e,"y"),"0")}else t&&l.append(t,r)}}else{if(Oe(e))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');n=Me,r=null,a=Re,o=e}var i;return l&&"text/plain"===a&&(o=l,l=void 0),{action:r,method:n.toLowerCase(),encType:a,formData:l,body:o}}function Ie(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}async function Ue(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(n){return console.error("Error loading route module `".concat(e.module,"`, reloading page...")),console.error(n),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise((()=>{}))}}function Be(e){return null!=e&&"string"===typeof e.page}function Ve(e){return null!=e&&(null==e.href?"preload"===e.rel&&"string"===typeof e.imageSrcSet&&"string"===typeof e.imageSizes:"string"===typeof e.rel&&"string"===typeof e.href)}function We(e,t,n,r,a,l){let o=(e,t)=>!n[t]||e.route.id!==n[t].route.id,i=(e,t)=>{var r;return n[t].pathname!==e.pathname||(null===(r=n[t].route.path)||void 0===r?void 0:r.endsWith("*"))&&n[t].params["*"]!==e.params["*"]};return"assets"===l?t.filter(((e,t)=>o(e,t)||i(e,t))):"data"===l?t.filter(((t,l)=>{let s=r.routes[t.route.id];if(!s||!s.hasLoader)return!1;if(o(t,l)||i(t,l))return!0;if(t.route.shouldRevalidate){var c;let r=t.route.shouldRevalidate({currentUrl:new URL(a.pathname+a.search+a.hash,window.origin),currentParams:(null===(c=n[0])||void 0===c?void 0:c.params)||{},nextUrl:new URL(e,window.origin),nextParams:t.params,defaultShouldRevalidate:!0});if("boolean"===typeof r)return r}return!0})):[]}function qe(e,t){let{includeHydrateFallback:n}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};return r=e.map((e=>{let r=t.routes[e.route.id];if(!r)return[];let a=[r.module];return r.clientActionModule&&(a=a.concat(r.clientActionModule)),r.clientLoaderModule&&(a=a.concat(r.clientLoaderModule)),n&&r.hydrateFallbackModule&&(a=a.concat(r.hydrateFallbackModule)),r.imports&&(a=a.concat(r.imports)),a})).flat(1),[...new Set(r)];var r}function $e(e,t){let n=new Set,r=new Set(t);return e.reduce(((e,a)=>{if(t&&!Be(a)&&"script"===a.as&&a.href&&r.has(a.href))return e;let l=JSON.stringify(function(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}(a));return n.has(l)||(n.add(l),e.push({key:l,link:a})),e}),[])}function Qe(e){return{__html:e}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");"undefined"!==typeof window?window:"undefined"!==typeof globalThis&&globalThis;Symbol("SingleFetchRedirect");var Ge=new Set([100,101,204,205]);function Ye(e,t){let n="string"===typeof e?new URL(e,"undefined"===typeof window?"server://singlefetch/":window.location.origin):e;return"/"===n.pathname?n.pathname="_root.data":t&&"/"===V(n.pathname,t)?n.pathname="".concat(t.replace(/\/$/,""),"/_root.data"):n.pathname="".concat(n.pathname.replace(/\/$/,""),".data"),n}r.Component;function Ke(e){let{error:t,isOutsideRemixApp:n}=e;console.error(t);let a,l=r.createElement("script",{dangerouslySetInnerHTML:{__html:'\n        console.log(\n          "\ud83d\udcbf Hey developer \ud83d\udc4b. You can provide a way better UX than this when your app throws errors. Check out https://reactrouter.com/how-to/error-boundary for more information."\n        );\n      '}});if(X(t))return r.createElement(Je,{title:"Unhandled Thrown Response!"},r.createElement("h1",{style:{fontSize:"24px"}},t.status," ",t.statusText),l);if(t instanceof Error)a=t;else{let e=null==t?"Unknown Error":"object"===typeof t&&"toString"in t?t.toString():JSON.stringify(t);a=new Error(e)}return r.createElement(Je,{title:"Application Error!",isOutsideRemixApp:n},r.createElement("h1",{style:{fontSize:"24px"}},"Application Error"),r.createElement("pre",{style:{padding:"2rem",background:"hsla(10, 50%, 50%, 0.1)",color:"red",overflow:"auto"}},a.stack),l)}function Je(e){var t;let{title:n,renderScripts:a,isOutsideRemixApp:l,children:o}=e,{routeModules:i}=nt();return null!==(t=i.root)&&void 0!==t&&t.Layout&&!l?o:r.createElement("html",{lang:"en"},r.createElement("head",null,r.createElement("meta",{charSet:"utf-8"}),r.createElement("meta",{name:"viewport",content:"width=device-width,initial-scale=1,viewport-fit=cover"}),r.createElement("title",null,n)),r.createElement("body",null,r.createElement("main",{style:{fontFamily:"system-ui, sans-serif",padding:"2rem"}},o,a?r.createElement(ct,null):null)))}function Xe(e,t){return"lazy"===e.mode&&!0===t}function Ze(){let e=r.useContext(te);return Ie(e,"You must render this element inside a <DataRouterContext.Provider> element"),e}function et(){let e=r.useContext(ne);return Ie(e,"You must render this element inside a <DataRouterStateContext.Provider> element"),e}var tt=r.createContext(void 0);function nt(){let e=r.useContext(tt);return Ie(e,"You must render this element inside a <HydratedRouter> element"),e}function rt(e,t){return n=>{e&&e(n),n.defaultPrevented||t(n)}}function at(e,t,n){if(n&&!st)return[e[0]];if(t){let n=e.findIndex((e=>void 0!==t[e.route.id]));return e.slice(0,n+1)}return e}function lt(e){let{page:t}=e,n=u(e,f),{router:a}=Ze(),l=r.useMemo((()=>C(a.routes,t,a.basename)),[a.routes,t,a.basename]);return l?r.createElement(it,c({page:t,matches:l},n)):null}function ot(e){let{manifest:t,routeModules:n}=nt(),[a,l]=r.useState([]);return r.useEffect((()=>{let r=!1;return async function(e,t,n){return $e((await Promise.all(e.map((async e=>{let r=t.routes[e.route.id];if(r){let e=await Ue(r,n);return e.links?e.links():[]}return[]})))).flat(1).filter(Ve).filter((e=>"stylesheet"===e.rel||"preload"===e.rel)).map((e=>"stylesheet"===e.rel?c(c({},e),{},{rel:"prefetch",as:"style"}):c(c({},e),{},{rel:"prefetch"}))))}(e,t,n).then((e=>{r||l(e)})),()=>{r=!0}}),[e,t,n]),a}function it(e){let{page:t,matches:n}=e,a=u(e,m),l=de(),{manifest:o,routeModules:i}=nt(),{basename:s}=Ze(),{loaderData:d,matches:f}=et(),p=r.useMemo((()=>We(t,n,f,o,l,"data")),[t,n,f,o,l]),h=r.useMemo((()=>We(t,n,f,o,l,"assets")),[t,n,f,o,l]),g=r.useMemo((()=>{if(t===l.pathname+l.search+l.hash)return[];let e=new Set,r=!1;if(n.forEach((t=>{var n;let a=o.routes[t.route.id];a&&a.hasLoader&&(!p.some((e=>e.route.id===t.route.id))&&t.route.id in d&&null!==(n=i[t.route.id])&&void 0!==n&&n.shouldRevalidate||a.hasClientLoader?r=!0:e.add(t.route.id))})),0===e.size)return[];let a=Ye(t,s);return r&&e.size>0&&a.searchParams.set("_routes",n.filter((t=>e.has(t.route.id))).map((e=>e.route.id)).join(",")),[a.pathname+a.search]}),[s,d,l,o,p,n,t,i]),v=r.useMemo((()=>qe(h,o)),[h,o]),b=ot(h);return r.createElement(r.Fragment,null,g.map((e=>r.createElement("link",c({key:e,rel:"prefetch",as:"fetch",href:e},a)))),v.map((e=>r.createElement("link",c({key:e,rel:"modulepreload",href:e},a)))),b.map((e=>{let{key:t,link:n}=e;return r.createElement("link",c({key:t},n))})))}tt.displayName="FrameworkContext";var st=!1;function ct(e){let{manifest:t,serverHandoffString:n,isSpaMode:a,renderMeta:l,routeDiscovery:o,ssr:i}=nt(),{router:s,static:f,staticContext:m}=Ze(),{matches:p}=et(),h=Xe(o,i);l&&(l.didRenderScripts=!0);let g=at(p,null,a);r.useEffect((()=>{st=!0}),[]);let v=r.useMemo((()=>{var a;let l=m?"window.__reactRouterContext = ".concat(n,";").concat("window.__reactRouterContext.stream = new ReadableStream({start(controller){window.__reactRouterContext.streamController = controller;}}).pipeThrough(new TextEncoderStream());"):" ",o=f?"".concat(null!==(a=t.hmr)&&void 0!==a&&a.runtime?"import ".concat(JSON.stringify(t.hmr.runtime),";"):"").concat(h?"":"import ".concat(JSON.stringify(t.url)),";\n").concat(g.map(((e,n)=>{let r="route".concat(n),a=t.routes[e.route.id];Ie(a,"Route ".concat(e.route.id," not found in manifest"));let{clientActionModule:l,clientLoaderModule:o,clientMiddlewareModule:i,hydrateFallbackModule:s,module:c}=a,u=[...l?[{module:l,varName:"".concat(r,"_clientAction")}]:[],...o?[{module:o,varName:"".concat(r,"_clientLoader")}]:[],...i?[{module:i,varName:"".concat(r,"_clientMiddleware")}]:[],...s?[{module:s,varName:"".concat(r,"_HydrateFallback")}]:[],{module:c,varName:"".concat(r,"_main")}];return 1===u.length?"import * as ".concat(r," from ").concat(JSON.stringify(c),";"):[u.map((e=>"import * as ".concat(e.varName,' from "').concat(e.module,'";'))).join("\n"),"const ".concat(r," = {").concat(u.map((e=>"...".concat(e.varName))).join(","),"};")].join("\n")})).join("\n"),"\n  ").concat(h?"window.__reactRouterManifest = ".concat(JSON.stringify(function(e,t){let{sri:n}=e,r=u(e,d),a=new Set(t.state.matches.map((e=>e.route.id))),l=t.state.location.pathname.split("/").filter(Boolean),o=["/"];for(l.pop();l.length>0;)o.push("/".concat(l.join("/"))),l.pop();o.forEach((e=>{let n=C(t.routes,e,t.basename);n&&n.forEach((e=>a.add(e.route.id)))}));let i=[...a].reduce(((e,t)=>Object.assign(e,{[t]:r.routes[t]})),{});return c(c({},r),{},{routes:i,sri:!!n||void 0})}(t,s),null,2),";"):"","\n  window.__reactRouterRouteModules = {").concat(g.map(((e,t)=>"".concat(JSON.stringify(e.route.id),":route").concat(t))).join(","),"};\n\nimport(").concat(JSON.stringify(t.entry.module),");"):" ";return r.createElement(r.Fragment,null,r.createElement("script",c(c({},e),{},{suppressHydrationWarning:!0,dangerouslySetInnerHTML:Qe(l),type:void 0})),r.createElement("script",c(c({},e),{},{suppressHydrationWarning:!0,dangerouslySetInnerHTML:Qe(o),type:"module",async:!0})))}),[]),b=st?[]:(y=t.entry.imports.concat(qe(g,t,{includeHydrateFallback:!0})),[...new Set(y)]);var y;let x="object"===typeof t.sri?t.sri:{};return st?null:r.createElement(r.Fragment,null,"object"===typeof t.sri?r.createElement("script",{"rr-importmap":"",type:"importmap",suppressHydrationWarning:!0,dangerouslySetInnerHTML:{__html:JSON.stringify({integrity:x})}}):null,h?null:r.createElement("link",{rel:"modulepreload",href:t.url,crossOrigin:e.crossOrigin,integrity:x[t.url],suppressHydrationWarning:!0}),r.createElement("link",{rel:"modulepreload",href:t.entry.module,crossOrigin:e.crossOrigin,integrity:x[t.entry.module],suppressHydrationWarning:!0}),b.map((t=>r.createElement("link",{key:t,rel:"modulepreload",href:t,crossOrigin:e.crossOrigin,integrity:x[t],suppressHydrationWarning:!0}))),v)}function ut(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return e=>{t.forEach((t=>{"function"===typeof t?t(e):null!=t&&(t.current=e)}))}}var dt="undefined"!==typeof window&&"undefined"!==typeof window.document&&"undefined"!==typeof window.document.createElement;try{dt&&(window.__reactRouterVersion="7.6.2")}catch(At){}function ft(e){let{basename:t,children:n,window:a}=e,l=r.useRef();null==l.current&&(l.current=b({window:a,v5Compat:!0}));let o=l.current,[i,s]=r.useState({action:o.action,location:o.location}),c=r.useCallback((e=>{r.startTransition((()=>s(e)))}),[s]);return r.useLayoutEffect((()=>o.listen(c)),[o,c]),r.createElement(Le,{basename:t,children:n,location:i.location,navigationType:i.action,navigator:o})}var mt=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,pt=r.forwardRef((function(e,t){let n,{onClick:a,discover:l="render",prefetch:o="none",relative:i,reloadDocument:s,replace:d,state:f,target:m,to:h,preventScrollReset:g,viewTransition:v}=e,b=u(e,p),{basename:w}=r.useContext(oe),k="string"===typeof h&&mt.test(h),N=!1;if("string"===typeof h&&k&&(n=h,dt))try{let e=new URL(window.location.href),t=h.startsWith("//")?new URL(e.protocol+h):new URL(h),n=V(t.pathname,w);t.origin===e.origin&&null!=n?h=n+t.search+t.hash:N=!0}catch(At){x(!1,'<Link to="'.concat(h,'"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.'))}let S=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};y(ue(),"useHref() may be used only in the context of a <Router> component.");let{basename:n,navigator:a}=r.useContext(oe),{hash:l,pathname:o,search:i}=he(e,{relative:t}),s=o;return"/"!==n&&(s="/"===o?n:G([n,o])),a.createHref({pathname:s,search:i,hash:l})}(h,{relative:i}),[_,C,E]=function(e,t){let n=r.useContext(tt),[a,l]=r.useState(!1),[o,i]=r.useState(!1),{onFocus:s,onBlur:c,onMouseEnter:u,onMouseLeave:d,onTouchStart:f}=t,m=r.useRef(null);r.useEffect((()=>{if("render"===e&&i(!0),"viewport"===e){let e=new IntersectionObserver((e=>{e.forEach((e=>{i(e.isIntersecting)}))}),{threshold:.5});return m.current&&e.observe(m.current),()=>{e.disconnect()}}}),[e]),r.useEffect((()=>{if(a){let e=setTimeout((()=>{i(!0)}),100);return()=>{clearTimeout(e)}}}),[a]);let p=()=>{l(!0)},h=()=>{l(!1),i(!1)};return n?"intent"!==e?[o,m,{}]:[o,m,{onFocus:rt(s,p),onBlur:rt(c,h),onMouseEnter:rt(u,p),onMouseLeave:rt(d,h),onTouchStart:rt(f,p)}]:[!1,m,{}]}(o,b),P=function(e){let{target:t,replace:n,state:a,preventScrollReset:l,relative:o,viewTransition:i}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},s=pe(),c=de(),u=he(e,{relative:o});return r.useCallback((r=>{if(function(e,t){return 0===e.button&&(!t||"_self"===t)&&!function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e)}(r,t)){r.preventDefault();let t=void 0!==n?n:j(c)===j(u);s(e,{replace:t,state:a,preventScrollReset:l,relative:o,viewTransition:i})}}),[c,s,u,n,a,t,e,l,o,i])}(h,{replace:d,state:f,target:m,preventScrollReset:g,relative:i,viewTransition:v});let L=r.createElement("a",c(c(c({},b),E),{},{href:n||S,onClick:N||s?a:function(e){a&&a(e),e.defaultPrevented||P(e)},ref:ut(t,C),target:m,"data-discover":k||"render"!==l?void 0:"true"}));return _&&!k?r.createElement(r.Fragment,null,L,r.createElement(lt,{page:S})):L}));pt.displayName="Link",r.forwardRef((function(e,t){let{"aria-current":n="page",caseSensitive:a=!1,className:l="",end:o=!1,style:i,to:s,viewTransition:d,children:f}=e,m=u(e,h),p=he(s,{relative:m.relative}),g=de(),v=r.useContext(ne),{navigator:b,basename:x}=r.useContext(oe),w=null!=v&&function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=r.useContext(re);y(null!=n,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:a}=vt("useViewTransitionState"),l=he(e,{relative:t.relative});if(!n.isTransitioning)return!1;let o=V(n.currentLocation.pathname,a)||n.currentLocation.pathname,i=V(n.nextLocation.pathname,a)||n.nextLocation.pathname;return null!=I(l.pathname,i)||null!=I(l.pathname,o)}(p)&&!0===d,k=b.encodeLocation?b.encodeLocation(p).pathname:p.pathname,j=g.pathname,N=v&&v.navigation&&v.navigation.location?v.navigation.location.pathname:null;a||(j=j.toLowerCase(),N=N?N.toLowerCase():null,k=k.toLowerCase()),N&&x&&(N=V(N,x)||N);const S="/"!==k&&k.endsWith("/")?k.length-1:k.length;let _,C=j===k||!o&&j.startsWith(k)&&"/"===j.charAt(S),E=null!=N&&(N===k||!o&&N.startsWith(k)&&"/"===N.charAt(k.length)),P={isActive:C,isPending:E,isTransitioning:w},L=C?n:void 0;_="function"===typeof l?l(P):[l,C?"active":null,E?"pending":null,w?"transitioning":null].filter(Boolean).join(" ");let z="function"===typeof i?i(P):i;return r.createElement(pt,c(c({},m),{},{"aria-current":L,className:_,ref:t,style:z,to:s,viewTransition:d}),"function"===typeof f?f(P):f)})).displayName="NavLink";var ht=r.forwardRef(((e,t)=>{let{discover:n="render",fetcherKey:a,navigate:l,reloadDocument:o,replace:i,state:s,method:d=Me,action:f,onSubmit:m,relative:p,preventScrollReset:h,viewTransition:v}=e,b=u(e,g),x=xt(),w=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{basename:n}=r.useContext(oe),a=r.useContext(se);y(a,"useFormAction must be used inside a RouteContext");let[l]=a.matches.slice(-1),o=c({},he(e||".",{relative:t})),i=de();if(null==e){o.search=i.search;let e=new URLSearchParams(o.search),t=e.getAll("index");if(t.some((e=>""===e))){e.delete("index"),t.filter((e=>e)).forEach((t=>e.append("index",t)));let n=e.toString();o.search=n?"?".concat(n):""}}e&&"."!==e||!l.route.index||(o.search=o.search?o.search.replace(/^\?/,"?index&"):"?index");"/"!==n&&(o.pathname="/"===o.pathname?n:G([n,o.pathname]));return j(o)}(f,{relative:p}),k="get"===d.toLowerCase()?"get":"post",N="string"===typeof f&&mt.test(f);return r.createElement("form",c(c({ref:t,method:k,action:w,onSubmit:o?m:e=>{if(m&&m(e),e.defaultPrevented)return;e.preventDefault();let t=e.nativeEvent.submitter,n=(null===t||void 0===t?void 0:t.getAttribute("formmethod"))||d;x(t||e.currentTarget,{fetcherKey:a,method:n,navigate:l,replace:i,state:s,relative:p,preventScrollReset:h,viewTransition:v})}},b),{},{"data-discover":N||"render"!==n?void 0:"true"}))}));function gt(e){return"".concat(e," must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.")}function vt(e){let t=r.useContext(te);return y(t,gt(e)),t}ht.displayName="Form";var bt=0,yt=()=>"__".concat(String(++bt),"__");function xt(){let{router:e}=vt("useSubmit"),{basename:t}=r.useContext(oe),n=Se("useRouteId");return r.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{action:l,method:o,encType:i,formData:s,body:c}=He(r,t);if(!1===a.navigate){let t=a.fetcherKey||yt();await e.fetch(t,n,a.action||l,{preventScrollReset:a.preventScrollReset,formData:s,body:c,formMethod:a.method||o,formEncType:a.encType||i,flushSync:a.flushSync})}else await e.navigate(a.action||l,{preventScrollReset:a.preventScrollReset,formData:s,body:c,formMethod:a.method||o,formEncType:a.encType||i,replace:a.replace,state:a.state,fromRouteId:n,flushSync:a.flushSync,viewTransition:a.viewTransition})}),[e,t,n])}var wt=n(579);const kt=e=>{let{appName:t="ModelForge"}=e;const n=de(),r="/finetune/load_settings"===n.pathname||"/finetune/loading"===n.pathname,a="/"===n.pathname||"/home"===n.pathname,l=!a&&!r,o="/technical-details"===n.pathname,i=(()=>{switch(n.pathname){case"/":case"/home":default:return null;case"/finetune/detect":return"Hardware Detection";case"/finetune/load_settings":return"Finetuning Settings";case"/finetune/loading":return"Training Progress";case"/technical-details":return"Technical Documentation";case"/app":return"Application";case"/models":return"My models"}})(),s=i&&!o;return(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsx)("nav",{className:"".concat("/"===n.pathname||"/home"===n.pathname?"bg-black":"bg-[#141b2d]"," py-4 px-4"),children:(0,wt.jsxs)("div",{className:"container mx-auto flex justify-between items-center",children:[(0,wt.jsx)("div",{className:"flex items-center",children:r?(0,wt.jsxs)("div",{className:"flex items-center",children:[(0,wt.jsx)("div",{className:"w-8 h-8 mr-2",children:(0,wt.jsxs)("svg",{width:"62",height:"62",viewBox:"0 0 62 62",fill:"none",xmlns:"http://www.w3.org/2000/svg",className:"w-full h-full",children:[(0,wt.jsx)("rect",{width:"62",height:"62",rx:"10",fill:"#E34D26"}),(0,wt.jsx)("path",{d:"M31 19.5V24.5M31 19.5H26M31 19.5H36M31 42.5V37.5M31 42.5H36M31 42.5H26M19.5 31H24.5M19.5 31V26M19.5 31V36M42.5 31H37.5M42.5 31V36M42.5 31V26M26 19.5V24.5H24.5V26H19.5M36 19.5V24.5H37.5V26H42.5M26 42.5V37.5H24.5V36H19.5M36 42.5V37.5H37.5V36H42.5",stroke:"white",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"})]})}),(0,wt.jsx)("span",{className:"text-white text-xl font-bold",children:t})]}):(0,wt.jsxs)(pt,{to:"/",className:"flex items-center",children:[(0,wt.jsx)("div",{className:"w-8 h-8 mr-2",children:(0,wt.jsxs)("svg",{width:"62",height:"62",viewBox:"0 0 62 62",fill:"none",xmlns:"http://www.w3.org/2000/svg",className:"w-full h-full",children:[(0,wt.jsx)("rect",{width:"62",height:"62",rx:"10",fill:"#E34D26"}),(0,wt.jsx)("path",{d:"M31 19.5V24.5M31 19.5H26M31 19.5H36M31 42.5V37.5M31 42.5H36M31 42.5H26M19.5 31H24.5M19.5 31V26M19.5 31V36M42.5 31H37.5M42.5 31V36M42.5 31V26M26 19.5V24.5H24.5V26H19.5M36 19.5V24.5H37.5V26H42.5M26 42.5V37.5H24.5V36H19.5M36 42.5V37.5H37.5V36H42.5",stroke:"white",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"})]})}),(0,wt.jsx)("span",{className:"text-white text-xl font-bold",children:t})]})}),(0,wt.jsxs)("div",{className:"flex items-center",children:[!r&&(0,wt.jsx)(pt,{to:"/models",className:"text-white px-4 py-2 rounded-lg transition ".concat("/models"===n.pathname?"bg-[#232c40] font-semibold":"hover:bg-[#232c40]"),style:{marginRight:"0.5rem"},children:"My Models"}),l&&(0,wt.jsxs)(pt,{to:"/",className:"bg-[#232c40] hover:bg-[#2d3a52] text-white px-4 py-2 rounded-lg flex items-center gap-2 transition",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-4 w-4",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M15 19l-7-7 7-7"})}),"Back to Home"]}),a&&(0,wt.jsx)(pt,{to:"/finetune/detect",className:"text-orange-500 hover:text-orange-400 px-4 py-2 transition",children:"Get Started"})]})]})}),"/"===n.pathname||"/home"===n.pathname||"/finetune/load_settings"===n.pathname||"/finetune/detect"===n.pathname?null:"/technical-details"===n.pathname?(0,wt.jsx)("div",{className:"bg-[#141b2d] pt-6 pb-12",children:(0,wt.jsx)("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:(0,wt.jsxs)("div",{className:"text-center",children:[(0,wt.jsx)("h1",{className:"text-4xl md:text-5xl font-bold mb-4 text-white",children:"Technical Documentation"}),(0,wt.jsx)("p",{className:"text-xl text-gray-300 max-w-3xl mx-auto",children:"Comprehensive technical details for developers and ML engineers"})]})})}):(0,wt.jsx)("header",{className:"py-6 md:py-12 bg-[#141b2d]",children:(0,wt.jsx)("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:s&&(0,wt.jsx)("div",{className:"mt-8 text-center",children:(0,wt.jsx)("h1",{className:"text-3xl md:text-4xl font-bold mb-4 text-white",children:i})})})}),(0,wt.jsx)("style",{jsx:"true",children:"\n        .bg-technical-tabs {\n          background-color: #182035;\n        }\n      "})]})},jt=e=>{let{appName:t="ModelForge"}=e;const n=[{title:"No-Code Interface",description:"Train AI models with simple clicks - no programming required",icon:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"w-10 h-10",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M10 20l4-16m4 4l4 4-4 4M6 16l-4-4 4-4"})})},{title:"Smart Hardware Detection",description:"Automatically configures for your computer's capabilities",icon:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"w-10 h-10",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2z"})})},{title:"Efficient Training",description:"Get results in minutes, not days",icon:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"w-10 h-10",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13 10V3L4 14h7v7l9-11h-7z"})})},{title:"Business Ready",description:"Custom AI models tailored to your industry needs",icon:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"w-10 h-10",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M21 13.255A23.931 23.931 0 0112 15c-3.183 0-6.22-.62-9-1.745M16 6V4a2 2 0 00-2-2h-4a2 2 0 00-2 2v2m4 6h.01M5 20h14a2 2 0 002-2V8a2 2 0 00-2-2H5a2 2 0 00-2 2v10a2 2 0 002 2z"})})}];return(0,wt.jsxs)("div",{className:"bg-black text-gray-100 min-h-screen",children:[(0,wt.jsxs)("div",{className:"hero-section py-16 lg:py-24 relative overflow-hidden",children:[(0,wt.jsx)("div",{className:"absolute inset-0 z-0",children:(0,wt.jsxs)("div",{className:"neural-network",children:[(0,wt.jsx)("div",{className:"node node-1"}),(0,wt.jsx)("div",{className:"node node-2"}),(0,wt.jsx)("div",{className:"node node-3"}),(0,wt.jsx)("div",{className:"node node-4"}),(0,wt.jsx)("div",{className:"node node-5"}),(0,wt.jsx)("div",{className:"node node-6"}),(0,wt.jsx)("div",{className:"connection connection-1"}),(0,wt.jsx)("div",{className:"connection connection-2"}),(0,wt.jsx)("div",{className:"connection connection-3"}),(0,wt.jsx)("div",{className:"connection connection-4"}),(0,wt.jsx)("div",{className:"connection connection-5"})]})}),(0,wt.jsxs)("div",{className:"max-w-6xl mx-auto px-4 relative z-10",children:[(0,wt.jsxs)("div",{className:"animate-fade-in text-center",children:[(0,wt.jsx)("div",{className:"mb-6 inline-block relative",children:(0,wt.jsx)("span",{className:"bg-orange-500 text-white text-sm md:text-base px-3 py-1 rounded-full transform -rotate-2 inline-block",children:"No Coding Required!"})}),(0,wt.jsxs)("h1",{className:"text-4xl md:text-6xl lg:text-7xl font-bold mb-6 relative",children:[(0,wt.jsx)("span",{className:"block",children:"AI So Easy"}),(0,wt.jsx)("span",{className:"text-transparent bg-clip-text bg-gradient-to-r from-orange-400 to-orange-600",children:"Your Grandma Can Use It"}),(0,wt.jsx)("div",{className:"absolute -top-8 -right-8 md:right-64 transform rotate-12 opacity-70",children:(0,wt.jsx)("svg",{className:"w-16 h-16 text-orange-500",fill:"currentColor",viewBox:"0 0 20 20",children:(0,wt.jsx)("path",{d:"M5 2a1 1 0 011 1v1h1a1 1 0 010 2H6v1a1 1 0 01-2 0V6H3a1 1 0 010-2h1V3a1 1 0 011-1zm0 10a1 1 0 011 1v1h1a1 1 0 110 2H6v1a1 1 0 11-2 0v-1H3a1 1 0 110-2h1v-1a1 1 0 011-1zM12 2a1 1 0 01.967.744L14.146 7.2 17.5 9.134a1 1 0 010 1.732l-3.354 1.935-1.18 4.455a1 1 0 01-1.933 0L9.854 12.8 6.5 10.866a1 1 0 010-1.732l3.354-1.935 1.18-4.455A1 1 0 0112 2z"})})})]}),(0,wt.jsx)("p",{className:"text-xl md:text-2xl text-gray-300 mb-8 max-w-3xl mx-auto",children:"Transform and customize AI models in minutes with zero technical knowledge. Point, click, and watch your custom AI come to life!"}),(0,wt.jsxs)("div",{className:"flex flex-wrap justify-center gap-4",children:[(0,wt.jsxs)(pt,{to:"/finetune/detect",className:"group bg-gradient-to-r from-orange-500 to-orange-600 hover:from-orange-600 hover:to-orange-700 px-8 py-4 rounded-lg text-lg font-medium transition shadow-lg hover:shadow-orange-500/30 transform hover:-translate-y-1",children:["Start Building Your AI",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 inline-block ml-2 transition-transform group-hover:translate-x-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M13 7l5 5m0 0l-5 5m5-5H6"})})]}),(0,wt.jsx)(pt,{to:"/technical-details",className:"border border-orange-500 text-orange-400 hover:bg-orange-500 hover:text-white px-8 py-4 rounded-lg text-lg font-medium transition transform hover:-translate-y-1",children:"Learn More"})]})]}),(0,wt.jsx)("div",{className:"mt-16 grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6",children:n.map(((e,t)=>(0,wt.jsxs)("div",{className:"feature-card bg-gray-900/70 backdrop-blur-sm border border-gray-800 p-6 rounded-xl transform transition-all duration-300 hover:scale-105 hover:border-orange-500 hover:shadow-lg hover:shadow-orange-500/20",style:{animationDelay:"".concat(.1*t,"s")},children:[(0,wt.jsx)("div",{className:"icon-container mb-4 p-3 bg-orange-500/10 rounded-lg inline-block",children:(0,wt.jsx)("div",{className:"text-orange-500",children:e.icon})}),(0,wt.jsx)("h3",{className:"text-xl font-bold mb-2",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-400",children:e.description})]},e.title)))})]})]}),(0,wt.jsx)("div",{id:"how-it-works",className:"how-it-works py-16 lg:py-24 bg-gradient-to-b from-black to-gray-900",children:(0,wt.jsxs)("div",{className:"max-w-6xl mx-auto px-4",children:[(0,wt.jsxs)("div",{className:"text-center mb-16",children:[(0,wt.jsx)("h2",{className:"text-3xl md:text-4xl font-bold mb-4",children:"From Zero to AI Hero in 3 Simple Steps"}),(0,wt.jsx)("p",{className:"text-xl text-gray-300 max-w-2xl mx-auto",children:"No PhD required. Just point, click, and watch the magic happen."})]}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-8",children:[(0,wt.jsxs)("div",{className:"step-card relative",children:[(0,wt.jsx)("div",{className:"absolute -left-4 -top-4 w-14 h-14 bg-orange-500 rounded-full flex items-center justify-center text-2xl font-bold",children:"1"}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-8 pt-12 h-full transform transition-all duration-300 hover:scale-105 hover:shadow-xl hover:shadow-orange-500/10",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold mb-4",children:"Hardware Detection"}),(0,wt.jsx)("p",{className:"text-gray-300 mb-4",children:"Our system automatically scans your computer and configures the perfect settings based on your hardware."}),(0,wt.jsx)("div",{className:"mt-4 flex justify-center",children:(0,wt.jsx)("div",{className:"w-16 h-16 rounded-full bg-orange-500/20 flex items-center justify-center",children:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-8 w-8 text-orange-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2z"})})})})]})]}),(0,wt.jsxs)("div",{className:"step-card relative",children:[(0,wt.jsx)("div",{className:"absolute -left-4 -top-4 w-14 h-14 bg-orange-500 rounded-full flex items-center justify-center text-2xl font-bold",children:"2"}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-8 pt-12 h-full transform transition-all duration-300 hover:scale-105 hover:shadow-xl hover:shadow-orange-500/10",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold mb-4",children:"Pick Your Settings"}),(0,wt.jsx)("p",{className:"text-gray-300 mb-4",children:"Use our simple sliders and dropdowns to customize your AI. No code or complex terms to worry about."}),(0,wt.jsx)("div",{className:"mt-4 flex justify-center",children:(0,wt.jsx)("div",{className:"w-16 h-16 rounded-full bg-orange-500/20 flex items-center justify-center",children:(0,wt.jsxs)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-8 w-8 text-orange-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:[(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M10.325 4.317c.426-1.756 2.924-1.756 3.35 0a1.724 1.724 0 002.573 1.066c1.543-.94 3.31.826 2.37 2.37a1.724 1.724 0 001.065 2.572c1.756.426 1.756 2.924 0 3.35a1.724 1.724 0 00-1.066 2.573c.94 1.543-.826 3.31-2.37 2.37a1.724 1.724 0 00-2.572 1.065c-.426 1.756-2.924 1.756-3.35 0a1.724 1.724 0 00-2.573-1.066c-1.543.94-3.31-.826-2.37-2.37a1.724 1.724 0 00-1.065-2.572c-1.756-.426-1.756-2.924 0-3.35a1.724 1.724 0 001.066-2.573c-.94-1.543.826-3.31 2.37-2.37.996.608 2.296.07 2.572-1.065z"}),(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M15 12a3 3 0 11-6 0 3 3 0 016 0z"})]})})})]})]}),(0,wt.jsxs)("div",{className:"step-card relative",children:[(0,wt.jsx)("div",{className:"absolute -left-4 -top-4 w-14 h-14 bg-orange-500 rounded-full flex items-center justify-center text-2xl font-bold",children:"3"}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-8 pt-12 h-full transform transition-all duration-300 hover:scale-105 hover:shadow-xl hover:shadow-orange-500/10",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold mb-4",children:"Launch Your AI"}),(0,wt.jsx)("p",{className:"text-gray-300 mb-4",children:"Click one button and watch as your custom AI model trains and deploys automatically."}),(0,wt.jsx)("div",{className:"mt-4 flex justify-center",children:(0,wt.jsx)("div",{className:"w-16 h-16 rounded-full bg-orange-500/20 flex items-center justify-center",children:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-8 w-8 text-orange-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13 10V3L4 14h7v7l9-11h-7z"})})})})]})]})]})]})}),(0,wt.jsx)("div",{className:"business-section py-16 lg:py-24 bg-gradient-to-b from-gray-900 to-black",children:(0,wt.jsx)("div",{className:"max-w-6xl mx-auto px-4",children:(0,wt.jsxs)("div",{className:"grid grid-cols-1 lg:grid-cols-2 gap-12 items-center",children:[(0,wt.jsxs)("div",{className:"order-2 lg:order-1",children:[(0,wt.jsx)("h2",{className:"text-3xl md:text-4xl font-bold mb-6",children:"Perfect for Business"}),(0,wt.jsx)("p",{className:"text-xl text-gray-300 mb-8",children:"Skip the expensive AI consultants. Train models on your business data in-house with zero technical expertise needed."}),(0,wt.jsx)("ul",{className:"space-y-4",children:["Automate customer support with custom chatbots","Extract insights from your business documents","Create AI assistants trained on your company knowledge","Generate content aligned with your brand voice"].map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 mr-2 text-orange-500 flex-shrink-0",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M5 13l4 4L19 7"})}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))}),(0,wt.jsx)("div",{className:"mt-8",children:(0,wt.jsxs)(pt,{to:"/finetune/detect",className:"group bg-gradient-to-r from-orange-500 to-orange-600 hover:from-orange-600 hover:to-orange-700 px-8 py-4 rounded-lg text-lg font-medium transition shadow-lg hover:shadow-orange-500/30",children:["Start Your Business AI",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 inline-block ml-2 transition-transform group-hover:translate-x-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M13 7l5 5m0 0l-5 5m5-5H6"})})]})})]}),(0,wt.jsx)("div",{className:"order-1 lg:order-2 flex justify-center",children:(0,wt.jsxs)("div",{className:"business-illustration relative w-full max-w-md",children:[(0,wt.jsx)("div",{className:"relative bg-gray-800 rounded-xl overflow-hidden shadow-2xl transform rotate-2 hover:rotate-0 transition-all duration-500",children:(0,wt.jsxs)("div",{className:"aspect-w-16 aspect-h-9 p-6",children:[(0,wt.jsx)("div",{className:"bg-gray-700 w-full h-32 rounded-lg mb-4 animate-pulse"}),(0,wt.jsx)("div",{className:"bg-gray-700 w-3/4 h-8 rounded-lg mb-3 animate-pulse"}),(0,wt.jsx)("div",{className:"bg-gray-700 w-1/2 h-8 rounded-lg mb-6 animate-pulse"}),(0,wt.jsxs)("div",{className:"flex space-x-4",children:[(0,wt.jsx)("div",{className:"bg-orange-500 w-1/3 h-10 rounded-lg animate-pulse"}),(0,wt.jsx)("div",{className:"bg-gray-700 w-1/3 h-10 rounded-lg animate-pulse"})]})]})}),(0,wt.jsx)("div",{className:"absolute -bottom-6 -right-6 bg-orange-500 rounded-full w-16 h-16 flex items-center justify-center text-white text-xl font-bold transform rotate-12",children:"New!"})]})})]})})}),(0,wt.jsxs)("div",{className:"cta-section py-16 lg:py-24 bg-black text-center relative overflow-hidden",children:[(0,wt.jsxs)("div",{className:"absolute inset-0 z-0 opacity-20",children:[(0,wt.jsx)("div",{className:"absolute top-0 left-1/4 w-64 h-64 bg-orange-500 rounded-full filter blur-3xl"}),(0,wt.jsx)("div",{className:"absolute bottom-0 right-1/4 w-64 h-64 bg-orange-600 rounded-full filter blur-3xl"})]}),(0,wt.jsxs)("div",{className:"max-w-4xl mx-auto px-4 relative z-10",children:[(0,wt.jsx)("h2",{className:"text-3xl md:text-5xl font-bold mb-6",children:"Ready to Build Your Custom AI?"}),(0,wt.jsx)("p",{className:"text-xl text-gray-300 mb-8 max-w-2xl mx-auto",children:"If your grandma can use a smartphone, she can build an AI with ModelForge. No coding. No technical skills. Just pure AI power at your fingertips."}),(0,wt.jsxs)(pt,{to:"/finetune/detect",className:"group bg-gradient-to-r from-orange-500 to-orange-600 hover:from-orange-600 hover:to-orange-700 px-10 py-5 rounded-lg text-xl font-bold transition shadow-xl hover:shadow-orange-500/30 transform hover:-translate-y-1",children:["Start Building Now",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 inline-block ml-2 transition-transform group-hover:translate-x-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M13 7l5 5m0 0l-5 5m5-5H6"})})]}),(0,wt.jsx)("p",{className:"mt-6 text-gray-400",children:"No credit card required. Ready in minutes."}),(0,wt.jsx)("div",{className:"mt-12",children:(0,wt.jsxs)(pt,{to:"/technical-details",className:"text-orange-500 hover:text-orange-400 flex items-center justify-center group",children:[(0,wt.jsx)("span",{children:"View technical specifications"}),(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 ml-2 group-hover:translate-x-1 transition-transform",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M14 5l7 7m0 0l-7 7m7-7H3"})})]})})]})]})]})},Nt={baseURL:"/api",headers:{"Content-Type":"application/json"}},St=e=>{var t;let{currentSettings:n,updateSettings:a}=e;const l=pe(),[o,i]=(0,r.useState)(!1),[s,u]=(0,r.useState)(n.task||""),[d,f]=(0,r.useState)(n.model_name||""),[m,p]=(0,r.useState)(null),[h,g]=(0,r.useState)(!1),[v,b]=(0,r.useState)(!1),[y,x]=(0,r.useState)(""),[w,k]=(0,r.useState)(null),[j,N]=(0,r.useState)(null),[S,_]=(0,r.useState)(!1);(0,r.useEffect)((()=>{i(!1)}),[s]),(0,r.useEffect)((()=>{console.log("Current settings from props:",n),u(n.task||""),f(n.model_name||"")}),[n]),(0,r.useEffect)((()=>{v||(x(""),k(null),N(null),_(!1))}),[v]);return(0,wt.jsxs)("div",{className:"max-w-4xl mx-auto p-4",children:[(0,wt.jsxs)("div",{className:"text-center mb-10",children:[(0,wt.jsx)("h1",{className:"text-3xl md:text-4xl font-bold mb-4",children:"Hardware Detection"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 mb-6",children:"Let's check your system to find the optimal configuration for LLM finetuning"})]}),h&&(0,wt.jsxs)("div",{className:"bg-green-700 text-white p-4 rounded-lg mb-6 flex items-center justify-between",children:[(0,wt.jsx)("div",{children:"Settings updated successfully! Redirecting to configuration page..."}),(0,wt.jsx)("div",{className:"animate-spin h-5 w-5 border-2 border-white rounded-full border-t-transparent"})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-6 md:p-8 shadow-lg mb-12",children:[(0,wt.jsxs)("h2",{className:"text-2xl font-semibold mb-6 flex items-center",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 mr-2 text-orange-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2zM9 9h6v6H9V9z"})}),"System Hardware Configuration"]}),(0,wt.jsxs)("form",{onSubmit:async e=>{e.preventDefault();try{console.log("Selected Task:",s);const e=await fetch("".concat(Nt.baseURL,"/finetune/detect"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({task:s})}),t=await e.json();if(!e.ok)throw new Error("Failed to fetch hardware data");p(t),i(!0);const n={task:s,hardware_config:{gpu:t.gpu_name,ram:t.ram_total_gb,disk:t.available_diskspace_gb,cpu_cores:t.cpu_cores}};console.log("Updating both task and hardware config:",n),a((e=>{console.log("Previous Settings in handleSubmit:",e);const t=c(c({},e),n);return console.log("New Settings in handleSubmit:",t),t}))}catch(t){console.error("Error:",t.message)}},className:"mb-8",children:[(0,wt.jsx)("h3",{className:"text-xl font-medium mb-4",children:"Select Task"}),(0,wt.jsx)("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4",children:[{id:"text-generation",title:"Text Generation",description:"Create models for generating coherent and relevant answers to queries based on old knowledge, like Customer Support Bots"},{id:"summarization",title:"Summarization",description:"Train models that can condense long documents into concise summaries."},{id:"extractive-question-answering",title:"Extractive Question Answering",description:"Build models that extract relevant answers from large texts based on user queries, like for RAG."}].map((e=>(0,wt.jsxs)("div",{onClick:()=>u(e.id),className:"\n        task-card p-5 rounded-lg cursor-pointer transition-all\n        ".concat(s===e.id?"bg-gray-800 border-2 border-orange-500":"bg-gray-800 border border-gray-700","\n        hover:border-orange-500 hover:bg-gray-700\n      "),children:[(0,wt.jsxs)("div",{className:"flex items-center justify-between mb-2",children:[(0,wt.jsx)("h4",{className:"text-lg font-medium text-orange-500",children:e.title}),s===e.id&&(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 text-orange-500",viewBox:"0 0 20 20",fill:"currentColor",children:(0,wt.jsx)("path",{fillRule:"evenodd",d:"M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z",clipRule:"evenodd"})})]}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm",children:e.description})]},e.id)))}),(0,wt.jsx)("div",{className:"mt-6 flex flex-col md:flex-row md:items-center md:justify-between",children:(0,wt.jsx)("button",{type:"submit",className:"bg-orange-500 hover:bg-orange-600 px-6 py-3 rounded-lg text-white font-medium transition disabled:opacity-50 disabled:cursor-not-allowed flex items-center justify-center",disabled:!s,children:"Detect Hardware"})})]}),o&&m&&(0,wt.jsxs)("div",{className:"border-t border-gray-700 pt-6 mt-6",children:[(0,wt.jsx)("h3",{className:"text-xl font-medium mb-4",children:"Hardware Detection Results"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"System Profile"}),(0,wt.jsx)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:m.profile})]}),(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"GPU"}),(0,wt.jsx)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:m.gpu_name})]}),(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"GPU Memory"}),(0,wt.jsxs)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:[m.gpu_total_memory_gb," GB"]})]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"System RAM"}),(0,wt.jsxs)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:[m.ram_total_gb," GB"]})]}),(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"Available Disk Space"}),(0,wt.jsxs)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:[m.available_diskspace_gb," GB"]})]}),(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"CPU Cores"}),(0,wt.jsx)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:m.cpu_cores})]})]})]}),(0,wt.jsxs)("div",{className:"mt-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"Recommended Model"}),(0,wt.jsx)("div",{className:"p-3 bg-gray-900 rounded-lg font-medium text-orange-500",children:m.model_recommendation})]}),(0,wt.jsxs)("div",{className:"mt-6",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-3",children:"Model Selection"}),(0,wt.jsx)("div",{className:"mb-4",children:(0,wt.jsxs)("div",{className:"flex flex-col space-y-2",children:[(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"modelType",checked:!v,onChange:()=>b(!1),className:"mr-3 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"text-white",children:"Use Recommended Models"})]}),(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"modelType",checked:v,onChange:()=>b(!0),className:"mr-3 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"text-white",children:"Use Custom Model"})]})]})}),!v&&(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{htmlFor:"model-select",className:"block text-sm font-medium text-gray-400 mb-1",children:"Select Your Model"}),(0,wt.jsxs)("select",{id:"model-select",value:d,onChange:async e=>{console.log("Setting model to:",e.target.value),f(e.target.value),await fetch("".concat(Nt.baseURL,"/finetune/set_model"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({selected_model:e.target.value})})},className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"",children:"Select a model"}),null===(t=m.possible_options)||void 0===t?void 0:t.map((e=>(0,wt.jsx)("option",{value:e,children:e},e)))]})]}),v&&(0,wt.jsxs)("div",{className:"space-y-4",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{htmlFor:"custom-repo",className:"block text-sm font-medium text-gray-400 mb-1",children:"HuggingFace Repository Name"}),(0,wt.jsxs)("div",{className:"flex space-x-2",children:[(0,wt.jsx)("input",{id:"custom-repo",type:"text",value:y,onChange:e=>{x(e.target.value),w&&(k(null),N(null))},placeholder:"meta-llama/Llama-3.2-1B",className:"bg-gray-900 border border-gray-700 rounded-lg p-3 flex-1 text-white focus:border-orange-500 focus:outline-none"}),(0,wt.jsx)("button",{onClick:async()=>{if(!y.trim())return k("invalid"),void N({error:"Repository name cannot be empty"});k("validating");try{const e=await fetch("".concat(Nt.baseURL,"/finetune/validate_custom_model"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({repo_name:y.trim()})}),t=await e.json();e.ok&&t.validation.valid?(k("valid"),N(t.validation)):(k("invalid"),N(t.validation||{error:"Validation failed"}))}catch(e){console.error("Validation error:",e),k("invalid"),N({error:"Unable to validate model. Check your connection."})}},disabled:!y.trim()||"validating"===w,className:"bg-orange-500 hover:bg-orange-600 disabled:bg-gray-600 disabled:cursor-not-allowed px-4 py-3 rounded-lg text-white font-medium transition flex items-center justify-center min-w-[100px]",children:"validating"===w?(0,wt.jsx)("div",{className:"animate-spin h-4 w-4 border-2 border-white rounded-full border-t-transparent"}):"Validate"})]})]}),w&&(0,wt.jsxs)("div",{className:"p-3 rounded-lg ".concat("valid"===w?"bg-green-800 border border-green-600":"invalid"===w?"bg-red-800 border border-red-600":"bg-gray-800 border border-gray-600"),children:["valid"===w&&(0,wt.jsxs)("div",{className:"flex items-center text-green-300",children:[(0,wt.jsx)("svg",{className:"h-5 w-5 mr-2",fill:"currentColor",viewBox:"0 0 20 20",children:(0,wt.jsx)("path",{fillRule:"evenodd",d:"M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z",clipRule:"evenodd"})}),(0,wt.jsx)("span",{className:"font-medium",children:"Model validated successfully!"})]}),"invalid"===w&&(0,wt.jsxs)("div",{className:"flex items-center text-red-300",children:[(0,wt.jsx)("svg",{className:"h-5 w-5 mr-2",fill:"currentColor",viewBox:"0 0 20 20",children:(0,wt.jsx)("path",{fillRule:"evenodd",d:"M10 18a8 8 0 100-16 8 8 0 000 16zM8.707 7.293a1 1 0 00-1.414 1.414L8.586 10l-1.293 1.293a1 1 0 101.414 1.414L10 11.414l1.293 1.293a1 1 0 001.414-1.414L11.414 10l1.293-1.293a1 1 0 00-1.414-1.414L10 8.586 8.707 7.293z",clipRule:"evenodd"})}),(0,wt.jsx)("span",{className:"font-medium",children:(null===j||void 0===j?void 0:j.error)||"Validation failed"})]})]}),(0,wt.jsxs)("div",{className:"bg-yellow-600 border border-yellow-500 rounded-lg p-4",children:[(0,wt.jsxs)("h4",{className:"font-bold mb-2 flex items-center text-yellow-100",children:[(0,wt.jsx)("svg",{className:"h-5 w-5 mr-2",fill:"currentColor",viewBox:"0 0 20 20",children:(0,wt.jsx)("path",{fillRule:"evenodd",d:"M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92zM11 13a1 1 0 11-2 0 1 1 0 012 0zm-1-8a1 1 0 00-1 1v3a1 1 0 002 0V6a1 1 0 00-1-1z",clipRule:"evenodd"})}),"Custom Model Warning"]}),(0,wt.jsxs)("ul",{className:"text-sm space-y-1 text-yellow-100 mb-3",children:[(0,wt.jsx)("li",{children:"\u2022 You are responsible for ensuring the model fits your hardware"}),(0,wt.jsx)("li",{children:"\u2022 Fine-tuning may fail if the model is incompatible"}),(0,wt.jsx)("li",{children:"\u2022 Memory usage and training time are not estimated"}),(0,wt.jsx)("li",{children:"\u2022 Check the model's license before use"})]}),(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"checkbox",checked:S,onChange:e=>_(e.target.checked),className:"mr-2"}),(0,wt.jsx)("span",{className:"text-sm text-yellow-100",children:"I understand and accept these risks"})]})]})]})]})]})]}),(0,wt.jsxs)("div",{className:"text-center mb-8",children:[(0,wt.jsxs)("a",{href:"/",className:"text-orange-500 hover:text-orange-400 mr-6 inline-flex items-center",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 mr-2",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M11 17l-5-5m0 0l5-5m-5 5h12"})}),"Back to Home"]}),(0,wt.jsxs)("button",{onClick:async()=>{console.log("Selected Task before update:",s),console.log("Selected Model before update:",d),console.log("Use Custom Model:",v);let e=d;if(v){if("valid"!==w||!S)return void alert("Please validate your custom model and accept the risks before proceeding.");try{if(!(await fetch("".concat(Nt.baseURL,"/finetune/set_custom_model"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({repo_name:y.trim()})})).ok)throw new Error("Failed to set custom model");e=y.trim()}catch(n){return console.error("Error setting custom model:",n),void alert("Failed to set custom model. Please try again.")}}const t={task:s,model_name:e,is_custom_model:v};console.log("Updating task settings (direct update):",t),a(t),g(!0),setTimeout((()=>{l("/finetune/load_settings")}),1e3)},className:"bg-orange-500 hover:bg-orange-600 px-6 py-3 rounded-lg font-medium transition inline-flex items-center disabled:opacity-50 disabled:cursor-not-allowed",disabled:!o||(v?"valid"!==w||!S:!d),children:["Configure Training",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 ml-2",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13 7l5 5m0 0l-5 5m5-5H6"})})]})]})]})},_t=e=>{var t,n,a,l,o,i;let{defaultValues:s,updateSettings:u}=e;const d=pe(),[f,m]=(0,r.useState)(!1),[p,h]=(0,r.useState)(null),[g,v]=(0,r.useState)({}),[b,y]=(0,r.useState)(!1),[x,w]=(0,r.useState)(null),[k,j]=(0,r.useState)([]),[N,S]=(0,r.useState)([]),[_,C]=(0,r.useState)(null),[E,P]=(0,r.useState)(!0),[L,z]=(0,r.useState)(null);(0,r.useEffect)((()=>{(async()=>{try{P(!0);const e=await(async()=>{try{const e=await fetch("".concat(Nt.baseURL,"/info"),{method:"GET",headers:Nt.headers});if(!e.ok)throw new Error("Failed to fetch system info: ".concat(e.status));return await e.json()}catch(L){throw console.error("Error fetching system info:",L),L}})();console.log("Fetched system info:",e),C(e),j(e.available_providers||["huggingface"]),S(e.available_strategies||["sft"]),P(!1)}catch(e){console.error("Error fetching system info:",e),z("Failed to load system information"),j(["huggingface"]),S(["sft"]),P(!1)}})()}),[]),(0,r.useEffect)((()=>{(async()=>{try{const e=await fetch("".concat(Nt.baseURL,"/finetune/load_settings"));if(!e.ok)throw new Error("Failed to fetch settings");const t=await e.json();console.log("Fetched default values:",t.default_values);const n=await fetch("".concat(Nt.baseURL,"/finetune/session"));if(!n.ok)throw new Error("Failed to fetch session");const r=await n.json();console.log("Fetched session data:",r);const a=c(c({},t.default_values),{},{task:r.task,model_name:r.selected_model,compute_specs:t.compute_profile||"low_end"});console.log("Merged form state:",a),s=a,v(a)}catch(e){console.error("Error fetching settings:",e)}})()}),[]),(0,r.useEffect)((()=>{if(console.log("defaultValues changed in FinetuneSettings:",s),s){const e=JSON.parse(JSON.stringify(s));e.provider||(e.provider="huggingface"),e.strategy||(e.strategy="sft"),void 0===e.eval_split&&(e.eval_split=.2),void 0===e.eval_steps&&(e.eval_steps=100),console.log("Setting form values to:",e),v(e)}}),[s]);const T=e=>{const{name:t,value:n,type:r,checked:a}=e.target,l="checkbox"===r?a:n,o=c(c({},g),{},{[t]:"number"===r?Number(l):l});console.log("Changing ".concat(t," to:"),l),console.log("New form values:",o),"task"!==t&&"model_name"!==t||console.log("\u26a0\ufe0f IMPORTANT: ".concat(t,' changed to "').concat(l,'"')),v(o)},M=e=>{const t=c(c({},g),{},{use_4bit:"4bit"===e,use_8bit:"8bit"===e,quantization:e});v(t)},R={task:"What you want your AI to be good at doing",model_name:"The base AI model you're customizing",provider:"Model provider (HuggingFace for standard, Unsloth for 2x faster training)",strategy:"Training method (SFT for basic, RLHF for preference learning, DPO for direct optimization, QLoRA for memory efficiency)",gpu:"The graphics card that will run your training",ram:"Computer memory available for training",num_train_epochs:"How many times the AI will see your training data",learning_rate:"How quickly the model adapts to new information",per_device_train_batch_size:"How many examples are processed at once",max_seq_length:"Maximum text length the model can handle",dataset_file:"Your training examples in JSON format",lora_r:"Controls model capacity and training speed",lora_alpha:"Controls how much the model changes during training",quantization:"Reduces model size to fit in memory",bnb_4bit_compute_dtype:"Technical setting for calculation precision",optim:"Method used to update the model during training",lr_scheduler_type:"How learning speed changes during training",eval_split:"Percentage of data to use for validation (0-1)",eval_steps:"How often to evaluate the model during training"},O={huggingface:"Standard HuggingFace Hub models",unsloth:"Optimized for 2x faster training with lower memory"},A={sft:"Supervised Fine-Tuning - Standard approach with LoRA",rlhf:"Reinforcement Learning from Human Feedback - Preference-based training",dpo:"Direct Preference Optimization - Simpler alternative to RLHF",qlora:"Quantized LoRA - Memory-efficient training with 4-bit quantization"},F=e=>{let{id:t,children:n}=e;return(0,wt.jsxs)("div",{className:"flex justify-between items-center",children:[(0,wt.jsx)("div",{className:"flex-grow",children:n}),(0,wt.jsxs)("div",{className:"relative",children:[(0,wt.jsx)("span",{className:"cursor-help text-orange-500 font-bold text-sm",onMouseEnter:()=>w(t),onMouseLeave:()=>w(null),children:"?"}),x===t&&(0,wt.jsx)("div",{className:"absolute z-10 w-64 p-2 text-sm text-white bg-gray-900 rounded-md shadow-lg border border-orange-500 right-0 top-6",children:R[t]})]})]})};return E?(0,wt.jsx)("div",{className:"container mx-auto px-4 py-8 max-w-4xl",children:(0,wt.jsxs)("div",{className:"text-center",children:[(0,wt.jsx)("div",{className:"animate-spin h-12 w-12 border-4 border-orange-500 rounded-full border-t-transparent mx-auto"}),(0,wt.jsx)("p",{className:"text-gray-400 mt-4",children:"Loading system information..."})]})}):(0,wt.jsxs)("div",{className:"container mx-auto px-4 py-8 max-w-4xl",children:[(0,wt.jsxs)("div",{className:"mb-8",children:[(0,wt.jsx)("h1",{className:"text-3xl font-bold text-white",children:"Finetuning Settings"}),(0,wt.jsx)("p",{className:"text-gray-400 mt-2",children:"Configure your model training parameters"}),_&&(0,wt.jsxs)("div",{className:"mt-4 p-3 bg-gray-800 rounded-lg text-sm text-gray-300",children:[(0,wt.jsx)("strong",{children:"Available:"})," ",k.length," provider(s), ",N.length," strategy(ies)"]})]}),L&&(0,wt.jsxs)("div",{className:"bg-red-700 text-white p-4 rounded-lg mb-6",children:[(0,wt.jsx)("strong",{children:"Error:"})," ",L]}),b&&(0,wt.jsxs)("div",{className:"bg-green-700 text-white p-4 rounded-lg mb-6 flex items-center justify-between",children:[(0,wt.jsx)("div",{children:"Settings updated successfully! Redirecting..."}),(0,wt.jsx)("div",{className:"animate-spin h-5 w-5 border-2 border-white rounded-full border-t-transparent"})]}),(0,wt.jsxs)("form",{onSubmit:async e=>{e.preventDefault();try{if(z(null),!g.task||!g.model_name)return void z("Missing required fields. Please go back and complete previous steps.");if(!p)throw new Error("Please select a dataset file");{console.log("Uploading dataset...");const e=await(async(e,t)=>{try{const n=new FormData;n.append("json_file",e,e.name),n.append("settings",JSON.stringify(t));const r=await fetch("".concat(Nt.baseURL,"/finetune/load_settings"),{method:"POST",body:n});if(!r.ok){const e=await r.json().catch((()=>({})));throw new Error(e.detail||"Upload failed: ".concat(r.status))}return await r.json()}catch(L){throw console.error("Error uploading dataset:",L),L}})(p,g);console.log("Dataset uploaded:",e),g.dataset=e.file_path}const e={task:g.task,model_name:g.model_name,dataset:g.dataset,compute_specs:g.compute_specs||"low_end",provider:g.provider||"huggingface",strategy:g.strategy||"sft",lora_r:g.lora_r||16,lora_alpha:g.lora_alpha||32,lora_dropout:g.lora_dropout||.1,use_4bit:void 0===g.use_4bit||g.use_4bit,use_8bit:g.use_8bit||!1,bnb_4bit_compute_dtype:g.bnb_4bit_compute_dtype||"float16",bnb_4bit_quant_type:g.bnb_4bit_quant_type||"nf4",use_nested_quant:g.use_nested_quant||!1,fp16:g.fp16||!1,bf16:g.bf16||!1,num_train_epochs:g.num_train_epochs||1,per_device_train_batch_size:g.per_device_train_batch_size||1,per_device_eval_batch_size:g.per_device_eval_batch_size||1,gradient_accumulation_steps:g.gradient_accumulation_steps||4,gradient_checkpointing:void 0===g.gradient_checkpointing||g.gradient_checkpointing,max_grad_norm:g.max_grad_norm||.3,learning_rate:g.learning_rate||2e-4,weight_decay:g.weight_decay||.001,optim:g.optim||"paged_adamw_32bit",lr_scheduler_type:g.lr_scheduler_type||"cosine",max_steps:g.max_steps||-1,warmup_ratio:g.warmup_ratio||.03,group_by_length:void 0===g.group_by_length||g.group_by_length,packing:g.packing||!1,max_seq_length:g.max_seq_length||null,eval_split:void 0!==g.eval_split?g.eval_split:.2,eval_steps:g.eval_steps||100};console.log("Starting training with config:",e);const t=await(async e=>{try{const t=await fetch("".concat(Nt.baseURL,"/finetune/start_training"),{method:"POST",headers:Nt.headers,body:JSON.stringify(e)});if(!t.ok){const e=await t.json().catch((()=>({})));throw new Error(e.detail||"Training start failed: ".concat(t.status))}return await t.json()}catch(L){throw console.error("Error starting training:",L),L}})(e);console.log("Training started:",t),y(!0),setTimeout((()=>{d("/finetune/loading")}),1e3)}catch(L){console.error("Error submitting form:",L),z(L.message||"Failed to start training"),alert("Failed to start training: ".concat(L.message))}},className:"space-y-8",children:[(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h2",{className:"text-xl font-semibold text-white mb-4",children:"Configuration Summary"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"task",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"Task"})}),(0,wt.jsx)("div",{className:"bg-gray-900 border border-gray-700 rounded-lg p-3 text-white",children:g.task||s.task||"Not set"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"model_name",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"Model Name"})}),(0,wt.jsx)("div",{className:"bg-gray-900 border border-gray-700 rounded-lg p-3 text-white",children:g.model_name||s.model_name||"Not set"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"gpu",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"GPU"})}),(0,wt.jsx)("div",{className:"bg-gray-900 border border-gray-700 rounded-lg p-3 text-white",children:(null===(t=g.hardware_config)||void 0===t?void 0:t.gpu)||(null===(n=s.hardware_config)||void 0===n?void 0:n.gpu)||"N/A"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"ram",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"RAM"})}),(0,wt.jsx)("div",{className:"bg-gray-900 border border-gray-700 rounded-lg p-3 text-white",children:null!==(a=g.hardware_config)&&void 0!==a&&a.ram||null!==(l=s.hardware_config)&&void 0!==l&&l.ram?"".concat((null===(o=g.hardware_config)||void 0===o?void 0:o.ram)||(null===(i=s.hardware_config)||void 0===i?void 0:i.ram)," GB"):"N/A"})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h2",{className:"text-xl font-semibold text-white mb-4",children:"Provider & Strategy"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"provider",children:(0,wt.jsx)("label",{htmlFor:"provider",className:"block text-sm font-medium text-gray-400 mb-1",children:"Model Provider"})}),(0,wt.jsx)("select",{id:"provider",name:"provider",value:g.provider||"huggingface",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:k.map((e=>(0,wt.jsx)("option",{value:e,children:e.charAt(0).toUpperCase()+e.slice(1)},e)))}),g.provider&&O[g.provider]&&(0,wt.jsx)("p",{className:"mt-2 text-xs text-gray-400",children:O[g.provider]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"strategy",children:(0,wt.jsx)("label",{htmlFor:"strategy",className:"block text-sm font-medium text-gray-400 mb-1",children:"Training Strategy"})}),(0,wt.jsx)("select",{id:"strategy",name:"strategy",value:g.strategy||"sft",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:N.map((e=>(0,wt.jsx)("option",{value:e,children:e.toUpperCase()},e)))}),g.strategy&&A[g.strategy]&&(0,wt.jsx)("p",{className:"mt-2 text-xs text-gray-400",children:A[g.strategy]})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h2",{className:"text-xl font-semibold text-white mb-4",children:"Basic Settings"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"num_train_epochs",children:(0,wt.jsx)("label",{htmlFor:"num_train_epochs",className:"block text-sm font-medium text-gray-400 mb-1",children:"Training Epochs"})}),(0,wt.jsx)("input",{type:"number",id:"num_train_epochs",name:"num_train_epochs",min:"1",max:"100",value:g.num_train_epochs||3,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"learning_rate",children:(0,wt.jsx)("label",{htmlFor:"learning_rate",className:"block text-sm font-medium text-gray-400 mb-1",children:"Learning Rate"})}),(0,wt.jsx)("input",{type:"number",id:"learning_rate",name:"learning_rate",step:"0.000001",value:g.learning_rate||2e-4,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"per_device_train_batch_size",children:(0,wt.jsx)("label",{htmlFor:"per_device_train_batch_size",className:"block text-sm font-medium text-gray-400 mb-1",children:"Batch Size (Train)"})}),(0,wt.jsx)("input",{type:"number",id:"per_device_train_batch_size",name:"per_device_train_batch_size",min:"1",value:g.per_device_train_batch_size||2,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"max_seq_length",children:(0,wt.jsx)("label",{htmlFor:"max_seq_length",className:"block text-sm font-medium text-gray-400 mb-1",children:"Max Sequence Length"})}),(0,wt.jsx)("input",{type:"number",id:"max_seq_length",name:"max_seq_length",value:g.max_seq_length||512,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]}),(0,wt.jsxs)("div",{className:"col-span-full",children:[(0,wt.jsx)(F,{id:"dataset_file",children:(0,wt.jsx)("label",{htmlFor:"dataset_file",className:"block text-sm font-medium text-gray-400 mb-1",children:"Dataset File"})}),(0,wt.jsx)("div",{className:"flex items-center",children:(0,wt.jsxs)("label",{className:"w-full flex items-center justify-center px-4 py-2 border border-gray-700 rounded-lg cursor-pointer bg-gray-900 hover:bg-gray-800 transition",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 mr-2 text-gray-400",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M7 16a4 4 0 01-.88-7.903A5 5 0 1115.9 6L16 6a5 5 0 011 9.9M15 13l-3-3m0 0l-3 3m3-3v12"})}),(0,wt.jsx)("span",{className:"text-white",children:"Upload Dataset"}),(0,wt.jsx)("input",{type:"file",id:"dataset_file",name:"dataset_file",accept:".json,.jsonl",className:"hidden",onChange:e=>{const t=e.target.files[0];h(t)}})]})}),(0,wt.jsx)("p",{className:"mt-2 text-sm text-gray-400",children:p?p.name:"No file selected"})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h2",{className:"text-xl font-semibold text-white mb-4",children:"Evaluation Settings"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"eval_split",children:(0,wt.jsx)("label",{htmlFor:"eval_split",className:"block text-sm font-medium text-gray-400 mb-1",children:"Validation Split"})}),(0,wt.jsx)("input",{type:"number",id:"eval_split",name:"eval_split",min:"0",max:"1",step:"0.05",value:void 0!==g.eval_split?g.eval_split:.2,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"}),(0,wt.jsxs)("p",{className:"mt-2 text-xs text-gray-400",children:[Math.round(100*(g.eval_split||.2)),"% of data for validation"]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"eval_steps",children:(0,wt.jsx)("label",{htmlFor:"eval_steps",className:"block text-sm font-medium text-gray-400 mb-1",children:"Evaluation Steps"})}),(0,wt.jsx)("input",{type:"number",id:"eval_steps",name:"eval_steps",min:"10",step:"10",value:g.eval_steps||100,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"}),(0,wt.jsxs)("p",{className:"mt-2 text-xs text-gray-400",children:["Evaluate every ",g.eval_steps||100," training steps"]})]})]})]}),(0,wt.jsx)("div",{className:"flex justify-center mb-6",children:(0,wt.jsxs)("button",{type:"button",onClick:()=>m(!f),className:"flex items-center text-orange-500 hover:text-orange-400 transition",children:[(0,wt.jsx)("span",{className:"mr-2",children:"Advanced Settings"}),(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 transform transition-transform ".concat(f?"rotate-180":""),fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M19 9l-7 7-7-7"})})]})}),f&&(0,wt.jsxs)("div",{className:"space-y-6",children:[(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h3",{className:"text-lg font-medium text-white mb-4",children:"LoRA Configuration"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"lora_r",children:(0,wt.jsx)("label",{htmlFor:"lora_r",className:"block text-sm font-medium text-gray-400 mb-1",children:"LoRA Rank (r)"})}),(0,wt.jsxs)("select",{id:"lora_r",name:"lora_r",value:g.lora_r||16,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"4",children:"4"}),(0,wt.jsx)("option",{value:"8",children:"8"}),(0,wt.jsx)("option",{value:"16",children:"16"}),(0,wt.jsx)("option",{value:"32",children:"32"}),(0,wt.jsx)("option",{value:"64",children:"64"})]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"lora_alpha",children:(0,wt.jsx)("label",{htmlFor:"lora_alpha",className:"block text-sm font-medium text-gray-400 mb-1",children:"LoRA Alpha"})}),(0,wt.jsx)("input",{type:"number",id:"lora_alpha",name:"lora_alpha",min:"1",value:g.lora_alpha||32,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h3",{className:"text-lg font-medium text-white mb-4",children:"Quantization Settings"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"quantization",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-2",children:"Precision"})}),(0,wt.jsxs)("div",{className:"space-y-3",children:[(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"quantization",value:"4bit",checked:"4bit"===g.quantization,onChange:()=>M("4bit"),className:"rounded-full bg-gray-900 border-gray-700 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"ml-2 text-sm text-gray-400",children:"4-bit Quantization"})]}),(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"quantization",value:"8bit",checked:"8bit"===g.quantization,onChange:()=>M("8bit"),className:"rounded-full bg-gray-900 border-gray-700 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"ml-2 text-sm text-gray-400",children:"8-bit Quantization"})]}),(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"quantization",value:"none",checked:"none"===g.quantization,onChange:()=>M("none"),className:"rounded-full bg-gray-900 border-gray-700 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"ml-2 text-sm text-gray-400",children:"No Quantization"})]})]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"bnb_4bit_compute_dtype",children:(0,wt.jsx)("label",{htmlFor:"bnb_4bit_compute_dtype",className:"block text-sm font-medium text-gray-400 mb-1",children:"Compute Dtype"})}),(0,wt.jsxs)("select",{id:"bnb_4bit_compute_dtype",name:"bnb_4bit_compute_dtype",value:g.bnb_4bit_compute_dtype||"float16",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"float32",children:"float32"}),(0,wt.jsx)("option",{value:"bfloat16",children:"bfloat16"}),(0,wt.jsx)("option",{value:"float16",children:"float16"})]})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h3",{className:"text-lg font-medium text-white mb-4",children:"Optimization Settings"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"optim",children:(0,wt.jsx)("label",{htmlFor:"optim",className:"block text-sm font-medium text-gray-400 mb-1",children:"Optimizer"})}),(0,wt.jsxs)("select",{id:"optim",name:"optim",value:g.optim||"paged_adamw_32bit",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"paged_adamw_32bit",children:"Paged AdamW 32bit"}),(0,wt.jsx)("option",{value:"adamw_torch",children:"AdamW Torch"}),(0,wt.jsx)("option",{value:"adamw_bnb_8bit",children:"AdamW 8-bit"})]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"lr_scheduler_type",children:(0,wt.jsx)("label",{htmlFor:"lr_scheduler_type",className:"block text-sm font-medium text-gray-400 mb-1",children:"Learning Rate Scheduler"})}),(0,wt.jsxs)("select",{id:"lr_scheduler_type",name:"lr_scheduler_type",value:g.lr_scheduler_type||"cosine",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"cosine",children:"Cosine"}),(0,wt.jsx)("option",{value:"linear",children:"Linear"}),(0,wt.jsx)("option",{value:"constant",children:"Constant"})]})]})]})]})]}),(0,wt.jsx)("div",{className:"text-center",children:(0,wt.jsxs)("button",{type:"submit",className:"bg-orange-500 hover:bg-orange-600 px-6 py-3 rounded-lg font-medium transition inline-flex items-center",children:["Start Finetuning",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 ml-2",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13 10V3L4 14h7v7l9-11h-7z"})})]})})]})]})};if("undefined"!==typeof document){const e=document.createElement("style");e.textContent="\n/* Success container */\n.celebration-container {\n  position: relative;\n  height: 200px;\n  display: flex;\n  justify-content: center;\n  align-items: center;\n  overflow: hidden;\n}\n\n/* AI Network Animation */\n.ai-network-animation {\n  position: relative;\n  width: 230px;\n  height: 230px;\n  margin: 0 auto;\n  perspective: 1000px;\n  transform-style: preserve-3d;\n}\n\n/* Core and layers */\n.network-core {\n  position: absolute;\n  width: 24px;\n  height: 24px;\n  background-color: #ff8033;\n  border-radius: 50%;\n  top: 50%;\n  left: 50%;\n  transform: translate(-50%, -50%);\n  box-shadow: 0 0 15px rgba(255, 128, 51, 0.7);\n  animation: pulse-core 2s infinite ease-in-out;\n  z-index: 30;\n}\n\n.network-layer {\n  position: absolute;\n  border: 2px solid rgba(255, 128, 51, 0.5);\n  border-radius: 50%;\n  top: 50%;\n  left: 50%;\n  transform-style: preserve-3d;\n  animation: rotate-layer 20s infinite linear;\n}\n\n.layer-1 {\n  width: 80px;\n  height: 80px;\n  transform: translate(-50%, -50%) rotateX(60deg) rotateY(0deg);\n  animation-direction: normal;\n}\n\n.layer-2 {\n  width: 140px;\n  height: 140px;\n  transform: translate(-50%, -50%) rotateX(30deg) rotateY(30deg);\n  animation-direction: reverse;\n  animation-duration: 25s;\n}\n\n.layer-3 {\n  width: 200px;\n  height: 200px;\n  transform: translate(-50%, -50%) rotateX(70deg) rotateY(10deg);\n  animation-duration: 30s;\n}\n\n/* Connection lines */\n.connection {\n  position: absolute;\n  top: 50%;\n  left: 50%;\n  height: 2px;\n  background: linear-gradient(90deg, rgba(255, 128, 51, 0.8), rgba(255, 128, 51, 0));\n  transform-origin: left center;\n  z-index: 10;\n}\n\n.connection-1 {\n  width: 100px;\n  transform: translate(0, -1px) rotate(30deg);\n}\n\n.connection-2 {\n  width: 80px;\n  transform: translate(0, -1px) rotate(150deg);\n}\n\n.connection-3 {\n  width: 120px;\n  transform: translate(0, -1px) rotate(210deg);\n}\n\n.connection-4 {\n  width: 90px;\n  transform: translate(0, -1px) rotate(270deg);\n}\n\n.connection-5 {\n  width: 110px;\n  transform: translate(0, -1px) rotate(330deg);\n}\n\n.connection-6 {\n  width: 80px;\n  transform: translate(0, -1px) rotate(90deg);\n}\n\n/* Data nodes */\n.data-node {\n  position: absolute;\n  width: 10px;\n  height: 10px;\n  background-color: #ff8033;\n  border-radius: 50%;\n  box-shadow: 0 0 8px rgba(255, 128, 51, 0.6);\n  animation: pulse-node 2s infinite alternate;\n}\n\n.node-1 {\n  top: calc(50% - 55px);\n  left: calc(50% + 65px);\n  animation-delay: 0s;\n}\n\n.node-2 {\n  top: calc(50% + 45px);\n  left: calc(50% + 85px);\n  animation-delay: 0.4s;\n}\n\n.node-3 {\n  top: calc(50% + 80px);\n  left: calc(50% - 30px);\n  animation-delay: 0.8s;\n}\n\n.node-4 {\n  top: calc(50% + 25px);\n  left: calc(50% - 90px);\n  animation-delay: 1.2s;\n}\n\n.node-5 {\n  top: calc(50% - 70px);\n  left: calc(50% - 60px);\n  animation-delay: 1.6s;\n}\n\n.node-6 {\n  top: calc(50% - 20px);\n  left: calc(50% + 95px);\n  animation-delay: 2s;\n}\n\n/* Animations */\n@keyframes pulse-core {\n  0% { transform: translate(-50%, -50%) scale(1); opacity: 1; }\n  50% { transform: translate(-50%, -50%) scale(1.2); opacity: 0.8; }\n  100% { transform: translate(-50%, -50%) scale(1); opacity: 1; }\n}\n\n@keyframes rotate-layer {\n  from { transform: translate(-50%, -50%) rotateX(60deg) rotateY(0deg) rotateZ(0deg); }\n  to { transform: translate(-50%, -50%) rotateX(60deg) rotateY(0deg) rotateZ(360deg); }\n}\n\n@keyframes pulse-node {\n  0% { transform: scale(1); opacity: 0.7; }\n  100% { transform: scale(1.3); opacity: 1; }\n}\n\n.glow-text {\n  text-shadow: 0 0 10px rgba(249, 115, 22, 0.7);\n  animation: glow 2s ease-in-out infinite alternate;\n}\n\n.bouncing-text {\n  animation: bounce 0.7s ease infinite alternate;\n}\n\n/* Progress bar surging animation */\n.progress-bar {\n  background: linear-gradient(90deg, #f97316, #ffaa70);\n  animation: gradient-shift 3s ease infinite;\n  background-size: 200% 200%;\n}\n\n@keyframes glow {\n  0% { filter: brightness(1); }\n  100% { filter: brightness(1.3); }\n}\n\n@keyframes bounce {\n  from { transform: translateY(0); }\n  to { transform: translateY(-5px); }\n}\n\n@keyframes gradient-shift {\n  0% { background-position: 0% 50%; }\n  50% { background-position: 100% 50%; }\n  100% { background-position: 0% 50%; }\n}\n",document.head.appendChild(e)}const Ct=()=>{const[e,t]=(0,r.useState)(0),[n,a]=(0,r.useState)(0),[l,o]=(0,r.useState)(!1),[i,s]=(0,r.useState)("running"),[c,u]=(0,r.useState)(""),[d,f]=(0,r.useState)(null),m=(0,r.useRef)(null),p=pe(),h=["Initializing model...","Loading dataset...","Configuring training parameters...","Preparing LoRA adapters...","Starting training loop...","Training in progress..."];(0,r.useEffect)((()=>{const e=async()=>{try{const e=await fetch("".concat(Nt.baseURL,"/finetune/status"),{method:"GET"}),n=await e.json();if(console.log("Status API response:",n),s(n.status||"running"),u(n.message||""),"completed"===n.status)return console.log("Training completed successfully!"),o(!0),t(100),a(h.length-1),void(m.current&&clearInterval(m.current));if("error"===n.status)return console.error("Training failed:",n.message),t(0),void(m.current&&clearInterval(m.current));"running"===n.status&&void 0!==n.progress&&(console.log("Backend progress:",n.progress),f(Number(n.progress)))}catch(e){console.error("Error checking status:",e)}};return e(),m.current=setInterval(e,5e3),()=>{m.current&&clearInterval(m.current)}}),[h.length]),(0,r.useEffect)((()=>{const e=e=>{if(!l)return e.preventDefault(),e.returnValue="",""};return window.addEventListener("beforeunload",e),()=>window.removeEventListener("beforeunload",e)}),[l]);return(0,r.useEffect)((()=>{if(l)return;const e=setInterval((()=>{const e=.5*Math.random()+.2,r=[32,67,88],l=[2e3,3e3,3500];t((o=>{if(null!==d&&!isNaN(d)){const e=Math.max(0,Math.min(100,Number(d)));if(Math.abs(e-o)<.5)return o+.1;if(e<o)return o;const t=Math.floor(e/(100/h.length));return t!==n&&t<h.length&&a(t),e}if(o>=95)return 95;if((e=>r.some(((t,n)=>Math.abs(e-t)<.5&&e<t+.5)))(o)){const e=(e=>{for(let t=0;t<r.length;t++)if(Math.abs(e-r[t])<.5)return l[t];return 0})(o);return setTimeout((()=>{t((e=>e+.1))}),e),o}const i=(t=>{const n=.15*Math.sin(Date.now()/1e3)+.1*Math.cos(Date.now()/800),a=r.find((e=>t<e));if(a&&a-t<5)return.5*e;const l=r.filter((e=>t>e)).pop();return l&&t-l<3?1.5*e:e+n})(o),s=o+i,c=Math.floor(s/(100/h.length));return c!==n&&c<h.length&&a(c),s}))}),100);return()=>{clearInterval(e)}}),[n,h.length,l,d]),(0,wt.jsx)("div",{className:"loading-container relative",children:(0,wt.jsx)("div",{className:"loading-card",children:"error"===i?(0,wt.jsxs)("div",{className:"error-container text-center",children:[(0,wt.jsx)("div",{className:"mb-6",children:(0,wt.jsx)("svg",{className:"mx-auto h-24 w-24 text-red-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-3L13.732 4c-.77-1.333-2.694-1.333-3.464 0L3.34 16c-.77 1.333.192 3 1.732 3z"})})}),(0,wt.jsx)("h2",{className:"text-2xl text-red-500 font-bold mb-4",children:"Training Failed"}),(0,wt.jsx)("p",{className:"text-gray-300 mb-2",children:c||"An error occurred during training."}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm mb-6",children:"Please check your configuration and try again."}),(0,wt.jsx)("button",{onClick:()=>p("/finetune/settings"),className:"bg-orange-500 hover:bg-orange-600 px-6 py-3 rounded-lg text-white font-semibold transition",children:"\u2190 Back to Settings"})]}):l?(0,wt.jsxs)("div",{className:"success-container",children:[(0,wt.jsx)("div",{className:"celebration-container mb-6",children:(0,wt.jsxs)("div",{className:"ai-network-animation",children:[(0,wt.jsx)("div",{className:"network-core"}),(0,wt.jsx)("div",{className:"network-layer layer-1"}),(0,wt.jsx)("div",{className:"network-layer layer-2"}),(0,wt.jsx)("div",{className:"network-layer layer-3"}),(0,wt.jsx)("div",{className:"connection connection-1"}),(0,wt.jsx)("div",{className:"connection connection-2"}),(0,wt.jsx)("div",{className:"connection connection-3"}),(0,wt.jsx)("div",{className:"connection connection-4"}),(0,wt.jsx)("div",{className:"connection connection-5"}),(0,wt.jsx)("div",{className:"connection connection-6"}),(0,wt.jsx)("div",{className:"data-node node-1"}),(0,wt.jsx)("div",{className:"data-node node-2"}),(0,wt.jsx)("div",{className:"data-node node-3"}),(0,wt.jsx)("div",{className:"data-node node-4"}),(0,wt.jsx)("div",{className:"data-node node-5"}),(0,wt.jsx)("div",{className:"data-node node-6"})]})}),(0,wt.jsxs)("div",{className:"text-center mb-8",children:[(0,wt.jsx)("h2",{className:"text-3xl text-orange-500 font-bold mb-4 glow-text",children:"BOOM! Your AI is alive! \ud83c\udf89"}),(0,wt.jsx)("p",{className:"text-gray-300 text-lg bouncing-text",children:"You just leveled up in the AI world! Your custom model is ready to blow minds!"}),c&&(0,wt.jsx)("p",{className:"text-gray-400 text-sm mt-2 italic",children:c}),(0,wt.jsx)("div",{className:"mt-4 inline-block px-4 py-2 bg-green-500/20 border border-green-500 rounded-lg",children:(0,wt.jsx)("p",{className:"text-green-400 text-sm font-semibold",children:"\u2713 Training Completed Successfully"})})]}),(0,wt.jsxs)("div",{className:"flex justify-center",children:[(0,wt.jsxs)("button",{onClick:async()=>{try{const e=await fetch("".concat(Nt.baseURL,"/playground/model_path"),{method:"GET"});if(!e.ok)throw new Error("Failed to get model path");const t=(await e.json()).model_path;console.log("Received model path:",t);await fetch("".concat(Nt.baseURL,"/playground/new"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({model_path:t})});p("/")}catch(e){console.error("Error starting AI chat:",e),alert("There was an error starting the AI chat. Please try again.")}},className:"bg-orange-500 hover:bg-orange-600 px-8 py-4 rounded-lg text-white text-lg font-bold transition flex items-center pulse-button",children:[(0,wt.jsx)("span",{className:"mr-2",children:"\ud83d\ude80"}),"Let's Chat With Your AI!",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 ml-2 animate-bounce",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M8 12h.01M12 12h.01M16 12h.01M21 12c0 4.418-4.03 8-9 8a9.863 9.863 0 01-4.255-.949L3 20l1.395-3.72C3.512 15.042 3 13.574 3 12c0-4.418 4.03-8 9-8s9 3.582 9 8z"})})]}),(0,wt.jsx)("style",{jsx:!0,children:"\n                .pulse-button {\n                  animation: pulse 1.5s infinite;\n                  box-shadow: 0 0 0 0 rgba(249, 115, 22, 0.7);\n                }\n                \n                @keyframes pulse {\n                  0% {\n                    transform: scale(0.95);\n                    box-shadow: 0 0 0 0 rgba(249, 115, 22, 0.7);\n                  }\n                  \n                  70% {\n                    transform: scale(1);\n                    box-shadow: 0 0 0 10px rgba(249, 115, 22, 0);\n                  }\n                  \n                  100% {\n                    transform: scale(0.95);\n                    box-shadow: 0 0 0 0 rgba(249, 115, 22, 0);\n                  }\n                }\n              "})]})]}):(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsx)("h1",{className:"loading-title",children:"Finetuning Your Model"}),(0,wt.jsx)("div",{className:"circular-loader-container",children:(0,wt.jsxs)("div",{className:"orbital-loader",children:[(0,wt.jsx)("div",{className:"center-core"}),(0,wt.jsx)("div",{className:"orbital-ring ring-1"}),(0,wt.jsx)("div",{className:"orbital-ring ring-2"}),(0,wt.jsx)("div",{className:"orbital-ring ring-3"}),(0,wt.jsx)("div",{className:"particle particle-1"}),(0,wt.jsx)("div",{className:"particle particle-2"}),(0,wt.jsx)("div",{className:"particle particle-3"}),(0,wt.jsx)("div",{className:"particle particle-4"}),(0,wt.jsx)("div",{className:"particle particle-5"}),(0,wt.jsx)("div",{className:"orbital-trail trail-1"}),(0,wt.jsx)("div",{className:"orbital-trail trail-2"}),(0,wt.jsx)("div",{className:"orbital-trail trail-3"})]})}),(0,wt.jsx)("div",{className:"step-indicator",children:(0,wt.jsx)("p",{className:"current-step",children:h[n]})}),(0,wt.jsxs)("div",{className:"progress-container",children:[(0,wt.jsx)("div",{className:"progress-bar",style:{width:"".concat(e,"%")}}),(0,wt.jsxs)("div",{className:"progress-text",children:[Math.floor(e),"%"]})]})]})})})},Et=()=>{const[e,t]=(0,r.useState)("architecture"),n={architecture:[{title:"PEFT Implementation",description:"Parameter-Efficient Fine-Tuning with LoRA adapters using 4-bit base models",details:["Low-Rank Adaptation (LoRA) with configurable rank and alpha parameters","Support for various adapter configurations (LoRA, AdaLoRA, IA\xb3)","Matrix factorization to enable efficient parameter updates","Trainable weight ratio typically <1% of full model parameters"]},{title:"Quantization Framework",description:"Automatic quantization for base models using GPTQ and bitsandbytes",details:["4-bit quantization with NF4/FP4 data types","8-bit quantization with scaled computation","Support for double quantization for further memory optimization","Nested quantization options for maximum compression"]},{title:"Model Architecture Support",description:"Compatible with major transformer architectures",details:["Decoder-only: Llama, Mistral, Phi, GPT-2, Falcon","Encoder-only: BERT, RoBERTa, DeBERTa","Encoder-decoder: T5, BART, Flan-T5"]}],performance:[{title:"Hardware Profiling",description:"Automatic hardware detection and optimization",details:["CUDA hardware capability detection","Memory usage optimizations based on available VRAM","Dynamic batch size adjustment","Progressive loading for low-memory environments"]},{title:"Training Efficiency",description:"Optimizations for faster training with minimal resources",details:["Gradient checkpointing for reduced memory usage","FlashAttention 2.0 integration for faster attention computation","Mixed precision training (BF16/FP16)","Gradient accumulation to simulate larger batch sizes"]},{title:"Resource Requirements",description:"Minimum and recommended system specifications",details:["Minimum: CUDA-capable GPU with 6GB VRAM, 16GB system RAM","Recommended: NVIDIA GPU with 12GB+ VRAM, 32GB system RAM","Optimal: NVIDIA RTX 3090/4090 or A100 with 24GB+ VRAM","Storage: 20GB+ free space for base models and adapters"]}],data:[{title:"Dataset Processing",description:"Advanced data preparation pipeline",details:["JSON/JSONL format support with configurable prompting templates","Automatic train/validation splitting","Tokenization with special token handling","On-the-fly data augmentation options"]},{title:"Training Formats",description:"Multiple training paradigms for different use cases",details:["Instruction fine-tuning with optional system prompts","Conversation fine-tuning with multi-turn support","Supervised fine-tuning for specific tasks","Custom formatting with template engine"]},{title:"Data Requirements",description:"Guidance on dataset preparation",details:["Recommended minimum: 100+ high-quality examples","Optimal range: 1,000-10,000 examples","Format validation with automatic error detection","Handling of long-context training data"]}],hyperparameters:[{title:"Learning Parameters",description:"Configurable optimization settings",details:["Learning rate: 1e-5 to 2e-4 (adaptive range based on task)","Schedulers: Cosine, linear, constant, warmup","Weight decay: 0.01-0.001 for regularization","Gradient clipping at 1.0 to prevent explosions"]},{title:"LoRA Configuration",description:"Fine-grained control over adapter training",details:["Rank (r): 8, 16, 32, 64 options (complexity vs. performance)","Alpha (\u03b1): Typically 2x rank for stable training","Target modules: Configurable matrix selection","Dropout: 0.05-0.1 for regularization"]},{title:"Advanced Options",description:"Expert-level configuration parameters",details:["Sequence packing for maximum throughput","Group by length for optimized batching","Custom optimizer configurations (AdamW, 8-bit Adam)","Framework integration options (DeepSpeed, FSDP)"]}]};return(0,wt.jsxs)("div",{className:"bg-gradient-to-b from-black via-gray-900 to-black min-h-screen text-white",children:[(0,wt.jsx)("div",{className:"sticky top-0 bg-gray-900 z-20 border-b border-gray-800",children:(0,wt.jsx)("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:(0,wt.jsx)("div",{className:"flex space-x-1 overflow-x-auto hide-scrollbar py-4",role:"tablist","aria-orientation":"horizontal",children:["architecture","performance","data","hyperparameters"].map((n=>(0,wt.jsx)("button",{onClick:()=>t(n),className:"px-4 py-2 rounded-lg font-medium transition-colors whitespace-nowrap ".concat(e===n?"bg-orange-500 text-white":"text-gray-300 hover:bg-gray-800"),role:"tab","aria-selected":e===n,children:n.charAt(0).toUpperCase()+n.slice(1)},n)))})})}),(0,wt.jsx)("main",{className:"py-12",children:(0,wt.jsxs)("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:["architecture"===e&&(0,wt.jsxs)("div",{className:"space-y-10",children:[(0,wt.jsxs)("div",{className:"max-w-3xl mx-auto mb-12",children:[(0,wt.jsx)("h2",{className:"text-3xl font-bold mb-6 text-center",children:"System Architecture"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 text-center",children:"ModelForge employs state-of-the-art Parameter-Efficient Fine-Tuning (PEFT) techniques to enable efficient training on consumer hardware with minimal quality compromise."})]}),n.architecture.map(((e,t)=>(0,wt.jsx)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 transition",children:(0,wt.jsxs)("div",{className:"p-8",children:[(0,wt.jsxs)("div",{className:"mb-6",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-300 mt-2",children:e.description})]}),(0,wt.jsx)("ul",{className:"space-y-2",children:e.details.map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("span",{className:"text-orange-500 mr-2",children:"\u2022"}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))})]})},t))),(0,wt.jsx)("div",{className:"bg-orange-500/10 border border-orange-500/30 rounded-xl p-6 mt-10",children:(0,wt.jsxs)("div",{className:"flex items-start",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 text-orange-500 mr-3 flex-shrink-0 mt-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M13 16h-1v-4h-1m1-4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"})}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("h4",{className:"text-lg font-semibold text-orange-500",children:"Technical Note"}),(0,wt.jsx)("p",{className:"text-gray-300 mt-1",children:"The architecture uses a modular adapter approach that modifies only a small subset of parameters during training, keeping the base model frozen. This approach dramatically reductes memory requirements and training time."})]})]})})]}),"performance"===e&&(0,wt.jsxs)("div",{className:"space-y-10",children:[(0,wt.jsxs)("div",{className:"max-w-3xl mx-auto mb-12",children:[(0,wt.jsx)("h2",{className:"text-3xl font-bold mb-6 text-center",children:"Performance Optimization"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 text-center",children:"ModelForge automatically optimizes training parameters based on available hardware, enabling high-performance fine-tuning even on consumer-grade GPUs."})]}),n.performance.map(((e,t)=>(0,wt.jsx)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 transition",children:(0,wt.jsxs)("div",{className:"p-8",children:[(0,wt.jsxs)("div",{className:"mb-6",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-300 mt-2",children:e.description})]}),(0,wt.jsx)("ul",{className:"space-y-2",children:e.details.map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("span",{className:"text-orange-500 mr-2",children:"\u2022"}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))})]})},t))),(0,wt.jsxs)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 p-8",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white mb-6",children:"GPU Memory Usage by Model Size"}),(0,wt.jsxs)("div",{className:"relative overflow-hidden",children:[(0,wt.jsxs)("div",{className:"space-y-8",children:[(0,wt.jsxs)("div",{className:"space-y-2",children:[(0,wt.jsxs)("div",{className:"flex justify-between text-sm text-gray-400 mb-1",children:[(0,wt.jsx)("span",{children:"Phi-2 (2.7B)"}),(0,wt.jsx)("span",{children:"4-6 GB VRAM"})]}),(0,wt.jsx)("div",{className:"h-4 bg-gray-700 rounded-full overflow-hidden",children:(0,wt.jsx)("div",{className:"h-full bg-gradient-to-r from-orange-400 to-orange-600 w-[20%]"})})]}),(0,wt.jsxs)("div",{className:"space-y-2",children:[(0,wt.jsxs)("div",{className:"flex justify-between text-sm text-gray-400 mb-1",children:[(0,wt.jsx)("span",{children:"Mistral-7B"}),(0,wt.jsx)("span",{children:"8-12 GB VRAM"})]}),(0,wt.jsx)("div",{className:"h-4 bg-gray-700 rounded-full overflow-hidden",children:(0,wt.jsx)("div",{className:"h-full bg-gradient-to-r from-orange-400 to-orange-600 w-[40%]"})})]}),(0,wt.jsxs)("div",{className:"space-y-2",children:[(0,wt.jsxs)("div",{className:"flex justify-between text-sm text-gray-400 mb-1",children:[(0,wt.jsx)("span",{children:"Llama-2-13B"}),(0,wt.jsx)("span",{children:"14-18 GB VRAM"})]}),(0,wt.jsx)("div",{className:"h-4 bg-gray-700 rounded-full overflow-hidden",children:(0,wt.jsx)("div",{className:"h-full bg-gradient-to-r from-orange-400 to-orange-600 w-[60%]"})})]}),(0,wt.jsxs)("div",{className:"space-y-2",children:[(0,wt.jsxs)("div",{className:"flex justify-between text-sm text-gray-400 mb-1",children:[(0,wt.jsx)("span",{children:"Llama-2-70B"}),(0,wt.jsx)("span",{children:"40+ GB VRAM"})]}),(0,wt.jsx)("div",{className:"h-4 bg-gray-700 rounded-full overflow-hidden",children:(0,wt.jsx)("div",{className:"h-full bg-gradient-to-r from-orange-400 to-orange-600 w-[95%]"})})]})]}),(0,wt.jsx)("div",{className:"absolute bottom-0 w-full h-px bg-gray-700"})]}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm mt-6",children:"Memory estimates based on 4-bit quantization with LoRA adapters (r=16). System RAM requirements are typically 2x the VRAM requirements."})]})]}),"data"===e&&(0,wt.jsxs)("div",{className:"space-y-10",children:[(0,wt.jsxs)("div",{className:"max-w-3xl mx-auto mb-12",children:[(0,wt.jsx)("h2",{className:"text-3xl font-bold mb-6 text-center",children:"Data Processing"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 text-center",children:"ModelForge provides advanced data handling capabilities, supporting multiple formats and training paradigms to accommodate diverse use cases."})]}),n.data.map(((e,t)=>(0,wt.jsx)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 transition",children:(0,wt.jsxs)("div",{className:"p-8",children:[(0,wt.jsxs)("div",{className:"mb-6",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-300 mt-2",children:e.description})]}),(0,wt.jsx)("ul",{className:"space-y-2",children:e.details.map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("span",{className:"text-orange-500 mr-2",children:"\u2022"}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))})]})},t))),(0,wt.jsxs)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700",children:[(0,wt.jsxs)("div",{className:"border-b border-gray-700 py-3 px-6 flex items-center justify-between",children:[(0,wt.jsx)("span",{className:"text-white font-medium",children:"Example Training Data Formats (JSONL)"}),(0,wt.jsxs)("div",{className:"flex space-x-2",children:[(0,wt.jsx)("div",{className:"w-3 h-3 rounded-full bg-red-500"}),(0,wt.jsx)("div",{className:"w-3 h-3 rounded-full bg-yellow-500"}),(0,wt.jsx)("div",{className:"w-3 h-3 rounded-full bg-green-500"})]})]}),(0,wt.jsxs)("div",{className:"p-6 overflow-x-auto",children:[(0,wt.jsx)("h4",{className:"text-xl font-medium text-white mb-4",children:"Text Generation"}),(0,wt.jsx)("pre",{className:"text-gray-300 font-mono text-sm mb-8",children:'{\n  "input": "The robot\'s name is Canvas-3000.",\n  "output": "Canvas-3000 whirred softly as its optical sensors focused on the blank paper..."\n}'}),(0,wt.jsx)("h4",{className:"text-xl font-medium text-white mb-4",children:"Summarization"}),(0,wt.jsx)("pre",{className:"text-gray-300 font-mono text-sm mb-8",children:'{\n  "article": "Scientists have discovered a new species of deep-sea creature living near hydrothermal vents...",\n  "summary": "Scientists found a new creature living near underwater hot springs in the deep ocean..."\n}'}),(0,wt.jsx)("h4",{className:"text-xl font-medium text-white mb-4",children:"Question Answering"}),(0,wt.jsx)("pre",{className:"text-gray-300 font-mono text-sm mb-8",children:'{\n  "context": "The Great Barrier Reef is the world\'s largest coral reef system. It is located off the coast of Queensland, Australia...",\n  "question": "Where is the Great Barrier Reef located?",\n  "answers": {"text":"off the coast of Queensland, Australia", "answer_start": [60]}\n}'})]})]})]}),"hyperparameters"===e&&(0,wt.jsxs)("div",{className:"space-y-10",children:[(0,wt.jsxs)("div",{className:"max-w-3xl mx-auto mb-12",children:[(0,wt.jsx)("h2",{className:"text-3xl font-bold mb-6 text-center",children:"Hyperparameter Configuration"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 text-center",children:"ModelForge provides fine-grained control over training hyperparameters with sensible defaults for beginners and advanced options for experts."})]}),n.hyperparameters.map(((e,t)=>(0,wt.jsx)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 transition",children:(0,wt.jsxs)("div",{className:"p-8",children:[(0,wt.jsxs)("div",{className:"mb-6",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-300 mt-2",children:e.description})]}),(0,wt.jsx)("ul",{className:"space-y-2",children:e.details.map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("span",{className:"text-orange-500 mr-2",children:"\u2022"}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))})]})},t))),(0,wt.jsx)("div",{className:"bg-orange-500/10 border border-orange-500/30 rounded-xl p-6 mt-10",children:(0,wt.jsxs)("div",{className:"flex items-start",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 text-orange-500 mr-3 flex-shrink-0 mt-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M9 12l2 2 4-4m5.618-4.016A11.955 11.955 0 0112 2.944a11.955 11.955 0 01-8.618 3.04A12.02 12.02 0 003 9c0 5.591 3.824 10.29 9 11.622 5.176-1.332 9-6.03 9-11.622 0-1.042-.133-2.052-.382-3.016z"})}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("h4",{className:"text-lg font-semibold text-orange-500",children:"Recommended Configurations"}),(0,wt.jsx)("p",{className:"text-gray-300 mt-1",children:"For most use cases, we recommend starting with LoRA rank (r) = 16, learning rate = 2e-4, and 3 epochs. For instruction-tuning tasks, use warmup ratio = 0.03 and weight decay = 0.01. Adjust batch size based on your GPU memory."})]})]})})]})]})}),(0,wt.jsx)("style",{jsx:"true",children:"\n        .hide-scrollbar {\n          -ms-overflow-style: none;\n          scrollbar-width: none;\n        }\n        .hide-scrollbar::-webkit-scrollbar {\n          display: none;\n        }\n        \n        .bg-grid-pattern {\n          background-image: radial-gradient(circle, rgba(255, 83, 51, 0.1) 1px, transparent 1px);\n          background-size: 30px 30px;\n        }\n      "})]})},Pt=e=>{let{isOpen:t,onClose:n,title:r="Error",message:a,details:l=null}=e;return t?(0,wt.jsx)("div",{className:"fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50 p-4",children:(0,wt.jsxs)("div",{className:"bg-gray-900 rounded-2xl shadow-2xl max-w-md w-full",children:[(0,wt.jsx)("div",{className:"p-6 border-b border-gray-700",children:(0,wt.jsxs)("div",{className:"flex items-center justify-between",children:[(0,wt.jsxs)("div",{className:"flex items-center",children:[(0,wt.jsx)("svg",{className:"w-6 h-6 text-red-400 mr-3",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-2.5L13.732 4c-.77-.833-1.964-.833-2.732 0L4.082 16.5c-.77.833.192 2.5 1.732 2.5z"})}),(0,wt.jsx)("h2",{className:"text-xl font-bold text-red-400",children:r})]}),(0,wt.jsx)("button",{onClick:n,className:"text-gray-400 hover:text-white transition-colors",children:(0,wt.jsx)("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M6 18L18 6M6 6l12 12"})})})]})}),(0,wt.jsxs)("div",{className:"p-6",children:[(0,wt.jsx)("p",{className:"text-gray-200 mb-4",children:a}),l&&(0,wt.jsx)("div",{className:"mt-4",children:(0,wt.jsxs)("details",{className:"cursor-pointer",children:[(0,wt.jsx)("summary",{className:"text-orange-400 font-medium hover:text-orange-300 transition-colors",children:"Show Details"}),(0,wt.jsx)("div",{className:"mt-2 p-3 bg-gray-800 rounded-lg text-sm text-gray-300 break-all",children:l})]})})]}),(0,wt.jsx)("div",{className:"p-6 border-t border-gray-700",children:(0,wt.jsx)("button",{onClick:n,className:"w-full px-6 py-3 bg-red-500 text-white rounded-lg hover:bg-red-600 transition-colors font-medium",children:"Close"})})]})}):null},Lt=e=>{let{isOpen:t,message:n,onClose:r,isSuccess:a=!1}=e;if(!t)return null;const l=/(https:\/\/huggingface\.co\/[^\s]+)/g,o=n?n.match(l):[];return(0,wt.jsx)("div",{className:"fixed inset-0 bg-black bg-opacity-70 flex items-center justify-center z-50 p-4",children:(0,wt.jsxs)("div",{className:"bg-gray-900 rounded-3xl shadow-2xl w-full max-w-2xl p-10 flex flex-col items-center border-4 border-orange-500",children:[a&&(0,wt.jsx)("h2",{className:"text-3xl font-bold text-orange-400 mb-6 text-center",children:"Success!"}),(()=>{if(!o||0===o.length)return(0,wt.jsx)("p",{className:"text-orange-300 text-xl mb-8 text-center",children:n});let e=n.split(l);return(0,wt.jsx)("div",{className:"text-orange-300 text-xl mb-8 text-center",children:e.map(((e,t)=>o.includes(e)?(0,wt.jsx)("a",{href:e,target:"_blank",rel:"noopener noreferrer",className:"text-blue-400 underline hover:text-blue-300 break-all",children:e},t):(0,wt.jsx)("span",{children:e},t)))})})(),r&&(0,wt.jsx)("button",{onClick:r,className:"px-8 py-3 bg-orange-500 text-white rounded-xl hover:bg-orange-600 transition-colors font-bold text-lg shadow-lg",children:"Close"})]})})},zt=e=>{let{model:t,onClose:n,onPush:a}=e;const[l,o]=(0,r.useState)(""),[i,s]=(0,r.useState)(!0),[c,u]=(0,r.useState)(!1),[d,f]=(0,r.useState)(""),[m,p]=(0,r.useState)(""),[h,g]=(0,r.useState)(!1),[v,b]=(0,r.useState)(null),[y,x]=(0,r.useState)(!1),[w,k]=(0,r.useState)(""),j=e=>/^([A-Za-z_0-9-]+\/[A-Za-z_0-9-]+)$/.test(e);return(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsx)(Lt,{isOpen:c,message:"Pushing to Hub. This might take a while."}),(0,wt.jsx)(Lt,{isOpen:y,message:w,isSuccess:!0,onClose:()=>{x(!1),n()}}),!c&&!y&&(0,wt.jsx)("div",{className:"fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50 p-4",children:(0,wt.jsxs)("div",{className:"bg-gray-900 rounded-2xl shadow-2xl max-w-2xl w-full max-h-[90vh] overflow-y-auto",children:[(0,wt.jsxs)("div",{className:"p-6 border-b border-gray-700",children:[(0,wt.jsx)("h2",{className:"text-2xl font-bold text-orange-400",children:"Push Model to HuggingFace Hub"}),(0,wt.jsx)("button",{onClick:n,className:"absolute top-4 right-4 text-gray-400 hover:text-white transition-colors",children:(0,wt.jsx)("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M6 18L18 6M6 6l12 12"})})})]}),(0,wt.jsxs)("form",{onSubmit:async e=>{if(e.preventDefault(),!l.trim())return f("Repository name is required"),void g(!0);if(!j(l))return f("Invalid repository name format"),void g(!0);u(!0),f("");try{const e=await fetch(Nt.baseURL+"/hub/push",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({repo_name:l,model_path:t.model_path,private:i})}),n=await e.json();if(!e.ok){u(!1);const t=n.error||"Failed to push model to hub";return f(t),b(n.details||"HTTP ".concat(e.status,": ").concat(e.statusText)),void g(!0)}setTimeout((()=>{u(!1),k(n.message||"Model pushed to Hub successfully!"),x(!0)}),2e3),a&&a(n.message)}catch(n){u(!1),f("Network error or unexpected failure"),b(n.message),g(!0)}},className:"p-6 space-y-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-orange-400 font-semibold mb-2",children:"Repository Name *"}),(0,wt.jsx)("input",{type:"text",value:l,onChange:e=>{const t=e.target.value;o(t),t&&!j(t)?p("Repository name must be in format 'username/repo-name' (letters, numbers, hyphens and underscores only)"):p("")},placeholder:"username/model-name or model-name",className:"w-full px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-white placeholder-gray-400 focus:outline-none focus:border-orange-500 focus:ring-1 focus:ring-orange-500",required:!0}),m&&(0,wt.jsx)("p",{className:"text-red-400 text-sm mt-1",children:m}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm mt-1",children:"Format: 'username/repo-name' or 'repo-name' (letters and underscores only)"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsxs)("label",{className:"flex items-center space-x-3",children:[(0,wt.jsx)("input",{type:"checkbox",checked:i,onChange:e=>s(e.target.checked),className:"w-5 h-5 text-orange-500 bg-gray-800 border-gray-600 rounded focus:ring-orange-500 focus:ring-2"}),(0,wt.jsx)("span",{className:"text-orange-400 font-semibold",children:"Make repository private"})]}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm mt-1 ml-8",children:i?"Repository will be private":"Repository will be public"})]}),(0,wt.jsxs)("div",{className:"space-y-4 border-t border-gray-700 pt-6",children:[(0,wt.jsx)("h3",{className:"text-lg font-semibold text-orange-400",children:"Model Information"}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Model Name"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200",children:t.model_name})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Base Model"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200 break-all",children:t.base_model})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Task Type"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200",children:t.task})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Local Model Path"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200 break-all text-sm",children:t.model_path})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Description"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200",children:t.description||"No description provided"})]})]}),d&&(0,wt.jsx)("div",{className:"text-red-400 bg-red-900/20 border border-red-700 rounded-lg p-3",children:d}),(0,wt.jsxs)("div",{className:"flex gap-4 pt-4",children:[(0,wt.jsx)("button",{type:"button",onClick:n,className:"flex-1 px-6 py-3 bg-gray-700 text-white rounded-lg hover:bg-gray-600 transition-colors font-medium",children:"Cancel"}),(0,wt.jsx)("button",{type:"submit",disabled:c||!!m||!l.trim(),className:"flex-1 px-6 py-3 bg-orange-500 text-white rounded-lg hover:bg-orange-600 transition-colors font-medium disabled:opacity-50 disabled:cursor-not-allowed flex items-center justify-center",children:c?(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsxs)("svg",{className:"animate-spin h-5 w-5 mr-2",xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",children:[(0,wt.jsx)("circle",{className:"opacity-25",cx:"12",cy:"12",r:"10",stroke:"currentColor",strokeWidth:"4"}),(0,wt.jsx)("path",{className:"opacity-75",fill:"currentColor",d:"M4 12a8 8 0 018-8v8z"})]}),"Pushing..."]}):"Push to Hub"})]})]})]})}),(0,wt.jsx)(Pt,{isOpen:h,onClose:()=>{g(!1),f(""),b(null)},title:"Push to Hub Error",message:d,details:v})]})},Tt=()=>{const[e,t]=(0,r.useState)([]),[n,a]=(0,r.useState)(!0),[l,o]=(0,r.useState)(null),[i,s]=(0,r.useState)(null),[c,u]=(0,r.useState)(!1),[d,f]=(0,r.useState)(!1),[m,p]=(0,r.useState)(null);(0,r.useEffect)((()=>{fetch(Nt.baseURL+"/models/").then((e=>{if(!e.ok)throw new Error("Failed to fetch models: HTTP ".concat(e.status," ").concat(e.statusText));return e.json()})).then((e=>{t(e.models||[]),a(!1)})).catch((e=>{o("Failed to load models"),p(e.message),f(!0),a(!1)}))}),[]);const h=async e=>{try{const t=await fetch(Nt.baseURL+"/playground/new",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({model_path:e})});if(!t.ok){const e=await t.json();o("Failed to open playground"),p(e.error||"HTTP ".concat(t.status,": ").concat(t.statusText)),f(!0)}}catch(t){o("Network error while opening playground"),p(t.message),f(!0)}};return(0,wt.jsxs)("div",{className:"min-h-screen bg-gradient-to-b from-black to-gray-900 py-12 px-2",children:[(0,wt.jsxs)("div",{className:"max-w-6xl mx-auto bg-gray-900/80 rounded-2xl shadow-2xl p-8",children:[(0,wt.jsx)("h1",{className:"text-3xl md:text-4xl font-bold text-orange-400 mb-8 text-center tracking-tight",children:"All Models"}),n?(0,wt.jsxs)("div",{className:"flex justify-center items-center min-h-[200px] text-orange-400 text-lg",children:[(0,wt.jsxs)("svg",{className:"animate-spin h-6 w-6 mr-2 text-orange-400",xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",children:[(0,wt.jsx)("circle",{className:"opacity-25",cx:"12",cy:"12",r:"10",stroke:"currentColor",strokeWidth:"4"}),(0,wt.jsx)("path",{className:"opacity-75",fill:"currentColor",d:"M4 12a8 8 0 018-8v8z"})]}),"Loading..."]}):(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsx)("div",{className:"hidden md:block overflow-x-auto rounded-xl shadow-lg",children:(0,wt.jsxs)("table",{className:"min-w-full bg-gray-800 rounded-xl overflow-hidden",children:[(0,wt.jsx)("thead",{children:(0,wt.jsxs)("tr",{children:[(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"ID"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Model Name"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Base Model"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Task"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Description"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Created At"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Model Path"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Playground"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Push to Hub"})]})}),(0,wt.jsx)("tbody",{children:0===e.length?(0,wt.jsx)("tr",{children:(0,wt.jsx)("td",{colSpan:9,className:"text-center text-gray-400 py-8",children:"No models found."})}):e.map(((e,t)=>(0,wt.jsxs)("tr",{className:t%2===0?"bg-gray-900/60":"bg-gray-800/80",children:[(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-200",children:e.id}),(0,wt.jsx)("td",{className:"px-4 py-3 text-orange-300 break-all",children:e.model_name}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-300 break-all",children:e.base_model}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-300",children:e.task}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-400",children:e.description}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-400",children:new Date(e.creation_date).toLocaleString()}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-400 break-all max-w-xs",children:e.model_path}),(0,wt.jsx)("td",{className:"px-4 py-3",children:(0,wt.jsx)("button",{onClick:()=>h(e.model_path),className:"text-orange-400 underline hover:text-orange-300 transition cursor-pointer",children:"Open"})}),(0,wt.jsx)("td",{className:"px-4 py-3",children:(0,wt.jsx)("button",{onClick:()=>{s(e),u(!0)},className:"bg-orange-500 text-white rounded-md px-4 py-2 hover:bg-orange-400 transition",children:"Push"})})]},e.id)))})]})}),(0,wt.jsx)("div",{className:"md:hidden space-y-4",children:0===e.length?(0,wt.jsx)("p",{className:"text-center text-gray-400 py-8",children:"No models found."}):e.map((e=>(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-4 shadow-md",children:[(0,wt.jsx)("div",{className:"text-orange-300 font-semibold text-lg break-all",children:e.model_name}),(0,wt.jsx)("div",{className:"text-gray-400 text-sm mb-2",children:e.description}),(0,wt.jsxs)("div",{className:"text-sm text-gray-300",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)("span",{className:"font-medium text-orange-400",children:"Base:"})," ",e.base_model]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("span",{className:"font-medium text-orange-400",children:"Task:"})," ",e.task]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("span",{className:"font-medium text-orange-400",children:"Created:"})," ",new Date(e.creation_date).toLocaleString()]}),(0,wt.jsxs)("div",{className:"break-all",children:[(0,wt.jsx)("span",{className:"font-medium text-orange-400",children:"Path:"})," ",e.model_path]})]}),(0,wt.jsxs)("div",{className:"mt-4 flex flex-wrap gap-2",children:[(0,wt.jsx)("button",{onClick:()=>h(e.model_path),className:"text-sm bg-transparent text-orange-400 underline hover:text-orange-300",children:"Open Playground"}),(0,wt.jsx)("button",{onClick:()=>{s(e),u(!0)},className:"text-sm bg-orange-500 text-white rounded-md px-3 py-1 hover:bg-orange-400",children:"Push to Hub"})]})]},e.id)))})]})]}),c&&(0,wt.jsx)(zt,{model:i,onClose:()=>{u(!1),s(null)},onPush:e=>{u(!1),s(null)}}),(0,wt.jsx)(Pt,{isOpen:d,onClose:()=>{f(!1),o(null),p(null)},title:"Application Error",message:l,details:m})]})},Mt=()=>((0,r.useEffect)((()=>{window.location.href="http://127.0.0.1:8000/"}),[]),null);const Rt=function(){const[e,t]=(0,r.useState)({task:"text-generation",model_name:"llama2-7b",compute_specs:"Standard GPU",num_train_epochs:3,lora_r:16,max_seq_length:512,use_4bit:!0,load_in_8bit:!1,bnb_4bit_compute_dtype:"nf4",bnb_4bit_use_quant_type:!1,use_nested_quant:!1,bnb_4bit_quant_type:"nf4",fp16:!1,bf16:!1,per_device_train_batch_size:2,per_device_eval_batch_size:2,learning_rate:2e-4,gradient_accumulation_steps:1,max_grad_norm:.3,warmup_ratio:.03,weight_decay:.001,gradient_checkpointing:!1,group_by_length:!1,packing:!1,optim:"paged_adamw_32bit",lr_scheduler_type:"cosine",max_steps:-1,hardware_config:{gpu:"",ram:0,disk:0,cpu_cores:0}});(0,r.useEffect)((()=>{console.log("Settings updated in App.js:",e)}),[e]);const n=e=>{console.log("Update triggered with:","function"===typeof e?"Function updater":e),t((t=>{const n="function"===typeof e?e(t):c(c({},t),e),r=JSON.parse(JSON.stringify(n));return console.log("Updating settings in App.js:",r),r}))};return(0,wt.jsx)(ft,{children:(0,wt.jsxs)("div",{className:"bg-[#1a202c] text-white min-h-screen",children:[(0,wt.jsx)(kt,{}),(0,wt.jsxs)(ze,{children:[(0,wt.jsx)(Pe,{path:"/",element:(0,wt.jsx)(jt,{})}),(0,wt.jsx)(Pe,{path:"/finetune/load_settings",element:(0,wt.jsx)(_t,{defaultValues:e,updateSettings:n})}),(0,wt.jsx)(Pe,{path:"/finetune/detect",element:(0,wt.jsx)(St,{currentSettings:e,updateSettings:n})}),(0,wt.jsx)(Pe,{path:"/app",element:(0,wt.jsx)(Mt,{})}),(0,wt.jsx)(Pe,{path:"/finetune/loading",element:(0,wt.jsx)(Ct,{})}),(0,wt.jsx)(Pe,{path:"/technical-details",element:(0,wt.jsx)(Et,{})}),(0,wt.jsx)(Pe,{path:"/models",element:(0,wt.jsx)(Tt,{})})]})]})})},Ot=e=>{e&&e instanceof Function&&n.e(453).then(n.bind(n,453)).then((t=>{let{getCLS:n,getFID:r,getFCP:a,getLCP:l,getTTFB:o}=t;n(e),r(e),a(e),l(e),o(e)}))};a.createRoot(document.getElementById("root")).render((0,wt.jsx)(r.StrictMode,{children:(0,wt.jsx)(Rt,{})})),Ot()})();
+(()=>{"use strict";var e={4:(e,t,n)=>{var r=n(853),a=n(43),l=n(950);function o(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function i(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function s(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function c(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function u(e){if(s(e)!==e)throw Error(o(188))}function d(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e;for(e=e.child;null!==e;){if(null!==(t=d(e)))return t;e=e.sibling}return null}var f=Object.assign,m=Symbol.for("react.element"),p=Symbol.for("react.transitional.element"),h=Symbol.for("react.portal"),g=Symbol.for("react.fragment"),v=Symbol.for("react.strict_mode"),b=Symbol.for("react.profiler"),y=Symbol.for("react.provider"),x=Symbol.for("react.consumer"),w=Symbol.for("react.context"),k=Symbol.for("react.forward_ref"),j=Symbol.for("react.suspense"),N=Symbol.for("react.suspense_list"),S=Symbol.for("react.memo"),_=Symbol.for("react.lazy");Symbol.for("react.scope");var C=Symbol.for("react.activity");Symbol.for("react.legacy_hidden"),Symbol.for("react.tracing_marker");var E=Symbol.for("react.memo_cache_sentinel");Symbol.for("react.view_transition");var P=Symbol.iterator;function L(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=P&&e[P]||e["@@iterator"])?e:null}var z=Symbol.for("react.client.reference");function T(e){if(null==e)return null;if("function"===typeof e)return e.$$typeof===z?null:e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case g:return"Fragment";case b:return"Profiler";case v:return"StrictMode";case j:return"Suspense";case N:return"SuspenseList";case C:return"Activity"}if("object"===typeof e)switch(e.$$typeof){case h:return"Portal";case w:return(e.displayName||"Context")+".Provider";case x:return(e._context.displayName||"Context")+".Consumer";case k:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case S:return null!==(t=e.displayName||null)?t:T(e.type)||"Memo";case _:t=e._payload,e=e._init;try{return T(e(t))}catch(n){}}return null}var M=Array.isArray,R=a.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,O=l.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,A={pending:!1,data:null,method:null,action:null},F=[],D=-1;function H(e){return{current:e}}function I(e){0>D||(e.current=F[D],F[D]=null,D--)}function U(e,t){D++,F[D]=e.current,e.current=t}var B=H(null),V=H(null),W=H(null),q=H(null);function $(e,t){switch(U(W,t),U(V,e),U(B,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?ad(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)e=ld(t=ad(t),e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}I(B),U(B,e)}function Q(){I(B),I(V),I(W)}function G(e){null!==e.memoizedState&&U(q,e);var t=B.current,n=ld(t,e.type);t!==n&&(U(V,e),U(B,n))}function Y(e){V.current===e&&(I(B),I(V)),q.current===e&&(I(q),Gd._currentValue=A)}var K=Object.prototype.hasOwnProperty,J=r.unstable_scheduleCallback,X=r.unstable_cancelCallback,Z=r.unstable_shouldYield,ee=r.unstable_requestPaint,te=r.unstable_now,ne=r.unstable_getCurrentPriorityLevel,re=r.unstable_ImmediatePriority,ae=r.unstable_UserBlockingPriority,le=r.unstable_NormalPriority,oe=r.unstable_LowPriority,ie=r.unstable_IdlePriority,se=r.log,ce=r.unstable_setDisableYieldValue,ue=null,de=null;function fe(e){if("function"===typeof se&&ce(e),de&&"function"===typeof de.setStrictMode)try{de.setStrictMode(ue,e)}catch(t){}}var me=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(pe(e)/he|0)|0},pe=Math.log,he=Math.LN2;var ge=256,ve=4194304;function be(e){var t=42&e;if(0!==t)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194048&e;case 4194304:case 8388608:case 16777216:case 33554432:return 62914560&e;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function ye(e,t,n){var r=e.pendingLanes;if(0===r)return 0;var a=0,l=e.suspendedLanes,o=e.pingedLanes;e=e.warmLanes;var i=134217727&r;return 0!==i?0!==(r=i&~l)?a=be(r):0!==(o&=i)?a=be(o):n||0!==(n=i&~e)&&(a=be(n)):0!==(i=r&~l)?a=be(i):0!==o?a=be(o):n||0!==(n=r&~e)&&(a=be(n)),0===a?0:0!==t&&t!==a&&0===(t&l)&&((l=a&-a)>=(n=t&-t)||32===l&&0!==(4194048&n))?t:a}function xe(e,t){return 0===(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)}function we(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function ke(){var e=ge;return 0===(4194048&(ge<<=1))&&(ge=256),e}function je(){var e=ve;return 0===(62914560&(ve<<=1))&&(ve=4194304),e}function Ne(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Se(e,t){e.pendingLanes|=t,268435456!==t&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function _e(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var r=31-me(t);e.entangledLanes|=t,e.entanglements[r]=1073741824|e.entanglements[r]|4194090&n}function Ce(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-me(n),a=1<<r;a&t|e[r]&t&&(e[r]|=t),n&=~a}}function Ee(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function Pe(e){return 2<(e&=-e)?8<e?0!==(134217727&e)?32:268435456:8:2}function Le(){var e=O.p;return 0!==e?e:void 0===(e=window.event)?32:uf(e.type)}var ze=Math.random().toString(36).slice(2),Te="__reactFiber$"+ze,Me="__reactProps$"+ze,Re="__reactContainer$"+ze,Oe="__reactEvents$"+ze,Ae="__reactListeners$"+ze,Fe="__reactHandles$"+ze,De="__reactResources$"+ze,He="__reactMarker$"+ze;function Ie(e){delete e[Te],delete e[Me],delete e[Oe],delete e[Ae],delete e[Fe]}function Ue(e){var t=e[Te];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Re]||n[Te]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=yd(e);null!==e;){if(n=e[Te])return n;e=yd(e)}return t}n=(e=n).parentNode}return null}function Be(e){if(e=e[Te]||e[Re]){var t=e.tag;if(5===t||6===t||13===t||26===t||27===t||3===t)return e}return null}function Ve(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e.stateNode;throw Error(o(33))}function We(e){var t=e[De];return t||(t=e[De]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function qe(e){e[He]=!0}var $e=new Set,Qe={};function Ge(e,t){Ye(e,t),Ye(e+"Capture",t)}function Ye(e,t){for(Qe[e]=t,e=0;e<t.length;e++)$e.add(t[e])}var Ke,Je,Xe=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Ze={},et={};function tt(e,t,n){if(a=t,K.call(et,a)||!K.call(Ze,a)&&(Xe.test(a)?et[a]=!0:(Ze[a]=!0,0)))if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":return void e.removeAttribute(t);case"boolean":var r=t.toLowerCase().slice(0,5);if("data-"!==r&&"aria-"!==r)return void e.removeAttribute(t)}e.setAttribute(t,""+n)}var a}function nt(e,t,n){if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(t)}e.setAttribute(t,""+n)}}function rt(e,t,n,r){if(null===r)e.removeAttribute(n);else{switch(typeof r){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(n)}e.setAttributeNS(t,n,""+r)}}function at(e){if(void 0===Ke)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ke=t&&t[1]||"",Je=-1<n.stack.indexOf("\n    at")?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return"\n"+Ke+e+Je}var lt=!1;function ot(e,t){if(!e||lt)return"";lt=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var r={DetermineComponentFrameRoot:function(){try{if(t){var n=function(){throw Error()};if(Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(a){var r=a}Reflect.construct(e,[],n)}else{try{n.call()}catch(l){r=l}e.call(n.prototype)}}else{try{throw Error()}catch(o){r=o}(n=e())&&"function"===typeof n.catch&&n.catch((function(){}))}}catch(i){if(i&&r&&"string"===typeof i.stack)return[i.stack,r.stack]}return[null,null]}};r.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var a=Object.getOwnPropertyDescriptor(r.DetermineComponentFrameRoot,"name");a&&a.configurable&&Object.defineProperty(r.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var l=r.DetermineComponentFrameRoot(),o=l[0],i=l[1];if(o&&i){var s=o.split("\n"),c=i.split("\n");for(a=r=0;r<s.length&&!s[r].includes("DetermineComponentFrameRoot");)r++;for(;a<c.length&&!c[a].includes("DetermineComponentFrameRoot");)a++;if(r===s.length||a===c.length)for(r=s.length-1,a=c.length-1;1<=r&&0<=a&&s[r]!==c[a];)a--;for(;1<=r&&0<=a;r--,a--)if(s[r]!==c[a]){if(1!==r||1!==a)do{if(r--,0>--a||s[r]!==c[a]){var u="\n"+s[r].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}}while(1<=r&&0<=a);break}}}finally{lt=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?at(n):""}function it(e){switch(e.tag){case 26:case 27:case 5:return at(e.type);case 16:return at("Lazy");case 13:return at("Suspense");case 19:return at("SuspenseList");case 0:case 15:return ot(e.type,!1);case 11:return ot(e.type.render,!1);case 1:return ot(e.type,!0);case 31:return at("Activity");default:return""}}function st(e){try{var t="";do{t+=it(e),e=e.return}while(e);return t}catch(n){return"\nError generating stack: "+n.message+"\n"+n.stack}}function ct(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function ut(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function dt(e){e._valueTracker||(e._valueTracker=function(e){var t=ut(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var a=n.get,l=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return a.call(this)},set:function(e){r=""+e,l.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function ft(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ut(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function mt(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}var pt=/[\n"\\]/g;function ht(e){return e.replace(pt,(function(e){return"\\"+e.charCodeAt(0).toString(16)+" "}))}function gt(e,t,n,r,a,l,o,i){e.name="",null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o?e.type=o:e.removeAttribute("type"),null!=t?"number"===o?(0===t&&""===e.value||e.value!=t)&&(e.value=""+ct(t)):e.value!==""+ct(t)&&(e.value=""+ct(t)):"submit"!==o&&"reset"!==o||e.removeAttribute("value"),null!=t?bt(e,o,ct(t)):null!=n?bt(e,o,ct(n)):null!=r&&e.removeAttribute("value"),null==a&&null!=l&&(e.defaultChecked=!!l),null!=a&&(e.checked=a&&"function"!==typeof a&&"symbol"!==typeof a),null!=i&&"function"!==typeof i&&"symbol"!==typeof i&&"boolean"!==typeof i?e.name=""+ct(i):e.removeAttribute("name")}function vt(e,t,n,r,a,l,o,i){if(null!=l&&"function"!==typeof l&&"symbol"!==typeof l&&"boolean"!==typeof l&&(e.type=l),null!=t||null!=n){if(!("submit"!==l&&"reset"!==l||void 0!==t&&null!==t))return;n=null!=n?""+ct(n):"",t=null!=t?""+ct(t):n,i||t===e.value||(e.value=t),e.defaultValue=t}r="function"!==typeof(r=null!=r?r:a)&&"symbol"!==typeof r&&!!r,e.checked=i?e.checked:!!r,e.defaultChecked=!!r,null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o&&(e.name=o)}function bt(e,t,n){"number"===t&&mt(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function yt(e,t,n,r){if(e=e.options,t){t={};for(var a=0;a<n.length;a++)t["$"+n[a]]=!0;for(n=0;n<e.length;n++)a=t.hasOwnProperty("$"+e[n].value),e[n].selected!==a&&(e[n].selected=a),a&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ct(n),t=null,a=0;a<e.length;a++){if(e[a].value===n)return e[a].selected=!0,void(r&&(e[a].defaultSelected=!0));null!==t||e[a].disabled||(t=e[a])}null!==t&&(t.selected=!0)}}function xt(e,t,n){null==t||((t=""+ct(t))!==e.value&&(e.value=t),null!=n)?e.defaultValue=null!=n?""+ct(n):"":e.defaultValue!==t&&(e.defaultValue=t)}function wt(e,t,n,r){if(null==t){if(null!=r){if(null!=n)throw Error(o(92));if(M(r)){if(1<r.length)throw Error(o(93));r=r[0]}n=r}null==n&&(n=""),t=n}n=ct(t),e.defaultValue=n,(r=e.textContent)===n&&""!==r&&null!==r&&(e.value=r)}function kt(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var jt=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Nt(e,t,n){var r=0===t.indexOf("--");null==n||"boolean"===typeof n||""===n?r?e.setProperty(t,""):"float"===t?e.cssFloat="":e[t]="":r?e.setProperty(t,n):"number"!==typeof n||0===n||jt.has(t)?"float"===t?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function St(e,t,n){if(null!=t&&"object"!==typeof t)throw Error(o(62));if(e=e.style,null!=n){for(var r in n)!n.hasOwnProperty(r)||null!=t&&t.hasOwnProperty(r)||(0===r.indexOf("--")?e.setProperty(r,""):"float"===r?e.cssFloat="":e[r]="");for(var a in t)r=t[a],t.hasOwnProperty(a)&&n[a]!==r&&Nt(e,a,r)}else for(var l in t)t.hasOwnProperty(l)&&Nt(e,l,t[l])}function _t(e){if(-1===e.indexOf("-"))return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Ct=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Et=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Pt(e){return Et.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var Lt=null;function zt(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Tt=null,Mt=null;function Rt(e){var t=Be(e);if(t&&(e=t.stateNode)){var n=e[Me]||null;e:switch(e=t.stateNode,t.type){case"input":if(gt(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+ht(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var a=r[Me]||null;if(!a)throw Error(o(90));gt(r,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name)}}for(t=0;t<n.length;t++)(r=n[t]).form===e.form&&ft(r)}break e;case"textarea":xt(e,n.value,n.defaultValue);break e;case"select":null!=(t=n.value)&&yt(e,!!n.multiple,t,!1)}}}var Ot=!1;function At(e,t,n){if(Ot)return e(t,n);Ot=!0;try{return e(t)}finally{if(Ot=!1,(null!==Tt||null!==Mt)&&(Uc(),Tt&&(t=Tt,e=Mt,Mt=Tt=null,Rt(t),e)))for(t=0;t<e.length;t++)Rt(e[t])}}function Ft(e,t){var n=e.stateNode;if(null===n)return null;var r=n[Me]||null;if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(o(231,t,typeof n));return n}var Dt=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),Ht=!1;if(Dt)try{var It={};Object.defineProperty(It,"passive",{get:function(){Ht=!0}}),window.addEventListener("test",It,It),window.removeEventListener("test",It,It)}catch(Rf){Ht=!1}var Ut=null,Bt=null,Vt=null;function Wt(){if(Vt)return Vt;var e,t,n=Bt,r=n.length,a="value"in Ut?Ut.value:Ut.textContent,l=a.length;for(e=0;e<r&&n[e]===a[e];e++);var o=r-e;for(t=1;t<=o&&n[r-t]===a[l-t];t++);return Vt=a.slice(e,1<t?1-t:void 0)}function qt(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function $t(){return!0}function Qt(){return!1}function Gt(e){function t(t,n,r,a,l){for(var o in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=a,this.target=l,this.currentTarget=null,e)e.hasOwnProperty(o)&&(t=e[o],this[o]=t?t(a):a[o]);return this.isDefaultPrevented=(null!=a.defaultPrevented?a.defaultPrevented:!1===a.returnValue)?$t:Qt,this.isPropagationStopped=Qt,this}return f(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=$t)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=$t)},persist:function(){},isPersistent:$t}),t}var Yt,Kt,Jt,Xt={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Zt=Gt(Xt),en=f({},Xt,{view:0,detail:0}),tn=Gt(en),nn=f({},en,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:pn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Jt&&(Jt&&"mousemove"===e.type?(Yt=e.screenX-Jt.screenX,Kt=e.screenY-Jt.screenY):Kt=Yt=0,Jt=e),Yt)},movementY:function(e){return"movementY"in e?e.movementY:Kt}}),rn=Gt(nn),an=Gt(f({},nn,{dataTransfer:0})),ln=Gt(f({},en,{relatedTarget:0})),on=Gt(f({},Xt,{animationName:0,elapsedTime:0,pseudoElement:0})),sn=Gt(f({},Xt,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),cn=Gt(f({},Xt,{data:0})),un={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},dn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function mn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=fn[e])&&!!t[e]}function pn(){return mn}var hn=Gt(f({},en,{key:function(e){if(e.key){var t=un[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=qt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?dn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:pn,charCode:function(e){return"keypress"===e.type?qt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?qt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),gn=Gt(f({},nn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),vn=Gt(f({},en,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:pn})),bn=Gt(f({},Xt,{propertyName:0,elapsedTime:0,pseudoElement:0})),yn=Gt(f({},nn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),xn=Gt(f({},Xt,{newState:0,oldState:0})),wn=[9,13,27,32],kn=Dt&&"CompositionEvent"in window,jn=null;Dt&&"documentMode"in document&&(jn=document.documentMode);var Nn=Dt&&"TextEvent"in window&&!jn,Sn=Dt&&(!kn||jn&&8<jn&&11>=jn),_n=String.fromCharCode(32),Cn=!1;function En(e,t){switch(e){case"keyup":return-1!==wn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Pn(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var Ln=!1;var zn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Tn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!zn[e.type]:"textarea"===t}function Mn(e,t,n,r){Tt?Mt?Mt.push(r):Mt=[r]:Tt=r,0<(t=Wu(t,"onChange")).length&&(n=new Zt("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Rn=null,On=null;function An(e){Au(e,0)}function Fn(e){if(ft(Ve(e)))return e}function Dn(e,t){if("change"===e)return t}var Hn=!1;if(Dt){var In;if(Dt){var Un="oninput"in document;if(!Un){var Bn=document.createElement("div");Bn.setAttribute("oninput","return;"),Un="function"===typeof Bn.oninput}In=Un}else In=!1;Hn=In&&(!document.documentMode||9<document.documentMode)}function Vn(){Rn&&(Rn.detachEvent("onpropertychange",Wn),On=Rn=null)}function Wn(e){if("value"===e.propertyName&&Fn(On)){var t=[];Mn(t,On,e,zt(e)),At(An,t)}}function qn(e,t,n){"focusin"===e?(Vn(),On=n,(Rn=t).attachEvent("onpropertychange",Wn)):"focusout"===e&&Vn()}function $n(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Fn(On)}function Qn(e,t){if("click"===e)return Fn(t)}function Gn(e,t){if("input"===e||"change"===e)return Fn(t)}var Yn="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function Kn(e,t){if(Yn(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var a=n[r];if(!K.call(t,a)||!Yn(e[a],t[a]))return!1}return!0}function Jn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Xn(e,t){var n,r=Jn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Jn(r)}}function Zn(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?Zn(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function er(e){for(var t=mt((e=null!=e&&null!=e.ownerDocument&&null!=e.ownerDocument.defaultView?e.ownerDocument.defaultView:window).document);t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=mt((e=t.contentWindow).document)}return t}function tr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var nr=Dt&&"documentMode"in document&&11>=document.documentMode,rr=null,ar=null,lr=null,or=!1;function ir(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;or||null==rr||rr!==mt(r)||("selectionStart"in(r=rr)&&tr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},lr&&Kn(lr,r)||(lr=r,0<(r=Wu(ar,"onSelect")).length&&(t=new Zt("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=rr)))}function sr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var cr={animationend:sr("Animation","AnimationEnd"),animationiteration:sr("Animation","AnimationIteration"),animationstart:sr("Animation","AnimationStart"),transitionrun:sr("Transition","TransitionRun"),transitionstart:sr("Transition","TransitionStart"),transitioncancel:sr("Transition","TransitionCancel"),transitionend:sr("Transition","TransitionEnd")},ur={},dr={};function fr(e){if(ur[e])return ur[e];if(!cr[e])return e;var t,n=cr[e];for(t in n)if(n.hasOwnProperty(t)&&t in dr)return ur[e]=n[t];return e}Dt&&(dr=document.createElement("div").style,"AnimationEvent"in window||(delete cr.animationend.animation,delete cr.animationiteration.animation,delete cr.animationstart.animation),"TransitionEvent"in window||delete cr.transitionend.transition);var mr=fr("animationend"),pr=fr("animationiteration"),hr=fr("animationstart"),gr=fr("transitionrun"),vr=fr("transitionstart"),br=fr("transitioncancel"),yr=fr("transitionend"),xr=new Map,wr="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function kr(e,t){xr.set(e,t),Ge(t,[e])}wr.push("scrollEnd");var jr=new WeakMap;function Nr(e,t){if("object"===typeof e&&null!==e){var n=jr.get(e);return void 0!==n?n:(t={value:e,source:t,stack:st(t)},jr.set(e,t),t)}return{value:e,source:t,stack:st(t)}}var Sr=[],_r=0,Cr=0;function Er(){for(var e=_r,t=Cr=_r=0;t<e;){var n=Sr[t];Sr[t++]=null;var r=Sr[t];Sr[t++]=null;var a=Sr[t];Sr[t++]=null;var l=Sr[t];if(Sr[t++]=null,null!==r&&null!==a){var o=r.pending;null===o?a.next=a:(a.next=o.next,o.next=a),r.pending=a}0!==l&&Tr(n,a,l)}}function Pr(e,t,n,r){Sr[_r++]=e,Sr[_r++]=t,Sr[_r++]=n,Sr[_r++]=r,Cr|=r,e.lanes|=r,null!==(e=e.alternate)&&(e.lanes|=r)}function Lr(e,t,n,r){return Pr(e,t,n,r),Mr(e)}function zr(e,t){return Pr(e,null,null,t),Mr(e)}function Tr(e,t,n){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n);for(var a=!1,l=e.return;null!==l;)l.childLanes|=n,null!==(r=l.alternate)&&(r.childLanes|=n),22===l.tag&&(null===(e=l.stateNode)||1&e._visibility||(a=!0)),e=l,l=l.return;return 3===e.tag?(l=e.stateNode,a&&null!==t&&(a=31-me(n),null===(r=(e=l.hiddenUpdates)[a])?e[a]=[t]:r.push(t),t.lane=536870912|n),l):null}function Mr(e){if(50<Tc)throw Tc=0,Mc=null,Error(o(185));for(var t=e.return;null!==t;)t=(e=t).return;return 3===e.tag?e.stateNode:null}var Rr={};function Or(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ar(e,t,n,r){return new Or(e,t,n,r)}function Fr(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Dr(e,t){var n=e.alternate;return null===n?((n=Ar(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=65011712&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function Hr(e,t){e.flags&=65011714;var n=e.alternate;return null===n?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Ir(e,t,n,r,a,l){var i=0;if(r=e,"function"===typeof e)Fr(e)&&(i=1);else if("string"===typeof e)i=function(e,t,n){if(1===n||null!=t.itemProp)return!1;switch(e){case"meta":case"title":return!0;case"style":if("string"!==typeof t.precedence||"string"!==typeof t.href||""===t.href)break;return!0;case"link":if("string"!==typeof t.rel||"string"!==typeof t.href||""===t.href||t.onLoad||t.onError)break;return"stylesheet"!==t.rel||(e=t.disabled,"string"===typeof t.precedence&&null==e);case"script":if(t.async&&"function"!==typeof t.async&&"symbol"!==typeof t.async&&!t.onLoad&&!t.onError&&t.src&&"string"===typeof t.src)return!0}return!1}(e,n,B.current)?26:"html"===e||"head"===e||"body"===e?27:5;else e:switch(e){case C:return(e=Ar(31,n,t,a)).elementType=C,e.lanes=l,e;case g:return Ur(n.children,a,l,t);case v:i=8,a|=24;break;case b:return(e=Ar(12,n,t,2|a)).elementType=b,e.lanes=l,e;case j:return(e=Ar(13,n,t,a)).elementType=j,e.lanes=l,e;case N:return(e=Ar(19,n,t,a)).elementType=N,e.lanes=l,e;default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case y:case w:i=10;break e;case x:i=9;break e;case k:i=11;break e;case S:i=14;break e;case _:i=16,r=null;break e}i=29,n=Error(o(130,null===e?"null":typeof e,"")),r=null}return(t=Ar(i,n,t,a)).elementType=e,t.type=r,t.lanes=l,t}function Ur(e,t,n,r){return(e=Ar(7,e,r,t)).lanes=n,e}function Br(e,t,n){return(e=Ar(6,e,null,t)).lanes=n,e}function Vr(e,t,n){return(t=Ar(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var Wr=[],qr=0,$r=null,Qr=0,Gr=[],Yr=0,Kr=null,Jr=1,Xr="";function Zr(e,t){Wr[qr++]=Qr,Wr[qr++]=$r,$r=e,Qr=t}function ea(e,t,n){Gr[Yr++]=Jr,Gr[Yr++]=Xr,Gr[Yr++]=Kr,Kr=e;var r=Jr;e=Xr;var a=32-me(r)-1;r&=~(1<<a),n+=1;var l=32-me(t)+a;if(30<l){var o=a-a%5;l=(r&(1<<o)-1).toString(32),r>>=o,a-=o,Jr=1<<32-me(t)+a|n<<a|r,Xr=l+e}else Jr=1<<l|n<<a|r,Xr=e}function ta(e){null!==e.return&&(Zr(e,1),ea(e,1,0))}function na(e){for(;e===$r;)$r=Wr[--qr],Wr[qr]=null,Qr=Wr[--qr],Wr[qr]=null;for(;e===Kr;)Kr=Gr[--Yr],Gr[Yr]=null,Xr=Gr[--Yr],Gr[Yr]=null,Jr=Gr[--Yr],Gr[Yr]=null}var ra=null,aa=null,la=!1,oa=null,ia=!1,sa=Error(o(519));function ca(e){throw ha(Nr(Error(o(418,"")),e)),sa}function ua(e){var t=e.stateNode,n=e.type,r=e.memoizedProps;switch(t[Te]=e,t[Me]=r,n){case"dialog":Fu("cancel",t),Fu("close",t);break;case"iframe":case"object":case"embed":Fu("load",t);break;case"video":case"audio":for(n=0;n<Ru.length;n++)Fu(Ru[n],t);break;case"source":Fu("error",t);break;case"img":case"image":case"link":Fu("error",t),Fu("load",t);break;case"details":Fu("toggle",t);break;case"input":Fu("invalid",t),vt(t,r.value,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name,!0),dt(t);break;case"select":Fu("invalid",t);break;case"textarea":Fu("invalid",t),wt(t,r.value,r.defaultValue,r.children),dt(t)}"string"!==typeof(n=r.children)&&"number"!==typeof n&&"bigint"!==typeof n||t.textContent===""+n||!0===r.suppressHydrationWarning||Ku(t.textContent,n)?(null!=r.popover&&(Fu("beforetoggle",t),Fu("toggle",t)),null!=r.onScroll&&Fu("scroll",t),null!=r.onScrollEnd&&Fu("scrollend",t),null!=r.onClick&&(t.onclick=Ju),t=!0):t=!1,t||ca(e)}function da(e){for(ra=e.return;ra;)switch(ra.tag){case 5:case 13:return void(ia=!1);case 27:case 3:return void(ia=!0);default:ra=ra.return}}function fa(e){if(e!==ra)return!1;if(!la)return da(e),la=!0,!1;var t,n=e.tag;if((t=3!==n&&27!==n)&&((t=5===n)&&(t=!("form"!==(t=e.type)&&"button"!==t)||od(e.type,e.memoizedProps)),t=!t),t&&aa&&ca(e),da(e),13===n){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType)if("/$"===(t=e.data)){if(0===n){aa=vd(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++;e=e.nextSibling}aa=null}}else 27===n?(n=aa,md(e.type)?(e=bd,bd=null,aa=e):aa=n):aa=ra?vd(e.stateNode.nextSibling):null;return!0}function ma(){aa=ra=null,la=!1}function pa(){var e=oa;return null!==e&&(null===yc?yc=e:yc.push.apply(yc,e),oa=null),e}function ha(e){null===oa?oa=[e]:oa.push(e)}var ga=H(null),va=null,ba=null;function ya(e,t,n){U(ga,t._currentValue),t._currentValue=n}function xa(e){e._currentValue=ga.current,I(ga)}function wa(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function ka(e,t,n,r){var a=e.child;for(null!==a&&(a.return=e);null!==a;){var l=a.dependencies;if(null!==l){var i=a.child;l=l.firstContext;e:for(;null!==l;){var s=l;l=a;for(var c=0;c<t.length;c++)if(s.context===t[c]){l.lanes|=n,null!==(s=l.alternate)&&(s.lanes|=n),wa(l.return,n,e),r||(i=null);break e}l=s.next}}else if(18===a.tag){if(null===(i=a.return))throw Error(o(341));i.lanes|=n,null!==(l=i.alternate)&&(l.lanes|=n),wa(i,n,e),i=null}else i=a.child;if(null!==i)i.return=a;else for(i=a;null!==i;){if(i===e){i=null;break}if(null!==(a=i.sibling)){a.return=i.return,i=a;break}i=i.return}a=i}}function ja(e,t,n,r){e=null;for(var a=t,l=!1;null!==a;){if(!l)if(0!==(524288&a.flags))l=!0;else if(0!==(262144&a.flags))break;if(10===a.tag){var i=a.alternate;if(null===i)throw Error(o(387));if(null!==(i=i.memoizedProps)){var s=a.type;Yn(a.pendingProps.value,i.value)||(null!==e?e.push(s):e=[s])}}else if(a===q.current){if(null===(i=a.alternate))throw Error(o(387));i.memoizedState.memoizedState!==a.memoizedState.memoizedState&&(null!==e?e.push(Gd):e=[Gd])}a=a.return}null!==e&&ka(t,e,n,r),t.flags|=262144}function Na(e){for(e=e.firstContext;null!==e;){if(!Yn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Sa(e){va=e,ba=null,null!==(e=e.dependencies)&&(e.firstContext=null)}function _a(e){return Ea(va,e)}function Ca(e,t){return null===va&&Sa(e),Ea(e,t)}function Ea(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},null===ba){if(null===e)throw Error(o(308));ba=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else ba=ba.next=t;return n}var Pa="undefined"!==typeof AbortController?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(t,n){e.push(n)}};this.abort=function(){t.aborted=!0,e.forEach((function(e){return e()}))}},La=r.unstable_scheduleCallback,za=r.unstable_NormalPriority,Ta={$$typeof:w,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Ma(){return{controller:new Pa,data:new Map,refCount:0}}function Ra(e){e.refCount--,0===e.refCount&&La(za,(function(){e.controller.abort()}))}var Oa=null,Aa=0,Fa=0,Da=null;function Ha(){if(0===--Aa&&null!==Oa){null!==Da&&(Da.status="fulfilled");var e=Oa;Oa=null,Fa=0,Da=null;for(var t=0;t<e.length;t++)(0,e[t])()}}var Ia=R.S;R.S=function(e,t){"object"===typeof t&&null!==t&&"function"===typeof t.then&&function(e,t){if(null===Oa){var n=Oa=[];Aa=0,Fa=Pu(),Da={status:"pending",value:void 0,then:function(e){n.push(e)}}}Aa++,t.then(Ha,Ha)}(0,t),null!==Ia&&Ia(e,t)};var Ua=H(null);function Ba(){var e=Ua.current;return null!==e?e:rc.pooledCache}function Va(e,t){U(Ua,null===t?Ua.current:t.pool)}function Wa(){var e=Ba();return null===e?null:{parent:Ta._currentValue,pool:e}}var qa=Error(o(460)),$a=Error(o(474)),Qa=Error(o(542)),Ga={then:function(){}};function Ya(e){return"fulfilled"===(e=e.status)||"rejected"===e}function Ka(){}function Ja(e,t,n){switch(void 0===(n=e[n])?e.push(t):n!==t&&(t.then(Ka,Ka),t=n),t.status){case"fulfilled":return t.value;case"rejected":throw el(e=t.reason),e;default:if("string"===typeof t.status)t.then(Ka,Ka);else{if(null!==(e=rc)&&100<e.shellSuspendCounter)throw Error(o(482));(e=t).status="pending",e.then((function(e){if("pending"===t.status){var n=t;n.status="fulfilled",n.value=e}}),(function(e){if("pending"===t.status){var n=t;n.status="rejected",n.reason=e}}))}switch(t.status){case"fulfilled":return t.value;case"rejected":throw el(e=t.reason),e}throw Xa=t,qa}}var Xa=null;function Za(){if(null===Xa)throw Error(o(459));var e=Xa;return Xa=null,e}function el(e){if(e===qa||e===Qa)throw Error(o(483))}var tl=!1;function nl(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function rl(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function al(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function ll(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&nc)){var a=r.pending;return null===a?t.next=t:(t.next=a.next,a.next=t),r.pending=t,t=Mr(e),Tr(e,null,n),t}return Pr(e,r,t,n),Mr(e)}function ol(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194048&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ce(e,n)}}function il(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var a=null,l=null;if(null!==(n=n.firstBaseUpdate)){do{var o={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};null===l?a=l=o:l=l.next=o,n=n.next}while(null!==n);null===l?a=l=t:l=l.next=t}else a=l=t;return n={baseState:r.baseState,firstBaseUpdate:a,lastBaseUpdate:l,shared:r.shared,callbacks:r.callbacks},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var sl=!1;function cl(){if(sl){if(null!==Da)throw Da}}function ul(e,t,n,r){sl=!1;var a=e.updateQueue;tl=!1;var l=a.firstBaseUpdate,o=a.lastBaseUpdate,i=a.shared.pending;if(null!==i){a.shared.pending=null;var s=i,c=s.next;s.next=null,null===o?l=c:o.next=c,o=s;var u=e.alternate;null!==u&&((i=(u=u.updateQueue).lastBaseUpdate)!==o&&(null===i?u.firstBaseUpdate=c:i.next=c,u.lastBaseUpdate=s))}if(null!==l){var d=a.baseState;for(o=0,u=c=s=null,i=l;;){var m=-536870913&i.lane,p=m!==i.lane;if(p?(lc&m)===m:(r&m)===m){0!==m&&m===Fa&&(sl=!0),null!==u&&(u=u.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});e:{var h=e,g=i;m=t;var v=n;switch(g.tag){case 1:if("function"===typeof(h=g.payload)){d=h.call(v,d,m);break e}d=h;break e;case 3:h.flags=-65537&h.flags|128;case 0:if(null===(m="function"===typeof(h=g.payload)?h.call(v,d,m):h)||void 0===m)break e;d=f({},d,m);break e;case 2:tl=!0}}null!==(m=i.callback)&&(e.flags|=64,p&&(e.flags|=8192),null===(p=a.callbacks)?a.callbacks=[m]:p.push(m))}else p={lane:m,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===u?(c=u=p,s=d):u=u.next=p,o|=m;if(null===(i=i.next)){if(null===(i=a.shared.pending))break;i=(p=i).next,p.next=null,a.lastBaseUpdate=p,a.shared.pending=null}}null===u&&(s=d),a.baseState=s,a.firstBaseUpdate=c,a.lastBaseUpdate=u,null===l&&(a.shared.lanes=0),mc|=o,e.lanes=o,e.memoizedState=d}}function dl(e,t){if("function"!==typeof e)throw Error(o(191,e));e.call(t)}function fl(e,t){var n=e.callbacks;if(null!==n)for(e.callbacks=null,e=0;e<n.length;e++)dl(n[e],t)}var ml=H(null),pl=H(0);function hl(e,t){U(pl,e=dc),U(ml,t),dc=e|t.baseLanes}function gl(){U(pl,dc),U(ml,ml.current)}function vl(){dc=pl.current,I(ml),I(pl)}var bl=0,yl=null,xl=null,wl=null,kl=!1,jl=!1,Nl=!1,Sl=0,_l=0,Cl=null,El=0;function Pl(){throw Error(o(321))}function Ll(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Yn(e[n],t[n]))return!1;return!0}function zl(e,t,n,r,a,l){return bl=l,yl=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,R.H=null===e||null===e.memoizedState?$o:Qo,Nl=!1,l=n(r,a),Nl=!1,jl&&(l=Ml(t,n,r,a)),Tl(e),l}function Tl(e){R.H=qo;var t=null!==xl&&null!==xl.next;if(bl=0,wl=xl=yl=null,kl=!1,_l=0,Cl=null,t)throw Error(o(300));null===e||Ci||null!==(e=e.dependencies)&&Na(e)&&(Ci=!0)}function Ml(e,t,n,r){yl=e;var a=0;do{if(jl&&(Cl=null),_l=0,jl=!1,25<=a)throw Error(o(301));if(a+=1,wl=xl=null,null!=e.updateQueue){var l=e.updateQueue;l.lastEffect=null,l.events=null,l.stores=null,null!=l.memoCache&&(l.memoCache.index=0)}R.H=Go,l=t(n,r)}while(jl);return l}function Rl(){var e=R.H,t=e.useState()[0];return t="function"===typeof t.then?Il(t):t,e=e.useState()[0],(null!==xl?xl.memoizedState:null)!==e&&(yl.flags|=1024),t}function Ol(){var e=0!==Sl;return Sl=0,e}function Al(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function Fl(e){if(kl){for(e=e.memoizedState;null!==e;){var t=e.queue;null!==t&&(t.pending=null),e=e.next}kl=!1}bl=0,wl=xl=yl=null,jl=!1,_l=Sl=0,Cl=null}function Dl(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===wl?yl.memoizedState=wl=e:wl=wl.next=e,wl}function Hl(){if(null===xl){var e=yl.alternate;e=null!==e?e.memoizedState:null}else e=xl.next;var t=null===wl?yl.memoizedState:wl.next;if(null!==t)wl=t,xl=e;else{if(null===e){if(null===yl.alternate)throw Error(o(467));throw Error(o(310))}e={memoizedState:(xl=e).memoizedState,baseState:xl.baseState,baseQueue:xl.baseQueue,queue:xl.queue,next:null},null===wl?yl.memoizedState=wl=e:wl=wl.next=e}return wl}function Il(e){var t=_l;return _l+=1,null===Cl&&(Cl=[]),e=Ja(Cl,e,t),t=yl,null===(null===wl?t.memoizedState:wl.next)&&(t=t.alternate,R.H=null===t||null===t.memoizedState?$o:Qo),e}function Ul(e){if(null!==e&&"object"===typeof e){if("function"===typeof e.then)return Il(e);if(e.$$typeof===w)return _a(e)}throw Error(o(438,String(e)))}function Bl(e){var t=null,n=yl.updateQueue;if(null!==n&&(t=n.memoCache),null==t){var r=yl.alternate;null!==r&&(null!==(r=r.updateQueue)&&(null!=(r=r.memoCache)&&(t={data:r.data.map((function(e){return e.slice()})),index:0})))}if(null==t&&(t={data:[],index:0}),null===n&&(n={lastEffect:null,events:null,stores:null,memoCache:null},yl.updateQueue=n),n.memoCache=t,void 0===(n=t.data[t.index]))for(n=t.data[t.index]=Array(e),r=0;r<e;r++)n[r]=E;return t.index++,n}function Vl(e,t){return"function"===typeof t?t(e):t}function Wl(e){return ql(Hl(),xl,e)}function ql(e,t,n){var r=e.queue;if(null===r)throw Error(o(311));r.lastRenderedReducer=n;var a=e.baseQueue,l=r.pending;if(null!==l){if(null!==a){var i=a.next;a.next=l.next,l.next=i}t.baseQueue=a=l,r.pending=null}if(l=e.baseState,null===a)e.memoizedState=l;else{var s=i=null,c=null,u=t=a.next,d=!1;do{var f=-536870913&u.lane;if(f!==u.lane?(lc&f)===f:(bl&f)===f){var m=u.revertLane;if(0===m)null!==c&&(c=c.next={lane:0,revertLane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),f===Fa&&(d=!0);else{if((bl&m)===m){u=u.next,m===Fa&&(d=!0);continue}f={lane:0,revertLane:u.revertLane,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null},null===c?(s=c=f,i=l):c=c.next=f,yl.lanes|=m,mc|=m}f=u.action,Nl&&n(l,f),l=u.hasEagerState?u.eagerState:n(l,f)}else m={lane:f,revertLane:u.revertLane,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null},null===c?(s=c=m,i=l):c=c.next=m,yl.lanes|=f,mc|=f;u=u.next}while(null!==u&&u!==t);if(null===c?i=l:c.next=s,!Yn(l,e.memoizedState)&&(Ci=!0,d&&null!==(n=Da)))throw n;e.memoizedState=l,e.baseState=i,e.baseQueue=c,r.lastRenderedState=l}return null===a&&(r.lanes=0),[e.memoizedState,r.dispatch]}function $l(e){var t=Hl(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,a=n.pending,l=t.memoizedState;if(null!==a){n.pending=null;var i=a=a.next;do{l=e(l,i.action),i=i.next}while(i!==a);Yn(l,t.memoizedState)||(Ci=!0),t.memoizedState=l,null===t.baseQueue&&(t.baseState=l),n.lastRenderedState=l}return[l,r]}function Ql(e,t,n){var r=yl,a=Hl(),l=la;if(l){if(void 0===n)throw Error(o(407));n=n()}else n=t();var i=!Yn((xl||a).memoizedState,n);if(i&&(a.memoizedState=n,Ci=!0),a=a.queue,vo(2048,8,Kl.bind(null,r,a,e),[e]),a.getSnapshot!==t||i||null!==wl&&1&wl.memoizedState.tag){if(r.flags|=2048,po(9,{destroy:void 0,resource:void 0},Yl.bind(null,r,a,n,t),null),null===rc)throw Error(o(349));l||0!==(124&bl)||Gl(r,t,n)}return n}function Gl(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=yl.updateQueue)?(t={lastEffect:null,events:null,stores:null,memoCache:null},yl.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Yl(e,t,n,r){t.value=n,t.getSnapshot=r,Jl(t)&&Xl(e)}function Kl(e,t,n){return n((function(){Jl(t)&&Xl(e)}))}function Jl(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Yn(e,n)}catch(r){return!0}}function Xl(e){var t=zr(e,2);null!==t&&Ac(t,e,2)}function Zl(e){var t=Dl();if("function"===typeof e){var n=e;if(e=n(),Nl){fe(!0);try{n()}finally{fe(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Vl,lastRenderedState:e},t}function eo(e,t,n,r){return e.baseState=n,ql(e,xl,"function"===typeof r?r:Vl)}function to(e,t,n,r,a){if(Bo(e))throw Error(o(485));if(null!==(e=t.action)){var l={payload:a,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(e){l.listeners.push(e)}};null!==R.T?n(!0):l.isTransition=!1,r(l),null===(n=t.pending)?(l.next=t.pending=l,no(t,l)):(l.next=n.next,t.pending=n.next=l)}}function no(e,t){var n=t.action,r=t.payload,a=e.state;if(t.isTransition){var l=R.T,o={};R.T=o;try{var i=n(a,r),s=R.S;null!==s&&s(o,i),ro(e,t,i)}catch(c){lo(e,t,c)}finally{R.T=l}}else try{ro(e,t,l=n(a,r))}catch(u){lo(e,t,u)}}function ro(e,t,n){null!==n&&"object"===typeof n&&"function"===typeof n.then?n.then((function(n){ao(e,t,n)}),(function(n){return lo(e,t,n)})):ao(e,t,n)}function ao(e,t,n){t.status="fulfilled",t.value=n,oo(t),e.state=n,null!==(t=e.pending)&&((n=t.next)===t?e.pending=null:(n=n.next,t.next=n,no(e,n)))}function lo(e,t,n){var r=e.pending;if(e.pending=null,null!==r){r=r.next;do{t.status="rejected",t.reason=n,oo(t),t=t.next}while(t!==r)}e.action=null}function oo(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function io(e,t){return t}function so(e,t){if(la){var n=rc.formState;if(null!==n){e:{var r=yl;if(la){if(aa){t:{for(var a=aa,l=ia;8!==a.nodeType;){if(!l){a=null;break t}if(null===(a=vd(a.nextSibling))){a=null;break t}}a="F!"===(l=a.data)||"F"===l?a:null}if(a){aa=vd(a.nextSibling),r="F!"===a.data;break e}}ca(r)}r=!1}r&&(t=n[0])}}return(n=Dl()).memoizedState=n.baseState=t,r={pending:null,lanes:0,dispatch:null,lastRenderedReducer:io,lastRenderedState:t},n.queue=r,n=Ho.bind(null,yl,r),r.dispatch=n,r=Zl(!1),l=Uo.bind(null,yl,!1,r.queue),a={state:t,dispatch:null,action:e,pending:null},(r=Dl()).queue=a,n=to.bind(null,yl,a,l,n),a.dispatch=n,r.memoizedState=e,[t,n,!1]}function co(e){return uo(Hl(),xl,e)}function uo(e,t,n){if(t=ql(e,t,io)[0],e=Wl(Vl)[0],"object"===typeof t&&null!==t&&"function"===typeof t.then)try{var r=Il(t)}catch(o){if(o===qa)throw Qa;throw o}else r=t;var a=(t=Hl()).queue,l=a.dispatch;return n!==t.memoizedState&&(yl.flags|=2048,po(9,{destroy:void 0,resource:void 0},fo.bind(null,a,n),null)),[r,l,e]}function fo(e,t){e.action=t}function mo(e){var t=Hl(),n=xl;if(null!==n)return uo(t,n,e);Hl(),t=t.memoizedState;var r=(n=Hl()).queue.dispatch;return n.memoizedState=e,[t,r,!1]}function po(e,t,n,r){return e={tag:e,create:n,deps:r,inst:t,next:null},null===(t=yl.updateQueue)&&(t={lastEffect:null,events:null,stores:null,memoCache:null},yl.updateQueue=t),null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function ho(){return Hl().memoizedState}function go(e,t,n,r){var a=Dl();r=void 0===r?null:r,yl.flags|=e,a.memoizedState=po(1|t,{destroy:void 0,resource:void 0},n,r)}function vo(e,t,n,r){var a=Hl();r=void 0===r?null:r;var l=a.memoizedState.inst;null!==xl&&null!==r&&Ll(r,xl.memoizedState.deps)?a.memoizedState=po(t,l,n,r):(yl.flags|=e,a.memoizedState=po(1|t,l,n,r))}function bo(e,t){go(8390656,8,e,t)}function yo(e,t){vo(2048,8,e,t)}function xo(e,t){return vo(4,2,e,t)}function wo(e,t){return vo(4,4,e,t)}function ko(e,t){if("function"===typeof t){e=e();var n=t(e);return function(){"function"===typeof n?n():t(null)}}if(null!==t&&void 0!==t)return e=e(),t.current=e,function(){t.current=null}}function jo(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,vo(4,4,ko.bind(null,t,e),n)}function No(){}function So(e,t){var n=Hl();t=void 0===t?null:t;var r=n.memoizedState;return null!==t&&Ll(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function _o(e,t){var n=Hl();t=void 0===t?null:t;var r=n.memoizedState;if(null!==t&&Ll(t,r[1]))return r[0];if(r=e(),Nl){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r}function Co(e,t,n){return void 0===n||0!==(1073741824&bl)?e.memoizedState=t:(e.memoizedState=n,e=Oc(),yl.lanes|=e,mc|=e,n)}function Eo(e,t,n,r){return Yn(n,t)?n:null!==ml.current?(e=Co(e,n,r),Yn(e,t)||(Ci=!0),e):0===(42&bl)?(Ci=!0,e.memoizedState=n):(e=Oc(),yl.lanes|=e,mc|=e,t)}function Po(e,t,n,r,a){var l=O.p;O.p=0!==l&&8>l?l:8;var o=R.T,i={};R.T=i,Uo(e,!1,t,n);try{var s=a(),c=R.S;if(null!==c&&c(i,s),null!==s&&"object"===typeof s&&"function"===typeof s.then)Io(e,t,function(e,t){var n=[],r={status:"pending",value:null,reason:null,then:function(e){n.push(e)}};return e.then((function(){r.status="fulfilled",r.value=t;for(var e=0;e<n.length;e++)(0,n[e])(t)}),(function(e){for(r.status="rejected",r.reason=e,e=0;e<n.length;e++)(0,n[e])(void 0)})),r}(s,r),Rc());else Io(e,t,r,Rc())}catch(u){Io(e,t,{then:function(){},status:"rejected",reason:u},Rc())}finally{O.p=l,R.T=o}}function Lo(){}function zo(e,t,n,r){if(5!==e.tag)throw Error(o(476));var a=To(e).queue;Po(e,a,t,A,null===n?Lo:function(){return Mo(e),n(r)})}function To(e){var t=e.memoizedState;if(null!==t)return t;var n={};return(t={memoizedState:A,baseState:A,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Vl,lastRenderedState:A},next:null}).next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Vl,lastRenderedState:n},next:null},e.memoizedState=t,null!==(e=e.alternate)&&(e.memoizedState=t),t}function Mo(e){Io(e,To(e).next.queue,{},Rc())}function Ro(){return _a(Gd)}function Oo(){return Hl().memoizedState}function Ao(){return Hl().memoizedState}function Fo(e){for(var t=e.return;null!==t;){switch(t.tag){case 24:case 3:var n=Rc(),r=ll(t,e=al(n),n);return null!==r&&(Ac(r,t,n),ol(r,t,n)),t={cache:Ma()},void(e.payload=t)}t=t.return}}function Do(e,t,n){var r=Rc();n={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},Bo(e)?Vo(t,n):null!==(n=Lr(e,t,n,r))&&(Ac(n,e,r),Wo(n,t,r))}function Ho(e,t,n){Io(e,t,n,Rc())}function Io(e,t,n,r){var a={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(Bo(e))Vo(t,a);else{var l=e.alternate;if(0===e.lanes&&(null===l||0===l.lanes)&&null!==(l=t.lastRenderedReducer))try{var o=t.lastRenderedState,i=l(o,n);if(a.hasEagerState=!0,a.eagerState=i,Yn(i,o))return Pr(e,t,a,0),null===rc&&Er(),!1}catch(s){}if(null!==(n=Lr(e,t,a,r)))return Ac(n,e,r),Wo(n,t,r),!0}return!1}function Uo(e,t,n,r){if(r={lane:2,revertLane:Pu(),action:r,hasEagerState:!1,eagerState:null,next:null},Bo(e)){if(t)throw Error(o(479))}else null!==(t=Lr(e,n,r,2))&&Ac(t,e,2)}function Bo(e){var t=e.alternate;return e===yl||null!==t&&t===yl}function Vo(e,t){jl=kl=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Wo(e,t,n){if(0!==(4194048&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ce(e,n)}}var qo={readContext:_a,use:Ul,useCallback:Pl,useContext:Pl,useEffect:Pl,useImperativeHandle:Pl,useLayoutEffect:Pl,useInsertionEffect:Pl,useMemo:Pl,useReducer:Pl,useRef:Pl,useState:Pl,useDebugValue:Pl,useDeferredValue:Pl,useTransition:Pl,useSyncExternalStore:Pl,useId:Pl,useHostTransitionStatus:Pl,useFormState:Pl,useActionState:Pl,useOptimistic:Pl,useMemoCache:Pl,useCacheRefresh:Pl},$o={readContext:_a,use:Ul,useCallback:function(e,t){return Dl().memoizedState=[e,void 0===t?null:t],e},useContext:_a,useEffect:bo,useImperativeHandle:function(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,go(4194308,4,ko.bind(null,t,e),n)},useLayoutEffect:function(e,t){return go(4194308,4,e,t)},useInsertionEffect:function(e,t){go(4,2,e,t)},useMemo:function(e,t){var n=Dl();t=void 0===t?null:t;var r=e();if(Nl){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r},useReducer:function(e,t,n){var r=Dl();if(void 0!==n){var a=n(t);if(Nl){fe(!0);try{n(t)}finally{fe(!1)}}}else a=t;return r.memoizedState=r.baseState=a,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:a},r.queue=e,e=e.dispatch=Do.bind(null,yl,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Dl().memoizedState=e},useState:function(e){var t=(e=Zl(e)).queue,n=Ho.bind(null,yl,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:No,useDeferredValue:function(e,t){return Co(Dl(),e,t)},useTransition:function(){var e=Zl(!1);return e=Po.bind(null,yl,e.queue,!0,!1),Dl().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var r=yl,a=Dl();if(la){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===rc)throw Error(o(349));0!==(124&lc)||Gl(r,t,n)}a.memoizedState=n;var l={value:n,getSnapshot:t};return a.queue=l,bo(Kl.bind(null,r,l,e),[e]),r.flags|=2048,po(9,{destroy:void 0,resource:void 0},Yl.bind(null,r,l,n,t),null),n},useId:function(){var e=Dl(),t=rc.identifierPrefix;if(la){var n=Xr;t="\xab"+t+"R"+(n=(Jr&~(1<<32-me(Jr)-1)).toString(32)+n),0<(n=Sl++)&&(t+="H"+n.toString(32)),t+="\xbb"}else t="\xab"+t+"r"+(n=El++).toString(32)+"\xbb";return e.memoizedState=t},useHostTransitionStatus:Ro,useFormState:so,useActionState:so,useOptimistic:function(e){var t=Dl();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=Uo.bind(null,yl,!0,n),n.dispatch=t,[e,t]},useMemoCache:Bl,useCacheRefresh:function(){return Dl().memoizedState=Fo.bind(null,yl)}},Qo={readContext:_a,use:Ul,useCallback:So,useContext:_a,useEffect:yo,useImperativeHandle:jo,useInsertionEffect:xo,useLayoutEffect:wo,useMemo:_o,useReducer:Wl,useRef:ho,useState:function(){return Wl(Vl)},useDebugValue:No,useDeferredValue:function(e,t){return Eo(Hl(),xl.memoizedState,e,t)},useTransition:function(){var e=Wl(Vl)[0],t=Hl().memoizedState;return["boolean"===typeof e?e:Il(e),t]},useSyncExternalStore:Ql,useId:Oo,useHostTransitionStatus:Ro,useFormState:co,useActionState:co,useOptimistic:function(e,t){return eo(Hl(),0,e,t)},useMemoCache:Bl,useCacheRefresh:Ao},Go={readContext:_a,use:Ul,useCallback:So,useContext:_a,useEffect:yo,useImperativeHandle:jo,useInsertionEffect:xo,useLayoutEffect:wo,useMemo:_o,useReducer:$l,useRef:ho,useState:function(){return $l(Vl)},useDebugValue:No,useDeferredValue:function(e,t){var n=Hl();return null===xl?Co(n,e,t):Eo(n,xl.memoizedState,e,t)},useTransition:function(){var e=$l(Vl)[0],t=Hl().memoizedState;return["boolean"===typeof e?e:Il(e),t]},useSyncExternalStore:Ql,useId:Oo,useHostTransitionStatus:Ro,useFormState:mo,useActionState:mo,useOptimistic:function(e,t){var n=Hl();return null!==xl?eo(n,0,e,t):(n.baseState=e,[e,n.queue.dispatch])},useMemoCache:Bl,useCacheRefresh:Ao},Yo=null,Ko=0;function Jo(e){var t=Ko;return Ko+=1,null===Yo&&(Yo=[]),Ja(Yo,e,t)}function Xo(e,t){t=t.props.ref,e.ref=void 0!==t?t:null}function Zo(e,t){if(t.$$typeof===m)throw Error(o(525));throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ei(e){return(0,e._init)(e._payload)}function ti(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e){for(var t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function a(e,t){return(e=Dr(e,t)).index=0,e.sibling=null,e}function l(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=67108866,n):r:(t.flags|=67108866,n):(t.flags|=1048576,n)}function i(t){return e&&null===t.alternate&&(t.flags|=67108866),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Br(n,e.mode,r)).return=e,t):((t=a(t,n)).return=e,t)}function c(e,t,n,r){var l=n.type;return l===g?d(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===l||"object"===typeof l&&null!==l&&l.$$typeof===_&&ei(l)===t.type)?(Xo(t=a(t,n.props),n),t.return=e,t):(Xo(t=Ir(n.type,n.key,n.props,null,e.mode,r),n),t.return=e,t)}function u(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Vr(n,e.mode,r)).return=e,t):((t=a(t,n.children||[])).return=e,t)}function d(e,t,n,r,l){return null===t||7!==t.tag?((t=Ur(n,e.mode,r,l)).return=e,t):((t=a(t,n)).return=e,t)}function f(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t||"bigint"===typeof t)return(t=Br(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case p:return Xo(n=Ir(t.type,t.key,t.props,null,e.mode,n),t),n.return=e,n;case h:return(t=Vr(t,e.mode,n)).return=e,t;case _:return f(e,t=(0,t._init)(t._payload),n)}if(M(t)||L(t))return(t=Ur(t,e.mode,n,null)).return=e,t;if("function"===typeof t.then)return f(e,Jo(t),n);if(t.$$typeof===w)return f(e,Ca(e,t),n);Zo(e,t)}return null}function m(e,t,n,r){var a=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n||"bigint"===typeof n)return null!==a?null:s(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case p:return n.key===a?c(e,t,n,r):null;case h:return n.key===a?u(e,t,n,r):null;case _:return m(e,t,n=(a=n._init)(n._payload),r)}if(M(n)||L(n))return null!==a?null:d(e,t,n,r,null);if("function"===typeof n.then)return m(e,t,Jo(n),r);if(n.$$typeof===w)return m(e,t,Ca(e,n),r);Zo(e,n)}return null}function v(e,t,n,r,a){if("string"===typeof r&&""!==r||"number"===typeof r||"bigint"===typeof r)return s(t,e=e.get(n)||null,""+r,a);if("object"===typeof r&&null!==r){switch(r.$$typeof){case p:return c(t,e=e.get(null===r.key?n:r.key)||null,r,a);case h:return u(t,e=e.get(null===r.key?n:r.key)||null,r,a);case _:return v(e,t,n,r=(0,r._init)(r._payload),a)}if(M(r)||L(r))return d(t,e=e.get(n)||null,r,a,null);if("function"===typeof r.then)return v(e,t,n,Jo(r),a);if(r.$$typeof===w)return v(e,t,n,Ca(t,r),a);Zo(t,r)}return null}function b(s,c,u,d){if("object"===typeof u&&null!==u&&u.type===g&&null===u.key&&(u=u.props.children),"object"===typeof u&&null!==u){switch(u.$$typeof){case p:e:{for(var y=u.key;null!==c;){if(c.key===y){if((y=u.type)===g){if(7===c.tag){n(s,c.sibling),(d=a(c,u.props.children)).return=s,s=d;break e}}else if(c.elementType===y||"object"===typeof y&&null!==y&&y.$$typeof===_&&ei(y)===c.type){n(s,c.sibling),Xo(d=a(c,u.props),u),d.return=s,s=d;break e}n(s,c);break}t(s,c),c=c.sibling}u.type===g?((d=Ur(u.props.children,s.mode,d,u.key)).return=s,s=d):(Xo(d=Ir(u.type,u.key,u.props,null,s.mode,d),u),d.return=s,s=d)}return i(s);case h:e:{for(y=u.key;null!==c;){if(c.key===y){if(4===c.tag&&c.stateNode.containerInfo===u.containerInfo&&c.stateNode.implementation===u.implementation){n(s,c.sibling),(d=a(c,u.children||[])).return=s,s=d;break e}n(s,c);break}t(s,c),c=c.sibling}(d=Vr(u,s.mode,d)).return=s,s=d}return i(s);case _:return b(s,c,u=(y=u._init)(u._payload),d)}if(M(u))return function(a,o,i,s){for(var c=null,u=null,d=o,p=o=0,h=null;null!==d&&p<i.length;p++){d.index>p?(h=d,d=null):h=d.sibling;var g=m(a,d,i[p],s);if(null===g){null===d&&(d=h);break}e&&d&&null===g.alternate&&t(a,d),o=l(g,o,p),null===u?c=g:u.sibling=g,u=g,d=h}if(p===i.length)return n(a,d),la&&Zr(a,p),c;if(null===d){for(;p<i.length;p++)null!==(d=f(a,i[p],s))&&(o=l(d,o,p),null===u?c=d:u.sibling=d,u=d);return la&&Zr(a,p),c}for(d=r(d);p<i.length;p++)null!==(h=v(d,a,p,i[p],s))&&(e&&null!==h.alternate&&d.delete(null===h.key?p:h.key),o=l(h,o,p),null===u?c=h:u.sibling=h,u=h);return e&&d.forEach((function(e){return t(a,e)})),la&&Zr(a,p),c}(s,c,u,d);if(L(u)){if("function"!==typeof(y=L(u)))throw Error(o(150));return function(a,i,s,c){if(null==s)throw Error(o(151));for(var u=null,d=null,p=i,h=i=0,g=null,b=s.next();null!==p&&!b.done;h++,b=s.next()){p.index>h?(g=p,p=null):g=p.sibling;var y=m(a,p,b.value,c);if(null===y){null===p&&(p=g);break}e&&p&&null===y.alternate&&t(a,p),i=l(y,i,h),null===d?u=y:d.sibling=y,d=y,p=g}if(b.done)return n(a,p),la&&Zr(a,h),u;if(null===p){for(;!b.done;h++,b=s.next())null!==(b=f(a,b.value,c))&&(i=l(b,i,h),null===d?u=b:d.sibling=b,d=b);return la&&Zr(a,h),u}for(p=r(p);!b.done;h++,b=s.next())null!==(b=v(p,a,h,b.value,c))&&(e&&null!==b.alternate&&p.delete(null===b.key?h:b.key),i=l(b,i,h),null===d?u=b:d.sibling=b,d=b);return e&&p.forEach((function(e){return t(a,e)})),la&&Zr(a,h),u}(s,c,u=y.call(u),d)}if("function"===typeof u.then)return b(s,c,Jo(u),d);if(u.$$typeof===w)return b(s,c,Ca(s,u),d);Zo(s,u)}return"string"===typeof u&&""!==u||"number"===typeof u||"bigint"===typeof u?(u=""+u,null!==c&&6===c.tag?(n(s,c.sibling),(d=a(c,u)).return=s,s=d):(n(s,c),(d=Br(u,s.mode,d)).return=s,s=d),i(s)):n(s,c)}return function(e,t,n,r){try{Ko=0;var a=b(e,t,n,r);return Yo=null,a}catch(o){if(o===qa||o===Qa)throw o;var l=Ar(29,o,null,e.mode);return l.lanes=r,l.return=e,l}}}var ni=ti(!0),ri=ti(!1),ai=H(null),li=null;function oi(e){var t=e.alternate;U(ui,1&ui.current),U(ai,e),null===li&&(null===t||null!==ml.current||null!==t.memoizedState)&&(li=e)}function ii(e){if(22===e.tag){if(U(ui,ui.current),U(ai,e),null===li){var t=e.alternate;null!==t&&null!==t.memoizedState&&(li=e)}}else si()}function si(){U(ui,ui.current),U(ai,ai.current)}function ci(e){I(ai),li===e&&(li=null),I(ui)}var ui=H(0);function di(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||gd(n)))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function fi(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:f({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var mi={enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Rc(),a=al(r);a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=ll(e,a,r))&&(Ac(t,e,r),ol(t,e,r))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Rc(),a=al(r);a.tag=1,a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=ll(e,a,r))&&(Ac(t,e,r),ol(t,e,r))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Rc(),r=al(n);r.tag=2,void 0!==t&&null!==t&&(r.callback=t),null!==(t=ll(e,r,n))&&(Ac(t,e,n),ol(t,e,n))}};function pi(e,t,n,r,a,l,o){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,l,o):!t.prototype||!t.prototype.isPureReactComponent||(!Kn(n,r)||!Kn(a,l))}function hi(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&mi.enqueueReplaceState(t,t.state,null)}function gi(e,t){var n=t;if("ref"in t)for(var r in n={},t)"ref"!==r&&(n[r]=t[r]);if(e=e.defaultProps)for(var a in n===t&&(n=f({},n)),e)void 0===n[a]&&(n[a]=e[a]);return n}var vi="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function bi(e){vi(e)}function yi(e){console.error(e)}function xi(e){vi(e)}function wi(e,t){try{(0,e.onUncaughtError)(t.value,{componentStack:t.stack})}catch(n){setTimeout((function(){throw n}))}}function ki(e,t,n){try{(0,e.onCaughtError)(n.value,{componentStack:n.stack,errorBoundary:1===t.tag?t.stateNode:null})}catch(r){setTimeout((function(){throw r}))}}function ji(e,t,n){return(n=al(n)).tag=3,n.payload={element:null},n.callback=function(){wi(e,t)},n}function Ni(e){return(e=al(e)).tag=3,e}function Si(e,t,n,r){var a=n.type.getDerivedStateFromError;if("function"===typeof a){var l=r.value;e.payload=function(){return a(l)},e.callback=function(){ki(t,n,r)}}var o=n.stateNode;null!==o&&"function"===typeof o.componentDidCatch&&(e.callback=function(){ki(t,n,r),"function"!==typeof a&&(null===Nc?Nc=new Set([this]):Nc.add(this));var e=r.stack;this.componentDidCatch(r.value,{componentStack:null!==e?e:""})})}var _i=Error(o(461)),Ci=!1;function Ei(e,t,n,r){t.child=null===e?ri(t,null,n,r):ni(t,e.child,n,r)}function Pi(e,t,n,r,a){n=n.render;var l=t.ref;if("ref"in r){var o={};for(var i in r)"ref"!==i&&(o[i]=r[i])}else o=r;return Sa(t),r=zl(e,t,n,o,l,a),i=Ol(),null===e||Ci?(la&&i&&ta(t),t.flags|=1,Ei(e,t,r,a),t.child):(Al(e,t,a),Yi(e,t,a))}function Li(e,t,n,r,a){if(null===e){var l=n.type;return"function"!==typeof l||Fr(l)||void 0!==l.defaultProps||null!==n.compare?((e=Ir(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=l,zi(e,t,l,r,a))}if(l=e.child,!Ki(e,a)){var o=l.memoizedProps;if((n=null!==(n=n.compare)?n:Kn)(o,r)&&e.ref===t.ref)return Yi(e,t,a)}return t.flags|=1,(e=Dr(l,r)).ref=t.ref,e.return=t,t.child=e}function zi(e,t,n,r,a){if(null!==e){var l=e.memoizedProps;if(Kn(l,r)&&e.ref===t.ref){if(Ci=!1,t.pendingProps=r=l,!Ki(e,a))return t.lanes=e.lanes,Yi(e,t,a);0!==(131072&e.flags)&&(Ci=!0)}}return Oi(e,t,n,r,a)}function Ti(e,t,n){var r=t.pendingProps,a=r.children,l=null!==e?e.memoizedState:null;if("hidden"===r.mode){if(0!==(128&t.flags)){if(r=null!==l?l.baseLanes|n:n,null!==e){for(a=t.child=e.child,l=0;null!==a;)l=l|a.lanes|a.childLanes,a=a.sibling;t.childLanes=l&~r}else t.childLanes=0,t.child=null;return Mi(e,t,r,n)}if(0===(536870912&n))return t.lanes=t.childLanes=536870912,Mi(e,t,null!==l?l.baseLanes|n:n,n);t.memoizedState={baseLanes:0,cachePool:null},null!==e&&Va(0,null!==l?l.cachePool:null),null!==l?hl(t,l):gl(),ii(t)}else null!==l?(Va(0,l.cachePool),hl(t,l),si(),t.memoizedState=null):(null!==e&&Va(0,null),gl(),si());return Ei(e,t,a,n),t.child}function Mi(e,t,n,r){var a=Ba();return a=null===a?null:{parent:Ta._currentValue,pool:a},t.memoizedState={baseLanes:n,cachePool:a},null!==e&&Va(0,null),gl(),ii(t),null!==e&&ja(e,t,r,!0),null}function Ri(e,t){var n=t.ref;if(null===n)null!==e&&null!==e.ref&&(t.flags|=4194816);else{if("function"!==typeof n&&"object"!==typeof n)throw Error(o(284));null!==e&&e.ref===n||(t.flags|=4194816)}}function Oi(e,t,n,r,a){return Sa(t),n=zl(e,t,n,r,void 0,a),r=Ol(),null===e||Ci?(la&&r&&ta(t),t.flags|=1,Ei(e,t,n,a),t.child):(Al(e,t,a),Yi(e,t,a))}function Ai(e,t,n,r,a,l){return Sa(t),t.updateQueue=null,n=Ml(t,r,n,a),Tl(e),r=Ol(),null===e||Ci?(la&&r&&ta(t),t.flags|=1,Ei(e,t,n,l),t.child):(Al(e,t,l),Yi(e,t,l))}function Fi(e,t,n,r,a){if(Sa(t),null===t.stateNode){var l=Rr,o=n.contextType;"object"===typeof o&&null!==o&&(l=_a(o)),l=new n(r,l),t.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,l.updater=mi,t.stateNode=l,l._reactInternals=t,(l=t.stateNode).props=r,l.state=t.memoizedState,l.refs={},nl(t),o=n.contextType,l.context="object"===typeof o&&null!==o?_a(o):Rr,l.state=t.memoizedState,"function"===typeof(o=n.getDerivedStateFromProps)&&(fi(t,n,o,r),l.state=t.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof l.getSnapshotBeforeUpdate||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||(o=l.state,"function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),o!==l.state&&mi.enqueueReplaceState(l,l.state,null),ul(t,r,l,a),cl(),l.state=t.memoizedState),"function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!0}else if(null===e){l=t.stateNode;var i=t.memoizedProps,s=gi(n,i);l.props=s;var c=l.context,u=n.contextType;o=Rr,"object"===typeof u&&null!==u&&(o=_a(u));var d=n.getDerivedStateFromProps;u="function"===typeof d||"function"===typeof l.getSnapshotBeforeUpdate,i=t.pendingProps!==i,u||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(i||c!==o)&&hi(t,l,r,o),tl=!1;var f=t.memoizedState;l.state=f,ul(t,r,l,a),cl(),c=t.memoizedState,i||f!==c||tl?("function"===typeof d&&(fi(t,n,d,r),c=t.memoizedState),(s=tl||pi(t,n,s,r,f,c,o))?(u||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||("function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount()),"function"===typeof l.componentDidMount&&(t.flags|=4194308)):("function"===typeof l.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=c),l.props=r,l.state=c,l.context=o,r=s):("function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!1)}else{l=t.stateNode,rl(e,t),u=gi(n,o=t.memoizedProps),l.props=u,d=t.pendingProps,f=l.context,c=n.contextType,s=Rr,"object"===typeof c&&null!==c&&(s=_a(c)),(c="function"===typeof(i=n.getDerivedStateFromProps)||"function"===typeof l.getSnapshotBeforeUpdate)||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(o!==d||f!==s)&&hi(t,l,r,s),tl=!1,f=t.memoizedState,l.state=f,ul(t,r,l,a),cl();var m=t.memoizedState;o!==d||f!==m||tl||null!==e&&null!==e.dependencies&&Na(e.dependencies)?("function"===typeof i&&(fi(t,n,i,r),m=t.memoizedState),(u=tl||pi(t,n,u,r,f,m,s)||null!==e&&null!==e.dependencies&&Na(e.dependencies))?(c||"function"!==typeof l.UNSAFE_componentWillUpdate&&"function"!==typeof l.componentWillUpdate||("function"===typeof l.componentWillUpdate&&l.componentWillUpdate(r,m,s),"function"===typeof l.UNSAFE_componentWillUpdate&&l.UNSAFE_componentWillUpdate(r,m,s)),"function"===typeof l.componentDidUpdate&&(t.flags|=4),"function"===typeof l.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=m),l.props=r,l.state=m,l.context=s,r=u):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),r=!1)}return l=r,Ri(e,t),r=0!==(128&t.flags),l||r?(l=t.stateNode,n=r&&"function"!==typeof n.getDerivedStateFromError?null:l.render(),t.flags|=1,null!==e&&r?(t.child=ni(t,e.child,null,a),t.child=ni(t,null,n,a)):Ei(e,t,n,a),t.memoizedState=l.state,e=t.child):e=Yi(e,t,a),e}function Di(e,t,n,r){return ma(),t.flags|=256,Ei(e,t,n,r),t.child}var Hi={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Ii(e){return{baseLanes:e,cachePool:Wa()}}function Ui(e,t,n){return e=null!==e?e.childLanes&~n:0,t&&(e|=gc),e}function Bi(e,t,n){var r,a=t.pendingProps,l=!1,i=0!==(128&t.flags);if((r=i)||(r=(null===e||null!==e.memoizedState)&&0!==(2&ui.current)),r&&(l=!0,t.flags&=-129),r=0!==(32&t.flags),t.flags&=-33,null===e){if(la){if(l?oi(t):si(),la){var s,c=aa;if(s=c){e:{for(s=c,c=ia;8!==s.nodeType;){if(!c){c=null;break e}if(null===(s=vd(s.nextSibling))){c=null;break e}}c=s}null!==c?(t.memoizedState={dehydrated:c,treeContext:null!==Kr?{id:Jr,overflow:Xr}:null,retryLane:536870912,hydrationErrors:null},(s=Ar(18,null,null,0)).stateNode=c,s.return=t,t.child=s,ra=t,aa=null,s=!0):s=!1}s||ca(t)}if(null!==(c=t.memoizedState)&&null!==(c=c.dehydrated))return gd(c)?t.lanes=32:t.lanes=536870912,null;ci(t)}return c=a.children,a=a.fallback,l?(si(),c=Wi({mode:"hidden",children:c},l=t.mode),a=Ur(a,l,n,null),c.return=t,a.return=t,c.sibling=a,t.child=c,(l=t.child).memoizedState=Ii(n),l.childLanes=Ui(e,r,n),t.memoizedState=Hi,a):(oi(t),Vi(t,c))}if(null!==(s=e.memoizedState)&&null!==(c=s.dehydrated)){if(i)256&t.flags?(oi(t),t.flags&=-257,t=qi(e,t,n)):null!==t.memoizedState?(si(),t.child=e.child,t.flags|=128,t=null):(si(),l=a.fallback,c=t.mode,a=Wi({mode:"visible",children:a.children},c),(l=Ur(l,c,n,null)).flags|=2,a.return=t,l.return=t,a.sibling=l,t.child=a,ni(t,e.child,null,n),(a=t.child).memoizedState=Ii(n),a.childLanes=Ui(e,r,n),t.memoizedState=Hi,t=l);else if(oi(t),gd(c)){if(r=c.nextSibling&&c.nextSibling.dataset)var u=r.dgst;r=u,(a=Error(o(419))).stack="",a.digest=r,ha({value:a,source:null,stack:null}),t=qi(e,t,n)}else if(Ci||ja(e,t,n,!1),r=0!==(n&e.childLanes),Ci||r){if(null!==(r=rc)&&(0!==(a=0!==((a=0!==(42&(a=n&-n))?1:Ee(a))&(r.suspendedLanes|n))?0:a)&&a!==s.retryLane))throw s.retryLane=a,zr(e,a),Ac(r,e,a),_i;"$?"===c.data||Qc(),t=qi(e,t,n)}else"$?"===c.data?(t.flags|=192,t.child=e.child,t=null):(e=s.treeContext,aa=vd(c.nextSibling),ra=t,la=!0,oa=null,ia=!1,null!==e&&(Gr[Yr++]=Jr,Gr[Yr++]=Xr,Gr[Yr++]=Kr,Jr=e.id,Xr=e.overflow,Kr=t),(t=Vi(t,a.children)).flags|=4096);return t}return l?(si(),l=a.fallback,c=t.mode,u=(s=e.child).sibling,(a=Dr(s,{mode:"hidden",children:a.children})).subtreeFlags=65011712&s.subtreeFlags,null!==u?l=Dr(u,l):(l=Ur(l,c,n,null)).flags|=2,l.return=t,a.return=t,a.sibling=l,t.child=a,a=l,l=t.child,null===(c=e.child.memoizedState)?c=Ii(n):(null!==(s=c.cachePool)?(u=Ta._currentValue,s=s.parent!==u?{parent:u,pool:u}:s):s=Wa(),c={baseLanes:c.baseLanes|n,cachePool:s}),l.memoizedState=c,l.childLanes=Ui(e,r,n),t.memoizedState=Hi,a):(oi(t),e=(n=e.child).sibling,(n=Dr(n,{mode:"visible",children:a.children})).return=t,n.sibling=null,null!==e&&(null===(r=t.deletions)?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n)}function Vi(e,t){return(t=Wi({mode:"visible",children:t},e.mode)).return=e,e.child=t}function Wi(e,t){return(e=Ar(22,e,null,t)).lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function qi(e,t,n){return ni(t,e.child,null,n),(e=Vi(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function $i(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),wa(e.return,t,n)}function Qi(e,t,n,r,a){var l=e.memoizedState;null===l?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:a}:(l.isBackwards=t,l.rendering=null,l.renderingStartTime=0,l.last=r,l.tail=n,l.tailMode=a)}function Gi(e,t,n){var r=t.pendingProps,a=r.revealOrder,l=r.tail;if(Ei(e,t,r.children,n),0!==(2&(r=ui.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&$i(e,n,t);else if(19===e.tag)$i(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}switch(U(ui,r),a){case"forwards":for(n=t.child,a=null;null!==n;)null!==(e=n.alternate)&&null===di(e)&&(a=n),n=n.sibling;null===(n=a)?(a=t.child,t.child=null):(a=n.sibling,n.sibling=null),Qi(t,!1,a,n,l);break;case"backwards":for(n=null,a=t.child,t.child=null;null!==a;){if(null!==(e=a.alternate)&&null===di(e)){t.child=a;break}e=a.sibling,a.sibling=n,n=a,a=e}Qi(t,!0,n,null,l);break;case"together":Qi(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Yi(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),mc|=t.lanes,0===(n&t.childLanes)){if(null===e)return null;if(ja(e,t,n,!1),0===(n&t.childLanes))return null}if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=Dr(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Dr(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Ki(e,t){return 0!==(e.lanes&t)||!(null===(e=e.dependencies)||!Na(e))}function Ji(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps)Ci=!0;else{if(!Ki(e,n)&&0===(128&t.flags))return Ci=!1,function(e,t,n){switch(t.tag){case 3:$(t,t.stateNode.containerInfo),ya(0,Ta,e.memoizedState.cache),ma();break;case 27:case 5:G(t);break;case 4:$(t,t.stateNode.containerInfo);break;case 10:ya(0,t.type,t.memoizedProps.value);break;case 13:var r=t.memoizedState;if(null!==r)return null!==r.dehydrated?(oi(t),t.flags|=128,null):0!==(n&t.child.childLanes)?Bi(e,t,n):(oi(t),null!==(e=Yi(e,t,n))?e.sibling:null);oi(t);break;case 19:var a=0!==(128&e.flags);if((r=0!==(n&t.childLanes))||(ja(e,t,n,!1),r=0!==(n&t.childLanes)),a){if(r)return Gi(e,t,n);t.flags|=128}if(null!==(a=t.memoizedState)&&(a.rendering=null,a.tail=null,a.lastEffect=null),U(ui,ui.current),r)break;return null;case 22:case 23:return t.lanes=0,Ti(e,t,n);case 24:ya(0,Ta,e.memoizedState.cache)}return Yi(e,t,n)}(e,t,n);Ci=0!==(131072&e.flags)}else Ci=!1,la&&0!==(1048576&t.flags)&&ea(t,Qr,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var r=t.elementType,a=r._init;if(r=a(r._payload),t.type=r,"function"!==typeof r){if(void 0!==r&&null!==r){if((a=r.$$typeof)===k){t.tag=11,t=Pi(null,t,r,e,n);break e}if(a===S){t.tag=14,t=Li(null,t,r,e,n);break e}}throw t=T(r)||r,Error(o(306,t,""))}Fr(r)?(e=gi(r,e),t.tag=1,t=Fi(null,t,r,e,n)):(t.tag=0,t=Oi(null,t,r,e,n))}return t;case 0:return Oi(e,t,t.type,t.pendingProps,n);case 1:return Fi(e,t,r=t.type,a=gi(r,t.pendingProps),n);case 3:e:{if($(t,t.stateNode.containerInfo),null===e)throw Error(o(387));r=t.pendingProps;var l=t.memoizedState;a=l.element,rl(e,t),ul(t,r,null,n);var i=t.memoizedState;if(r=i.cache,ya(0,Ta,r),r!==l.cache&&ka(t,[Ta],n,!0),cl(),r=i.element,l.isDehydrated){if(l={element:r,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=l,t.memoizedState=l,256&t.flags){t=Di(e,t,r,n);break e}if(r!==a){ha(a=Nr(Error(o(424)),t)),t=Di(e,t,r,n);break e}if(9===(e=t.stateNode.containerInfo).nodeType)e=e.body;else e="HTML"===e.nodeName?e.ownerDocument.body:e;for(aa=vd(e.firstChild),ra=t,la=!0,oa=null,ia=!0,n=ri(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(ma(),r===a){t=Yi(e,t,n);break e}Ei(e,t,r,n)}t=t.child}return t;case 26:return Ri(e,t),null===e?(n=Ed(t.type,null,t.pendingProps,null))?t.memoizedState=n:la||(n=t.type,e=t.pendingProps,(r=rd(W.current).createElement(n))[Te]=t,r[Me]=e,ed(r,n,e),qe(r),t.stateNode=r):t.memoizedState=Ed(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return G(t),null===e&&la&&(r=t.stateNode=xd(t.type,t.pendingProps,W.current),ra=t,ia=!0,a=aa,md(t.type)?(bd=a,aa=vd(r.firstChild)):aa=a),Ei(e,t,t.pendingProps.children,n),Ri(e,t),null===e&&(t.flags|=4194304),t.child;case 5:return null===e&&la&&((a=r=aa)&&(null!==(r=function(e,t,n,r){for(;1===e.nodeType;){var a=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!r&&("INPUT"!==e.nodeName||"hidden"!==e.type))break}else if(r){if(!e[He])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if("stylesheet"===(l=e.getAttribute("rel"))&&e.hasAttribute("data-precedence"))break;if(l!==a.rel||e.getAttribute("href")!==(null==a.href||""===a.href?null:a.href)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin)||e.getAttribute("title")!==(null==a.title?null:a.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(((l=e.getAttribute("src"))!==(null==a.src?null:a.src)||e.getAttribute("type")!==(null==a.type?null:a.type)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin))&&l&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else{if("input"!==t||"hidden"!==e.type)return e;var l=null==a.name?null:""+a.name;if("hidden"===a.type&&e.getAttribute("name")===l)return e}if(null===(e=vd(e.nextSibling)))break}return null}(r,t.type,t.pendingProps,ia))?(t.stateNode=r,ra=t,aa=vd(r.firstChild),ia=!1,a=!0):a=!1),a||ca(t)),G(t),a=t.type,l=t.pendingProps,i=null!==e?e.memoizedProps:null,r=l.children,od(a,l)?r=null:null!==i&&od(a,i)&&(t.flags|=32),null!==t.memoizedState&&(a=zl(e,t,Rl,null,null,n),Gd._currentValue=a),Ri(e,t),Ei(e,t,r,n),t.child;case 6:return null===e&&la&&((e=n=aa)&&(null!==(n=function(e,t,n){if(""===t)return null;for(;3!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!n)return null;if(null===(e=vd(e.nextSibling)))return null}return e}(n,t.pendingProps,ia))?(t.stateNode=n,ra=t,aa=null,e=!0):e=!1),e||ca(t)),null;case 13:return Bi(e,t,n);case 4:return $(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=ni(t,null,r,n):Ei(e,t,r,n),t.child;case 11:return Pi(e,t,t.type,t.pendingProps,n);case 7:return Ei(e,t,t.pendingProps,n),t.child;case 8:case 12:return Ei(e,t,t.pendingProps.children,n),t.child;case 10:return r=t.pendingProps,ya(0,t.type,r.value),Ei(e,t,r.children,n),t.child;case 9:return a=t.type._context,r=t.pendingProps.children,Sa(t),r=r(a=_a(a)),t.flags|=1,Ei(e,t,r,n),t.child;case 14:return Li(e,t,t.type,t.pendingProps,n);case 15:return zi(e,t,t.type,t.pendingProps,n);case 19:return Gi(e,t,n);case 31:return r=t.pendingProps,n=t.mode,r={mode:r.mode,children:r.children},null===e?((n=Wi(r,n)).ref=t.ref,t.child=n,n.return=t,t=n):((n=Dr(e.child,r)).ref=t.ref,t.child=n,n.return=t,t=n),t;case 22:return Ti(e,t,n);case 24:return Sa(t),r=_a(Ta),null===e?(null===(a=Ba())&&(a=rc,l=Ma(),a.pooledCache=l,l.refCount++,null!==l&&(a.pooledCacheLanes|=n),a=l),t.memoizedState={parent:r,cache:a},nl(t),ya(0,Ta,a)):(0!==(e.lanes&n)&&(rl(e,t),ul(t,null,null,n),cl()),a=e.memoizedState,l=t.memoizedState,a.parent!==r?(a={parent:r,cache:r},t.memoizedState=a,0===t.lanes&&(t.memoizedState=t.updateQueue.baseState=a),ya(0,Ta,r)):(r=l.cache,ya(0,Ta,r),r!==a.cache&&ka(t,[Ta],n,!0))),Ei(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(o(156,t.tag))}function Xi(e){e.flags|=4}function Zi(e,t){if("stylesheet"!==t.type||0!==(4&t.state.loading))e.flags&=-16777217;else if(e.flags|=16777216,!Ud(t)){if(null!==(t=ai.current)&&((4194048&lc)===lc?null!==li:(62914560&lc)!==lc&&0===(536870912&lc)||t!==li))throw Xa=Ga,$a;e.flags|=8192}}function es(e,t){null!==t&&(e.flags|=4),16384&e.flags&&(t=22!==e.tag?je():536870912,e.lanes|=t,vc|=t)}function ts(e,t){if(!la)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ns(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=65011712&a.subtreeFlags,r|=65011712&a.flags,a.return=e,a=a.sibling;else for(a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=a.subtreeFlags,r|=a.flags,a.return=e,a=a.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function rs(e,t,n){var r=t.pendingProps;switch(na(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:case 1:return ns(t),null;case 3:return n=t.stateNode,r=null,null!==e&&(r=e.memoizedState.cache),t.memoizedState.cache!==r&&(t.flags|=2048),xa(Ta),Q(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||(fa(t)?Xi(t):null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,pa())),ns(t),null;case 26:return n=t.memoizedState,null===e?(Xi(t),null!==n?(ns(t),Zi(t,n)):(ns(t),t.flags&=-16777217)):n?n!==e.memoizedState?(Xi(t),ns(t),Zi(t,n)):(ns(t),t.flags&=-16777217):(e.memoizedProps!==r&&Xi(t),ns(t),t.flags&=-16777217),null;case 27:Y(t),n=W.current;var a=t.type;if(null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Xi(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return ns(t),null}e=B.current,fa(t)?ua(t):(e=xd(a,r,n),t.stateNode=e,Xi(t))}return ns(t),null;case 5:if(Y(t),n=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Xi(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return ns(t),null}if(e=B.current,fa(t))ua(t);else{switch(a=rd(W.current),e){case 1:e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":(e=a.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e="string"===typeof r.is?a.createElement("select",{is:r.is}):a.createElement("select"),r.multiple?e.multiple=!0:r.size&&(e.size=r.size);break;default:e="string"===typeof r.is?a.createElement(n,{is:r.is}):a.createElement(n)}}e[Te]=t,e[Me]=r;e:for(a=t.child;null!==a;){if(5===a.tag||6===a.tag)e.appendChild(a.stateNode);else if(4!==a.tag&&27!==a.tag&&null!==a.child){a.child.return=a,a=a.child;continue}if(a===t)break e;for(;null===a.sibling;){if(null===a.return||a.return===t)break e;a=a.return}a.sibling.return=a.return,a=a.sibling}t.stateNode=e;e:switch(ed(e,n,r),n){case"button":case"input":case"select":case"textarea":e=!!r.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&Xi(t)}}return ns(t),t.flags&=-16777217,null;case 6:if(e&&null!=t.stateNode)e.memoizedProps!==r&&Xi(t);else{if("string"!==typeof r&&null===t.stateNode)throw Error(o(166));if(e=W.current,fa(t)){if(e=t.stateNode,n=t.memoizedProps,r=null,null!==(a=ra))switch(a.tag){case 27:case 5:r=a.memoizedProps}e[Te]=t,(e=!!(e.nodeValue===n||null!==r&&!0===r.suppressHydrationWarning||Ku(e.nodeValue,n)))||ca(t)}else(e=rd(e).createTextNode(r))[Te]=t,t.stateNode=e}return ns(t),null;case 13:if(r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(a=fa(t),null!==r&&null!==r.dehydrated){if(null===e){if(!a)throw Error(o(318));if(!(a=null!==(a=t.memoizedState)?a.dehydrated:null))throw Error(o(317));a[Te]=t}else ma(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;ns(t),a=!1}else a=pa(),null!==e&&null!==e.memoizedState&&(e.memoizedState.hydrationErrors=a),a=!0;if(!a)return 256&t.flags?(ci(t),t):(ci(t),null)}if(ci(t),0!==(128&t.flags))return t.lanes=n,t;if(n=null!==r,e=null!==e&&null!==e.memoizedState,n){a=null,null!==(r=t.child).alternate&&null!==r.alternate.memoizedState&&null!==r.alternate.memoizedState.cachePool&&(a=r.alternate.memoizedState.cachePool.pool);var l=null;null!==r.memoizedState&&null!==r.memoizedState.cachePool&&(l=r.memoizedState.cachePool.pool),l!==a&&(r.flags|=2048)}return n!==e&&n&&(t.child.flags|=8192),es(t,t.updateQueue),ns(t),null;case 4:return Q(),null===e&&Iu(t.stateNode.containerInfo),ns(t),null;case 10:return xa(t.type),ns(t),null;case 19:if(I(ui),null===(a=t.memoizedState))return ns(t),null;if(r=0!==(128&t.flags),null===(l=a.rendering))if(r)ts(a,!1);else{if(0!==fc||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(l=di(e))){for(t.flags|=128,ts(a,!1),e=l.updateQueue,t.updateQueue=e,es(t,e),t.subtreeFlags=0,e=n,n=t.child;null!==n;)Hr(n,e),n=n.sibling;return U(ui,1&ui.current|2),t.child}e=e.sibling}null!==a.tail&&te()>kc&&(t.flags|=128,r=!0,ts(a,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=di(l))){if(t.flags|=128,r=!0,e=e.updateQueue,t.updateQueue=e,es(t,e),ts(a,!0),null===a.tail&&"hidden"===a.tailMode&&!l.alternate&&!la)return ns(t),null}else 2*te()-a.renderingStartTime>kc&&536870912!==n&&(t.flags|=128,r=!0,ts(a,!1),t.lanes=4194304);a.isBackwards?(l.sibling=t.child,t.child=l):(null!==(e=a.last)?e.sibling=l:t.child=l,a.last=l)}return null!==a.tail?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=te(),t.sibling=null,e=ui.current,U(ui,r?1&e|2:1&e),t):(ns(t),null);case 22:case 23:return ci(t),vl(),r=null!==t.memoizedState,null!==e?null!==e.memoizedState!==r&&(t.flags|=8192):r&&(t.flags|=8192),r?0!==(536870912&n)&&0===(128&t.flags)&&(ns(t),6&t.subtreeFlags&&(t.flags|=8192)):ns(t),null!==(n=t.updateQueue)&&es(t,n.retryQueue),n=null,null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),r=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(r=t.memoizedState.cachePool.pool),r!==n&&(t.flags|=2048),null!==e&&I(Ua),null;case 24:return n=null,null!==e&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),xa(Ta),ns(t),null;case 25:case 30:return null}throw Error(o(156,t.tag))}function as(e,t){switch(na(t),t.tag){case 1:return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return xa(Ta),Q(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 26:case 27:case 5:return Y(t),null;case 13:if(ci(t),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));ma()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return I(ui),null;case 4:return Q(),null;case 10:return xa(t.type),null;case 22:case 23:return ci(t),vl(),null!==e&&I(Ua),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 24:return xa(Ta),null;default:return null}}function ls(e,t){switch(na(t),t.tag){case 3:xa(Ta),Q();break;case 26:case 27:case 5:Y(t);break;case 4:Q();break;case 13:ci(t);break;case 19:I(ui);break;case 10:xa(t.type);break;case 22:case 23:ci(t),vl(),null!==e&&I(Ua);break;case 24:xa(Ta)}}function os(e,t){try{var n=t.updateQueue,r=null!==n?n.lastEffect:null;if(null!==r){var a=r.next;n=a;do{if((n.tag&e)===e){r=void 0;var l=n.create,o=n.inst;r=l(),o.destroy=r}n=n.next}while(n!==a)}}catch(i){uu(t,t.return,i)}}function is(e,t,n){try{var r=t.updateQueue,a=null!==r?r.lastEffect:null;if(null!==a){var l=a.next;r=l;do{if((r.tag&e)===e){var o=r.inst,i=o.destroy;if(void 0!==i){o.destroy=void 0,a=t;var s=n,c=i;try{c()}catch(u){uu(a,s,u)}}}r=r.next}while(r!==l)}}catch(u){uu(t,t.return,u)}}function ss(e){var t=e.updateQueue;if(null!==t){var n=e.stateNode;try{fl(t,n)}catch(r){uu(e,e.return,r)}}}function cs(e,t,n){n.props=gi(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(r){uu(e,t,r)}}function us(e,t){try{var n=e.ref;if(null!==n){switch(e.tag){case 26:case 27:case 5:var r=e.stateNode;break;default:r=e.stateNode}"function"===typeof n?e.refCleanup=n(r):n.current=r}}catch(a){uu(e,t,a)}}function ds(e,t){var n=e.ref,r=e.refCleanup;if(null!==n)if("function"===typeof r)try{r()}catch(a){uu(e,t,a)}finally{e.refCleanup=null,null!=(e=e.alternate)&&(e.refCleanup=null)}else if("function"===typeof n)try{n(null)}catch(l){uu(e,t,l)}else n.current=null}function fs(e){var t=e.type,n=e.memoizedProps,r=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&r.focus();break e;case"img":n.src?r.src=n.src:n.srcSet&&(r.srcset=n.srcSet)}}catch(a){uu(e,e.return,a)}}function ms(e,t,n){try{var r=e.stateNode;!function(e,t,n,r){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var a=null,l=null,i=null,s=null,c=null,u=null,d=null;for(p in n){var f=n[p];if(n.hasOwnProperty(p)&&null!=f)switch(p){case"checked":case"value":break;case"defaultValue":c=f;default:r.hasOwnProperty(p)||Xu(e,t,p,null,r,f)}}for(var m in r){var p=r[m];if(f=n[m],r.hasOwnProperty(m)&&(null!=p||null!=f))switch(m){case"type":l=p;break;case"name":a=p;break;case"checked":u=p;break;case"defaultChecked":d=p;break;case"value":i=p;break;case"defaultValue":s=p;break;case"children":case"dangerouslySetInnerHTML":if(null!=p)throw Error(o(137,t));break;default:p!==f&&Xu(e,t,m,p,r,f)}}return void gt(e,i,s,c,u,d,l,a);case"select":for(l in p=i=s=m=null,n)if(c=n[l],n.hasOwnProperty(l)&&null!=c)switch(l){case"value":break;case"multiple":p=c;default:r.hasOwnProperty(l)||Xu(e,t,l,null,r,c)}for(a in r)if(l=r[a],c=n[a],r.hasOwnProperty(a)&&(null!=l||null!=c))switch(a){case"value":m=l;break;case"defaultValue":s=l;break;case"multiple":i=l;default:l!==c&&Xu(e,t,a,l,r,c)}return t=s,n=i,r=p,void(null!=m?yt(e,!!n,m,!1):!!r!==!!n&&(null!=t?yt(e,!!n,t,!0):yt(e,!!n,n?[]:"",!1)));case"textarea":for(s in p=m=null,n)if(a=n[s],n.hasOwnProperty(s)&&null!=a&&!r.hasOwnProperty(s))switch(s){case"value":case"children":break;default:Xu(e,t,s,null,r,a)}for(i in r)if(a=r[i],l=n[i],r.hasOwnProperty(i)&&(null!=a||null!=l))switch(i){case"value":m=a;break;case"defaultValue":p=a;break;case"children":break;case"dangerouslySetInnerHTML":if(null!=a)throw Error(o(91));break;default:a!==l&&Xu(e,t,i,a,r,l)}return void xt(e,m,p);case"option":for(var h in n)if(m=n[h],n.hasOwnProperty(h)&&null!=m&&!r.hasOwnProperty(h))if("selected"===h)e.selected=!1;else Xu(e,t,h,null,r,m);for(c in r)if(m=r[c],p=n[c],r.hasOwnProperty(c)&&m!==p&&(null!=m||null!=p))if("selected"===c)e.selected=m&&"function"!==typeof m&&"symbol"!==typeof m;else Xu(e,t,c,m,r,p);return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var g in n)m=n[g],n.hasOwnProperty(g)&&null!=m&&!r.hasOwnProperty(g)&&Xu(e,t,g,null,r,m);for(u in r)if(m=r[u],p=n[u],r.hasOwnProperty(u)&&m!==p&&(null!=m||null!=p))switch(u){case"children":case"dangerouslySetInnerHTML":if(null!=m)throw Error(o(137,t));break;default:Xu(e,t,u,m,r,p)}return;default:if(_t(t)){for(var v in n)m=n[v],n.hasOwnProperty(v)&&void 0!==m&&!r.hasOwnProperty(v)&&Zu(e,t,v,void 0,r,m);for(d in r)m=r[d],p=n[d],!r.hasOwnProperty(d)||m===p||void 0===m&&void 0===p||Zu(e,t,d,m,r,p);return}}for(var b in n)m=n[b],n.hasOwnProperty(b)&&null!=m&&!r.hasOwnProperty(b)&&Xu(e,t,b,null,r,m);for(f in r)m=r[f],p=n[f],!r.hasOwnProperty(f)||m===p||null==m&&null==p||Xu(e,t,f,m,r,p)}(r,e.type,n,t),r[Me]=t}catch(a){uu(e,e.return,a)}}function ps(e){return 5===e.tag||3===e.tag||26===e.tag||27===e.tag&&md(e.type)||4===e.tag}function hs(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||ps(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(27===e.tag&&md(e.type))continue e;if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function gs(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?(9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).insertBefore(e,t):((t=9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Ju));else if(4!==r&&(27===r&&md(e.type)&&(n=e.stateNode,t=null),null!==(e=e.child)))for(gs(e,t,n),e=e.sibling;null!==e;)gs(e,t,n),e=e.sibling}function vs(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&(27===r&&md(e.type)&&(n=e.stateNode),null!==(e=e.child)))for(vs(e,t,n),e=e.sibling;null!==e;)vs(e,t,n),e=e.sibling}function bs(e){var t=e.stateNode,n=e.memoizedProps;try{for(var r=e.type,a=t.attributes;a.length;)t.removeAttributeNode(a[0]);ed(t,r,n),t[Te]=e,t[Me]=n}catch(l){uu(e,e.return,l)}}var ys=!1,xs=!1,ws=!1,ks="function"===typeof WeakSet?WeakSet:Set,js=null;function Ns(e,t,n){var r=n.flags;switch(n.tag){case 0:case 11:case 15:Fs(e,n),4&r&&os(5,n);break;case 1:if(Fs(e,n),4&r)if(e=n.stateNode,null===t)try{e.componentDidMount()}catch(o){uu(n,n.return,o)}else{var a=gi(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(a,t,e.__reactInternalSnapshotBeforeUpdate)}catch(i){uu(n,n.return,i)}}64&r&&ss(n),512&r&&us(n,n.return);break;case 3:if(Fs(e,n),64&r&&null!==(e=n.updateQueue)){if(t=null,null!==n.child)switch(n.child.tag){case 27:case 5:case 1:t=n.child.stateNode}try{fl(e,t)}catch(o){uu(n,n.return,o)}}break;case 27:null===t&&4&r&&bs(n);case 26:case 5:Fs(e,n),null===t&&4&r&&fs(n),512&r&&us(n,n.return);break;case 12:Fs(e,n);break;case 13:Fs(e,n),4&r&&Ls(e,n),64&r&&(null!==(e=n.memoizedState)&&(null!==(e=e.dehydrated)&&function(e,t){var n=e.ownerDocument;if("$?"!==e.data||"complete"===n.readyState)t();else{var r=function(){t(),n.removeEventListener("DOMContentLoaded",r)};n.addEventListener("DOMContentLoaded",r),e._reactRetry=r}}(e,n=pu.bind(null,n))));break;case 22:if(!(r=null!==n.memoizedState||ys)){t=null!==t&&null!==t.memoizedState||xs,a=ys;var l=xs;ys=r,(xs=t)&&!l?Hs(e,n,0!==(8772&n.subtreeFlags)):Fs(e,n),ys=a,xs=l}break;case 30:break;default:Fs(e,n)}}function Ss(e){var t=e.alternate;null!==t&&(e.alternate=null,Ss(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&Ie(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var _s=null,Cs=!1;function Es(e,t,n){for(n=n.child;null!==n;)Ps(e,t,n),n=n.sibling}function Ps(e,t,n){if(de&&"function"===typeof de.onCommitFiberUnmount)try{de.onCommitFiberUnmount(ue,n)}catch(l){}switch(n.tag){case 26:xs||ds(n,t),Es(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode).parentNode.removeChild(n);break;case 27:xs||ds(n,t);var r=_s,a=Cs;md(n.type)&&(_s=n.stateNode,Cs=!1),Es(e,t,n),wd(n.stateNode),_s=r,Cs=a;break;case 5:xs||ds(n,t);case 6:if(r=_s,a=Cs,_s=null,Es(e,t,n),Cs=a,null!==(_s=r))if(Cs)try{(9===_s.nodeType?_s.body:"HTML"===_s.nodeName?_s.ownerDocument.body:_s).removeChild(n.stateNode)}catch(o){uu(n,t,o)}else try{_s.removeChild(n.stateNode)}catch(o){uu(n,t,o)}break;case 18:null!==_s&&(Cs?(pd(9===(e=_s).nodeType?e.body:"HTML"===e.nodeName?e.ownerDocument.body:e,n.stateNode),Ef(e)):pd(_s,n.stateNode));break;case 4:r=_s,a=Cs,_s=n.stateNode.containerInfo,Cs=!0,Es(e,t,n),_s=r,Cs=a;break;case 0:case 11:case 14:case 15:xs||is(2,n,t),xs||is(4,n,t),Es(e,t,n);break;case 1:xs||(ds(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount&&cs(n,t,r)),Es(e,t,n);break;case 21:Es(e,t,n);break;case 22:xs=(r=xs)||null!==n.memoizedState,Es(e,t,n),xs=r;break;default:Es(e,t,n)}}function Ls(e,t){if(null===t.memoizedState&&(null!==(e=t.alternate)&&(null!==(e=e.memoizedState)&&null!==(e=e.dehydrated))))try{Ef(e)}catch(n){uu(t,t.return,n)}}function zs(e,t){var n=function(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return null===t&&(t=e.stateNode=new ks),t;case 22:return null===(t=(e=e.stateNode)._retryCache)&&(t=e._retryCache=new ks),t;default:throw Error(o(435,e.tag))}}(e);t.forEach((function(t){var r=hu.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}function Ts(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var a=n[r],l=e,i=t,s=i;e:for(;null!==s;){switch(s.tag){case 27:if(md(s.type)){_s=s.stateNode,Cs=!1;break e}break;case 5:_s=s.stateNode,Cs=!1;break e;case 3:case 4:_s=s.stateNode.containerInfo,Cs=!0;break e}s=s.return}if(null===_s)throw Error(o(160));Ps(l,i,a),_s=null,Cs=!1,null!==(l=a.alternate)&&(l.return=null),a.return=null}if(13878&t.subtreeFlags)for(t=t.child;null!==t;)Rs(t,e),t=t.sibling}var Ms=null;function Rs(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:Ts(t,e),Os(e),4&r&&(is(3,e,e.return),os(3,e),is(5,e,e.return));break;case 1:Ts(t,e),Os(e),512&r&&(xs||null===n||ds(n,n.return)),64&r&&ys&&(null!==(e=e.updateQueue)&&(null!==(r=e.callbacks)&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=null===n?r:n.concat(r))));break;case 26:var a=Ms;if(Ts(t,e),Os(e),512&r&&(xs||null===n||ds(n,n.return)),4&r){var l=null!==n?n.memoizedState:null;if(r=e.memoizedState,null===n)if(null===r)if(null===e.stateNode){e:{r=e.type,n=e.memoizedProps,a=a.ownerDocument||a;t:switch(r){case"title":(!(l=a.getElementsByTagName("title")[0])||l[He]||l[Te]||"http://www.w3.org/2000/svg"===l.namespaceURI||l.hasAttribute("itemprop"))&&(l=a.createElement(r),a.head.insertBefore(l,a.querySelector("head > title"))),ed(l,r,n),l[Te]=e,qe(l),r=l;break e;case"link":var i=Hd("link","href",a).get(r+(n.href||""));if(i)for(var s=0;s<i.length;s++)if((l=i[s]).getAttribute("href")===(null==n.href||""===n.href?null:n.href)&&l.getAttribute("rel")===(null==n.rel?null:n.rel)&&l.getAttribute("title")===(null==n.title?null:n.title)&&l.getAttribute("crossorigin")===(null==n.crossOrigin?null:n.crossOrigin)){i.splice(s,1);break t}ed(l=a.createElement(r),r,n),a.head.appendChild(l);break;case"meta":if(i=Hd("meta","content",a).get(r+(n.content||"")))for(s=0;s<i.length;s++)if((l=i[s]).getAttribute("content")===(null==n.content?null:""+n.content)&&l.getAttribute("name")===(null==n.name?null:n.name)&&l.getAttribute("property")===(null==n.property?null:n.property)&&l.getAttribute("http-equiv")===(null==n.httpEquiv?null:n.httpEquiv)&&l.getAttribute("charset")===(null==n.charSet?null:n.charSet)){i.splice(s,1);break t}ed(l=a.createElement(r),r,n),a.head.appendChild(l);break;default:throw Error(o(468,r))}l[Te]=e,qe(l),r=l}e.stateNode=r}else Id(a,e.type,e.stateNode);else e.stateNode=Rd(a,r,e.memoizedProps);else l!==r?(null===l?null!==n.stateNode&&(n=n.stateNode).parentNode.removeChild(n):l.count--,null===r?Id(a,e.type,e.stateNode):Rd(a,r,e.memoizedProps)):null===r&&null!==e.stateNode&&ms(e,e.memoizedProps,n.memoizedProps)}break;case 27:Ts(t,e),Os(e),512&r&&(xs||null===n||ds(n,n.return)),null!==n&&4&r&&ms(e,e.memoizedProps,n.memoizedProps);break;case 5:if(Ts(t,e),Os(e),512&r&&(xs||null===n||ds(n,n.return)),32&e.flags){a=e.stateNode;try{kt(a,"")}catch(p){uu(e,e.return,p)}}4&r&&null!=e.stateNode&&ms(e,a=e.memoizedProps,null!==n?n.memoizedProps:a),1024&r&&(ws=!0);break;case 6:if(Ts(t,e),Os(e),4&r){if(null===e.stateNode)throw Error(o(162));r=e.memoizedProps,n=e.stateNode;try{n.nodeValue=r}catch(p){uu(e,e.return,p)}}break;case 3:if(Dd=null,a=Ms,Ms=Nd(t.containerInfo),Ts(t,e),Ms=a,Os(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Ef(t.containerInfo)}catch(p){uu(e,e.return,p)}ws&&(ws=!1,As(e));break;case 4:r=Ms,Ms=Nd(e.stateNode.containerInfo),Ts(t,e),Os(e),Ms=r;break;case 12:default:Ts(t,e),Os(e);break;case 13:Ts(t,e),Os(e),8192&e.child.flags&&null!==e.memoizedState!==(null!==n&&null!==n.memoizedState)&&(wc=te()),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,zs(e,r)));break;case 22:a=null!==e.memoizedState;var c=null!==n&&null!==n.memoizedState,u=ys,d=xs;if(ys=u||a,xs=d||c,Ts(t,e),xs=d,ys=u,Os(e),8192&r)e:for(t=e.stateNode,t._visibility=a?-2&t._visibility:1|t._visibility,a&&(null===n||c||ys||xs||Ds(e)),n=null,t=e;;){if(5===t.tag||26===t.tag){if(null===n){c=n=t;try{if(l=c.stateNode,a)"function"===typeof(i=l.style).setProperty?i.setProperty("display","none","important"):i.display="none";else{s=c.stateNode;var f=c.memoizedProps.style,m=void 0!==f&&null!==f&&f.hasOwnProperty("display")?f.display:null;s.style.display=null==m||"boolean"===typeof m?"":(""+m).trim()}}catch(p){uu(c,c.return,p)}}}else if(6===t.tag){if(null===n){c=t;try{c.stateNode.nodeValue=a?"":c.memoizedProps}catch(p){uu(c,c.return,p)}}}else if((22!==t.tag&&23!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;null===t.sibling;){if(null===t.return||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}4&r&&(null!==(r=e.updateQueue)&&(null!==(n=r.retryQueue)&&(r.retryQueue=null,zs(e,n))));break;case 19:Ts(t,e),Os(e),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,zs(e,r)));case 30:case 21:}}function Os(e){var t=e.flags;if(2&t){try{for(var n,r=e.return;null!==r;){if(ps(r)){n=r;break}r=r.return}if(null==n)throw Error(o(160));switch(n.tag){case 27:var a=n.stateNode;vs(e,hs(e),a);break;case 5:var l=n.stateNode;32&n.flags&&(kt(l,""),n.flags&=-33),vs(e,hs(e),l);break;case 3:case 4:var i=n.stateNode.containerInfo;gs(e,hs(e),i);break;default:throw Error(o(161))}}catch(s){uu(e,e.return,s)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function As(e){if(1024&e.subtreeFlags)for(e=e.child;null!==e;){var t=e;As(t),5===t.tag&&1024&t.flags&&t.stateNode.reset(),e=e.sibling}}function Fs(e,t){if(8772&t.subtreeFlags)for(t=t.child;null!==t;)Ns(e,t.alternate,t),t=t.sibling}function Ds(e){for(e=e.child;null!==e;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:is(4,t,t.return),Ds(t);break;case 1:ds(t,t.return);var n=t.stateNode;"function"===typeof n.componentWillUnmount&&cs(t,t.return,n),Ds(t);break;case 27:wd(t.stateNode);case 26:case 5:ds(t,t.return),Ds(t);break;case 22:null===t.memoizedState&&Ds(t);break;default:Ds(t)}e=e.sibling}}function Hs(e,t,n){for(n=n&&0!==(8772&t.subtreeFlags),t=t.child;null!==t;){var r=t.alternate,a=e,l=t,o=l.flags;switch(l.tag){case 0:case 11:case 15:Hs(a,l,n),os(4,l);break;case 1:if(Hs(a,l,n),"function"===typeof(a=(r=l).stateNode).componentDidMount)try{a.componentDidMount()}catch(c){uu(r,r.return,c)}if(null!==(a=(r=l).updateQueue)){var i=r.stateNode;try{var s=a.shared.hiddenCallbacks;if(null!==s)for(a.shared.hiddenCallbacks=null,a=0;a<s.length;a++)dl(s[a],i)}catch(c){uu(r,r.return,c)}}n&&64&o&&ss(l),us(l,l.return);break;case 27:bs(l);case 26:case 5:Hs(a,l,n),n&&null===r&&4&o&&fs(l),us(l,l.return);break;case 12:Hs(a,l,n);break;case 13:Hs(a,l,n),n&&4&o&&Ls(a,l);break;case 22:null===l.memoizedState&&Hs(a,l,n),us(l,l.return);break;case 30:break;default:Hs(a,l,n)}t=t.sibling}}function Is(e,t){var n=null;null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),e=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(e=t.memoizedState.cachePool.pool),e!==n&&(null!=e&&e.refCount++,null!=n&&Ra(n))}function Us(e,t){e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&Ra(e))}function Bs(e,t,n,r){if(10256&t.subtreeFlags)for(t=t.child;null!==t;)Vs(e,t,n,r),t=t.sibling}function Vs(e,t,n,r){var a=t.flags;switch(t.tag){case 0:case 11:case 15:Bs(e,t,n,r),2048&a&&os(9,t);break;case 1:case 13:default:Bs(e,t,n,r);break;case 3:Bs(e,t,n,r),2048&a&&(e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&Ra(e)));break;case 12:if(2048&a){Bs(e,t,n,r),e=t.stateNode;try{var l=t.memoizedProps,o=l.id,i=l.onPostCommit;"function"===typeof i&&i(o,null===t.alternate?"mount":"update",e.passiveEffectDuration,-0)}catch(s){uu(t,t.return,s)}}else Bs(e,t,n,r);break;case 23:break;case 22:l=t.stateNode,o=t.alternate,null!==t.memoizedState?2&l._visibility?Bs(e,t,n,r):qs(e,t):2&l._visibility?Bs(e,t,n,r):(l._visibility|=2,Ws(e,t,n,r,0!==(10256&t.subtreeFlags))),2048&a&&Is(o,t);break;case 24:Bs(e,t,n,r),2048&a&&Us(t.alternate,t)}}function Ws(e,t,n,r,a){for(a=a&&0!==(10256&t.subtreeFlags),t=t.child;null!==t;){var l=e,o=t,i=n,s=r,c=o.flags;switch(o.tag){case 0:case 11:case 15:Ws(l,o,i,s,a),os(8,o);break;case 23:break;case 22:var u=o.stateNode;null!==o.memoizedState?2&u._visibility?Ws(l,o,i,s,a):qs(l,o):(u._visibility|=2,Ws(l,o,i,s,a)),a&&2048&c&&Is(o.alternate,o);break;case 24:Ws(l,o,i,s,a),a&&2048&c&&Us(o.alternate,o);break;default:Ws(l,o,i,s,a)}t=t.sibling}}function qs(e,t){if(10256&t.subtreeFlags)for(t=t.child;null!==t;){var n=e,r=t,a=r.flags;switch(r.tag){case 22:qs(n,r),2048&a&&Is(r.alternate,r);break;case 24:qs(n,r),2048&a&&Us(r.alternate,r);break;default:qs(n,r)}t=t.sibling}}var $s=8192;function Qs(e){if(e.subtreeFlags&$s)for(e=e.child;null!==e;)Gs(e),e=e.sibling}function Gs(e){switch(e.tag){case 26:Qs(e),e.flags&$s&&null!==e.memoizedState&&function(e,t,n){if(null===Bd)throw Error(o(475));var r=Bd;if("stylesheet"===t.type&&("string"!==typeof n.media||!1!==matchMedia(n.media).matches)&&0===(4&t.state.loading)){if(null===t.instance){var a=Pd(n.href),l=e.querySelector(Ld(a));if(l)return null!==(e=l._p)&&"object"===typeof e&&"function"===typeof e.then&&(r.count++,r=Wd.bind(r),e.then(r,r)),t.state.loading|=4,t.instance=l,void qe(l);l=e.ownerDocument||e,n=zd(n),(a=kd.get(a))&&Ad(n,a),qe(l=l.createElement("link"));var i=l;i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),ed(l,"link",n),t.instance=l}null===r.stylesheets&&(r.stylesheets=new Map),r.stylesheets.set(t,e),(e=t.state.preload)&&0===(3&t.state.loading)&&(r.count++,t=Wd.bind(r),e.addEventListener("load",t),e.addEventListener("error",t))}}(Ms,e.memoizedState,e.memoizedProps);break;case 5:default:Qs(e);break;case 3:case 4:var t=Ms;Ms=Nd(e.stateNode.containerInfo),Qs(e),Ms=t;break;case 22:null===e.memoizedState&&(null!==(t=e.alternate)&&null!==t.memoizedState?(t=$s,$s=16777216,Qs(e),$s=t):Qs(e))}}function Ys(e){var t=e.alternate;if(null!==t&&null!==(e=t.child)){t.child=null;do{t=e.sibling,e.sibling=null,e=t}while(null!==e)}}function Ks(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];js=r,Zs(r,e)}Ys(e)}if(10256&e.subtreeFlags)for(e=e.child;null!==e;)Js(e),e=e.sibling}function Js(e){switch(e.tag){case 0:case 11:case 15:Ks(e),2048&e.flags&&is(9,e,e.return);break;case 3:case 12:default:Ks(e);break;case 22:var t=e.stateNode;null!==e.memoizedState&&2&t._visibility&&(null===e.return||13!==e.return.tag)?(t._visibility&=-3,Xs(e)):Ks(e)}}function Xs(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];js=r,Zs(r,e)}Ys(e)}for(e=e.child;null!==e;){switch((t=e).tag){case 0:case 11:case 15:is(8,t,t.return),Xs(t);break;case 22:2&(n=t.stateNode)._visibility&&(n._visibility&=-3,Xs(t));break;default:Xs(t)}e=e.sibling}}function Zs(e,t){for(;null!==js;){var n=js;switch(n.tag){case 0:case 11:case 15:is(8,n,t);break;case 23:case 22:if(null!==n.memoizedState&&null!==n.memoizedState.cachePool){var r=n.memoizedState.cachePool.pool;null!=r&&r.refCount++}break;case 24:Ra(n.memoizedState.cache)}if(null!==(r=n.child))r.return=n,js=r;else e:for(n=e;null!==js;){var a=(r=js).sibling,l=r.return;if(Ss(r),r===n){js=null;break e}if(null!==a){a.return=l,js=a;break e}js=l}}}var ec={getCacheForType:function(e){var t=_a(Ta),n=t.data.get(e);return void 0===n&&(n=e(),t.data.set(e,n)),n}},tc="function"===typeof WeakMap?WeakMap:Map,nc=0,rc=null,ac=null,lc=0,oc=0,ic=null,sc=!1,cc=!1,uc=!1,dc=0,fc=0,mc=0,pc=0,hc=0,gc=0,vc=0,bc=null,yc=null,xc=!1,wc=0,kc=1/0,jc=null,Nc=null,Sc=0,_c=null,Cc=null,Ec=0,Pc=0,Lc=null,zc=null,Tc=0,Mc=null;function Rc(){if(0!==(2&nc)&&0!==lc)return lc&-lc;if(null!==R.T){return 0!==Fa?Fa:Pu()}return Le()}function Oc(){0===gc&&(gc=0===(536870912&lc)||la?ke():536870912);var e=ai.current;return null!==e&&(e.flags|=32),gc}function Ac(e,t,n){(e!==rc||2!==oc&&9!==oc)&&null===e.cancelPendingCommit||(Vc(e,0),Ic(e,lc,gc,!1)),Se(e,n),0!==(2&nc)&&e===rc||(e===rc&&(0===(2&nc)&&(pc|=n),4===fc&&Ic(e,lc,gc,!1)),ku(e))}function Fc(e,t,n){if(0!==(6&nc))throw Error(o(327));for(var r=!n&&0===(124&t)&&0===(t&e.expiredLanes)||xe(e,t),a=r?function(e,t){var n=nc;nc|=2;var r=qc(),a=$c();rc!==e||lc!==t?(jc=null,kc=te()+500,Vc(e,t)):cc=xe(e,t);e:for(;;)try{if(0!==oc&&null!==ac){t=ac;var l=ic;t:switch(oc){case 1:oc=0,ic=null,Zc(e,t,l,1);break;case 2:case 9:if(Ya(l)){oc=0,ic=null,Xc(t);break}t=function(){2!==oc&&9!==oc||rc!==e||(oc=7),ku(e)},l.then(t,t);break e;case 3:oc=7;break e;case 4:oc=5;break e;case 7:Ya(l)?(oc=0,ic=null,Xc(t)):(oc=0,ic=null,Zc(e,t,l,7));break;case 5:var i=null;switch(ac.tag){case 26:i=ac.memoizedState;case 5:case 27:var s=ac;if(!i||Ud(i)){oc=0,ic=null;var c=s.sibling;if(null!==c)ac=c;else{var u=s.return;null!==u?(ac=u,eu(u)):ac=null}break t}}oc=0,ic=null,Zc(e,t,l,5);break;case 6:oc=0,ic=null,Zc(e,t,l,6);break;case 8:Bc(),fc=6;break e;default:throw Error(o(462))}}Kc();break}catch(d){Wc(e,d)}return ba=va=null,R.H=r,R.A=a,nc=n,null!==ac?0:(rc=null,lc=0,Er(),fc)}(e,t):Gc(e,t,!0),l=r;;){if(0===a){cc&&!r&&Ic(e,t,0,!1);break}if(n=e.current.alternate,!l||Hc(n)){if(2===a){if(l=t,e.errorRecoveryDisabledLanes&l)var i=0;else i=0!==(i=-536870913&e.pendingLanes)?i:536870912&i?536870912:0;if(0!==i){t=i;e:{var s=e;a=bc;var c=s.current.memoizedState.isDehydrated;if(c&&(Vc(s,i).flags|=256),2!==(i=Gc(s,i,!1))){if(uc&&!c){s.errorRecoveryDisabledLanes|=l,pc|=l,a=4;break e}l=yc,yc=a,null!==l&&(null===yc?yc=l:yc.push.apply(yc,l))}a=i}if(l=!1,2!==a)continue}}if(1===a){Vc(e,0),Ic(e,t,0,!0);break}e:{switch(r=e,l=a){case 0:case 1:throw Error(o(345));case 4:if((4194048&t)!==t)break;case 6:Ic(r,t,gc,!sc);break e;case 2:yc=null;break;case 3:case 5:break;default:throw Error(o(329))}if((62914560&t)===t&&10<(a=wc+300-te())){if(Ic(r,t,gc,!sc),0!==ye(r,0,!0))break e;r.timeoutHandle=sd(Dc.bind(null,r,n,yc,jc,xc,t,gc,pc,vc,sc,l,2,-0,0),a)}else Dc(r,n,yc,jc,xc,t,gc,pc,vc,sc,l,0,-0,0)}break}a=Gc(e,t,!1),l=!1}ku(e)}function Dc(e,t,n,r,a,l,i,s,c,u,d,f,m,p){if(e.timeoutHandle=-1,(8192&(f=t.subtreeFlags)||16785408===(16785408&f))&&(Bd={stylesheets:null,count:0,unsuspend:Vd},Gs(t),null!==(f=function(){if(null===Bd)throw Error(o(475));var e=Bd;return e.stylesheets&&0===e.count&&$d(e,e.stylesheets),0<e.count?function(t){var n=setTimeout((function(){if(e.stylesheets&&$d(e,e.stylesheets),e.unsuspend){var t=e.unsuspend;e.unsuspend=null,t()}}),6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(n)}}:null}())))return e.cancelPendingCommit=f(nu.bind(null,e,t,l,n,r,a,i,s,c,d,1,m,p)),void Ic(e,l,i,!u);nu(e,t,l,n,r,a,i,s,c)}function Hc(e){for(var t=e;;){var n=t.tag;if((0===n||11===n||15===n)&&16384&t.flags&&(null!==(n=t.updateQueue)&&null!==(n=n.stores)))for(var r=0;r<n.length;r++){var a=n[r],l=a.getSnapshot;a=a.value;try{if(!Yn(l(),a))return!1}catch(o){return!1}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ic(e,t,n,r){t&=~hc,t&=~pc,e.suspendedLanes|=t,e.pingedLanes&=~t,r&&(e.warmLanes|=t),r=e.expirationTimes;for(var a=t;0<a;){var l=31-me(a),o=1<<l;r[l]=-1,a&=~o}0!==n&&_e(e,n,t)}function Uc(){return 0!==(6&nc)||(ju(0,!1),!1)}function Bc(){if(null!==ac){if(0===oc)var e=ac.return;else ba=va=null,Fl(e=ac),Yo=null,Ko=0,e=ac;for(;null!==e;)ls(e.alternate,e),e=e.return;ac=null}}function Vc(e,t){var n=e.timeoutHandle;-1!==n&&(e.timeoutHandle=-1,cd(n)),null!==(n=e.cancelPendingCommit)&&(e.cancelPendingCommit=null,n()),Bc(),rc=e,ac=n=Dr(e.current,null),lc=t,oc=0,ic=null,sc=!1,cc=xe(e,t),uc=!1,vc=gc=hc=pc=mc=fc=0,yc=bc=null,xc=!1,0!==(8&t)&&(t|=32&t);var r=e.entangledLanes;if(0!==r)for(e=e.entanglements,r&=t;0<r;){var a=31-me(r),l=1<<a;t|=e[a],r&=~l}return dc=t,Er(),n}function Wc(e,t){yl=null,R.H=qo,t===qa||t===Qa?(t=Za(),oc=3):t===$a?(t=Za(),oc=4):oc=t===_i?8:null!==t&&"object"===typeof t&&"function"===typeof t.then?6:1,ic=t,null===ac&&(fc=1,wi(e,Nr(t,e.current)))}function qc(){var e=R.H;return R.H=qo,null===e?qo:e}function $c(){var e=R.A;return R.A=ec,e}function Qc(){fc=4,sc||(4194048&lc)!==lc&&null!==ai.current||(cc=!0),0===(134217727&mc)&&0===(134217727&pc)||null===rc||Ic(rc,lc,gc,!1)}function Gc(e,t,n){var r=nc;nc|=2;var a=qc(),l=$c();rc===e&&lc===t||(jc=null,Vc(e,t)),t=!1;var o=fc;e:for(;;)try{if(0!==oc&&null!==ac){var i=ac,s=ic;switch(oc){case 8:Bc(),o=6;break e;case 3:case 2:case 9:case 6:null===ai.current&&(t=!0);var c=oc;if(oc=0,ic=null,Zc(e,i,s,c),n&&cc){o=0;break e}break;default:c=oc,oc=0,ic=null,Zc(e,i,s,c)}}Yc(),o=fc;break}catch(u){Wc(e,u)}return t&&e.shellSuspendCounter++,ba=va=null,nc=r,R.H=a,R.A=l,null===ac&&(rc=null,lc=0,Er()),o}function Yc(){for(;null!==ac;)Jc(ac)}function Kc(){for(;null!==ac&&!Z();)Jc(ac)}function Jc(e){var t=Ji(e.alternate,e,dc);e.memoizedProps=e.pendingProps,null===t?eu(e):ac=t}function Xc(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=Ai(n,t,t.pendingProps,t.type,void 0,lc);break;case 11:t=Ai(n,t,t.pendingProps,t.type.render,t.ref,lc);break;case 5:Fl(t);default:ls(n,t),t=Ji(n,t=ac=Hr(t,dc),dc)}e.memoizedProps=e.pendingProps,null===t?eu(e):ac=t}function Zc(e,t,n,r){ba=va=null,Fl(t),Yo=null,Ko=0;var a=t.return;try{if(function(e,t,n,r,a){if(n.flags|=32768,null!==r&&"object"===typeof r&&"function"===typeof r.then){if(null!==(t=n.alternate)&&ja(t,n,a,!0),null!==(n=ai.current)){switch(n.tag){case 13:return null===li?Qc():null===n.alternate&&0===fc&&(fc=3),n.flags&=-257,n.flags|=65536,n.lanes=a,r===Ga?n.flags|=16384:(null===(t=n.updateQueue)?n.updateQueue=new Set([r]):t.add(r),du(e,r,a)),!1;case 22:return n.flags|=65536,r===Ga?n.flags|=16384:(null===(t=n.updateQueue)?(t={transitions:null,markerInstances:null,retryQueue:new Set([r])},n.updateQueue=t):null===(n=t.retryQueue)?t.retryQueue=new Set([r]):n.add(r),du(e,r,a)),!1}throw Error(o(435,n.tag))}return du(e,r,a),Qc(),!1}if(la)return null!==(t=ai.current)?(0===(65536&t.flags)&&(t.flags|=256),t.flags|=65536,t.lanes=a,r!==sa&&ha(Nr(e=Error(o(422),{cause:r}),n))):(r!==sa&&ha(Nr(t=Error(o(423),{cause:r}),n)),(e=e.current.alternate).flags|=65536,a&=-a,e.lanes|=a,r=Nr(r,n),il(e,a=ji(e.stateNode,r,a)),4!==fc&&(fc=2)),!1;var l=Error(o(520),{cause:r});if(l=Nr(l,n),null===bc?bc=[l]:bc.push(l),4!==fc&&(fc=2),null===t)return!0;r=Nr(r,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=a&-a,n.lanes|=e,il(n,e=ji(n.stateNode,r,e)),!1;case 1:if(t=n.type,l=n.stateNode,0===(128&n.flags)&&("function"===typeof t.getDerivedStateFromError||null!==l&&"function"===typeof l.componentDidCatch&&(null===Nc||!Nc.has(l))))return n.flags|=65536,a&=-a,n.lanes|=a,Si(a=Ni(a),e,n,r),il(n,a),!1}n=n.return}while(null!==n);return!1}(e,a,t,n,lc))return fc=1,wi(e,Nr(n,e.current)),void(ac=null)}catch(l){if(null!==a)throw ac=a,l;return fc=1,wi(e,Nr(n,e.current)),void(ac=null)}32768&t.flags?(la||1===r?e=!0:cc||0!==(536870912&lc)?e=!1:(sc=e=!0,(2===r||9===r||3===r||6===r)&&(null!==(r=ai.current)&&13===r.tag&&(r.flags|=16384))),tu(t,e)):eu(t)}function eu(e){var t=e;do{if(0!==(32768&t.flags))return void tu(t,sc);e=t.return;var n=rs(t.alternate,t,dc);if(null!==n)return void(ac=n);if(null!==(t=t.sibling))return void(ac=t);ac=t=e}while(null!==t);0===fc&&(fc=5)}function tu(e,t){do{var n=as(e.alternate,e);if(null!==n)return n.flags&=32767,void(ac=n);if(null!==(n=e.return)&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&null!==(e=e.sibling))return void(ac=e);ac=e=n}while(null!==e);fc=6,ac=null}function nu(e,t,n,r,a,l,i,s,c){e.cancelPendingCommit=null;do{iu()}while(0!==Sc);if(0!==(6&nc))throw Error(o(327));if(null!==t){if(t===e.current)throw Error(o(177));if(l=t.lanes|t.childLanes,function(e,t,n,r,a,l){var o=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var i=e.entanglements,s=e.expirationTimes,c=e.hiddenUpdates;for(n=o&~n;0<n;){var u=31-me(n),d=1<<u;i[u]=0,s[u]=-1;var f=c[u];if(null!==f)for(c[u]=null,u=0;u<f.length;u++){var m=f[u];null!==m&&(m.lane&=-536870913)}n&=~d}0!==r&&_e(e,r,0),0!==l&&0===a&&0!==e.tag&&(e.suspendedLanes|=l&~(o&~t))}(e,n,l|=Cr,i,s,c),e===rc&&(ac=rc=null,lc=0),Cc=t,_c=e,Ec=n,Pc=l,Lc=a,zc=r,0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?(e.callbackNode=null,e.callbackPriority=0,J(le,(function(){return su(),null}))):(e.callbackNode=null,e.callbackPriority=0),r=0!==(13878&t.flags),0!==(13878&t.subtreeFlags)||r){r=R.T,R.T=null,a=O.p,O.p=2,i=nc,nc|=4;try{!function(e,t){if(e=e.containerInfo,td=nf,tr(e=er(e))){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var a=r.anchorOffset,l=r.focusNode;r=r.focusOffset;try{n.nodeType,l.nodeType}catch(g){n=null;break e}var i=0,s=-1,c=-1,u=0,d=0,f=e,m=null;t:for(;;){for(var p;f!==n||0!==a&&3!==f.nodeType||(s=i+a),f!==l||0!==r&&3!==f.nodeType||(c=i+r),3===f.nodeType&&(i+=f.nodeValue.length),null!==(p=f.firstChild);)m=f,f=p;for(;;){if(f===e)break t;if(m===n&&++u===a&&(s=i),m===l&&++d===r&&(c=i),null!==(p=f.nextSibling))break;m=(f=m).parentNode}f=p}n=-1===s||-1===c?null:{start:s,end:c}}else n=null}n=n||{start:0,end:0}}else n=null;for(nd={focusedElem:e,selectionRange:n},nf=!1,js=t;null!==js;)if(e=(t=js).child,0!==(1024&t.subtreeFlags)&&null!==e)e.return=t,js=e;else for(;null!==js;){switch(l=(t=js).alternate,e=t.flags,t.tag){case 0:case 11:case 15:case 5:case 26:case 27:case 6:case 4:case 17:break;case 1:if(0!==(1024&e)&&null!==l){e=void 0,n=t,a=l.memoizedProps,l=l.memoizedState,r=n.stateNode;try{var h=gi(n.type,a,(n.elementType,n.type));e=r.getSnapshotBeforeUpdate(h,l),r.__reactInternalSnapshotBeforeUpdate=e}catch(v){uu(n,n.return,v)}}break;case 3:if(0!==(1024&e))if(9===(n=(e=t.stateNode.containerInfo).nodeType))hd(e);else if(1===n)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":hd(e);break;default:e.textContent=""}break;default:if(0!==(1024&e))throw Error(o(163))}if(null!==(e=t.sibling)){e.return=t.return,js=e;break}js=t.return}}(e,t)}finally{nc=i,O.p=a,R.T=r}}Sc=1,ru(),au(),lu()}}function ru(){if(1===Sc){Sc=0;var e=_c,t=Cc,n=0!==(13878&t.flags);if(0!==(13878&t.subtreeFlags)||n){n=R.T,R.T=null;var r=O.p;O.p=2;var a=nc;nc|=4;try{Rs(t,e);var l=nd,o=er(e.containerInfo),i=l.focusedElem,s=l.selectionRange;if(o!==i&&i&&i.ownerDocument&&Zn(i.ownerDocument.documentElement,i)){if(null!==s&&tr(i)){var c=s.start,u=s.end;if(void 0===u&&(u=c),"selectionStart"in i)i.selectionStart=c,i.selectionEnd=Math.min(u,i.value.length);else{var d=i.ownerDocument||document,f=d&&d.defaultView||window;if(f.getSelection){var m=f.getSelection(),p=i.textContent.length,h=Math.min(s.start,p),g=void 0===s.end?h:Math.min(s.end,p);!m.extend&&h>g&&(o=g,g=h,h=o);var v=Xn(i,h),b=Xn(i,g);if(v&&b&&(1!==m.rangeCount||m.anchorNode!==v.node||m.anchorOffset!==v.offset||m.focusNode!==b.node||m.focusOffset!==b.offset)){var y=d.createRange();y.setStart(v.node,v.offset),m.removeAllRanges(),h>g?(m.addRange(y),m.extend(b.node,b.offset)):(y.setEnd(b.node,b.offset),m.addRange(y))}}}}for(d=[],m=i;m=m.parentNode;)1===m.nodeType&&d.push({element:m,left:m.scrollLeft,top:m.scrollTop});for("function"===typeof i.focus&&i.focus(),i=0;i<d.length;i++){var x=d[i];x.element.scrollLeft=x.left,x.element.scrollTop=x.top}}nf=!!td,nd=td=null}finally{nc=a,O.p=r,R.T=n}}e.current=t,Sc=2}}function au(){if(2===Sc){Sc=0;var e=_c,t=Cc,n=0!==(8772&t.flags);if(0!==(8772&t.subtreeFlags)||n){n=R.T,R.T=null;var r=O.p;O.p=2;var a=nc;nc|=4;try{Ns(e,t.alternate,t)}finally{nc=a,O.p=r,R.T=n}}Sc=3}}function lu(){if(4===Sc||3===Sc){Sc=0,ee();var e=_c,t=Cc,n=Ec,r=zc;0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?Sc=5:(Sc=0,Cc=_c=null,ou(e,e.pendingLanes));var a=e.pendingLanes;if(0===a&&(Nc=null),Pe(n),t=t.stateNode,de&&"function"===typeof de.onCommitFiberRoot)try{de.onCommitFiberRoot(ue,t,void 0,128===(128&t.current.flags))}catch(s){}if(null!==r){t=R.T,a=O.p,O.p=2,R.T=null;try{for(var l=e.onRecoverableError,o=0;o<r.length;o++){var i=r[o];l(i.value,{componentStack:i.stack})}}finally{R.T=t,O.p=a}}0!==(3&Ec)&&iu(),ku(e),a=e.pendingLanes,0!==(4194090&n)&&0!==(42&a)?e===Mc?Tc++:(Tc=0,Mc=e):Tc=0,ju(0,!1)}}function ou(e,t){0===(e.pooledCacheLanes&=t)&&(null!=(t=e.pooledCache)&&(e.pooledCache=null,Ra(t)))}function iu(e){return ru(),au(),lu(),su()}function su(){if(5!==Sc)return!1;var e=_c,t=Pc;Pc=0;var n=Pe(Ec),r=R.T,a=O.p;try{O.p=32>n?32:n,R.T=null,n=Lc,Lc=null;var l=_c,i=Ec;if(Sc=0,Cc=_c=null,Ec=0,0!==(6&nc))throw Error(o(331));var s=nc;if(nc|=4,Js(l.current),Vs(l,l.current,i,n),nc=s,ju(0,!1),de&&"function"===typeof de.onPostCommitFiberRoot)try{de.onPostCommitFiberRoot(ue,l)}catch(c){}return!0}finally{O.p=a,R.T=r,ou(e,t)}}function cu(e,t,n){t=Nr(n,t),null!==(e=ll(e,t=ji(e.stateNode,t,2),2))&&(Se(e,2),ku(e))}function uu(e,t,n){if(3===e.tag)cu(e,e,n);else for(;null!==t;){if(3===t.tag){cu(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Nc||!Nc.has(r))){e=Nr(n,e),null!==(r=ll(t,n=Ni(2),2))&&(Si(n,r,t,e),Se(r,2),ku(r));break}}t=t.return}}function du(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new tc;var a=new Set;r.set(t,a)}else void 0===(a=r.get(t))&&(a=new Set,r.set(t,a));a.has(n)||(uc=!0,a.add(n),e=fu.bind(null,e,t,n),t.then(e,e))}function fu(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,rc===e&&(lc&n)===n&&(4===fc||3===fc&&(62914560&lc)===lc&&300>te()-wc?0===(2&nc)&&Vc(e,0):hc|=n,vc===lc&&(vc=0)),ku(e)}function mu(e,t){0===t&&(t=je()),null!==(e=zr(e,t))&&(Se(e,t),ku(e))}function pu(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),mu(e,n)}function hu(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,a=e.memoizedState;null!==a&&(n=a.retryLane);break;case 19:r=e.stateNode;break;case 22:r=e.stateNode._retryCache;break;default:throw Error(o(314))}null!==r&&r.delete(t),mu(e,n)}var gu=null,vu=null,bu=!1,yu=!1,xu=!1,wu=0;function ku(e){e!==vu&&null===e.next&&(null===vu?gu=vu=e:vu=vu.next=e),yu=!0,bu||(bu=!0,dd((function(){0!==(6&nc)?J(re,Nu):Su()})))}function ju(e,t){if(!xu&&yu){xu=!0;do{for(var n=!1,r=gu;null!==r;){if(!t)if(0!==e){var a=r.pendingLanes;if(0===a)var l=0;else{var o=r.suspendedLanes,i=r.pingedLanes;l=(1<<31-me(42|e)+1)-1,l=201326741&(l&=a&~(o&~i))?201326741&l|1:l?2|l:0}0!==l&&(n=!0,Eu(r,l))}else l=lc,0===(3&(l=ye(r,r===rc?l:0,null!==r.cancelPendingCommit||-1!==r.timeoutHandle)))||xe(r,l)||(n=!0,Eu(r,l));r=r.next}}while(n);xu=!1}}function Nu(){Su()}function Su(){yu=bu=!1;var e=0;0!==wu&&(function(){var e=window.event;if(e&&"popstate"===e.type)return e!==id&&(id=e,!0);return id=null,!1}()&&(e=wu),wu=0);for(var t=te(),n=null,r=gu;null!==r;){var a=r.next,l=_u(r,t);0===l?(r.next=null,null===n?gu=a:n.next=a,null===a&&(vu=n)):(n=r,(0!==e||0!==(3&l))&&(yu=!0)),r=a}ju(e,!1)}function _u(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,a=e.expirationTimes,l=-62914561&e.pendingLanes;0<l;){var o=31-me(l),i=1<<o,s=a[o];-1===s?0!==(i&n)&&0===(i&r)||(a[o]=we(i,t)):s<=t&&(e.expiredLanes|=i),l&=~i}if(n=lc,n=ye(e,e===(t=rc)?n:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle),r=e.callbackNode,0===n||e===t&&(2===oc||9===oc)||null!==e.cancelPendingCommit)return null!==r&&null!==r&&X(r),e.callbackNode=null,e.callbackPriority=0;if(0===(3&n)||xe(e,n)){if((t=n&-n)===e.callbackPriority)return t;switch(null!==r&&X(r),Pe(n)){case 2:case 8:n=ae;break;case 32:default:n=le;break;case 268435456:n=ie}return r=Cu.bind(null,e),n=J(n,r),e.callbackPriority=t,e.callbackNode=n,t}return null!==r&&null!==r&&X(r),e.callbackPriority=2,e.callbackNode=null,2}function Cu(e,t){if(0!==Sc&&5!==Sc)return e.callbackNode=null,e.callbackPriority=0,null;var n=e.callbackNode;if(iu()&&e.callbackNode!==n)return null;var r=lc;return 0===(r=ye(e,e===rc?r:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle))?null:(Fc(e,r,t),_u(e,te()),null!=e.callbackNode&&e.callbackNode===n?Cu.bind(null,e):null)}function Eu(e,t){if(iu())return null;Fc(e,t,!0)}function Pu(){return 0===wu&&(wu=ke()),wu}function Lu(e){return null==e||"symbol"===typeof e||"boolean"===typeof e?null:"function"===typeof e?e:Pt(""+e)}function zu(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}for(var Tu=0;Tu<wr.length;Tu++){var Mu=wr[Tu];kr(Mu.toLowerCase(),"on"+(Mu[0].toUpperCase()+Mu.slice(1)))}kr(mr,"onAnimationEnd"),kr(pr,"onAnimationIteration"),kr(hr,"onAnimationStart"),kr("dblclick","onDoubleClick"),kr("focusin","onFocus"),kr("focusout","onBlur"),kr(gr,"onTransitionRun"),kr(vr,"onTransitionStart"),kr(br,"onTransitionCancel"),kr(yr,"onTransitionEnd"),Ye("onMouseEnter",["mouseout","mouseover"]),Ye("onMouseLeave",["mouseout","mouseover"]),Ye("onPointerEnter",["pointerout","pointerover"]),Ye("onPointerLeave",["pointerout","pointerover"]),Ge("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ge("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ge("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ge("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ge("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ge("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ru="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Ou=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Ru));function Au(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],a=r.event;r=r.listeners;e:{var l=void 0;if(t)for(var o=r.length-1;0<=o;o--){var i=r[o],s=i.instance,c=i.currentTarget;if(i=i.listener,s!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=c;try{l(a)}catch(u){vi(u)}a.currentTarget=null,l=s}else for(o=0;o<r.length;o++){if(s=(i=r[o]).instance,c=i.currentTarget,i=i.listener,s!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=c;try{l(a)}catch(u){vi(u)}a.currentTarget=null,l=s}}}}function Fu(e,t){var n=t[Oe];void 0===n&&(n=t[Oe]=new Set);var r=e+"__bubble";n.has(r)||(Uu(t,e,2,!1),n.add(r))}function Du(e,t,n){var r=0;t&&(r|=4),Uu(n,e,r,t)}var Hu="_reactListening"+Math.random().toString(36).slice(2);function Iu(e){if(!e[Hu]){e[Hu]=!0,$e.forEach((function(t){"selectionchange"!==t&&(Ou.has(t)||Du(t,!1,e),Du(t,!0,e))}));var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Hu]||(t[Hu]=!0,Du("selectionchange",!1,t))}}function Uu(e,t,n,r){switch(uf(t)){case 2:var a=rf;break;case 8:a=af;break;default:a=lf}n=a.bind(null,t,n,e),a=void 0,!Ht||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(a=!0),r?void 0!==a?e.addEventListener(t,n,{capture:!0,passive:a}):e.addEventListener(t,n,!0):void 0!==a?e.addEventListener(t,n,{passive:a}):e.addEventListener(t,n,!1)}function Bu(e,t,n,r,a){var l=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===a)break;if(4===o)for(o=r.return;null!==o;){var c=o.tag;if((3===c||4===c)&&o.stateNode.containerInfo===a)return;o=o.return}for(;null!==i;){if(null===(o=Ue(i)))return;if(5===(c=o.tag)||6===c||26===c||27===c){r=l=o;continue e}i=i.parentNode}}r=r.return}At((function(){var r=l,a=zt(n),o=[];e:{var i=xr.get(e);if(void 0!==i){var c=Zt,u=e;switch(e){case"keypress":if(0===qt(n))break e;case"keydown":case"keyup":c=hn;break;case"focusin":u="focus",c=ln;break;case"focusout":u="blur",c=ln;break;case"beforeblur":case"afterblur":c=ln;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":c=rn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":c=an;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":c=vn;break;case mr:case pr:case hr:c=on;break;case yr:c=bn;break;case"scroll":case"scrollend":c=tn;break;case"wheel":c=yn;break;case"copy":case"cut":case"paste":c=sn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":c=gn;break;case"toggle":case"beforetoggle":c=xn}var d=0!==(4&t),f=!d&&("scroll"===e||"scrollend"===e),m=d?null!==i?i+"Capture":null:i;d=[];for(var p,h=r;null!==h;){var g=h;if(p=g.stateNode,5!==(g=g.tag)&&26!==g&&27!==g||null===p||null===m||null!=(g=Ft(h,m))&&d.push(Vu(h,g,p)),f)break;h=h.return}0<d.length&&(i=new c(i,u,null,n,a),o.push({event:i,listeners:d}))}}if(0===(7&t)){if(c="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||n===Lt||!(u=n.relatedTarget||n.fromElement)||!Ue(u)&&!u[Re])&&(c||i)&&(i=a.window===a?a:(i=a.ownerDocument)?i.defaultView||i.parentWindow:window,c?(c=r,null!==(u=(u=n.relatedTarget||n.toElement)?Ue(u):null)&&(f=s(u),d=u.tag,u!==f||5!==d&&27!==d&&6!==d)&&(u=null)):(c=null,u=r),c!==u)){if(d=rn,g="onMouseLeave",m="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(d=gn,g="onPointerLeave",m="onPointerEnter",h="pointer"),f=null==c?i:Ve(c),p=null==u?i:Ve(u),(i=new d(g,h+"leave",c,n,a)).target=f,i.relatedTarget=p,g=null,Ue(a)===r&&((d=new d(m,h+"enter",u,n,a)).target=p,d.relatedTarget=f,g=d),f=g,c&&u)e:{for(m=u,h=0,p=d=c;p;p=qu(p))h++;for(p=0,g=m;g;g=qu(g))p++;for(;0<h-p;)d=qu(d),h--;for(;0<p-h;)m=qu(m),p--;for(;h--;){if(d===m||null!==m&&d===m.alternate)break e;d=qu(d),m=qu(m)}d=null}else d=null;null!==c&&$u(o,i,c,d,!1),null!==u&&null!==f&&$u(o,f,u,d,!0)}if("select"===(c=(i=r?Ve(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===c&&"file"===i.type)var v=Dn;else if(Tn(i))if(Hn)v=Gn;else{v=$n;var b=qn}else!(c=i.nodeName)||"input"!==c.toLowerCase()||"checkbox"!==i.type&&"radio"!==i.type?r&&_t(r.elementType)&&(v=Dn):v=Qn;switch(v&&(v=v(e,r))?Mn(o,v,n,a):(b&&b(e,i,r),"focusout"===e&&r&&"number"===i.type&&null!=r.memoizedProps.value&&bt(i,"number",i.value)),b=r?Ve(r):window,e){case"focusin":(Tn(b)||"true"===b.contentEditable)&&(rr=b,ar=r,lr=null);break;case"focusout":lr=ar=rr=null;break;case"mousedown":or=!0;break;case"contextmenu":case"mouseup":case"dragend":or=!1,ir(o,n,a);break;case"selectionchange":if(nr)break;case"keydown":case"keyup":ir(o,n,a)}var y;if(kn)e:{switch(e){case"compositionstart":var x="onCompositionStart";break e;case"compositionend":x="onCompositionEnd";break e;case"compositionupdate":x="onCompositionUpdate";break e}x=void 0}else Ln?En(e,n)&&(x="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(x="onCompositionStart");x&&(Sn&&"ko"!==n.locale&&(Ln||"onCompositionStart"!==x?"onCompositionEnd"===x&&Ln&&(y=Wt()):(Bt="value"in(Ut=a)?Ut.value:Ut.textContent,Ln=!0)),0<(b=Wu(r,x)).length&&(x=new cn(x,e,null,n,a),o.push({event:x,listeners:b}),y?x.data=y:null!==(y=Pn(n))&&(x.data=y))),(y=Nn?function(e,t){switch(e){case"compositionend":return Pn(t);case"keypress":return 32!==t.which?null:(Cn=!0,_n);case"textInput":return(e=t.data)===_n&&Cn?null:e;default:return null}}(e,n):function(e,t){if(Ln)return"compositionend"===e||!kn&&En(e,t)?(e=Wt(),Vt=Bt=Ut=null,Ln=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Sn&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(x=Wu(r,"onBeforeInput")).length&&(b=new cn("onBeforeInput","beforeinput",null,n,a),o.push({event:b,listeners:x}),b.data=y)),function(e,t,n,r,a){if("submit"===t&&n&&n.stateNode===a){var l=Lu((a[Me]||null).action),o=r.submitter;o&&null!==(t=(t=o[Me]||null)?Lu(t.formAction):o.getAttribute("formAction"))&&(l=t,o=null);var i=new Zt("action","action",null,r,a);e.push({event:i,listeners:[{instance:null,listener:function(){if(r.defaultPrevented){if(0!==wu){var e=o?zu(a,o):new FormData(a);zo(n,{pending:!0,data:e,method:a.method,action:l},null,e)}}else"function"===typeof l&&(i.preventDefault(),e=o?zu(a,o):new FormData(a),zo(n,{pending:!0,data:e,method:a.method,action:l},l,e))},currentTarget:a}]})}}(o,e,r,n,a)}Au(o,t)}))}function Vu(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Wu(e,t){for(var n=t+"Capture",r=[];null!==e;){var a=e,l=a.stateNode;if(5!==(a=a.tag)&&26!==a&&27!==a||null===l||(null!=(a=Ft(e,n))&&r.unshift(Vu(e,a,l)),null!=(a=Ft(e,t))&&r.push(Vu(e,a,l))),3===e.tag)return r;e=e.return}return[]}function qu(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag&&27!==e.tag);return e||null}function $u(e,t,n,r,a){for(var l=t._reactName,o=[];null!==n&&n!==r;){var i=n,s=i.alternate,c=i.stateNode;if(i=i.tag,null!==s&&s===r)break;5!==i&&26!==i&&27!==i||null===c||(s=c,a?null!=(c=Ft(n,l))&&o.unshift(Vu(n,c,s)):a||null!=(c=Ft(n,l))&&o.push(Vu(n,c,s))),n=n.return}0!==o.length&&e.push({event:t,listeners:o})}var Qu=/\r\n?/g,Gu=/\u0000|\uFFFD/g;function Yu(e){return("string"===typeof e?e:""+e).replace(Qu,"\n").replace(Gu,"")}function Ku(e,t){return t=Yu(t),Yu(e)===t}function Ju(){}function Xu(e,t,n,r,a,l){switch(n){case"children":"string"===typeof r?"body"===t||"textarea"===t&&""===r||kt(e,r):("number"===typeof r||"bigint"===typeof r)&&"body"!==t&&kt(e,""+r);break;case"className":nt(e,"class",r);break;case"tabIndex":nt(e,"tabindex",r);break;case"dir":case"role":case"viewBox":case"width":case"height":nt(e,n,r);break;case"style":St(e,r,l);break;case"data":if("object"!==t){nt(e,"data",r);break}case"src":case"href":if(""===r&&("a"!==t||"href"!==n)){e.removeAttribute(n);break}if(null==r||"function"===typeof r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Pt(""+r),e.setAttribute(n,r);break;case"action":case"formAction":if("function"===typeof r){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}if("function"===typeof l&&("formAction"===n?("input"!==t&&Xu(e,t,"name",a.name,a,null),Xu(e,t,"formEncType",a.formEncType,a,null),Xu(e,t,"formMethod",a.formMethod,a,null),Xu(e,t,"formTarget",a.formTarget,a,null)):(Xu(e,t,"encType",a.encType,a,null),Xu(e,t,"method",a.method,a,null),Xu(e,t,"target",a.target,a,null))),null==r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Pt(""+r),e.setAttribute(n,r);break;case"onClick":null!=r&&(e.onclick=Ju);break;case"onScroll":null!=r&&Fu("scroll",e);break;case"onScrollEnd":null!=r&&Fu("scrollend",e);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"multiple":e.multiple=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"muted":e.muted=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":case"autoFocus":break;case"xlinkHref":if(null==r||"function"===typeof r||"boolean"===typeof r||"symbol"===typeof r){e.removeAttribute("xlink:href");break}n=Pt(""+r),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""+r):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":!0===r?e.setAttribute(n,""):!1!==r&&null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,r):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":null!=r&&"function"!==typeof r&&"symbol"!==typeof r&&!isNaN(r)&&1<=r?e.setAttribute(n,r):e.removeAttribute(n);break;case"rowSpan":case"start":null==r||"function"===typeof r||"symbol"===typeof r||isNaN(r)?e.removeAttribute(n):e.setAttribute(n,r);break;case"popover":Fu("beforetoggle",e),Fu("toggle",e),tt(e,"popover",r);break;case"xlinkActuate":rt(e,"http://www.w3.org/1999/xlink","xlink:actuate",r);break;case"xlinkArcrole":rt(e,"http://www.w3.org/1999/xlink","xlink:arcrole",r);break;case"xlinkRole":rt(e,"http://www.w3.org/1999/xlink","xlink:role",r);break;case"xlinkShow":rt(e,"http://www.w3.org/1999/xlink","xlink:show",r);break;case"xlinkTitle":rt(e,"http://www.w3.org/1999/xlink","xlink:title",r);break;case"xlinkType":rt(e,"http://www.w3.org/1999/xlink","xlink:type",r);break;case"xmlBase":rt(e,"http://www.w3.org/XML/1998/namespace","xml:base",r);break;case"xmlLang":rt(e,"http://www.w3.org/XML/1998/namespace","xml:lang",r);break;case"xmlSpace":rt(e,"http://www.w3.org/XML/1998/namespace","xml:space",r);break;case"is":tt(e,"is",r);break;case"innerText":case"textContent":break;default:(!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&tt(e,n=Ct.get(n)||n,r)}}function Zu(e,t,n,r,a,l){switch(n){case"style":St(e,r,l);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"children":"string"===typeof r?kt(e,r):("number"===typeof r||"bigint"===typeof r)&&kt(e,""+r);break;case"onScroll":null!=r&&Fu("scroll",e);break;case"onScrollEnd":null!=r&&Fu("scrollend",e);break;case"onClick":null!=r&&(e.onclick=Ju);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":case"innerText":case"textContent":break;default:Qe.hasOwnProperty(n)||("o"!==n[0]||"n"!==n[1]||(a=n.endsWith("Capture"),t=n.slice(2,a?n.length-7:void 0),"function"===typeof(l=null!=(l=e[Me]||null)?l[n]:null)&&e.removeEventListener(t,l,a),"function"!==typeof r)?n in e?e[n]=r:!0===r?e.setAttribute(n,""):tt(e,n,r):("function"!==typeof l&&null!==l&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,r,a)))}}function ed(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Fu("error",e),Fu("load",e);var r,a=!1,l=!1;for(r in n)if(n.hasOwnProperty(r)){var i=n[r];if(null!=i)switch(r){case"src":a=!0;break;case"srcSet":l=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:Xu(e,t,r,i,n,null)}}return l&&Xu(e,t,"srcSet",n.srcSet,n,null),void(a&&Xu(e,t,"src",n.src,n,null));case"input":Fu("invalid",e);var s=r=i=l=null,c=null,u=null;for(a in n)if(n.hasOwnProperty(a)){var d=n[a];if(null!=d)switch(a){case"name":l=d;break;case"type":i=d;break;case"checked":c=d;break;case"defaultChecked":u=d;break;case"value":r=d;break;case"defaultValue":s=d;break;case"children":case"dangerouslySetInnerHTML":if(null!=d)throw Error(o(137,t));break;default:Xu(e,t,a,d,n,null)}}return vt(e,r,s,c,u,i,l,!1),void dt(e);case"select":for(l in Fu("invalid",e),a=i=r=null,n)if(n.hasOwnProperty(l)&&null!=(s=n[l]))switch(l){case"value":r=s;break;case"defaultValue":i=s;break;case"multiple":a=s;default:Xu(e,t,l,s,n,null)}return t=r,n=i,e.multiple=!!a,void(null!=t?yt(e,!!a,t,!1):null!=n&&yt(e,!!a,n,!0));case"textarea":for(i in Fu("invalid",e),r=l=a=null,n)if(n.hasOwnProperty(i)&&null!=(s=n[i]))switch(i){case"value":a=s;break;case"defaultValue":l=s;break;case"children":r=s;break;case"dangerouslySetInnerHTML":if(null!=s)throw Error(o(91));break;default:Xu(e,t,i,s,n,null)}return wt(e,a,l,r),void dt(e);case"option":for(c in n)if(n.hasOwnProperty(c)&&null!=(a=n[c]))if("selected"===c)e.selected=a&&"function"!==typeof a&&"symbol"!==typeof a;else Xu(e,t,c,a,n,null);return;case"dialog":Fu("beforetoggle",e),Fu("toggle",e),Fu("cancel",e),Fu("close",e);break;case"iframe":case"object":Fu("load",e);break;case"video":case"audio":for(a=0;a<Ru.length;a++)Fu(Ru[a],e);break;case"image":Fu("error",e),Fu("load",e);break;case"details":Fu("toggle",e);break;case"embed":case"source":case"link":Fu("error",e),Fu("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(u in n)if(n.hasOwnProperty(u)&&null!=(a=n[u]))switch(u){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:Xu(e,t,u,a,n,null)}return;default:if(_t(t)){for(d in n)n.hasOwnProperty(d)&&(void 0!==(a=n[d])&&Zu(e,t,d,a,n,void 0));return}}for(s in n)n.hasOwnProperty(s)&&(null!=(a=n[s])&&Xu(e,t,s,a,n,null))}var td=null,nd=null;function rd(e){return 9===e.nodeType?e:e.ownerDocument}function ad(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function ld(e,t){if(0===e)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return 1===e&&"foreignObject"===t?0:e}function od(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"bigint"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var id=null;var sd="function"===typeof setTimeout?setTimeout:void 0,cd="function"===typeof clearTimeout?clearTimeout:void 0,ud="function"===typeof Promise?Promise:void 0,dd="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof ud?function(e){return ud.resolve(null).then(e).catch(fd)}:sd;function fd(e){setTimeout((function(){throw e}))}function md(e){return"head"===e}function pd(e,t){var n=t,r=0,a=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&8===l.nodeType)if("/$"===(n=l.data)){if(0<r&&8>r){n=r;var o=e.ownerDocument;if(1&n&&wd(o.documentElement),2&n&&wd(o.body),4&n)for(wd(n=o.head),o=n.firstChild;o;){var i=o.nextSibling,s=o.nodeName;o[He]||"SCRIPT"===s||"STYLE"===s||"LINK"===s&&"stylesheet"===o.rel.toLowerCase()||n.removeChild(o),o=i}}if(0===a)return e.removeChild(l),void Ef(t);a--}else"$"===n||"$?"===n||"$!"===n?a++:r=n.charCodeAt(0)-48;else r=0;n=l}while(n);Ef(t)}function hd(e){var t=e.firstChild;for(t&&10===t.nodeType&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":hd(n),Ie(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if("stylesheet"===n.rel.toLowerCase())continue}e.removeChild(n)}}function gd(e){return"$!"===e.data||"$?"===e.data&&"complete"===e.ownerDocument.readyState}function vd(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t||"F!"===t||"F"===t)break;if("/$"===t)return null}}return e}var bd=null;function yd(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}function xd(e,t,n){switch(t=rd(n),e){case"html":if(!(e=t.documentElement))throw Error(o(452));return e;case"head":if(!(e=t.head))throw Error(o(453));return e;case"body":if(!(e=t.body))throw Error(o(454));return e;default:throw Error(o(451))}}function wd(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);Ie(e)}var kd=new Map,jd=new Set;function Nd(e){return"function"===typeof e.getRootNode?e.getRootNode():9===e.nodeType?e:e.ownerDocument}var Sd=O.d;O.d={f:function(){var e=Sd.f(),t=Uc();return e||t},r:function(e){var t=Be(e);null!==t&&5===t.tag&&"form"===t.type?Mo(t):Sd.r(e)},D:function(e){Sd.D(e),Cd("dns-prefetch",e,null)},C:function(e,t){Sd.C(e,t),Cd("preconnect",e,t)},L:function(e,t,n){Sd.L(e,t,n);var r=_d;if(r&&e&&t){var a='link[rel="preload"][as="'+ht(t)+'"]';"image"===t&&n&&n.imageSrcSet?(a+='[imagesrcset="'+ht(n.imageSrcSet)+'"]',"string"===typeof n.imageSizes&&(a+='[imagesizes="'+ht(n.imageSizes)+'"]')):a+='[href="'+ht(e)+'"]';var l=a;switch(t){case"style":l=Pd(e);break;case"script":l=Td(e)}kd.has(l)||(e=f({rel:"preload",href:"image"===t&&n&&n.imageSrcSet?void 0:e,as:t},n),kd.set(l,e),null!==r.querySelector(a)||"style"===t&&r.querySelector(Ld(l))||"script"===t&&r.querySelector(Md(l))||(ed(t=r.createElement("link"),"link",e),qe(t),r.head.appendChild(t)))}},m:function(e,t){Sd.m(e,t);var n=_d;if(n&&e){var r=t&&"string"===typeof t.as?t.as:"script",a='link[rel="modulepreload"][as="'+ht(r)+'"][href="'+ht(e)+'"]',l=a;switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":l=Td(e)}if(!kd.has(l)&&(e=f({rel:"modulepreload",href:e},t),kd.set(l,e),null===n.querySelector(a))){switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(Md(l)))return}ed(r=n.createElement("link"),"link",e),qe(r),n.head.appendChild(r)}}},X:function(e,t){Sd.X(e,t);var n=_d;if(n&&e){var r=We(n).hoistableScripts,a=Td(e),l=r.get(a);l||((l=n.querySelector(Md(a)))||(e=f({src:e,async:!0},t),(t=kd.get(a))&&Fd(e,t),qe(l=n.createElement("script")),ed(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}},S:function(e,t,n){Sd.S(e,t,n);var r=_d;if(r&&e){var a=We(r).hoistableStyles,l=Pd(e);t=t||"default";var o=a.get(l);if(!o){var i={loading:0,preload:null};if(o=r.querySelector(Ld(l)))i.loading=5;else{e=f({rel:"stylesheet",href:e,"data-precedence":t},n),(n=kd.get(l))&&Ad(e,n);var s=o=r.createElement("link");qe(s),ed(s,"link",e),s._p=new Promise((function(e,t){s.onload=e,s.onerror=t})),s.addEventListener("load",(function(){i.loading|=1})),s.addEventListener("error",(function(){i.loading|=2})),i.loading|=4,Od(o,t,r)}o={type:"stylesheet",instance:o,count:1,state:i},a.set(l,o)}}},M:function(e,t){Sd.M(e,t);var n=_d;if(n&&e){var r=We(n).hoistableScripts,a=Td(e),l=r.get(a);l||((l=n.querySelector(Md(a)))||(e=f({src:e,async:!0,type:"module"},t),(t=kd.get(a))&&Fd(e,t),qe(l=n.createElement("script")),ed(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}}};var _d="undefined"===typeof document?null:document;function Cd(e,t,n){var r=_d;if(r&&"string"===typeof t&&t){var a=ht(t);a='link[rel="'+e+'"][href="'+a+'"]',"string"===typeof n&&(a+='[crossorigin="'+n+'"]'),jd.has(a)||(jd.add(a),e={rel:e,crossOrigin:n,href:t},null===r.querySelector(a)&&(ed(t=r.createElement("link"),"link",e),qe(t),r.head.appendChild(t)))}}function Ed(e,t,n,r){var a,l,i,s,c=(c=W.current)?Nd(c):null;if(!c)throw Error(o(446));switch(e){case"meta":case"title":return null;case"style":return"string"===typeof n.precedence&&"string"===typeof n.href?(t=Pd(n.href),(r=(n=We(c).hoistableStyles).get(t))||(r={type:"style",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};case"link":if("stylesheet"===n.rel&&"string"===typeof n.href&&"string"===typeof n.precedence){e=Pd(n.href);var u=We(c).hoistableStyles,d=u.get(e);if(d||(c=c.ownerDocument||c,d={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},u.set(e,d),(u=c.querySelector(Ld(e)))&&!u._p&&(d.instance=u,d.state.loading=5),kd.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},kd.set(e,n),u||(a=c,l=e,i=n,s=d.state,a.querySelector('link[rel="preload"][as="style"]['+l+"]")?s.loading=1:(l=a.createElement("link"),s.preload=l,l.addEventListener("load",(function(){return s.loading|=1})),l.addEventListener("error",(function(){return s.loading|=2})),ed(l,"link",i),qe(l),a.head.appendChild(l))))),t&&null===r)throw Error(o(528,""));return d}if(t&&null!==r)throw Error(o(529,""));return null;case"script":return t=n.async,"string"===typeof(n=n.src)&&t&&"function"!==typeof t&&"symbol"!==typeof t?(t=Td(n),(r=(n=We(c).hoistableScripts).get(t))||(r={type:"script",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,e))}}function Pd(e){return'href="'+ht(e)+'"'}function Ld(e){return'link[rel="stylesheet"]['+e+"]"}function zd(e){return f({},e,{"data-precedence":e.precedence,precedence:null})}function Td(e){return'[src="'+ht(e)+'"]'}function Md(e){return"script[async]"+e}function Rd(e,t,n){if(t.count++,null===t.instance)switch(t.type){case"style":var r=e.querySelector('style[data-href~="'+ht(n.href)+'"]');if(r)return t.instance=r,qe(r),r;var a=f({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return qe(r=(e.ownerDocument||e).createElement("style")),ed(r,"style",a),Od(r,n.precedence,e),t.instance=r;case"stylesheet":a=Pd(n.href);var l=e.querySelector(Ld(a));if(l)return t.state.loading|=4,t.instance=l,qe(l),l;r=zd(n),(a=kd.get(a))&&Ad(r,a),qe(l=(e.ownerDocument||e).createElement("link"));var i=l;return i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),ed(l,"link",r),t.state.loading|=4,Od(l,n.precedence,e),t.instance=l;case"script":return l=Td(n.src),(a=e.querySelector(Md(l)))?(t.instance=a,qe(a),a):(r=n,(a=kd.get(l))&&Fd(r=f({},n),a),qe(a=(e=e.ownerDocument||e).createElement("script")),ed(a,"link",r),e.head.appendChild(a),t.instance=a);case"void":return null;default:throw Error(o(443,t.type))}else"stylesheet"===t.type&&0===(4&t.state.loading)&&(r=t.instance,t.state.loading|=4,Od(r,n.precedence,e));return t.instance}function Od(e,t,n){for(var r=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),a=r.length?r[r.length-1]:null,l=a,o=0;o<r.length;o++){var i=r[o];if(i.dataset.precedence===t)l=i;else if(l!==a)break}l?l.parentNode.insertBefore(e,l.nextSibling):(t=9===n.nodeType?n.head:n).insertBefore(e,t.firstChild)}function Ad(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.title&&(e.title=t.title)}function Fd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.integrity&&(e.integrity=t.integrity)}var Dd=null;function Hd(e,t,n){if(null===Dd){var r=new Map,a=Dd=new Map;a.set(n,r)}else(r=(a=Dd).get(n))||(r=new Map,a.set(n,r));if(r.has(e))return r;for(r.set(e,null),n=n.getElementsByTagName(e),a=0;a<n.length;a++){var l=n[a];if(!(l[He]||l[Te]||"link"===e&&"stylesheet"===l.getAttribute("rel"))&&"http://www.w3.org/2000/svg"!==l.namespaceURI){var o=l.getAttribute(t)||"";o=e+o;var i=r.get(o);i?i.push(l):r.set(o,[l])}}return r}function Id(e,t,n){(e=e.ownerDocument||e).head.insertBefore(n,"title"===t?e.querySelector("head > title"):null)}function Ud(e){return"stylesheet"!==e.type||0!==(3&e.state.loading)}var Bd=null;function Vd(){}function Wd(){if(this.count--,0===this.count)if(this.stylesheets)$d(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}var qd=null;function $d(e,t){e.stylesheets=null,null!==e.unsuspend&&(e.count++,qd=new Map,t.forEach(Qd,e),qd=null,Wd.call(e))}function Qd(e,t){if(!(4&t.state.loading)){var n=qd.get(e);if(n)var r=n.get(null);else{n=new Map,qd.set(e,n);for(var a=e.querySelectorAll("link[data-precedence],style[data-precedence]"),l=0;l<a.length;l++){var o=a[l];"LINK"!==o.nodeName&&"not all"===o.getAttribute("media")||(n.set(o.dataset.precedence,o),r=o)}r&&n.set(null,r)}o=(a=t.instance).getAttribute("data-precedence"),(l=n.get(o)||r)===r&&n.set(null,a),n.set(o,a),this.count++,r=Wd.bind(this),a.addEventListener("load",r),a.addEventListener("error",r),l?l.parentNode.insertBefore(a,l.nextSibling):(e=9===e.nodeType?e.head:e).insertBefore(a,e.firstChild),t.state.loading|=4}}var Gd={$$typeof:w,Provider:null,Consumer:null,_currentValue:A,_currentValue2:A,_threadCount:0};function Yd(e,t,n,r,a,l,o,i){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Ne(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ne(0),this.hiddenUpdates=Ne(null),this.identifierPrefix=r,this.onUncaughtError=a,this.onCaughtError=l,this.onRecoverableError=o,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function Kd(e,t,n,r,a,l,o,i,s,c,u,d){return e=new Yd(e,t,n,o,i,s,c,d),t=1,!0===l&&(t|=24),l=Ar(3,null,null,t),e.current=l,l.stateNode=e,(t=Ma()).refCount++,e.pooledCache=t,t.refCount++,l.memoizedState={element:r,isDehydrated:n,cache:t},nl(l),e}function Jd(e){return e?e=Rr:Rr}function Xd(e,t,n,r,a,l){a=Jd(a),null===r.context?r.context=a:r.pendingContext=a,(r=al(t)).payload={element:n},null!==(l=void 0===l?null:l)&&(r.callback=l),null!==(n=ll(e,r,t))&&(Ac(n,0,t),ol(n,e,t))}function Zd(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function ef(e,t){Zd(e,t),(e=e.alternate)&&Zd(e,t)}function tf(e){if(13===e.tag){var t=zr(e,67108864);null!==t&&Ac(t,0,67108864),ef(e,67108864)}}var nf=!0;function rf(e,t,n,r){var a=R.T;R.T=null;var l=O.p;try{O.p=2,lf(e,t,n,r)}finally{O.p=l,R.T=a}}function af(e,t,n,r){var a=R.T;R.T=null;var l=O.p;try{O.p=8,lf(e,t,n,r)}finally{O.p=l,R.T=a}}function lf(e,t,n,r){if(nf){var a=of(r);if(null===a)Bu(e,t,r,sf,n),yf(e,r);else if(function(e,t,n,r,a){switch(t){case"focusin":return ff=xf(ff,e,t,n,r,a),!0;case"dragenter":return mf=xf(mf,e,t,n,r,a),!0;case"mouseover":return pf=xf(pf,e,t,n,r,a),!0;case"pointerover":var l=a.pointerId;return hf.set(l,xf(hf.get(l)||null,e,t,n,r,a)),!0;case"gotpointercapture":return l=a.pointerId,gf.set(l,xf(gf.get(l)||null,e,t,n,r,a)),!0}return!1}(a,e,t,n,r))r.stopPropagation();else if(yf(e,r),4&t&&-1<bf.indexOf(e)){for(;null!==a;){var l=Be(a);if(null!==l)switch(l.tag){case 3:if((l=l.stateNode).current.memoizedState.isDehydrated){var o=be(l.pendingLanes);if(0!==o){var i=l;for(i.pendingLanes|=2,i.entangledLanes|=2;o;){var s=1<<31-me(o);i.entanglements[1]|=s,o&=~s}ku(l),0===(6&nc)&&(kc=te()+500,ju(0,!1))}}break;case 13:null!==(i=zr(l,2))&&Ac(i,0,2),Uc(),ef(l,2)}if(null===(l=of(r))&&Bu(e,t,r,sf,n),l===a)break;a=l}null!==a&&r.stopPropagation()}else Bu(e,t,r,null,n)}}function of(e){return cf(e=zt(e))}var sf=null;function cf(e){if(sf=null,null!==(e=Ue(e))){var t=s(e);if(null===t)e=null;else{var n=t.tag;if(13===n){if(null!==(e=c(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return sf=e,null}function uf(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(ne()){case re:return 2;case ae:return 8;case le:case oe:return 32;case ie:return 268435456;default:return 32}default:return 32}}var df=!1,ff=null,mf=null,pf=null,hf=new Map,gf=new Map,vf=[],bf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function yf(e,t){switch(e){case"focusin":case"focusout":ff=null;break;case"dragenter":case"dragleave":mf=null;break;case"mouseover":case"mouseout":pf=null;break;case"pointerover":case"pointerout":hf.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":gf.delete(t.pointerId)}}function xf(e,t,n,r,a,l){return null===e||e.nativeEvent!==l?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:l,targetContainers:[a]},null!==t&&(null!==(t=Be(t))&&tf(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==a&&-1===t.indexOf(a)&&t.push(a),e)}function wf(e){var t=Ue(e.target);if(null!==t){var n=s(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=c(n)))return e.blockedOn=t,void function(e,t){var n=O.p;try{return O.p=e,t()}finally{O.p=n}}(e.priority,(function(){if(13===n.tag){var e=Rc();e=Ee(e);var t=zr(n,e);null!==t&&Ac(t,0,e),ef(n,e)}}))}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function kf(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=of(e.nativeEvent);if(null!==n)return null!==(t=Be(n))&&tf(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);Lt=r,n.target.dispatchEvent(r),Lt=null,t.shift()}return!0}function jf(e,t,n){kf(e)&&n.delete(t)}function Nf(){df=!1,null!==ff&&kf(ff)&&(ff=null),null!==mf&&kf(mf)&&(mf=null),null!==pf&&kf(pf)&&(pf=null),hf.forEach(jf),gf.forEach(jf)}function Sf(e,t){e.blockedOn===t&&(e.blockedOn=null,df||(df=!0,r.unstable_scheduleCallback(r.unstable_NormalPriority,Nf)))}var _f=null;function Cf(e){_f!==e&&(_f=e,r.unstable_scheduleCallback(r.unstable_NormalPriority,(function(){_f===e&&(_f=null);for(var t=0;t<e.length;t+=3){var n=e[t],r=e[t+1],a=e[t+2];if("function"!==typeof r){if(null===cf(r||n))continue;break}var l=Be(n);null!==l&&(e.splice(t,3),t-=3,zo(l,{pending:!0,data:a,method:n.method,action:r},r,a))}})))}function Ef(e){function t(t){return Sf(t,e)}null!==ff&&Sf(ff,e),null!==mf&&Sf(mf,e),null!==pf&&Sf(pf,e),hf.forEach(t),gf.forEach(t);for(var n=0;n<vf.length;n++){var r=vf[n];r.blockedOn===e&&(r.blockedOn=null)}for(;0<vf.length&&null===(n=vf[0]).blockedOn;)wf(n),null===n.blockedOn&&vf.shift();if(null!=(n=(e.ownerDocument||e).$$reactFormReplay))for(r=0;r<n.length;r+=3){var a=n[r],l=n[r+1],o=a[Me]||null;if("function"===typeof l)o||Cf(n);else if(o){var i=null;if(l&&l.hasAttribute("formAction")){if(a=l,o=l[Me]||null)i=o.formAction;else if(null!==cf(a))continue}else i=o.action;"function"===typeof i?n[r+1]=i:(n.splice(r,3),r-=3),Cf(n)}}}function Pf(e){this._internalRoot=e}function Lf(e){this._internalRoot=e}Lf.prototype.render=Pf.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));Xd(t.current,Rc(),e,t,null,null)},Lf.prototype.unmount=Pf.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;Xd(e.current,2,null,e,null,null),Uc(),t[Re]=null}},Lf.prototype.unstable_scheduleHydration=function(e){if(e){var t=Le();e={blockedOn:null,target:e,priority:t};for(var n=0;n<vf.length&&0!==t&&t<vf[n].priority;n++);vf.splice(n,0,e),0===n&&wf(e)}};var zf=a.version;if("19.1.0"!==zf)throw Error(o(527,zf,"19.1.0"));O.findDOMNode=function(e){var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return e=function(e){var t=e.alternate;if(!t){if(null===(t=s(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var a=n.return;if(null===a)break;var l=a.alternate;if(null===l){if(null!==(r=a.return)){n=r;continue}break}if(a.child===l.child){for(l=a.child;l;){if(l===n)return u(a),e;if(l===r)return u(a),t;l=l.sibling}throw Error(o(188))}if(n.return!==r.return)n=a,r=l;else{for(var i=!1,c=a.child;c;){if(c===n){i=!0,n=a,r=l;break}if(c===r){i=!0,r=a,n=l;break}c=c.sibling}if(!i){for(c=l.child;c;){if(c===n){i=!0,n=l,r=a;break}if(c===r){i=!0,r=l,n=a;break}c=c.sibling}if(!i)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(t),e=null===(e=null!==e?d(e):null)?null:e.stateNode};var Tf={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:R,reconcilerVersion:"19.1.0"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var Mf=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Mf.isDisabled&&Mf.supportsFiber)try{ue=Mf.inject(Tf),de=Mf}catch(Of){}}t.createRoot=function(e,t){if(!i(e))throw Error(o(299));var n=!1,r="",a=bi,l=yi,s=xi;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onUncaughtError&&(a=t.onUncaughtError),void 0!==t.onCaughtError&&(l=t.onCaughtError),void 0!==t.onRecoverableError&&(s=t.onRecoverableError),void 0!==t.unstable_transitionCallbacks&&t.unstable_transitionCallbacks),t=Kd(e,1,!1,null,0,n,r,a,l,s,0,null),e[Re]=t.current,Iu(e),new Pf(t)},t.hydrateRoot=function(e,t,n){if(!i(e))throw Error(o(299));var r=!1,a="",l=bi,s=yi,c=xi,u=null;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(r=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onUncaughtError&&(l=n.onUncaughtError),void 0!==n.onCaughtError&&(s=n.onCaughtError),void 0!==n.onRecoverableError&&(c=n.onRecoverableError),void 0!==n.unstable_transitionCallbacks&&n.unstable_transitionCallbacks,void 0!==n.formState&&(u=n.formState)),(t=Kd(e,1,!0,t,0,r,a,l,s,c,0,u)).context=Jd(null),n=t.current,(a=al(r=Ee(r=Rc()))).callback=null,ll(n,a,r),n=r,t.current.lanes=n,Se(t,n),ku(t),e[Re]=t.current,Iu(e),new Lf(t)},t.version="19.1.0"},43:(e,t,n)=>{e.exports=n(288)},175:(e,t)=>{const n=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,r=/^[\u0021-\u003A\u003C-\u007E]*$/,a=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,l=/^[\u0020-\u003A\u003D-\u007E]*$/,o=Object.prototype.toString,i=(()=>{const e=function(){};return e.prototype=Object.create(null),e})();function s(e,t,n){do{const n=e.charCodeAt(t);if(32!==n&&9!==n)return t}while(++t<n);return n}function c(e,t,n){for(;t>n;){const n=e.charCodeAt(--t);if(32!==n&&9!==n)return t+1}return n}function u(e){if(-1===e.indexOf("%"))return e;try{return decodeURIComponent(e)}catch(t){return e}}},288:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),a=Symbol.for("react.fragment"),l=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.consumer"),s=Symbol.for("react.context"),c=Symbol.for("react.forward_ref"),u=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),m=Symbol.iterator;var p={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},h=Object.assign,g={};function v(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||p}function b(){}function y(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||p}v.prototype.isReactComponent={},v.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},v.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},b.prototype=v.prototype;var x=y.prototype=new b;x.constructor=y,h(x,v.prototype),x.isPureReactComponent=!0;var w=Array.isArray,k={H:null,A:null,T:null,S:null,V:null},j=Object.prototype.hasOwnProperty;function N(e,t,r,a,l,o){return r=o.ref,{$$typeof:n,type:e,key:t,ref:void 0!==r?r:null,props:o}}function S(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var _=/\/+/g;function C(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function E(){}function P(e,t,a,l,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var s,c,u=!1;if(null===e)u=!0;else switch(i){case"bigint":case"string":case"number":u=!0;break;case"object":switch(e.$$typeof){case n:case r:u=!0;break;case f:return P((u=e._init)(e._payload),t,a,l,o)}}if(u)return o=o(e),u=""===l?"."+C(e,0):l,w(o)?(a="",null!=u&&(a=u.replace(_,"$&/")+"/"),P(o,t,a,"",(function(e){return e}))):null!=o&&(S(o)&&(s=o,c=a+(null==o.key||e&&e.key===o.key?"":(""+o.key).replace(_,"$&/")+"/")+u,o=N(s.type,c,void 0,0,0,s.props)),t.push(o)),1;u=0;var d,p=""===l?".":l+":";if(w(e))for(var h=0;h<e.length;h++)u+=P(l=e[h],t,a,i=p+C(l,h),o);else if("function"===typeof(h=null===(d=e)||"object"!==typeof d?null:"function"===typeof(d=m&&d[m]||d["@@iterator"])?d:null))for(e=h.call(e),h=0;!(l=e.next()).done;)u+=P(l=l.value,t,a,i=p+C(l,h++),o);else if("object"===i){if("function"===typeof e.then)return P(function(e){switch(e.status){case"fulfilled":return e.value;case"rejected":throw e.reason;default:switch("string"===typeof e.status?e.then(E,E):(e.status="pending",e.then((function(t){"pending"===e.status&&(e.status="fulfilled",e.value=t)}),(function(t){"pending"===e.status&&(e.status="rejected",e.reason=t)}))),e.status){case"fulfilled":return e.value;case"rejected":throw e.reason}}throw e}(e),t,a,l,o);throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.")}return u}function L(e,t,n){if(null==e)return e;var r=[],a=0;return P(e,r,"","",(function(e){return t.call(n,e,a++)})),r}function z(e){if(-1===e._status){var t=e._result;(t=t()).then((function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)}),(function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)})),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var T="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function M(){}t.Children={map:L,forEach:function(e,t,n){L(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return L(e,(function(){t++})),t},toArray:function(e){return L(e,(function(e){return e}))||[]},only:function(e){if(!S(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=v,t.Fragment=a,t.Profiler=o,t.PureComponent=y,t.StrictMode=l,t.Suspense=u,t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=k,t.__COMPILER_RUNTIME={__proto__:null,c:function(e){return k.H.useMemoCache(e)}},t.cache=function(e){return function(){return e.apply(null,arguments)}},t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error("The argument must be a React element, but you passed "+e+".");var r=h({},e.props),a=e.key;if(null!=t)for(l in void 0!==t.ref&&void 0,void 0!==t.key&&(a=""+t.key),t)!j.call(t,l)||"key"===l||"__self"===l||"__source"===l||"ref"===l&&void 0===t.ref||(r[l]=t[l]);var l=arguments.length-2;if(1===l)r.children=n;else if(1<l){for(var o=Array(l),i=0;i<l;i++)o[i]=arguments[i+2];r.children=o}return N(e.type,a,void 0,0,0,r)},t.createContext=function(e){return(e={$$typeof:s,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider=e,e.Consumer={$$typeof:i,_context:e},e},t.createElement=function(e,t,n){var r,a={},l=null;if(null!=t)for(r in void 0!==t.key&&(l=""+t.key),t)j.call(t,r)&&"key"!==r&&"__self"!==r&&"__source"!==r&&(a[r]=t[r]);var o=arguments.length-2;if(1===o)a.children=n;else if(1<o){for(var i=Array(o),s=0;s<o;s++)i[s]=arguments[s+2];a.children=i}if(e&&e.defaultProps)for(r in o=e.defaultProps)void 0===a[r]&&(a[r]=o[r]);return N(e,l,void 0,0,0,a)},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:c,render:e}},t.isValidElement=S,t.lazy=function(e){return{$$typeof:f,_payload:{_status:-1,_result:e},_init:z}},t.memo=function(e,t){return{$$typeof:d,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=k.T,n={};k.T=n;try{var r=e(),a=k.S;null!==a&&a(n,r),"object"===typeof r&&null!==r&&"function"===typeof r.then&&r.then(M,T)}catch(l){T(l)}finally{k.T=t}},t.unstable_useCacheRefresh=function(){return k.H.useCacheRefresh()},t.use=function(e){return k.H.use(e)},t.useActionState=function(e,t,n){return k.H.useActionState(e,t,n)},t.useCallback=function(e,t){return k.H.useCallback(e,t)},t.useContext=function(e){return k.H.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e,t){return k.H.useDeferredValue(e,t)},t.useEffect=function(e,t,n){var r=k.H;if("function"===typeof n)throw Error("useEffect CRUD overload is not enabled in this build of React.");return r.useEffect(e,t)},t.useId=function(){return k.H.useId()},t.useImperativeHandle=function(e,t,n){return k.H.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return k.H.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return k.H.useLayoutEffect(e,t)},t.useMemo=function(e,t){return k.H.useMemo(e,t)},t.useOptimistic=function(e,t){return k.H.useOptimistic(e,t)},t.useReducer=function(e,t,n){return k.H.useReducer(e,t,n)},t.useRef=function(e){return k.H.useRef(e)},t.useState=function(e){return k.H.useState(e)},t.useSyncExternalStore=function(e,t,n){return k.H.useSyncExternalStore(e,t,n)},t.useTransition=function(){return k.H.useTransition()},t.version="19.1.0"},391:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(4)},579:(e,t,n)=>{e.exports=n(799)},672:(e,t,n)=>{var r=n(43);function a(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function l(){}var o={d:{f:l,r:function(){throw Error(a(522))},D:l,C:l,L:l,m:l,X:l,S:l,M:l},p:0,findDOMNode:null},i=Symbol.for("react.portal");var s=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function c(e,t){return"font"===e?"":"string"===typeof t?"use-credentials"===t?t:"":void 0}t.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=o,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)throw Error(a(299));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:i,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.flushSync=function(e){var t=s.T,n=o.p;try{if(s.T=null,o.p=2,e)return e()}finally{s.T=t,o.p=n,o.d.f()}},t.preconnect=function(e,t){"string"===typeof e&&(t?t="string"===typeof(t=t.crossOrigin)?"use-credentials"===t?t:"":void 0:t=null,o.d.C(e,t))},t.prefetchDNS=function(e){"string"===typeof e&&o.d.D(e)},t.preinit=function(e,t){if("string"===typeof e&&t&&"string"===typeof t.as){var n=t.as,r=c(n,t.crossOrigin),a="string"===typeof t.integrity?t.integrity:void 0,l="string"===typeof t.fetchPriority?t.fetchPriority:void 0;"style"===n?o.d.S(e,"string"===typeof t.precedence?t.precedence:void 0,{crossOrigin:r,integrity:a,fetchPriority:l}):"script"===n&&o.d.X(e,{crossOrigin:r,integrity:a,fetchPriority:l,nonce:"string"===typeof t.nonce?t.nonce:void 0})}},t.preinitModule=function(e,t){if("string"===typeof e)if("object"===typeof t&&null!==t){if(null==t.as||"script"===t.as){var n=c(t.as,t.crossOrigin);o.d.M(e,{crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0})}}else null==t&&o.d.M(e)},t.preload=function(e,t){if("string"===typeof e&&"object"===typeof t&&null!==t&&"string"===typeof t.as){var n=t.as,r=c(n,t.crossOrigin);o.d.L(e,n,{crossOrigin:r,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0,type:"string"===typeof t.type?t.type:void 0,fetchPriority:"string"===typeof t.fetchPriority?t.fetchPriority:void 0,referrerPolicy:"string"===typeof t.referrerPolicy?t.referrerPolicy:void 0,imageSrcSet:"string"===typeof t.imageSrcSet?t.imageSrcSet:void 0,imageSizes:"string"===typeof t.imageSizes?t.imageSizes:void 0,media:"string"===typeof t.media?t.media:void 0})}},t.preloadModule=function(e,t){if("string"===typeof e)if(t){var n=c(t.as,t.crossOrigin);o.d.m(e,{as:"string"===typeof t.as&&"script"!==t.as?t.as:void 0,crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0})}else o.d.m(e)},t.requestFormReset=function(e){o.d.r(e)},t.unstable_batchedUpdates=function(e,t){return e(t)},t.useFormState=function(e,t,n){return s.H.useFormState(e,t,n)},t.useFormStatus=function(){return s.H.useHostTransitionStatus()},t.version="19.1.0"},799:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.fragment");function a(e,t,r){var a=null;if(void 0!==r&&(a=""+r),void 0!==t.key&&(a=""+t.key),"key"in t)for(var l in r={},t)"key"!==l&&(r[l]=t[l]);else r=t;return t=r.ref,{$$typeof:n,type:e,key:a,ref:void 0!==t?t:null,props:r}}t.Fragment=r,t.jsx=a,t.jsxs=a},853:(e,t,n)=>{e.exports=n(896)},896:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,a=e[r];if(!(0<l(a,t)))break e;e[r]=t,e[n]=a,n=r}}function r(e){return 0===e.length?null:e[0]}function a(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,a=e.length,o=a>>>1;r<o;){var i=2*(r+1)-1,s=e[i],c=i+1,u=e[c];if(0>l(s,n))c<a&&0>l(u,s)?(e[r]=u,e[c]=n,r=c):(e[r]=s,e[i]=n,r=i);else{if(!(c<a&&0>l(u,n)))break e;e[r]=u,e[c]=n,r=c}}}return t}function l(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if(t.unstable_now=void 0,"object"===typeof performance&&"function"===typeof performance.now){var o=performance;t.unstable_now=function(){return o.now()}}else{var i=Date,s=i.now();t.unstable_now=function(){return i.now()-s}}var c=[],u=[],d=1,f=null,m=3,p=!1,h=!1,g=!1,v=!1,b="function"===typeof setTimeout?setTimeout:null,y="function"===typeof clearTimeout?clearTimeout:null,x="undefined"!==typeof setImmediate?setImmediate:null;function w(e){for(var t=r(u);null!==t;){if(null===t.callback)a(u);else{if(!(t.startTime<=e))break;a(u),t.sortIndex=t.expirationTime,n(c,t)}t=r(u)}}function k(e){if(g=!1,w(e),!h)if(null!==r(c))h=!0,N||(N=!0,j());else{var t=r(u);null!==t&&T(k,t.startTime-e)}}var j,N=!1,S=-1,_=5,C=-1;function E(){return!!v||!(t.unstable_now()-C<_)}function P(){if(v=!1,N){var e=t.unstable_now();C=e;var n=!0;try{e:{h=!1,g&&(g=!1,y(S),S=-1),p=!0;var l=m;try{t:{for(w(e),f=r(c);null!==f&&!(f.expirationTime>e&&E());){var o=f.callback;if("function"===typeof o){f.callback=null,m=f.priorityLevel;var i=o(f.expirationTime<=e);if(e=t.unstable_now(),"function"===typeof i){f.callback=i,w(e),n=!0;break t}f===r(c)&&a(c),w(e)}else a(c);f=r(c)}if(null!==f)n=!0;else{var s=r(u);null!==s&&T(k,s.startTime-e),n=!1}}break e}finally{f=null,m=l,p=!1}n=void 0}}finally{n?j():N=!1}}}if("function"===typeof x)j=function(){x(P)};else if("undefined"!==typeof MessageChannel){var L=new MessageChannel,z=L.port2;L.port1.onmessage=P,j=function(){z.postMessage(null)}}else j=function(){b(P,0)};function T(e,n){S=b((function(){e(t.unstable_now())}),n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):_=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return m},t.unstable_next=function(e){switch(m){case 1:case 2:case 3:var t=3;break;default:t=m}var n=m;m=t;try{return e()}finally{m=n}},t.unstable_requestPaint=function(){v=!0},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=m;m=e;try{return t()}finally{m=n}},t.unstable_scheduleCallback=function(e,a,l){var o=t.unstable_now();switch("object"===typeof l&&null!==l?l="number"===typeof(l=l.delay)&&0<l?o+l:o:l=o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:d++,callback:a,priorityLevel:e,startTime:l,expirationTime:i=l+i,sortIndex:-1},l>o?(e.sortIndex=l,n(u,e),null===r(c)&&e===r(u)&&(g?(y(S),S=-1):g=!0,T(k,l-o))):(e.sortIndex=i,n(c,e),h||p||(h=!0,N||(N=!0,j()))),e},t.unstable_shouldYield=E,t.unstable_wrapCallback=function(e){var t=m;return function(){var n=m;m=t;try{return e.apply(this,arguments)}finally{m=n}}}},950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(672)}},t={};function n(r){var a=t[r];if(void 0!==a)return a.exports;var l=t[r]={exports:{}};return e[r](l,l.exports,n),l.exports}n.m=e,n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.f={},n.e=e=>Promise.all(Object.keys(n.f).reduce(((t,r)=>(n.f[r](e,t),t)),[])),n.u=e=>"static/js/"+e+".ad6eb26e.chunk.js",n.miniCssF=e=>{},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),(()=>{var e={},t="my-react-app:";n.l=(r,a,l,o)=>{if(e[r])e[r].push(a);else{var i,s;if(void 0!==l)for(var c=document.getElementsByTagName("script"),u=0;u<c.length;u++){var d=c[u];if(d.getAttribute("src")==r||d.getAttribute("data-webpack")==t+l){i=d;break}}i||(s=!0,(i=document.createElement("script")).charset="utf-8",i.timeout=120,n.nc&&i.setAttribute("nonce",n.nc),i.setAttribute("data-webpack",t+l),i.src=r),e[r]=[a];var f=(t,n)=>{i.onerror=i.onload=null,clearTimeout(m);var a=e[r];if(delete e[r],i.parentNode&&i.parentNode.removeChild(i),a&&a.forEach((e=>e(n))),t)return t(n)},m=setTimeout(f.bind(null,void 0,{type:"timeout",target:i}),12e4);i.onerror=f.bind(null,i.onerror),i.onload=f.bind(null,i.onload),s&&document.head.appendChild(i)}}})(),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},n.p="/",(()=>{var e={792:0};n.f.j=(t,r)=>{var a=n.o(e,t)?e[t]:void 0;if(0!==a)if(a)r.push(a[2]);else{var l=new Promise(((n,r)=>a=e[t]=[n,r]));r.push(a[2]=l);var o=n.p+n.u(t),i=new Error;n.l(o,(r=>{if(n.o(e,t)&&(0!==(a=e[t])&&(e[t]=void 0),a)){var l=r&&("load"===r.type?"missing":r.type),o=r&&r.target&&r.target.src;i.message="Loading chunk "+t+" failed.\n("+l+": "+o+")",i.name="ChunkLoadError",i.type=l,i.request=o,a[1](i)}}),"chunk-"+t,t)}};var t=(t,r)=>{var a,l,o=r[0],i=r[1],s=r[2],c=0;if(o.some((t=>0!==e[t]))){for(a in i)n.o(i,a)&&(n.m[a]=i[a]);if(s)s(n)}for(t&&t(r);c<o.length;c++)l=o[c],n.o(e,l)&&e[l]&&e[l][0](),e[l]=0},r=self.webpackChunkmy_react_app=self.webpackChunkmy_react_app||[];r.forEach(t.bind(null,0)),r.push=t.bind(null,r.push.bind(r))})();var r=n(43),a=n(391);function l(e){return l="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},l(e)}function o(e){var t=function(e,t){if("object"!=l(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=l(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==l(t)?t:t+""}function i(e,t,n){return(t=o(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function s(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function c(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?s(Object(n),!0).forEach((function(t){i(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):s(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function u(e,t){if(null==e)return{};var n,r,a=function(e,t){if(null==e)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==t.indexOf(r))continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(r=0;r<l.length;r++)n=l[r],-1===t.indexOf(n)&&{}.propertyIsEnumerable.call(e,n)&&(a[n]=e[n])}return a}n(175);const d=["sri"],f=["page"],m=["page","matches"],p=["onClick","discover","prefetch","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],h=["aria-current","caseSensitive","className","end","style","to","viewTransition","children"],g=["discover","fetcherKey","navigate","reloadDocument","replace","state","method","action","onSubmit","relative","preventScrollReset","viewTransition"];var v="popstate";function b(){return S((function(e,t){let{pathname:n,search:r,hash:a}=e.location;return k("",{pathname:n,search:r,hash:a},t.state&&t.state.usr||null,t.state&&t.state.key||"default")}),(function(e,t){return"string"===typeof t?t:j(t)}),null,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{})}function y(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}function x(e,t){if(!e){"undefined"!==typeof console&&console.warn(t);try{throw new Error(t)}catch(n){}}}function w(e,t){return{usr:e.state,key:e.key,idx:t}}function k(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,r=arguments.length>3?arguments[3]:void 0;return c(c({pathname:"string"===typeof e?e:e.pathname,search:"",hash:""},"string"===typeof t?N(t):t),{},{state:n,key:t&&t.key||r||Math.random().toString(36).substring(2,10)})}function j(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&"?"!==n&&(t+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(t+="#"===r.charAt(0)?r:"#"+r),t}function N(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function S(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},{window:a=document.defaultView,v5Compat:l=!1}=r,o=a.history,i="POP",s=null,u=d();function d(){return(o.state||{idx:null}).idx}function f(){i="POP";let e=d(),t=null==e?null:e-u;u=e,s&&s({action:i,location:p.location,delta:t})}function m(e){return _(e)}null==u&&(u=0,o.replaceState(c(c({},o.state),{},{idx:u}),""));let p={get action(){return i},get location(){return e(a,o)},listen(e){if(s)throw new Error("A history only accepts one active listener");return a.addEventListener(v,f),s=e,()=>{a.removeEventListener(v,f),s=null}},createHref:e=>t(a,e),createURL:m,encodeLocation(e){let t=m(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:function(e,t){i="PUSH";let r=k(p.location,e,t);n&&n(r,e),u=d()+1;let c=w(r,u),f=p.createHref(r);try{o.pushState(c,"",f)}catch(m){if(m instanceof DOMException&&"DataCloneError"===m.name)throw m;a.location.assign(f)}l&&s&&s({action:i,location:p.location,delta:1})},replace:function(e,t){i="REPLACE";let r=k(p.location,e,t);n&&n(r,e),u=d();let a=w(r,u),c=p.createHref(r);o.replaceState(a,"",c),l&&s&&s({action:i,location:p.location,delta:0})},go:e=>o.go(e)};return p}function _(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n="http://localhost";"undefined"!==typeof window&&(n="null"!==window.location.origin?window.location.origin:window.location.href),y(n,"No window.location.(origin|href) available to create URL");let r="string"===typeof e?e:j(e);return r=r.replace(/ $/,"%20"),!t&&r.startsWith("//")&&(r=n+r),new URL(r,n)}new WeakMap;function C(e,t){return E(e,t,arguments.length>2&&void 0!==arguments[2]?arguments[2]:"/",!1)}function E(e,t,n,r){let a=V(("string"===typeof t?N(t):t).pathname||"/",n);if(null==a)return null;let l=P(e);!function(e){e.sort(((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){let n=e.length===t.length&&e.slice(0,-1).every(((e,n)=>e===t[n]));return n?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map((e=>e.childrenIndex)),t.routesMeta.map((e=>e.childrenIndex)))))}(l);let o=null;for(let i=0;null==o&&i<l.length;++i){let e=B(a);o=H(l[i],e,r)}return o}function P(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[],r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"",a=(e,a,l)=>{let o={relativePath:void 0===l?e.path||"":l,caseSensitive:!0===e.caseSensitive,childrenIndex:a,route:e};o.relativePath.startsWith("/")&&(y(o.relativePath.startsWith(r),'Absolute route path "'.concat(o.relativePath,'" nested under path "').concat(r,'" is not valid. An absolute child route path must start with the combined path of all its parent routes.')),o.relativePath=o.relativePath.slice(r.length));let i=G([r,o.relativePath]),s=n.concat(o);e.children&&e.children.length>0&&(y(!0!==e.index,'Index routes must not have child routes. Please remove all child routes from route path "'.concat(i,'".')),P(e.children,t,s,i)),(null!=e.path||e.index)&&t.push({path:i,score:D(i,e.index),routesMeta:s})};return e.forEach(((e,t)=>{var n;if(""!==e.path&&null!==(n=e.path)&&void 0!==n&&n.includes("?"))for(let r of L(e.path))a(e,t,r);else a(e,t)})),t}function L(e){let t=e.split("/");if(0===t.length)return[];let[n,...r]=t,a=n.endsWith("?"),l=n.replace(/\?$/,"");if(0===r.length)return a?[l,""]:[l];let o=L(r.join("/")),i=[];return i.push(...o.map((e=>""===e?l:[l,e].join("/")))),a&&i.push(...o),i.map((t=>e.startsWith("/")&&""===t?"/":t))}var z=/^:[\w-]+$/,T=3,M=2,R=1,O=10,A=-2,F=e=>"*"===e;function D(e,t){let n=e.split("/"),r=n.length;return n.some(F)&&(r+=A),t&&(r+=M),n.filter((e=>!F(e))).reduce(((e,t)=>e+(z.test(t)?T:""===t?R:O)),r)}function H(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],{routesMeta:r}=e,a={},l="/",o=[];for(let i=0;i<r.length;++i){let e=r[i],s=i===r.length-1,c="/"===l?t:t.slice(l.length)||"/",u=I({path:e.relativePath,caseSensitive:e.caseSensitive,end:s},c),d=e.route;if(!u&&s&&n&&!r[r.length-1].route.index&&(u=I({path:e.relativePath,caseSensitive:e.caseSensitive,end:!1},c)),!u)return null;Object.assign(a,u.params),o.push({params:a,pathname:G([l,u.pathname]),pathnameBase:Y(G([l,u.pathnameBase])),route:d}),"/"!==u.pathnameBase&&(l=G([l,u.pathnameBase]))}return o}function I(e,t){"string"===typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=U(e.path,e.caseSensitive,e.end),a=t.match(n);if(!a)return null;let l=a[0],o=l.replace(/(.)\/+$/,"$1"),i=a.slice(1);return{params:r.reduce(((e,t,n)=>{let{paramName:r,isOptional:a}=t;if("*"===r){let e=i[n]||"";o=l.slice(0,l.length-e.length).replace(/(.)\/+$/,"$1")}const s=i[n];return e[r]=a&&!s?void 0:(s||"").replace(/%2F/g,"/"),e}),{}),pathname:l,pathnameBase:o,pattern:e}}function U(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];x("*"===e||!e.endsWith("*")||e.endsWith("/*"),'Route path "'.concat(e,'" will be treated as if it were "').concat(e.replace(/\*$/,"/*"),'" because the `*` character must always follow a `/` in the pattern. To get rid of this warning, please change the route path to "').concat(e.replace(/\*$/,"/*"),'".'));let r=[],a="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,((e,t,n)=>(r.push({paramName:t,isOptional:null!=n}),n?"/?([^\\/]+)?":"/([^\\/]+)")));return e.endsWith("*")?(r.push({paramName:"*"}),a+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?a+="\\/*$":""!==e&&"/"!==e&&(a+="(?:(?=\\/|$))"),[new RegExp(a,t?void 0:"i"),r]}function B(e){try{return e.split("/").map((e=>decodeURIComponent(e).replace(/\//g,"%2F"))).join("/")}catch(t){return x(!1,'The URL path "'.concat(e,'" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (').concat(t,").")),e}}function V(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&"/"!==r?null:e.slice(n)||"/"}function W(e,t,n,r){return"Cannot include a '".concat(e,"' character in a manually specified `to.").concat(t,"` field [").concat(JSON.stringify(r),"].  Please separate it out to the `to.").concat(n,'` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.')}function q(e){return e.filter(((e,t)=>0===t||e.route.path&&e.route.path.length>0))}function $(e){let t=q(e);return t.map(((e,n)=>n===t.length-1?e.pathname:e.pathnameBase))}function Q(e,t,n){let r,a=arguments.length>3&&void 0!==arguments[3]&&arguments[3];"string"===typeof e?r=N(e):(r=c({},e),y(!r.pathname||!r.pathname.includes("?"),W("?","pathname","search",r)),y(!r.pathname||!r.pathname.includes("#"),W("#","pathname","hash",r)),y(!r.search||!r.search.includes("#"),W("#","search","hash",r)));let l,o=""===e||""===r.pathname,i=o?"/":r.pathname;if(null==i)l=n;else{let e=t.length-1;if(!a&&i.startsWith("..")){let t=i.split("/");for(;".."===t[0];)t.shift(),e-=1;r.pathname=t.join("/")}l=e>=0?t[e]:"/"}let s=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"/",{pathname:n,search:r="",hash:a=""}="string"===typeof e?N(e):e,l=n?n.startsWith("/")?n:function(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach((e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)})),n.length>1?n.join("/"):"/"}(n,t):t;return{pathname:l,search:K(r),hash:J(a)}}(r,l),u=i&&"/"!==i&&i.endsWith("/"),d=(o||"."===i)&&n.endsWith("/");return s.pathname.endsWith("/")||!u&&!d||(s.pathname+="/"),s}var G=e=>e.join("/").replace(/\/\/+/g,"/"),Y=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),K=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",J=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";function X(e){return null!=e&&"number"===typeof e.status&&"string"===typeof e.statusText&&"boolean"===typeof e.internal&&"data"in e}var Z=["POST","PUT","PATCH","DELETE"],ee=(new Set(Z),["GET",...Z]);new Set(ee),Symbol("ResetLoaderData");var te=r.createContext(null);te.displayName="DataRouter";var ne=r.createContext(null);ne.displayName="DataRouterState";var re=r.createContext({isTransitioning:!1});re.displayName="ViewTransition";var ae=r.createContext(new Map);ae.displayName="Fetchers";var le=r.createContext(null);le.displayName="Await";var oe=r.createContext(null);oe.displayName="Navigation";var ie=r.createContext(null);ie.displayName="Location";var se=r.createContext({outlet:null,matches:[],isDataRoute:!1});se.displayName="Route";var ce=r.createContext(null);ce.displayName="RouteError";function ue(){return null!=r.useContext(ie)}function de(){return y(ue(),"useLocation() may be used only in the context of a <Router> component."),r.useContext(ie).location}var fe="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function me(e){r.useContext(oe).static||r.useLayoutEffect(e)}function pe(){let{isDataRoute:e}=r.useContext(se);return e?function(){let{router:e}=je("useNavigate"),t=Se("useNavigate"),n=r.useRef(!1);me((()=>{n.current=!0}));let a=r.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};x(n.current,fe),n.current&&("number"===typeof r?e.navigate(r):await e.navigate(r,c({fromRouteId:t},a)))}),[e,t]);return a}():function(){y(ue(),"useNavigate() may be used only in the context of a <Router> component.");let e=r.useContext(te),{basename:t,navigator:n}=r.useContext(oe),{matches:a}=r.useContext(se),{pathname:l}=de(),o=JSON.stringify($(a)),i=r.useRef(!1);me((()=>{i.current=!0}));let s=r.useCallback((function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(x(i.current,fe),!i.current)return;if("number"===typeof r)return void n.go(r);let s=Q(r,JSON.parse(o),l,"path"===a.relative);null==e&&"/"!==t&&(s.pathname="/"===s.pathname?t:G([t,s.pathname])),(a.replace?n.replace:n.push)(s,a.state,a)}),[t,n,o,l,e]);return s}()}r.createContext(null);function he(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{matches:n}=r.useContext(se),{pathname:a}=de(),l=JSON.stringify($(n));return r.useMemo((()=>Q(e,JSON.parse(l),a,"path"===t)),[e,l,a,t])}function ge(e,t,n,a){y(ue(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:l}=r.useContext(oe),{matches:o}=r.useContext(se),i=o[o.length-1],s=i?i.params:{},u=i?i.pathname:"/",d=i?i.pathnameBase:"/",f=i&&i.route;{let e=f&&f.path||"";Ee(u,!f||e.endsWith("*")||e.endsWith("*?"),'You rendered descendant <Routes> (or called `useRoutes()`) at "'.concat(u,'" (under <Route path="').concat(e,'">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won\'t match anymore and therefore the child routes will never render.\n\nPlease change the parent <Route path="').concat(e,'"> to <Route path="').concat("/"===e?"*":"".concat(e,"/*"),'">.'))}let m,p=de();if(t){var h;let e="string"===typeof t?N(t):t;y("/"===d||(null===(h=e.pathname)||void 0===h?void 0:h.startsWith(d)),'When overriding the location using `<Routes location>` or `useRoutes(routes, location)`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "'.concat(d,'" but pathname "').concat(e.pathname,'" was given in the `location` prop.')),m=e}else m=p;let g=m.pathname||"/",v=g;if("/"!==d){let e=d.replace(/^\//,"").split("/");v="/"+g.replace(/^\//,"").split("/").slice(e.length).join("/")}let b=C(e,{pathname:v});x(f||null!=b,'No routes matched location "'.concat(m.pathname).concat(m.search).concat(m.hash,'" ')),x(null==b||void 0!==b[b.length-1].route.element||void 0!==b[b.length-1].route.Component||void 0!==b[b.length-1].route.lazy,'Matched leaf route at location "'.concat(m.pathname).concat(m.search).concat(m.hash,'" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.'));let w=we(b&&b.map((e=>Object.assign({},e,{params:Object.assign({},s,e.params),pathname:G([d,l.encodeLocation?l.encodeLocation(e.pathname).pathname:e.pathname]),pathnameBase:"/"===e.pathnameBase?d:G([d,l.encodeLocation?l.encodeLocation(e.pathnameBase).pathname:e.pathnameBase])}))),o,n,a);return t&&w?r.createElement(ie.Provider,{value:{location:c({pathname:"/",search:"",hash:"",state:null,key:"default"},m),navigationType:"POP"}},w):w}function ve(){let e=_e(),t=X(e)?"".concat(e.status," ").concat(e.statusText):e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,a="rgba(200,200,200, 0.5)",l={padding:"0.5rem",backgroundColor:a},o={padding:"2px 4px",backgroundColor:a},i=null;return console.error("Error handled by React Router default ErrorBoundary:",e),i=r.createElement(r.Fragment,null,r.createElement("p",null,"\ud83d\udcbf Hey developer \ud83d\udc4b"),r.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",r.createElement("code",{style:o},"ErrorBoundary")," or"," ",r.createElement("code",{style:o},"errorElement")," prop on your route.")),r.createElement(r.Fragment,null,r.createElement("h2",null,"Unexpected Application Error!"),r.createElement("h3",{style:{fontStyle:"italic"}},t),n?r.createElement("pre",{style:l},n):null,i)}var be=r.createElement(ve,null),ye=class extends r.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||"idle"!==t.revalidation&&"idle"===e.revalidation?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:void 0!==e.error?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){console.error("React Router caught the following error during render",e,t)}render(){return void 0!==this.state.error?r.createElement(se.Provider,{value:this.props.routeContext},r.createElement(ce.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function xe(e){let{routeContext:t,match:n,children:a}=e,l=r.useContext(te);return l&&l.static&&l.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(l.staticContext._deepestRenderedBoundaryId=n.route.id),r.createElement(se.Provider,{value:t},a)}function we(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null;if(null==e){if(!n)return null;if(n.errors)e=n.matches;else{if(0!==t.length||n.initialized||!(n.matches.length>0))return null;e=n.matches}}let a=e,l=null===n||void 0===n?void 0:n.errors;if(null!=l){let e=a.findIndex((e=>e.route.id&&void 0!==(null===l||void 0===l?void 0:l[e.route.id])));y(e>=0,"Could not find a matching route for errors on route IDs: ".concat(Object.keys(l).join(","))),a=a.slice(0,Math.min(a.length,e+1))}let o=!1,i=-1;if(n)for(let r=0;r<a.length;r++){let e=a[r];if((e.route.HydrateFallback||e.route.hydrateFallbackElement)&&(i=r),e.route.id){let{loaderData:t,errors:r}=n,l=e.route.loader&&!t.hasOwnProperty(e.route.id)&&(!r||void 0===r[e.route.id]);if(e.route.lazy||l){o=!0,a=i>=0?a.slice(0,i+1):[a[0]];break}}}return a.reduceRight(((e,s,c)=>{let u,d=!1,f=null,m=null;n&&(u=l&&s.route.id?l[s.route.id]:void 0,f=s.route.errorElement||be,o&&(i<0&&0===c?(Ee("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),d=!0,m=null):i===c&&(d=!0,m=s.route.hydrateFallbackElement||null)));let p=t.concat(a.slice(0,c+1)),h=()=>{let t;return t=u?f:d?m:s.route.Component?r.createElement(s.route.Component,null):s.route.element?s.route.element:e,r.createElement(xe,{match:s,routeContext:{outlet:e,matches:p,isDataRoute:null!=n},children:t})};return n&&(s.route.ErrorBoundary||s.route.errorElement||0===c)?r.createElement(ye,{location:n.location,revalidation:n.revalidation,component:f,error:u,children:h(),routeContext:{outlet:null,matches:p,isDataRoute:!0}}):h()}),null)}function ke(e){return"".concat(e," must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.")}function je(e){let t=r.useContext(te);return y(t,ke(e)),t}function Ne(e){let t=r.useContext(ne);return y(t,ke(e)),t}function Se(e){let t=function(e){let t=r.useContext(se);return y(t,ke(e)),t}(e),n=t.matches[t.matches.length-1];return y(n.route.id,"".concat(e,' can only be used on routes that contain a unique "id"')),n.route.id}function _e(){var e;let t=r.useContext(ce),n=Ne("useRouteError"),a=Se("useRouteError");return void 0!==t?t:null===(e=n.errors)||void 0===e?void 0:e[a]}var Ce={};function Ee(e,t,n){t||Ce[e]||(Ce[e]=!0,x(!1,n))}r.memo((function(e){let{routes:t,future:n,state:r}=e;return ge(t,void 0,r,n)}));function Pe(e){y(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function Le(e){let{basename:t="/",children:n=null,location:a,navigationType:l="POP",navigator:o,static:i=!1}=e;y(!ue(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let s=t.replace(/^\/*/,"/"),c=r.useMemo((()=>({basename:s,navigator:o,static:i,future:{}})),[s,o,i]);"string"===typeof a&&(a=N(a));let{pathname:u="/",search:d="",hash:f="",state:m=null,key:p="default"}=a,h=r.useMemo((()=>{let e=V(u,s);return null==e?null:{location:{pathname:e,search:d,hash:f,state:m,key:p},navigationType:l}}),[s,u,d,f,m,p,l]);return x(null!=h,'<Router basename="'.concat(s,'"> is not able to match the URL "').concat(u).concat(d).concat(f,"\" because it does not start with the basename, so the <Router> won't render anything.")),null==h?null:r.createElement(oe.Provider,{value:c},r.createElement(ie.Provider,{children:n,value:h}))}function ze(e){let{children:t,location:n}=e;return ge(Te(t),n)}r.Component;function Te(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=[];return r.Children.forEach(e,((e,a)=>{if(!r.isValidElement(e))return;let l=[...t,a];if(e.type===r.Fragment)return void n.push.apply(n,Te(e.props.children,l));y(e.type===Pe,"[".concat("string"===typeof e.type?e.type:e.type.name,"] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>")),y(!e.props.index||!e.props.children,"An index route cannot have child routes.");let o={id:e.props.id||l.join("-"),caseSensitive:e.props.caseSensitive,element:e.props.element,Component:e.props.Component,index:e.props.index,path:e.props.path,loader:e.props.loader,action:e.props.action,hydrateFallbackElement:e.props.hydrateFallbackElement,HydrateFallback:e.props.HydrateFallback,errorElement:e.props.errorElement,ErrorBoundary:e.props.ErrorBoundary,hasErrorBoundary:!0===e.props.hasErrorBoundary||null!=e.props.ErrorBoundary||null!=e.props.errorElement,shouldRevalidate:e.props.shouldRevalidate,handle:e.props.handle,lazy:e.props.lazy};e.props.children&&(o.children=Te(e.props.children,l)),n.push(o)})),n}var Me="get",Re="application/x-www-form-urlencoded";function Oe(e){return null!=e&&"string"===typeof e.tagName}var Ae=null;var Fe=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function De(e){return null==e||Fe.has(e)?e:(x(!1,'"'.concat(e,'" is not a valid `encType` for `<Form>`/`<fetcher.Form>` and will default to "').concat(Re,'"')),null)}function He(e,t){let n,r,a,l,o;if(Oe(i=e)&&"form"===i.tagName.toLowerCase()){let o=e.getAttribute("action");r=o?V(o,t):null,n=e.getAttribute("method")||Me,a=De(e.getAttribute("enctype"))||Re,l=new FormData(e)}else if(function(e){return Oe(e)&&"button"===e.tagName.toLowerCase()}(e)||function(e){return Oe(e)&&"input"===e.tagName.toLowerCase()}(e)&&("submit"===e.type||"image"===e.type)){let o=e.form;if(null==o)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let i=e.getAttribute("formaction")||o.getAttribute("action");if(r=i?V(i,t):null,n=e.getAttribute("formmethod")||o.getAttribute("method")||Me,a=De(e.getAttribute("formenctype"))||De(o.getAttribute("enctype"))||Re,l=new FormData(o,e),!function(){if(null===Ae)try{new FormData(document.createElement("form"),0),Ae=!1}catch(e){Ae=!0}return Ae}()){let{name:t,type:n,value:r}=e;if("image"===n){let e=t?"".concat(t,"."):"";l.append("".concat(e,"x"),"0"),l.append("".concat(e,"y"),"0")}else t&&l.append(t,r)}}else{if(Oe(e))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');n=Me,r=null,a=Re,o=e}var i;return l&&"text/plain"===a&&(o=l,l=void 0),{action:r,method:n.toLowerCase(),encType:a,formData:l,body:o}}function Ie(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}async function Ue(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(n){return console.error("Error loading route module `".concat(e.module,"`, reloading page...")),console.error(n),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise((()=>{}))}}function Be(e){return null!=e&&"string"===typeof e.page}function Ve(e){return null!=e&&(null==e.href?"preload"===e.rel&&"string"===typeof e.imageSrcSet&&"string"===typeof e.imageSizes:"string"===typeof e.rel&&"string"===typeof e.href)}function We(e,t,n,r,a,l){let o=(e,t)=>!n[t]||e.route.id!==n[t].route.id,i=(e,t)=>{var r;return n[t].pathname!==e.pathname||(null===(r=n[t].route.path)||void 0===r?void 0:r.endsWith("*"))&&n[t].params["*"]!==e.params["*"]};return"assets"===l?t.filter(((e,t)=>o(e,t)||i(e,t))):"data"===l?t.filter(((t,l)=>{let s=r.routes[t.route.id];if(!s||!s.hasLoader)return!1;if(o(t,l)||i(t,l))return!0;if(t.route.shouldRevalidate){var c;let r=t.route.shouldRevalidate({currentUrl:new URL(a.pathname+a.search+a.hash,window.origin),currentParams:(null===(c=n[0])||void 0===c?void 0:c.params)||{},nextUrl:new URL(e,window.origin),nextParams:t.params,defaultShouldRevalidate:!0});if("boolean"===typeof r)return r}return!0})):[]}function qe(e,t){let{includeHydrateFallback:n}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};return r=e.map((e=>{let r=t.routes[e.route.id];if(!r)return[];let a=[r.module];return r.clientActionModule&&(a=a.concat(r.clientActionModule)),r.clientLoaderModule&&(a=a.concat(r.clientLoaderModule)),n&&r.hydrateFallbackModule&&(a=a.concat(r.hydrateFallbackModule)),r.imports&&(a=a.concat(r.imports)),a})).flat(1),[...new Set(r)];var r}function $e(e,t){let n=new Set,r=new Set(t);return e.reduce(((e,a)=>{if(t&&!Be(a)&&"script"===a.as&&a.href&&r.has(a.href))return e;let l=JSON.stringify(function(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}(a));return n.has(l)||(n.add(l),e.push({key:l,link:a})),e}),[])}function Qe(e){return{__html:e}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");"undefined"!==typeof window?window:"undefined"!==typeof globalThis&&globalThis;Symbol("SingleFetchRedirect");var Ge=new Set([100,101,204,205]);function Ye(e,t){let n="string"===typeof e?new URL(e,"undefined"===typeof window?"server://singlefetch/":window.location.origin):e;return"/"===n.pathname?n.pathname="_root.data":t&&"/"===V(n.pathname,t)?n.pathname="".concat(t.replace(/\/$/,""),"/_root.data"):n.pathname="".concat(n.pathname.replace(/\/$/,""),".data"),n}r.Component;function Ke(e){let{error:t,isOutsideRemixApp:n}=e;console.error(t);let a,l=r.createElement("script",{dangerouslySetInnerHTML:{__html:'\n        console.log(\n          "\ud83d\udcbf Hey developer \ud83d\udc4b. You can provide a way better UX than this when your app throws errors. Check out https://reactrouter.com/how-to/error-boundary for more information."\n        );\n      '}});if(X(t))return r.createElement(Je,{title:"Unhandled Thrown Response!"},r.createElement("h1",{style:{fontSize:"24px"}},t.status," ",t.statusText),l);if(t instanceof Error)a=t;else{let e=null==t?"Unknown Error":"object"===typeof t&&"toString"in t?t.toString():JSON.stringify(t);a=new Error(e)}return r.createElement(Je,{title:"Application Error!",isOutsideRemixApp:n},r.createElement("h1",{style:{fontSize:"24px"}},"Application Error"),r.createElement("pre",{style:{padding:"2rem",background:"hsla(10, 50%, 50%, 0.1)",color:"red",overflow:"auto"}},a.stack),l)}function Je(e){var t;let{title:n,renderScripts:a,isOutsideRemixApp:l,children:o}=e,{routeModules:i}=nt();return null!==(t=i.root)&&void 0!==t&&t.Layout&&!l?o:r.createElement("html",{lang:"en"},r.createElement("head",null,r.createElement("meta",{charSet:"utf-8"}),r.createElement("meta",{name:"viewport",content:"width=device-width,initial-scale=1,viewport-fit=cover"}),r.createElement("title",null,n)),r.createElement("body",null,r.createElement("main",{style:{fontFamily:"system-ui, sans-serif",padding:"2rem"}},o,a?r.createElement(ct,null):null)))}function Xe(e,t){return"lazy"===e.mode&&!0===t}function Ze(){let e=r.useContext(te);return Ie(e,"You must render this element inside a <DataRouterContext.Provider> element"),e}function et(){let e=r.useContext(ne);return Ie(e,"You must render this element inside a <DataRouterStateContext.Provider> element"),e}var tt=r.createContext(void 0);function nt(){let e=r.useContext(tt);return Ie(e,"You must render this element inside a <HydratedRouter> element"),e}function rt(e,t){return n=>{e&&e(n),n.defaultPrevented||t(n)}}function at(e,t,n){if(n&&!st)return[e[0]];if(t){let n=e.findIndex((e=>void 0!==t[e.route.id]));return e.slice(0,n+1)}return e}function lt(e){let{page:t}=e,n=u(e,f),{router:a}=Ze(),l=r.useMemo((()=>C(a.routes,t,a.basename)),[a.routes,t,a.basename]);return l?r.createElement(it,c({page:t,matches:l},n)):null}function ot(e){let{manifest:t,routeModules:n}=nt(),[a,l]=r.useState([]);return r.useEffect((()=>{let r=!1;return async function(e,t,n){return $e((await Promise.all(e.map((async e=>{let r=t.routes[e.route.id];if(r){let e=await Ue(r,n);return e.links?e.links():[]}return[]})))).flat(1).filter(Ve).filter((e=>"stylesheet"===e.rel||"preload"===e.rel)).map((e=>"stylesheet"===e.rel?c(c({},e),{},{rel:"prefetch",as:"style"}):c(c({},e),{},{rel:"prefetch"}))))}(e,t,n).then((e=>{r||l(e)})),()=>{r=!0}}),[e,t,n]),a}function it(e){let{page:t,matches:n}=e,a=u(e,m),l=de(),{manifest:o,routeModules:i}=nt(),{basename:s}=Ze(),{loaderData:d,matches:f}=et(),p=r.useMemo((()=>We(t,n,f,o,l,"data")),[t,n,f,o,l]),h=r.useMemo((()=>We(t,n,f,o,l,"assets")),[t,n,f,o,l]),g=r.useMemo((()=>{if(t===l.pathname+l.search+l.hash)return[];let e=new Set,r=!1;if(n.forEach((t=>{var n;let a=o.routes[t.route.id];a&&a.hasLoader&&(!p.some((e=>e.route.id===t.route.id))&&t.route.id in d&&null!==(n=i[t.route.id])&&void 0!==n&&n.shouldRevalidate||a.hasClientLoader?r=!0:e.add(t.route.id))})),0===e.size)return[];let a=Ye(t,s);return r&&e.size>0&&a.searchParams.set("_routes",n.filter((t=>e.has(t.route.id))).map((e=>e.route.id)).join(",")),[a.pathname+a.search]}),[s,d,l,o,p,n,t,i]),v=r.useMemo((()=>qe(h,o)),[h,o]),b=ot(h);return r.createElement(r.Fragment,null,g.map((e=>r.createElement("link",c({key:e,rel:"prefetch",as:"fetch",href:e},a)))),v.map((e=>r.createElement("link",c({key:e,rel:"modulepreload",href:e},a)))),b.map((e=>{let{key:t,link:n}=e;return r.createElement("link",c({key:t},n))})))}tt.displayName="FrameworkContext";var st=!1;function ct(e){let{manifest:t,serverHandoffString:n,isSpaMode:a,renderMeta:l,routeDiscovery:o,ssr:i}=nt(),{router:s,static:f,staticContext:m}=Ze(),{matches:p}=et(),h=Xe(o,i);l&&(l.didRenderScripts=!0);let g=at(p,null,a);r.useEffect((()=>{st=!0}),[]);let v=r.useMemo((()=>{var a;let l=m?"window.__reactRouterContext = ".concat(n,";").concat("window.__reactRouterContext.stream = new ReadableStream({start(controller){window.__reactRouterContext.streamController = controller;}}).pipeThrough(new TextEncoderStream());"):" ",o=f?"".concat(null!==(a=t.hmr)&&void 0!==a&&a.runtime?"import ".concat(JSON.stringify(t.hmr.runtime),";"):"").concat(h?"":"import ".concat(JSON.stringify(t.url)),";\n").concat(g.map(((e,n)=>{let r="route".concat(n),a=t.routes[e.route.id];Ie(a,"Route ".concat(e.route.id," not found in manifest"));let{clientActionModule:l,clientLoaderModule:o,clientMiddlewareModule:i,hydrateFallbackModule:s,module:c}=a,u=[...l?[{module:l,varName:"".concat(r,"_clientAction")}]:[],...o?[{module:o,varName:"".concat(r,"_clientLoader")}]:[],...i?[{module:i,varName:"".concat(r,"_clientMiddleware")}]:[],...s?[{module:s,varName:"".concat(r,"_HydrateFallback")}]:[],{module:c,varName:"".concat(r,"_main")}];return 1===u.length?"import * as ".concat(r," from ").concat(JSON.stringify(c),";"):[u.map((e=>"import * as ".concat(e.varName,' from "').concat(e.module,'";'))).join("\n"),"const ".concat(r," = {").concat(u.map((e=>"...".concat(e.varName))).join(","),"};")].join("\n")})).join("\n"),"\n  ").concat(h?"window.__reactRouterManifest = ".concat(JSON.stringify(function(e,t){let{sri:n}=e,r=u(e,d),a=new Set(t.state.matches.map((e=>e.route.id))),l=t.state.location.pathname.split("/").filter(Boolean),o=["/"];for(l.pop();l.length>0;)o.push("/".concat(l.join("/"))),l.pop();o.forEach((e=>{let n=C(t.routes,e,t.basename);n&&n.forEach((e=>a.add(e.route.id)))}));let i=[...a].reduce(((e,t)=>Object.assign(e,{[t]:r.routes[t]})),{});return c(c({},r),{},{routes:i,sri:!!n||void 0})}(t,s),null,2),";"):"","\n  window.__reactRouterRouteModules = {").concat(g.map(((e,t)=>"".concat(JSON.stringify(e.route.id),":route").concat(t))).join(","),"};\n\nimport(").concat(JSON.stringify(t.entry.module),");"):" ";return r.createElement(r.Fragment,null,r.createElement("script",c(c({},e),{},{suppressHydrationWarning:!0,dangerouslySetInnerHTML:Qe(l),type:void 0})),r.createElement("script",c(c({},e),{},{suppressHydrationWarning:!0,dangerouslySetInnerHTML:Qe(o),type:"module",async:!0})))}),[]),b=st?[]:(y=t.entry.imports.concat(qe(g,t,{includeHydrateFallback:!0})),[...new Set(y)]);var y;let x="object"===typeof t.sri?t.sri:{};return st?null:r.createElement(r.Fragment,null,"object"===typeof t.sri?r.createElement("script",{"rr-importmap":"",type:"importmap",suppressHydrationWarning:!0,dangerouslySetInnerHTML:{__html:JSON.stringify({integrity:x})}}):null,h?null:r.createElement("link",{rel:"modulepreload",href:t.url,crossOrigin:e.crossOrigin,integrity:x[t.url],suppressHydrationWarning:!0}),r.createElement("link",{rel:"modulepreload",href:t.entry.module,crossOrigin:e.crossOrigin,integrity:x[t.entry.module],suppressHydrationWarning:!0}),b.map((t=>r.createElement("link",{key:t,rel:"modulepreload",href:t,crossOrigin:e.crossOrigin,integrity:x[t],suppressHydrationWarning:!0}))),v)}function ut(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return e=>{t.forEach((t=>{"function"===typeof t?t(e):null!=t&&(t.current=e)}))}}var dt="undefined"!==typeof window&&"undefined"!==typeof window.document&&"undefined"!==typeof window.document.createElement;try{dt&&(window.__reactRouterVersion="7.6.2")}catch(At){}function ft(e){let{basename:t,children:n,window:a}=e,l=r.useRef();null==l.current&&(l.current=b({window:a,v5Compat:!0}));let o=l.current,[i,s]=r.useState({action:o.action,location:o.location}),c=r.useCallback((e=>{r.startTransition((()=>s(e)))}),[s]);return r.useLayoutEffect((()=>o.listen(c)),[o,c]),r.createElement(Le,{basename:t,children:n,location:i.location,navigationType:i.action,navigator:o})}var mt=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,pt=r.forwardRef((function(e,t){let n,{onClick:a,discover:l="render",prefetch:o="none",relative:i,reloadDocument:s,replace:d,state:f,target:m,to:h,preventScrollReset:g,viewTransition:v}=e,b=u(e,p),{basename:w}=r.useContext(oe),k="string"===typeof h&&mt.test(h),N=!1;if("string"===typeof h&&k&&(n=h,dt))try{let e=new URL(window.location.href),t=h.startsWith("//")?new URL(e.protocol+h):new URL(h),n=V(t.pathname,w);t.origin===e.origin&&null!=n?h=n+t.search+t.hash:N=!0}catch(At){x(!1,'<Link to="'.concat(h,'"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.'))}let S=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};y(ue(),"useHref() may be used only in the context of a <Router> component.");let{basename:n,navigator:a}=r.useContext(oe),{hash:l,pathname:o,search:i}=he(e,{relative:t}),s=o;return"/"!==n&&(s="/"===o?n:G([n,o])),a.createHref({pathname:s,search:i,hash:l})}(h,{relative:i}),[_,C,E]=function(e,t){let n=r.useContext(tt),[a,l]=r.useState(!1),[o,i]=r.useState(!1),{onFocus:s,onBlur:c,onMouseEnter:u,onMouseLeave:d,onTouchStart:f}=t,m=r.useRef(null);r.useEffect((()=>{if("render"===e&&i(!0),"viewport"===e){let e=new IntersectionObserver((e=>{e.forEach((e=>{i(e.isIntersecting)}))}),{threshold:.5});return m.current&&e.observe(m.current),()=>{e.disconnect()}}}),[e]),r.useEffect((()=>{if(a){let e=setTimeout((()=>{i(!0)}),100);return()=>{clearTimeout(e)}}}),[a]);let p=()=>{l(!0)},h=()=>{l(!1),i(!1)};return n?"intent"!==e?[o,m,{}]:[o,m,{onFocus:rt(s,p),onBlur:rt(c,h),onMouseEnter:rt(u,p),onMouseLeave:rt(d,h),onTouchStart:rt(f,p)}]:[!1,m,{}]}(o,b),P=function(e){let{target:t,replace:n,state:a,preventScrollReset:l,relative:o,viewTransition:i}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},s=pe(),c=de(),u=he(e,{relative:o});return r.useCallback((r=>{if(function(e,t){return 0===e.button&&(!t||"_self"===t)&&!function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e)}(r,t)){r.preventDefault();let t=void 0!==n?n:j(c)===j(u);s(e,{replace:t,state:a,preventScrollReset:l,relative:o,viewTransition:i})}}),[c,s,u,n,a,t,e,l,o,i])}(h,{replace:d,state:f,target:m,preventScrollReset:g,relative:i,viewTransition:v});let L=r.createElement("a",c(c(c({},b),E),{},{href:n||S,onClick:N||s?a:function(e){a&&a(e),e.defaultPrevented||P(e)},ref:ut(t,C),target:m,"data-discover":k||"render"!==l?void 0:"true"}));return _&&!k?r.createElement(r.Fragment,null,L,r.createElement(lt,{page:S})):L}));pt.displayName="Link",r.forwardRef((function(e,t){let{"aria-current":n="page",caseSensitive:a=!1,className:l="",end:o=!1,style:i,to:s,viewTransition:d,children:f}=e,m=u(e,h),p=he(s,{relative:m.relative}),g=de(),v=r.useContext(ne),{navigator:b,basename:x}=r.useContext(oe),w=null!=v&&function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=r.useContext(re);y(null!=n,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:a}=vt("useViewTransitionState"),l=he(e,{relative:t.relative});if(!n.isTransitioning)return!1;let o=V(n.currentLocation.pathname,a)||n.currentLocation.pathname,i=V(n.nextLocation.pathname,a)||n.nextLocation.pathname;return null!=I(l.pathname,i)||null!=I(l.pathname,o)}(p)&&!0===d,k=b.encodeLocation?b.encodeLocation(p).pathname:p.pathname,j=g.pathname,N=v&&v.navigation&&v.navigation.location?v.navigation.location.pathname:null;a||(j=j.toLowerCase(),N=N?N.toLowerCase():null,k=k.toLowerCase()),N&&x&&(N=V(N,x)||N);const S="/"!==k&&k.endsWith("/")?k.length-1:k.length;let _,C=j===k||!o&&j.startsWith(k)&&"/"===j.charAt(S),E=null!=N&&(N===k||!o&&N.startsWith(k)&&"/"===N.charAt(k.length)),P={isActive:C,isPending:E,isTransitioning:w},L=C?n:void 0;_="function"===typeof l?l(P):[l,C?"active":null,E?"pending":null,w?"transitioning":null].filter(Boolean).join(" ");let z="function"===typeof i?i(P):i;return r.createElement(pt,c(c({},m),{},{"aria-current":L,className:_,ref:t,style:z,to:s,viewTransition:d}),"function"===typeof f?f(P):f)})).displayName="NavLink";var ht=r.forwardRef(((e,t)=>{let{discover:n="render",fetcherKey:a,navigate:l,reloadDocument:o,replace:i,state:s,method:d=Me,action:f,onSubmit:m,relative:p,preventScrollReset:h,viewTransition:v}=e,b=u(e,g),x=xt(),w=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{basename:n}=r.useContext(oe),a=r.useContext(se);y(a,"useFormAction must be used inside a RouteContext");let[l]=a.matches.slice(-1),o=c({},he(e||".",{relative:t})),i=de();if(null==e){o.search=i.search;let e=new URLSearchParams(o.search),t=e.getAll("index");if(t.some((e=>""===e))){e.delete("index"),t.filter((e=>e)).forEach((t=>e.append("index",t)));let n=e.toString();o.search=n?"?".concat(n):""}}e&&"."!==e||!l.route.index||(o.search=o.search?o.search.replace(/^\?/,"?index&"):"?index");"/"!==n&&(o.pathname="/"===o.pathname?n:G([n,o.pathname]));return j(o)}(f,{relative:p}),k="get"===d.toLowerCase()?"get":"post",N="string"===typeof f&&mt.test(f);return r.createElement("form",c(c({ref:t,method:k,action:w,onSubmit:o?m:e=>{if(m&&m(e),e.defaultPrevented)return;e.preventDefault();let t=e.nativeEvent.submitter,n=(null===t||void 0===t?void 0:t.getAttribute("formmethod"))||d;x(t||e.currentTarget,{fetcherKey:a,method:n,navigate:l,replace:i,state:s,relative:p,preventScrollReset:h,viewTransition:v})}},b),{},{"data-discover":N||"render"!==n?void 0:"true"}))}));function gt(e){return"".concat(e," must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.")}function vt(e){let t=r.useContext(te);return y(t,gt(e)),t}ht.displayName="Form";var bt=0,yt=()=>"__".concat(String(++bt),"__");function xt(){let{router:e}=vt("useSubmit"),{basename:t}=r.useContext(oe),n=Se("useRouteId");return r.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{action:l,method:o,encType:i,formData:s,body:c}=He(r,t);if(!1===a.navigate){let t=a.fetcherKey||yt();await e.fetch(t,n,a.action||l,{preventScrollReset:a.preventScrollReset,formData:s,body:c,formMethod:a.method||o,formEncType:a.encType||i,flushSync:a.flushSync})}else await e.navigate(a.action||l,{preventScrollReset:a.preventScrollReset,formData:s,body:c,formMethod:a.method||o,formEncType:a.encType||i,replace:a.replace,state:a.state,fromRouteId:n,flushSync:a.flushSync,viewTransition:a.viewTransition})}),[e,t,n])}var wt=n(579);const kt=e=>{let{appName:t="ModelForge"}=e;const n=de(),r="/finetune/load_settings"===n.pathname||"/finetune/loading"===n.pathname,a="/"===n.pathname||"/home"===n.pathname,l=!a&&!r,o="/technical-details"===n.pathname,i=(()=>{switch(n.pathname){case"/":case"/home":default:return null;case"/finetune/detect":return"Hardware Detection";case"/finetune/load_settings":return"Finetuning Settings";case"/finetune/loading":return"Training Progress";case"/technical-details":return"Technical Documentation";case"/app":return"Application";case"/models":return"My models"}})(),s=i&&!o;return(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsx)("nav",{className:"".concat("/"===n.pathname||"/home"===n.pathname?"bg-black":"bg-[#141b2d]"," py-4 px-4"),children:(0,wt.jsxs)("div",{className:"container mx-auto flex justify-between items-center",children:[(0,wt.jsx)("div",{className:"flex items-center",children:r?(0,wt.jsxs)("div",{className:"flex items-center",children:[(0,wt.jsx)("div",{className:"w-8 h-8 mr-2",children:(0,wt.jsxs)("svg",{width:"62",height:"62",viewBox:"0 0 62 62",fill:"none",xmlns:"http://www.w3.org/2000/svg",className:"w-full h-full",children:[(0,wt.jsx)("rect",{width:"62",height:"62",rx:"10",fill:"#E34D26"}),(0,wt.jsx)("path",{d:"M31 19.5V24.5M31 19.5H26M31 19.5H36M31 42.5V37.5M31 42.5H36M31 42.5H26M19.5 31H24.5M19.5 31V26M19.5 31V36M42.5 31H37.5M42.5 31V36M42.5 31V26M26 19.5V24.5H24.5V26H19.5M36 19.5V24.5H37.5V26H42.5M26 42.5V37.5H24.5V36H19.5M36 42.5V37.5H37.5V36H42.5",stroke:"white",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"})]})}),(0,wt.jsx)("span",{className:"text-white text-xl font-bold",children:t})]}):(0,wt.jsxs)(pt,{to:"/",className:"flex items-center",children:[(0,wt.jsx)("div",{className:"w-8 h-8 mr-2",children:(0,wt.jsxs)("svg",{width:"62",height:"62",viewBox:"0 0 62 62",fill:"none",xmlns:"http://www.w3.org/2000/svg",className:"w-full h-full",children:[(0,wt.jsx)("rect",{width:"62",height:"62",rx:"10",fill:"#E34D26"}),(0,wt.jsx)("path",{d:"M31 19.5V24.5M31 19.5H26M31 19.5H36M31 42.5V37.5M31 42.5H36M31 42.5H26M19.5 31H24.5M19.5 31V26M19.5 31V36M42.5 31H37.5M42.5 31V36M42.5 31V26M26 19.5V24.5H24.5V26H19.5M36 19.5V24.5H37.5V26H42.5M26 42.5V37.5H24.5V36H19.5M36 42.5V37.5H37.5V36H42.5",stroke:"white",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"})]})}),(0,wt.jsx)("span",{className:"text-white text-xl font-bold",children:t})]})}),(0,wt.jsxs)("div",{className:"flex items-center",children:[!r&&(0,wt.jsx)(pt,{to:"/models",className:"text-white px-4 py-2 rounded-lg transition ".concat("/models"===n.pathname?"bg-[#232c40] font-semibold":"hover:bg-[#232c40]"),style:{marginRight:"0.5rem"},children:"My Models"}),l&&(0,wt.jsxs)(pt,{to:"/",className:"bg-[#232c40] hover:bg-[#2d3a52] text-white px-4 py-2 rounded-lg flex items-center gap-2 transition",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-4 w-4",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M15 19l-7-7 7-7"})}),"Back to Home"]}),a&&(0,wt.jsx)(pt,{to:"/finetune/detect",className:"text-orange-500 hover:text-orange-400 px-4 py-2 transition",children:"Get Started"})]})]})}),"/"===n.pathname||"/home"===n.pathname||"/finetune/load_settings"===n.pathname||"/finetune/detect"===n.pathname?null:"/technical-details"===n.pathname?(0,wt.jsx)("div",{className:"bg-[#141b2d] pt-6 pb-12",children:(0,wt.jsx)("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:(0,wt.jsxs)("div",{className:"text-center",children:[(0,wt.jsx)("h1",{className:"text-4xl md:text-5xl font-bold mb-4 text-white",children:"Technical Documentation"}),(0,wt.jsx)("p",{className:"text-xl text-gray-300 max-w-3xl mx-auto",children:"Comprehensive technical details for developers and ML engineers"})]})})}):(0,wt.jsx)("header",{className:"py-6 md:py-12 bg-[#141b2d]",children:(0,wt.jsx)("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:s&&(0,wt.jsx)("div",{className:"mt-8 text-center",children:(0,wt.jsx)("h1",{className:"text-3xl md:text-4xl font-bold mb-4 text-white",children:i})})})}),(0,wt.jsx)("style",{jsx:"true",children:"\n        .bg-technical-tabs {\n          background-color: #182035;\n        }\n      "})]})},jt=e=>{let{appName:t="ModelForge"}=e;const n=[{title:"No-Code Interface",description:"Train AI models with simple clicks - no programming required",icon:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"w-10 h-10",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M10 20l4-16m4 4l4 4-4 4M6 16l-4-4 4-4"})})},{title:"Smart Hardware Detection",description:"Automatically configures for your computer's capabilities",icon:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"w-10 h-10",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2z"})})},{title:"Efficient Training",description:"Get results in minutes, not days",icon:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"w-10 h-10",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13 10V3L4 14h7v7l9-11h-7z"})})},{title:"Business Ready",description:"Custom AI models tailored to your industry needs",icon:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"w-10 h-10",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M21 13.255A23.931 23.931 0 0112 15c-3.183 0-6.22-.62-9-1.745M16 6V4a2 2 0 00-2-2h-4a2 2 0 00-2 2v2m4 6h.01M5 20h14a2 2 0 002-2V8a2 2 0 00-2-2H5a2 2 0 00-2 2v10a2 2 0 002 2z"})})}];return(0,wt.jsxs)("div",{className:"bg-black text-gray-100 min-h-screen",children:[(0,wt.jsxs)("div",{className:"hero-section py-16 lg:py-24 relative overflow-hidden",children:[(0,wt.jsx)("div",{className:"absolute inset-0 z-0",children:(0,wt.jsxs)("div",{className:"neural-network",children:[(0,wt.jsx)("div",{className:"node node-1"}),(0,wt.jsx)("div",{className:"node node-2"}),(0,wt.jsx)("div",{className:"node node-3"}),(0,wt.jsx)("div",{className:"node node-4"}),(0,wt.jsx)("div",{className:"node node-5"}),(0,wt.jsx)("div",{className:"node node-6"}),(0,wt.jsx)("div",{className:"connection connection-1"}),(0,wt.jsx)("div",{className:"connection connection-2"}),(0,wt.jsx)("div",{className:"connection connection-3"}),(0,wt.jsx)("div",{className:"connection connection-4"}),(0,wt.jsx)("div",{className:"connection connection-5"})]})}),(0,wt.jsxs)("div",{className:"max-w-6xl mx-auto px-4 relative z-10",children:[(0,wt.jsxs)("div",{className:"animate-fade-in text-center",children:[(0,wt.jsx)("div",{className:"mb-6 inline-block relative",children:(0,wt.jsx)("span",{className:"bg-orange-500 text-white text-sm md:text-base px-3 py-1 rounded-full transform -rotate-2 inline-block",children:"No Coding Required!"})}),(0,wt.jsxs)("h1",{className:"text-4xl md:text-6xl lg:text-7xl font-bold mb-6 relative",children:[(0,wt.jsx)("span",{className:"block",children:"AI So Easy"}),(0,wt.jsx)("span",{className:"text-transparent bg-clip-text bg-gradient-to-r from-orange-400 to-orange-600",children:"Your Grandma Can Use It"}),(0,wt.jsx)("div",{className:"absolute -top-8 -right-8 md:right-64 transform rotate-12 opacity-70",children:(0,wt.jsx)("svg",{className:"w-16 h-16 text-orange-500",fill:"currentColor",viewBox:"0 0 20 20",children:(0,wt.jsx)("path",{d:"M5 2a1 1 0 011 1v1h1a1 1 0 010 2H6v1a1 1 0 01-2 0V6H3a1 1 0 010-2h1V3a1 1 0 011-1zm0 10a1 1 0 011 1v1h1a1 1 0 110 2H6v1a1 1 0 11-2 0v-1H3a1 1 0 110-2h1v-1a1 1 0 011-1zM12 2a1 1 0 01.967.744L14.146 7.2 17.5 9.134a1 1 0 010 1.732l-3.354 1.935-1.18 4.455a1 1 0 01-1.933 0L9.854 12.8 6.5 10.866a1 1 0 010-1.732l3.354-1.935 1.18-4.455A1 1 0 0112 2z"})})})]}),(0,wt.jsx)("p",{className:"text-xl md:text-2xl text-gray-300 mb-8 max-w-3xl mx-auto",children:"Transform and customize AI models in minutes with zero technical knowledge. Point, click, and watch your custom AI come to life!"}),(0,wt.jsxs)("div",{className:"flex flex-wrap justify-center gap-4",children:[(0,wt.jsxs)(pt,{to:"/finetune/detect",className:"group bg-gradient-to-r from-orange-500 to-orange-600 hover:from-orange-600 hover:to-orange-700 px-8 py-4 rounded-lg text-lg font-medium transition shadow-lg hover:shadow-orange-500/30 transform hover:-translate-y-1",children:["Start Building Your AI",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 inline-block ml-2 transition-transform group-hover:translate-x-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M13 7l5 5m0 0l-5 5m5-5H6"})})]}),(0,wt.jsx)(pt,{to:"/technical-details",className:"border border-orange-500 text-orange-400 hover:bg-orange-500 hover:text-white px-8 py-4 rounded-lg text-lg font-medium transition transform hover:-translate-y-1",children:"Learn More"})]})]}),(0,wt.jsx)("div",{className:"mt-16 grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6",children:n.map(((e,t)=>(0,wt.jsxs)("div",{className:"feature-card bg-gray-900/70 backdrop-blur-sm border border-gray-800 p-6 rounded-xl transform transition-all duration-300 hover:scale-105 hover:border-orange-500 hover:shadow-lg hover:shadow-orange-500/20",style:{animationDelay:"".concat(.1*t,"s")},children:[(0,wt.jsx)("div",{className:"icon-container mb-4 p-3 bg-orange-500/10 rounded-lg inline-block",children:(0,wt.jsx)("div",{className:"text-orange-500",children:e.icon})}),(0,wt.jsx)("h3",{className:"text-xl font-bold mb-2",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-400",children:e.description})]},e.title)))})]})]}),(0,wt.jsx)("div",{id:"how-it-works",className:"how-it-works py-16 lg:py-24 bg-gradient-to-b from-black to-gray-900",children:(0,wt.jsxs)("div",{className:"max-w-6xl mx-auto px-4",children:[(0,wt.jsxs)("div",{className:"text-center mb-16",children:[(0,wt.jsx)("h2",{className:"text-3xl md:text-4xl font-bold mb-4",children:"From Zero to AI Hero in 3 Simple Steps"}),(0,wt.jsx)("p",{className:"text-xl text-gray-300 max-w-2xl mx-auto",children:"No PhD required. Just point, click, and watch the magic happen."})]}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-8",children:[(0,wt.jsxs)("div",{className:"step-card relative",children:[(0,wt.jsx)("div",{className:"absolute -left-4 -top-4 w-14 h-14 bg-orange-500 rounded-full flex items-center justify-center text-2xl font-bold",children:"1"}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-8 pt-12 h-full transform transition-all duration-300 hover:scale-105 hover:shadow-xl hover:shadow-orange-500/10",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold mb-4",children:"Hardware Detection"}),(0,wt.jsx)("p",{className:"text-gray-300 mb-4",children:"Our system automatically scans your computer and configures the perfect settings based on your hardware."}),(0,wt.jsx)("div",{className:"mt-4 flex justify-center",children:(0,wt.jsx)("div",{className:"w-16 h-16 rounded-full bg-orange-500/20 flex items-center justify-center",children:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-8 w-8 text-orange-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2z"})})})})]})]}),(0,wt.jsxs)("div",{className:"step-card relative",children:[(0,wt.jsx)("div",{className:"absolute -left-4 -top-4 w-14 h-14 bg-orange-500 rounded-full flex items-center justify-center text-2xl font-bold",children:"2"}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-8 pt-12 h-full transform transition-all duration-300 hover:scale-105 hover:shadow-xl hover:shadow-orange-500/10",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold mb-4",children:"Pick Your Settings"}),(0,wt.jsx)("p",{className:"text-gray-300 mb-4",children:"Use our simple sliders and dropdowns to customize your AI. No code or complex terms to worry about."}),(0,wt.jsx)("div",{className:"mt-4 flex justify-center",children:(0,wt.jsx)("div",{className:"w-16 h-16 rounded-full bg-orange-500/20 flex items-center justify-center",children:(0,wt.jsxs)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-8 w-8 text-orange-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:[(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M10.325 4.317c.426-1.756 2.924-1.756 3.35 0a1.724 1.724 0 002.573 1.066c1.543-.94 3.31.826 2.37 2.37a1.724 1.724 0 001.065 2.572c1.756.426 1.756 2.924 0 3.35a1.724 1.724 0 00-1.066 2.573c.94 1.543-.826 3.31-2.37 2.37a1.724 1.724 0 00-2.572 1.065c-.426 1.756-2.924 1.756-3.35 0a1.724 1.724 0 00-2.573-1.066c-1.543.94-3.31-.826-2.37-2.37a1.724 1.724 0 00-1.065-2.572c-1.756-.426-1.756-2.924 0-3.35a1.724 1.724 0 001.066-2.573c-.94-1.543.826-3.31 2.37-2.37.996.608 2.296.07 2.572-1.065z"}),(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M15 12a3 3 0 11-6 0 3 3 0 016 0z"})]})})})]})]}),(0,wt.jsxs)("div",{className:"step-card relative",children:[(0,wt.jsx)("div",{className:"absolute -left-4 -top-4 w-14 h-14 bg-orange-500 rounded-full flex items-center justify-center text-2xl font-bold",children:"3"}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-8 pt-12 h-full transform transition-all duration-300 hover:scale-105 hover:shadow-xl hover:shadow-orange-500/10",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold mb-4",children:"Launch Your AI"}),(0,wt.jsx)("p",{className:"text-gray-300 mb-4",children:"Click one button and watch as your custom AI model trains and deploys automatically."}),(0,wt.jsx)("div",{className:"mt-4 flex justify-center",children:(0,wt.jsx)("div",{className:"w-16 h-16 rounded-full bg-orange-500/20 flex items-center justify-center",children:(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-8 w-8 text-orange-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13 10V3L4 14h7v7l9-11h-7z"})})})})]})]})]})]})}),(0,wt.jsx)("div",{className:"business-section py-16 lg:py-24 bg-gradient-to-b from-gray-900 to-black",children:(0,wt.jsx)("div",{className:"max-w-6xl mx-auto px-4",children:(0,wt.jsxs)("div",{className:"grid grid-cols-1 lg:grid-cols-2 gap-12 items-center",children:[(0,wt.jsxs)("div",{className:"order-2 lg:order-1",children:[(0,wt.jsx)("h2",{className:"text-3xl md:text-4xl font-bold mb-6",children:"Perfect for Business"}),(0,wt.jsx)("p",{className:"text-xl text-gray-300 mb-8",children:"Skip the expensive AI consultants. Train models on your business data in-house with zero technical expertise needed."}),(0,wt.jsx)("ul",{className:"space-y-4",children:["Automate customer support with custom chatbots","Extract insights from your business documents","Create AI assistants trained on your company knowledge","Generate content aligned with your brand voice"].map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 mr-2 text-orange-500 flex-shrink-0",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M5 13l4 4L19 7"})}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))}),(0,wt.jsx)("div",{className:"mt-8",children:(0,wt.jsxs)(pt,{to:"/finetune/detect",className:"group bg-gradient-to-r from-orange-500 to-orange-600 hover:from-orange-600 hover:to-orange-700 px-8 py-4 rounded-lg text-lg font-medium transition shadow-lg hover:shadow-orange-500/30",children:["Start Your Business AI",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 inline-block ml-2 transition-transform group-hover:translate-x-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M13 7l5 5m0 0l-5 5m5-5H6"})})]})})]}),(0,wt.jsx)("div",{className:"order-1 lg:order-2 flex justify-center",children:(0,wt.jsxs)("div",{className:"business-illustration relative w-full max-w-md",children:[(0,wt.jsx)("div",{className:"relative bg-gray-800 rounded-xl overflow-hidden shadow-2xl transform rotate-2 hover:rotate-0 transition-all duration-500",children:(0,wt.jsxs)("div",{className:"aspect-w-16 aspect-h-9 p-6",children:[(0,wt.jsx)("div",{className:"bg-gray-700 w-full h-32 rounded-lg mb-4 animate-pulse"}),(0,wt.jsx)("div",{className:"bg-gray-700 w-3/4 h-8 rounded-lg mb-3 animate-pulse"}),(0,wt.jsx)("div",{className:"bg-gray-700 w-1/2 h-8 rounded-lg mb-6 animate-pulse"}),(0,wt.jsxs)("div",{className:"flex space-x-4",children:[(0,wt.jsx)("div",{className:"bg-orange-500 w-1/3 h-10 rounded-lg animate-pulse"}),(0,wt.jsx)("div",{className:"bg-gray-700 w-1/3 h-10 rounded-lg animate-pulse"})]})]})}),(0,wt.jsx)("div",{className:"absolute -bottom-6 -right-6 bg-orange-500 rounded-full w-16 h-16 flex items-center justify-center text-white text-xl font-bold transform rotate-12",children:"New!"})]})})]})})}),(0,wt.jsxs)("div",{className:"cta-section py-16 lg:py-24 bg-black text-center relative overflow-hidden",children:[(0,wt.jsxs)("div",{className:"absolute inset-0 z-0 opacity-20",children:[(0,wt.jsx)("div",{className:"absolute top-0 left-1/4 w-64 h-64 bg-orange-500 rounded-full filter blur-3xl"}),(0,wt.jsx)("div",{className:"absolute bottom-0 right-1/4 w-64 h-64 bg-orange-600 rounded-full filter blur-3xl"})]}),(0,wt.jsxs)("div",{className:"max-w-4xl mx-auto px-4 relative z-10",children:[(0,wt.jsx)("h2",{className:"text-3xl md:text-5xl font-bold mb-6",children:"Ready to Build Your Custom AI?"}),(0,wt.jsx)("p",{className:"text-xl text-gray-300 mb-8 max-w-2xl mx-auto",children:"If your grandma can use a smartphone, she can build an AI with ModelForge. No coding. No technical skills. Just pure AI power at your fingertips."}),(0,wt.jsxs)(pt,{to:"/finetune/detect",className:"group bg-gradient-to-r from-orange-500 to-orange-600 hover:from-orange-600 hover:to-orange-700 px-10 py-5 rounded-lg text-xl font-bold transition shadow-xl hover:shadow-orange-500/30 transform hover:-translate-y-1",children:["Start Building Now",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 inline-block ml-2 transition-transform group-hover:translate-x-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M13 7l5 5m0 0l-5 5m5-5H6"})})]}),(0,wt.jsx)("p",{className:"mt-6 text-gray-400",children:"No credit card required. Ready in minutes."}),(0,wt.jsx)("div",{className:"mt-12",children:(0,wt.jsxs)(pt,{to:"/technical-details",className:"text-orange-500 hover:text-orange-400 flex items-center justify-center group",children:[(0,wt.jsx)("span",{children:"View technical specifications"}),(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 ml-2 group-hover:translate-x-1 transition-transform",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M14 5l7 7m0 0l-7 7m7-7H3"})})]})})]})]})]})},Nt={baseURL:"/api",headers:{"Content-Type":"application/json"}},St=e=>{var t;let{currentSettings:n,updateSettings:a}=e;const l=pe(),[o,i]=(0,r.useState)(!1),[s,u]=(0,r.useState)(n.task||""),[d,f]=(0,r.useState)(n.model_name||""),[m,p]=(0,r.useState)(null),[h,g]=(0,r.useState)(!1),[v,b]=(0,r.useState)(!1),[y,x]=(0,r.useState)(""),[w,k]=(0,r.useState)(null),[j,N]=(0,r.useState)(null),[S,_]=(0,r.useState)(!1);(0,r.useEffect)((()=>{i(!1)}),[s]),(0,r.useEffect)((()=>{console.log("Current settings from props:",n),u(n.task||""),f(n.model_name||"")}),[n]),(0,r.useEffect)((()=>{v||(x(""),k(null),N(null),_(!1))}),[v]);return(0,wt.jsxs)("div",{className:"max-w-4xl mx-auto p-4",children:[(0,wt.jsxs)("div",{className:"text-center mb-10",children:[(0,wt.jsx)("h1",{className:"text-3xl md:text-4xl font-bold mb-4",children:"Hardware Detection"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 mb-6",children:"Let's check your system to find the optimal configuration for LLM finetuning"})]}),h&&(0,wt.jsxs)("div",{className:"bg-green-700 text-white p-4 rounded-lg mb-6 flex items-center justify-between",children:[(0,wt.jsx)("div",{children:"Settings updated successfully! Redirecting to configuration page..."}),(0,wt.jsx)("div",{className:"animate-spin h-5 w-5 border-2 border-white rounded-full border-t-transparent"})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-6 md:p-8 shadow-lg mb-12",children:[(0,wt.jsxs)("h2",{className:"text-2xl font-semibold mb-6 flex items-center",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 mr-2 text-orange-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2zM9 9h6v6H9V9z"})}),"System Hardware Configuration"]}),(0,wt.jsxs)("form",{onSubmit:async e=>{e.preventDefault();try{console.log("Selected Task:",s);const e=await fetch("".concat(Nt.baseURL,"/finetune/detect"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({task:s})}),t=await e.json();if(!e.ok)throw new Error("Failed to fetch hardware data");p(t),i(!0);const n={task:s,hardware_config:{gpu:t.gpu_name,ram:t.ram_total_gb,disk:t.available_diskspace_gb,cpu_cores:t.cpu_cores}};console.log("Updating both task and hardware config:",n),a((e=>{console.log("Previous Settings in handleSubmit:",e);const t=c(c({},e),n);return console.log("New Settings in handleSubmit:",t),t}))}catch(t){console.error("Error:",t.message)}},className:"mb-8",children:[(0,wt.jsx)("h3",{className:"text-xl font-medium mb-4",children:"Select Task"}),(0,wt.jsx)("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4",children:[{id:"text-generation",title:"Text Generation",description:"Create models for generating coherent and relevant answers to queries based on old knowledge, like Customer Support Bots"},{id:"summarization",title:"Summarization",description:"Train models that can condense long documents into concise summaries."},{id:"extractive-question-answering",title:"Extractive Question Answering",description:"Build models that extract relevant answers from large texts based on user queries, like for RAG."}].map((e=>(0,wt.jsxs)("div",{onClick:()=>u(e.id),className:"\n        task-card p-5 rounded-lg cursor-pointer transition-all\n        ".concat(s===e.id?"bg-gray-800 border-2 border-orange-500":"bg-gray-800 border border-gray-700","\n        hover:border-orange-500 hover:bg-gray-700\n      "),children:[(0,wt.jsxs)("div",{className:"flex items-center justify-between mb-2",children:[(0,wt.jsx)("h4",{className:"text-lg font-medium text-orange-500",children:e.title}),s===e.id&&(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 text-orange-500",viewBox:"0 0 20 20",fill:"currentColor",children:(0,wt.jsx)("path",{fillRule:"evenodd",d:"M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z",clipRule:"evenodd"})})]}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm",children:e.description})]},e.id)))}),(0,wt.jsx)("div",{className:"mt-6 flex flex-col md:flex-row md:items-center md:justify-between",children:(0,wt.jsx)("button",{type:"submit",className:"bg-orange-500 hover:bg-orange-600 px-6 py-3 rounded-lg text-white font-medium transition disabled:opacity-50 disabled:cursor-not-allowed flex items-center justify-center",disabled:!s,children:"Detect Hardware"})})]}),o&&m&&(0,wt.jsxs)("div",{className:"border-t border-gray-700 pt-6 mt-6",children:[(0,wt.jsx)("h3",{className:"text-xl font-medium mb-4",children:"Hardware Detection Results"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"System Profile"}),(0,wt.jsx)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:m.profile})]}),(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"GPU"}),(0,wt.jsx)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:m.gpu_name})]}),(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"GPU Memory"}),(0,wt.jsxs)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:[m.gpu_total_memory_gb," GB"]})]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"System RAM"}),(0,wt.jsxs)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:[m.ram_total_gb," GB"]})]}),(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"Available Disk Space"}),(0,wt.jsxs)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:[m.available_diskspace_gb," GB"]})]}),(0,wt.jsxs)("div",{className:"mb-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"CPU Cores"}),(0,wt.jsx)("div",{className:"p-3 bg-gray-900 rounded-lg text-white",children:m.cpu_cores})]})]})]}),(0,wt.jsxs)("div",{className:"mt-4",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"Recommended Model"}),(0,wt.jsx)("div",{className:"p-3 bg-gray-900 rounded-lg font-medium text-orange-500",children:m.model_recommendation})]}),(0,wt.jsxs)("div",{className:"mt-6",children:[(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-3",children:"Model Selection"}),(0,wt.jsx)("div",{className:"mb-4",children:(0,wt.jsxs)("div",{className:"flex flex-col space-y-2",children:[(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"modelType",checked:!v,onChange:()=>b(!1),className:"mr-3 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"text-white",children:"Use Recommended Models"})]}),(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"modelType",checked:v,onChange:()=>b(!0),className:"mr-3 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"text-white",children:"Use Custom Model"})]})]})}),!v&&(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{htmlFor:"model-select",className:"block text-sm font-medium text-gray-400 mb-1",children:"Select Your Model"}),(0,wt.jsxs)("select",{id:"model-select",value:d,onChange:async e=>{console.log("Setting model to:",e.target.value),f(e.target.value),await fetch("".concat(Nt.baseURL,"/finetune/set_model"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({selected_model:e.target.value})})},className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"",children:"Select a model"}),null===(t=m.possible_options)||void 0===t?void 0:t.map((e=>(0,wt.jsx)("option",{value:e,children:e},e)))]})]}),v&&(0,wt.jsxs)("div",{className:"space-y-4",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{htmlFor:"custom-repo",className:"block text-sm font-medium text-gray-400 mb-1",children:"HuggingFace Repository Name"}),(0,wt.jsxs)("div",{className:"flex space-x-2",children:[(0,wt.jsx)("input",{id:"custom-repo",type:"text",value:y,onChange:e=>{x(e.target.value),w&&(k(null),N(null))},placeholder:"meta-llama/Llama-3.2-1B",className:"bg-gray-900 border border-gray-700 rounded-lg p-3 flex-1 text-white focus:border-orange-500 focus:outline-none"}),(0,wt.jsx)("button",{onClick:async()=>{if(!y.trim())return k("invalid"),void N({error:"Repository name cannot be empty"});k("validating");try{const e=await fetch("".concat(Nt.baseURL,"/finetune/validate_custom_model"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({repo_name:y.trim()})}),t=await e.json();e.ok&&t.validation.valid?(k("valid"),N(t.validation)):(k("invalid"),N(t.validation||{error:"Validation failed"}))}catch(e){console.error("Validation error:",e),k("invalid"),N({error:"Unable to validate model. Check your connection."})}},disabled:!y.trim()||"validating"===w,className:"bg-orange-500 hover:bg-orange-600 disabled:bg-gray-600 disabled:cursor-not-allowed px-4 py-3 rounded-lg text-white font-medium transition flex items-center justify-center min-w-[100px]",children:"validating"===w?(0,wt.jsx)("div",{className:"animate-spin h-4 w-4 border-2 border-white rounded-full border-t-transparent"}):"Validate"})]})]}),w&&(0,wt.jsxs)("div",{className:"p-3 rounded-lg ".concat("valid"===w?"bg-green-800 border border-green-600":"invalid"===w?"bg-red-800 border border-red-600":"bg-gray-800 border border-gray-600"),children:["valid"===w&&(0,wt.jsxs)("div",{className:"flex items-center text-green-300",children:[(0,wt.jsx)("svg",{className:"h-5 w-5 mr-2",fill:"currentColor",viewBox:"0 0 20 20",children:(0,wt.jsx)("path",{fillRule:"evenodd",d:"M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z",clipRule:"evenodd"})}),(0,wt.jsx)("span",{className:"font-medium",children:"Model validated successfully!"})]}),"invalid"===w&&(0,wt.jsxs)("div",{className:"flex items-center text-red-300",children:[(0,wt.jsx)("svg",{className:"h-5 w-5 mr-2",fill:"currentColor",viewBox:"0 0 20 20",children:(0,wt.jsx)("path",{fillRule:"evenodd",d:"M10 18a8 8 0 100-16 8 8 0 000 16zM8.707 7.293a1 1 0 00-1.414 1.414L8.586 10l-1.293 1.293a1 1 0 101.414 1.414L10 11.414l1.293 1.293a1 1 0 001.414-1.414L11.414 10l1.293-1.293a1 1 0 00-1.414-1.414L10 8.586 8.707 7.293z",clipRule:"evenodd"})}),(0,wt.jsx)("span",{className:"font-medium",children:(null===j||void 0===j?void 0:j.error)||"Validation failed"})]})]}),(0,wt.jsxs)("div",{className:"bg-yellow-600 border border-yellow-500 rounded-lg p-4",children:[(0,wt.jsxs)("h4",{className:"font-bold mb-2 flex items-center text-yellow-100",children:[(0,wt.jsx)("svg",{className:"h-5 w-5 mr-2",fill:"currentColor",viewBox:"0 0 20 20",children:(0,wt.jsx)("path",{fillRule:"evenodd",d:"M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92zM11 13a1 1 0 11-2 0 1 1 0 012 0zm-1-8a1 1 0 00-1 1v3a1 1 0 002 0V6a1 1 0 00-1-1z",clipRule:"evenodd"})}),"Custom Model Warning"]}),(0,wt.jsxs)("ul",{className:"text-sm space-y-1 text-yellow-100 mb-3",children:[(0,wt.jsx)("li",{children:"\u2022 You are responsible for ensuring the model fits your hardware"}),(0,wt.jsx)("li",{children:"\u2022 Fine-tuning may fail if the model is incompatible"}),(0,wt.jsx)("li",{children:"\u2022 Memory usage and training time are not estimated"}),(0,wt.jsx)("li",{children:"\u2022 Check the model's license before use"})]}),(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"checkbox",checked:S,onChange:e=>_(e.target.checked),className:"mr-2"}),(0,wt.jsx)("span",{className:"text-sm text-yellow-100",children:"I understand and accept these risks"})]})]})]})]})]})]}),(0,wt.jsxs)("div",{className:"text-center mb-8",children:[(0,wt.jsxs)("a",{href:"/",className:"text-orange-500 hover:text-orange-400 mr-6 inline-flex items-center",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 mr-2",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M11 17l-5-5m0 0l5-5m-5 5h12"})}),"Back to Home"]}),(0,wt.jsxs)("button",{onClick:async()=>{console.log("Selected Task before update:",s),console.log("Selected Model before update:",d),console.log("Use Custom Model:",v);let e=d;if(v){if("valid"!==w||!S)return void alert("Please validate your custom model and accept the risks before proceeding.");try{if(!(await fetch("".concat(Nt.baseURL,"/finetune/set_custom_model"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({repo_name:y.trim()})})).ok)throw new Error("Failed to set custom model");e=y.trim()}catch(n){return console.error("Error setting custom model:",n),void alert("Failed to set custom model. Please try again.")}}const t={task:s,model_name:e,is_custom_model:v};console.log("Updating task settings (direct update):",t),a(t),g(!0),setTimeout((()=>{l("/finetune/load_settings")}),1e3)},className:"bg-orange-500 hover:bg-orange-600 px-6 py-3 rounded-lg font-medium transition inline-flex items-center disabled:opacity-50 disabled:cursor-not-allowed",disabled:!o||(v?"valid"!==w||!S:!d),children:["Configure Training",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 ml-2",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13 7l5 5m0 0l-5 5m5-5H6"})})]})]})]})},_t=e=>{var t,n,a,l,o,i;let{defaultValues:s,updateSettings:u}=e;const d=pe(),[f,m]=(0,r.useState)(!1),[p,h]=(0,r.useState)(null),[g,v]=(0,r.useState)({}),[b,y]=(0,r.useState)(!1),[x,w]=(0,r.useState)(null),[k,j]=(0,r.useState)([]),[N,S]=(0,r.useState)([]),[_,C]=(0,r.useState)(null),[E,P]=(0,r.useState)(!0),[L,z]=(0,r.useState)(null);(0,r.useEffect)((()=>{(async()=>{try{P(!0);const e=await(async()=>{try{const e=await fetch("".concat(Nt.baseURL,"/info"),{method:"GET",headers:Nt.headers});if(!e.ok)throw new Error("Failed to fetch system info: ".concat(e.status));return await e.json()}catch(L){throw console.error("Error fetching system info:",L),L}})();console.log("Fetched system info:",e),C(e),j(e.available_providers||["huggingface"]),S(e.available_strategies||["sft"]),P(!1)}catch(e){console.error("Error fetching system info:",e),z("Failed to load system information"),j(["huggingface"]),S(["sft"]),P(!1)}})()}),[]),(0,r.useEffect)((()=>{(async()=>{try{const e=await fetch("".concat(Nt.baseURL,"/finetune/load_settings"));if(!e.ok)throw new Error("Failed to fetch settings");const t=await e.json();console.log("Fetched default values:",t.default_values);const n=await fetch("".concat(Nt.baseURL,"/finetune/session"));if(!n.ok)throw new Error("Failed to fetch session");const r=await n.json();console.log("Fetched session data:",r);const a=c(c({},t.default_values),{},{task:r.task,model_name:r.selected_model,compute_specs:t.compute_profile||"low_end"});console.log("Merged form state:",a),s=a,v(a)}catch(e){console.error("Error fetching settings:",e)}})()}),[]),(0,r.useEffect)((()=>{if(console.log("defaultValues changed in FinetuneSettings:",s),s){const e=JSON.parse(JSON.stringify(s));e.provider||(e.provider="huggingface"),e.strategy||(e.strategy="sft"),void 0===e.eval_split&&(e.eval_split=.2),void 0===e.eval_steps&&(e.eval_steps=100),console.log("Setting form values to:",e),v(e)}}),[s]);const T=e=>{const{name:t,value:n,type:r,checked:a}=e.target,l="checkbox"===r?a:n,o=c(c({},g),{},{[t]:"number"===r?Number(l):l});console.log("Changing ".concat(t," to:"),l),console.log("New form values:",o),"task"!==t&&"model_name"!==t||console.log("\u26a0\ufe0f IMPORTANT: ".concat(t,' changed to "').concat(l,'"')),v(o)},M=e=>{const t=c(c({},g),{},{use_4bit:"4bit"===e,use_8bit:"8bit"===e,quantization:e});v(t)},R={task:"What you want your AI to be good at doing",model_name:"The base AI model you're customizing",provider:"Model provider (HuggingFace for standard, Unsloth for 2x faster training)",strategy:"Training method (SFT for basic, RLHF for preference learning, DPO for direct optimization, QLoRA for memory efficiency)",gpu:"The graphics card that will run your training",ram:"Computer memory available for training",num_train_epochs:"How many times the AI will see your training data",learning_rate:"How quickly the model adapts to new information",per_device_train_batch_size:"How many examples are processed at once",max_seq_length:"Maximum text length the model can handle",dataset_file:"Your training examples in JSON format",lora_r:"Controls model capacity and training speed",lora_alpha:"Controls how much the model changes during training",quantization:"Reduces model size to fit in memory",bnb_4bit_compute_dtype:"Technical setting for calculation precision",optim:"Method used to update the model during training",lr_scheduler_type:"How learning speed changes during training",eval_split:"Percentage of data to use for validation (0-1)",eval_steps:"How often to evaluate the model during training"},O={huggingface:"Standard HuggingFace Hub models",unsloth:"Optimized for 2x faster training with lower memory"},A={sft:"Supervised Fine-Tuning - Standard approach with LoRA",rlhf:"Reinforcement Learning from Human Feedback - Preference-based training",dpo:"Direct Preference Optimization - Simpler alternative to RLHF",qlora:"Quantized LoRA - Memory-efficient training with 4-bit quantization"},F=e=>{let{id:t,children:n}=e;return(0,wt.jsxs)("div",{className:"flex justify-between items-center",children:[(0,wt.jsx)("div",{className:"flex-grow",children:n}),(0,wt.jsxs)("div",{className:"relative",children:[(0,wt.jsx)("span",{className:"cursor-help text-orange-500 font-bold text-sm",onMouseEnter:()=>w(t),onMouseLeave:()=>w(null),children:"?"}),x===t&&(0,wt.jsx)("div",{className:"absolute z-10 w-64 p-2 text-sm text-white bg-gray-900 rounded-md shadow-lg border border-orange-500 right-0 top-6",children:R[t]})]})]})};return E?(0,wt.jsx)("div",{className:"container mx-auto px-4 py-8 max-w-4xl",children:(0,wt.jsxs)("div",{className:"text-center",children:[(0,wt.jsx)("div",{className:"animate-spin h-12 w-12 border-4 border-orange-500 rounded-full border-t-transparent mx-auto"}),(0,wt.jsx)("p",{className:"text-gray-400 mt-4",children:"Loading system information..."})]})}):(0,wt.jsxs)("div",{className:"container mx-auto px-4 py-8 max-w-4xl",children:[(0,wt.jsxs)("div",{className:"mb-8",children:[(0,wt.jsx)("h1",{className:"text-3xl font-bold text-white",children:"Finetuning Settings"}),(0,wt.jsx)("p",{className:"text-gray-400 mt-2",children:"Configure your model training parameters"}),_&&(0,wt.jsxs)("div",{className:"mt-4 p-3 bg-gray-800 rounded-lg text-sm text-gray-300",children:[(0,wt.jsx)("strong",{children:"Available:"})," ",k.length," provider(s), ",N.length," strategy(ies)"]})]}),L&&(0,wt.jsxs)("div",{className:"bg-red-700 text-white p-4 rounded-lg mb-6",children:[(0,wt.jsx)("strong",{children:"Error:"})," ",L]}),b&&(0,wt.jsxs)("div",{className:"bg-green-700 text-white p-4 rounded-lg mb-6 flex items-center justify-between",children:[(0,wt.jsx)("div",{children:"Settings updated successfully! Redirecting..."}),(0,wt.jsx)("div",{className:"animate-spin h-5 w-5 border-2 border-white rounded-full border-t-transparent"})]}),(0,wt.jsxs)("form",{onSubmit:async e=>{e.preventDefault();try{if(z(null),!g.task||!g.model_name)return void z("Missing required fields. Please go back and complete previous steps.");if(!p)throw new Error("Please select a dataset file");{console.log("Uploading dataset...");const e=await(async(e,t)=>{try{const n=new FormData;n.append("json_file",e,e.name),n.append("settings",JSON.stringify(t));const r=await fetch("".concat(Nt.baseURL,"/finetune/load_settings"),{method:"POST",body:n});if(!r.ok){const e=await r.json().catch((()=>({})));throw new Error(e.detail||"Upload failed: ".concat(r.status))}return await r.json()}catch(L){throw console.error("Error uploading dataset:",L),L}})(p,g);console.log("Dataset uploaded:",e),g.dataset=e.file_path}const e={task:g.task,model_name:g.model_name,dataset:g.dataset,compute_specs:g.compute_specs||"low_end",provider:g.provider||"huggingface",strategy:g.strategy||"sft",lora_r:g.lora_r||16,lora_alpha:g.lora_alpha||32,lora_dropout:g.lora_dropout||.1,use_4bit:void 0===g.use_4bit||g.use_4bit,use_8bit:g.use_8bit||!1,bnb_4bit_compute_dtype:g.bnb_4bit_compute_dtype||"float16",bnb_4bit_quant_type:g.bnb_4bit_quant_type||"nf4",use_nested_quant:g.use_nested_quant||!1,fp16:g.fp16||!1,bf16:g.bf16||!1,num_train_epochs:g.num_train_epochs||1,per_device_train_batch_size:g.per_device_train_batch_size||1,per_device_eval_batch_size:g.per_device_eval_batch_size||1,gradient_accumulation_steps:g.gradient_accumulation_steps||4,gradient_checkpointing:void 0===g.gradient_checkpointing||g.gradient_checkpointing,max_grad_norm:g.max_grad_norm||.3,learning_rate:g.learning_rate||2e-4,weight_decay:g.weight_decay||.001,optim:g.optim||"paged_adamw_32bit",lr_scheduler_type:g.lr_scheduler_type||"cosine",max_steps:g.max_steps||-1,warmup_ratio:g.warmup_ratio||.03,group_by_length:void 0===g.group_by_length||g.group_by_length,packing:g.packing||!1,max_seq_length:g.max_seq_length||null,eval_split:void 0!==g.eval_split?g.eval_split:.2,eval_steps:g.eval_steps||100};console.log("Starting training with config:",e);const t=await(async e=>{try{const t=await fetch("".concat(Nt.baseURL,"/finetune/start_training"),{method:"POST",headers:Nt.headers,body:JSON.stringify(e)});if(!t.ok){const e=await t.json().catch((()=>({})));throw new Error(e.detail||"Training start failed: ".concat(t.status))}return await t.json()}catch(L){throw console.error("Error starting training:",L),L}})(e);console.log("Training started:",t),y(!0),setTimeout((()=>{d("/finetune/loading")}),1e3)}catch(L){console.error("Error submitting form:",L),z(L.message||"Failed to start training"),alert("Failed to start training: ".concat(L.message))}},className:"space-y-8",children:[(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h2",{className:"text-xl font-semibold text-white mb-4",children:"Configuration Summary"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"task",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"Task"})}),(0,wt.jsx)("div",{className:"bg-gray-900 border border-gray-700 rounded-lg p-3 text-white",children:g.task||s.task||"Not set"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"model_name",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"Model Name"})}),(0,wt.jsx)("div",{className:"bg-gray-900 border border-gray-700 rounded-lg p-3 text-white",children:g.model_name||s.model_name||"Not set"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"gpu",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"GPU"})}),(0,wt.jsx)("div",{className:"bg-gray-900 border border-gray-700 rounded-lg p-3 text-white",children:(null===(t=g.hardware_config)||void 0===t?void 0:t.gpu)||(null===(n=s.hardware_config)||void 0===n?void 0:n.gpu)||"N/A"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"ram",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-1",children:"RAM"})}),(0,wt.jsx)("div",{className:"bg-gray-900 border border-gray-700 rounded-lg p-3 text-white",children:null!==(a=g.hardware_config)&&void 0!==a&&a.ram||null!==(l=s.hardware_config)&&void 0!==l&&l.ram?"".concat((null===(o=g.hardware_config)||void 0===o?void 0:o.ram)||(null===(i=s.hardware_config)||void 0===i?void 0:i.ram)," GB"):"N/A"})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h2",{className:"text-xl font-semibold text-white mb-4",children:"Provider & Strategy"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"provider",children:(0,wt.jsx)("label",{htmlFor:"provider",className:"block text-sm font-medium text-gray-400 mb-1",children:"Model Provider"})}),(0,wt.jsx)("select",{id:"provider",name:"provider",value:g.provider||"huggingface",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:k.map((e=>(0,wt.jsx)("option",{value:e,children:e.charAt(0).toUpperCase()+e.slice(1)},e)))}),g.provider&&O[g.provider]&&(0,wt.jsx)("p",{className:"mt-2 text-xs text-gray-400",children:O[g.provider]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"strategy",children:(0,wt.jsx)("label",{htmlFor:"strategy",className:"block text-sm font-medium text-gray-400 mb-1",children:"Training Strategy"})}),(0,wt.jsx)("select",{id:"strategy",name:"strategy",value:g.strategy||"sft",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:N.map((e=>(0,wt.jsx)("option",{value:e,children:e.toUpperCase()},e)))}),g.strategy&&A[g.strategy]&&(0,wt.jsx)("p",{className:"mt-2 text-xs text-gray-400",children:A[g.strategy]})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h2",{className:"text-xl font-semibold text-white mb-4",children:"Basic Settings"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"num_train_epochs",children:(0,wt.jsx)("label",{htmlFor:"num_train_epochs",className:"block text-sm font-medium text-gray-400 mb-1",children:"Training Epochs"})}),(0,wt.jsx)("input",{type:"number",id:"num_train_epochs",name:"num_train_epochs",min:"1",max:"100",value:g.num_train_epochs||3,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"learning_rate",children:(0,wt.jsx)("label",{htmlFor:"learning_rate",className:"block text-sm font-medium text-gray-400 mb-1",children:"Learning Rate"})}),(0,wt.jsx)("input",{type:"number",id:"learning_rate",name:"learning_rate",step:"0.000001",value:g.learning_rate||2e-4,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"per_device_train_batch_size",children:(0,wt.jsx)("label",{htmlFor:"per_device_train_batch_size",className:"block text-sm font-medium text-gray-400 mb-1",children:"Batch Size (Train)"})}),(0,wt.jsx)("input",{type:"number",id:"per_device_train_batch_size",name:"per_device_train_batch_size",min:"1",value:g.per_device_train_batch_size||2,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"max_seq_length",children:(0,wt.jsx)("label",{htmlFor:"max_seq_length",className:"block text-sm font-medium text-gray-400 mb-1",children:"Max Sequence Length"})}),(0,wt.jsx)("input",{type:"number",id:"max_seq_length",name:"max_seq_length",value:g.max_seq_length||512,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]}),(0,wt.jsxs)("div",{className:"col-span-full",children:[(0,wt.jsx)(F,{id:"dataset_file",children:(0,wt.jsx)("label",{htmlFor:"dataset_file",className:"block text-sm font-medium text-gray-400 mb-1",children:"Dataset File"})}),(0,wt.jsx)("div",{className:"flex items-center",children:(0,wt.jsxs)("label",{className:"w-full flex items-center justify-center px-4 py-2 border border-gray-700 rounded-lg cursor-pointer bg-gray-900 hover:bg-gray-800 transition",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 mr-2 text-gray-400",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M7 16a4 4 0 01-.88-7.903A5 5 0 1115.9 6L16 6a5 5 0 011 9.9M15 13l-3-3m0 0l-3 3m3-3v12"})}),(0,wt.jsx)("span",{className:"text-white",children:"Upload Dataset"}),(0,wt.jsx)("input",{type:"file",id:"dataset_file",name:"dataset_file",accept:".json,.jsonl",className:"hidden",onChange:e=>{const t=e.target.files[0];h(t)}})]})}),(0,wt.jsx)("p",{className:"mt-2 text-sm text-gray-400",children:p?p.name:"No file selected"})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h2",{className:"text-xl font-semibold text-white mb-4",children:"Evaluation Settings"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"eval_split",children:(0,wt.jsx)("label",{htmlFor:"eval_split",className:"block text-sm font-medium text-gray-400 mb-1",children:"Validation Split"})}),(0,wt.jsx)("input",{type:"number",id:"eval_split",name:"eval_split",min:"0",max:"1",step:"0.05",value:void 0!==g.eval_split?g.eval_split:.2,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"}),(0,wt.jsxs)("p",{className:"mt-2 text-xs text-gray-400",children:[Math.round(100*(g.eval_split||.2)),"% of data for validation"]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"eval_steps",children:(0,wt.jsx)("label",{htmlFor:"eval_steps",className:"block text-sm font-medium text-gray-400 mb-1",children:"Evaluation Steps"})}),(0,wt.jsx)("input",{type:"number",id:"eval_steps",name:"eval_steps",min:"10",step:"10",value:g.eval_steps||100,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"}),(0,wt.jsxs)("p",{className:"mt-2 text-xs text-gray-400",children:["Evaluate every ",g.eval_steps||100," training steps"]})]})]})]}),(0,wt.jsx)("div",{className:"flex justify-center mb-6",children:(0,wt.jsxs)("button",{type:"button",onClick:()=>m(!f),className:"flex items-center text-orange-500 hover:text-orange-400 transition",children:[(0,wt.jsx)("span",{className:"mr-2",children:"Advanced Settings"}),(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 transform transition-transform ".concat(f?"rotate-180":""),fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M19 9l-7 7-7-7"})})]})}),f&&(0,wt.jsxs)("div",{className:"space-y-6",children:[(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h3",{className:"text-lg font-medium text-white mb-4",children:"LoRA Configuration"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"lora_r",children:(0,wt.jsx)("label",{htmlFor:"lora_r",className:"block text-sm font-medium text-gray-400 mb-1",children:"LoRA Rank (r)"})}),(0,wt.jsxs)("select",{id:"lora_r",name:"lora_r",value:g.lora_r||16,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"4",children:"4"}),(0,wt.jsx)("option",{value:"8",children:"8"}),(0,wt.jsx)("option",{value:"16",children:"16"}),(0,wt.jsx)("option",{value:"32",children:"32"}),(0,wt.jsx)("option",{value:"64",children:"64"})]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"lora_alpha",children:(0,wt.jsx)("label",{htmlFor:"lora_alpha",className:"block text-sm font-medium text-gray-400 mb-1",children:"LoRA Alpha"})}),(0,wt.jsx)("input",{type:"number",id:"lora_alpha",name:"lora_alpha",min:"1",value:g.lora_alpha||32,onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none"})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h3",{className:"text-lg font-medium text-white mb-4",children:"Quantization Settings"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"quantization",children:(0,wt.jsx)("label",{className:"block text-sm font-medium text-gray-400 mb-2",children:"Precision"})}),(0,wt.jsxs)("div",{className:"space-y-3",children:[(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"quantization",value:"4bit",checked:"4bit"===g.quantization,onChange:()=>M("4bit"),className:"rounded-full bg-gray-900 border-gray-700 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"ml-2 text-sm text-gray-400",children:"4-bit Quantization"})]}),(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"quantization",value:"8bit",checked:"8bit"===g.quantization,onChange:()=>M("8bit"),className:"rounded-full bg-gray-900 border-gray-700 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"ml-2 text-sm text-gray-400",children:"8-bit Quantization"})]}),(0,wt.jsxs)("label",{className:"flex items-center",children:[(0,wt.jsx)("input",{type:"radio",name:"quantization",value:"none",checked:"none"===g.quantization,onChange:()=>M("none"),className:"rounded-full bg-gray-900 border-gray-700 text-orange-500 focus:ring-orange-500"}),(0,wt.jsx)("span",{className:"ml-2 text-sm text-gray-400",children:"No Quantization"})]})]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"bnb_4bit_compute_dtype",children:(0,wt.jsx)("label",{htmlFor:"bnb_4bit_compute_dtype",className:"block text-sm font-medium text-gray-400 mb-1",children:"Compute Dtype"})}),(0,wt.jsxs)("select",{id:"bnb_4bit_compute_dtype",name:"bnb_4bit_compute_dtype",value:g.bnb_4bit_compute_dtype||"float16",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"float32",children:"float32"}),(0,wt.jsx)("option",{value:"bfloat16",children:"bfloat16"}),(0,wt.jsx)("option",{value:"float16",children:"float16"})]})]})]})]}),(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-lg p-6",children:[(0,wt.jsx)("h3",{className:"text-lg font-medium text-white mb-4",children:"Optimization Settings"}),(0,wt.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"optim",children:(0,wt.jsx)("label",{htmlFor:"optim",className:"block text-sm font-medium text-gray-400 mb-1",children:"Optimizer"})}),(0,wt.jsxs)("select",{id:"optim",name:"optim",value:g.optim||"paged_adamw_32bit",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"paged_adamw_32bit",children:"Paged AdamW 32bit"}),(0,wt.jsx)("option",{value:"adamw_torch",children:"AdamW Torch"}),(0,wt.jsx)("option",{value:"adamw_bnb_8bit",children:"AdamW 8-bit"})]})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)(F,{id:"lr_scheduler_type",children:(0,wt.jsx)("label",{htmlFor:"lr_scheduler_type",className:"block text-sm font-medium text-gray-400 mb-1",children:"Learning Rate Scheduler"})}),(0,wt.jsxs)("select",{id:"lr_scheduler_type",name:"lr_scheduler_type",value:g.lr_scheduler_type||"cosine",onChange:T,className:"bg-gray-900 border border-gray-700 rounded-lg p-3 w-full text-white focus:border-orange-500 focus:outline-none",children:[(0,wt.jsx)("option",{value:"cosine",children:"Cosine"}),(0,wt.jsx)("option",{value:"linear",children:"Linear"}),(0,wt.jsx)("option",{value:"constant",children:"Constant"})]})]})]})]})]}),(0,wt.jsx)("div",{className:"text-center",children:(0,wt.jsxs)("button",{type:"submit",className:"bg-orange-500 hover:bg-orange-600 px-6 py-3 rounded-lg font-medium transition inline-flex items-center",children:["Start Finetuning",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-5 w-5 ml-2",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13 10V3L4 14h7v7l9-11h-7z"})})]})})]})]})};if("undefined"!==typeof document){const e=document.createElement("style");e.textContent="\n/* Success container */\n.celebration-container {\n  position: relative;\n  height: 200px;\n  display: flex;\n  justify-content: center;\n  align-items: center;\n  overflow: hidden;\n}\n\n/* AI Network Animation */\n.ai-network-animation {\n  position: relative;\n  width: 230px;\n  height: 230px;\n  margin: 0 auto;\n  perspective: 1000px;\n  transform-style: preserve-3d;\n}\n\n/* Core and layers */\n.network-core {\n  position: absolute;\n  width: 24px;\n  height: 24px;\n  background-color: #ff8033;\n  border-radius: 50%;\n  top: 50%;\n  left: 50%;\n  transform: translate(-50%, -50%);\n  box-shadow: 0 0 15px rgba(255, 128, 51, 0.7);\n  animation: pulse-core 2s infinite ease-in-out;\n  z-index: 30;\n}\n\n.network-layer {\n  position: absolute;\n  border: 2px solid rgba(255, 128, 51, 0.5);\n  border-radius: 50%;\n  top: 50%;\n  left: 50%;\n  transform-style: preserve-3d;\n  animation: rotate-layer 20s infinite linear;\n}\n\n.layer-1 {\n  width: 80px;\n  height: 80px;\n  transform: translate(-50%, -50%) rotateX(60deg) rotateY(0deg);\n  animation-direction: normal;\n}\n\n.layer-2 {\n  width: 140px;\n  height: 140px;\n  transform: translate(-50%, -50%) rotateX(30deg) rotateY(30deg);\n  animation-direction: reverse;\n  animation-duration: 25s;\n}\n\n.layer-3 {\n  width: 200px;\n  height: 200px;\n  transform: translate(-50%, -50%) rotateX(70deg) rotateY(10deg);\n  animation-duration: 30s;\n}\n\n/* Connection lines */\n.connection {\n  position: absolute;\n  top: 50%;\n  left: 50%;\n  height: 2px;\n  background: linear-gradient(90deg, rgba(255, 128, 51, 0.8), rgba(255, 128, 51, 0));\n  transform-origin: left center;\n  z-index: 10;\n}\n\n.connection-1 {\n  width: 100px;\n  transform: translate(0, -1px) rotate(30deg);\n}\n\n.connection-2 {\n  width: 80px;\n  transform: translate(0, -1px) rotate(150deg);\n}\n\n.connection-3 {\n  width: 120px;\n  transform: translate(0, -1px) rotate(210deg);\n}\n\n.connection-4 {\n  width: 90px;\n  transform: translate(0, -1px) rotate(270deg);\n}\n\n.connection-5 {\n  width: 110px;\n  transform: translate(0, -1px) rotate(330deg);\n}\n\n.connection-6 {\n  width: 80px;\n  transform: translate(0, -1px) rotate(90deg);\n}\n\n/* Data nodes */\n.data-node {\n  position: absolute;\n  width: 10px;\n  height: 10px;\n  background-color: #ff8033;\n  border-radius: 50%;\n  box-shadow: 0 0 8px rgba(255, 128, 51, 0.6);\n  animation: pulse-node 2s infinite alternate;\n}\n\n.node-1 {\n  top: calc(50% - 55px);\n  left: calc(50% + 65px);\n  animation-delay: 0s;\n}\n\n.node-2 {\n  top: calc(50% + 45px);\n  left: calc(50% + 85px);\n  animation-delay: 0.4s;\n}\n\n.node-3 {\n  top: calc(50% + 80px);\n  left: calc(50% - 30px);\n  animation-delay: 0.8s;\n}\n\n.node-4 {\n  top: calc(50% + 25px);\n  left: calc(50% - 90px);\n  animation-delay: 1.2s;\n}\n\n.node-5 {\n  top: calc(50% - 70px);\n  left: calc(50% - 60px);\n  animation-delay: 1.6s;\n}\n\n.node-6 {\n  top: calc(50% - 20px);\n  left: calc(50% + 95px);\n  animation-delay: 2s;\n}\n\n/* Animations */\n@keyframes pulse-core {\n  0% { transform: translate(-50%, -50%) scale(1); opacity: 1; }\n  50% { transform: translate(-50%, -50%) scale(1.2); opacity: 0.8; }\n  100% { transform: translate(-50%, -50%) scale(1); opacity: 1; }\n}\n\n@keyframes rotate-layer {\n  from { transform: translate(-50%, -50%) rotateX(60deg) rotateY(0deg) rotateZ(0deg); }\n  to { transform: translate(-50%, -50%) rotateX(60deg) rotateY(0deg) rotateZ(360deg); }\n}\n\n@keyframes pulse-node {\n  0% { transform: scale(1); opacity: 0.7; }\n  100% { transform: scale(1.3); opacity: 1; }\n}\n\n.glow-text {\n  text-shadow: 0 0 10px rgba(249, 115, 22, 0.7);\n  animation: glow 2s ease-in-out infinite alternate;\n}\n\n.bouncing-text {\n  animation: bounce 0.7s ease infinite alternate;\n}\n\n/* Progress bar surging animation */\n.progress-bar {\n  background: linear-gradient(90deg, #f97316, #ffaa70);\n  animation: gradient-shift 3s ease infinite;\n  background-size: 200% 200%;\n}\n\n@keyframes glow {\n  0% { filter: brightness(1); }\n  100% { filter: brightness(1.3); }\n}\n\n@keyframes bounce {\n  from { transform: translateY(0); }\n  to { transform: translateY(-5px); }\n}\n\n@keyframes gradient-shift {\n  0% { background-position: 0% 50%; }\n  50% { background-position: 100% 50%; }\n  100% { background-position: 0% 50%; }\n}\n",document.head.appendChild(e)}const Ct=()=>{const[e,t]=(0,r.useState)(0),[n,a]=(0,r.useState)(0),[l,o]=(0,r.useState)(!1),[i,s]=(0,r.useState)("running"),[c,u]=(0,r.useState)(""),[d,f]=(0,r.useState)(null),m=(0,r.useRef)(null),p=pe(),h=["Initializing model...","Loading dataset...","Configuring training parameters...","Preparing LoRA adapters...","Starting training loop...","Training in progress..."];(0,r.useEffect)((()=>{const e=async()=>{try{const e=await fetch("".concat(Nt.baseURL,"/finetune/status"),{method:"GET"}),n=await e.json();if(console.log("Status API response:",n),s(n.status||"running"),u(n.message||""),"completed"===n.status)return console.log("Training completed successfully!"),o(!0),t(100),a(h.length-1),void(m.current&&clearInterval(m.current));if("error"===n.status)return console.error("Training failed:",n.message),t(0),void(m.current&&clearInterval(m.current));"running"===n.status&&void 0!==n.progress&&(console.log("Backend progress:",n.progress),f(Number(n.progress)))}catch(e){console.error("Error checking status:",e)}};return e(),m.current=setInterval(e,5e3),()=>{m.current&&clearInterval(m.current)}}),[h.length]),(0,r.useEffect)((()=>{const e=e=>{if(!l)return e.preventDefault(),e.returnValue="",""};return window.addEventListener("beforeunload",e),()=>window.removeEventListener("beforeunload",e)}),[l]);return(0,r.useEffect)((()=>{if(l)return;const e=setInterval((()=>{const e=.5*Math.random()+.2,r=[32,67,88],l=[2e3,3e3,3500];t((o=>{if(null!==d&&!isNaN(d)){const e=Math.max(0,Math.min(100,Number(d)));if(Math.abs(e-o)<.5)return o+.1;if(e<o)return o;const t=Math.floor(e/(100/h.length));return t!==n&&t<h.length&&a(t),e}if(o>=95)return 95;if((e=>r.some(((t,n)=>Math.abs(e-t)<.5&&e<t+.5)))(o)){const e=(e=>{for(let t=0;t<r.length;t++)if(Math.abs(e-r[t])<.5)return l[t];return 0})(o);return setTimeout((()=>{t((e=>e+.1))}),e),o}const i=(t=>{const n=.15*Math.sin(Date.now()/1e3)+.1*Math.cos(Date.now()/800),a=r.find((e=>t<e));if(a&&a-t<5)return.5*e;const l=r.filter((e=>t>e)).pop();return l&&t-l<3?1.5*e:e+n})(o),s=o+i,c=Math.floor(s/(100/h.length));return c!==n&&c<h.length&&a(c),s}))}),100);return()=>{clearInterval(e)}}),[n,h.length,l,d]),(0,wt.jsx)("div",{className:"loading-container relative",children:(0,wt.jsx)("div",{className:"loading-card",children:"error"===i?(0,wt.jsxs)("div",{className:"error-container text-center",children:[(0,wt.jsx)("div",{className:"mb-6",children:(0,wt.jsx)("svg",{className:"mx-auto h-24 w-24 text-red-500",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-3L13.732 4c-.77-1.333-2.694-1.333-3.464 0L3.34 16c-.77 1.333.192 3 1.732 3z"})})}),(0,wt.jsx)("h2",{className:"text-2xl text-red-500 font-bold mb-4",children:"Training Failed"}),(0,wt.jsx)("p",{className:"text-gray-300 mb-2",children:c||"An error occurred during training."}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm mb-6",children:"Please check your configuration and try again."}),(0,wt.jsx)("button",{onClick:()=>p("/finetune/settings"),className:"bg-orange-500 hover:bg-orange-600 px-6 py-3 rounded-lg text-white font-semibold transition",children:"\u2190 Back to Settings"})]}):l?(0,wt.jsxs)("div",{className:"success-container",children:[(0,wt.jsx)("div",{className:"celebration-container mb-6",children:(0,wt.jsxs)("div",{className:"ai-network-animation",children:[(0,wt.jsx)("div",{className:"network-core"}),(0,wt.jsx)("div",{className:"network-layer layer-1"}),(0,wt.jsx)("div",{className:"network-layer layer-2"}),(0,wt.jsx)("div",{className:"network-layer layer-3"}),(0,wt.jsx)("div",{className:"connection connection-1"}),(0,wt.jsx)("div",{className:"connection connection-2"}),(0,wt.jsx)("div",{className:"connection connection-3"}),(0,wt.jsx)("div",{className:"connection connection-4"}),(0,wt.jsx)("div",{className:"connection connection-5"}),(0,wt.jsx)("div",{className:"connection connection-6"}),(0,wt.jsx)("div",{className:"data-node node-1"}),(0,wt.jsx)("div",{className:"data-node node-2"}),(0,wt.jsx)("div",{className:"data-node node-3"}),(0,wt.jsx)("div",{className:"data-node node-4"}),(0,wt.jsx)("div",{className:"data-node node-5"}),(0,wt.jsx)("div",{className:"data-node node-6"})]})}),(0,wt.jsxs)("div",{className:"text-center mb-8",children:[(0,wt.jsx)("h2",{className:"text-3xl text-orange-500 font-bold mb-4 glow-text",children:"BOOM! Your AI is alive! \ud83c\udf89"}),(0,wt.jsx)("p",{className:"text-gray-300 text-lg bouncing-text",children:"You just leveled up in the AI world! Your custom model is ready to blow minds!"}),c&&(0,wt.jsx)("p",{className:"text-gray-400 text-sm mt-2 italic",children:c}),(0,wt.jsx)("div",{className:"mt-4 inline-block px-4 py-2 bg-green-500/20 border border-green-500 rounded-lg",children:(0,wt.jsx)("p",{className:"text-green-400 text-sm font-semibold",children:"\u2713 Training Completed Successfully"})})]}),(0,wt.jsxs)("div",{className:"flex justify-center",children:[(0,wt.jsxs)("button",{onClick:async()=>{try{const e=await fetch("".concat(Nt.baseURL,"/playground/model_path"),{method:"GET"});if(!e.ok)throw new Error("Failed to get model path");const t=(await e.json()).model_path;console.log("Received model path:",t);await fetch("".concat(Nt.baseURL,"/playground/new"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({model_path:t})});p("/")}catch(e){console.error("Error starting AI chat:",e),alert("There was an error starting the AI chat. Please try again.")}},className:"bg-orange-500 hover:bg-orange-600 px-8 py-4 rounded-lg text-white text-lg font-bold transition flex items-center pulse-button",children:[(0,wt.jsx)("span",{className:"mr-2",children:"\ud83d\ude80"}),"Let's Chat With Your AI!",(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 ml-2 animate-bounce",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M8 12h.01M12 12h.01M16 12h.01M21 12c0 4.418-4.03 8-9 8a9.863 9.863 0 01-4.255-.949L3 20l1.395-3.72C3.512 15.042 3 13.574 3 12c0-4.418 4.03-8 9-8s9 3.582 9 8z"})})]}),(0,wt.jsx)("style",{jsx:!0,children:"\n                .pulse-button {\n                  animation: pulse 1.5s infinite;\n                  box-shadow: 0 0 0 0 rgba(249, 115, 22, 0.7);\n                }\n                \n                @keyframes pulse {\n                  0% {\n                    transform: scale(0.95);\n                    box-shadow: 0 0 0 0 rgba(249, 115, 22, 0.7);\n                  }\n                  \n                  70% {\n                    transform: scale(1);\n                    box-shadow: 0 0 0 10px rgba(249, 115, 22, 0);\n                  }\n                  \n                  100% {\n                    transform: scale(0.95);\n                    box-shadow: 0 0 0 0 rgba(249, 115, 22, 0);\n                  }\n                }\n              "})]})]}):(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsx)("h1",{className:"loading-title",children:"Finetuning Your Model"}),(0,wt.jsx)("div",{className:"circular-loader-container",children:(0,wt.jsxs)("div",{className:"orbital-loader",children:[(0,wt.jsx)("div",{className:"center-core"}),(0,wt.jsx)("div",{className:"orbital-ring ring-1"}),(0,wt.jsx)("div",{className:"orbital-ring ring-2"}),(0,wt.jsx)("div",{className:"orbital-ring ring-3"}),(0,wt.jsx)("div",{className:"particle particle-1"}),(0,wt.jsx)("div",{className:"particle particle-2"}),(0,wt.jsx)("div",{className:"particle particle-3"}),(0,wt.jsx)("div",{className:"particle particle-4"}),(0,wt.jsx)("div",{className:"particle particle-5"}),(0,wt.jsx)("div",{className:"orbital-trail trail-1"}),(0,wt.jsx)("div",{className:"orbital-trail trail-2"}),(0,wt.jsx)("div",{className:"orbital-trail trail-3"})]})}),(0,wt.jsx)("div",{className:"step-indicator",children:(0,wt.jsx)("p",{className:"current-step",children:h[n]})}),(0,wt.jsxs)("div",{className:"progress-container",children:[(0,wt.jsx)("div",{className:"progress-bar",style:{width:"".concat(e,"%")}}),(0,wt.jsxs)("div",{className:"progress-text",children:[Math.floor(e),"%"]})]})]})})})},Et=()=>{const[e,t]=(0,r.useState)("architecture"),n={architecture:[{title:"PEFT Implementation",description:"Parameter-Efficient Fine-Tuning with LoRA adapters using 4-bit base models",details:["Low-Rank Adaptation (LoRA) with configurable rank and alpha parameters","Support for various adapter configurations (LoRA, AdaLoRA, IA\xb3)","Matrix factorization to enable efficient parameter updates","Trainable weight ratio typically <1% of full model parameters"]},{title:"Quantization Framework",description:"Automatic quantization for base models using GPTQ and bitsandbytes",details:["4-bit quantization with NF4/FP4 data types","8-bit quantization with scaled computation","Support for double quantization for further memory optimization","Nested quantization options for maximum compression"]},{title:"Model Architecture Support",description:"Compatible with major transformer architectures",details:["Decoder-only: Llama, Mistral, Phi, GPT-2, Falcon","Encoder-only: BERT, RoBERTa, DeBERTa","Encoder-decoder: T5, BART, Flan-T5"]}],performance:[{title:"Hardware Profiling",description:"Automatic hardware detection and optimization",details:["CUDA hardware capability detection","Memory usage optimizations based on available VRAM","Dynamic batch size adjustment","Progressive loading for low-memory environments"]},{title:"Training Efficiency",description:"Optimizations for faster training with minimal resources",details:["Gradient checkpointing for reduced memory usage","FlashAttention 2.0 integration for faster attention computation","Mixed precision training (BF16/FP16)","Gradient accumulation to simulate larger batch sizes"]},{title:"Resource Requirements",description:"Minimum and recommended system specifications",details:["Minimum: CUDA-capable GPU with 6GB VRAM, 16GB system RAM","Recommended: NVIDIA GPU with 12GB+ VRAM, 32GB system RAM","Optimal: NVIDIA RTX 3090/4090 or A100 with 24GB+ VRAM","Storage: 20GB+ free space for base models and adapters"]}],data:[{title:"Dataset Processing",description:"Advanced data preparation pipeline",details:["JSON/JSONL format support with configurable prompting templates","Automatic train/validation splitting","Tokenization with special token handling","On-the-fly data augmentation options"]},{title:"Training Formats",description:"Multiple training paradigms for different use cases",details:["Instruction fine-tuning with optional system prompts","Conversation fine-tuning with multi-turn support","Supervised fine-tuning for specific tasks","Custom formatting with template engine"]},{title:"Data Requirements",description:"Guidance on dataset preparation",details:["Recommended minimum: 100+ high-quality examples","Optimal range: 1,000-10,000 examples","Format validation with automatic error detection","Handling of long-context training data"]}],hyperparameters:[{title:"Learning Parameters",description:"Configurable optimization settings",details:["Learning rate: 1e-5 to 2e-4 (adaptive range based on task)","Schedulers: Cosine, linear, constant, warmup","Weight decay: 0.01-0.001 for regularization","Gradient clipping at 1.0 to prevent explosions"]},{title:"LoRA Configuration",description:"Fine-grained control over adapter training",details:["Rank (r): 8, 16, 32, 64 options (complexity vs. performance)","Alpha (\u03b1): Typically 2x rank for stable training","Target modules: Configurable matrix selection","Dropout: 0.05-0.1 for regularization"]},{title:"Advanced Options",description:"Expert-level configuration parameters",details:["Sequence packing for maximum throughput","Group by length for optimized batching","Custom optimizer configurations (AdamW, 8-bit Adam)","Framework integration options (DeepSpeed, FSDP)"]}]};return(0,wt.jsxs)("div",{className:"bg-gradient-to-b from-black via-gray-900 to-black min-h-screen text-white",children:[(0,wt.jsx)("div",{className:"sticky top-0 bg-gray-900 z-20 border-b border-gray-800",children:(0,wt.jsx)("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:(0,wt.jsx)("div",{className:"flex space-x-1 overflow-x-auto hide-scrollbar py-4",role:"tablist","aria-orientation":"horizontal",children:["architecture","performance","data","hyperparameters"].map((n=>(0,wt.jsx)("button",{onClick:()=>t(n),className:"px-4 py-2 rounded-lg font-medium transition-colors whitespace-nowrap ".concat(e===n?"bg-orange-500 text-white":"text-gray-300 hover:bg-gray-800"),role:"tab","aria-selected":e===n,children:n.charAt(0).toUpperCase()+n.slice(1)},n)))})})}),(0,wt.jsx)("main",{className:"py-12",children:(0,wt.jsxs)("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:["architecture"===e&&(0,wt.jsxs)("div",{className:"space-y-10",children:[(0,wt.jsxs)("div",{className:"max-w-3xl mx-auto mb-12",children:[(0,wt.jsx)("h2",{className:"text-3xl font-bold mb-6 text-center",children:"System Architecture"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 text-center",children:"ModelForge employs state-of-the-art Parameter-Efficient Fine-Tuning (PEFT) techniques to enable efficient training on consumer hardware with minimal quality compromise."})]}),n.architecture.map(((e,t)=>(0,wt.jsx)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 transition",children:(0,wt.jsxs)("div",{className:"p-8",children:[(0,wt.jsxs)("div",{className:"mb-6",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-300 mt-2",children:e.description})]}),(0,wt.jsx)("ul",{className:"space-y-2",children:e.details.map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("span",{className:"text-orange-500 mr-2",children:"\u2022"}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))})]})},t))),(0,wt.jsx)("div",{className:"bg-orange-500/10 border border-orange-500/30 rounded-xl p-6 mt-10",children:(0,wt.jsxs)("div",{className:"flex items-start",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 text-orange-500 mr-3 flex-shrink-0 mt-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M13 16h-1v-4h-1m1-4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"})}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("h4",{className:"text-lg font-semibold text-orange-500",children:"Technical Note"}),(0,wt.jsx)("p",{className:"text-gray-300 mt-1",children:"The architecture uses a modular adapter approach that modifies only a small subset of parameters during training, keeping the base model frozen. This approach dramatically reductes memory requirements and training time."})]})]})})]}),"performance"===e&&(0,wt.jsxs)("div",{className:"space-y-10",children:[(0,wt.jsxs)("div",{className:"max-w-3xl mx-auto mb-12",children:[(0,wt.jsx)("h2",{className:"text-3xl font-bold mb-6 text-center",children:"Performance Optimization"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 text-center",children:"ModelForge automatically optimizes training parameters based on available hardware, enabling high-performance fine-tuning even on consumer-grade GPUs."})]}),n.performance.map(((e,t)=>(0,wt.jsx)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 transition",children:(0,wt.jsxs)("div",{className:"p-8",children:[(0,wt.jsxs)("div",{className:"mb-6",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-300 mt-2",children:e.description})]}),(0,wt.jsx)("ul",{className:"space-y-2",children:e.details.map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("span",{className:"text-orange-500 mr-2",children:"\u2022"}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))})]})},t))),(0,wt.jsxs)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 p-8",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white mb-6",children:"GPU Memory Usage by Model Size"}),(0,wt.jsxs)("div",{className:"relative overflow-hidden",children:[(0,wt.jsxs)("div",{className:"space-y-8",children:[(0,wt.jsxs)("div",{className:"space-y-2",children:[(0,wt.jsxs)("div",{className:"flex justify-between text-sm text-gray-400 mb-1",children:[(0,wt.jsx)("span",{children:"Phi-2 (2.7B)"}),(0,wt.jsx)("span",{children:"4-6 GB VRAM"})]}),(0,wt.jsx)("div",{className:"h-4 bg-gray-700 rounded-full overflow-hidden",children:(0,wt.jsx)("div",{className:"h-full bg-gradient-to-r from-orange-400 to-orange-600 w-[20%]"})})]}),(0,wt.jsxs)("div",{className:"space-y-2",children:[(0,wt.jsxs)("div",{className:"flex justify-between text-sm text-gray-400 mb-1",children:[(0,wt.jsx)("span",{children:"Mistral-7B"}),(0,wt.jsx)("span",{children:"8-12 GB VRAM"})]}),(0,wt.jsx)("div",{className:"h-4 bg-gray-700 rounded-full overflow-hidden",children:(0,wt.jsx)("div",{className:"h-full bg-gradient-to-r from-orange-400 to-orange-600 w-[40%]"})})]}),(0,wt.jsxs)("div",{className:"space-y-2",children:[(0,wt.jsxs)("div",{className:"flex justify-between text-sm text-gray-400 mb-1",children:[(0,wt.jsx)("span",{children:"Llama-2-13B"}),(0,wt.jsx)("span",{children:"14-18 GB VRAM"})]}),(0,wt.jsx)("div",{className:"h-4 bg-gray-700 rounded-full overflow-hidden",children:(0,wt.jsx)("div",{className:"h-full bg-gradient-to-r from-orange-400 to-orange-600 w-[60%]"})})]}),(0,wt.jsxs)("div",{className:"space-y-2",children:[(0,wt.jsxs)("div",{className:"flex justify-between text-sm text-gray-400 mb-1",children:[(0,wt.jsx)("span",{children:"Llama-2-70B"}),(0,wt.jsx)("span",{children:"40+ GB VRAM"})]}),(0,wt.jsx)("div",{className:"h-4 bg-gray-700 rounded-full overflow-hidden",children:(0,wt.jsx)("div",{className:"h-full bg-gradient-to-r from-orange-400 to-orange-600 w-[95%]"})})]})]}),(0,wt.jsx)("div",{className:"absolute bottom-0 w-full h-px bg-gray-700"})]}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm mt-6",children:"Memory estimates based on 4-bit quantization with LoRA adapters (r=16). System RAM requirements are typically 2x the VRAM requirements."})]})]}),"data"===e&&(0,wt.jsxs)("div",{className:"space-y-10",children:[(0,wt.jsxs)("div",{className:"max-w-3xl mx-auto mb-12",children:[(0,wt.jsx)("h2",{className:"text-3xl font-bold mb-6 text-center",children:"Data Processing"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 text-center",children:"ModelForge provides advanced data handling capabilities, supporting multiple formats and training paradigms to accommodate diverse use cases."})]}),n.data.map(((e,t)=>(0,wt.jsx)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 transition",children:(0,wt.jsxs)("div",{className:"p-8",children:[(0,wt.jsxs)("div",{className:"mb-6",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-300 mt-2",children:e.description})]}),(0,wt.jsx)("ul",{className:"space-y-2",children:e.details.map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("span",{className:"text-orange-500 mr-2",children:"\u2022"}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))})]})},t))),(0,wt.jsxs)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700",children:[(0,wt.jsxs)("div",{className:"border-b border-gray-700 py-3 px-6 flex items-center justify-between",children:[(0,wt.jsx)("span",{className:"text-white font-medium",children:"Example Training Data Formats (JSONL)"}),(0,wt.jsxs)("div",{className:"flex space-x-2",children:[(0,wt.jsx)("div",{className:"w-3 h-3 rounded-full bg-red-500"}),(0,wt.jsx)("div",{className:"w-3 h-3 rounded-full bg-yellow-500"}),(0,wt.jsx)("div",{className:"w-3 h-3 rounded-full bg-green-500"})]})]}),(0,wt.jsxs)("div",{className:"p-6 overflow-x-auto",children:[(0,wt.jsx)("h4",{className:"text-xl font-medium text-white mb-4",children:"Text Generation"}),(0,wt.jsx)("pre",{className:"text-gray-300 font-mono text-sm mb-8",children:'{\n  "input": "The robot\'s name is Canvas-3000.",\n  "output": "Canvas-3000 whirred softly as its optical sensors focused on the blank paper..."\n}'}),(0,wt.jsx)("h4",{className:"text-xl font-medium text-white mb-4",children:"Summarization"}),(0,wt.jsx)("pre",{className:"text-gray-300 font-mono text-sm mb-8",children:'{\n  "article": "Scientists have discovered a new species of deep-sea creature living near hydrothermal vents...",\n  "summary": "Scientists found a new creature living near underwater hot springs in the deep ocean..."\n}'}),(0,wt.jsx)("h4",{className:"text-xl font-medium text-white mb-4",children:"Question Answering"}),(0,wt.jsx)("pre",{className:"text-gray-300 font-mono text-sm mb-8",children:'{\n  "context": "The Great Barrier Reef is the world\'s largest coral reef system. It is located off the coast of Queensland, Australia...",\n  "question": "Where is the Great Barrier Reef located?",\n  "answers": {"text":"off the coast of Queensland, Australia", "answer_start": [60]}\n}'})]})]})]}),"hyperparameters"===e&&(0,wt.jsxs)("div",{className:"space-y-10",children:[(0,wt.jsxs)("div",{className:"max-w-3xl mx-auto mb-12",children:[(0,wt.jsx)("h2",{className:"text-3xl font-bold mb-6 text-center",children:"Hyperparameter Configuration"}),(0,wt.jsx)("p",{className:"text-lg text-gray-300 text-center",children:"ModelForge provides fine-grained control over training hyperparameters with sensible defaults for beginners and advanced options for experts."})]}),n.hyperparameters.map(((e,t)=>(0,wt.jsx)("div",{className:"bg-gradient-to-br from-gray-800 to-gray-900 rounded-xl overflow-hidden border border-gray-700 transition",children:(0,wt.jsxs)("div",{className:"p-8",children:[(0,wt.jsxs)("div",{className:"mb-6",children:[(0,wt.jsx)("h3",{className:"text-2xl font-bold text-white",children:e.title}),(0,wt.jsx)("p",{className:"text-gray-300 mt-2",children:e.description})]}),(0,wt.jsx)("ul",{className:"space-y-2",children:e.details.map(((e,t)=>(0,wt.jsxs)("li",{className:"flex items-start",children:[(0,wt.jsx)("span",{className:"text-orange-500 mr-2",children:"\u2022"}),(0,wt.jsx)("span",{className:"text-gray-300",children:e})]},t)))})]})},t))),(0,wt.jsx)("div",{className:"bg-orange-500/10 border border-orange-500/30 rounded-xl p-6 mt-10",children:(0,wt.jsxs)("div",{className:"flex items-start",children:[(0,wt.jsx)("svg",{xmlns:"http://www.w3.org/2000/svg",className:"h-6 w-6 text-orange-500 mr-3 flex-shrink-0 mt-1",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M9 12l2 2 4-4m5.618-4.016A11.955 11.955 0 0112 2.944a11.955 11.955 0 01-8.618 3.04A12.02 12.02 0 003 9c0 5.591 3.824 10.29 9 11.622 5.176-1.332 9-6.03 9-11.622 0-1.042-.133-2.052-.382-3.016z"})}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("h4",{className:"text-lg font-semibold text-orange-500",children:"Recommended Configurations"}),(0,wt.jsx)("p",{className:"text-gray-300 mt-1",children:"For most use cases, we recommend starting with LoRA rank (r) = 16, learning rate = 2e-4, and 3 epochs. For instruction-tuning tasks, use warmup ratio = 0.03 and weight decay = 0.01. Adjust batch size based on your GPU memory."})]})]})})]})]})}),(0,wt.jsx)("style",{jsx:"true",children:"\n        .hide-scrollbar {\n          -ms-overflow-style: none;\n          scrollbar-width: none;\n        }\n        .hide-scrollbar::-webkit-scrollbar {\n          display: none;\n        }\n        \n        .bg-grid-pattern {\n          background-image: radial-gradient(circle, rgba(255, 83, 51, 0.1) 1px, transparent 1px);\n          background-size: 30px 30px;\n        }\n      "})]})},Pt=e=>{let{isOpen:t,onClose:n,title:r="Error",message:a,details:l=null}=e;return t?(0,wt.jsx)("div",{className:"fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50 p-4",children:(0,wt.jsxs)("div",{className:"bg-gray-900 rounded-2xl shadow-2xl max-w-md w-full",children:[(0,wt.jsx)("div",{className:"p-6 border-b border-gray-700",children:(0,wt.jsxs)("div",{className:"flex items-center justify-between",children:[(0,wt.jsxs)("div",{className:"flex items-center",children:[(0,wt.jsx)("svg",{className:"w-6 h-6 text-red-400 mr-3",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-2.5L13.732 4c-.77-.833-1.964-.833-2.732 0L4.082 16.5c-.77.833.192 2.5 1.732 2.5z"})}),(0,wt.jsx)("h2",{className:"text-xl font-bold text-red-400",children:r})]}),(0,wt.jsx)("button",{onClick:n,className:"text-gray-400 hover:text-white transition-colors",children:(0,wt.jsx)("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M6 18L18 6M6 6l12 12"})})})]})}),(0,wt.jsxs)("div",{className:"p-6",children:[(0,wt.jsx)("p",{className:"text-gray-200 mb-4",children:a}),l&&(0,wt.jsx)("div",{className:"mt-4",children:(0,wt.jsxs)("details",{className:"cursor-pointer",children:[(0,wt.jsx)("summary",{className:"text-orange-400 font-medium hover:text-orange-300 transition-colors",children:"Show Details"}),(0,wt.jsx)("div",{className:"mt-2 p-3 bg-gray-800 rounded-lg text-sm text-gray-300 break-all",children:l})]})})]}),(0,wt.jsx)("div",{className:"p-6 border-t border-gray-700",children:(0,wt.jsx)("button",{onClick:n,className:"w-full px-6 py-3 bg-red-500 text-white rounded-lg hover:bg-red-600 transition-colors font-medium",children:"Close"})})]})}):null},Lt=e=>{let{isOpen:t,message:n,onClose:r,isSuccess:a=!1}=e;if(!t)return null;const l=/(https:\/\/huggingface\.co\/[^\s]+)/g,o=n?n.match(l):[];return(0,wt.jsx)("div",{className:"fixed inset-0 bg-black bg-opacity-70 flex items-center justify-center z-50 p-4",children:(0,wt.jsxs)("div",{className:"bg-gray-900 rounded-3xl shadow-2xl w-full max-w-2xl p-10 flex flex-col items-center border-4 border-orange-500",children:[a&&(0,wt.jsx)("h2",{className:"text-3xl font-bold text-orange-400 mb-6 text-center",children:"Success!"}),(()=>{if(!o||0===o.length)return(0,wt.jsx)("p",{className:"text-orange-300 text-xl mb-8 text-center",children:n});let e=n.split(l);return(0,wt.jsx)("div",{className:"text-orange-300 text-xl mb-8 text-center",children:e.map(((e,t)=>o.includes(e)?(0,wt.jsx)("a",{href:e,target:"_blank",rel:"noopener noreferrer",className:"text-blue-400 underline hover:text-blue-300 break-all",children:e},t):(0,wt.jsx)("span",{children:e},t)))})})(),r&&(0,wt.jsx)("button",{onClick:r,className:"px-8 py-3 bg-orange-500 text-white rounded-xl hover:bg-orange-600 transition-colors font-bold text-lg shadow-lg",children:"Close"})]})})},zt=e=>{let{model:t,onClose:n,onPush:a}=e;const[l,o]=(0,r.useState)(""),[i,s]=(0,r.useState)(!0),[c,u]=(0,r.useState)(!1),[d,f]=(0,r.useState)(""),[m,p]=(0,r.useState)(""),[h,g]=(0,r.useState)(!1),[v,b]=(0,r.useState)(null),[y,x]=(0,r.useState)(!1),[w,k]=(0,r.useState)(""),j=e=>/^([A-Za-z_0-9-]+\/[A-Za-z_0-9-]+)$/.test(e);return(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsx)(Lt,{isOpen:c,message:"Pushing to Hub. This might take a while."}),(0,wt.jsx)(Lt,{isOpen:y,message:w,isSuccess:!0,onClose:()=>{x(!1),n()}}),!c&&!y&&(0,wt.jsx)("div",{className:"fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50 p-4",children:(0,wt.jsxs)("div",{className:"bg-gray-900 rounded-2xl shadow-2xl max-w-2xl w-full max-h-[90vh] overflow-y-auto",children:[(0,wt.jsxs)("div",{className:"p-6 border-b border-gray-700",children:[(0,wt.jsx)("h2",{className:"text-2xl font-bold text-orange-400",children:"Push Model to HuggingFace Hub"}),(0,wt.jsx)("button",{onClick:n,className:"absolute top-4 right-4 text-gray-400 hover:text-white transition-colors",children:(0,wt.jsx)("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:(0,wt.jsx)("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M6 18L18 6M6 6l12 12"})})})]}),(0,wt.jsxs)("form",{onSubmit:async e=>{if(e.preventDefault(),!l.trim())return f("Repository name is required"),void g(!0);if(!j(l))return f("Invalid repository name format"),void g(!0);u(!0),f("");try{const e=await fetch(Nt.baseURL+"/hub/push",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({repo_name:l,model_path:t.model_path,private:i})}),n=await e.json();if(!e.ok){u(!1);const t=n.error||"Failed to push model to hub";return f(t),b(n.details||"HTTP ".concat(e.status,": ").concat(e.statusText)),void g(!0)}setTimeout((()=>{u(!1),k(n.message||"Model pushed to Hub successfully!"),x(!0)}),2e3),a&&a(n.message)}catch(n){u(!1),f("Network error or unexpected failure"),b(n.message),g(!0)}},className:"p-6 space-y-6",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-orange-400 font-semibold mb-2",children:"Repository Name *"}),(0,wt.jsx)("input",{type:"text",value:l,onChange:e=>{const t=e.target.value;o(t),t&&!j(t)?p("Repository name must be in format 'username/repo-name' (letters, numbers, hyphens and underscores only)"):p("")},placeholder:"username/model-name or model-name",className:"w-full px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-white placeholder-gray-400 focus:outline-none focus:border-orange-500 focus:ring-1 focus:ring-orange-500",required:!0}),m&&(0,wt.jsx)("p",{className:"text-red-400 text-sm mt-1",children:m}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm mt-1",children:"Format: 'username/repo-name' or 'repo-name' (letters and underscores only)"})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsxs)("label",{className:"flex items-center space-x-3",children:[(0,wt.jsx)("input",{type:"checkbox",checked:i,onChange:e=>s(e.target.checked),className:"w-5 h-5 text-orange-500 bg-gray-800 border-gray-600 rounded focus:ring-orange-500 focus:ring-2"}),(0,wt.jsx)("span",{className:"text-orange-400 font-semibold",children:"Make repository private"})]}),(0,wt.jsx)("p",{className:"text-gray-400 text-sm mt-1 ml-8",children:i?"Repository will be private":"Repository will be public"})]}),(0,wt.jsxs)("div",{className:"space-y-4 border-t border-gray-700 pt-6",children:[(0,wt.jsx)("h3",{className:"text-lg font-semibold text-orange-400",children:"Model Information"}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Model Name"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200",children:t.model_name})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Base Model"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200 break-all",children:t.base_model})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Task Type"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200",children:t.task})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Local Model Path"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200 break-all text-sm",children:t.model_path})]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("label",{className:"block text-gray-300 font-medium mb-1",children:"Description"}),(0,wt.jsx)("div",{className:"px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-gray-200",children:t.description||"No description provided"})]})]}),d&&(0,wt.jsx)("div",{className:"text-red-400 bg-red-900/20 border border-red-700 rounded-lg p-3",children:d}),(0,wt.jsxs)("div",{className:"flex gap-4 pt-4",children:[(0,wt.jsx)("button",{type:"button",onClick:n,className:"flex-1 px-6 py-3 bg-gray-700 text-white rounded-lg hover:bg-gray-600 transition-colors font-medium",children:"Cancel"}),(0,wt.jsx)("button",{type:"submit",disabled:c||!!m||!l.trim(),className:"flex-1 px-6 py-3 bg-orange-500 text-white rounded-lg hover:bg-orange-600 transition-colors font-medium disabled:opacity-50 disabled:cursor-not-allowed flex items-center justify-center",children:c?(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsxs)("svg",{className:"animate-spin h-5 w-5 mr-2",xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",children:[(0,wt.jsx)("circle",{className:"opacity-25",cx:"12",cy:"12",r:"10",stroke:"currentColor",strokeWidth:"4"}),(0,wt.jsx)("path",{className:"opacity-75",fill:"currentColor",d:"M4 12a8 8 0 018-8v8z"})]}),"Pushing..."]}):"Push to Hub"})]})]})]})}),(0,wt.jsx)(Pt,{isOpen:h,onClose:()=>{g(!1),f(""),b(null)},title:"Push to Hub Error",message:d,details:v})]})},Tt=()=>{const[e,t]=(0,r.useState)([]),[n,a]=(0,r.useState)(!0),[l,o]=(0,r.useState)(null),[i,s]=(0,r.useState)(null),[c,u]=(0,r.useState)(!1),[d,f]=(0,r.useState)(!1),[m,p]=(0,r.useState)(null);(0,r.useEffect)((()=>{(async()=>{const e=[];let n=null;do{const r=new URLSearchParams({limit:"500"});n&&r.set("cursor",n);const l=await fetch(Nt.baseURL+"/models/all?"+r);if(!l.ok)throw new Error("Failed to fetch models: HTTP ".concat(l.status," ").concat(l.statusText));const s=await l.json();e.push(...s.models||[]),n=s.next_cursor}while(n);return e})().then((e=>{t(e),a(!1)})).catch((e=>{o("Failed to load models"),p(e.message),f(!0),a(!1)}))}),[]);const h=async e=>{try{const t=await fetch(Nt.baseURL+"/playground/new",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({model_path:e})});if(!t.ok){const e=await t.json();o("Failed to open playground"),p(e.error||"HTTP ".concat(t.status,": ").concat(t.statusText)),f(!0)}}catch(t){o("Network error while opening playground"),p(t.message),f(!0)}};return(0,wt.jsxs)("div",{className:"min-h-screen bg-gradient-to-b from-black to-gray-900 py-12 px-2",children:[(0,wt.jsxs)("div",{className:"max-w-6xl mx-auto bg-gray-900/80 rounded-2xl shadow-2xl p-8",children:[(0,wt.jsx)("h1",{className:"text-3xl md:text-4xl font-bold text-orange-400 mb-8 text-center tracking-tight",children:"All Models"}),n?(0,wt.jsxs)("div",{className:"flex justify-center items-center min-h-[200px] text-orange-400 text-lg",children:[(0,wt.jsxs)("svg",{className:"animate-spin h-6 w-6 mr-2 text-orange-400",xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",children:[(0,wt.jsx)("circle",{className:"opacity-25",cx:"12",cy:"12",r:"10",stroke:"currentColor",strokeWidth:"4"}),(0,wt.jsx)("path",{className:"opacity-75",fill:"currentColor",d:"M4 12a8 8 0 018-8v8z"})]}),"Loading..."]}):(0,wt.jsxs)(wt.Fragment,{children:[(0,wt.jsx)("div",{className:"hidden md:block overflow-x-auto rounded-xl shadow-lg",children:(0,wt.jsxs)("table",{className:"min-w-full bg-gray-800 rounded-xl overflow-hidden",children:[(0,wt.jsx)("thead",{children:(0,wt.jsxs)("tr",{children:[(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"ID"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Model Name"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Base Model"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Task"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Description"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Created At"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Model Path"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Playground"}),(0,wt.jsx)("th",{className:"px-4 py-3 bg-orange-500/20 text-orange-400 font-semibold text-left",children:"Push to Hub"})]})}),(0,wt.jsx)("tbody",{children:0===e.length?(0,wt.jsx)("tr",{children:(0,wt.jsx)("td",{colSpan:9,className:"text-center text-gray-400 py-8",children:"No models found."})}):e.map(((e,t)=>(0,wt.jsxs)("tr",{className:t%2===0?"bg-gray-900/60":"bg-gray-800/80",children:[(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-200",children:e.id}),(0,wt.jsx)("td",{className:"px-4 py-3 text-orange-300 break-all",children:e.model_name}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-300 break-all",children:e.base_model}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-300",children:e.task}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-400",children:e.description}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-400",children:new Date(e.creation_date).toLocaleString()}),(0,wt.jsx)("td",{className:"px-4 py-3 text-gray-400 break-all max-w-xs",children:e.model_path}),(0,wt.jsx)("td",{className:"px-4 py-3",children:(0,wt.jsx)("button",{onClick:()=>h(e.model_path),className:"text-orange-400 underline hover:text-orange-300 transition cursor-pointer",children:"Open"})}),(0,wt.jsx)("td",{className:"px-4 py-3",children:(0,wt.jsx)("button",{onClick:()=>{s(e),u(!0)},className:"bg-orange-500 text-white rounded-md px-4 py-2 hover:bg-orange-400 transition",children:"Push"})})]},e.id)))})]})}),(0,wt.jsx)("div",{className:"md:hidden space-y-4",children:0===e.length?(0,wt.jsx)("p",{className:"text-center text-gray-400 py-8",children:"No models found."}):e.map((e=>(0,wt.jsxs)("div",{className:"bg-gray-800 rounded-xl p-4 shadow-md",children:[(0,wt.jsx)("div",{className:"text-orange-300 font-semibold text-lg break-all",children:e.model_name}),(0,wt.jsx)("div",{className:"text-gray-400 text-sm mb-2",children:e.description}),(0,wt.jsxs)("div",{className:"text-sm text-gray-300",children:[(0,wt.jsxs)("div",{children:[(0,wt.jsx)("span",{className:"font-medium text-orange-400",children:"Base:"})," ",e.base_model]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("span",{className:"font-medium text-orange-400",children:"Task:"})," ",e.task]}),(0,wt.jsxs)("div",{children:[(0,wt.jsx)("span",{className:"font-medium text-orange-400",children:"Created:"})," ",new Date(e.creation_date).toLocaleString()]}),(0,wt.jsxs)("div",{className:"break-all",children:[(0,wt.jsx)("span",{className:"font-medium text-orange-400",children:"Path:"})," ",e.model_path]})]}),(0,wt.jsxs)("div",{className:"mt-4 flex flex-wrap gap-2",children:[(0,wt.jsx)("button",{onClick:()=>h(e.model_path),className:"text-sm bg-transparent text-orange-400 underline hover:text-orange-300",children:"Open Playground"}),(0,wt.jsx)("button",{onClick:()=>{s(e),u(!0)},className:"text-sm bg-orange-500 text-white rounded-md px-3 py-1 hover:bg-orange-400",children:"Push to Hub"})]})]},e.id)))})]})]}),c&&(0,wt.jsx)(zt,{model:i,onClose:()=>{u(!1),s(null)},onPush:e=>{u(!1),s(null)}}),(0,wt.jsx)(Pt,{isOpen:d,onClose:()=>{f(!1),o(null),p(null)},title:"Application Error",message:l,details:m})]})},Mt=()=>((0,r.useEffect)((()=>{window.location.href="http://127.0.0.1:8000/"}),[]),null);const Rt=function(){const[e,t]=(0,r.useState)({task:"text-generation",model_name:"llama2-7b",compute_specs:"Standard GPU",num_train_epochs:3,lora_r:16,max_seq_length:512,use_4bit:!0,load_in_8bit:!1,bnb_4bit_compute_dtype:"nf4",bnb_4bit_use_quant_type:!1,use_nested_quant:!1,bnb_4bit_quant_type:"nf4",fp16:!1,bf16:!1,per_device_train_batch_size:2,per_device_eval_batch_size:2,learning_rate:2e-4,gradient_accumulation_steps:1,max_grad_norm:.3,warmup_ratio:.03,weight_decay:.001,gradient_checkpointing:!1,group_by_length:!1,packing:!1,optim:"paged_adamw_32bit",lr_scheduler_type:"cosine",max_steps:-1,hardware_config:{gpu:"",ram:0,disk:0,cpu_cores:0}});(0,r.useEffect)((()=>{console.log("Settings updated in App.js:",e)}),[e]);const n=e=>{console.log("Update triggered with:","function"===typeof e?"Function updater":e),t((t=>{const n="function"===typeof e?e(t):c(c({},t),e),r=JSON.parse(JSON.stringify(n));return console.log("Updating settings in App.js:",r),r}))};return(0,wt.jsx)(ft,{children:(0,wt.jsxs)("div",{className:"bg-[#1a202c] text-white min-h-screen",children:[(0,wt.jsx)(kt,{}),(0,wt.jsxs)(ze,{children:[(0,wt.jsx)(Pe,{path:"/",element:(0,wt.jsx)(jt,{})}),(0,wt.jsx)(Pe,{path:"/finetune/load_settings",element:(0,wt.jsx)(_t,{defaultValues:e,updateSettings:n})}),(0,wt.jsx)(Pe,{path:"/finetune/detect",element:(0,wt.jsx)(St,{currentSettings:e,updateSettings:n})}),(0,wt.jsx)(Pe,{path:"/app",element:(0,wt.jsx)(Mt,{})}),(0,wt.jsx)(Pe,{path:"/finetune/loading",element:(0,wt.jsx)(Ct,{})}),(0,wt.jsx)(Pe,{path:"/technical-details",element:(0,wt.jsx)(Et,{})}),(0,wt.jsx)(Pe,{path:"/models",element:(0,wt.jsx)(Tt,{})})]})]})})},Ot=e=>{e&&e instanceof Function&&n.e(453).then(n.bind(n,453)).then((t=>{let{getCLS:n,getFID:r,getFCP:a,getLCP:l,getTTFB:o}=t;n(e),r(e),a(e),l(e),o(e)}))};a.createRoot(document.getElementById("root")).render((0,wt.jsx)(r.StrictMode,{children:(0,wt.jsx)(Rt,{})})),Ot()})();
 //# sourceMappingURL=main.630cdb63.js.map
\ No newline at end of file
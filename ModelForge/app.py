@@ -9,7 +9,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from .routers import finetuning_router, models_router, playground_router, hub_management_router
+from .routers import finetuning_router, models_router, playground_router, hub_management_router, runs_router, sweeps_router
 from .exceptions import (
     ModelForgeException,
     ModelAccessError,
@@ -20,7 +20,7 @@ from .exceptions import (
     DatabaseError,
 )
 from .logging_config import logger, setup_logging
-from .dependencies import reset_services
+from .dependencies import close_async_services, reset_services
 
 
 # Setup logging
@@ -46,6 +46,7 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info("ModelForge shutting down...")
+        await close_async_services()
         reset_services()
         logger.info("Shutdown complete")
 
@@ -156,6 +157,8 @@ async def modelforge_exception_handler(request: Request, exc: ModelForgeExceptio
 # Include routers
 app.include_router(finetuning_router.router, prefix="/api", tags=["Fine-tuning"])
 app.include_router(models_router.router, prefix="/api", tags=["Models"])
+app.include_router(runs_router.router, prefix="/api", tags=["Runs"])
+app.include_router(sweeps_router.router, prefix="/api", tags=["Sweeps"])
 app.include_router(playground_router.router, prefix="/api", tags=["Playground"])
 app.include_router(hub_management_router.router, prefix="/api", tags=["Hub Management"])
 
@@ -177,6 +180,7 @@ async def get_info():
     """Get ModelForge information."""
     from .providers.provider_factory import ProviderFactory
     from .strategies.strategy_factory import StrategyFactory
+    from .utilities.model_registry import is_offline_mode
 
     return {
         "name": "ModelForge",
@@ -184,6 +188,7 @@ async def get_info():
         "description": "No-code fine-tuning platform",
         "available_providers": ProviderFactory.get_available_providers(),
         "available_strategies": StrategyFactory.get_available_strategies(),
+        "offline": is_offline_mode(),
         "supported_tasks": [
             "text-generation",
             "summarization",
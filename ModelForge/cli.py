@@ -3,9 +3,11 @@ Refactored CLI for ModelForge.
 Clean entry point with improved structure.
 """
 import sys
+import argparse
 import subprocess
-from huggingface_hub import login, whoami
+from importlib.metadata import version, PackageNotFoundError
 from .logging_config import logger
+from .utilities.model_registry import enable_offline_mode, is_offline_mode, get_model_registry
 
 
 def check_huggingface_login():
@@ -13,6 +15,8 @@ def check_huggingface_login():
     Check if user is logged into HuggingFace.
     If not, prompt for login.
     """
+    from huggingface_hub import login, whoami
+
     try:
         whoami()
         logger.info("HuggingFace authentication verified")
@@ -47,10 +51,51 @@ def check_huggingface_login():
             return False
 
 
+def get_version() -> str:
+    """
+    Get the installed ModelForge version.
+
+    Returns:
+        Package version, or "unknown" when running from a source tree
+    """
+    try:
+        return version("modelforge-finetuning")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(prog="modelforge", description="ModelForge fine-tuning platform")
+    parser.add_argument("command", nargs="?", default="run", choices=["run"], help="Command to run")
+    parser.add_argument("--version", action="version", version=f"ModelForge v{get_version()}")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind the server to (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to serve on (default: 8000)")
+    parser.add_argument("--reload", action="store_true", help="Restart the server when source files change (development)")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Run without HuggingFace Hub access, using only locally available base models",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """
     Main entry point for ModelForge CLI.
     """
+    args = parse_args()
+    if args.offline:
+        enable_offline_mode()
+
     print("\n" + "=" * 80)
     print("  __  __           _      _ _____                     ")
     print(" |  \\/  |         | |    | |  ___|                    ")
@@ -60,28 +105,38 @@ def main():
     print(" |_|  |_|\\___/ \\__,_|\\___|_|_| \\___/|_|  \\__, |\\___| ")
     print("                                          __/ |      ")
     print("                                         |___/       ")
-    print("\n ModelForge v2.0 - No-code Fine-Tuning Platform")
+    print(f"\n ModelForge v{get_version()} - No-code Fine-Tuning Platform")
     print("=" * 80 + "\n")
 
-    # Check HuggingFace login
-    if not check_huggingface_login():
+    # Check HuggingFace login (skipped offline so startup never waits on the network)
+    if is_offline_mode():
+        local_models = get_model_registry().list_models()
+        logger.info(f"Offline mode: skipping HuggingFace login, {len(local_models)} local models available")
+        print(f"Offline mode: {len(local_models)} locally available base models")
+    elif not check_huggingface_login():
         sys.exit(1)
 
     # Import and run app
     try:
         import uvicorn
-        from .app import app
 
-        logger.info("Starting ModelForge server...")
+        # The reloader imports the app itself in a worker process
+        app = "ModelForge.app:app"
+        if not args.reload:
+            from .app import app
+
+        display_host = "localhost" if args.host in ("127.0.0.1", "0.0.0.0") else args.host
+        logger.info(f"Starting ModelForge server on {args.host}:{args.port}...")
         print("\nStarting ModelForge server...")
-        print("Server will be available at: http://localhost:8000")
-        print("API documentation: http://localhost:8000/docs")
+        print(f"Server will be available at: http://{display_host}:{args.port}")
+        print(f"API documentation: http://{display_host}:{args.port}/docs")
         print("Press Ctrl+C to stop\n")
 
         uvicorn.run(
             app,
-            host="127.0.0.1",
-            port=8000,
+            host=args.host,
+            port=args.port,
+            reload=args.reload,
             log_level="info",
         )
 
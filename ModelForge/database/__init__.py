@@ -1,4 +1,5 @@
 """
 Database module for ModelForge.
-Provides SQLAlchemy-based database access with connection pooling.
+Provides SQLAlchemy-based database access with connection pooling
+and schema migrations.
 """
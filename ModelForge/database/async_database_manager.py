@@ -0,0 +1,192 @@
+"""
+Async database manager for the API.
+
+Route handlers are ``async def`` and run on the event loop, so a blocking
+SQLite call stalls every other request while it runs. This manager uses
+SQLAlchemy's asyncio engine with aiosqlite, which runs the SQLite calls in a
+worker thread per connection and awaits them. It shares the connection
+settings and query builders of DatabaseManager. Schema creation and
+migrations stay with DatabaseManager, which must be initialized first.
+"""
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from .database_manager import _set_sqlite_pragmas
+from .models import Model
+from .queries import list_models_query, models_version_query, page_from_rows, version_from_row
+from ..exceptions import DatabaseError
+from ..logging_config import logger
+
+
+class AsyncDatabaseManager:
+    """
+    Async counterpart of DatabaseManager for the API's read and delete paths.
+    """
+
+    def __init__(self, db_path: str, pool_size: int = 5, max_overflow: int = 5):
+        """
+        Initialize the async engine.
+
+        Args:
+            db_path: Path to an existing SQLite database file
+            pool_size: Number of pooled connections
+            max_overflow: Extra connections allowed under load
+        """
+        self.db_path = db_path
+        self.engine = create_async_engine(
+            f"sqlite+aiosqlite:///{db_path}",
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            echo=False,
+        )
+        event.listen(self.engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        logger.info(f"Async database engine initialized at {db_path}")
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Get an async database session.
+
+        Yields:
+            SQLAlchemy AsyncSession; committed on success, rolled back on error
+        """
+        async with self.SessionLocal() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Database session error: {e}")
+                raise
+
+    async def _fetch_all(self, query) -> List:
+        """Run a read-only query on a pooled connection, without a session or commit."""
+        async with self.engine.connect() as connection:
+            return (await connection.execute(query)).all()
+
+    async def get_model_by_id(self, model_id: str) -> Optional[Dict]:
+        """
+        Get a model by ID.
+
+        Args:
+            model_id: Model identifier
+
+        Returns:
+            Dictionary of model data if found, None otherwise
+        """
+        try:
+            async with self.get_session() as session:
+                model = await session.get(Model, model_id)
+                if model is None:
+                    logger.warning(f"Model not found: {model_id}")
+                    return None
+                return model.to_dict()
+
+        except Exception as e:
+            logger.error(f"Error fetching model: {e}")
+            raise DatabaseError(f"Failed to fetch model: {str(e)}") from e
+
+    async def list_models(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        task: Optional[str] = None,
+        strategy: Optional[str] = None,
+        provider: Optional[str] = None,
+        base_model: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        include_config: bool = False,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Get one page of active models, filtered and sorted.
+
+        Args:
+            See DatabaseManager.list_models
+
+        Returns:
+            Tuple of (model dictionaries, cursor for the next page or None)
+
+        Raises:
+            ValueError: If sort_by or cursor is invalid
+        """
+        query = list_models_query(
+            limit=limit,
+            cursor=cursor,
+            task=task,
+            strategy=strategy,
+            provider=provider,
+            base_model=base_model,
+            created_after=created_after,
+            created_before=created_before,
+            sort_by=sort_by,
+            descending=descending,
+            include_config=include_config,
+        )
+
+        try:
+            rows = await self._fetch_all(query)
+        except Exception as e:
+            logger.error(f"Error listing models: {e}")
+            raise DatabaseError(f"Failed to list models: {str(e)}") from e
+
+        return page_from_rows(rows, limit, sort_by)
+
+    async def get_models_version(self) -> Tuple[Optional[str], int]:
+        """
+        Get the last-modified time and row count of the models table.
+
+        Returns:
+            Tuple of (latest updated_at as ISO string or None, row count)
+        """
+        try:
+            row = (await self._fetch_all(models_version_query()))[0]
+        except Exception as e:
+            logger.error(f"Error reading models version: {e}")
+            raise DatabaseError(f"Failed to read models version: {str(e)}") from e
+
+        return version_from_row(row)
+
+    async def delete_model(self, model_id: str) -> bool:
+        """
+        Soft delete a model (mark as inactive).
+
+        Args:
+            model_id: Model identifier
+
+        Returns:
+            True if successful, False if the model does not exist
+        """
+        logger.info(f"Deleting model: {model_id}")
+
+        try:
+            async with self.get_session() as session:
+                model = await session.get(Model, model_id)
+                if model is None:
+                    logger.warning(f"Model not found for deletion: {model_id}")
+                    return False
+                model.is_active = False
+
+            logger.info(f"Model deleted successfully: {model_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting model: {e}")
+            raise DatabaseError(f"Failed to delete model: {str(e)}") from e
+
+    async def close(self):
+        """Dispose of the async engine."""
+        await self.engine.dispose()
+        logger.info("Async database connection closed")
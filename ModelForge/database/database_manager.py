@@ -3,16 +3,49 @@ Database manager with SQLAlchemy and connection pooling.
 Replaces the old DBManager with proper session management.
 """
 import os
-from typing import Optional, List, Dict
-from sqlalchemy import create_engine
+import json
+from datetime import datetime
+from typing import Optional, List, Dict, Sequence, Tuple
+from sqlalchemy import create_engine, event, func, select
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
 
-from .models import Base, Model
+from .models import Base, Model, Run, RunMetric, StoredDataset, Sweep, SweepTrial
+from .migrations import apply_migrations
+from .queries import (
+    list_models_query,
+    models_version_query,
+    page_from_rows,
+    version_from_row,
+)
 from ..exceptions import DatabaseError
 from ..logging_config import logger
 
 
+# Applied to every new SQLite connection. WAL lets readers run concurrently
+# with a writer; synchronous=NORMAL is durable across application crashes in
+# WAL mode and avoids an fsync per commit.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+    "cache_size": -16000,  # 16 MB page cache per connection
+    "foreign_keys": "ON",
+}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
 class DatabaseManager:
     """
     Database manager using SQLAlchemy.
@@ -31,19 +64,24 @@ class DatabaseManager:
         # Ensure directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
-        # Create engine with connection pooling
+        # A small pool of reused connections keeps each connection's page cache
+        # warm. A local file connection cannot go stale, so no pre-ping.
         self.engine = create_engine(
             f"sqlite:///{db_path}",
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,  # Verify connections before using
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=5,
+            connect_args={"check_same_thread": False},
             echo=False,  # Set to True for SQL debugging
         )
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
 
-        # Create session factory
+        # Create session factory. Objects stay loaded after commit, so
+        # to_dict() does not re-query the row.
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
+            expire_on_commit=False,
             bind=self.engine
         )
 
@@ -53,10 +91,11 @@ class DatabaseManager:
         logger.info(f"Database initialized at {db_path}")
 
     def _initialize_database(self):
-        """Create tables if they don't exist."""
+        """Create tables if they don't exist and apply pending migrations."""
         try:
             Base.metadata.create_all(bind=self.engine)
-            logger.info("Database tables created/verified")
+            version = apply_migrations(self.engine)
+            logger.info(f"Database tables created/verified (schema version {version})")
         except Exception as e:
             logger.error(f"Error initializing database: {e}")
             raise DatabaseError(f"Failed to initialize database: {str(e)}") from e
@@ -174,7 +213,12 @@ class DatabaseManager:
 
         try:
             with self.get_session() as session:
-                models = session.query(Model).filter_by(is_active=True).all()
+                models = (
+                    session.query(Model)
+                    .filter_by(is_active=True)
+                    .order_by(Model.created_at.desc())
+                    .all()
+                )
                 return [model.to_dict() for model in models]
 
         except Exception as e:
@@ -255,16 +299,713 @@ class DatabaseManager:
 
         try:
             with self.get_session() as session:
-                models = session.query(Model).filter_by(
-                    task=task,
-                    is_active=True
-                ).all()
+                models = (
+                    session.query(Model)
+                    .filter_by(task=task, is_active=True)
+                    .order_by(Model.created_at.desc())
+                    .all()
+                )
                 return [model.to_dict() for model in models]
 
         except Exception as e:
             logger.error(f"Error fetching models by task: {e}")
             raise DatabaseError(f"Failed to fetch models by task: {str(e)}") from e
 
+    def list_models(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        task: Optional[str] = None,
+        strategy: Optional[str] = None,
+        provider: Optional[str] = None,
+        base_model: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        include_config: bool = False,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Get one page of active models, filtered and sorted.
+
+        Pages are keyset-paginated on (sort field, id), so fetching a page
+        costs the same however deep it is and rows do not shift between
+        pages when models are added.
+
+        Args:
+            limit: Maximum number of models to return
+            cursor: next_cursor from the previous page (None for the first page)
+            task: Only models for this task
+            strategy: Only models trained with this strategy
+            provider: Only models trained with this provider
+            base_model: Only models fine-tuned from this base model
+            created_after: Only models created at or after this time
+            created_before: Only models created before this time
+            sort_by: Field to sort by (one of SORTABLE_FIELDS)
+            descending: Sort in descending order
+            include_config: Include the (large) JSON config column
+
+        Returns:
+            Tuple of (model dictionaries, cursor for the next page or None)
+
+        Raises:
+            ValueError: If sort_by or cursor is invalid
+        """
+        query = list_models_query(
+            limit=limit,
+            cursor=cursor,
+            task=task,
+            strategy=strategy,
+            provider=provider,
+            base_model=base_model,
+            created_after=created_after,
+            created_before=created_before,
+            sort_by=sort_by,
+            descending=descending,
+            include_config=include_config,
+        )
+
+        try:
+            with self.get_session() as session:
+                rows = session.execute(query).all()
+        except Exception as e:
+            logger.error(f"Error listing models: {e}")
+            raise DatabaseError(f"Failed to list models: {str(e)}") from e
+
+        return page_from_rows(rows, limit, sort_by)
+
+    def get_models_version(self) -> Tuple[Optional[str], int]:
+        """
+        Get the last-modified time and row count of the models table.
+
+        Every insert, update and soft delete changes updated_at, so together
+        they identify the table's state (e.g. for list ETags).
+
+        Returns:
+            Tuple of (latest updated_at as ISO string or None, row count)
+        """
+        try:
+            with self.get_session() as session:
+                row = session.execute(models_version_query()).one()
+        except Exception as e:
+            logger.error(f"Error reading models version: {e}")
+            raise DatabaseError(f"Failed to read models version: {str(e)}") from e
+
+        return version_from_row(row)
+
+    def create_run(
+        self,
+        run_id: str,
+        base_model: str,
+        task: str,
+        strategy: str,
+        provider: str,
+        config: Optional[str] = None,
+    ) -> Dict:
+        """
+        Record the start of a training run.
+
+        Args:
+            run_id: Unique run identifier
+            base_model: Base model identifier
+            task: Task type
+            strategy: Training strategy
+            provider: Model provider
+            config: JSON configuration
+
+        Returns:
+            Dictionary of run data
+        """
+        logger.info(f"Recording training run: {run_id}")
+
+        try:
+            with self.get_session() as session:
+                run = Run(
+                    id=run_id,
+                    base_model=base_model,
+                    task=task,
+                    strategy=strategy,
+                    provider=provider,
+                    status="running",
+                    config=config,
+                )
+                session.add(run)
+                session.flush()
+                return run.to_dict()
+
+        except Exception as e:
+            logger.error(f"Error recording run: {e}")
+            raise DatabaseError(f"Failed to record run: {str(e)}") from e
+
+    def update_run(self, run_id: str, **kwargs) -> Optional[Dict]:
+        """
+        Update a training run.
+
+        Args:
+            run_id: Run identifier
+            **kwargs: Fields to update
+
+        Returns:
+            Updated run dictionary, or None if the run does not exist
+        """
+        try:
+            with self.get_session() as session:
+                run = session.get(Run, run_id)
+                if not run:
+                    logger.warning(f"Run not found for update: {run_id}")
+                    return None
+
+                for key, value in kwargs.items():
+                    if hasattr(run, key):
+                        setattr(run, key, value)
+                return run.to_dict()
+
+        except Exception as e:
+            logger.error(f"Error updating run: {e}")
+            raise DatabaseError(f"Failed to update run: {str(e)}") from e
+
+    def get_run(self, run_id: str) -> Optional[Dict]:
+        """
+        Get a training run by ID.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Dictionary of run data if found, None otherwise
+        """
+        try:
+            with self.get_session() as session:
+                run = session.get(Run, run_id)
+                return run.to_dict() if run else None
+
+        except Exception as e:
+            logger.error(f"Error fetching run: {e}")
+            raise DatabaseError(f"Failed to fetch run: {str(e)}") from e
+
+    def list_runs(
+        self,
+        limit: int = 50,
+        status: Optional[str] = None,
+        model_id: Optional[str] = None,
+        include_config: bool = False,
+    ) -> List[Dict]:
+        """
+        Get the most recent training runs.
+
+        Args:
+            limit: Maximum number of runs to return
+            status: Only runs with this status (running, completed, failed, pruned)
+            model_id: Only the run that produced this model
+            include_config: Include the JSON config of each run
+
+        Returns:
+            List of run dictionaries, newest first
+        """
+        try:
+            with self.get_session() as session:
+                query = session.query(Run)
+                if status is not None:
+                    query = query.filter(Run.status == status)
+                if model_id is not None:
+                    query = query.filter(Run.model_id == model_id)
+                runs = query.order_by(Run.started_at.desc()).limit(limit).all()
+
+                results = [run.to_dict() for run in runs]
+                if not include_config:
+                    for result in results:
+                        result.pop("config")
+                return results
+
+        except Exception as e:
+            logger.error(f"Error listing runs: {e}")
+            raise DatabaseError(f"Failed to list runs: {str(e)}") from e
+
+    def add_run_metrics(self, run_id: str, series: Dict[str, Tuple[Sequence[int], Sequence[float]]]):
+        """
+        Append one chunk per metric to a run's metric history.
+
+        Args:
+            run_id: Run identifier
+            series: Metric name -> (steps, values) logged since the last flush
+        """
+        series = {name: data for name, data in series.items() if len(data[0])}
+        if not series:
+            return
+
+        try:
+            with self.get_session() as session:
+                last_chunks = dict(
+                    session.execute(
+                        select(RunMetric.name, func.max(RunMetric.chunk))
+                        .where(RunMetric.run_id == run_id, RunMetric.name.in_(list(series)))
+                        .group_by(RunMetric.name)
+                    ).all()
+                )
+                for name, (steps, values) in series.items():
+                    session.add(RunMetric(
+                        run_id=run_id,
+                        name=name,
+                        chunk=last_chunks.get(name, -1) + 1,
+                        start_step=int(steps[0]),
+                        end_step=int(steps[-1]),
+                        count=len(steps),
+                        steps=RunMetric.pack(steps, "i"),
+                        values=RunMetric.pack(values, "f"),
+                    ))
+
+        except Exception as e:
+            logger.error(f"Error storing run metrics: {e}")
+            raise DatabaseError(f"Failed to store run metrics: {str(e)}") from e
+
+    def get_run_metrics(
+        self,
+        run_ids: Sequence[str],
+        names: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Dict[str, Tuple[List[bytes], List[bytes]]]]:
+        """
+        Get the stored metric chunks of one or more runs.
+
+        Args:
+            run_ids: Run identifiers
+            names: Metric names to fetch (None for all)
+
+        Returns:
+            run_id -> metric name -> (packed step chunks, packed value chunks), in step order
+        """
+        query = (
+            select(RunMetric.run_id, RunMetric.name, RunMetric.steps, RunMetric.values)
+            .where(RunMetric.run_id.in_(list(run_ids)))
+            .order_by(RunMetric.run_id, RunMetric.name, RunMetric.chunk)
+        )
+        if names is not None:
+            query = query.where(RunMetric.name.in_(list(names)))
+
+        try:
+            with self.get_session() as session:
+                rows = session.execute(query).all()
+        except Exception as e:
+            logger.error(f"Error fetching run metrics: {e}")
+            raise DatabaseError(f"Failed to fetch run metrics: {str(e)}") from e
+
+        metrics: Dict[str, Dict[str, Tuple[List[bytes], List[bytes]]]] = {}
+        for run_id, name, steps, values in rows:
+            step_chunks, value_chunks = metrics.setdefault(run_id, {}).setdefault(name, ([], []))
+            step_chunks.append(steps)
+            value_chunks.append(values)
+        return metrics
+
+    def create_sweep(
+        self,
+        sweep_id: str,
+        metric: str,
+        direction: str,
+        config: str,
+        trial_params: Sequence[str],
+        name: Optional[str] = None,
+    ) -> Dict:
+        """
+        Record a new sweep with its trials, all pending.
+
+        Args:
+            sweep_id: Unique sweep identifier
+            metric: Eval metric the trials are compared on
+            direction: "minimize" or "maximize"
+            config: JSON base config, search space and scheduler settings
+            trial_params: JSON search space values of each trial, in trial order
+            name: Optional display name
+
+        Returns:
+            Dictionary of sweep data
+        """
+        logger.info(f"Recording sweep {sweep_id} with {len(trial_params)} trials")
+
+        try:
+            with self.get_session() as session:
+                sweep = Sweep(
+                    id=sweep_id,
+                    name=name,
+                    status="running",
+                    metric=metric,
+                    direction=direction,
+                    config=config,
+                )
+                session.add(sweep)
+                session.add_all([
+                    SweepTrial(sweep_id=sweep_id, trial=trial, status="pending", params=params)
+                    for trial, params in enumerate(trial_params)
+                ])
+                session.flush()
+                return sweep.to_dict()
+
+        except Exception as e:
+            logger.error(f"Error recording sweep: {e}")
+            raise DatabaseError(f"Failed to record sweep: {str(e)}") from e
+
+    def update_sweep(self, sweep_id: str, **kwargs) -> Optional[Dict]:
+        """
+        Update a sweep.
+
+        Args:
+            sweep_id: Sweep identifier
+            **kwargs: Fields to update
+
+        Returns:
+            Updated sweep dictionary, or None if the sweep does not exist
+        """
+        try:
+            with self.get_session() as session:
+                sweep = session.get(Sweep, sweep_id)
+                if not sweep:
+                    logger.warning(f"Sweep not found for update: {sweep_id}")
+                    return None
+
+                for key, value in kwargs.items():
+                    if hasattr(sweep, key):
+                        setattr(sweep, key, value)
+                return sweep.to_dict()
+
+        except Exception as e:
+            logger.error(f"Error updating sweep: {e}")
+            raise DatabaseError(f"Failed to update sweep: {str(e)}") from e
+
+    def get_sweep(self, sweep_id: str, include_trials: bool = True) -> Optional[Dict]:
+        """
+        Get a sweep by ID.
+
+        Args:
+            sweep_id: Sweep identifier
+            include_trials: Include the sweep's trials, in trial order
+
+        Returns:
+            Dictionary of sweep data if found, None otherwise
+        """
+        try:
+            with self.get_session() as session:
+                sweep = session.get(Sweep, sweep_id)
+                if not sweep:
+                    return None
+                result = sweep.to_dict()
+                if include_trials:
+                    trials = (
+                        session.query(SweepTrial)
+                        .filter(SweepTrial.sweep_id == sweep_id)
+                        .order_by(SweepTrial.trial)
+                        .all()
+                    )
+                    result["trials"] = [trial.to_dict() for trial in trials]
+                return result
+
+        except Exception as e:
+            logger.error(f"Error fetching sweep: {e}")
+            raise DatabaseError(f"Failed to fetch sweep: {str(e)}") from e
+
+    def list_sweeps(self, limit: int = 50) -> List[Dict]:
+        """
+        Get the most recent sweeps with their trial counts per status.
+
+        Args:
+            limit: Maximum number of sweeps to return
+
+        Returns:
+            List of sweep dictionaries without config, newest first
+        """
+        try:
+            with self.get_session() as session:
+                sweeps = session.query(Sweep).order_by(Sweep.created_at.desc()).limit(limit).all()
+                counts: Dict[str, Dict[str, int]] = {}
+                if sweeps:
+                    rows = session.execute(
+                        select(SweepTrial.sweep_id, SweepTrial.status, func.count())
+                        .where(SweepTrial.sweep_id.in_([sweep.id for sweep in sweeps]))
+                        .group_by(SweepTrial.sweep_id, SweepTrial.status)
+                    ).all()
+                    for sweep_id, status, count in rows:
+                        counts.setdefault(sweep_id, {})[status] = count
+
+                results = []
+                for sweep in sweeps:
+                    result = sweep.to_dict()
+                    result.pop("config")
+                    result["trial_counts"] = counts.get(sweep.id, {})
+                    results.append(result)
+                return results
+
+        except Exception as e:
+            logger.error(f"Error listing sweeps: {e}")
+            raise DatabaseError(f"Failed to list sweeps: {str(e)}") from e
+
+    def claim_sweep_trial(self, sweep_id: str, worker: str) -> Optional[Dict]:
+        """
+        Mark the next pending trial of a sweep as running on a worker.
+
+        Safe to call from several worker processes at once: each pending
+        trial is claimed by exactly one of them.
+
+        Args:
+            sweep_id: Sweep identifier
+            worker: Name of the claiming worker
+
+        Returns:
+            Dictionary of the claimed trial, or None if no trial is pending
+        """
+        try:
+            while True:
+                with self.get_session() as session:
+                    trial = session.execute(
+                        select(func.min(SweepTrial.trial))
+                        .where(SweepTrial.sweep_id == sweep_id, SweepTrial.status == "pending")
+                    ).scalar()
+                    if trial is None:
+                        return None
+
+                    # Conditional on the trial still being pending, so a
+                    # concurrent claim of the same trial updates nothing
+                    claimed = (
+                        session.query(SweepTrial)
+                        .filter(
+                            SweepTrial.sweep_id == sweep_id,
+                            SweepTrial.trial == trial,
+                            SweepTrial.status == "pending",
+                        )
+                        .update(
+                            {
+                                SweepTrial.status: "running",
+                                SweepTrial.worker: worker,
+                                SweepTrial.started_at: datetime.utcnow(),
+                            },
+                            synchronize_session=False,
+                        )
+                    )
+                    if claimed:
+                        return session.get(SweepTrial, (sweep_id, trial)).to_dict()
+
+        except Exception as e:
+            logger.error(f"Error claiming sweep trial: {e}")
+            raise DatabaseError(f"Failed to claim sweep trial: {str(e)}") from e
+
+    def update_sweep_trial(self, sweep_id: str, trial: int, **kwargs) -> Optional[Dict]:
+        """
+        Update a sweep trial.
+
+        Args:
+            sweep_id: Sweep identifier
+            trial: Trial number
+            **kwargs: Fields to update
+
+        Returns:
+            Updated trial dictionary, or None if the trial does not exist
+        """
+        try:
+            with self.get_session() as session:
+                row = session.get(SweepTrial, (sweep_id, trial))
+                if not row:
+                    logger.warning(f"Sweep trial not found for update: {sweep_id}/{trial}")
+                    return None
+
+                for key, value in kwargs.items():
+                    if hasattr(row, key):
+                        setattr(row, key, value)
+                return row.to_dict()
+
+        except Exception as e:
+            logger.error(f"Error updating sweep trial: {e}")
+            raise DatabaseError(f"Failed to update sweep trial: {str(e)}") from e
+
+    def record_sweep_rung(self, sweep_id: str, trial: int, rung: int, value: Optional[float]) -> List[Optional[float]]:
+        """
+        Record a trial's metric at a rung and get every value reported there.
+
+        Args:
+            sweep_id: Sweep identifier
+            trial: Trial number
+            rung: Rung index
+            value: Metric value (None if not finite)
+
+        Returns:
+            Values of all trials of the sweep at this rung, including this one
+        """
+        try:
+            with self.get_session() as session:
+                row = session.get(SweepTrial, (sweep_id, trial))
+                rungs = json.loads(row.rungs) if row.rungs else {}
+                rungs[str(rung)] = value
+                row.rungs = json.dumps(rungs)
+
+            with self.get_session() as session:
+                stored = session.execute(
+                    select(SweepTrial.rungs)
+                    .where(SweepTrial.sweep_id == sweep_id, SweepTrial.rungs.is_not(None))
+                ).scalars().all()
+
+        except Exception as e:
+            logger.error(f"Error recording sweep rung: {e}")
+            raise DatabaseError(f"Failed to record sweep rung: {str(e)}") from e
+
+        key = str(rung)
+        return [rungs[key] for rungs in map(json.loads, stored) if key in rungs]
+
+    def cancel_sweep_trials(self, sweep_id: str) -> int:
+        """
+        Cancel the pending trials of a sweep; running trials are not affected.
+
+        Args:
+            sweep_id: Sweep identifier
+
+        Returns:
+            Number of trials cancelled
+        """
+        try:
+            with self.get_session() as session:
+                return session.query(SweepTrial).filter(
+                    SweepTrial.sweep_id == sweep_id,
+                    SweepTrial.status == "pending",
+                ).update(
+                    {SweepTrial.status: "cancelled", SweepTrial.finished_at: datetime.utcnow()},
+                    synchronize_session=False,
+                )
+
+        except Exception as e:
+            logger.error(f"Error cancelling sweep trials: {e}")
+            raise DatabaseError(f"Failed to cancel sweep trials: {str(e)}") from e
+
+    def add_dataset_reference(
+        self,
+        sha256: str,
+        path: str,
+        size: int,
+        original_filename: Optional[str] = None,
+        records: Optional[int] = None,
+        fields: Optional[str] = None,
+    ) -> Dict:
+        """
+        Add a reference to a stored dataset, recording the dataset if it is new.
+
+        Args:
+            sha256: Content hash of the dataset file
+            path: Path of the stored file
+            size: File size in bytes
+            original_filename: Name of the uploaded file
+            records: Number of records, if known
+            fields: JSON list of field names, if known
+
+        Returns:
+            Dictionary of dataset data with the new refcount
+        """
+        try:
+            with self.get_session() as session:
+                updated = (
+                    session.query(StoredDataset)
+                    .filter(StoredDataset.sha256 == sha256)
+                    .update(
+                        {
+                            StoredDataset.refcount: StoredDataset.refcount + 1,
+                            StoredDataset.last_used_at: datetime.utcnow(),
+                        },
+                        synchronize_session=False,
+                    )
+                )
+                if not updated:
+                    session.add(StoredDataset(
+                        sha256=sha256,
+                        path=path,
+                        original_filename=original_filename,
+                        size=size,
+                        records=records,
+                        fields=fields,
+                        refcount=1,
+                    ))
+                session.flush()
+                return session.get(StoredDataset, sha256).to_dict()
+
+        except Exception as e:
+            logger.error(f"Error adding dataset reference: {e}")
+            raise DatabaseError(f"Failed to add dataset reference: {str(e)}") from e
+
+    def release_dataset_reference(self, sha256: str) -> Optional[Dict]:
+        """
+        Remove a reference to a stored dataset.
+
+        Args:
+            sha256: Content hash of the dataset file
+
+        Returns:
+            Dictionary of dataset data with the new refcount, or None if the
+            dataset does not exist
+        """
+        try:
+            with self.get_session() as session:
+                session.query(StoredDataset).filter(
+                    StoredDataset.sha256 == sha256,
+                    StoredDataset.refcount > 0,
+                ).update(
+                    {StoredDataset.refcount: StoredDataset.refcount - 1},
+                    synchronize_session=False,
+                )
+                dataset = session.get(StoredDataset, sha256)
+                return dataset.to_dict() if dataset else None
+
+        except Exception as e:
+            logger.error(f"Error releasing dataset reference: {e}")
+            raise DatabaseError(f"Failed to release dataset reference: {str(e)}") from e
+
+    def get_dataset(self, sha256: str) -> Optional[Dict]:
+        """
+        Get a stored dataset by content hash.
+
+        Args:
+            sha256: Content hash of the dataset file
+
+        Returns:
+            Dictionary of dataset data if found, None otherwise
+        """
+        try:
+            with self.get_session() as session:
+                dataset = session.get(StoredDataset, sha256)
+                return dataset.to_dict() if dataset else None
+
+        except Exception as e:
+            logger.error(f"Error fetching dataset: {e}")
+            raise DatabaseError(f"Failed to fetch dataset: {str(e)}") from e
+
+    def list_datasets(self) -> List[Dict]:
+        """
+        Get all stored datasets.
+
+        Returns:
+            List of dataset dictionaries, most recently used first
+        """
+        try:
+            with self.get_session() as session:
+                datasets = session.query(StoredDataset).order_by(StoredDataset.last_used_at.desc()).all()
+                return [dataset.to_dict() for dataset in datasets]
+
+        except Exception as e:
+            logger.error(f"Error listing datasets: {e}")
+            raise DatabaseError(f"Failed to list datasets: {str(e)}") from e
+
+    def delete_dataset(self, sha256: str) -> bool:
+        """
+        Delete a stored dataset's record if it has no references left.
+
+        Args:
+            sha256: Content hash of the dataset file
+
+        Returns:
+            True if the record was deleted
+        """
+        try:
+            with self.get_session() as session:
+                deleted = session.query(StoredDataset).filter(
+                    StoredDataset.sha256 == sha256,
+                    StoredDataset.refcount <= 0,
+                ).delete(synchronize_session=False)
+                return bool(deleted)
+
+        except Exception as e:
+            logger.error(f"Error deleting dataset: {e}")
+            raise DatabaseError(f"Failed to delete dataset: {str(e)}") from e
+
     def close(self):
         """Close the database engine."""
         if self.engine:
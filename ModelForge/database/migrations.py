@@ -0,0 +1,79 @@
+"""
+Schema migrations for existing ModelForge databases.
+
+Base.metadata.create_all() creates missing tables (with their indexes) but
+never changes a table that already exists, so databases created by older
+versions need explicit migrations. Migrations are applied in order at startup
+and the last applied version is stored in SQLite's ``PRAGMA user_version``.
+Every migration must be idempotent, since a fresh database already has the
+objects created by create_all().
+"""
+from typing import Callable, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from ..logging_config import logger
+
+
+def _add_model_list_indexes(connection: Connection):
+    """Indexes for listing active models (optionally by task), newest first."""
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_models_active_created ON models (is_active, created_at)"
+    ))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_models_task_active_created ON models (task, is_active, created_at)"
+    ))
+    # Give the query planner statistics for the new indexes
+    connection.execute(text("ANALYZE models"))
+
+
+def _add_updated_at_index(connection: Connection):
+    """Index for the table's last-modified time (list ETags)."""
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_models_updated_at ON models (updated_at)"
+    ))
+
+
+# (version, description, migration) in application order. Append only.
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "Add model listing indexes", _add_model_list_indexes),
+    (2, "Add models.updated_at index", _add_updated_at_index),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(connection: Connection) -> int:
+    """
+    Get the schema version of a database.
+
+    Args:
+        connection: SQLAlchemy connection
+
+    Returns:
+        Last applied migration version (0 for databases never migrated)
+    """
+    return int(connection.exec_driver_sql("PRAGMA user_version").scalar() or 0)
+
+
+def apply_migrations(engine: Engine) -> int:
+    """
+    Apply all pending migrations.
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        Schema version after migrating
+    """
+    with engine.begin() as connection:
+        version = get_schema_version(connection)
+        for migration_version, description, migrate in MIGRATIONS:
+            if migration_version <= version:
+                continue
+            logger.info(f"Applying database migration {migration_version}: {description}")
+            migrate(connection)
+            connection.exec_driver_sql(f"PRAGMA user_version = {int(migration_version)}")
+            version = migration_version
+    return version
@@ -1,7 +1,11 @@
 """
 SQLAlchemy models for ModelForge database.
 """
-from sqlalchemy import Column, String, DateTime, Text, Boolean
+import sys
+from array import array
+from typing import Sequence
+
+from sqlalchemy import Column, String, DateTime, Text, Boolean, Index, Integer, Float, LargeBinary, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -12,6 +16,13 @@ class Model(Base):
     """Model for storing fine-tuned model metadata."""
 
     __tablename__ = "models"
+    __table_args__ = (
+        # Listing (active models, newest first) and listing by task
+        Index("ix_models_active_created", "is_active", "created_at"),
+        Index("ix_models_task_active_created", "task", "is_active", "created_at"),
+        # Last-modified time of the table (list ETags)
+        Index("ix_models_updated_at", "updated_at"),
+    )
 
     id = Column(String, primary_key=True)
     name = Column(String, nullable=False)
@@ -42,3 +53,179 @@ class Model(Base):
             "config": self.config,
             "is_active": self.is_active,
         }
+
+
+class Run(Base):
+    """One training job, successful or not."""
+
+    __tablename__ = "runs"
+    __table_args__ = (
+        Index("ix_runs_status_started", "status", "started_at"),
+        Index("ix_runs_model_id", "model_id"),
+    )
+
+    id = Column(String, primary_key=True)
+    model_id = Column(String, nullable=True)  # Set when the run produced a model
+    base_model = Column(String, nullable=False)
+    task = Column(String, nullable=False)
+    strategy = Column(String, nullable=False)
+    provider = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="running")  # running, completed, failed, pruned
+    started_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    config = Column(Text, nullable=True)  # JSON config
+    summary = Column(Text, nullable=True)  # JSON: phase timings, eval metrics, early stop
+    error = Column(Text, nullable=True)
+
+    def to_dict(self):
+        """Convert run to dictionary."""
+        return {
+            "id": self.id,
+            "model_id": self.model_id,
+            "base_model": self.base_model,
+            "task": self.task,
+            "strategy": self.strategy,
+            "provider": self.provider,
+            "status": self.status,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "config": self.config,
+            "summary": self.summary,
+            "error": self.error,
+        }
+
+
+class RunMetric(Base):
+    """
+    A chunk of one logged metric series of a run.
+
+    Steps and values are stored column-wise as packed little-endian int32 and
+    float32 arrays, one row per metric per flush, instead of one row per
+    logged value.
+    """
+
+    __tablename__ = "run_metrics"
+
+    run_id = Column(String, ForeignKey("runs.id", ondelete="CASCADE"), primary_key=True)
+    name = Column(String, primary_key=True)
+    chunk = Column(Integer, primary_key=True)
+    start_step = Column(Integer, nullable=False)
+    end_step = Column(Integer, nullable=False)
+    count = Column(Integer, nullable=False)
+    steps = Column(LargeBinary, nullable=False)
+    values = Column(LargeBinary, nullable=False)
+
+    @staticmethod
+    def pack(numbers: Sequence, typecode: str) -> bytes:
+        """Pack numbers as a little-endian array ("i" int32 or "f" float32)."""
+        packed = array(typecode, numbers)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        return packed.tobytes()
+
+
+class Sweep(Base):
+    """A hyperparameter sweep: trials of one base config over a search space."""
+
+    __tablename__ = "sweeps"
+
+    id = Column(String, primary_key=True)
+    name = Column(String, nullable=True)
+    status = Column(String, nullable=False, default="running")  # running, completed, failed, cancelled
+    metric = Column(String, nullable=False)
+    direction = Column(String, nullable=False)  # minimize, maximize
+    config = Column(Text, nullable=False)  # JSON: base config, search space, scheduler settings
+    best_trial = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
+
+    def to_dict(self):
+        """Convert sweep to dictionary."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "metric": self.metric,
+            "direction": self.direction,
+            "config": self.config,
+            "best_trial": self.best_trial,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+        }
+
+
+class SweepTrial(Base):
+    """
+    One trial of a sweep.
+
+    Trials are created as pending and claimed by sweep workers. Each trial
+    that starts is also recorded as a run. rungs holds the metric the trial
+    reported at each successive-halving rung it reached.
+    """
+
+    __tablename__ = "sweep_trials"
+
+    sweep_id = Column(String, ForeignKey("sweeps.id", ondelete="CASCADE"), primary_key=True)
+    trial = Column(Integer, primary_key=True)
+    status = Column(String, nullable=False, default="pending")  # pending, running, completed, pruned, failed, cancelled
+    params = Column(Text, nullable=False)  # JSON: the trial's search space values
+    run_id = Column(String, nullable=True)
+    worker = Column(String, nullable=True)
+    score = Column(Float, nullable=True)  # Best value of the sweep metric
+    rungs = Column(Text, nullable=True)  # JSON: rung -> metric value
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
+
+    def to_dict(self):
+        """Convert trial to dictionary."""
+        return {
+            "sweep_id": self.sweep_id,
+            "trial": self.trial,
+            "status": self.status,
+            "params": self.params,
+            "run_id": self.run_id,
+            "worker": self.worker,
+            "score": self.score,
+            "rungs": self.rungs,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+        }
+
+
+class StoredDataset(Base):
+    """
+    An uploaded dataset file, stored once under its content hash.
+
+    refcount counts the references to the file (uploads and running training
+    jobs); the file is deleted when it drops to zero.
+    """
+
+    __tablename__ = "datasets"
+
+    sha256 = Column(String, primary_key=True)
+    path = Column(String, nullable=False)
+    original_filename = Column(String, nullable=True)
+    size = Column(Integer, nullable=False)
+    records = Column(Integer, nullable=True)
+    fields = Column(Text, nullable=True)  # JSON list of field names
+    refcount = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_used_at = Column(DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        """Convert dataset to dictionary."""
+        return {
+            "sha256": self.sha256,
+            "path": self.path,
+            "original_filename": self.original_filename,
+            "size": self.size,
+            "records": self.records,
+            "fields": self.fields,
+            "refcount": self.refcount,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "last_used_at": self.last_used_at.isoformat() if self.last_used_at else None,
+        }
@@ -0,0 +1,140 @@
+"""
+Query builders shared by the sync and async database managers.
+
+Each builder returns a SQLAlchemy statement and a function turning the
+fetched rows into the manager's return value, so both managers run exactly
+the same SQL.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, func, select, tuple_
+
+from .models import Model
+
+
+# Columns the model listing can be sorted by
+SORTABLE_FIELDS = ["created_at", "updated_at", "name"]
+
+
+def _encode_cursor(sort_value: Any, model_id: str) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, model_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, sort_by: str) -> Tuple[Any, str]:
+    """Decode a cursor into (sort value, model id)."""
+    try:
+        sort_value, model_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if sort_by in ("created_at", "updated_at"):
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, str(model_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def row_to_dict(row: Any) -> Dict:
+    """Convert a result row of model columns to a dictionary."""
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in row._mapping.items()
+    }
+
+
+def list_models_query(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    task: Optional[str] = None,
+    strategy: Optional[str] = None,
+    provider: Optional[str] = None,
+    base_model: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    sort_by: str = "created_at",
+    descending: bool = True,
+    include_config: bool = False,
+) -> Select:
+    """
+    Build the query for one page of active models.
+
+    Pages are keyset-paginated on (sort field, id). The query fetches one row
+    more than limit; page_from_rows uses it to tell whether a next page exists.
+
+    Args:
+        See DatabaseManager.list_models
+
+    Returns:
+        SQLAlchemy select statement
+
+    Raises:
+        ValueError: If sort_by or cursor is invalid
+    """
+    if sort_by not in SORTABLE_FIELDS:
+        raise ValueError(f"Invalid sort field: {sort_by}. Must be one of {SORTABLE_FIELDS}")
+
+    sort_column = getattr(Model, sort_by)
+    columns = [c for c in Model.__table__.columns if include_config or c.name != "config"]
+    query = select(*columns).where(Model.is_active.is_(True))
+
+    filters = {"task": task, "strategy": strategy, "provider": provider, "base_model": base_model}
+    for name, value in filters.items():
+        if value is not None:
+            query = query.where(getattr(Model, name) == value)
+    if created_after is not None:
+        query = query.where(Model.created_at >= created_after)
+    if created_before is not None:
+        query = query.where(Model.created_at < created_before)
+
+    key = tuple_(sort_column, Model.id)
+    if cursor:
+        after = tuple_(*_decode_cursor(cursor, sort_by))
+        query = query.where(key < after if descending else key > after)
+    if descending:
+        query = query.order_by(sort_column.desc(), Model.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), Model.id.asc())
+
+    return query.limit(limit + 1)
+
+
+def page_from_rows(rows: Sequence[Any], limit: int, sort_by: str) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Turn the rows of a list_models_query into a page.
+
+    Args:
+        rows: Fetched rows (up to limit + 1)
+        limit: Page size
+        sort_by: Sort field of the query
+
+    Returns:
+        Tuple of (model dictionaries, cursor for the next page or None)
+    """
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]._mapping
+        next_cursor = _encode_cursor(last[sort_by], last["id"])
+    return [row_to_dict(row) for row in rows], next_cursor
+
+
+def models_version_query() -> Select:
+    """Query for the latest updated_at and row count of the models table."""
+    # Separate scalar subqueries: MAX alone is an index lookup, while
+    # MAX and COUNT in one SELECT force a scan for both
+    return select(
+        select(func.max(Model.updated_at)).scalar_subquery(),
+        select(func.count()).select_from(Model).scalar_subquery(),
+    )
+
+
+def version_from_row(row: Any) -> Tuple[Optional[str], int]:
+    """Turn the row of a models_version_query into (last modified ISO string, count)."""
+    last_modified, count = row
+    if isinstance(last_modified, datetime):
+        last_modified = last_modified.isoformat()
+    return last_modified, int(count)
@@ -5,8 +5,14 @@ Provides factory functions for services and managers.
 import os
 
 from .database.database_manager import DatabaseManager
+from .database.async_database_manager import AsyncDatabaseManager
 from .services.training_service import TrainingService
+from .services.model_cache import BaseModelCache
 from .services.model_service import ModelService
+from .services.run_service import RunService
+from .services.sweep_service import SweepService
+from .services.dataset_store import DatasetStore
+from .services.dataset_upload_service import DatasetUploadService
 from .services.hardware_service import HardwareService
 from .utilities.settings_managers.FileManager import FileManager
 from .logging_config import logger
@@ -14,10 +20,16 @@ from .logging_config import logger
 
 # Global instances (singleton pattern for stateless services)
 _db_manager = None
+_async_db_manager = None
 _file_manager = None
 _training_service = None
 _model_service = None
+_run_service = None
+_sweep_service = None
+_dataset_store = None
+_upload_service = None
 _hardware_service = None
+_model_cache = None
 
 # Session cache for storing temporary user selections
 _session_cache = {}
@@ -54,6 +66,41 @@ def get_db_manager() -> DatabaseManager:
     return _db_manager
 
 
+def get_async_db_manager() -> AsyncDatabaseManager:
+    """
+    Get AsyncDatabaseManager instance.
+
+    The sync DatabaseManager is initialized first, so the schema exists and
+    migrations have run before the async engine connects.
+
+    Returns:
+        AsyncDatabaseManager instance
+    """
+    global _async_db_manager
+    if _async_db_manager is None:
+        db_manager = get_db_manager()
+        _async_db_manager = AsyncDatabaseManager(db_manager.db_path)
+        logger.info("AsyncDatabaseManager initialized")
+    return _async_db_manager
+
+
+def get_model_cache() -> BaseModelCache:
+    """
+    Get the resident base-model cache.
+
+    The memory budget is read from MODELFORGE_MODEL_CACHE_GB (default 8, 0 disables).
+
+    Returns:
+        BaseModelCache instance
+    """
+    global _model_cache
+    if _model_cache is None:
+        budget_gb = float(os.environ.get("MODELFORGE_MODEL_CACHE_GB", 8))
+        _model_cache = BaseModelCache(max_memory_bytes=int(budget_gb * 1024 ** 3))
+        logger.info(f"BaseModelCache initialized with {budget_gb} GB budget")
+    return _model_cache
+
+
 def get_training_service() -> TrainingService:
     """
     Get TrainingService instance.
@@ -68,6 +115,8 @@ def get_training_service() -> TrainingService:
         _training_service = TrainingService(
             db_manager=db_manager,
             file_manager=file_manager,
+            model_cache=get_model_cache(),
+            dataset_store=get_dataset_store(),
         )
         logger.info("TrainingService initialized")
     return _training_service
@@ -83,11 +132,74 @@ def get_model_service() -> ModelService:
     global _model_service
     if _model_service is None:
         db_manager = get_db_manager()
-        _model_service = ModelService(db_manager=db_manager)
+        _model_service = ModelService(
+            db_manager=db_manager,
+            async_db_manager=get_async_db_manager(),
+        )
         logger.info("ModelService initialized")
     return _model_service
 
 
+def get_run_service() -> RunService:
+    """
+    Get RunService instance.
+
+    Returns:
+        RunService instance
+    """
+    global _run_service
+    if _run_service is None:
+        _run_service = RunService(db_manager=get_db_manager())
+        logger.info("RunService initialized")
+    return _run_service
+
+
+def get_sweep_service() -> SweepService:
+    """
+    Get SweepService instance.
+
+    Returns:
+        SweepService instance
+    """
+    global _sweep_service
+    if _sweep_service is None:
+        _sweep_service = SweepService(
+            db_manager=get_db_manager(),
+            training_service=get_training_service(),
+        )
+        logger.info("SweepService initialized")
+    return _sweep_service
+
+
+def get_dataset_store() -> DatasetStore:
+    """
+    Get DatasetStore instance.
+
+    Returns:
+        DatasetStore instance
+    """
+    global _dataset_store
+    if _dataset_store is None:
+        default_dirs = get_file_manager().return_default_dirs()
+        _dataset_store = DatasetStore(db_manager=get_db_manager(), datasets_dir=default_dirs["datasets"])
+        logger.info("DatasetStore initialized")
+    return _dataset_store
+
+
+def get_upload_service() -> DatasetUploadService:
+    """
+    Get DatasetUploadService instance.
+
+    Returns:
+        DatasetUploadService instance
+    """
+    global _upload_service
+    if _upload_service is None:
+        _upload_service = DatasetUploadService(store=get_dataset_store())
+        logger.info("DatasetUploadService initialized")
+    return _upload_service
+
+
 def get_hardware_service() -> HardwareService:
     """
     Get HardwareService instance.
@@ -138,21 +250,39 @@ def clear_session():
     logger.info("Session cache cleared")
 
 
+async def close_async_services():
+    """Dispose of async resources; must run on the event loop before reset_services()."""
+    global _async_db_manager
+    if _async_db_manager:
+        await _async_db_manager.close()
+    _async_db_manager = None
+
+
 def reset_services():
     """
     Reset all service instances.
     Useful for testing or reinitializing.
     """
-    global _db_manager, _file_manager, _training_service, _model_service, _hardware_service
+    global _db_manager, _async_db_manager, _file_manager, _training_service, _model_service, _run_service
+    global _sweep_service, _dataset_store, _upload_service, _hardware_service, _model_cache
 
     if _db_manager:
         _db_manager.close()
 
+    if _model_cache:
+        _model_cache.clear()
+
     _db_manager = None
+    _async_db_manager = None
     _file_manager = None
     _training_service = None
     _model_service = None
+    _run_service = None
+    _sweep_service = None
+    _dataset_store = None
+    _upload_service = None
     _hardware_service = None
+    _model_cache = None
 
     # Also clear session cache on reset
     clear_session()
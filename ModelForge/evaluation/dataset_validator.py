@@ -2,10 +2,10 @@
 Dataset validation utilities.
 Validates datasets before training to catch errors early.
 """
-from datasets import load_dataset
 from typing import Dict, List
 
 from ..exceptions import DatasetValidationError
+from ..utilities.dataset_formats import describe_dataset_file, load_dataset_file
 from ..logging_config import logger
 
 
@@ -24,6 +24,8 @@ class DatasetValidator:
         "sft": {},  # Task-specific
         "rlhf": ["prompt", "chosen", "rejected"],
         "dpo": ["prompt", "chosen", "rejected"],
+        "orpo": ["prompt", "chosen", "rejected"],
+        "simpo": ["prompt", "chosen", "rejected"],
         "qlora": {},  # Task-specific
     }
 
@@ -53,8 +55,15 @@ class DatasetValidator:
         logger.info(f"Validating dataset: {dataset_path} for task={task}, strategy={strategy}")
 
         try:
-            # Load dataset
-            dataset = load_dataset("json", data_files=dataset_path, split="train")
+            # Check required fields based on strategy
+            if cls.STRATEGY_FIELD_REQUIREMENTS.get(strategy):
+                required_fields = cls.STRATEGY_FIELD_REQUIREMENTS[strategy]
+            else:
+                # For SFT and QLoRA, use task-specific fields
+                required_fields = cls.TASK_FIELD_REQUIREMENTS.get(task, [])
+
+            # Load dataset; columnar files only read the required fields
+            dataset = load_dataset_file(dataset_path, columns=required_fields or None)
 
             # Check minimum size
             if len(dataset) < min_examples:
@@ -63,13 +72,6 @@ class DatasetValidator:
                     f"Minimum required: {min_examples}"
                 )
 
-            # Check required fields based on strategy
-            if strategy in ["rlhf", "dpo"]:
-                required_fields = cls.STRATEGY_FIELD_REQUIREMENTS[strategy]
-            else:
-                # For SFT and QLoRA, use task-specific fields
-                required_fields = cls.TASK_FIELD_REQUIREMENTS.get(task, [])
-
             # Validate fields
             missing_fields = [
                 field for field in required_fields
@@ -77,10 +79,11 @@ class DatasetValidator:
             ]
 
             if missing_fields:
+                _, available_fields = describe_dataset_file(dataset_path)
                 raise DatasetValidationError(
                     f"Dataset missing required fields: {missing_fields}. "
                     f"Required for {strategy}/{task}: {required_fields}. "
-                    f"Available fields: {dataset.column_names}"
+                    f"Available fields: {available_fields}"
                 )
 
             # Additional validation: check for empty examples
@@ -120,7 +123,7 @@ class DatasetValidator:
         Returns:
             List of required field names
         """
-        if strategy in ["rlhf", "dpo"]:
+        if cls.STRATEGY_FIELD_REQUIREMENTS.get(strategy):
             return cls.STRATEGY_FIELD_REQUIREMENTS[strategy]
         else:
             return cls.TASK_FIELD_REQUIREMENTS.get(task, [])
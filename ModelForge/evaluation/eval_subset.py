@@ -0,0 +1,137 @@
+"""
+Fixed-size, stratified evaluation subsets.
+
+Periodic evaluation on the full held-out split can take as long as the
+training between evaluations. With an eval budget, periodic evaluation runs
+on a fixed-size subset instead and the full split is evaluated once at the
+end of training.
+
+The subset is stratified by example length (token count for tokenized
+datasets, character count otherwise), so short and long examples are
+represented in the same proportions as in the full split. The selected
+indices are cached on disk by dataset fingerprint, so reruns on the same data
+evaluate on exactly the same examples.
+"""
+import json
+import os
+from typing import Any, List, Optional
+
+import numpy as np
+
+from ..logging_config import logger
+
+
+DEFAULT_NUM_STRATA = 10
+LENGTH_BATCH_SIZE = 1000
+
+
+def _example_lengths(dataset: Any) -> np.ndarray:
+    """Length of every example, read in batches to bound memory."""
+    columns = dataset.column_names
+    if "attention_mask" in columns:
+        column, token_level = "attention_mask", True
+    elif "input_ids" in columns:
+        column, token_level = "input_ids", True
+    else:
+        column = next((c for c in columns if isinstance(dataset[0][c], str)), None)
+        token_level = False
+        if column is None:
+            return np.zeros(len(dataset), dtype=np.int64)
+
+    lengths = []
+    for batch in dataset.select_columns([column]).iter(batch_size=LENGTH_BATCH_SIZE):
+        values = batch[column]
+        if column == "attention_mask":
+            lengths.extend(int(sum(mask)) for mask in values)
+        elif token_level:
+            lengths.extend(len(ids) for ids in values)
+        else:
+            lengths.extend(len(text or "") for text in values)
+    return np.asarray(lengths, dtype=np.int64)
+
+
+def stratified_indices(lengths: np.ndarray, num_samples: int, seed: int = 42, num_strata: int = DEFAULT_NUM_STRATA) -> List[int]:
+    """
+    Sample indices proportionally from length-quantile strata.
+
+    Args:
+        lengths: Length of every example
+        num_samples: Number of indices to select
+        seed: Random seed
+        num_strata: Number of length quantile buckets
+
+    Returns:
+        Sorted list of selected indices
+    """
+    total = len(lengths)
+    if num_samples >= total:
+        return list(range(total))
+
+    rng = np.random.default_rng(seed)
+    edges = np.unique(np.quantile(lengths, np.linspace(0, 1, num_strata + 1)[1:-1]))
+    strata = np.searchsorted(edges, lengths, side="right")
+
+    # Proportional allocation with largest-remainder rounding
+    stratum_ids, stratum_sizes = np.unique(strata, return_counts=True)
+    quotas = stratum_sizes * num_samples / total
+    allocation = np.floor(quotas).astype(np.int64)
+    remainder = num_samples - int(allocation.sum())
+    if remainder > 0:
+        allocation[np.argsort(quotas - allocation)[::-1][:remainder]] += 1
+
+    selected = []
+    for stratum, count in zip(stratum_ids, allocation):
+        members = np.flatnonzero(strata == stratum)
+        selected.extend(rng.choice(members, size=min(count, len(members)), replace=False).tolist())
+    return sorted(selected)
+
+
+def select_eval_subset(
+    dataset: Any,
+    max_samples: int,
+    cache_dir: Optional[str] = None,
+    seed: int = 42,
+    num_strata: int = DEFAULT_NUM_STRATA,
+) -> Any:
+    """
+    Select a fixed-size stratified subset of an eval dataset.
+
+    Args:
+        dataset: datasets.Dataset to subsample
+        max_samples: Subset size; the dataset is returned unchanged if it is not larger
+        cache_dir: Directory for cached subset indices (None disables caching)
+        seed: Random seed
+        num_strata: Number of length quantile buckets
+
+    Returns:
+        Subset dataset
+    """
+    if max_samples is None or max_samples <= 0 or len(dataset) <= max_samples:
+        return dataset
+
+    cache_path = None
+    fingerprint = getattr(dataset, "_fingerprint", None)
+    if cache_dir and fingerprint:
+        cache_path = os.path.join(cache_dir, f"{fingerprint}_{max_samples}_{seed}_{num_strata}.json")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r") as f:
+                    indices = json.load(f)
+                if indices and max(indices) < len(dataset):
+                    logger.info(f"Using cached eval subset of {len(indices)} examples")
+                    return dataset.select(indices)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable eval subset cache {cache_path}: {e}")
+
+    indices = stratified_indices(_example_lengths(dataset), max_samples, seed, num_strata)
+    logger.info(f"Selected stratified eval subset: {len(indices)} of {len(dataset)} examples")
+
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_path, "w") as f:
+                json.dump(indices, f)
+        except Exception as e:
+            logger.warning(f"Could not cache eval subset indices: {e}")
+
+    return dataset.select(indices)
@@ -0,0 +1,238 @@
+"""
+In-package text metrics engine.
+
+ROUGE-1/2/L and extractive-QA span F1/Exact Match computed directly over
+NumPy arrays of token ids, without downloading metric scripts. Works offline
+and avoids decoding predictions back to text.
+
+- ROUGE-N: n-grams of every pair in a batch are packed into single integer
+  keys tagged with the pair index, so the clipped overlap counts of the whole
+  batch come out of one ``np.unique`` / ``np.intersect1d`` pass.
+- ROUGE-L: longest common subsequence with a row-vectorized DP. Each DP row
+  is ``np.maximum.accumulate`` over the match-shifted previous row, which is
+  exact because adjacent LCS cells differ by at most one.
+- Span F1 is the overlap F-measure of the predicted and gold token position
+  ranges; EM is exact equality of start and end.
+
+Large ROUGE inputs are split into chunks and scored in parallel worker
+processes.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Pairs per worker chunk; below 2 chunks everything runs in-process
+DEFAULT_CHUNK_SIZE = 2048
+
+IdArray = np.ndarray
+
+
+def _as_id_arrays(sequences: Sequence) -> List[IdArray]:
+    """Convert sequences of token ids to 1-D int64 arrays."""
+    return [np.asarray(seq, dtype=np.int64).reshape(-1) for seq in sequences]
+
+
+def _compact_ids(preds: List[IdArray], refs: List[IdArray]) -> Tuple[List[IdArray], List[IdArray], int]:
+    """Remap ids of a batch to 0..V-1 so n-gram keys stay small."""
+    lengths = [len(a) for a in preds] + [len(a) for a in refs]
+    flat = np.concatenate(preds + refs) if sum(lengths) else np.zeros(0, dtype=np.int64)
+    vocab, inverse = np.unique(flat, return_inverse=True)
+    split_points = np.cumsum(lengths)[:-1]
+    parts = np.split(inverse.astype(np.int64), split_points)
+    return parts[:len(preds)], parts[len(preds):], max(len(vocab), 1)
+
+
+def _ngram_keys(sequences: List[IdArray], n: int, vocab_size: int) -> Tuple[IdArray, IdArray]:
+    """
+    Pack the n-grams of every sequence into integer keys.
+
+    Returns:
+        Tuple of (keys, owner) where owner is the index of the sequence each key came from
+    """
+    keys, owners = [], []
+    for index, seq in enumerate(sequences):
+        count = len(seq) - n + 1
+        if count <= 0:
+            continue
+        key = np.zeros(count, dtype=np.int64)
+        for offset in range(n):
+            key = key * vocab_size + seq[offset:offset + count]
+        keys.append(key)
+        owners.append(np.full(count, index, dtype=np.int64))
+    if not keys:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(keys), np.concatenate(owners)
+
+
+def _ngram_overlap(preds: List[IdArray], refs: List[IdArray], n: int, vocab_size: int) -> Tuple[IdArray, IdArray, IdArray]:
+    """
+    Clipped n-gram overlap for every (pred, ref) pair of a batch.
+
+    Returns:
+        Tuple of (overlap, pred_total, ref_total) arrays, one entry per pair
+    """
+    num_pairs = len(preds)
+    pred_keys, pred_owner = _ngram_keys(preds, n, vocab_size)
+    ref_keys, ref_owner = _ngram_keys(refs, n, vocab_size)
+
+    pred_total = np.bincount(pred_owner, minlength=num_pairs)
+    ref_total = np.bincount(ref_owner, minlength=num_pairs)
+
+    # Tag each n-gram with its pair so one pass counts all pairs at once
+    ngram_space = vocab_size ** n
+    pred_tagged, pred_counts = np.unique(pred_owner * ngram_space + pred_keys, return_counts=True)
+    ref_tagged, ref_counts = np.unique(ref_owner * ngram_space + ref_keys, return_counts=True)
+    common, pred_index, ref_index = np.intersect1d(pred_tagged, ref_tagged, assume_unique=True, return_indices=True)
+
+    overlap = np.bincount(
+        common // ngram_space,
+        weights=np.minimum(pred_counts[pred_index], ref_counts[ref_index]),
+        minlength=num_pairs,
+    )
+    return overlap, pred_total, ref_total
+
+
+def _f_measure(overlap: IdArray, pred_total: IdArray, ref_total: IdArray) -> IdArray:
+    """F1 from overlap counts; 0 where either side is empty."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(pred_total > 0, overlap / np.maximum(pred_total, 1), 0.0)
+        recall = np.where(ref_total > 0, overlap / np.maximum(ref_total, 1), 0.0)
+        denominator = precision + recall
+        return np.where(denominator > 0, 2 * precision * recall / np.where(denominator > 0, denominator, 1), 0.0)
+
+
+def lcs_length(a: IdArray, b: IdArray) -> int:
+    """
+    Length of the longest common subsequence of two id arrays.
+
+    Args:
+        a: First sequence
+        b: Second sequence
+
+    Returns:
+        LCS length
+    """
+    if len(a) == 0 or len(b) == 0:
+        return 0
+    # Iterate over the shorter sequence, vectorize over the longer one
+    if len(a) > len(b):
+        a, b = b, a
+    previous = np.zeros(len(b) + 1, dtype=np.int32)
+    for token in a:
+        shifted = np.where(b == token, previous[:-1] + 1, previous[1:])
+        current = np.empty_like(previous)
+        current[0] = 0
+        np.maximum.accumulate(shifted, out=current[1:])
+        previous = current
+    return int(previous[-1])
+
+
+def _rouge_batch(preds: List[IdArray], refs: List[IdArray]) -> Dict[str, IdArray]:
+    """Per-pair ROUGE-1/2/L F-measures for one batch."""
+    preds, refs, vocab_size = _compact_ids(preds, refs)
+    scores = {}
+    for n, name in ((1, "rouge1"), (2, "rouge2")):
+        scores[name] = _f_measure(*_ngram_overlap(preds, refs, n, vocab_size))
+
+    lcs = np.array([lcs_length(p, r) for p, r in zip(preds, refs)], dtype=np.float64)
+    pred_lengths = np.array([len(p) for p in preds], dtype=np.float64)
+    ref_lengths = np.array([len(r) for r in refs], dtype=np.float64)
+    scores["rougeL"] = _f_measure(lcs, pred_lengths, ref_lengths)
+    return scores
+
+
+def _run_chunked(fn, preds: List[IdArray], refs: List[IdArray], num_workers: Optional[int], chunk_size: int) -> Dict[str, IdArray]:
+    """Score pairs in chunks, in worker processes when there is more than one chunk."""
+    chunks = [(preds[i:i + chunk_size], refs[i:i + chunk_size]) for i in range(0, len(preds), chunk_size)]
+    if num_workers is None:
+        num_workers = min(4, os.cpu_count() or 1)
+
+    if len(chunks) <= 1 or num_workers <= 1:
+        results = [fn(p, r) for p, r in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(chunks))) as executor:
+            results = list(executor.map(fn, *zip(*chunks)))
+
+    if not results:
+        return {}
+    return {key: np.concatenate([r[key] for r in results]) for key in results[0]}
+
+
+def rouge_scores(
+    predictions: Sequence,
+    references: Sequence,
+    num_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, IdArray]:
+    """
+    Per-example ROUGE-1, ROUGE-2 and ROUGE-L F-measures over token ids.
+
+    Args:
+        predictions: Predicted token id sequences
+        references: Reference token id sequences (same length as predictions)
+        num_workers: Worker processes for large inputs (default: up to 4 CPUs)
+        chunk_size: Pairs per worker chunk
+
+    Returns:
+        Dictionary with "rouge1", "rouge2" and "rougeL" arrays
+    """
+    if len(predictions) != len(references):
+        raise ValueError(f"Got {len(predictions)} predictions but {len(references)} references")
+    return _run_chunked(_rouge_batch, _as_id_arrays(predictions), _as_id_arrays(references), num_workers, chunk_size)
+
+
+def span_scores(
+    start_preds: IdArray,
+    end_preds: IdArray,
+    start_labels: IdArray,
+    end_labels: IdArray,
+) -> Dict[str, IdArray]:
+    """
+    Per-example token-level F1 and Exact Match for extractive QA spans.
+
+    Spans are inclusive [start, end] token positions in the context, so F1 is
+    the overlap of the predicted and gold position ranges.
+
+    Args:
+        start_preds: Predicted start positions
+        end_preds: Predicted end positions
+        start_labels: Gold start positions
+        end_labels: Gold end positions
+
+    Returns:
+        Dictionary with "f1" and "exact_match" arrays
+    """
+    start_preds, end_preds, start_labels, end_labels = (
+        np.asarray(a, dtype=np.int64).reshape(-1) for a in (start_preds, end_preds, start_labels, end_labels)
+    )
+    exact = ((start_preds == start_labels) & (end_preds == end_labels)).astype(np.float64)
+
+    pred_len = np.maximum(end_preds - start_preds + 1, 0)
+    gold_len = np.maximum(end_labels - start_labels + 1, 0)
+    overlap = np.maximum(np.minimum(end_preds, end_labels) - np.maximum(start_preds, start_labels) + 1, 0)
+    overlap = np.minimum(overlap, np.minimum(pred_len, gold_len))
+    return {"f1": _f_measure(overlap, pred_len, gold_len), "exact_match": exact}
+
+
+def mean_scores(scores: Dict[str, IdArray]) -> Dict[str, float]:
+    """Average per-example scores into corpus-level metrics."""
+    return {key: float(values.mean()) if len(values) else 0.0 for key, values in scores.items()}
+
+
+def strip_ignored(sequences: np.ndarray, ignore_ids: Sequence[int] = (-100,)) -> List[IdArray]:
+    """
+    Drop ignored positions (label padding, pad tokens) from a 2-D id matrix.
+
+    Args:
+        sequences: Array of shape [batch, seq]
+        ignore_ids: Ids to remove
+
+    Returns:
+        List of 1-D id arrays
+    """
+    sequences = np.asarray(sequences)
+    keep = ~np.isin(sequences, [i for i in ignore_ids if i is not None])
+    return [row[mask] for row, mask in zip(sequences, keep)]
@@ -3,9 +3,12 @@ Metrics computation for different tasks.
 Provides task-specific evaluation metrics.
 """
 import numpy as np
-from typing import Dict, Any
-from transformers import EvalPrediction
+from typing import Dict, Any, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from transformers import EvalPrediction
+
+from . import metric_engine
 from ..logging_config import logger
 
 
@@ -13,7 +16,7 @@ class MetricsCalculator:
     """Calculator for task-specific metrics."""
 
     @staticmethod
-    def compute_causal_lm_metrics(eval_pred: EvalPrediction) -> Dict[str, float]:
+    def compute_causal_lm_metrics(eval_pred: "EvalPrediction") -> Dict[str, float]:
         """
         Compute metrics for causal language modeling (text generation).
 
@@ -50,69 +53,82 @@ class MetricsCalculator:
         return metrics
 
     @staticmethod
-    def compute_seq2seq_metrics(eval_pred: EvalPrediction, tokenizer: Any = None) -> Dict[str, float]:
+    def _to_token_ids(predictions: Any) -> np.ndarray:
+        """Reduce model outputs to predicted token ids (argmax over logits if needed)."""
+        if isinstance(predictions, tuple):
+            predictions = predictions[0]
+        predictions = np.asarray(predictions)
+        if predictions.ndim == 3:
+            predictions = predictions.argmax(axis=-1)
+        return predictions
+
+    @staticmethod
+    def compute_seq2seq_metrics(
+        eval_pred: "EvalPrediction",
+        tokenizer: Any = None,
+        causal: bool = False,
+    ) -> Dict[str, float]:
         """
         Compute metrics for sequence-to-sequence tasks (summarization).
 
         Metrics:
-        - ROUGE-1, ROUGE-2, ROUGE-L (if available)
-        - BLEU score (if available)
+        - ROUGE-1, ROUGE-2, ROUGE-L F-measures over token ids
+
+        Scores are computed in-package by metric_engine, so evaluation works
+        offline and needs no decoding.
 
         Args:
-            eval_pred: Evaluation prediction
-            tokenizer: Tokenizer for decoding predictions
+            eval_pred: Evaluation prediction (generated ids or logits)
+            tokenizer: Tokenizer, used to drop pad and special token ids
+            causal: Predictions come from a causal LM, so logits at position t
+                predict label t+1
 
         Returns:
             Dictionary of metrics
         """
         logger.info("Computing seq2seq metrics")
 
-        predictions, labels = eval_pred.predictions, eval_pred.label_ids
+        try:
+            predictions = MetricsCalculator._to_token_ids(eval_pred.predictions)
+            labels = np.asarray(eval_pred.label_ids)
 
-        # Decode predictions and labels
-        if tokenizer is not None:
-            # Replace -100 in labels (used for padding)
-            labels = np.where(labels != -100, labels, tokenizer.pad_token_id)
+            if causal:
+                predictions, labels = predictions[:, :-1], labels[:, 1:]
 
-            decoded_preds = tokenizer.batch_decode(predictions, skip_special_tokens=True)
-            decoded_labels = tokenizer.batch_decode(labels, skip_special_tokens=True)
+            ignore_ids = [-100]
+            if tokenizer is not None:
+                ignore_ids += list(getattr(tokenizer, "all_special_ids", None) or [tokenizer.pad_token_id])
 
-            # Try to compute ROUGE scores
-            try:
-                import evaluate
-                rouge_metric = evaluate.load("rouge")
-                result = rouge_metric.compute(
-                    predictions=decoded_preds,
-                    references=decoded_labels,
-                    use_stemmer=True
-                )
+            # Score only positions that carry a label
+            predictions = np.where(labels != -100, predictions, -100)
 
-                metrics = {
-                    "rouge1": float(result["rouge1"].mid.fmeasure),
-                    "rouge2": float(result["rouge2"].mid.fmeasure),
-                    "rougeL": float(result["rougeL"].mid.fmeasure),
-                }
+            scores = metric_engine.rouge_scores(
+                metric_engine.strip_ignored(predictions, ignore_ids),
+                metric_engine.strip_ignored(labels, ignore_ids),
+            )
+            metrics = metric_engine.mean_scores(scores)
 
-                logger.info(f"Seq2Seq metrics: {metrics}")
-                return metrics
+            logger.info(f"Seq2Seq metrics: {metrics}")
+            return metrics
 
-            except Exception as e:
-                logger.warning(f"Could not compute ROUGE metrics: {e}")
+        except Exception as e:
+            logger.warning(f"Could not compute ROUGE metrics: {e}")
 
         # Fallback: return basic metrics
         return {"eval_loss": 0.0}
 
     @staticmethod
-    def compute_qa_metrics(eval_pred: EvalPrediction) -> Dict[str, float]:
+    def compute_qa_metrics(eval_pred: "EvalPrediction") -> Dict[str, float]:
         """
-        Compute metrics for question answering.
+        Compute metrics for extractive question answering.
 
         Metrics:
-        - Exact Match (EM)
-        - F1 Score
+        - Exact Match (EM): predicted span equals the gold span
+        - F1 Score: token-level overlap between predicted and gold spans
 
         Args:
-            eval_pred: Evaluation prediction
+            eval_pred: Evaluation prediction with (start, end) logits or positions
+                and (start, end) gold positions
 
         Returns:
             Dictionary of metrics
@@ -121,26 +137,16 @@ class MetricsCalculator:
 
         predictions, labels = eval_pred.predictions, eval_pred.label_ids
 
-        # For QA, predictions are start/end positions
-        # This is a simplified version - full implementation would need more context
         try:
-            # Extract start and end positions
-            start_preds, end_preds = predictions
-            start_labels, end_labels = labels
-
-            # Compute exact match
-            exact_matches = (
-                (start_preds == start_labels) & (end_preds == end_labels)
-            ).astype(float)
-            em_score = exact_matches.mean()
-
-            # Simplified F1 (proper F1 would need token-level comparison)
-            f1_score = em_score  # Placeholder
-
-            metrics = {
-                "exact_match": float(em_score),
-                "f1": float(f1_score),
-            }
+            # Extract start and end positions (argmax over logits if needed)
+            start_preds, end_preds = (np.asarray(p) for p in predictions[:2])
+            if start_preds.ndim == 2:
+                start_preds, end_preds = start_preds.argmax(axis=-1), end_preds.argmax(axis=-1)
+            start_labels, end_labels = (np.asarray(l) for l in labels[:2])
+
+            # Exact span match and token-level F1 over the span overlap
+            scores = metric_engine.span_scores(start_preds, end_preds, start_labels, end_labels)
+            metrics = metric_engine.mean_scores(scores)
 
             logger.info(f"QA metrics: {metrics}")
             return metrics
@@ -0,0 +1,279 @@
+"""
+Streaming evaluation metrics.
+
+A Trainer with ``compute_metrics`` normally gathers the model outputs of the
+whole eval set before computing metrics. For causal LMs those outputs are
+logits of shape [N, seq, vocab], which does not fit in host memory for large
+vocabularies. Here the logits are reduced on the device, batch by batch, by
+a logits preprocessor (argmax ids and per-token loss, or argmax span
+positions for QA), and the metrics are accumulated per batch with
+``TrainingArguments.batch_eval_metrics``. Eval memory stays O(batch).
+"""
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from . import metric_engine
+from ..logging_config import logger
+
+
+IGNORE_INDEX = -100
+
+
+def _to_numpy(value: Any) -> np.ndarray:
+    """Convert a tensor (on any device) or array-like to a NumPy array."""
+    if hasattr(value, "detach"):
+        value = value.detach()
+        if value.dtype.is_floating_point:
+            value = value.float()
+        return value.cpu().numpy()
+    return np.asarray(value)
+
+
+def _first(value: Any) -> Any:
+    """Model outputs may be tuples (logits, past_key_values, ...); keep the logits."""
+    return value[0] if isinstance(value, (tuple, list)) else value
+
+
+def causal_lm_logits_preprocessor(logits: Any, labels: Any) -> Tuple[Any, Any]:
+    """
+    Reduce causal LM logits to predicted ids and per-token loss on the device.
+
+    Logits at position t predict label t+1, so both outputs have shape
+    [batch, seq - 1] and line up with ``labels[:, 1:]``.
+
+    Args:
+        logits: Logits tensor of shape [batch, seq, vocab]
+        labels: Label tensor of shape [batch, seq]
+
+    Returns:
+        Tuple of (predicted ids, per-token loss); ignored positions have loss 0
+    """
+    return _token_preprocess(_first(logits), labels, shift=True)
+
+
+def seq2seq_logits_preprocessor(logits: Any, labels: Any) -> Tuple[Any, Any]:
+    """
+    Reduce encoder-decoder logits (aligned with labels) to predicted ids and per-token loss.
+
+    Args:
+        logits: Decoder logits of shape [batch, seq, vocab]
+        labels: Label tensor of shape [batch, seq]
+
+    Returns:
+        Tuple of (predicted ids, per-token loss), both [batch, seq]
+    """
+    return _token_preprocess(_first(logits), labels, shift=False)
+
+
+def _token_preprocess(logits: Any, labels: Any, shift: bool) -> Tuple[Any, Any]:
+    import torch
+    import torch.nn.functional as F
+
+    if shift:
+        logits, labels = logits[:, :-1, :], labels[:, 1:]
+
+    predictions = logits.argmax(dim=-1)
+
+    # One row at a time keeps the float32 upcast to [seq, vocab]
+    token_loss = torch.empty(labels.shape, dtype=torch.float32, device=logits.device)
+    for row in range(logits.shape[0]):
+        token_loss[row] = F.cross_entropy(
+            logits[row].float(), labels[row], ignore_index=IGNORE_INDEX, reduction="none"
+        )
+    return predictions, token_loss
+
+
+def qa_logits_preprocessor(logits: Any, labels: Any) -> Tuple[Any, Any]:
+    """
+    Reduce start/end logits to predicted span positions on the device.
+
+    Args:
+        logits: Tuple of (start_logits, end_logits), each [batch, seq]
+        labels: Unused
+
+    Returns:
+        Tuple of (start positions, end positions)
+    """
+    start_logits, end_logits = logits[0], logits[1]
+    return start_logits.argmax(dim=-1), end_logits.argmax(dim=-1)
+
+
+class StreamingMetrics(ABC):
+    """
+    Base class for per-batch metric accumulators.
+
+    Instances are used as ``compute_metrics`` with ``batch_eval_metrics=True``:
+    the Trainer calls them once per eval batch and sets ``compute_result`` on
+    the last one, which returns the final metrics and resets the state. Called
+    without ``compute_result`` on a full EvalPrediction they behave like a
+    regular compute_metrics function.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    @abstractmethod
+    def reset(self):
+        """Clear accumulated state."""
+
+    @abstractmethod
+    def update(self, predictions: Any, labels: Any):
+        """Accumulate one batch."""
+
+    @abstractmethod
+    def compute(self) -> Dict[str, float]:
+        """Compute metrics from the accumulated state."""
+
+    def __call__(self, eval_pred: Any, compute_result: bool = True) -> Dict[str, float]:
+        try:
+            self.update(eval_pred.predictions, eval_pred.label_ids)
+        except Exception as e:
+            logger.warning(f"Skipping eval batch in {type(self).__name__}: {e}")
+
+        if not compute_result:
+            return {}
+
+        metrics = self.compute()
+        self.reset()
+        logger.info(f"Streaming eval metrics: {metrics}")
+        return metrics
+
+
+class TokenStreamingMetrics(StreamingMetrics):
+    """
+    Perplexity and next-token accuracy from (predicted ids, per-token loss) batches.
+
+    Optionally also averages teacher-forced ROUGE-1/2/L per example.
+    """
+
+    def __init__(self, shift_labels: bool = True, rouge: bool = False, ignore_ids: Tuple[int, ...] = ()):
+        """
+        Initialize the accumulator.
+
+        Args:
+            shift_labels: Labels are unshifted causal LM labels (predictions are for labels[:, 1:])
+            rouge: Also accumulate ROUGE scores over the labelled positions
+            ignore_ids: Token ids (e.g. pad/special tokens) left out of ROUGE
+        """
+        self.shift_labels = shift_labels
+        self.rouge = rouge
+        self.ignore_ids = (IGNORE_INDEX,) + tuple(i for i in ignore_ids if i is not None)
+        super().__init__()
+
+    def reset(self):
+        self.loss_sum = 0.0
+        self.num_tokens = 0
+        self.num_correct = 0
+        self.rouge_sums: Dict[str, float] = {}
+        self.num_examples = 0
+
+    def update(self, predictions: Any, labels: Any):
+        pred_ids, token_loss = (_to_numpy(p) for p in predictions)
+        labels = _to_numpy(_first(labels))
+        if self.shift_labels:
+            labels = labels[:, 1:]
+
+        mask = labels != IGNORE_INDEX
+        self.loss_sum += float(token_loss[mask].sum())
+        self.num_tokens += int(mask.sum())
+        self.num_correct += int((pred_ids[mask] == labels[mask]).sum())
+
+        if self.rouge:
+            masked_preds = np.where(mask, pred_ids, IGNORE_INDEX)
+            scores = metric_engine.rouge_scores(
+                metric_engine.strip_ignored(masked_preds, self.ignore_ids),
+                metric_engine.strip_ignored(labels, self.ignore_ids),
+                num_workers=1,
+            )
+            for key, values in scores.items():
+                self.rouge_sums[key] = self.rouge_sums.get(key, 0.0) + float(values.sum())
+            self.num_examples += len(labels)
+
+    def compute(self) -> Dict[str, float]:
+        if self.num_tokens == 0:
+            return {}
+        mean_loss = self.loss_sum / self.num_tokens
+        metrics = {
+            "perplexity": math.exp(min(mean_loss, 100.0)),
+            "token_accuracy": self.num_correct / self.num_tokens,
+        }
+        if self.rouge and self.num_examples:
+            metrics.update({key: total / self.num_examples for key, total in self.rouge_sums.items()})
+        return metrics
+
+
+class QAStreamingMetrics(StreamingMetrics):
+    """Exact Match and token-level F1 from (start, end) span position batches."""
+
+    def reset(self):
+        self.f1_sum = 0.0
+        self.exact_sum = 0.0
+        self.num_examples = 0
+
+    def update(self, predictions: Any, labels: Any):
+        start_preds, end_preds = (_to_numpy(p) for p in predictions[:2])
+        start_labels, end_labels = (_to_numpy(l) for l in labels[:2])
+        scores = metric_engine.span_scores(start_preds, end_preds, start_labels, end_labels)
+        self.f1_sum += float(scores["f1"].sum())
+        self.exact_sum += float(scores["exact_match"].sum())
+        self.num_examples += len(scores["f1"])
+
+    def compute(self) -> Dict[str, float]:
+        if self.num_examples == 0:
+            return {}
+        return {
+            "exact_match": self.exact_sum / self.num_examples,
+            "f1": self.f1_sum / self.num_examples,
+        }
+
+
+def get_streaming_metrics(
+    task: str,
+    tokenizer: Any = None,
+    is_encoder_decoder: bool = False,
+) -> Tuple[StreamingMetrics, Callable[[Any, Any], Any]]:
+    """
+    Get the streaming metrics and matching logits preprocessor for a task.
+
+    Args:
+        task: Task type (text-generation, summarization, extractive-question-answering)
+        tokenizer: Optional tokenizer; its special token ids are left out of ROUGE
+        is_encoder_decoder: The model is encoder-decoder (logits aligned with labels)
+
+    Returns:
+        Tuple of (compute_metrics, preprocess_logits_for_metrics)
+    """
+    if task == "extractive-question-answering":
+        return QAStreamingMetrics(), qa_logits_preprocessor
+
+    preprocessor = seq2seq_logits_preprocessor if is_encoder_decoder else causal_lm_logits_preprocessor
+    ignore_ids = tuple(getattr(tokenizer, "all_special_ids", None) or ()) if tokenizer is not None else ()
+    metrics = TokenStreamingMetrics(
+        shift_labels=not is_encoder_decoder,
+        rouge=task == "summarization",
+        ignore_ids=ignore_ids,
+    )
+    return metrics, preprocessor
+
+
+def attach_streaming_metrics(trainer: Any, task: str, tokenizer: Any = None, model: Optional[Any] = None):
+    """
+    Configure a transformers Trainer to compute eval metrics batch by batch.
+
+    Args:
+        trainer: transformers.Trainer instance
+        task: Task type
+        tokenizer: Optional tokenizer
+        model: Model being trained (defaults to trainer.model)
+    """
+    model = model if model is not None else trainer.model
+    is_encoder_decoder = bool(getattr(getattr(model, "config", None), "is_encoder_decoder", False))
+    compute_metrics, preprocessor = get_streaming_metrics(task, tokenizer, is_encoder_decoder)
+
+    trainer.compute_metrics = compute_metrics
+    trainer.preprocess_logits_for_metrics = preprocessor
+    trainer.args.batch_eval_metrics = True
+    logger.info(f"Streaming eval metrics enabled: {type(compute_metrics).__name__}")
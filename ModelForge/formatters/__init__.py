@@ -4,5 +4,18 @@ This module provides task-specific formatting functions for use with Unsloth/TRL
 """
 
 from .formatting_functions import get_formatting_func
+from .batched_formatters import create_batched_formatter, create_arrow_formatter, format_dataset
+from .completion_masking import IGNORE_INDEX, tokenize_with_completion_mask
+from .chat_templates import get_chat_formatter, resolve_prompt_format, tokenize_chat_dataset
 
-__all__ = ["get_formatting_func"]
+__all__ = [
+    "get_formatting_func",
+    "create_batched_formatter",
+    "create_arrow_formatter",
+    "format_dataset",
+    "IGNORE_INDEX",
+    "tokenize_with_completion_mask",
+    "get_chat_formatter",
+    "resolve_prompt_format",
+    "tokenize_chat_dataset",
+]
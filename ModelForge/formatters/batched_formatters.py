@@ -0,0 +1,249 @@
+"""
+Batched, vectorized formatters for dataset preparation.
+
+``TASK_TEMPLATES`` is the single definition of each task's prompt format;
+the per-example formatters in ``formatting_functions`` and the chat-template
+formatter are built on it. These formatters work on whole column batches and
+produce the ``text`` column (prompt followed by completion and EOS) together
+with ``prompt_length``, the number of prompt characters used for
+completion-only label masking.
+
+Two paths are available:
+
+- a batched Python path that formats a batch with one ``map`` over the
+  columns and works for every task, and
+- an Arrow-compute path for simple templates (every placeholder is a string
+  column), which joins the columns in Arrow kernels without creating Python
+  strings at all.
+
+``format_dataset`` picks the fastest path that applies.
+"""
+
+import operator
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..logging_config import logger
+
+
+# User message per task, shared by the plain prompt templates below and the
+# chat-template formatter. Placeholders name dataset columns after
+# training_service._format_dataset.
+TASK_PROMPTS: Dict[str, str] = {
+    "text-generation": "{prompt}",
+    "summarization": "Summarize the following document:\n{input}",
+    "extractive-question-answering": "Context: {context}\n\nQuestion: {question}",
+}
+
+# Plain-text prompt and completion templates per task; "answer" is derived
+# from "answers".
+TASK_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    "text-generation": ("USER: " + TASK_PROMPTS["text-generation"] + "\nASSISTANT: ", "{completion}"),
+    "summarization": (TASK_PROMPTS["summarization"] + "\n\nSummary:\n", "{output}"),
+    "extractive-question-answering": (TASK_PROMPTS["extractive-question-answering"] + "\n\nAnswer: ", "{answer}"),
+}
+
+# Columns derived from other columns before templating
+DERIVED_FIELDS = {"answer": "answers"}
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _parse_template(template: str) -> List[Tuple[str, Optional[str]]]:
+    """Split a template into (literal, field) segments; field is None for a trailing literal."""
+    return [(literal, field) for literal, field, _, _ in Formatter().parse(template)]
+
+
+def _template_fields(task: str) -> List[str]:
+    """Names of the fields referenced by a task's templates, in order."""
+    fields = []
+    for template in TASK_TEMPLATES[task]:
+        for _, field in _parse_template(template):
+            if field is not None and field not in fields:
+                fields.append(field)
+    return fields
+
+
+def _positional_template(template: str, fields: List[str]) -> str:
+    """Rewrite named placeholders as positional ones so rows can be formatted from zipped columns."""
+    parts = []
+    for literal, field in _parse_template(template):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is not None:
+            parts.append(f"{{{fields.index(field)}}}")
+    return "".join(parts)
+
+
+def _answer_texts(answers: List[Any]) -> List[str]:
+    """Extract the first answer text from SQuAD-style answers (dict) or plain strings."""
+    texts = []
+    for answer in answers:
+        if isinstance(answer, dict):
+            candidates = answer.get("text") or [""]
+            texts.append(candidates[0] if isinstance(candidates, list) else str(candidates))
+        elif answer is None:
+            texts.append("")
+        else:
+            texts.append(str(answer))
+    return texts
+
+
+def _column(batch: Dict[str, List[Any]], field: str) -> List[str]:
+    """Get a template field from a batch as strings, treating missing values as empty."""
+    if field in DERIVED_FIELDS:
+        return _answer_texts(batch.get(DERIVED_FIELDS[field], []))
+    return ["" if value is None else str(value) for value in batch.get(field, [])]
+
+
+def create_batched_formatter(task: str, eos_token: str) -> Callable[[Dict[str, List[Any]]], Dict[str, List[Any]]]:
+    """
+    Create a batched formatting function for ``Dataset.map(batched=True)``.
+
+    Args:
+        task: Task type (e.g., "text-generation", "summarization", "extractive-question-answering")
+        eos_token: The EOS token string from the tokenizer
+
+    Returns:
+        Function mapping a column batch to {"text": [...], "prompt_length": [...]}
+    """
+    if task not in TASK_TEMPLATES:
+        logger.warning(f"Unknown task type: {task}, using raw field concatenation")
+
+        def concat_formatting_func(batch: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+            # Fallback: concatenate all string fields (no prompt to mask)
+            rows = zip(*batch.values())
+            texts = [" ".join(v for v in row if isinstance(v, str)) + eos_token for row in rows]
+            return {"text": texts, "prompt_length": [0] * len(texts)}
+
+        return concat_formatting_func
+
+    fields = _template_fields(task)
+    prompt_template, completion_template = TASK_TEMPLATES[task]
+    prompt_format = _positional_template(prompt_template, fields).format
+    completion_format = (_positional_template(completion_template, fields) + eos_token.replace("{", "{{").replace("}", "}}")).format
+
+    def formatting_func(batch: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        columns = [_column(batch, field) for field in fields]
+        prompts = list(map(prompt_format, *columns))
+        completions = map(completion_format, *columns)
+        return {
+            "text": list(map(operator.add, prompts, completions)),
+            "prompt_length": list(map(len, prompts)),
+        }
+
+    return formatting_func
+
+
+def supports_arrow(task: str, features: Any) -> bool:
+    """
+    Check whether a task can be formatted with Arrow compute kernels.
+
+    Args:
+        task: Task type
+        features: Dataset features (datasets.Features) or pyarrow.Schema
+
+    Returns:
+        True if every template field is a string column
+    """
+    if task not in TASK_TEMPLATES:
+        return False
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return False
+
+    schema = features.arrow_schema if hasattr(features, "arrow_schema") else features
+    for field in _template_fields(task):
+        if field not in schema.names:
+            return False
+        field_type = schema.field(field).type
+        if not (pa.types.is_string(field_type) or pa.types.is_large_string(field_type)):
+            return False
+    return True
+
+
+def create_arrow_formatter(task: str, eos_token: str) -> Callable[[Any], Any]:
+    """
+    Create an Arrow-compute formatting function for simple templates.
+
+    Use only when supports_arrow() is True. The function takes a pyarrow.Table
+    batch (``Dataset.with_format("arrow").map(batched=True)``) and returns a
+    table with "text" and "prompt_length" columns. Nulls format as empty strings.
+
+    Args:
+        task: Task type
+        eos_token: The EOS token string from the tokenizer
+
+    Returns:
+        Function mapping a pyarrow.Table to a pyarrow.Table
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    prompt_template, completion_template = TASK_TEMPLATES[task]
+    prompt_segments = _parse_template(prompt_template)
+    completion_segments = _parse_template(completion_template) + [(eos_token, None)]
+
+    def join(table: Any, segments: List[Tuple[str, Optional[str]]]) -> Any:
+        parts = []
+        for literal, field in segments:
+            if literal:
+                parts.append(pa.scalar(literal, pa.large_string()))
+            if field is not None:
+                parts.append(pc.cast(table.column(field), pa.large_string()))
+        return pc.binary_join_element_wise(
+            *parts, pa.scalar("", pa.large_string()), null_handling="replace", null_replacement=""
+        )
+
+    def formatting_func(table: Any) -> Any:
+        prompts = join(table, prompt_segments)
+        completions = join(table, completion_segments)
+        empty = pa.scalar("", pa.large_string())
+        return pa.table({
+            "text": pc.binary_join_element_wise(prompts, completions, empty),
+            "prompt_length": pc.utf8_length(prompts),
+        })
+
+    return formatting_func
+
+
+def format_dataset(
+    dataset: Any,
+    task: str,
+    eos_token: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Any:
+    """
+    Format a dataset into "text" and "prompt_length" columns.
+
+    Uses the Arrow-compute path when the task's template only references
+    string columns, and the batched Python path otherwise. All other columns
+    are removed.
+
+    Args:
+        dataset: datasets.Dataset with task fields (after _format_dataset)
+        task: Task type
+        eos_token: The EOS token string from the tokenizer
+        batch_size: Rows per formatting batch
+
+    Returns:
+        Formatted dataset
+    """
+    if supports_arrow(task, dataset.features):
+        logger.info(f"Formatting {len(dataset)} examples with Arrow compute")
+        formatted = dataset.with_format("arrow").map(
+            create_arrow_formatter(task, eos_token),
+            batched=True,
+            batch_size=batch_size,
+            remove_columns=dataset.column_names,
+        )
+        return formatted.with_format(None)
+
+    logger.info(f"Formatting {len(dataset)} examples with batched formatter")
+    return dataset.map(
+        create_batched_formatter(task, eos_token),
+        batched=True,
+        batch_size=batch_size,
+        remove_columns=dataset.column_names,
+    )
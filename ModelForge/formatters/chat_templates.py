@@ -0,0 +1,361 @@
+"""
+Chat-template-aware formatting for instruction-tuned base models.
+
+Instead of the plain "USER: ... ASSISTANT:" templates, examples can be
+rendered with the base model's own chat template via
+``tokenizer.apply_chat_template``, so fine-tuning and inference use the same
+conversation format.
+
+The chat template is rendered once per tokenizer and system prompt with
+placeholder messages, which splits it into three fixed parts: the prefix
+before the user message, the part between the user message and the
+assistant reply (including the generation prompt), and the suffix after the
+reply. These parts are tokenized once and cached; each example then only
+encodes its variable user and assistant text, and the prompt/completion
+boundary needed for completion-only masking falls out for free. Templates
+that do not insert message content verbatim fall back to rendering every
+example with ``apply_chat_template``.
+"""
+
+import threading
+import weakref
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batched_formatters import TASK_PROMPTS, TASK_TEMPLATES, _column
+from .completion_masking import IGNORE_INDEX
+from ..logging_config import logger
+
+
+PROMPT_FORMATS = ["plain", "chat_template"]
+
+# Placeholder message contents used to split a rendered template
+_USER_SENTINEL = "MODELFORGE_USER"
+_ASSISTANT_SENTINEL = "MODELFORGE_ASSISTANT"
+
+
+def has_chat_template(tokenizer: Any) -> bool:
+    """Check whether a tokenizer defines a chat template."""
+    return bool(getattr(tokenizer, "chat_template", None))
+
+
+def resolve_prompt_format(tokenizer: Any, config: Dict[str, Any]) -> str:
+    """
+    Get the prompt format a job will actually use.
+
+    "chat_template" falls back to "plain" when the tokenizer has no chat template.
+
+    Args:
+        tokenizer: Tokenizer instance
+        config: Training configuration
+
+    Returns:
+        "plain" or "chat_template"
+    """
+    prompt_format = config.get("prompt_format") or "plain"
+    if prompt_format == "chat_template" and not has_chat_template(tokenizer):
+        logger.warning("Tokenizer has no chat template, falling back to the plain prompt format")
+        return "plain"
+    return prompt_format
+
+
+def build_messages(user_text: str, system_prompt: Optional[str] = None, assistant_text: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Build a chat message list for one example.
+
+    Args:
+        user_text: User message content
+        system_prompt: Optional system message content
+        assistant_text: Assistant reply; omitted for generation prompts
+
+    Returns:
+        List of {"role", "content"} messages
+    """
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": user_text})
+    if assistant_text is not None:
+        messages.append({"role": "assistant", "content": assistant_text})
+    return messages
+
+
+def format_user_message(task: str, example: Dict[str, Any]) -> str:
+    """
+    Build the user message for a single example (e.g. in the playground).
+
+    Args:
+        task: Task type
+        example: Task fields, e.g. {"prompt": ...} or {"context": ..., "question": ...}
+
+    Returns:
+        User message content
+    """
+    return TASK_PROMPTS.get(task, "{prompt}").format_map(
+        {key: "" if value is None else value for key, value in example.items()}
+    )
+
+
+class ChatTemplateFormatter:
+    """
+    Chat-template formatter with pre-tokenized fixed parts.
+
+    Use get_chat_formatter() to get the cached instance for a tokenizer.
+    """
+
+    def __init__(self, tokenizer: Any, system_prompt: Optional[str] = None):
+        """
+        Render the template once and pre-tokenize its fixed parts.
+
+        Args:
+            tokenizer: Tokenizer with a chat template
+            system_prompt: Optional system message included in every example
+        """
+        self.tokenizer = tokenizer
+        self.system_prompt = system_prompt
+
+        rendered = tokenizer.apply_chat_template(
+            build_messages(_USER_SENTINEL, system_prompt, _ASSISTANT_SENTINEL),
+            tokenize=False,
+        )
+        self.parts = self._split(rendered)
+
+        if self.parts is None:
+            logger.warning("Chat template does not insert messages verbatim, rendering each example")
+            self.prefix_ids = self.middle_ids = self.suffix_ids = None
+        else:
+            prefix, middle, suffix = self.parts
+            self.prefix_ids = self._encode(prefix)
+            self.middle_ids = self._encode(middle)
+            self.suffix_ids = self._encode(suffix)
+
+    @staticmethod
+    def _split(rendered: str) -> Optional[Tuple[str, str, str]]:
+        """Split a rendered template into (prefix, middle, suffix) around the placeholders."""
+        if rendered.count(_USER_SENTINEL) != 1 or rendered.count(_ASSISTANT_SENTINEL) != 1:
+            return None
+        prefix, rest = rendered.split(_USER_SENTINEL)
+        middle, suffix = rest.split(_ASSISTANT_SENTINEL)
+        return prefix, middle, suffix
+
+    def _encode(self, text: str) -> List[int]:
+        return self.tokenizer(text, add_special_tokens=False)["input_ids"]
+
+    def _encode_batch(self, texts: List[str]) -> List[List[int]]:
+        if not texts:
+            return []
+        return self.tokenizer(texts, add_special_tokens=False)["input_ids"]
+
+    def encode_batch(
+        self,
+        user_texts: List[str],
+        assistant_texts: List[str],
+        max_length: int,
+        completion_only: bool = False,
+    ) -> Dict[str, List[List[int]]]:
+        """
+        Tokenize a batch of conversations, padded to max_length.
+
+        Args:
+            user_texts: User message per example
+            assistant_texts: Assistant reply per example
+            max_length: Maximum sequence length; longer sequences are truncated on the right
+            completion_only: Mask everything but the assistant reply in labels
+
+        Returns:
+            Batch with input_ids, attention_mask and labels
+        """
+        if self.parts is None:
+            return self._encode_batch_rendered(user_texts, assistant_texts, max_length, completion_only)
+
+        user_ids = self._encode_batch(user_texts)
+        assistant_ids = self._encode_batch(assistant_texts)
+
+        sequences = []
+        prompt_lengths = []
+        for user, assistant in zip(user_ids, assistant_ids):
+            prompt = self.prefix_ids + user + self.middle_ids
+            sequences.append(prompt + assistant + self.suffix_ids)
+            prompt_lengths.append(len(prompt))
+
+        return self._pad(sequences, prompt_lengths, max_length, completion_only)
+
+    def sequence_lengths(self, user_texts: List[str], assistant_texts: List[str]) -> Tuple[List[int], List[int]]:
+        """
+        Count the tokens of a batch of conversations without truncating them.
+
+        Args:
+            user_texts: User message per example
+            assistant_texts: Assistant reply per example
+
+        Returns:
+            Tuple of (conversation lengths, prompt lengths) in tokens
+        """
+        if self.parts is None:
+            lengths, prompt_lengths = [], []
+            for user, assistant in zip(user_texts, assistant_texts):
+                prompt = self.tokenizer.apply_chat_template(
+                    build_messages(user, self.system_prompt), tokenize=True, add_generation_prompt=True
+                )
+                full = self.tokenizer.apply_chat_template(
+                    build_messages(user, self.system_prompt, assistant), tokenize=True
+                )
+                lengths.append(len(full))
+                prompt_lengths.append(len(prompt))
+            return lengths, prompt_lengths
+
+        fixed = len(self.prefix_ids) + len(self.middle_ids)
+        prompt_lengths = [fixed + len(ids) for ids in self._encode_batch(user_texts)]
+        lengths = [
+            prompt_length + len(ids) + len(self.suffix_ids)
+            for prompt_length, ids in zip(prompt_lengths, self._encode_batch(assistant_texts))
+        ]
+        return lengths, prompt_lengths
+
+    def _encode_batch_rendered(
+        self,
+        user_texts: List[str],
+        assistant_texts: List[str],
+        max_length: int,
+        completion_only: bool,
+    ) -> Dict[str, List[List[int]]]:
+        """Slow path: render every example with apply_chat_template."""
+        sequences = []
+        prompt_lengths = []
+        for user, assistant in zip(user_texts, assistant_texts):
+            prompt = self.tokenizer.apply_chat_template(
+                build_messages(user, self.system_prompt), tokenize=True, add_generation_prompt=True
+            )
+            full = self.tokenizer.apply_chat_template(
+                build_messages(user, self.system_prompt, assistant), tokenize=True
+            )
+            sequences.append(full)
+            prompt_lengths.append(len(prompt))
+
+        return self._pad(sequences, prompt_lengths, max_length, completion_only)
+
+    def _pad(
+        self,
+        sequences: List[List[int]],
+        prompt_lengths: List[int],
+        max_length: int,
+        completion_only: bool,
+    ) -> Dict[str, List[List[int]]]:
+        """Truncate, right-pad and build labels."""
+        pad_id = self.tokenizer.pad_token_id
+        if pad_id is None:
+            pad_id = self.tokenizer.eos_token_id
+
+        batch = {"input_ids": [], "attention_mask": [], "labels": []}
+        for ids, prompt_length in zip(sequences, prompt_lengths):
+            ids = ids[:max_length]
+            padding = max_length - len(ids)
+            if completion_only:
+                labels = [IGNORE_INDEX] * min(prompt_length, len(ids)) + ids[prompt_length:]
+            else:
+                labels = list(ids)
+            batch["input_ids"].append(ids + [pad_id] * padding)
+            batch["attention_mask"].append([1] * len(ids) + [0] * padding)
+            batch["labels"].append(labels + [IGNORE_INDEX] * padding)
+        return batch
+
+    def render_generation_prompt(self, user_text: str) -> str:
+        """
+        Render the prompt for generation (the same prefix the model was trained on).
+
+        Args:
+            user_text: User message content
+
+        Returns:
+            Rendered prompt ending with the assistant generation header
+        """
+        if self.parts is not None:
+            prefix, middle, _ = self.parts
+            return prefix + user_text + middle
+        return self.tokenizer.apply_chat_template(
+            build_messages(user_text, self.system_prompt), tokenize=False, add_generation_prompt=True
+        )
+
+
+# Formatters per tokenizer, keyed by system prompt. Weak keys drop the cached
+# template when the tokenizer is garbage collected.
+_formatters: "weakref.WeakKeyDictionary[Any, Dict[Tuple[Optional[str], str], ChatTemplateFormatter]]" = weakref.WeakKeyDictionary()
+_formatters_lock = threading.Lock()
+
+
+def get_chat_formatter(tokenizer: Any, system_prompt: Optional[str] = None) -> ChatTemplateFormatter:
+    """
+    Get the cached chat formatter for a tokenizer and system prompt.
+
+    Args:
+        tokenizer: Tokenizer with a chat template
+        system_prompt: Optional system message
+
+    Returns:
+        ChatTemplateFormatter instance
+    """
+    key = (system_prompt, tokenizer.chat_template)
+    with _formatters_lock:
+        per_tokenizer = _formatters.setdefault(tokenizer, {})
+        formatter = per_tokenizer.get(key)
+        if formatter is None:
+            formatter = ChatTemplateFormatter(tokenizer, system_prompt)
+            per_tokenizer[key] = formatter
+    return formatter
+
+
+def _user_and_assistant_columns(task: str, batch: Dict[str, List[Any]]) -> Tuple[List[str], List[str]]:
+    """Build user messages and assistant replies for a column batch."""
+    user_template = TASK_PROMPTS[task]
+    user_fields = [field for _, field, _, _ in Formatter().parse(user_template) if field is not None]
+    columns = {field: _column(batch, field) for field in user_fields}
+    num_rows = len(next(iter(batch.values()))) if batch else 0
+    users = [
+        user_template.format_map({field: columns[field][i] for field in user_fields})
+        for i in range(num_rows)
+    ]
+
+    completion_field = next(field for _, field, _, _ in Formatter().parse(TASK_TEMPLATES[task][1]) if field)
+    return users, _column(batch, completion_field)
+
+
+def tokenize_chat_dataset(
+    dataset: Any,
+    tokenizer: Any,
+    task: str,
+    max_length: int,
+    completion_only: bool = False,
+    system_prompt: Optional[str] = None,
+) -> Any:
+    """
+    Format and tokenize a dataset with the tokenizer's chat template.
+
+    Args:
+        dataset: datasets.Dataset with task fields (after _format_dataset)
+        tokenizer: Tokenizer with a chat template
+        task: Task type
+        max_length: Maximum sequence length (sequences are padded to this length)
+        completion_only: Mask everything but the assistant reply in labels
+        system_prompt: Optional system message
+
+    Returns:
+        Dataset with input_ids, attention_mask and labels
+    """
+    if task not in TASK_PROMPTS:
+        raise ValueError(
+            f"Chat template formatting is not available for task: {task}. "
+            f"Supported tasks: {list(TASK_PROMPTS.keys())}"
+        )
+
+    formatter = get_chat_formatter(tokenizer, system_prompt)
+
+    def tokenize_function(batch: Dict[str, List[Any]]) -> Dict[str, List[List[int]]]:
+        users, assistants = _user_and_assistant_columns(task, batch)
+        return formatter.encode_batch(users, assistants, max_length, completion_only)
+
+    logger.info(f"Formatting {len(dataset)} examples with the tokenizer's chat template")
+    return dataset.map(
+        tokenize_function,
+        batched=True,
+        remove_columns=dataset.column_names,
+    )
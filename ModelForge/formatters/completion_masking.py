@@ -0,0 +1,100 @@
+"""
+Completion-only label masking for causal language model training.
+
+By default every token of the formatted text is a training target, so the
+model spends gradient on reproducing the prompt template and on padding.
+In completion-only mode the prompt/completion boundary is located once, at
+tokenization time, and prompt and padding positions get the ignore index in
+``labels``. The mask is stored with the tokenized dataset, so it is cached
+alongside ``input_ids`` and costs nothing per training step.
+"""
+
+from typing import Any, Dict, List
+
+# Label value ignored by the cross-entropy loss in transformers models
+IGNORE_INDEX = -100
+
+
+def tokenize_with_completion_mask(
+    tokenizer: Any,
+    texts: List[str],
+    prompt_lengths: List[int],
+    max_length: int,
+) -> Dict[str, List[List[int]]]:
+    """
+    Tokenize texts and build labels that cover only the completion.
+
+    Each text is ``prompt + completion``; ``prompt_lengths`` holds the number of
+    prompt characters. A token is a target if it contains at least one
+    completion character, so a token that merges the template's trailing space
+    with the first completion word is kept. Special tokens and padding are
+    never targets. Fast tokenizers locate the boundary from character offsets;
+    slow tokenizers fall back to tokenizing the prompt separately.
+
+    Args:
+        tokenizer: Tokenizer instance
+        texts: Full formatted texts (prompt followed by completion)
+        prompt_lengths: Length of the prompt part of each text, in characters
+        max_length: Maximum sequence length (texts are padded to this length)
+
+    Returns:
+        Tokenized batch with input_ids, attention_mask and labels
+    """
+    use_offsets = getattr(tokenizer, "is_fast", False)
+
+    tokenized = tokenizer(
+        texts,
+        truncation=True,
+        max_length=max_length,
+        padding="max_length",
+        return_offsets_mapping=use_offsets,
+        return_tensors=None,
+    )
+
+    if use_offsets:
+        offsets = tokenized.pop("offset_mapping")
+        boundaries = None
+    else:
+        offsets = None
+        boundaries = _prompt_token_counts(tokenizer, texts, prompt_lengths)
+
+    labels = []
+    for i, (input_ids, attention_mask) in enumerate(zip(tokenized["input_ids"], tokenized["attention_mask"])):
+        if offsets is not None:
+            prompt_chars = prompt_lengths[i]
+            is_target = [end > prompt_chars and end > start for start, end in offsets[i]]
+        else:
+            is_target = [position >= boundaries[i] for position in range(len(input_ids))]
+
+        labels.append([
+            token_id if attended and target else IGNORE_INDEX
+            for token_id, attended, target in zip(input_ids, attention_mask, is_target)
+        ])
+
+    tokenized["labels"] = labels
+    return tokenized
+
+
+def _prompt_token_counts(tokenizer: Any, texts: List[str], prompt_lengths: List[int]) -> List[int]:
+    """
+    Count the leading tokens of each text that belong to the prompt (slow tokenizers).
+
+    Assumes padding on the right, where the prompt tokens follow any special
+    prefix tokens (e.g. BOS) at the start of the sequence.
+    """
+    special_prefix = len(tokenizer("", add_special_tokens=True)["input_ids"]) - len(
+        tokenizer("", add_special_tokens=False)["input_ids"]
+    )
+    prompts = [text[:length] for text, length in zip(texts, prompt_lengths)]
+    prompt_ids = tokenizer(prompts, add_special_tokens=False)["input_ids"]
+    return [special_prefix + len(ids) if length > 0 else 0 for ids, length in zip(prompt_ids, prompt_lengths)]
+
+
+def has_completion_tokens(example: Dict[str, Any]) -> bool:
+    """
+    Check that an example kept at least one target token after truncation.
+
+    Examples whose completion was truncated away would contribute a NaN loss,
+    so they are filtered out of completion-only datasets.
+    """
+    return any(label != IGNORE_INDEX for label in example["labels"])
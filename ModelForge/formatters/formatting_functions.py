@@ -3,11 +3,27 @@ Task-specific formatting functions for Unsloth/TRL trainers.
 
 These functions convert dataset examples into formatted text strings
 that are ready for training. Each function must return a list of strings
-as required by Unsloth.
+as required by Unsloth. The text comes from the task's template in
+``batched_formatters.TASK_TEMPLATES``, so it matches the batched formatters.
 """
 
 from typing import Callable, List
 
+from .batched_formatters import DERIVED_FIELDS, _template_fields, create_batched_formatter
+
+
+def _create_formatter(task: str, eos_token: str) -> Callable:
+    """Wrap the batched formatter for a task so it formats a single example."""
+    batched_func = create_batched_formatter(task, eos_token)
+    columns = [DERIVED_FIELDS.get(field, field) for field in _template_fields(task)]
+
+    def formatting_func(example: dict) -> List[str]:
+        batch = {column: [None] for column in columns}
+        batch.update({key: [value] for key, value in example.items()})
+        return batched_func(batch)["text"]  # Must return list as required by Unsloth
+
+    return formatting_func
+
 
 def create_text_generation_formatter(eos_token: str) -> Callable:
     """
@@ -23,16 +39,7 @@ def create_text_generation_formatter(eos_token: str) -> Callable:
     Returns:
         Formatting function that returns a list of formatted strings
     """
-    def formatting_func(example: dict) -> List[str]:
-        prompt = example.get("prompt", "")
-        completion = example.get("completion", "")
-
-        # Format as USER/ASSISTANT conversation with EOS token
-        text = f"USER: {prompt}\nASSISTANT: {completion}{eos_token}"
-
-        return [text]  # Must return list as required by Unsloth
-
-    return formatting_func
+    return _create_formatter("text-generation", eos_token)
 
 
 def create_summarization_formatter(eos_token: str) -> Callable:
@@ -49,16 +56,7 @@ def create_summarization_formatter(eos_token: str) -> Callable:
     Returns:
         Formatting function that returns a list of formatted strings
     """
-    def formatting_func(example: dict) -> List[str]:
-        input_text = example.get("input", "")
-        output_text = example.get("output", "")
-
-        # Format as document -> summary with EOS token
-        text = f"Summarize the following document:\n{input_text}\n\nSummary:\n{output_text}{eos_token}"
-
-        return [text]
-
-    return formatting_func
+    return _create_formatter("summarization", eos_token)
 
 
 def create_qa_formatter(eos_token: str) -> Callable:
@@ -76,23 +74,7 @@ def create_qa_formatter(eos_token: str) -> Callable:
     Returns:
         Formatting function that returns a list of formatted strings
     """
-    def formatting_func(example: dict) -> List[str]:
-        context = example.get("context", "")
-        question = example.get("question", "")
-        answers = example.get("answers", {})
-
-        # Extract answer text (handle both dict and string formats)
-        if isinstance(answers, dict):
-            answer_text = answers.get("text", [""])[0] if "text" in answers else ""
-        else:
-            answer_text = str(answers)
-
-        # Format as context + question -> answer with EOS token
-        text = f"Context: {context}\n\nQuestion: {question}\n\nAnswer: {answer_text}{eos_token}"
-
-        return [text]
-
-    return formatting_func
+    return _create_formatter("extractive-question-answering", eos_token)
 
 
 def get_formatting_func(task: str, eos_token: str) -> Callable:
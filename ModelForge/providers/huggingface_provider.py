@@ -3,6 +3,7 @@ HuggingFace provider implementation.
 Handles model loading from HuggingFace Hub.
 """
 from typing import Any, Dict, Optional
+import torch
 from transformers import (
     AutoModelForCausalLM,
     AutoModelForSeq2SeqLM,
@@ -12,6 +13,8 @@ from transformers import (
 from huggingface_hub import errors as hf_errors
 
 from ..exceptions import ModelAccessError, ProviderError
+from ..utilities.hub_cache import get_hub_cache
+from ..utilities.model_registry import is_offline_mode, resolve_model_path
 from ..logging_config import logger
 
 
@@ -40,7 +43,7 @@ class HuggingFaceProvider:
             model_id: HuggingFace model identifier
             model_class: Model class name
             quantization_config: Optional BitsAndBytesConfig
-            device_map: Optional device mapping
+            device_map: Optional device mapping (default: the first GPU, or the CPU without one)
             **kwargs: Additional arguments
 
         Returns:
@@ -59,19 +62,23 @@ class HuggingFaceProvider:
             )
 
         model_cls = self.model_class_mapping[model_class]
+        model_path = self._resolve_model_path(model_id)
 
         try:
             load_kwargs = {
-                "device_map": device_map or {"": 0},
+                "device_map": device_map or {"": 0 if torch.cuda.is_available() else "cpu"},
                 "use_cache": False,
             }
 
+            if is_offline_mode():
+                load_kwargs["local_files_only"] = True
+
             if quantization_config is not None:
                 load_kwargs["quantization_config"] = quantization_config
 
             load_kwargs.update(kwargs)
 
-            model = model_cls.from_pretrained(model_id, **load_kwargs)
+            model = model_cls.from_pretrained(model_path, **load_kwargs)
             logger.info(f"Successfully loaded model {model_id}")
             return model
 
@@ -109,11 +116,13 @@ class HuggingFaceProvider:
             ProviderError: If tokenizer loading fails
         """
         logger.info(f"Loading tokenizer for {model_id}")
+        model_path = self._resolve_model_path(model_id)
 
         try:
             tokenizer = AutoTokenizer.from_pretrained(
-                model_id,
-                trust_remote_code=kwargs.get("trust_remote_code", True)
+                model_path,
+                trust_remote_code=kwargs.get("trust_remote_code", True),
+                local_files_only=is_offline_mode(),
             )
 
             # Configure tokenizer for training
@@ -147,22 +156,47 @@ class HuggingFaceProvider:
             logger.error(f"Unsupported model class: {model_class}")
             return False
 
+        # Existence and gated status come from the shared Hub metadata cache,
+        # so repeated validation does not hit the network
         try:
-            model_cls = self.model_class_mapping[model_class]
-            # Try to load config only (lightweight check)
-            from transformers import AutoConfig
-            AutoConfig.from_pretrained(model_id)
-            logger.info(f"Model {model_id} is accessible")
-            return True
-
-        except hf_errors.GatedRepoError:
+            entry = get_hub_cache().lookup(model_id)
+        except Exception as e:
+            logger.error(f"Model {model_id} validation failed: {e}")
+            return False
+
+        if entry.get("is_gated") and not entry.get("accessible"):
             logger.error(f"Model {model_id} is gated - access denied")
             return False
 
-        except Exception as e:
-            logger.error(f"Model {model_id} validation failed: {e}")
+        if not entry.get("exists"):
+            logger.error(f"Model {model_id} validation failed: {entry.get('error')}")
             return False
 
+        logger.info(f"Model {model_id} is accessible")
+        return True
+
+    def _resolve_model_path(self, model_id: str) -> str:
+        """
+        Resolve a model identifier through the local model registry.
+
+        Args:
+            model_id: HuggingFace model identifier or local path
+
+        Returns:
+            Local directory if the model is available locally, otherwise model_id
+
+        Raises:
+            ProviderError: In offline mode, if the model is not available locally
+        """
+        try:
+            model_path = resolve_model_path(model_id)
+        except FileNotFoundError as e:
+            raise ProviderError(str(e)) from e
+
+        if model_path != model_id:
+            logger.info(f"Using local copy of {model_id}: {model_path}")
+        return model_path
+
     def get_provider_name(self) -> str:
         """Get the provider name."""
         return "huggingface"
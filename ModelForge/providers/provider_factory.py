@@ -1,10 +1,9 @@
 """
 Provider factory for creating model provider instances.
 """
-from typing import Optional
+import importlib
+from typing import Union
 
-from .huggingface_provider import HuggingFaceProvider
-from .unsloth_provider import UnslothProvider
 from ..exceptions import ConfigurationError
 from ..logging_config import logger
 
@@ -12,11 +11,32 @@ from ..logging_config import logger
 class ProviderFactory:
     """Factory for creating model provider instances."""
 
+    # Providers are registered as "module:Class" import paths and resolved on
+    # first use, so importing the factory does not pull in transformers/torch.
     _providers = {
-        "huggingface": HuggingFaceProvider,
-        "unsloth": UnslothProvider,
+        "huggingface": ".huggingface_provider:HuggingFaceProvider",
+        "unsloth": ".unsloth_provider:UnslothProvider",
     }
 
+    @classmethod
+    def _resolve_provider_class(cls, provider_name: str):
+        """
+        Resolve a registered provider to its class, importing it if needed.
+
+        Args:
+            provider_name: Registered provider name
+
+        Returns:
+            Provider class
+        """
+        provider_class = cls._providers[provider_name]
+        if isinstance(provider_class, str):
+            module_path, class_name = provider_class.split(":")
+            module = importlib.import_module(module_path, package=__package__)
+            provider_class = getattr(module, class_name)
+            cls._providers[provider_name] = provider_class
+        return provider_class
+
     @classmethod
     def create_provider(cls, provider_name: str = "huggingface"):
         """
@@ -41,7 +61,7 @@ class ProviderFactory:
                 f"Available providers: {list(cls._providers.keys())}"
             )
 
-        provider_class = cls._providers[provider_name]
+        provider_class = cls._resolve_provider_class(provider_name)
         return provider_class()
 
     @classmethod
@@ -55,13 +75,14 @@ class ProviderFactory:
         return list(cls._providers.keys())
 
     @classmethod
-    def register_provider(cls, name: str, provider_class):
+    def register_provider(cls, name: str, provider_class: Union[type, str]):
         """
         Register a new provider.
 
         Args:
             name: Provider name
-            provider_class: Provider class
+            provider_class: Provider class, or a "module:Class" import path
+                that is resolved lazily on first use
         """
         logger.info(f"Registering provider: {name}")
         cls._providers[name.lower()] = provider_class
@@ -5,6 +5,8 @@ Provides optimized model loading for faster fine-tuning.
 from typing import Any, Dict, Optional, Tuple
 
 from ..exceptions import ProviderError
+from ..utilities.hub_cache import get_hub_cache
+from ..utilities.model_registry import is_offline_mode, resolve_model_path
 from ..logging_config import logger
 
 
@@ -63,6 +65,11 @@ class UnslothProvider:
                 "Unsloth is not installed. Install with: pip install unsloth"
             ) from e
 
+        try:
+            model_path = resolve_model_path(model_id)
+        except FileNotFoundError as e:
+            raise ProviderError(str(e)) from e
+
         try:
             # Extract quantization settings
             load_in_4bit = False
@@ -76,7 +83,7 @@ class UnslothProvider:
                     load_in_4bit = False  # Unsloth primarily uses 4-bit
 
             model, tokenizer = FastLanguageModel.from_pretrained(
-                model_name=model_id,
+                model_name=model_path,
                 max_seq_length=max_seq_length,
                 dtype=dtype,  # Auto-detect
                 load_in_4bit=load_in_4bit,
@@ -118,7 +125,12 @@ class UnslothProvider:
 
         # Fallback to standard loading
         from transformers import AutoTokenizer
-        return AutoTokenizer.from_pretrained(model_id, **kwargs)
+        try:
+            model_path = resolve_model_path(model_id)
+        except FileNotFoundError as e:
+            raise ProviderError(str(e)) from e
+        kwargs.setdefault("local_files_only", is_offline_mode())
+        return AutoTokenizer.from_pretrained(model_path, **kwargs)
 
     def prepare_for_training(
         self,
@@ -189,19 +201,20 @@ class UnslothProvider:
         Returns:
             True if model is accessible
         """
-        # Unsloth uses HuggingFace Hub, so same validation applies
+        # Unsloth uses HuggingFace Hub, so the shared metadata cache applies
         logger.info(f"Validating access to model {model_id}")
 
         try:
-            from transformers import AutoConfig
-            AutoConfig.from_pretrained(model_id)
-            logger.info(f"Model {model_id} is accessible")
-            return True
-
+            if get_hub_cache().is_accessible(model_id):
+                logger.info(f"Model {model_id} is accessible")
+                return True
         except Exception as e:
             logger.error(f"Model {model_id} validation failed: {e}")
             return False
 
+        logger.error(f"Model {model_id} validation failed")
+        return False
+
     def get_provider_name(self) -> str:
         """Get the provider name."""
         return "unsloth"
@@ -3,8 +3,10 @@ Refactored fine-tuning router.
 Slim router that delegates to services for business logic.
 """
 import os
-import uuid
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks, Depends
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from starlette.responses import JSONResponse
 
 from ..schemas.training_schemas import (
@@ -14,24 +16,32 @@ from ..schemas.training_schemas import (
     ModelValidation,
     TrainingStatus,
     TrainingResult,
+    UploadSessionRequest,
+    DedupRequest,
+    DatasetProfileRequest,
 )
 from ..services.training_service import TrainingService
 from ..services.model_service import ModelService
 from ..services.hardware_service import HardwareService
-from ..utilities.settings_managers.FileManager import FileManager
+from ..services.dataset_upload_service import DatasetUploadService, UploadSession, UPLOAD_CHUNK_SIZE
+from ..services.dataset_store import DatasetStore
 from ..dependencies import (
     get_training_service,
     get_model_service,
     get_hardware_service,
-    get_file_manager,
+    get_upload_service,
+    get_dataset_store,
     get_session_data,
     update_session_data,
 )
+from ..utilities.model_registry import is_offline_mode, get_model_registry
+from ..utilities.token_profile import DEFAULT_SAMPLE_SIZE
 from ..exceptions import (
     ModelAccessError,
     DatasetValidationError,
     TrainingError,
     ConfigurationError,
+    ProviderError,
 )
 from ..logging_config import logger
 
@@ -171,6 +181,26 @@ async def detect_hardware(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/local_models")
+async def get_local_models():
+    """
+    List base models available on local disk.
+
+    In offline mode these are the only models that can be trained.
+
+    Returns:
+        Offline flag and locally available model names
+    """
+    registry = get_model_registry()
+    registry.refresh()
+
+    return {
+        "success": True,
+        "offline": is_offline_mode(),
+        "models": registry.list_models(),
+    }
+
+
 @router.post("/set_model")
 async def set_model(data: ModelSelection):
     """
@@ -277,16 +307,32 @@ async def get_session():
 
 @router.get("/load_settings")
 async def get_default_settings(
+    dataset: Optional[str] = Query(None),
+    strategy: str = Query("sft"),
+    prompt_format: str = Query("plain"),
+    system_prompt: Optional[str] = Query(None),
+    sample_size: int = Query(DEFAULT_SAMPLE_SIZE, gt=0),
     hardware_service: HardwareService = Depends(get_hardware_service),
+    training_service: TrainingService = Depends(get_training_service),
 ):
     """
     Get default training settings based on hardware profile.
 
     Returns hardware-appropriate default training configuration including
     batch size, learning rate, sequence length, and other training parameters.
+    If the dataset was profiled with the selected model (POST /profile),
+    max_seq_length is the profile's recommendation, capped at the hardware
+    default.
 
     Args:
+        dataset: Optional dataset path to use the token length profile of
+        strategy: Training strategy the dataset was profiled for
+        prompt_format: Prompt format the dataset was profiled with
+        system_prompt: System message the dataset was profiled with
+        sample_size: Rows sampled when profiling (a profile over every row
+            is always used if one exists)
         hardware_service: Hardware service instance
+        training_service: Training service instance
 
     Returns:
         Default training settings dictionary
@@ -359,6 +405,26 @@ async def get_default_settings(
             "default_values": settings,
         }
 
+        if dataset and selected_model and selected_task and os.path.isfile(dataset):
+            profile = await run_in_threadpool(
+                training_service.get_cached_profile,
+                dataset,
+                selected_model,
+                selected_task,
+                strategy,
+                prompt_format,
+                system_prompt,
+                sample_size,
+            )
+            if profile is not None:
+                settings = dict(settings)
+                settings["max_seq_length"] = min(profile["recommended_max_seq_length"], settings["max_seq_length"])
+                response["default_values"] = settings
+                response["token_profile"] = {
+                    "lengths": profile["lengths"],
+                    "recommended_max_seq_length": profile["recommended_max_seq_length"],
+                }
+
         logger.info(f"Returning default settings for {compute_profile} profile")
         return response
 
@@ -371,55 +437,344 @@ async def get_default_settings(
 async def load_settings(
     json_file: UploadFile = File(...),
     settings: str = Form(...),
-    file_manager: FileManager = Depends(get_file_manager),
+    upload_service: DatasetUploadService = Depends(get_upload_service),
 ):
     """
     Upload dataset file.
 
+    The file is streamed to disk in chunks while it is hashed and, for JSONL,
+    validated line by line. Identical datasets are stored once.
+
     Args:
         json_file: Dataset file (JSON/JSONL)
         settings: JSON string with settings
-        file_manager: File manager instance
+        upload_service: Dataset upload service instance
 
     Returns:
         Upload result with file path
 
     Raises:
-        HTTPException: If file upload fails
+        HTTPException: If the file is invalid or the upload fails
     """
     logger.info(f"Uploading dataset: {json_file.filename}")
 
+    session = None
     try:
-        # Validate file type
-        if not json_file.filename.endswith(('.json', '.jsonl')):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Only JSON and JSONL files are allowed."
-            )
+        session = upload_service.start_stream(json_file.filename)
+        while chunk := await json_file.read(UPLOAD_CHUNK_SIZE):
+            await run_in_threadpool(session.write, chunk)
+        result = await run_in_threadpool(upload_service.finish_stream, session)
+        return _upload_response(result)
+
+    except DatasetValidationError as e:
+        logger.error(f"Invalid dataset upload: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
 
-        # Read file content
-        file_content = await json_file.read()
+    except Exception as e:
+        logger.error(f"Error uploading dataset: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Generate unique filename
-        file_id = str(uuid.uuid4())
-        filename = f"{file_id}_{json_file.filename}"
+    finally:
+        if session is not None:
+            session.remove()
 
-        # Save file
-        default_dirs = file_manager.return_default_dirs()
-        file_path = os.path.join(default_dirs["datasets"], filename)
-        file_manager.save_file(file_path, file_content)
 
-        logger.info(f"Dataset uploaded successfully: {file_path}")
+def _upload_response(result: dict) -> dict:
+    """Build the response for a stored dataset."""
+    message = "Dataset already uploaded" if result["deduplicated"] else "Dataset uploaded successfully"
+    return {"success": True, "message": message, **result}
 
-        return {
-            "success": True,
-            "file_path": file_path,
-            "filename": filename,
-            "message": "Dataset uploaded successfully",
-        }
 
+def _get_upload(upload_service: DatasetUploadService, upload_id: str) -> UploadSession:
+    """Get an upload session or raise a 404."""
+    try:
+        session = upload_service.get_session(upload_id)
+    except DatasetValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if session is None:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return session
+
+
+@router.post("/uploads")
+async def create_upload(
+    data: UploadSessionRequest,
+    upload_service: DatasetUploadService = Depends(get_upload_service),
+):
+    """
+    Start a resumable chunked dataset upload.
+
+    If sha256 is given and a dataset with that content is already stored,
+    the stored dataset is returned and nothing needs to be uploaded.
+
+    Args:
+        data: File name, optional total size and content hash
+        upload_service: Dataset upload service instance
+
+    Returns:
+        Upload session (upload_id, offset), or the stored dataset with
+        completed set
+
+    Raises:
+        HTTPException: If the file type is not supported
+    """
+    if data.sha256:
+        existing = await run_in_threadpool(upload_service.add_existing, data.sha256)
+        if existing:
+            logger.info(f"Dataset already stored, skipping upload: {existing['file_path']}")
+            return {"completed": True, **_upload_response(existing)}
+
+    try:
+        session = await run_in_threadpool(upload_service.create_session, data.filename, data.total_size)
+        return {"success": True, "completed": False, **session}
+    except DatasetValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/uploads/{upload_id}")
+async def get_upload(
+    upload_id: str,
+    upload_service: DatasetUploadService = Depends(get_upload_service),
+):
+    """
+    Get the state of an upload, to resume it from the returned offset.
+
+    Args:
+        upload_id: Upload identifier
+        upload_service: Dataset upload service instance
+
+    Returns:
+        Upload session with the number of bytes received (offset)
+    """
+    session = await run_in_threadpool(_get_upload, upload_service, upload_id)
+    return session.to_dict()
+
+
+@router.put("/uploads/{upload_id}")
+async def upload_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0),
+    upload_service: DatasetUploadService = Depends(get_upload_service),
+):
+    """
+    Append the raw request body to an upload.
+
+    The body is written as it arrives. If the connection drops, the bytes
+    received so far are kept; GET the upload for the offset to resume from.
+
+    Args:
+        upload_id: Upload identifier
+        request: Request whose body is the chunk
+        offset: Byte offset of the chunk in the file
+        upload_service: Dataset upload service instance
+
+    Returns:
+        Upload session with the new offset
+
+    Raises:
+        HTTPException: 409 if the offset does not match the bytes received,
+            400 if the chunk contains an invalid line (the upload is discarded)
+    """
+    session = await run_in_threadpool(_get_upload, upload_service, upload_id)
+
+    position = offset
+    state = session.to_dict()
+    try:
+        async for piece in request.stream():
+            if piece:
+                state = await run_in_threadpool(upload_service.write_chunk, session, position, piece)
+                position += len(piece)
+        return state
+
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    except DatasetValidationError as e:
+        logger.error(f"Invalid dataset upload {upload_id}: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/uploads/{upload_id}/complete")
+async def complete_upload(
+    upload_id: str,
+    upload_service: DatasetUploadService = Depends(get_upload_service),
+):
+    """
+    Finish an upload and store the dataset.
+
+    Args:
+        upload_id: Upload identifier
+        upload_service: Dataset upload service instance
+
+    Returns:
+        Upload result with file path, content hash and record count
+
+    Raises:
+        HTTPException: If the upload is incomplete or the dataset is invalid
+    """
+    session = await run_in_threadpool(_get_upload, upload_service, upload_id)
+    try:
+        result = await run_in_threadpool(upload_service.complete_session, session)
+        return _upload_response(result)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except DatasetValidationError as e:
+        logger.error(f"Invalid dataset upload {upload_id}: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.delete("/uploads/{upload_id}")
+async def cancel_upload(
+    upload_id: str,
+    upload_service: DatasetUploadService = Depends(get_upload_service),
+):
+    """
+    Cancel an upload and delete the received data.
+
+    Args:
+        upload_id: Upload identifier
+        upload_service: Dataset upload service instance
+
+    Returns:
+        Success confirmation
+    """
+    session = await run_in_threadpool(_get_upload, upload_service, upload_id)
+    await run_in_threadpool(upload_service.discard_session, session)
+    return {"success": True, "message": "Upload cancelled"}
+
+
+@router.get("/datasets")
+async def list_datasets(dataset_store: DatasetStore = Depends(get_dataset_store)):
+    """
+    List stored datasets.
+
+    Args:
+        dataset_store: Dataset store instance
+
+    Returns:
+        Stored datasets with content hash, size and reference count
+    """
+    datasets = await run_in_threadpool(dataset_store.list)
+    return {"datasets": datasets, "count": len(datasets)}
+
+
+@router.delete("/datasets/{sha256}")
+async def release_dataset(
+    sha256: str,
+    dataset_store: DatasetStore = Depends(get_dataset_store),
+):
+    """
+    Release one reference to a stored dataset.
+
+    The file is deleted once no uploads or running jobs reference it.
+
+    Args:
+        sha256: Content hash
+        dataset_store: Dataset store instance
+
+    Returns:
+        Remaining reference count
+
+    Raises:
+        HTTPException: If the dataset is not stored
+    """
+    dataset = await run_in_threadpool(dataset_store.release, sha256.lower())
+    if dataset is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    return {
+        "success": True,
+        "sha256": dataset["sha256"],
+        "refcount": max(dataset["refcount"], 0),
+        "deleted": dataset["refcount"] <= 0,
+    }
+
+
+@router.post("/profile")
+async def profile_dataset(
+    data: DatasetProfileRequest,
+    training_service: TrainingService = Depends(get_training_service),
+):
+    """
+    Profile a dataset's token lengths with the model's tokenizer.
+
+    The result is cached by dataset content and tokenizer.
+
+    Args:
+        data: Dataset path, model, task and formatting settings
+        training_service: Training service instance
+
+    Returns:
+        Length percentiles and histogram, truncation rate and padding waste
+        per candidate max_seq_length, and the recommended max_seq_length
+
+    Raises:
+        HTTPException: If the dataset is missing or invalid, or no model or
+            task is given or selected
+    """
+    model_name = data.model_name or get_session_data("selected_model")
+    task = data.task or get_session_data("task")
+    if not model_name or not task:
+        raise HTTPException(status_code=400, detail="Select a model and task, or pass model_name and task")
+    if not os.path.isfile(data.dataset):
+        raise HTTPException(status_code=404, detail="Dataset not found")
+
+    try:
+        profile = await run_in_threadpool(
+            training_service.profile_dataset,
+            data.dataset,
+            model_name,
+            task,
+            data.strategy,
+            data.provider,
+            data.prompt_format,
+            data.system_prompt,
+            data.sample_size,
+        )
+        return {"success": True, **profile}
+    except (DatasetValidationError, ProviderError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error uploading dataset: {e}")
+        logger.error(f"Error profiling dataset: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/dedup")
+async def deduplicate_dataset(
+    data: DedupRequest,
+    training_service: TrainingService = Depends(get_training_service),
+):
+    """
+    Find exact and near-duplicate examples in a dataset.
+
+    The result is cached, so training with the same dedup settings reuses it.
+
+    Args:
+        data: Dataset path, task, strategy and dedup settings
+        training_service: Training service instance
+
+    Returns:
+        Deduplication statistics
+
+    Raises:
+        HTTPException: If the dataset is missing or invalid
+    """
+    if not os.path.isfile(data.dataset):
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    try:
+        _, stats = await run_in_threadpool(
+            training_service.deduplicate_dataset,
+            data.dataset,
+            data.task,
+            data.strategy,
+            data.dedup,
+            data.dedup_threshold,
+        )
+        return {"success": True, **stats}
+    except DatasetValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error deduplicating dataset: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
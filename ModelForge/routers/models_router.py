@@ -2,18 +2,109 @@
 Refactored models router.
 Handles model listing and retrieval operations.
 """
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict, Any
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse
+from typing import List, Dict, Any, Literal, Optional
 from pydantic import BaseModel
 
+from ..database.queries import SORTABLE_FIELDS
 from ..services.model_service import ModelService
 from ..dependencies import get_model_service
 from ..logging_config import logger
 
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
 class ModelsResponse(BaseModel):
-    """Response model for list of models."""
+    """Response model for a page of models."""
     models: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+def model_list_params(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    task: Optional[str] = None,
+    strategy: Optional[str] = None,
+    provider: Optional[str] = None,
+    base_model: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    sort_by: str = Query("created_at", description=f"One of {SORTABLE_FIELDS}"),
+    order: Literal["asc", "desc"] = "desc",
+    include_config: bool = False,
+) -> Dict[str, Any]:
+    """Query parameters shared by the model listing endpoints."""
+    return {
+        "limit": limit,
+        "cursor": cursor,
+        "task": task,
+        "strategy": strategy,
+        "provider": provider,
+        "base_model": base_model,
+        "created_after": created_after,
+        "created_before": created_before,
+        "sort_by": sort_by,
+        "descending": order == "desc",
+        "include_config": include_config,
+    }
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check If-None-Match against an ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag.removeprefix("W/") for tag in tags)
+
+
+async def _list_models(
+    request: Request,
+    model_service: ModelService,
+    params: Dict[str, Any],
+    legacy_names: bool = False,
+) -> Response:
+    """
+    Build a page of models, or 304 Not Modified if the client's copy is current.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        model_service: Model service instance
+        params: Listing parameters from model_list_params
+        legacy_names: Also return name/path as model_name/model_path
+
+    Returns:
+        JSON response with an ETag header
+
+    Raises:
+        HTTPException: If the parameters are invalid or listing fails
+    """
+    try:
+        etag = await model_service.get_models_etag_async(sorted(params.items()), legacy_names)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        models, next_cursor = await model_service.list_models_async(**params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching models: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if legacy_names:
+        for model in models:
+            model["model_name"] = model["name"]
+            model["model_path"] = model["path"]
+
+    body = ModelsResponse(models=models, next_cursor=next_cursor)
+    return JSONResponse(
+        content=body.model_dump(),
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
 
 
 router = APIRouter(prefix="/models")
@@ -21,60 +112,51 @@ router = APIRouter(prefix="/models")
 
 @router.get("/all", response_model=ModelsResponse)
 async def get_all_models_legacy(
+    request: Request,
+    params: Dict[str, Any] = Depends(model_list_params),
     model_service: ModelService = Depends(get_model_service),
 ):
     """
-    Get all fine-tuned models (legacy endpoint for backward compatibility).
+    Get a page of fine-tuned models (legacy endpoint for backward compatibility).
+
+    Same as GET /models/, but each model also carries the legacy
+    model_name/model_path fields.
 
     Args:
+        request: Incoming request
+        params: Pagination, filter and sort parameters
         model_service: Model service instance
 
     Returns:
-        Dictionary with models list
+        Dictionary with models list and next page cursor
     """
-    logger.info("Fetching all models (legacy endpoint)")
-    try:
-        models = model_service.get_all_models()
-        # Transform field names to match frontend expectations
-        transformed_models = []
-        for model in models:
-            transformed_model = model.copy()
-            transformed_model["model_name"] = model["name"]
-            transformed_model["model_path"] = model["path"]
-            transformed_models.append(transformed_model)
-        return ModelsResponse(models=transformed_models)
-    except Exception as e:
-        logger.error(f"Error fetching models: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Fetching models (legacy endpoint)")
+    return await _list_models(request, model_service, params, legacy_names=True)
 
 
 @router.get("/", response_model=ModelsResponse)
 async def get_all_models(
+    request: Request,
+    params: Dict[str, Any] = Depends(model_list_params),
     model_service: ModelService = Depends(get_model_service),
 ):
     """
-    Get all fine-tuned models.
+    Get a page of fine-tuned models.
+
+    Pass the returned next_cursor as `cursor` to fetch the next page; it is
+    null on the last page. Responses carry an ETag that changes whenever any
+    model changes; send it back in If-None-Match to get 304 Not Modified.
 
     Args:
+        request: Incoming request
+        params: Pagination, filter and sort parameters
         model_service: Model service instance
 
     Returns:
-        Dictionary with models list
+        Dictionary with models list and next page cursor
     """
-    logger.info("Fetching all models")
-    try:
-        models = model_service.get_all_models()
-        # Transform field names to match frontend expectations
-        transformed_models = []
-        for model in models:
-            transformed_model = model.copy()
-            transformed_model["model_name"] = model["name"]
-            transformed_model["model_path"] = model["path"]
-            transformed_models.append(transformed_model)
-        return ModelsResponse(models=transformed_models)
-    except Exception as e:
-        logger.error(f"Error fetching models: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Fetching models")
+    return await _list_models(request, model_service, params)
 
 
 @router.get("/{model_id}")
@@ -97,7 +179,7 @@ async def get_model(
     """
     logger.info(f"Fetching model: {model_id}")
     try:
-        model = model_service.get_model_by_id(model_id)
+        model = await model_service.get_model_by_id_async(model_id)
         if model is None:
             raise HTTPException(status_code=404, detail="Model not found")
         return model
@@ -108,28 +190,27 @@ async def get_model(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/task/{task}")
+@router.get("/task/{task}", response_model=ModelsResponse)
 async def get_models_by_task(
     task: str,
+    request: Request,
+    params: Dict[str, Any] = Depends(model_list_params),
     model_service: ModelService = Depends(get_model_service),
 ):
     """
-    Get all models for a specific task.
+    Get a page of models for a specific task.
 
     Args:
         task: Task type
+        request: Incoming request
+        params: Pagination, filter and sort parameters
         model_service: Model service instance
 
     Returns:
-        List of models for the task
+        Dictionary with models list and next page cursor
     """
     logger.info(f"Fetching models for task: {task}")
-    try:
-        models = model_service.get_models_by_task(task)
-        return models
-    except Exception as e:
-        logger.error(f"Error fetching models by task: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _list_models(request, model_service, {**params, "task": task})
 
 
 @router.delete("/{model_id}")
@@ -152,7 +233,7 @@ async def delete_model(
     """
     logger.info(f"Deleting model: {model_id}")
     try:
-        success = model_service.delete_model(model_id)
+        success = await model_service.delete_model_async(model_id)
         if not success:
             raise HTTPException(status_code=404, detail="Model not found")
 
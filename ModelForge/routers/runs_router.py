@@ -0,0 +1,145 @@
+"""
+Training run history router.
+Handles run listing and metric curve queries.
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional
+
+from ..services.run_service import RunService, DEFAULT_CURVE_POINTS
+from ..dependencies import get_run_service
+from ..logging_config import logger
+
+
+MAX_CURVE_POINTS = 5000
+MAX_COMPARED_RUNS = 500
+
+
+def _split(values: Optional[str]) -> Optional[list]:
+    """Split a comma-separated query parameter."""
+    if not values:
+        return None
+    return [value.strip() for value in values.split(",") if value.strip()]
+
+
+router = APIRouter(prefix="/runs")
+
+
+@router.get("/")
+async def list_runs(
+    limit: int = Query(50, ge=1, le=500),
+    status: Optional[str] = None,
+    model_id: Optional[str] = None,
+    include_config: bool = False,
+    run_service: RunService = Depends(get_run_service),
+):
+    """
+    List the most recent training runs.
+
+    Args:
+        limit: Maximum number of runs
+        status: Filter by status (running, completed, failed, pruned)
+        model_id: Filter by the model a run produced
+        include_config: Include each run's training config
+        run_service: Run service instance
+
+    Returns:
+        Dictionary with runs list, newest first
+    """
+    try:
+        runs = await run_in_threadpool(
+            run_service.list_runs,
+            limit=limit,
+            status=status,
+            model_id=model_id,
+            include_config=include_config,
+        )
+        return {"runs": runs}
+    except Exception as e:
+        logger.error(f"Error listing runs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/curves")
+async def compare_curves(
+    run_ids: str = Query(..., description="Comma-separated run IDs"),
+    metrics: str = Query("loss", description="Comma-separated metric names"),
+    points: int = Query(DEFAULT_CURVE_POINTS, ge=2, le=MAX_CURVE_POINTS),
+    run_service: RunService = Depends(get_run_service),
+):
+    """
+    Get downsampled metric curves of several runs for comparison.
+
+    Args:
+        run_ids: Comma-separated run IDs
+        metrics: Comma-separated metric names (e.g. "loss,eval_loss")
+        points: Maximum points per curve
+        run_service: Run service instance
+
+    Returns:
+        Dictionary mapping run ID to metric name to curve
+    """
+    ids = _split(run_ids) or []
+    if len(ids) > MAX_COMPARED_RUNS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_COMPARED_RUNS} runs can be compared")
+    try:
+        curves = await run_in_threadpool(run_service.get_metric_curves, ids, _split(metrics), points)
+        return {"points": points, "runs": curves}
+    except Exception as e:
+        logger.error(f"Error fetching run curves: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{run_id}")
+async def get_run(
+    run_id: str,
+    run_service: RunService = Depends(get_run_service),
+):
+    """
+    Get a training run.
+
+    Args:
+        run_id: Run identifier
+        run_service: Run service instance
+
+    Returns:
+        Run details, including its summary and error if it failed
+
+    Raises:
+        HTTPException: If the run is not found
+    """
+    try:
+        run = await run_in_threadpool(run_service.get_run, run_id)
+    except Exception as e:
+        logger.error(f"Error fetching run: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return run
+
+
+@router.get("/{run_id}/metrics")
+async def get_run_metrics(
+    run_id: str,
+    metrics: Optional[str] = Query(None, description="Comma-separated metric names (default: all)"),
+    points: int = Query(DEFAULT_CURVE_POINTS, ge=2, le=MAX_CURVE_POINTS),
+    run_service: RunService = Depends(get_run_service),
+):
+    """
+    Get the downsampled metric curves of a run.
+
+    Args:
+        run_id: Run identifier
+        metrics: Comma-separated metric names (default: all recorded metrics)
+        points: Maximum points per curve
+        run_service: Run service instance
+
+    Returns:
+        Dictionary mapping metric name to curve
+    """
+    try:
+        curves = await run_in_threadpool(run_service.get_metric_curves, [run_id], _split(metrics), points)
+        return {"run_id": run_id, "points": points, "metrics": curves[run_id]}
+    except Exception as e:
+        logger.error(f"Error fetching run metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
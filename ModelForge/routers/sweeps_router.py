@@ -0,0 +1,177 @@
+"""
+Hyperparameter sweep router.
+Handles starting, listing and cancelling sweeps.
+"""
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+
+from ..schemas.training_schemas import SweepRequest, TrainingConfig
+from ..services.sweep_service import SweepService, sample_trials
+from ..services.training_service import TrainingService
+from ..dependencies import get_sweep_service, get_training_service
+from ..exceptions import DatasetValidationError, ConfigurationError
+from ..logging_config import logger
+
+
+router = APIRouter(prefix="/sweeps")
+
+
+@router.post("/")
+async def start_sweep(
+    request: SweepRequest,
+    background_tasks: BackgroundTasks,
+    sweep_service: SweepService = Depends(get_sweep_service),
+    training_service: TrainingService = Depends(get_training_service),
+):
+    """
+    Sample a sweep's trials and start training them.
+
+    Args:
+        request: Base config, search space and scheduler settings
+        background_tasks: FastAPI background tasks
+        sweep_service: Sweep service instance
+        training_service: Training service instance
+
+    Returns:
+        The new sweep and its number of trials
+
+    Raises:
+        HTTPException: If the dataset, search space or a sampled trial is invalid
+    """
+    config = request.config
+    logger.info(f"Starting sweep: {config.task} with {config.strategy} over {list(request.search_space)}")
+
+    try:
+        dataset_info = training_service.validate_and_prepare_dataset(
+            dataset_path=config.dataset,
+            task=config.task,
+            strategy=config.strategy,
+        )
+
+        base_config = config.model_dump()
+        search_space = {field: dimension.model_dump(exclude_none=True) for field, dimension in request.search_space.items()}
+        trials = sample_trials(search_space, request.num_trials, request.method, request.seed)
+
+        # Every trial must be a valid training config; values are coerced to the field types
+        validated = []
+        for params in trials:
+            trial_config = TrainingConfig(**{**base_config, **params}).model_dump()
+            validated.append({field: trial_config[field] for field in params})
+
+        sweep = sweep_service.create_sweep(
+            config=base_config,
+            trials=validated,
+            search_space=search_space,
+            method=request.method,
+            metric=request.metric,
+            direction=request.direction,
+            eta=request.eta,
+            min_steps=request.min_steps,
+            workers=request.workers,
+            devices=request.devices,
+            name=request.name,
+        )
+        background_tasks.add_task(sweep_service.run_sweep, sweep["id"])
+
+        return {
+            "success": True,
+            "message": f"Sweep started with {len(validated)} trials",
+            "sweep": sweep,
+            "num_trials": len(validated),
+            "dataset_info": dataset_info,
+        }
+
+    except (DatasetValidationError, ConfigurationError) as e:
+        logger.error(f"Invalid sweep: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except ValidationError as e:
+        logger.error(f"Invalid sweep trial: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid trial config: {e}")
+
+    except Exception as e:
+        logger.error(f"Error starting sweep: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/")
+async def list_sweeps(
+    limit: int = Query(50, ge=1, le=500),
+    sweep_service: SweepService = Depends(get_sweep_service),
+):
+    """
+    List the most recent sweeps.
+
+    Args:
+        limit: Maximum number of sweeps
+        sweep_service: Sweep service instance
+
+    Returns:
+        Dictionary with sweeps list and their trial counts per status, newest first
+    """
+    try:
+        sweeps = await run_in_threadpool(sweep_service.list_sweeps, limit=limit)
+        return {"sweeps": sweeps}
+    except Exception as e:
+        logger.error(f"Error listing sweeps: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{sweep_id}")
+async def get_sweep(
+    sweep_id: str,
+    sweep_service: SweepService = Depends(get_sweep_service),
+):
+    """
+    Get a sweep with its trials.
+
+    Args:
+        sweep_id: Sweep identifier
+        sweep_service: Sweep service instance
+
+    Returns:
+        Sweep details, its best trial and every trial's status, score and run
+
+    Raises:
+        HTTPException: If the sweep is not found
+    """
+    try:
+        sweep = await run_in_threadpool(sweep_service.get_sweep, sweep_id)
+    except Exception as e:
+        logger.error(f"Error fetching sweep: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if sweep is None:
+        raise HTTPException(status_code=404, detail="Sweep not found")
+    return sweep
+
+
+@router.post("/{sweep_id}/cancel")
+async def cancel_sweep(
+    sweep_id: str,
+    sweep_service: SweepService = Depends(get_sweep_service),
+):
+    """
+    Cancel a sweep's pending trials. Running trials finish.
+
+    Args:
+        sweep_id: Sweep identifier
+        sweep_service: Sweep service instance
+
+    Returns:
+        Number of trials cancelled
+
+    Raises:
+        HTTPException: If the sweep is not found
+    """
+    try:
+        sweep = await run_in_threadpool(sweep_service.get_sweep, sweep_id)
+        if sweep is None:
+            raise HTTPException(status_code=404, detail="Sweep not found")
+        cancelled = await run_in_threadpool(sweep_service.cancel_sweep, sweep_id)
+        return {"success": True, "cancelled": cancelled}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error cancelling sweep: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
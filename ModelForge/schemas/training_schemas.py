@@ -3,12 +3,17 @@ Training configuration schemas.
 Pydantic models for training request validation.
 """
 from pydantic import BaseModel, field_validator, Field
-from typing import Optional
+from typing import Any, Dict, List, Optional
+
+from ..utilities.dataset_dedup import DEDUP_MODES, DEFAULT_THRESHOLD
+from ..utilities.token_profile import DEFAULT_SAMPLE_SIZE
 
 
 VALID_TASKS = ["text-generation", "summarization", "extractive-question-answering"]
-VALID_STRATEGIES = ["sft", "rlhf", "dpo", "qlora"]
+VALID_STRATEGIES = ["sft", "rlhf", "dpo", "orpo", "simpo", "qlora"]
 VALID_PROVIDERS = ["huggingface", "unsloth"]
+VALID_PROMPT_FORMATS = ["plain", "chat_template"]
+VALID_SEARCH_TYPES = ["choice", "uniform", "loguniform", "int"]
 
 
 class TrainingConfig(BaseModel):
@@ -53,13 +58,64 @@ class TrainingConfig(BaseModel):
     warmup_ratio: float = 0.03
     group_by_length: bool = True
     packing: bool = False
+    # Compute the loss on completion tokens only (prompt and padding are masked)
+    completion_only_loss: bool = False
+    # "plain" (USER:/ASSISTANT: style) or the base model's "chat_template"
+    prompt_format: str = "plain"
+    system_prompt: Optional[str] = None
+
+    # Keep the quantized base model resident for the next job on the same base
+    cache_base_model: bool = False
+
+    # DPO: compute reference log-probs once before training and cache them per
+    # example, instead of a reference forward pass on every step
+    precompute_ref_logps: bool = True
+    precompute_ref_batch_size: Optional[int] = None
+
+    # Preference loss strength: DPO/SimPO beta, ORPO lambda (None uses the strategy default)
+    beta: Optional[float] = None
+    # SimPO: target reward margin between chosen and rejected
+    simpo_gamma: float = 0.5
+
+    # RLHF: reward model (sequence classification, one label) that scores rollouts,
+    # its device (default: the first GPU, else CPU) and padded tokens per scoring batch
+    reward_model: Optional[str] = None
+    reward_device: Optional[str] = None
+    reward_batch_tokens: Optional[int] = None
+    # RLHF rollouts: prompts per PPO step, prompts per generate() call, sampling and stop strings
+    rollout_batch_size: int = 64
+    generation_batch_size: int = 16
+    max_new_tokens: int = 128
+    temperature: float = 1.0
+    top_p: float = 1.0
+    stop_sequences: Optional[List[str]] = None
+    # RLHF PPO updates: epochs over each rollout batch, mini-batch size and KL penalty
+    ppo_epochs: int = 4
+    mini_batch_size: int = 4
+    kl_coef: float = 0.05
 
     # Sequence settings
     max_seq_length: Optional[int] = None
 
+    # Drop duplicate examples before training: "off", "exact" or "near" (MinHash, Jaccard >= dedup_threshold)
+    dedup: str = "off"
+    dedup_threshold: float = DEFAULT_THRESHOLD
+
     # Evaluation settings
     eval_split: float = 0.2
     eval_steps: int = 100
+    # Periodic evals use a stratified subset of this size; the full split is evaluated at the end
+    eval_max_samples: Optional[int] = None
+    final_full_eval: bool = True
+    # Perplexity/accuracy (ROUGE, EM/F1 by task), accumulated batch by batch
+    compute_eval_metrics: bool = True
+
+    # Early stopping: stop after this many evals without eval_loss improving by more than min_delta
+    early_stopping_patience: Optional[int] = None
+    early_stopping_min_delta: float = 0.0
+    # Divergence detection: stop on NaN/inf loss or gradient norm above the threshold
+    stop_on_nan: bool = True
+    grad_norm_threshold: Optional[float] = None
 
     @field_validator("task")
     @classmethod
@@ -88,6 +144,143 @@ class TrainingConfig(BaseModel):
             )
         return v
 
+    @field_validator("prompt_format")
+    @classmethod
+    def validate_prompt_format(cls, v):
+        if v not in VALID_PROMPT_FORMATS:
+            raise ValueError(
+                f"Invalid prompt format: {v}. Must be one of {VALID_PROMPT_FORMATS}"
+            )
+        return v
+
+    @field_validator("dedup")
+    @classmethod
+    def validate_dedup(cls, v):
+        if v not in DEDUP_MODES:
+            raise ValueError(
+                f"Invalid dedup mode: {v}. Must be one of {DEDUP_MODES}"
+            )
+        return v
+
+    @field_validator("dedup_threshold")
+    @classmethod
+    def validate_dedup_threshold(cls, v):
+        if v <= 0 or v > 1:
+            raise ValueError("dedup_threshold must be between 0 and 1")
+        return v
+
+    @field_validator("precompute_ref_batch_size")
+    @classmethod
+    def validate_precompute_ref_batch_size(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("precompute_ref_batch_size must be at least 1")
+        return v
+
+    @field_validator("beta")
+    @classmethod
+    def validate_beta(cls, v):
+        if v is not None and v <= 0:
+            raise ValueError("beta must be positive")
+        return v
+
+    @field_validator("simpo_gamma")
+    @classmethod
+    def validate_simpo_gamma(cls, v):
+        if v < 0:
+            raise ValueError("simpo_gamma cannot be negative")
+        return v
+
+    @field_validator("reward_batch_tokens")
+    @classmethod
+    def validate_reward_batch_tokens(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("reward_batch_tokens must be at least 1")
+        return v
+
+    @field_validator("rollout_batch_size")
+    @classmethod
+    def validate_rollout_batch_size(cls, v):
+        if v < 1:
+            raise ValueError("rollout_batch_size must be at least 1")
+        return v
+
+    @field_validator("generation_batch_size")
+    @classmethod
+    def validate_generation_batch_size(cls, v):
+        if v < 1:
+            raise ValueError("generation_batch_size must be at least 1")
+        return v
+
+    @field_validator("max_new_tokens")
+    @classmethod
+    def validate_max_new_tokens(cls, v):
+        if v < 1:
+            raise ValueError("max_new_tokens must be at least 1")
+        return v
+
+    @field_validator("temperature")
+    @classmethod
+    def validate_temperature(cls, v):
+        if v < 0:
+            raise ValueError("temperature cannot be negative")
+        return v
+
+    @field_validator("top_p")
+    @classmethod
+    def validate_top_p(cls, v):
+        if v <= 0 or v > 1:
+            raise ValueError("top_p must be greater than 0 and at most 1")
+        return v
+
+    @field_validator("ppo_epochs")
+    @classmethod
+    def validate_ppo_epochs(cls, v):
+        if v < 1:
+            raise ValueError("ppo_epochs must be at least 1")
+        return v
+
+    @field_validator("mini_batch_size")
+    @classmethod
+    def validate_mini_batch_size(cls, v):
+        if v < 1:
+            raise ValueError("mini_batch_size must be at least 1")
+        return v
+
+    @field_validator("kl_coef")
+    @classmethod
+    def validate_kl_coef(cls, v):
+        if v < 0:
+            raise ValueError("kl_coef cannot be negative")
+        return v
+
+    @field_validator("eval_max_samples")
+    @classmethod
+    def validate_eval_max_samples(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("eval_max_samples must be at least 1")
+        return v
+
+    @field_validator("early_stopping_patience")
+    @classmethod
+    def validate_early_stopping_patience(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("early_stopping_patience must be at least 1")
+        return v
+
+    @field_validator("early_stopping_min_delta")
+    @classmethod
+    def validate_early_stopping_min_delta(cls, v):
+        if v < 0:
+            raise ValueError("early_stopping_min_delta cannot be negative")
+        return v
+
+    @field_validator("grad_norm_threshold")
+    @classmethod
+    def validate_grad_norm_threshold(cls, v):
+        if v is not None and v <= 0:
+            raise ValueError("grad_norm_threshold must be positive")
+        return v
+
     @field_validator("model_name")
     @classmethod
     def validate_model_name(cls, v):
@@ -176,6 +369,221 @@ class ModelValidation(BaseModel):
         return v.strip()
 
 
+class UploadSessionRequest(BaseModel):
+    """Chunked dataset upload request."""
+    filename: str
+    total_size: Optional[int] = None
+    sha256: Optional[str] = None  # Skips the upload if this content is already stored
+
+    @field_validator("total_size")
+    @classmethod
+    def validate_total_size(cls, v):
+        if v is not None and v < 0:
+            raise ValueError("total_size cannot be negative")
+        return v
+
+    @field_validator("sha256")
+    @classmethod
+    def validate_sha256(cls, v):
+        if v is not None:
+            v = v.strip().lower()
+            if len(v) != 64 or any(c not in "0123456789abcdef" for c in v):
+                raise ValueError("sha256 must be a 64-character hex digest")
+        return v
+
+
+class DedupRequest(BaseModel):
+    """Duplicate detection request for a dataset."""
+    dataset: str
+    task: str
+    strategy: str = "sft"
+    dedup: str = "near"
+    dedup_threshold: float = DEFAULT_THRESHOLD
+
+    @field_validator("task")
+    @classmethod
+    def validate_task(cls, v):
+        if v not in VALID_TASKS:
+            raise ValueError(
+                f"Invalid task: {v}. Must be one of {VALID_TASKS}"
+            )
+        return v
+
+    @field_validator("strategy")
+    @classmethod
+    def validate_strategy(cls, v):
+        if v not in VALID_STRATEGIES:
+            raise ValueError(
+                f"Invalid strategy: {v}. Must be one of {VALID_STRATEGIES}"
+            )
+        return v
+
+    @field_validator("dedup")
+    @classmethod
+    def validate_dedup(cls, v):
+        if v not in ("exact", "near"):
+            raise ValueError("Invalid dedup mode: must be 'exact' or 'near'")
+        return v
+
+    @field_validator("dedup_threshold")
+    @classmethod
+    def validate_dedup_threshold(cls, v):
+        if v <= 0 or v > 1:
+            raise ValueError("dedup_threshold must be between 0 and 1")
+        return v
+
+
+class DatasetProfileRequest(BaseModel):
+    """Token length profiling request; model and task default to the session's."""
+    dataset: str
+    model_name: Optional[str] = None
+    task: Optional[str] = None
+    strategy: str = "sft"
+    provider: str = "huggingface"
+    prompt_format: str = "plain"
+    system_prompt: Optional[str] = None
+    sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE  # None profiles every row
+
+    @field_validator("task")
+    @classmethod
+    def validate_task(cls, v):
+        if v is not None and v not in VALID_TASKS:
+            raise ValueError(
+                f"Invalid task: {v}. Must be one of {VALID_TASKS}"
+            )
+        return v
+
+    @field_validator("strategy")
+    @classmethod
+    def validate_strategy(cls, v):
+        if v not in VALID_STRATEGIES:
+            raise ValueError(
+                f"Invalid strategy: {v}. Must be one of {VALID_STRATEGIES}"
+            )
+        return v
+
+    @field_validator("provider")
+    @classmethod
+    def validate_provider(cls, v):
+        if v not in VALID_PROVIDERS:
+            raise ValueError(
+                f"Invalid provider: {v}. Must be one of {VALID_PROVIDERS}"
+            )
+        return v
+
+    @field_validator("prompt_format")
+    @classmethod
+    def validate_prompt_format(cls, v):
+        if v not in VALID_PROMPT_FORMATS:
+            raise ValueError(
+                f"Invalid prompt format: {v}. Must be one of {VALID_PROMPT_FORMATS}"
+            )
+        return v
+
+    @field_validator("sample_size")
+    @classmethod
+    def validate_sample_size(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("sample_size must be at least 1")
+        return v
+
+
+class SearchDimension(BaseModel):
+    """
+    One dimension of a sweep search space.
+
+    "choice" picks from values; "uniform" and "loguniform" draw a float from
+    [low, high]; "int" draws an integer from [low, high], log-uniformly with log.
+    """
+    type: str
+    values: Optional[List[Any]] = None
+    low: Optional[float] = None
+    high: Optional[float] = None
+    log: bool = False
+
+    @field_validator("type")
+    @classmethod
+    def validate_type(cls, v):
+        if v not in VALID_SEARCH_TYPES:
+            raise ValueError(
+                f"Invalid search type: {v}. Must be one of {VALID_SEARCH_TYPES}"
+            )
+        return v
+
+
+class SweepRequest(BaseModel):
+    """Hyperparameter sweep request: a base config and the fields to search."""
+    config: TrainingConfig
+    search_space: Dict[str, SearchDimension]
+    method: str = "random"
+    num_trials: int = 20
+    seed: int = 0
+    # Eval metric the trials are compared and pruned on
+    metric: str = "eval_loss"
+    direction: str = "minimize"
+    # Successive halving: trials report at min_steps * eta**k steps (default
+    # min_steps: the config's eval_steps) and the best 1/eta continue
+    eta: int = 3
+    min_steps: Optional[int] = None
+    # Parallel trials: one worker per GPU (optionally only these GPUs), or
+    # this many CPU workers without a GPU
+    workers: Optional[int] = None
+    devices: Optional[List[int]] = None
+    name: Optional[str] = None
+
+    @field_validator("search_space")
+    @classmethod
+    def validate_search_space(cls, v):
+        if not v:
+            raise ValueError("search_space must name at least one field")
+        unknown = [field for field in v if field not in TrainingConfig.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown training config fields in search_space: {unknown}")
+        return v
+
+    @field_validator("method")
+    @classmethod
+    def validate_method(cls, v):
+        if v not in ("random", "grid"):
+            raise ValueError("Invalid search method: must be 'random' or 'grid'")
+        return v
+
+    @field_validator("direction")
+    @classmethod
+    def validate_direction(cls, v):
+        if v not in ("minimize", "maximize"):
+            raise ValueError("Invalid direction: must be 'minimize' or 'maximize'")
+        return v
+
+    @field_validator("num_trials")
+    @classmethod
+    def validate_num_trials(cls, v):
+        if v < 1 or v > 1000:
+            raise ValueError("num_trials must be between 1 and 1000")
+        return v
+
+    @field_validator("eta")
+    @classmethod
+    def validate_eta(cls, v):
+        if v < 2:
+            raise ValueError("eta must be at least 2")
+        return v
+
+    @field_validator("min_steps")
+    @classmethod
+    def validate_min_steps(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("min_steps must be at least 1")
+        return v
+
+    @field_validator("workers")
+    @classmethod
+    def validate_workers(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("workers must be at least 1")
+        return v
+
+
 class TrainingStatus(BaseModel):
     """Training status response."""
     status: str  # idle, running, completed, error
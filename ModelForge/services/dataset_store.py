@@ -0,0 +1,176 @@
+"""
+Content-addressed dataset store.
+
+Each distinct dataset file is stored once as ``<sha256><extension>`` in the
+datasets directory, with a reference count in the database. Every upload of
+the content and every running training job holds a reference; the file is
+deleted when the last reference is released.
+"""
+import json
+import os
+import re
+import threading
+from typing import Dict, List, Optional
+
+from ..database.database_manager import DatabaseManager
+from ..utilities.dataset_formats import get_dataset_extension
+from ..logging_config import logger
+
+
+_STORED_NAME = re.compile(r"^([0-9a-f]{64})(\..+)$")
+
+
+class DatasetStore:
+    """Content-addressed, reference-counted storage for dataset files."""
+
+    def __init__(self, db_manager: DatabaseManager, datasets_dir: str):
+        """
+        Initialize the dataset store.
+
+        Files stored before reference counting existed are registered with
+        one reference.
+
+        Args:
+            db_manager: Database manager instance
+            datasets_dir: Directory where datasets are stored
+        """
+        self.db_manager = db_manager
+        self.datasets_dir = datasets_dir
+        os.makedirs(datasets_dir, exist_ok=True)
+        # Serializes adding files and deleting them at refcount zero
+        self._lock = threading.Lock()
+        self._register_existing_files()
+        logger.info("Dataset store initialized")
+
+    def _register_existing_files(self):
+        for name in os.listdir(self.datasets_dir):
+            match = _STORED_NAME.match(name)
+            if not match or get_dataset_extension(name) != match.group(2):
+                continue
+            if self.db_manager.get_dataset(match.group(1)) is None:
+                path = os.path.join(self.datasets_dir, name)
+                self.db_manager.add_dataset_reference(match.group(1), path, os.path.getsize(path))
+                logger.info(f"Registered existing dataset: {name}")
+
+    @staticmethod
+    def sha256_from_path(path: str) -> Optional[str]:
+        """
+        Get the content hash of a stored dataset from its path.
+
+        Args:
+            path: Dataset file path
+
+        Returns:
+            Hex SHA-256, or None if the path is not a stored dataset name
+        """
+        match = _STORED_NAME.match(os.path.basename(path))
+        return match.group(1) if match else None
+
+    def get(self, sha256: str) -> Optional[Dict]:
+        """
+        Get a stored dataset whose file exists.
+
+        Args:
+            sha256: Content hash
+
+        Returns:
+            Dataset dictionary, or None
+        """
+        dataset = self.db_manager.get_dataset(sha256)
+        if dataset is None or not os.path.exists(dataset["path"]):
+            return None
+        return dataset
+
+    def list(self) -> List[Dict]:
+        """
+        List stored datasets.
+
+        Returns:
+            Dataset dictionaries, most recently used first
+        """
+        return [dataset for dataset in self.db_manager.list_datasets() if os.path.exists(dataset["path"])]
+
+    def add(
+        self,
+        source_path: str,
+        sha256: str,
+        extension: str,
+        original_filename: Optional[str] = None,
+        records: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict:
+        """
+        Store a file under its content hash and add a reference to it.
+
+        If the content is already stored, source_path is left alone and only
+        the reference is added.
+
+        Args:
+            source_path: File to store; moved into the store if the content is new
+            sha256: Content hash of the file
+            extension: Dataset extension such as ".jsonl.gz"
+            original_filename: Name of the uploaded file
+            records: Number of records, if known
+            fields: Field names, if known
+
+        Returns:
+            Dataset dictionary, with deduplicated set if the content was already stored
+        """
+        with self._lock:
+            existing = self.get(sha256)
+            if existing is not None:
+                path = existing["path"]
+            else:
+                path = os.path.join(self.datasets_dir, f"{sha256}{extension}")
+                os.replace(source_path, path)
+
+            dataset = self.db_manager.add_dataset_reference(
+                sha256,
+                path,
+                os.path.getsize(path),
+                original_filename=original_filename,
+                records=records,
+                fields=json.dumps(fields) if fields is not None else None,
+            )
+
+        dataset["deduplicated"] = existing is not None
+        logger.info(
+            f"Dataset {'already stored' if existing else 'stored'}: {path} (refcount {dataset['refcount']})"
+        )
+        return dataset
+
+    def acquire(self, sha256: str) -> Optional[Dict]:
+        """
+        Add a reference to a stored dataset.
+
+        Args:
+            sha256: Content hash
+
+        Returns:
+            Dataset dictionary, or None if it is not stored
+        """
+        with self._lock:
+            dataset = self.get(sha256)
+            if dataset is None:
+                return None
+            return self.db_manager.add_dataset_reference(sha256, dataset["path"], dataset["size"])
+
+    def release(self, sha256: str) -> Optional[Dict]:
+        """
+        Remove a reference; the file is deleted when none are left.
+
+        Args:
+            sha256: Content hash
+
+        Returns:
+            Dataset dictionary with the new refcount, or None if it is not stored
+        """
+        with self._lock:
+            dataset = self.db_manager.release_dataset_reference(sha256)
+            if dataset is None:
+                return None
+            if dataset["refcount"] <= 0 and self.db_manager.delete_dataset(sha256):
+                if os.path.exists(dataset["path"]):
+                    os.remove(dataset["path"])
+                logger.info(f"Dataset deleted, no references left: {dataset['path']}")
+            return dataset
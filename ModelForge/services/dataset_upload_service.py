@@ -0,0 +1,587 @@
+"""
+Dataset upload service.
+Streams uploaded datasets to disk in chunks, hashing and validating them on
+the fly, and adds them to the content-addressed dataset store.
+"""
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+import zlib
+from typing import Any, Dict, Iterator, List, Optional
+
+from .dataset_store import DatasetStore
+from ..exceptions import DatasetValidationError
+from ..logging_config import logger
+from ..utilities.dataset_formats import (
+    COLUMNAR_BUILDERS,
+    DATASET_EXTENSIONS,
+    get_dataset_extension,
+    read_columnar_metadata,
+)
+
+
+# Size of the chunks read from an upload stream
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Longest accepted JSONL line; bounds the validator's memory use
+MAX_LINE_BYTES = 64 * 1024 * 1024
+
+# Most decompressed bytes produced at once from gzip input
+MAX_DECOMPRESSED_CHUNK = UPLOAD_CHUNK_SIZE
+
+# Compressed bytes passed to the zstd decompressor at once
+ZSTD_INPUT_SLICE = 512
+
+# Unfinished upload sessions older than this are removed
+STALE_UPLOAD_SECONDS = 24 * 60 * 60
+
+
+class _GzipDecompressor:
+    """Streaming gzip decompressor that handles multi-member files."""
+
+    def __init__(self):
+        self._decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    def decompress(self, data: bytes) -> Iterator[bytes]:
+        """Yield the decompressed data in pieces of at most MAX_DECOMPRESSED_CHUNK bytes."""
+        while True:
+            # A new member starts here, possibly at the start of a chunk
+            if self._decompressor.eof and data:
+                self._decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            output = self._decompressor.decompress(data, MAX_DECOMPRESSED_CHUNK)
+            if output:
+                yield output
+            data = self._decompressor.unconsumed_tail or self._decompressor.unused_data
+            # A full piece may leave output pending even with no input left
+            if not data and len(output) < MAX_DECOMPRESSED_CHUNK:
+                return
+
+    @property
+    def eof(self) -> bool:
+        return self._decompressor.eof
+
+
+class _ZstdDecompressor:
+    """Streaming zstd decompressor that handles multi-frame files."""
+
+    def __init__(self):
+        import zstandard
+
+        self._zstd = zstandard.ZstdDecompressor()
+        self._decompressor = self._zstd.decompressobj()
+
+    def decompress(self, data: bytes) -> Iterator[bytes]:
+        """
+        Yield the decompressed data in bounded pieces.
+
+        zstandard's decompressobj has no output limit, so the input is passed
+        in slices of ZSTD_INPUT_SLICE bytes. A zstd block of at most 128 KB
+        takes at least 4 compressed bytes, so a slice yields at most 16 MB.
+        """
+        for start in range(0, len(data), ZSTD_INPUT_SLICE):
+            piece = data[start:start + ZSTD_INPUT_SLICE]
+            while piece:
+                # A new frame starts here, possibly at the start of a chunk
+                if self._decompressor.eof:
+                    self._decompressor = self._zstd.decompressobj()
+                output = self._decompressor.decompress(piece)
+                if output:
+                    yield output
+                piece = self._decompressor.unused_data
+
+    @property
+    def eof(self) -> bool:
+        return self._decompressor.eof
+
+
+class JsonlValidator:
+    """
+    Incremental JSONL validator fed with raw byte chunks.
+
+    Lines may span chunk boundaries; only the unfinished last line is kept
+    between chunks. Every non-blank line must be a JSON object. Compressed
+    files are decompressed on the fly.
+    """
+
+    def __init__(self, compression: Optional[str] = None):
+        """
+        Initialize an empty validator.
+
+        Args:
+            compression: "gzip", "zstd" or None
+        """
+        self.line_number = 0
+        self.records = 0
+        self.fields: Optional[List[str]] = None
+        self._partial = b""
+        self._compression = compression
+        if compression == "gzip":
+            self._decompressor = _GzipDecompressor()
+        elif compression == "zstd":
+            self._decompressor = _ZstdDecompressor()
+        else:
+            self._decompressor = None
+
+    def feed(self, chunk: bytes):
+        """
+        Validate the complete lines of a chunk.
+
+        Args:
+            chunk: Next bytes of the file
+
+        Raises:
+            DatasetValidationError: If a line is not a JSON object or the
+                compressed data is invalid
+        """
+        if self._decompressor is None:
+            self._split(chunk)
+            return
+
+        # Decompressed data is validated as it is produced, about
+        # UPLOAD_CHUNK_SIZE bytes at a time, so a highly compressed chunk
+        # never expands fully in memory
+        pending: List[bytes] = []
+        size = 0
+        output = self._decompressor.decompress(chunk)
+        while True:
+            try:
+                piece = next(output, None)
+            except Exception as e:
+                raise DatasetValidationError(f"Invalid {self._compression} data: {e}") from e
+            if piece is not None:
+                pending.append(piece)
+                size += len(piece)
+            if pending and (piece is None or size >= UPLOAD_CHUNK_SIZE):
+                self._split(b"".join(pending))
+                pending, size = [], 0
+            if piece is None:
+                return
+
+    def _split(self, data: bytes):
+        """Validate the lines completed by the next decompressed bytes."""
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        if len(self._partial) > MAX_LINE_BYTES:
+            raise DatasetValidationError(
+                f"Line {self.line_number + 1} is longer than {MAX_LINE_BYTES} bytes"
+            )
+        for line in lines:
+            self._check_line(line)
+
+    def close(self):
+        """
+        Validate the last line of the file.
+
+        Raises:
+            DatasetValidationError: If the line is invalid, the compressed data is
+                truncated or the file has no records
+        """
+        if self._decompressor is not None and not self._decompressor.eof:
+            raise DatasetValidationError("Compressed data is truncated")
+        if self._partial:
+            self._check_line(self._partial)
+            self._partial = b""
+        if self.records == 0:
+            raise DatasetValidationError("Dataset contains no records")
+
+    def _check_line(self, line: bytes):
+        self.line_number += 1
+        if not line.strip():
+            return
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise DatasetValidationError(f"Line {self.line_number} is not valid JSON: {e}") from e
+        if not isinstance(record, dict):
+            raise DatasetValidationError(f"Line {self.line_number} is not a JSON object")
+        if self.fields is None:
+            self.fields = sorted(record)
+        self.records += 1
+
+
+def _make_validator(filename: str) -> Optional[JsonlValidator]:
+    """Get an incremental validator for a file name (JSONL only, possibly compressed)."""
+    extension = get_dataset_extension(filename)
+    if extension is None or not extension.startswith(".jsonl"):
+        return None
+    return JsonlValidator(compression=DATASET_EXTENSIONS[extension][1])
+
+
+class UploadSession:
+    """
+    State of one upload: a partial file plus the running hash and validator.
+
+    Chunks must be appended in order. The session's metadata is kept in a
+    JSON file next to the partial file, so an upload can be resumed after a
+    restart; the hash and validator state are then rebuilt from the partial
+    file.
+    """
+
+    def __init__(self, upload_id: str, filename: str, upload_dir: str, total_size: Optional[int] = None):
+        """
+        Initialize an upload session.
+
+        Args:
+            upload_id: Session identifier
+            filename: Original file name
+            upload_dir: Directory for partial uploads
+            total_size: Expected size in bytes, if known
+        """
+        self.upload_id = upload_id
+        self.filename = filename
+        self.total_size = total_size
+        self.part_path = os.path.join(upload_dir, f"{upload_id}.part")
+        self.meta_path = os.path.join(upload_dir, f"{upload_id}.json")
+        self.offset = 0
+        self.hasher = hashlib.sha256()
+        self.validator = _make_validator(filename)
+        self.lock = threading.Lock()
+
+    def save_meta(self):
+        """Write the session's metadata file."""
+        with open(self.meta_path, "w") as f:
+            json.dump({"filename": self.filename, "total_size": self.total_size, "created": time.time()}, f)
+
+    def replay(self):
+        """Rebuild the hash and validator state from the partial file."""
+        with open(self.part_path, "rb") as f:
+            while chunk := f.read(UPLOAD_CHUNK_SIZE):
+                self._consume(chunk)
+
+    def write(self, chunk: bytes):
+        """
+        Append a chunk to the partial file.
+
+        Args:
+            chunk: Next bytes of the upload
+
+        Raises:
+            DatasetValidationError: If the chunk contains an invalid line
+        """
+        with open(self.part_path, "ab") as f:
+            f.write(chunk)
+        self._consume(chunk)
+
+    def _consume(self, chunk: bytes):
+        if self.validator is not None:
+            self.validator.feed(chunk)
+        self.hasher.update(chunk)
+        self.offset += len(chunk)
+
+    def remove(self):
+        """Delete the session's files."""
+        for path in (self.part_path, self.meta_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the session to a status dictionary."""
+        return {
+            "upload_id": self.upload_id,
+            "filename": self.filename,
+            "offset": self.offset,
+            "total_size": self.total_size,
+        }
+
+
+class DatasetUploadService:
+    """Service for streaming, resumable dataset uploads."""
+
+    def __init__(self, store: DatasetStore):
+        """
+        Initialize dataset upload service.
+
+        Args:
+            store: Dataset store uploads are added to
+        """
+        self.store = store
+        self.upload_dir = os.path.join(store.datasets_dir, ".uploads")
+        os.makedirs(self.upload_dir, exist_ok=True)
+        self._sessions: Dict[str, UploadSession] = {}
+        self._sessions_lock = threading.Lock()
+        logger.info("Dataset upload service initialized")
+
+    @staticmethod
+    def check_filename(filename: Optional[str]) -> str:
+        """
+        Check that an upload has a supported file type.
+
+        Args:
+            filename: Original file name
+
+        Returns:
+            The file name
+
+        Raises:
+            DatasetValidationError: If the file type is not supported
+        """
+        if get_dataset_extension(filename) is None:
+            raise DatasetValidationError(
+                f"Invalid file type. Supported formats: {', '.join(DATASET_EXTENSIONS)}"
+            )
+        return filename
+
+    def add_existing(self, sha256: str) -> Optional[Dict[str, Any]]:
+        """
+        Reference an already stored dataset instead of uploading it again.
+
+        Args:
+            sha256: Hex SHA-256 of the file content
+
+        Returns:
+            Stored dataset information (see _store), or None if the content
+            is not stored
+        """
+        dataset = self.store.acquire(sha256)
+        if dataset is None:
+            return None
+        return self._result(dataset, dataset["original_filename"], deduplicated=True)
+
+    def create_session(self, filename: str, total_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Start a chunked upload.
+
+        Args:
+            filename: Original file name
+            total_size: Expected size in bytes, if known
+
+        Returns:
+            Session status with upload_id and offset 0
+
+        Raises:
+            DatasetValidationError: If the file type is not supported
+        """
+        self.check_filename(filename)
+        self.remove_stale_sessions()
+
+        session = UploadSession(str(uuid.uuid4()), filename, self.upload_dir, total_size)
+        open(session.part_path, "wb").close()
+        session.save_meta()
+        with self._sessions_lock:
+            self._sessions[session.upload_id] = session
+        logger.info(f"Upload session created: {session.upload_id} ({filename})")
+        return session.to_dict()
+
+    def get_session(self, upload_id: str) -> Optional[UploadSession]:
+        """
+        Get an upload session, restoring it from disk if needed.
+
+        Args:
+            upload_id: Session identifier
+
+        Returns:
+            UploadSession, or None if it does not exist
+        """
+        try:
+            uuid.UUID(upload_id)
+        except ValueError:
+            return None
+
+        with self._sessions_lock:
+            session = self._sessions.get(upload_id)
+            if session is not None:
+                return session
+
+            meta_path = os.path.join(self.upload_dir, f"{upload_id}.json")
+            if not os.path.exists(meta_path):
+                return None
+            with open(meta_path) as f:
+                meta = json.load(f)
+            session = UploadSession(upload_id, meta["filename"], self.upload_dir, meta.get("total_size"))
+            try:
+                session.replay()
+            except DatasetValidationError:
+                session.remove()
+                raise
+            self._sessions[upload_id] = session
+            logger.info(f"Upload session restored: {upload_id} at offset {session.offset}")
+            return session
+
+    def write_chunk(self, session: UploadSession, offset: int, chunk: bytes) -> Dict[str, Any]:
+        """
+        Append a chunk to an upload.
+
+        Args:
+            session: Upload session
+            offset: Byte offset of the chunk; must equal the bytes received so far
+            chunk: Chunk content
+
+        Returns:
+            Session status with the new offset
+
+        Raises:
+            ValueError: If the offset does not match the upload or the chunk
+                exceeds total_size
+            DatasetValidationError: If the chunk contains an invalid line (the
+                upload is discarded)
+        """
+        with session.lock:
+            if offset != session.offset:
+                raise ValueError(f"Expected offset {session.offset}, got {offset}")
+            if session.total_size is not None and offset + len(chunk) > session.total_size:
+                raise ValueError(f"Chunk exceeds the declared size of {session.total_size} bytes")
+            try:
+                session.write(chunk)
+            except DatasetValidationError:
+                self.discard_session(session)
+                raise
+            return session.to_dict()
+
+    def complete_session(self, session: UploadSession) -> Dict[str, Any]:
+        """
+        Finish a chunked upload and store the dataset.
+
+        Args:
+            session: Upload session
+
+        Returns:
+            Stored dataset information (see store)
+
+        Raises:
+            ValueError: If fewer bytes than total_size were received
+            DatasetValidationError: If the dataset is invalid
+        """
+        with session.lock:
+            if session.total_size is not None and session.offset != session.total_size:
+                raise ValueError(f"Upload incomplete: received {session.offset} of {session.total_size} bytes")
+            with self._sessions_lock:
+                self._sessions.pop(session.upload_id, None)
+            try:
+                return self._store(session)
+            finally:
+                session.remove()
+
+    def discard_session(self, session: UploadSession):
+        """
+        Abort an upload and delete its partial file.
+
+        Args:
+            session: Upload session
+        """
+        with self._sessions_lock:
+            self._sessions.pop(session.upload_id, None)
+        session.remove()
+        logger.info(f"Upload session discarded: {session.upload_id}")
+
+    def remove_stale_sessions(self, max_age: float = STALE_UPLOAD_SECONDS):
+        """
+        Delete unfinished uploads older than max_age seconds.
+
+        Args:
+            max_age: Maximum age in seconds
+        """
+        cutoff = time.time() - max_age
+        for meta_path in glob.glob(os.path.join(self.upload_dir, "*.json")):
+            if os.path.getmtime(meta_path) >= cutoff:
+                continue
+            upload_id = os.path.splitext(os.path.basename(meta_path))[0]
+            with self._sessions_lock:
+                self._sessions.pop(upload_id, None)
+            for path in (meta_path, os.path.join(self.upload_dir, f"{upload_id}.part")):
+                if os.path.exists(path):
+                    os.remove(path)
+            logger.info(f"Removed stale upload: {upload_id}")
+
+    def start_stream(self, filename: Optional[str]) -> UploadSession:
+        """
+        Start a single-request streamed upload.
+
+        Unlike create_session, the session is not registered and has no
+        metadata file, so it cannot be resumed.
+
+        Args:
+            filename: Original file name
+
+        Returns:
+            UploadSession to feed with write and finish with finish_stream
+
+        Raises:
+            DatasetValidationError: If the file type is not supported
+        """
+        self.check_filename(filename)
+        session = UploadSession(str(uuid.uuid4()), filename, self.upload_dir)
+        open(session.part_path, "wb").close()
+        return session
+
+    def finish_stream(self, session: UploadSession) -> Dict[str, Any]:
+        """
+        Store a streamed upload.
+
+        Args:
+            session: Session returned by start_stream, fully written
+
+        Returns:
+            Stored dataset information (see store)
+
+        Raises:
+            DatasetValidationError: If the dataset is invalid
+        """
+        try:
+            return self._store(session)
+        finally:
+            session.remove()
+
+    def _store(self, session: UploadSession) -> Dict[str, Any]:
+        """
+        Add a fully received upload to the dataset store.
+
+        If a dataset with the same content is already stored, the upload is
+        dropped and a reference to the existing file is added.
+
+        Returns:
+            Dictionary with file_path, filename, original_filename, sha256,
+            size, records, fields, refcount and deduplicated
+        """
+        extension = get_dataset_extension(session.filename)
+        builder, _ = DATASET_EXTENSIONS[extension]
+        validator = session.validator
+        records, fields = None, None
+        if validator is not None:
+            validator.close()
+            records, fields = validator.records, validator.fields
+        elif builder in COLUMNAR_BUILDERS:
+            # Columnar files cannot be validated while streaming; read their metadata
+            records, fields = read_columnar_metadata(session.part_path, builder)
+            if records == 0:
+                raise DatasetValidationError("Dataset contains no records")
+        elif session.offset == 0:
+            raise DatasetValidationError("Dataset is empty")
+
+        dataset = self.store.add(
+            session.part_path,
+            session.hasher.hexdigest(),
+            extension,
+            original_filename=session.filename,
+            records=records,
+            fields=fields,
+        )
+        return self._result(dataset, session.filename, dataset["deduplicated"], records, fields)
+
+    @staticmethod
+    def _result(
+        dataset: Dict[str, Any],
+        original_filename: Optional[str],
+        deduplicated: bool,
+        records: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Build the upload result for a stored dataset."""
+        if records is None:
+            records = dataset["records"]
+        if fields is None and dataset["fields"]:
+            fields = json.loads(dataset["fields"])
+        return {
+            "file_path": dataset["path"],
+            "filename": os.path.basename(dataset["path"]),
+            "original_filename": original_filename,
+            "sha256": dataset["sha256"],
+            "size": dataset["size"],
+            "records": records,
+            "fields": fields,
+            "refcount": dataset["refcount"],
+            "deduplicated": deduplicated,
+        }
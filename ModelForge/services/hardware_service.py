@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 from ..utilities.hardware_detection.hardware_detector import HardwareDetector
 from ..utilities.hardware_detection.model_recommendation import ModelRecommendationEngine
+from ..utilities.model_registry import is_offline_mode, get_model_registry
 from ..logging_config import logger
 
 
@@ -101,6 +102,9 @@ class HardwareService:
             task=task
         )
 
+        if is_offline_mode():
+            primary_model, alternative_models = self._filter_local_models(primary_model, alternative_models)
+
         return {
             "compute_profile": compute_profile,
             "task": task,
@@ -108,6 +112,30 @@ class HardwareService:
             "possible_models": alternative_models,
         }
 
+    def _filter_local_models(self, primary_model: str, alternative_models: List[str]):
+        """
+        Restrict recommendations to models available in the local registry.
+
+        Args:
+            primary_model: Recommended model for the hardware profile
+            alternative_models: Alternative models for the hardware profile
+
+        Returns:
+            Tuple of (primary_model, alternative_models) containing only local models.
+            If none of the recommended models are local, all local models are offered
+            as alternatives with no primary recommendation.
+        """
+        registry = get_model_registry()
+        candidates = [primary_model] + list(alternative_models)
+        local = [model for model in candidates if registry.has_model(model)]
+
+        if not local:
+            logger.warning("Offline mode: no recommended model is available locally")
+            return "", registry.list_models()
+
+        logger.info(f"Offline mode: recommending local models only: {local}")
+        return local[0], local[1:]
+
     def validate_batch_size(self, batch_size: int, compute_profile: str) -> bool:
         """
         Validate if batch size is appropriate for compute profile.
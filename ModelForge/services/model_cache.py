@@ -0,0 +1,311 @@
+"""
+Resident base-model cache for sequential training jobs.
+
+Loading and quantizing a base model can take minutes. When enabled, the
+training worker keeps quantized base models in memory between jobs and hands
+each new job the same base weights; every job still gets a fresh set of LoRA
+adapters because the previous job's adapters are unloaded when the model is
+released back to the cache. Release runs correctness checks (no adapter
+modules left, base weights unchanged) and evicts the model if any fails.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..logging_config import logger
+
+
+class _CacheEntry:
+    """A cached base model with its bookkeeping."""
+
+    def __init__(self, model: Any, tokenizer: Any, size_bytes: int, fingerprint: Tuple[float, ...]):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.size_bytes = size_bytes
+        self.fingerprint = fingerprint
+        self.in_use = False
+        self.hits = 0
+        self.last_used = time.time()
+
+
+class BaseModelCache:
+    """
+    Memory-budgeted LRU cache of loaded base models.
+
+    Only one job may hold a given base model at a time. Models larger than the
+    budget are never cached.
+    """
+
+    # Number of parameter tensors sampled for the base-weight fingerprint
+    FINGERPRINT_SAMPLES = 16
+
+    def __init__(self, max_memory_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_memory_bytes: Total memory budget for cached models. 0 disables caching.
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self._entries: "OrderedDict[Tuple, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache can hold any model."""
+        return self.max_memory_bytes > 0
+
+    @staticmethod
+    def make_key(config: Dict[str, Any], model_class: str) -> Tuple:
+        """
+        Build the cache key for a training configuration.
+
+        Everything that changes the loaded base weights is part of the key.
+
+        Args:
+            config: Training configuration dictionary
+            model_class: Model class name used for loading
+
+        Returns:
+            Hashable cache key
+        """
+        return (
+            config.get("provider", "huggingface"),
+            config["model_name"],
+            model_class,
+            bool(config.get("use_4bit", True)),
+            bool(config.get("use_8bit", False)),
+            config.get("bnb_4bit_compute_dtype", "float16"),
+            config.get("bnb_4bit_quant_type", "nf4"),
+            bool(config.get("use_nested_quant", False)),
+        )
+
+    def acquire(self, key: Tuple) -> Optional[Tuple[Any, Any]]:
+        """
+        Check out a cached base model.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Tuple of (model, tokenizer), or None on a miss or if the model is in use
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.in_use:
+                return None
+
+            entry.in_use = True
+            entry.hits += 1
+            entry.last_used = time.time()
+            self._entries.move_to_end(key)
+
+        logger.info(f"Base model cache hit: {key[1]} (hit #{entry.hits})")
+        return entry.model, entry.tokenizer
+
+    def release(self, key: Tuple, model: Any, tokenizer: Any) -> bool:
+        """
+        Return a model after training, stripping its adapters.
+
+        The model is cached if it is new and fits in the budget, or put back if
+        it was checked out. It is evicted if any correctness check fails.
+
+        Args:
+            key: Cache key from make_key()
+            model: Model used for training (typically PEFT-wrapped)
+            tokenizer: Tokenizer used for training
+
+        Returns:
+            True if the base model is now cached
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            base_model = self._strip_adapters(model)
+            self._check_clean(base_model)
+            self._freeze(base_model)
+        except Exception as e:
+            logger.error(f"Base model for {key[1]} failed cache checks, evicting: {e}")
+            self.discard(key)
+            return False
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                if base_model is not entry.model:
+                    logger.error(f"Released model for {key[1]} is not the cached instance, evicting")
+                    self._entries.pop(key, None)
+                    return False
+                if self._fingerprint(base_model) != entry.fingerprint:
+                    logger.error(f"Base weights of {key[1]} changed during training, evicting")
+                    self._entries.pop(key, None)
+                    return False
+                entry.in_use = False
+                entry.last_used = time.time()
+                return True
+
+            size_bytes = self._memory_footprint(base_model)
+            if size_bytes > self.max_memory_bytes:
+                logger.info(
+                    f"Not caching {key[1]}: {size_bytes / 1e9:.2f} GB exceeds "
+                    f"budget of {self.max_memory_bytes / 1e9:.2f} GB"
+                )
+                return False
+
+            self._evict_for(size_bytes)
+            self._entries[key] = _CacheEntry(base_model, tokenizer, size_bytes, self._fingerprint(base_model))
+            logger.info(f"Cached base model {key[1]} ({size_bytes / 1e9:.2f} GB)")
+            return True
+
+    def discard(self, key: Tuple):
+        """
+        Drop a model from the cache (e.g. after a failed job).
+
+        Args:
+            key: Cache key from make_key()
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                logger.info(f"Evicted base model {key[1]} from cache")
+        self._free_device_memory()
+
+    def clear(self):
+        """Drop all cached models."""
+        with self._lock:
+            self._entries.clear()
+        self._free_device_memory()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with budget, usage and cached models
+        """
+        with self._lock:
+            return {
+                "max_memory_bytes": self.max_memory_bytes,
+                "used_memory_bytes": sum(e.size_bytes for e in self._entries.values()),
+                "models": [
+                    {"model_name": key[1], "size_bytes": e.size_bytes, "hits": e.hits, "in_use": e.in_use}
+                    for key, e in self._entries.items()
+                ],
+            }
+
+    def _evict_for(self, size_bytes: int):
+        """Evict least recently used idle models until size_bytes fits. Caller holds the lock."""
+        used = sum(e.size_bytes for e in self._entries.values())
+        for key in list(self._entries.keys()):
+            if used + size_bytes <= self.max_memory_bytes:
+                break
+            entry = self._entries[key]
+            if entry.in_use:
+                continue
+            used -= entry.size_bytes
+            del self._entries[key]
+            logger.info(f"Evicted base model {key[1]} to make room ({entry.size_bytes / 1e9:.2f} GB)")
+
+    @staticmethod
+    def _strip_adapters(model: Any) -> Any:
+        """
+        Remove LoRA adapters and training hooks, returning the bare base model.
+
+        Parameters are left as they are so that _check_clean() can still see
+        anything that was trainable during the job.
+
+        Args:
+            model: Trained model, PEFT-wrapped or not
+
+        Returns:
+            Base model with adapter layers removed (not merged)
+        """
+        if hasattr(model, "unload") and hasattr(model, "peft_config"):
+            model = model.unload()
+
+        if getattr(model, "is_gradient_checkpointing", False) and hasattr(model, "gradient_checkpointing_disable"):
+            model.gradient_checkpointing_disable()
+
+        # prepare_model_for_kbit_training() hooks the input embeddings so
+        # that their output requires grad; the hook outlives unload().
+        if getattr(model, "_require_grads_hook", None) is not None:
+            model.disable_input_require_grads()
+            del model._require_grads_hook
+
+        if hasattr(model, "peft_config"):
+            del model.peft_config
+        model.eval()
+        return model
+
+    @staticmethod
+    def _check_clean(model: Any):
+        """
+        Verify that no adapter or training state survives on a base model.
+
+        Raises:
+            RuntimeError: If adapter modules, trainable parameters or
+                input-embedding hooks remain
+        """
+        leftover = [
+            name for name, module in model.named_modules()
+            if "lora_" in name or hasattr(module, "base_layer")
+        ]
+        if leftover:
+            raise RuntimeError(f"{len(leftover)} adapter modules remain (e.g. {leftover[0]})")
+
+        if hasattr(model, "peft_config"):
+            raise RuntimeError("PEFT config remains on the base model")
+
+        trainable = [name for name, param in model.named_parameters() if param.requires_grad]
+        if trainable:
+            raise RuntimeError(f"{len(trainable)} base parameters were trainable (e.g. {trainable[0]})")
+
+        if hasattr(model, "get_input_embeddings"):
+            embeddings = model.get_input_embeddings()
+            if embeddings is not None and (embeddings._forward_hooks or embeddings._forward_pre_hooks):
+                raise RuntimeError("Forward hooks remain on the input embeddings")
+
+    @staticmethod
+    def _freeze(model: Any):
+        """Freeze all parameters and drop stale gradients before caching."""
+        for param in model.parameters():
+            param.requires_grad_(False)
+            param.grad = None
+
+    @classmethod
+    def _fingerprint(cls, model: Any) -> Tuple[float, ...]:
+        """
+        Cheap fingerprint of the base weights from a fixed sample of tensors.
+
+        Args:
+            model: Base model
+
+        Returns:
+            Tuple of per-tensor sums
+        """
+        params = [p for _, p in sorted(model.named_parameters(), key=lambda item: item[0])]
+        if not params:
+            return ()
+        stride = max(1, len(params) // cls.FINGERPRINT_SAMPLES)
+        return tuple(float(p.detach().float().sum().item()) for p in params[::stride])
+
+    @staticmethod
+    def _memory_footprint(model: Any) -> int:
+        """Estimate model memory in bytes."""
+        if hasattr(model, "get_memory_footprint"):
+            return int(model.get_memory_footprint())
+        return sum(p.numel() * p.element_size() for p in model.parameters())
+
+    @staticmethod
+    def _free_device_memory():
+        """Release cached CUDA blocks after an eviction."""
+        try:
+            import gc
+            import torch
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
@@ -2,9 +2,13 @@
 Model service for managing fine-tuned models.
 Handles model CRUD operations and validation.
 """
-from typing import List, Dict, Optional
+import asyncio
+import hashlib
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
 
 from ..database.database_manager import DatabaseManager
+from ..database.async_database_manager import AsyncDatabaseManager
 from ..providers.provider_factory import ProviderFactory
 from ..exceptions import ModelAccessError
 from ..logging_config import logger
@@ -13,14 +17,17 @@ from ..logging_config import logger
 class ModelService:
     """Service for managing models."""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, async_db_manager: Optional[AsyncDatabaseManager] = None):
         """
         Initialize model service.
 
         Args:
             db_manager: Database manager instance
+            async_db_manager: Async database manager used by the *_async
+                methods. Without it they run the sync methods in a worker thread.
         """
         self.db_manager = db_manager
+        self.async_db_manager = async_db_manager
         logger.info("Model service initialized")
 
     def get_all_models(self) -> List[Dict]:
@@ -33,6 +40,131 @@ class ModelService:
         logger.info("Fetching all models")
         return self.db_manager.get_all_models()
 
+    def list_models(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        task: Optional[str] = None,
+        strategy: Optional[str] = None,
+        provider: Optional[str] = None,
+        base_model: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        include_config: bool = False,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Get one page of fine-tuned models, filtered and sorted.
+
+        Args:
+            limit: Maximum number of models to return
+            cursor: Cursor returned with the previous page
+            task: Filter by task
+            strategy: Filter by training strategy
+            provider: Filter by provider
+            base_model: Filter by base model
+            created_after: Only models created at or after this time
+            created_before: Only models created before this time
+            sort_by: Field to sort by
+            descending: Sort in descending order
+            include_config: Include each model's training config
+
+        Returns:
+            Tuple of (model dictionaries, next page cursor or None)
+        """
+        return self.db_manager.list_models(
+            limit=limit,
+            cursor=cursor,
+            task=task,
+            strategy=strategy,
+            provider=provider,
+            base_model=base_model,
+            created_after=created_after,
+            created_before=created_before,
+            sort_by=sort_by,
+            descending=descending,
+            include_config=include_config,
+        )
+
+    def get_models_etag(self, *parts: object) -> str:
+        """
+        Get an ETag for model listings.
+
+        The tag changes whenever any model is added, updated or deleted.
+
+        Args:
+            *parts: Request-specific values (filters, cursor, ...) mixed into the tag
+
+        Returns:
+            Weak ETag header value
+        """
+        return self._etag(self.db_manager.get_models_version(), parts)
+
+    @staticmethod
+    def _etag(version: Tuple[Optional[str], int], parts: Tuple[object, ...]) -> str:
+        digest = hashlib.sha1(repr((version, parts)).encode("utf-8")).hexdigest()
+        return f'W/"{digest}"'
+
+    async def list_models_async(self, **kwargs) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Get one page of fine-tuned models without blocking the event loop.
+
+        Args:
+            **kwargs: Same arguments as list_models
+
+        Returns:
+            Tuple of (model dictionaries, next page cursor or None)
+        """
+        if self.async_db_manager is None:
+            return await asyncio.to_thread(self.list_models, **kwargs)
+        return await self.async_db_manager.list_models(**kwargs)
+
+    async def get_models_etag_async(self, *parts: object) -> str:
+        """
+        Get an ETag for model listings without blocking the event loop.
+
+        Args:
+            *parts: Request-specific values mixed into the tag
+
+        Returns:
+            Weak ETag header value
+        """
+        if self.async_db_manager is None:
+            version = await asyncio.to_thread(self.db_manager.get_models_version)
+        else:
+            version = await self.async_db_manager.get_models_version()
+        return self._etag(version, parts)
+
+    async def get_model_by_id_async(self, model_id: str) -> Optional[Dict]:
+        """
+        Get a model by ID without blocking the event loop.
+
+        Args:
+            model_id: Model identifier
+
+        Returns:
+            Model dictionary if found, None otherwise
+        """
+        if self.async_db_manager is None:
+            return await asyncio.to_thread(self.get_model_by_id, model_id)
+        logger.info(f"Fetching model: {model_id}")
+        return await self.async_db_manager.get_model_by_id(model_id)
+
+    async def delete_model_async(self, model_id: str) -> bool:
+        """
+        Delete a model without blocking the event loop.
+
+        Args:
+            model_id: Model identifier
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.async_db_manager is None:
+            return await asyncio.to_thread(self.delete_model, model_id)
+        return await self.async_db_manager.delete_model(model_id)
+
     def get_model_by_id(self, model_id: str) -> Optional[Dict]:
         """
         Get a model by ID.
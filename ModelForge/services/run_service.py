@@ -0,0 +1,136 @@
+"""
+Run service for training run history and metric curves.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..database.database_manager import DatabaseManager
+from ..logging_config import logger
+
+
+DEFAULT_CURVE_POINTS = 200
+
+
+def downsample(steps: np.ndarray, values: np.ndarray, points: int) -> Dict[str, List[Any]]:
+    """
+    Downsample a metric series to at most `points` buckets of consecutive values.
+
+    Each bucket reports the mean step, the mean value and the value range, so
+    noisy curves are smoothed but spikes stay visible in min/max.
+
+    Args:
+        steps: Step of each value
+        values: Logged values
+        points: Maximum number of points to return
+
+    Returns:
+        Dictionary with step, value, min and max lists (non-finite values as None)
+    """
+    if len(values) <= points:
+        mean_steps, means, mins, maxs = steps, values, values, values
+    else:
+        starts = np.unique(np.linspace(0, len(values), points, endpoint=False).astype(np.int64))
+        counts = np.diff(np.append(starts, len(values)))
+        mean_steps = np.add.reduceat(steps.astype(np.float64), starts) / counts
+        means = np.add.reduceat(values.astype(np.float64), starts) / counts
+        mins = np.minimum.reduceat(values, starts)
+        maxs = np.maximum.reduceat(values, starts)
+
+    def to_list(array: np.ndarray) -> List[Optional[float]]:
+        values = array.astype(np.float64)
+        finite = np.isfinite(values)
+        if finite.all():
+            return values.tolist()
+        return [v if ok else None for v, ok in zip(values.tolist(), finite.tolist())]
+
+    return {
+        "step": np.rint(mean_steps).astype(np.int64).tolist(),
+        "value": to_list(means),
+        "min": to_list(mins),
+        "max": to_list(maxs),
+    }
+
+
+class RunService:
+    """Service for training run history."""
+
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize run service.
+
+        Args:
+            db_manager: Database manager instance
+        """
+        self.db_manager = db_manager
+        logger.info("Run service initialized")
+
+    def list_runs(
+        self,
+        limit: int = 50,
+        status: Optional[str] = None,
+        model_id: Optional[str] = None,
+        include_config: bool = False,
+    ) -> List[Dict]:
+        """
+        Get the most recent training runs.
+
+        Args:
+            limit: Maximum number of runs to return
+            status: Filter by status (running, completed, failed, pruned)
+            model_id: Filter by produced model
+            include_config: Include each run's config
+
+        Returns:
+            List of run dictionaries, newest first
+        """
+        return self.db_manager.list_runs(
+            limit=limit,
+            status=status,
+            model_id=model_id,
+            include_config=include_config,
+        )
+
+    def get_run(self, run_id: str) -> Optional[Dict]:
+        """
+        Get a training run by ID.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Run dictionary if found, None otherwise
+        """
+        return self.db_manager.get_run(run_id)
+
+    def get_metric_curves(
+        self,
+        run_ids: Sequence[str],
+        names: Optional[Sequence[str]] = None,
+        points: int = DEFAULT_CURVE_POINTS,
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get downsampled metric curves for one or more runs.
+
+        All chunks of all requested runs are read in a single query.
+
+        Args:
+            run_ids: Run identifiers
+            names: Metric names, e.g. ["loss", "eval_loss"] (None for all)
+            points: Maximum number of points per curve
+
+        Returns:
+            run_id -> metric name -> curve (step, value, min, max, num_logged)
+        """
+        stored = self.db_manager.get_run_metrics(run_ids, names)
+
+        curves: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for run_id in run_ids:
+            curves[run_id] = {}
+            for name, (step_chunks, value_chunks) in stored.get(run_id, {}).items():
+                steps = np.frombuffer(b"".join(step_chunks), dtype="<i4")
+                values = np.frombuffer(b"".join(value_chunks), dtype="<f4")
+                curve = downsample(steps, values, points)
+                curve["num_logged"] = len(values)
+                curves[run_id][name] = curve
+        return curves
@@ -0,0 +1,470 @@
+"""
+Hyperparameter sweep service.
+
+A sweep trains one base training config with different values of some of its
+fields (the search space) and compares the trials on an eval metric:
+
+- Trials are sampled up front, by random search or as a grid, and stored as
+  pending. Worker processes, one per GPU or a chosen number of CPU workers,
+  claim pending trials and train them one after another.
+- A worker keeps the quantized base model warm between its trials
+  (cache_base_model), and the tokenized dataset is reused from the datasets
+  cache, so a trial pays only for its own training.
+- Asynchronous successive halving prunes trials early: at each rung
+  (min_steps * eta**k steps) a trial continues only if its metric is among the
+  best 1/eta of the trials that reached the rung so far. Most of the budget
+  goes to the promising trials.
+- Every trial is recorded as a run, so its config, metrics and outcome are in
+  the run history; the sweep records the run of each trial.
+
+Workers are processes rather than threads because a Trainer always trains on
+the first visible GPU of its process; each worker only sees its own device.
+"""
+import itertools
+import json
+import math
+import os
+import subprocess
+import sys
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..database.database_manager import DatabaseManager
+from .training_service import TrainingService
+from ..exceptions import ConfigurationError
+from ..logging_config import logger
+
+
+SEARCH_TYPES = ("choice", "uniform", "loguniform", "int")
+SEARCH_METHODS = ("random", "grid")
+
+# Fields every trial of a sweep shares; trials are only comparable on the same data
+FIXED_FIELDS = ("task", "dataset", "compute_specs")
+
+# Upper bound on the trials of one sweep
+MAX_TRIALS = 1000
+
+
+def _sample(spec: Dict[str, Any], rng: np.random.RandomState) -> Any:
+    """Draw one value from a search space dimension."""
+    kind = spec["type"]
+    if kind == "choice":
+        return spec["values"][rng.randint(len(spec["values"]))]
+    low, high = spec["low"], spec["high"]
+    if kind == "uniform":
+        return float(rng.uniform(low, high))
+    if kind == "loguniform":
+        return float(math.exp(rng.uniform(math.log(low), math.log(high))))
+    # int: uniform over [low, high], or log-uniform with "log"
+    if spec.get("log"):
+        return int(round(math.exp(rng.uniform(math.log(low), math.log(high)))))
+    return int(rng.randint(int(low), int(high) + 1))
+
+
+def sample_trials(
+    search_space: Dict[str, Dict[str, Any]],
+    num_trials: int,
+    method: str = "random",
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Sample the parameters of a sweep's trials.
+
+    Search space dimensions are {"type": "choice", "values": [...]},
+    {"type": "uniform" | "loguniform", "low": ..., "high": ...} or
+    {"type": "int", "low": ..., "high": ..., "log": false}.
+
+    Args:
+        search_space: Config field -> dimension
+        num_trials: Number of trials (for a grid: at most this many
+            combinations, chosen at random)
+        method: "random" or "grid" (grid dimensions must be choices)
+        seed: Random seed
+
+    Returns:
+        Parameters of each trial; duplicates are dropped
+
+    Raises:
+        ConfigurationError: If the search space or method is invalid
+    """
+    if not search_space:
+        raise ConfigurationError("The search space is empty")
+    if method not in SEARCH_METHODS:
+        raise ConfigurationError(f"Invalid search method: {method}. Must be one of {list(SEARCH_METHODS)}")
+    for field, spec in search_space.items():
+        kind = spec.get("type")
+        if kind not in SEARCH_TYPES:
+            raise ConfigurationError(f"Invalid search type for {field}: {kind}. Must be one of {list(SEARCH_TYPES)}")
+        if kind == "choice":
+            if not spec.get("values"):
+                raise ConfigurationError(f"Choice dimension {field} needs a non-empty values list")
+        elif method == "grid":
+            raise ConfigurationError(f"Grid search needs choice dimensions; {field} is {kind}")
+        elif spec.get("low") is None or spec.get("high") is None or spec["low"] > spec["high"]:
+            raise ConfigurationError(f"Dimension {field} needs low <= high")
+        elif (kind == "loguniform" or spec.get("log")) and spec["low"] <= 0:
+            raise ConfigurationError(f"Log-scale dimension {field} needs low > 0")
+
+    rng = np.random.RandomState(seed)
+    fields = list(search_space)
+    if method == "grid":
+        grid = [dict(zip(fields, values)) for values in itertools.product(*(search_space[f]["values"] for f in fields))]
+        if len(grid) > num_trials:
+            grid = [grid[i] for i in sorted(rng.choice(len(grid), num_trials, replace=False))]
+        return grid
+
+    trials, seen = [], set()
+    # Small discrete spaces run out of distinct combinations before num_trials
+    for _ in range(num_trials * 10):
+        params = {field: _sample(search_space[field], rng) for field in fields}
+        key = json.dumps(params, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            trials.append(params)
+            if len(trials) == num_trials:
+                break
+    return trials
+
+
+def successive_halving_keep(
+    value: Optional[float],
+    values: Sequence[Optional[float]],
+    eta: int,
+    maximize: bool = False,
+) -> bool:
+    """
+    Decide whether a trial continues past a rung.
+
+    Args:
+        value: The trial's metric at the rung (None if not finite)
+        values: Metric of every trial at the rung so far, including this one
+        eta: Reduction factor; the best 1/eta of the trials continue
+        maximize: Whether higher metric values are better
+
+    Returns:
+        True if the trial is among the best len(values) // eta, or too few
+        trials reached the rung to compare
+    """
+    keep = len(values) // eta
+    if keep == 0:
+        return True
+    if value is None:
+        return False
+    ranked = sorted((v for v in values if v is not None), reverse=maximize)
+    if len(ranked) <= keep:
+        return True
+    cutoff = ranked[keep - 1]
+    return value >= cutoff if maximize else value <= cutoff
+
+
+class SweepService:
+    """Service for hyperparameter sweeps."""
+
+    def __init__(self, db_manager: DatabaseManager, training_service: TrainingService):
+        """
+        Initialize sweep service.
+
+        Args:
+            db_manager: Database manager instance
+            training_service: Training service the trials of this process run on
+        """
+        self.db_manager = db_manager
+        self.training_service = training_service
+        logger.info("Sweep service initialized")
+
+    def create_sweep(
+        self,
+        config: Dict[str, Any],
+        trials: List[Dict[str, Any]],
+        search_space: Dict[str, Dict[str, Any]],
+        method: str = "random",
+        metric: str = "eval_loss",
+        direction: str = "minimize",
+        eta: int = 3,
+        min_steps: Optional[int] = None,
+        workers: Optional[int] = None,
+        devices: Optional[List[int]] = None,
+        name: Optional[str] = None,
+    ) -> Dict:
+        """
+        Record a sweep and its pending trials.
+
+        Args:
+            config: Base training configuration
+            trials: Parameters of each trial (see sample_trials)
+            search_space: The search space the trials were sampled from
+            method: Search method the trials were sampled with
+            metric: Eval metric to compare trials on
+            direction: "minimize" or "maximize"
+            eta: Successive halving reduction factor
+            min_steps: Steps to the first rung (default: the config's eval_steps)
+            workers: Number of workers (default: one per GPU, or one CPU worker)
+            devices: GPU indices to use (default: all visible GPUs)
+            name: Optional display name
+
+        Returns:
+            Dictionary of sweep data
+
+        Raises:
+            ConfigurationError: If the sweep cannot be run
+        """
+        if not trials:
+            raise ConfigurationError("The sweep has no trials")
+        if len(trials) > MAX_TRIALS:
+            raise ConfigurationError(f"A sweep can have at most {MAX_TRIALS} trials")
+        if direction not in ("minimize", "maximize"):
+            raise ConfigurationError(f"Invalid direction: {direction}. Must be 'minimize' or 'maximize'")
+        if config.get("eval_split", 0.2) <= 0:
+            raise ConfigurationError("Sweeps compare trials on evaluation; set eval_split > 0")
+        fixed = [field for field in FIXED_FIELDS if field in search_space]
+        if fixed:
+            raise ConfigurationError(f"Fields shared by all trials cannot be searched: {fixed}")
+
+        sweep_id = str(uuid.uuid4())
+        settings = {
+            "base_config": config,
+            "search_space": search_space,
+            "method": method,
+            "eta": eta,
+            "min_steps": min_steps or config.get("eval_steps", 100),
+            "workers": workers,
+            "devices": devices,
+        }
+        return self.db_manager.create_sweep(
+            sweep_id=sweep_id,
+            metric=metric,
+            direction=direction,
+            config=json.dumps(settings, default=str),
+            trial_params=[json.dumps(params, default=str) for params in trials],
+            name=name,
+        )
+
+    def get_sweep(self, sweep_id: str) -> Optional[Dict]:
+        """
+        Get a sweep with its trials.
+
+        Args:
+            sweep_id: Sweep identifier
+
+        Returns:
+            Sweep dictionary if found, None otherwise
+        """
+        return self.db_manager.get_sweep(sweep_id)
+
+    def list_sweeps(self, limit: int = 50) -> List[Dict]:
+        """
+        Get the most recent sweeps.
+
+        Args:
+            limit: Maximum number of sweeps to return
+
+        Returns:
+            List of sweep dictionaries with trial counts, newest first
+        """
+        return self.db_manager.list_sweeps(limit=limit)
+
+    def cancel_sweep(self, sweep_id: str) -> int:
+        """
+        Cancel a sweep's pending trials; running trials finish.
+
+        Args:
+            sweep_id: Sweep identifier
+
+        Returns:
+            Number of trials cancelled
+        """
+        cancelled = self.db_manager.cancel_sweep_trials(sweep_id)
+        logger.info(f"Cancelled {cancelled} pending trials of sweep {sweep_id}")
+        return cancelled
+
+    def _worker_slots(self, workers: Optional[int], devices: Optional[List[int]]) -> List[Tuple[str, Dict[str, str]]]:
+        """Name and environment of each worker process: one per GPU, or CPU workers sharing the cores."""
+        import torch
+
+        if torch.cuda.is_available():
+            gpus = devices if devices else list(range(torch.cuda.device_count()))
+            if workers:
+                gpus = gpus[:workers]
+            # Indices are relative to the GPUs this process sees
+            visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+            physical = visible.split(",") if visible else [str(gpu) for gpu in range(torch.cuda.device_count())]
+            return [(f"gpu{gpu}", {"CUDA_VISIBLE_DEVICES": physical[gpu].strip()}) for gpu in gpus]
+
+        count = workers or 1
+        threads = str(max(1, (os.cpu_count() or 1) // count))
+        return [
+            (f"cpu{i}", {"CUDA_VISIBLE_DEVICES": "", "OMP_NUM_THREADS": threads, "MKL_NUM_THREADS": threads})
+            for i in range(count)
+        ]
+
+    def run_sweep(self, sweep_id: str):
+        """
+        Run a sweep's trials on worker processes and record the best trial.
+
+        Blocks until every worker has exited.
+
+        Args:
+            sweep_id: Sweep identifier
+        """
+        sweep = self.db_manager.get_sweep(sweep_id)
+        if sweep is None:
+            logger.error(f"Sweep not found: {sweep_id}")
+            return
+        settings = json.loads(sweep["config"])
+
+        try:
+            slots = self._worker_slots(settings.get("workers"), settings.get("devices"))
+            slots = slots[:len(sweep["trials"])]
+
+            package = __package__.split(".")[0]
+            package_parent = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            processes = []
+            for worker, worker_env in slots:
+                env = dict(os.environ, **worker_env)
+                env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_parent, os.environ.get("PYTHONPATH")]))
+                logger.info(f"Starting sweep worker {worker} for sweep {sweep_id}")
+                processes.append((
+                    worker,
+                    subprocess.Popen(
+                        [sys.executable, "-m", f"{package}.services.sweep_worker", sweep_id, "--worker", worker],
+                        env=env,
+                    ),
+                ))
+
+            for worker, process in processes:
+                code = process.wait()
+                if code != 0:
+                    logger.error(f"Sweep worker {worker} exited with code {code}")
+                    self._fail_worker_trials(sweep_id, worker, f"Sweep worker {worker} exited with code {code}")
+
+            self._finish_sweep(sweep_id)
+
+        except Exception as e:
+            logger.error(f"Sweep {sweep_id} failed: {e}", exc_info=True)
+            self.db_manager.cancel_sweep_trials(sweep_id)
+            self.db_manager.update_sweep(sweep_id, status="failed", finished_at=datetime.utcnow(), error=str(e))
+
+    def _fail_worker_trials(self, sweep_id: str, worker: str, error: str):
+        """Mark the trials a crashed worker left running as failed."""
+        for trial in self.db_manager.get_sweep(sweep_id)["trials"]:
+            if trial["status"] == "running" and trial["worker"] == worker:
+                self.db_manager.update_sweep_trial(
+                    sweep_id, trial["trial"], status="failed", finished_at=datetime.utcnow(), error=error
+                )
+
+    def _finish_sweep(self, sweep_id: str):
+        """Record the best completed trial and the sweep's final status."""
+        sweep = self.db_manager.get_sweep(sweep_id)
+        maximize = sweep["direction"] == "maximize"
+        scored = [t for t in sweep["trials"] if t["status"] == "completed" and t["score"] is not None]
+        counts: Dict[str, int] = {}
+        for trial in sweep["trials"]:
+            counts[trial["status"]] = counts.get(trial["status"], 0) + 1
+
+        best = None
+        if scored:
+            best = (max if maximize else min)(scored, key=lambda t: t["score"])
+
+        if counts.get("cancelled"):
+            status, error = "cancelled", None
+        elif best is not None:
+            status, error = "completed", None
+        else:
+            status, error = "failed", "No trial completed with a score"
+        self.db_manager.update_sweep(
+            sweep_id,
+            status=status,
+            best_trial=best["trial"] if best else None,
+            finished_at=datetime.utcnow(),
+            error=error,
+        )
+        logger.info(
+            f"Sweep {sweep_id} {status}: {counts}"
+            + (f", best trial {best['trial']} ({sweep['metric']}={best['score']:.4g})" if best else "")
+        )
+
+    def run_trials(self, sweep_id: str, worker: str) -> int:
+        """
+        Claim and train pending trials of a sweep until none is left.
+
+        Runs in a sweep worker process.
+
+        Args:
+            sweep_id: Sweep identifier
+            worker: Name of this worker
+
+        Returns:
+            Number of trials run
+        """
+        sweep = self.db_manager.get_sweep(sweep_id, include_trials=False)
+        if sweep is None:
+            logger.error(f"Sweep not found: {sweep_id}")
+            return 0
+        settings = json.loads(sweep["config"])
+
+        count = 0
+        while True:
+            trial = self.db_manager.claim_sweep_trial(sweep_id, worker)
+            if trial is None:
+                return count
+            self._run_trial(sweep, settings, trial)
+            count += 1
+
+    def _run_trial(self, sweep: Dict[str, Any], settings: Dict[str, Any], trial: Dict[str, Any]):
+        """Train one trial and record its outcome."""
+        from .training_callbacks import SuccessiveHalvingCallback
+
+        sweep_id, number = sweep["id"], trial["trial"]
+        params = json.loads(trial["params"])
+        config = {
+            **settings["base_config"],
+            **params,
+            # Trials on this worker share the warm base model
+            "cache_base_model": True,
+            "sweep_id": sweep_id,
+            "sweep_trial": number,
+        }
+        run_id = str(uuid.uuid4())
+        self.db_manager.update_sweep_trial(sweep_id, number, run_id=run_id)
+        logger.info(f"Sweep {sweep_id} trial {number}: {params}")
+
+        maximize = sweep["direction"] == "maximize"
+        eta = settings["eta"]
+
+        def report(rung: int, value: Optional[float]) -> bool:
+            values = self.db_manager.record_sweep_rung(sweep_id, number, rung, value)
+            return successive_halving_keep(value, values, eta, maximize)
+
+        pruner = SuccessiveHalvingCallback(
+            report,
+            min_steps=settings["min_steps"],
+            eta=eta,
+            metric=sweep["metric"],
+            maximize=maximize,
+        )
+
+        try:
+            result = self.training_service.train_model(config, run_id=run_id, pruner=pruner)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+
+        # The full-split evaluation is the most accurate score of a completed trial
+        score = (result.get("eval_metrics") or {}).get(sweep["metric"], pruner.best)
+        if score is not None and not math.isfinite(score):
+            score = None
+        if result.get("pruned"):
+            status = "pruned"
+        else:
+            status = "completed" if result["success"] else "failed"
+        self.db_manager.update_sweep_trial(
+            sweep_id,
+            number,
+            status=status,
+            score=score,
+            finished_at=datetime.utcnow(),
+            error=result.get("error"),
+        )
+        logger.info(f"Sweep {sweep_id} trial {number} {status} ({sweep['metric']}={score})")
@@ -0,0 +1,32 @@
+"""
+Sweep worker process.
+
+Started by SweepService.run_sweep, one process per device:
+
+    python -m ModelForge.services.sweep_worker <sweep_id> --worker gpu0
+
+The device is selected through CUDA_VISIBLE_DEVICES before torch is
+imported. The worker claims pending trials of the sweep and trains them one
+after another until none is left.
+"""
+import argparse
+import sys
+
+from ..dependencies import get_sweep_service
+from ..logging_config import logger
+
+
+def main(argv=None) -> int:
+    """Run a sweep worker; returns the process exit code."""
+    parser = argparse.ArgumentParser(description="Train the pending trials of a sweep")
+    parser.add_argument("sweep_id", help="Sweep identifier")
+    parser.add_argument("--worker", default="worker", help="Worker name recorded on claimed trials")
+    args = parser.parse_args(argv)
+
+    count = get_sweep_service().run_trials(args.sweep_id, args.worker)
+    logger.info(f"Sweep worker {args.worker} finished after {count} trials")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+Trainer callbacks used by the training service.
+Kept separate from training_service so that transformers is only imported
+once a training job actually starts.
+"""
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from transformers import TrainerCallback
+
+from ..logging_config import logger
+
+
+class ProgressCallback(TrainerCallback):
+    """Callback to update training progress."""
+
+    def __init__(self, status_dict: Dict):
+        super().__init__()
+        self.status_dict = status_dict
+
+    def on_log(self, args, state, control, logs=None, **kwargs):
+        """Update progress during training."""
+        if state.max_steps <= 0:
+            return
+
+        progress = min(95, int((state.global_step / state.max_steps) * 100))
+        self.status_dict["progress"] = progress
+        self.status_dict["message"] = f"Training step {state.global_step}/{state.max_steps}"
+
+    def on_train_end(self, args, state, control, **kwargs):
+        """Mark training as complete."""
+        self.status_dict["progress"] = 100
+        self.status_dict["message"] = "Training completed!"
+
+
+class EvalTimingCallback(TrainerCallback):
+    """Accumulate wall time spent in periodic evaluation during training."""
+
+    def __init__(self, phase_timings: Dict[str, float], status_dict: Dict):
+        super().__init__()
+        self.phase_timings = phase_timings
+        self.phase_timings.setdefault("eval", 0.0)
+        self.status_dict = status_dict
+        self.status_dict["eval_count"] = 0
+
+    def on_evaluate(self, args, state, control, metrics=None, **kwargs):
+        """Add the runtime reported by each evaluation and count it."""
+        runtime = sum(v for k, v in (metrics or {}).items() if k.endswith("_runtime"))
+        self.phase_timings["eval"] = round(self.phase_timings["eval"] + runtime, 3)
+        self.status_dict["eval_count"] += 1
+
+
+class EarlyStoppingCallback(TrainerCallback):
+    """
+    Stop training when evaluation stops improving or the run diverges.
+
+    - Plateau: the monitored eval metric (lower is better) has not improved by
+      more than min_delta for `patience` consecutive evaluations.
+    - NaN/inf: a logged training loss or gradient norm is not finite.
+    - Gradient explosion: a logged gradient norm exceeds grad_norm_threshold.
+
+    Divergence checks run on every log (every `logging_steps`). The reason for
+    a stop is kept in `stop_info` and published in the status dictionary.
+    """
+
+    def __init__(
+        self,
+        status_dict: Dict,
+        patience: Optional[int] = None,
+        min_delta: float = 0.0,
+        metric: str = "eval_loss",
+        stop_on_nan: bool = True,
+        grad_norm_threshold: Optional[float] = None,
+    ):
+        super().__init__()
+        self.status_dict = status_dict
+        self.patience = patience
+        self.min_delta = min_delta
+        self.metric = metric
+        self.stop_on_nan = stop_on_nan
+        self.grad_norm_threshold = grad_norm_threshold
+
+        self.best_metric: Optional[float] = None
+        self.evals_without_improvement = 0
+        self.stop_info: Optional[Dict[str, Any]] = None
+
+    @property
+    def diverged(self) -> bool:
+        """Whether training was stopped because it diverged (rather than plateaued)."""
+        return self.stop_info is not None and self.stop_info["reason"] != "plateau"
+
+    def _stop(self, control, state, reason: str, detail: str):
+        if self.stop_info is not None:
+            return
+        self.stop_info = {"reason": reason, "step": state.global_step, "detail": detail}
+        self.status_dict["early_stop"] = self.stop_info
+        self.status_dict["message"] = f"Stopping early at step {state.global_step}: {detail}"
+        logger.warning(f"Early stopping at step {state.global_step}: {detail}")
+        control.should_training_stop = True
+
+    def on_log(self, args, state, control, logs=None, **kwargs):
+        """Detect NaN/inf loss and gradient norm explosion."""
+        logs = logs or {}
+        loss = logs.get("loss")
+        grad_norm = logs.get("grad_norm")
+
+        if self.stop_on_nan:
+            if loss is not None and not math.isfinite(loss):
+                self._stop(control, state, "nan_loss", f"training loss is {loss}")
+                return
+            if grad_norm is not None and not math.isfinite(grad_norm):
+                self._stop(control, state, "nan_grad_norm", f"gradient norm is {grad_norm}")
+                return
+
+        if self.grad_norm_threshold is not None and grad_norm is not None and grad_norm > self.grad_norm_threshold:
+            self._stop(
+                control, state, "grad_norm_explosion",
+                f"gradient norm {grad_norm:.4g} exceeds threshold {self.grad_norm_threshold:.4g}",
+            )
+
+    def on_evaluate(self, args, state, control, metrics=None, **kwargs):
+        """Track the monitored metric and stop after `patience` evaluations without improvement."""
+        value = (metrics or {}).get(self.metric)
+        if value is None:
+            return
+
+        if self.stop_on_nan and not math.isfinite(value):
+            self._stop(control, state, "nan_loss", f"{self.metric} is {value}")
+            return
+
+        if not self.patience:
+            return
+
+        if self.best_metric is None or value < self.best_metric - self.min_delta:
+            self.best_metric = value
+            self.evals_without_improvement = 0
+            return
+
+        self.evals_without_improvement += 1
+        if self.evals_without_improvement >= self.patience:
+            self._stop(
+                control, state, "plateau",
+                f"{self.metric} did not improve by more than {self.min_delta} "
+                f"for {self.patience} evaluations (best {self.best_metric:.4f})",
+            )
+
+
+class SuccessiveHalvingCallback(TrainerCallback):
+    """
+    Prune a sweep trial that falls behind the other trials.
+
+    Rung k is reached at the first evaluation at or after min_steps * eta**k
+    steps. There the trial reports its eval metric through `report`, which
+    returns False when the trial is not among the best 1/eta of the trials
+    that reached the rung so far; training then stops and `pruned` records
+    the rung. The best value of the metric is kept in `best`.
+    """
+
+    def __init__(
+        self,
+        report: Callable[[int, Optional[float]], bool],
+        min_steps: int,
+        eta: int = 3,
+        metric: str = "eval_loss",
+        maximize: bool = False,
+    ):
+        super().__init__()
+        self.report = report
+        self.min_steps = max(1, min_steps)
+        self.eta = eta
+        self.metric = metric
+        self.maximize = maximize
+
+        self.rung = 0
+        self.best: Optional[float] = None
+        self.pruned: Optional[Dict[str, Any]] = None
+
+    def rung_step(self, rung: int) -> int:
+        """Step at which a rung is reached."""
+        return self.min_steps * self.eta ** rung
+
+    def on_evaluate(self, args, state, control, metrics=None, **kwargs):
+        """Report the metric at each rung and stop the trial if it is pruned."""
+        value = (metrics or {}).get(self.metric)
+        if value is None:
+            return
+        if not math.isfinite(value):
+            value = None
+        elif self.best is None or (value > self.best if self.maximize else value < self.best):
+            self.best = value
+
+        if self.pruned is not None or state.global_step < self.rung_step(self.rung):
+            return
+
+        rung = self.rung
+        while self.rung_step(self.rung) <= state.global_step:
+            self.rung += 1
+        # A trial at its last step has nothing left to save; it completes
+        if self.report(rung, value) or state.global_step >= state.max_steps:
+            return
+
+        self.pruned = {"rung": rung, "step": state.global_step, self.metric: value}
+        logger.info(f"Trial pruned at rung {rung} (step {state.global_step}, {self.metric}={value})")
+        control.should_training_stop = True
+
+
+class RunMetricsCallback(TrainerCallback):
+    """
+    Record every logged scalar of a run in the run_metrics table.
+
+    Values are buffered per metric and written as one columnar chunk per
+    metric every `flush_every` steps and at the end of training, rather than
+    one database write per log. Seconds per optimizer step between logs are
+    recorded as "step_time" (evaluation time excluded). Call flush() after
+    any evaluation run outside of train(). Database errors are logged and never interrupt
+    training.
+    """
+
+    def __init__(self, db_manager: Any, run_id: str, flush_every: int = 100):
+        super().__init__()
+        self.db_manager = db_manager
+        self.run_id = run_id
+        self.flush_every = max(1, flush_every)
+
+        self.buffer: Dict[str, Tuple[List[int], List[float]]] = {}
+        self.last_flush_step = 0
+        self.last_log_step: Optional[int] = None
+        self.last_log_time: Optional[float] = None
+
+    def _append(self, name: str, step: int, value: float):
+        steps, values = self.buffer.setdefault(name, ([], []))
+        steps.append(step)
+        values.append(value)
+
+    def flush(self):
+        """Write buffered values to the database."""
+        if not self.buffer:
+            return
+        buffer, self.buffer = self.buffer, {}
+        try:
+            self.db_manager.add_run_metrics(self.run_id, buffer)
+        except Exception as e:
+            logger.warning(f"Could not store metrics for run {self.run_id}: {e}")
+
+    def on_train_begin(self, args, state, control, **kwargs):
+        self.last_log_step = state.global_step
+        self.last_log_time = time.perf_counter()
+
+    def on_log(self, args, state, control, logs=None, **kwargs):
+        """Buffer numeric log values and flush every `flush_every` steps."""
+        step = state.global_step
+        for name, value in (logs or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self._append(name, step, float(value))
+
+        now = time.perf_counter()
+        if self.last_log_step is not None and step > self.last_log_step and "loss" in (logs or {}):
+            self._append("step_time", step, (now - self.last_log_time) / (step - self.last_log_step))
+            self.last_log_step, self.last_log_time = step, now
+
+        if step - self.last_flush_step >= self.flush_every:
+            self.flush()
+            self.last_flush_step = step
+
+    def on_evaluate(self, args, state, control, metrics=None, **kwargs):
+        """Leave evaluation time out of step_time."""
+        if self.last_log_time is not None:
+            self.last_log_time += sum(v for k, v in (metrics or {}).items() if k.endswith("_runtime"))
+
+    def on_train_end(self, args, state, control, **kwargs):
+        self.flush()
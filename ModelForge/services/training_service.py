@@ -4,51 +4,60 @@ Coordinates providers, strategies, and training execution.
 """
 import os
 import json
+import time
+import shutil
+import hashlib
 import uuid
-from typing import Dict, Any, Optional
-from datasets import load_dataset
-from transformers import TrainerCallback
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
 
 from ..providers.provider_factory import ProviderFactory
 from ..strategies.strategy_factory import StrategyFactory
-from ..utilities.finetuning.quantization import QuantizationFactory
 from ..evaluation.dataset_validator import DatasetValidator
-from ..evaluation.metrics import MetricsCalculator
 from ..database.database_manager import DatabaseManager
+from ..formatters.chat_templates import resolve_prompt_format
+from ..utilities.dataset_formats import describe_dataset_file, load_dataset_file
+from ..utilities.dataset_dedup import DEFAULT_THRESHOLD, deduplicate
+from ..utilities.token_profile import (
+    DEFAULT_SAMPLE_SIZE,
+    PREFERENCE_STRATEGIES,
+    model_max_length,
+    sequence_lengths,
+    summarize_lengths,
+)
+from .model_cache import BaseModelCache
+from .dataset_store import DatasetStore
 from ..utilities.settings_managers.FileManager import FileManager
 from ..exceptions import TrainingError, DatasetValidationError
 from ..logging_config import logger
 
 
-class ProgressCallback(TrainerCallback):
-    """Callback to update training progress."""
-
-    def __init__(self, status_dict: Dict):
-        super().__init__()
-        self.status_dict = status_dict
-
-    def on_log(self, args, state, control, logs=None, **kwargs):
-        """Update progress during training."""
-        if state.max_steps <= 0:
-            return
-
-        progress = min(95, int((state.global_step / state.max_steps) * 100))
-        self.status_dict["progress"] = progress
-        self.status_dict["message"] = f"Training step {state.global_step}/{state.max_steps}"
-
-    def on_train_end(self, args, state, control, **kwargs):
-        """Mark training as complete."""
-        self.status_dict["progress"] = 100
-        self.status_dict["message"] = "Training completed!"
+@contextmanager
+def _timed_phase(phase_timings: Dict[str, float], phase: str):
+    """Record the wall-clock duration of a pipeline phase in seconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phase_timings[phase] = round(time.perf_counter() - start, 3)
 
 
 class TrainingService:
     """Service for managing model training."""
 
+    # Steps between writes of buffered training metrics to the run history
+    METRICS_FLUSH_STEPS = 100
+
     def __init__(
         self,
         db_manager: DatabaseManager,
         file_manager: FileManager,
+        model_cache: Optional[BaseModelCache] = None,
+        dataset_store: Optional[DatasetStore] = None,
     ):
         """
         Initialize training service.
@@ -56,10 +65,18 @@ class TrainingService:
         Args:
             db_manager: Database manager instance
             file_manager: File manager instance
+            model_cache: Optional resident base-model cache shared across jobs
+            dataset_store: Optional dataset store; jobs hold a reference to
+                their stored dataset while they run
         """
         self.db_manager = db_manager
         self.file_manager = file_manager
         self.default_dirs = file_manager.return_default_dirs()
+        self.model_cache = model_cache
+        self.dataset_store = dataset_store
+
+        # Content hashes of datasets outside the store: path -> (size, mtime_ns, sha256)
+        self._digest_cache: Dict[str, Tuple[int, int, str]] = {}
 
         # Training status (should be stored in Redis for production)
         self.training_status = {
@@ -82,6 +99,298 @@ class TrainingService:
             "message": "",
         }
 
+    def _start_run(self, run_id: str, config: Dict[str, Any]):
+        """Record a new run in the run history. Failures are logged, not raised."""
+        try:
+            self.db_manager.create_run(
+                run_id=run_id,
+                base_model=config.get("model_name", ""),
+                task=config.get("task", ""),
+                strategy=config.get("strategy", "sft"),
+                provider=config.get("provider", "huggingface"),
+                config=json.dumps(config, default=str),
+            )
+        except Exception as e:
+            logger.warning(f"Could not record run {run_id}: {e}")
+
+    def _finish_run(self, run_id: str, status: str, summary: Dict[str, Any], **fields):
+        """Record the outcome of a run. Failures are logged, not raised."""
+        try:
+            self.db_manager.update_run(
+                run_id,
+                status=status,
+                finished_at=datetime.utcnow(),
+                summary=json.dumps(summary, default=str),
+                **fields,
+            )
+        except Exception as e:
+            logger.warning(f"Could not record the outcome of run {run_id}: {e}")
+
+    def _acquire_dataset(self, dataset_path: str) -> Optional[str]:
+        """Reference a stored dataset for the duration of a job; returns its hash."""
+        sha256 = DatasetStore.sha256_from_path(dataset_path)
+        if self.dataset_store is None or sha256 is None:
+            return None
+        try:
+            return sha256 if self.dataset_store.acquire(sha256) else None
+        except Exception as e:
+            logger.warning(f"Could not reference dataset {sha256}: {e}")
+            return None
+
+    def _release_dataset(self, sha256: Optional[str]):
+        """Release a job's reference to a stored dataset."""
+        if sha256 is None:
+            return
+        try:
+            self.dataset_store.release(sha256)
+        except Exception as e:
+            logger.warning(f"Could not release dataset {sha256}: {e}")
+
+    def deduplicate_dataset(
+        self,
+        dataset_path: str,
+        task: str,
+        strategy: str = "sft",
+        mode: str = "near",
+        threshold: float = DEFAULT_THRESHOLD,
+        dataset: Optional[Any] = None,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Find duplicate examples on the task's text fields.
+
+        Results are cached per file and settings, so the statistics can be
+        checked before training and the job reuses them.
+
+        Args:
+            dataset_path: Path to dataset file
+            task: Task type
+            strategy: Training strategy
+            mode: "exact" or "near" (near also removes exact duplicates)
+            threshold: Near-duplicate Jaccard similarity threshold
+            dataset: The loaded dataset, if already loaded
+
+        Returns:
+            Tuple of (indices of the examples to keep, statistics)
+
+        Raises:
+            DatasetValidationError: If the dataset lacks a required field
+        """
+        text_fields = DatasetValidator.get_required_fields(task, strategy)
+        if dataset is None:
+            dataset = load_dataset_file(dataset_path, columns=text_fields)
+        missing = [field for field in text_fields if field not in dataset.column_names]
+        if missing:
+            raise DatasetValidationError(f"Dataset is missing required fields: {missing}")
+        return deduplicate(
+            dataset,
+            dataset_path,
+            text_fields,
+            mode=mode,
+            threshold=threshold,
+            cache_dir=os.path.join(self.default_dirs["cache"], "dedup"),
+        )
+
+    def _dataset_sha256(self, dataset_path: str) -> str:
+        """
+        Content hash of a dataset file.
+
+        Stored datasets carry it in their name. Other files are hashed once
+        and the digest is reused while their size and modification time are
+        unchanged.
+        """
+        sha256 = DatasetStore.sha256_from_path(dataset_path)
+        if sha256 is not None:
+            return sha256
+
+        stat = os.stat(dataset_path)
+        key = os.path.realpath(dataset_path)
+        cached = self._digest_cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+
+        hasher = hashlib.sha256()
+        with open(dataset_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        self._digest_cache[key] = (stat.st_size, stat.st_mtime_ns, hasher.hexdigest())
+        return hasher.hexdigest()
+
+    def _profile_cache_path(
+        self,
+        dataset_sha256: str,
+        model_name: str,
+        task: str,
+        strategy: str,
+        prompt_format: str,
+        system_prompt: Optional[str],
+        sample_size: Optional[int],
+    ) -> str:
+        """
+        Cache file of a token length profile, keyed by dataset content and tokenizer.
+
+        sample_size is the number of rows actually sampled: None when every
+        row was profiled.
+        """
+        key = json.dumps([
+            dataset_sha256, model_name, task, strategy,
+            prompt_format, system_prompt, sample_size,
+        ])
+        cache_dir = os.path.join(self.default_dirs["cache"], "token_profiles")
+        return os.path.join(cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get_cached_profile(
+        self,
+        dataset_path: str,
+        model_name: str,
+        task: str,
+        strategy: str = "sft",
+        prompt_format: str = "plain",
+        system_prompt: Optional[str] = None,
+        sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a previously computed token length profile.
+
+        Args:
+            dataset_path: Path to dataset file
+            model_name: Model whose tokenizer was used
+            task: Task type
+            strategy: Training strategy
+            prompt_format: Requested prompt format
+            system_prompt: System message for the chat template
+            sample_size: Rows sampled (None for all rows)
+
+        Returns:
+            Profile dictionary, or None if it has not been computed. A profile
+            over every row is returned for any sample size.
+        """
+        return self._find_profile(
+            self._dataset_sha256(dataset_path), model_name, task, strategy, prompt_format, system_prompt, sample_size
+        )
+
+    def _find_profile(
+        self,
+        dataset_sha256: str,
+        model_name: str,
+        task: str,
+        strategy: str,
+        prompt_format: str,
+        system_prompt: Optional[str],
+        sample_size: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        """Read a cached profile over every row, or else over the requested sample."""
+        for sampled in [None] + ([sample_size] if sample_size else []):
+            profile = self._read_profile(self._profile_cache_path(
+                dataset_sha256, model_name, task, strategy, prompt_format, system_prompt, sampled
+            ))
+            if profile is not None:
+                return profile
+        return None
+
+    @staticmethod
+    def _read_profile(cache_path: str) -> Optional[Dict[str, Any]]:
+        """Read a cached token length profile."""
+        if not os.path.exists(cache_path):
+            return None
+        with open(cache_path, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+        profile["cached"] = True
+        return profile
+
+    def profile_dataset(
+        self,
+        dataset_path: str,
+        model_name: str,
+        task: str,
+        strategy: str = "sft",
+        provider: str = "huggingface",
+        prompt_format: str = "plain",
+        system_prompt: Optional[str] = None,
+        sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Profile the token lengths of a dataset with a model's tokenizer.
+
+        Examples are formatted as training formats them. The profile is cached
+        by dataset content hash, model and formatting settings.
+
+        Args:
+            dataset_path: Path to dataset file
+            model_name: Model whose tokenizer is used
+            task: Task type
+            strategy: Training strategy
+            provider: Provider used to load the tokenizer
+            prompt_format: "plain" or "chat_template"
+            system_prompt: System message for the chat template
+            sample_size: Rows to sample (None for all rows)
+
+        Returns:
+            Profile with length percentiles, histogram, truncation rate and
+            padding waste per candidate length, and the recommended
+            max_seq_length
+
+        Raises:
+            DatasetValidationError: If the dataset lacks a required field
+        """
+        dataset_sha256 = self._dataset_sha256(dataset_path)
+        cached = self._find_profile(
+            dataset_sha256, model_name, task, strategy, prompt_format, system_prompt, sample_size
+        )
+        if cached is not None:
+            return cached
+
+        start = time.perf_counter()
+        fields = DatasetValidator.get_required_fields(task, strategy)
+        dataset = load_dataset_file(dataset_path, columns=fields)
+        missing = [field for field in fields if field not in dataset.column_names]
+        if missing:
+            raise DatasetValidationError(f"Dataset is missing required fields: {missing}")
+
+        total = len(dataset)
+        if sample_size and total > sample_size:
+            indices = np.sort(np.random.RandomState(0).choice(total, sample_size, replace=False))
+            dataset = dataset.select(indices)
+        else:
+            # Every row is profiled, whatever sample was requested
+            sample_size = None
+        cache_path = self._profile_cache_path(
+            dataset_sha256, model_name, task, strategy, prompt_format, system_prompt, sample_size
+        )
+        if strategy not in PREFERENCE_STRATEGIES:
+            dataset = self._format_dataset(dataset, task, "")
+
+        tokenizer = ProviderFactory.create_provider(provider).load_tokenizer(model_name)
+        tokenizer.eos_token = tokenizer.eos_token or tokenizer.sep_token
+        resolved_format = resolve_prompt_format(tokenizer, {"prompt_format": prompt_format})
+
+        lengths, prompt_lengths = sequence_lengths(
+            dataset, tokenizer, task, strategy, resolved_format, system_prompt
+        )
+        profile = {
+            "sha256": dataset_sha256,
+            "model_name": model_name,
+            "task": task,
+            "strategy": strategy,
+            "prompt_format": resolved_format,
+            "total": total,
+            "sampled": len(lengths),
+            **summarize_lengths(lengths, prompt_lengths, model_max_length(tokenizer)),
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(profile, f)
+        os.replace(cache_path + ".tmp", cache_path)
+
+        logger.info(
+            f"Token profile of {os.path.basename(dataset_path)} with {model_name}: "
+            f"p50={profile['lengths']['p50']}, p99={profile['lengths']['p99']}, "
+            f"recommended max_seq_length={profile['recommended_max_seq_length']}"
+        )
+        profile["cached"] = False
+        return profile
+
     def validate_and_prepare_dataset(
         self,
         dataset_path: str,
@@ -112,18 +421,20 @@ class TrainingService:
             min_examples=10,
         )
 
-        # Load and get info
-        dataset = load_dataset("json", data_files=dataset_path, split="train")
+        # Get info; columnar files are described from their metadata
+        num_examples, fields = describe_dataset_file(dataset_path)
 
         return {
-            "num_examples": len(dataset),
-            "fields": dataset.column_names,
+            "num_examples": num_examples,
+            "fields": fields,
         }
 
     def train_model(
         self,
         config: Dict[str, Any],
         background: bool = False,
+        run_id: Optional[str] = None,
+        pruner: Optional[Any] = None,
     ) -> Dict:
         """
         Train a model with the given configuration.
@@ -131,6 +442,9 @@ class TrainingService:
         Args:
             config: Training configuration dictionary
             background: Whether to run in background (for async execution)
+            run_id: Identifier to record the run under (default: a new UUID)
+            pruner: Sweep pruning callback; a trial it stops is recorded as
+                pruned and no model is saved
 
         Returns:
             Dictionary with training result
@@ -140,11 +454,42 @@ class TrainingService:
         """
         logger.info(f"Starting training with config: {config.get('task')}, {config.get('strategy')}")
 
+        # Key of the base model checked out of the warm cache, if any
+        cache_key = None
+
+        # Every job is recorded in the run history, whether it succeeds or not
+        run_id = run_id or str(uuid.uuid4())
+        self._start_run(run_id, config)
+        dataset_sha256 = self._acquire_dataset(config["dataset"])
+        run_metrics = None
+        early_stop = None
+
+        # Wall-clock seconds per pipeline phase, reported in the job status
+        phase_timings: Dict[str, float] = {}
+        job_start = time.perf_counter()
+
         try:
+            # ML libraries are imported here rather than at module level so the
+            # API can start without loading torch/transformers/datasets.
+            from ..utilities.finetuning.quantization import QuantizationFactory
+            from ..evaluation.streaming_metrics import attach_streaming_metrics
+            from ..evaluation.eval_subset import select_eval_subset
+            from .training_callbacks import (
+                ProgressCallback,
+                EvalTimingCallback,
+                EarlyStoppingCallback,
+                RunMetricsCallback,
+            )
+
             # Update status
             self.training_status["status"] = "running"
             self.training_status["progress"] = 0
             self.training_status["message"] = "Initializing training..."
+            self.training_status["phase_timings"] = phase_timings
+            self.training_status["eval_count"] = 0
+            self.training_status["early_stop"] = None
+            self.training_status["dedup"] = None
+            self.training_status["run_id"] = run_id
 
             # Create provider
             provider_name = config.get("provider", "huggingface")
@@ -200,8 +545,6 @@ class TrainingService:
                 use_double_quant=config.get("use_nested_quant", False),
             )
 
-            # Load model
-            self.training_status["message"] = "Loading model..."
             model_class_map = {
                 "text-generation": "AutoModelForCausalLM",
                 "summarization": "AutoModelForSeq2SeqLM",
@@ -209,66 +552,96 @@ class TrainingService:
             }
             model_class = model_class_map[config["task"]]
 
-            # Handle Unsloth special case (returns model and tokenizer together)
-            if provider_name == "unsloth":
-                model, tokenizer = provider.load_model(
-                    model_id=config["model_name"],
-                    model_class=model_class,
-                    quantization_config=quant_config,
-                    max_seq_length=config.get("max_seq_length", 2048),
-                )
-                tokenizer.eos_token = tokenizer.eos_token or tokenizer.sep_token
-            else:
-                model = provider.load_model(
-                    model_id=config["model_name"],
-                    model_class=model_class,
-                    quantization_config=quant_config,
-                )
-                tokenizer = provider.load_tokenizer(config["model_name"])
-                tokenizer.eos_token = tokenizer.eos_token or tokenizer.sep_token
+            # Reuse a resident quantized base model from a previous job if possible
+            cached = None
+            if self._use_model_cache(config, provider_name, strategy_name):
+                cache_key = BaseModelCache.make_key(config, model_class)
+                cached = self.model_cache.acquire(cache_key)
+
+            # Dataset preparation only needs the tokenizer, so it runs on a worker
+            # thread while the model is downloaded and loaded. The worker gets a
+            # snapshot of the config because precision detection mutates it.
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dataset-prep")
+            try:
+                if cached is not None:
+                    model, tokenizer = cached
+                    self.training_status["message"] = "Using cached base model, preparing dataset..."
+                    dataset_future = executor.submit(
+                        self._prepare_datasets, strategy, tokenizer, dict(config), phase_timings
+                    )
 
-            # Auto-detect and correct precision settings to prevent Unsloth errors
-            config = self._auto_detect_precision_settings(model, config)
+                # Handle Unsloth special case (returns model and tokenizer together).
+                # Only loading, formatting and splitting overlap with the model load;
+                # tokenization waits for Unsloth's patched tokenizer.
+                elif provider_name == "unsloth":
+                    dataset_future = executor.submit(
+                        self._prepare_datasets, strategy, None, dict(config), phase_timings
+                    )
+                    self.training_status["message"] = "Loading model and dataset..."
+                    with _timed_phase(phase_timings, "model_load"):
+                        model, tokenizer = provider.load_model(
+                            model_id=config["model_name"],
+                            model_class=model_class,
+                            quantization_config=quant_config,
+                            max_seq_length=config.get("max_seq_length", 2048),
+                        )
+                    tokenizer.eos_token = tokenizer.eos_token or tokenizer.sep_token
+                else:
+                    self.training_status["message"] = "Loading tokenizer..."
+                    with _timed_phase(phase_timings, "tokenizer_load"):
+                        tokenizer = provider.load_tokenizer(config["model_name"])
+                    tokenizer.eos_token = tokenizer.eos_token or tokenizer.sep_token
 
-            # Load and prepare dataset
-            self.training_status["message"] = "Loading dataset..."
-            dataset = load_dataset(
-                "json",
-                data_files=config["dataset"],
-                split="train"
-            )
+                    dataset_future = executor.submit(
+                        self._prepare_datasets, strategy, tokenizer, dict(config), phase_timings
+                    )
+                    self.training_status["message"] = "Loading model and preparing dataset..."
+                    with _timed_phase(phase_timings, "model_load"):
+                        model = provider.load_model(
+                            model_id=config["model_name"],
+                            model_class=model_class,
+                            quantization_config=quant_config,
+                        )
 
-            # Format dataset based on task
-            dataset = self._format_dataset(dataset, config["task"], config.get("compute_specs", "low_end"))
+                with _timed_phase(phase_timings, "dataset_wait"):
+                    train_dataset, eval_dataset = dataset_future.result()
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
-            # Split into train/eval
-            eval_split = config.get("eval_split", 0.2)
-            if eval_split > 0:
-                split_dataset = dataset.train_test_split(test_size=eval_split, seed=42)
-                train_dataset = split_dataset["train"]
-                eval_dataset = split_dataset["test"]
-            else:
-                train_dataset = dataset
-                eval_dataset = None
+            if provider_name == "unsloth" and cached is None:
+                self.training_status["message"] = "Tokenizing dataset..."
+                with _timed_phase(phase_timings, "dataset_tokenize"):
+                    train_dataset, eval_dataset = self._tokenize_datasets(
+                        strategy, train_dataset, eval_dataset, tokenizer, config
+                    )
 
-            # Prepare dataset with strategy
-            train_dataset = strategy.prepare_dataset(train_dataset, tokenizer, config)
-            if eval_dataset:
-                eval_dataset = strategy.prepare_dataset(eval_dataset, tokenizer, config)
+            # Periodic evaluation runs on a fixed-size stratified subset; the full
+            # split is evaluated once after training
+            full_eval_dataset = eval_dataset
+            if eval_dataset is not None and config.get("eval_max_samples"):
+                eval_dataset = select_eval_subset(
+                    eval_dataset,
+                    config["eval_max_samples"],
+                    cache_dir=os.path.join(self.default_dirs["cache"], "eval_subsets"),
+                )
+
+            # Auto-detect and correct precision settings to prevent Unsloth errors
+            config = self._auto_detect_precision_settings(model, config)
 
             # Prepare model with strategy
             self.training_status["message"] = "Preparing model for training..."
 
             # Handle Unsloth special case for model preparation
-            if provider_name == "unsloth":
-                model = provider.prepare_for_training(
-                    model=model,
-                    lora_r=config.get("lora_r", 16),
-                    lora_alpha=config.get("lora_alpha", 32),
-                    lora_dropout=config.get("lora_dropout", 0.1),
-                )
-            else:
-                model = strategy.prepare_model(model, config)
+            with _timed_phase(phase_timings, "model_prepare"):
+                if provider_name == "unsloth":
+                    model = provider.prepare_for_training(
+                        model=model,
+                        lora_r=config.get("lora_r", 16),
+                        lora_alpha=config.get("lora_alpha", 32),
+                        lora_dropout=config.get("lora_dropout", 0.1),
+                    )
+                else:
+                    model = strategy.prepare_model(model, config)
 
             # Generate output paths
             model_id = str(uuid.uuid4())
@@ -284,7 +657,8 @@ class TrainingService:
 
             # Update config with paths
             config["output_dir"] = checkpoint_dir
-            config["logging_dir"] = "./training_logs"
+            config["logging_dir"] = os.path.join(self.default_dirs["logs"], run_id)
+            config["reference_logps_dir"] = os.path.join(self.default_dirs["cache"], "reference_logps")
 
             # Calculate max_steps for proper progress tracking
             if config.get("max_steps", -1) <= 0:
@@ -303,23 +677,35 @@ class TrainingService:
 
             tokenizer.eos_token = tokenizer.eos_token or tokenizer.sep_token
 
-            # Get metrics function
-            metrics_fn = MetricsCalculator.get_metrics_fn_for_task(
-                config["task"],
-                tokenizer
-            )
-
             # Create trainer with progress callback and precision failsafe
             self.training_status["message"] = "Creating trainer..."
-            trainer = self._create_trainer_with_failsafe(
-                strategy=strategy,
-                model=model,
-                train_dataset=train_dataset,
-                eval_dataset=eval_dataset,
-                tokenizer=tokenizer,
-                config=config,
-                callbacks=[ProgressCallback(self.training_status)],
+            early_stopping = EarlyStoppingCallback(
+                self.training_status,
+                patience=config.get("early_stopping_patience") if eval_dataset is not None else None,
+                min_delta=config.get("early_stopping_min_delta", 0.0),
+                stop_on_nan=config.get("stop_on_nan", True),
+                grad_norm_threshold=config.get("grad_norm_threshold"),
             )
+            run_metrics = RunMetricsCallback(self.db_manager, run_id, flush_every=self.METRICS_FLUSH_STEPS)
+            with _timed_phase(phase_timings, "trainer_create"):
+                trainer = self._create_trainer_with_failsafe(
+                    strategy=strategy,
+                    model=model,
+                    train_dataset=train_dataset,
+                    eval_dataset=eval_dataset,
+                    tokenizer=tokenizer,
+                    config=config,
+                    callbacks=[
+                        ProgressCallback(self.training_status),
+                        EvalTimingCallback(phase_timings, self.training_status),
+                        early_stopping,
+                        run_metrics,
+                    ] + ([pruner] if pruner is not None else []),
+                )
+
+            # Stream eval metrics batch by batch instead of gathering all logits
+            if eval_dataset is not None and strategy_name in ("sft", "qlora") and config.get("compute_eval_metrics", True):
+                attach_streaming_metrics(trainer, config["task"], tokenizer, model)
 
             # Verify single-process mode for Unsloth (debug logging)
             if provider_name == "unsloth":
@@ -337,20 +723,98 @@ class TrainingService:
 
             # Train
             self.training_status["message"] = "Training in progress..."
-            trainer.train()
+            with _timed_phase(phase_timings, "train"):
+                trainer.train()
+            # RLHF reports rollout, reward and optimization time separately
+            phase_timings.update(
+                {phase: round(seconds, 3) for phase, seconds in getattr(trainer, "phase_timings", {}).items()}
+            )
+            phase_timings["train_excluding_eval"] = round(phase_timings["train"] - phase_timings.get("eval", 0.0), 3)
+
+            # A diverged run is only usable if the best checkpoint was restored
+            early_stop = early_stopping.stop_info
+            if early_stop is not None:
+                config["early_stop"] = early_stop
+                if early_stopping.diverged and not getattr(trainer.state, "best_model_checkpoint", None):
+                    raise TrainingError(
+                        f"Training diverged at step {early_stop['step']}: {early_stop['detail']}"
+                    )
 
-            # Save model
+            # A pruned sweep trial keeps the base model warm for the next trial
+            # but leaves no model or checkpoints behind
+            if pruner is not None and pruner.pruned is not None:
+                run_metrics.flush()
+                if cache_key is not None:
+                    self.model_cache.release(cache_key, trainer.model, tokenizer)
+                    cache_key = None
+                shutil.rmtree(checkpoint_dir, ignore_errors=True)
+                phase_timings["total"] = round(time.perf_counter() - job_start, 3)
+                self._log_phase_timings(phase_timings)
+
+                self.training_status["status"] = "pruned"
+                self.training_status["progress"] = 100
+                self.training_status["message"] = f"Trial pruned at step {pruner.pruned['step']}"
+                self._finish_run(
+                    run_id,
+                    "pruned",
+                    {
+                        "phase_timings": phase_timings,
+                        "eval_count": self.training_status["eval_count"],
+                        "pruned": pruner.pruned,
+                        "early_stop": early_stop,
+                    },
+                )
+                return {
+                    "success": True,
+                    "run_id": run_id,
+                    "model_id": None,
+                    "model_path": None,
+                    "message": "Trial pruned",
+                    "phase_timings": phase_timings,
+                    "pruned": pruner.pruned,
+                    "early_stop": early_stop,
+                }
+
+            # Final evaluation on the full eval split when periodic evals used a subset
+            eval_metrics = None
+            if full_eval_dataset is not None and full_eval_dataset is not eval_dataset and config.get("final_full_eval", True):
+                self.training_status["message"] = "Running final evaluation on the full eval split..."
+                with _timed_phase(phase_timings, "eval_full"):
+                    # Preference trainers tokenize their splits when created; the full split must be too
+                    if hasattr(strategy, "prepare_eval_dataset"):
+                        full_eval_dataset = strategy.prepare_eval_dataset(trainer, full_eval_dataset, config)
+                    eval_metrics = trainer.evaluate(eval_dataset=full_eval_dataset)
+                logger.info(f"Final evaluation on {len(full_eval_dataset)} examples: {eval_metrics}")
+                config["eval_metrics"] = eval_metrics
+            run_metrics.flush()
+
+            # Save model and tokenizer
             self.training_status["message"] = "Saving model..."
-            trainer.model.save_pretrained(model_output_path)
-
-            # Save tokenizer
-            tokenizer.save_pretrained(model_output_path)
-
-            # Create modelforge config file
+            with _timed_phase(phase_timings, "save"):
+                # The RLHF value-head wrapper writes its head before the adapters create the directory
+                os.makedirs(model_output_path, exist_ok=True)
+                trainer.model.save_pretrained(model_output_path)
+                tokenizer.save_pretrained(model_output_path)
+
+            # Keep the base model resident for the next job; adapters are stripped
+            if cache_key is not None:
+                self.model_cache.release(cache_key, trainer.model, tokenizer)
+                cache_key = None
+
+            phase_timings["total"] = round(time.perf_counter() - job_start, 3)
+            self._log_phase_timings(phase_timings)
+            config["phase_timings"] = phase_timings
+
+            # Create modelforge config file. Only SFT and QLoRA apply the prompt format.
+            prompt_format = "plain"
+            if strategy_name in ("sft", "qlora"):
+                prompt_format = resolve_prompt_format(tokenizer, config)
             self._create_model_config(
                 model_output_path,
                 config["task"],
                 model_class,
+                prompt_format=prompt_format,
+                system_prompt=config.get("system_prompt"),
             )
 
             # Add to database
@@ -370,14 +834,37 @@ class TrainingService:
             self.training_status["status"] = "completed"
             self.training_status["progress"] = 100
             self.training_status["message"] = "Training completed successfully!"
+            if early_stop is not None:
+                self.training_status["message"] = (
+                    f"Training completed (stopped early at step {early_stop['step']}: {early_stop['detail']})"
+                )
+
+            self._finish_run(
+                run_id,
+                "completed",
+                {
+                    "phase_timings": phase_timings,
+                    "eval_count": self.training_status["eval_count"],
+                    "eval_metrics": eval_metrics,
+                    "early_stop": early_stop,
+                    "dedup": self.training_status.get("dedup"),
+                },
+                model_id=model_id,
+            )
 
             logger.info(f"Training completed successfully: {model_id}")
 
             return {
                 "success": True,
+                "run_id": run_id,
                 "model_id": model_id,
                 "model_path": model_output_path,
                 "message": "Training completed successfully",
+                "phase_timings": phase_timings,
+                "eval_count": self.training_status["eval_count"],
+                "eval_metrics": eval_metrics,
+                "early_stop": early_stop,
+                "dedup": self.training_status.get("dedup"),
             }
 
         except Exception as e:
@@ -385,14 +872,138 @@ class TrainingService:
             self.training_status["status"] = "error"
             self.training_status["message"] = str(e)
 
+            # A failed job may leave the base model in an unknown state
+            if cache_key is not None:
+                self.model_cache.discard(cache_key)
+
+            if run_metrics is not None:
+                run_metrics.flush()
+            self._finish_run(
+                run_id,
+                "failed",
+                {"phase_timings": phase_timings, "early_stop": early_stop},
+                error=str(e),
+            )
+
             return {
                 "success": False,
+                "run_id": run_id,
                 "model_id": None,
                 "model_path": None,
                 "message": "Training failed",
                 "error": str(e),
             }
 
+        finally:
+            self._release_dataset(dataset_sha256)
+
+    def _prepare_datasets(
+        self,
+        strategy: Any,
+        tokenizer: Optional[Any],
+        config: Dict[str, Any],
+        phase_timings: Dict[str, float],
+    ) -> Tuple[Any, Optional[Any]]:
+        """
+        Load, format and split the dataset, then tokenize it if a tokenizer is given.
+
+        Runs on the dataset-prep worker thread, concurrently with model loading.
+
+        Args:
+            strategy: Training strategy instance
+            tokenizer: Tokenizer, or None to return untokenized splits
+            config: Snapshot of the training configuration
+            phase_timings: Dictionary the phase durations are recorded in
+
+        Returns:
+            Tuple of (train_dataset, eval_dataset); eval_dataset is None without an eval split
+        """
+        with _timed_phase(phase_timings, "dataset_load"):
+            # Only the fields the task uses are loaded (read from disk for columnar files)
+            dataset = load_dataset_file(
+                config["dataset"],
+                columns=DatasetValidator.get_required_fields(config["task"], config.get("strategy", "sft")),
+            )
+
+            # Optionally drop exact and near-duplicate examples; the result is
+            # cached if the stats were checked before training
+            if config.get("dedup", "off") != "off":
+                self.training_status["message"] = "Removing duplicate examples..."
+                keep, stats = self.deduplicate_dataset(
+                    config["dataset"],
+                    config["task"],
+                    config.get("strategy", "sft"),
+                    mode=config["dedup"],
+                    threshold=config.get("dedup_threshold", DEFAULT_THRESHOLD),
+                    dataset=dataset,
+                )
+                if len(keep) < len(dataset):
+                    dataset = dataset.select(keep)
+                self.training_status["dedup"] = stats
+
+            # Format dataset based on task; preference pairs are used as-is
+            if config.get("strategy", "sft") not in PREFERENCE_STRATEGIES:
+                dataset = self._format_dataset(dataset, config["task"], config.get("compute_specs", "low_end"))
+
+            # Split into train/eval
+            eval_split = config.get("eval_split", 0.2)
+            if eval_split > 0:
+                split_dataset = dataset.train_test_split(test_size=eval_split, seed=42)
+                train_dataset = split_dataset["train"]
+                eval_dataset = split_dataset["test"]
+            else:
+                train_dataset = dataset
+                eval_dataset = None
+
+        if tokenizer is None:
+            return train_dataset, eval_dataset
+
+        with _timed_phase(phase_timings, "dataset_tokenize"):
+            return self._tokenize_datasets(strategy, train_dataset, eval_dataset, tokenizer, config)
+
+    @staticmethod
+    def _tokenize_datasets(
+        strategy: Any,
+        train_dataset: Any,
+        eval_dataset: Optional[Any],
+        tokenizer: Any,
+        config: Dict[str, Any],
+    ) -> Tuple[Any, Optional[Any]]:
+        """Prepare the train and eval splits with the strategy."""
+        train_dataset = strategy.prepare_dataset(train_dataset, tokenizer, config)
+        if eval_dataset:
+            eval_dataset = strategy.prepare_dataset(eval_dataset, tokenizer, config)
+        return train_dataset, eval_dataset
+
+    @staticmethod
+    def _log_phase_timings(phase_timings: Dict[str, float]):
+        """Log per-phase timings and the time saved by overlapping dataset prep."""
+        logger.info(
+            "Training phase timings (s): "
+            + ", ".join(f"{phase}={seconds:.2f}" for phase, seconds in phase_timings.items())
+        )
+        if "model_load" in phase_timings:
+            dataset_prep = phase_timings.get("dataset_load", 0.0) + phase_timings.get("dataset_tokenize", 0.0)
+            overlapped = phase_timings["model_load"] + phase_timings.get("dataset_wait", 0.0)
+            saved = phase_timings["model_load"] + dataset_prep - overlapped
+            logger.info(f"Overlapping dataset preparation with model loading saved {max(saved, 0.0):.2f}s")
+
+    def _use_model_cache(self, config: Dict[str, Any], provider_name: str, strategy_name: str) -> bool:
+        """
+        Decide whether this job may use the resident base-model cache.
+
+        Unsloth patches the model in ways that cannot be undone, and RLHF wraps
+        it in a value head, so both always load a fresh model.
+        """
+        if self.model_cache is None or not self.model_cache.enabled:
+            return False
+        if not config.get("cache_base_model", False):
+            return False
+        if provider_name == "unsloth" or strategy_name == "rlhf":
+            logger.info(f"Base model cache not supported for {provider_name}/{strategy_name}, loading fresh")
+            return False
+        return True
+
     def _format_dataset(self, dataset, task: str, compute_specs: str):
         """
         Format dataset based on task type.
@@ -633,12 +1244,26 @@ class TrainingService:
                 # Not an Unsloth precision error, re-raise
                 raise
 
-    def _create_model_config(self, config_dir: str, pipeline_task: str, model_class: str):
-        """Create modelforge config file for playground compatibility."""
+    def _create_model_config(
+        self,
+        config_dir: str,
+        pipeline_task: str,
+        model_class: str,
+        prompt_format: str = "plain",
+        system_prompt: Optional[str] = None,
+    ):
+        """
+        Create modelforge config file for playground compatibility.
+
+        The prompt format and system prompt are recorded so the playground
+        formats prompts exactly as they were formatted for training.
+        """
         try:
             config = {
                 "model_class": model_class.replace("AutoModel", "AutoPeftModel"),
                 "pipeline_task": pipeline_task,
+                "prompt_format": prompt_format,
+                "system_prompt": system_prompt,
             }
 
             config_path = os.path.join(config_dir, "modelforge_config.json")
@@ -5,6 +5,7 @@ DPO is a simpler alternative to RLHF that doesn't require a reward model.
 from typing import Any, Dict
 from peft import LoraConfig, get_peft_model, TaskType, prepare_model_for_kbit_training
 
+from .reference_logps import attach_reference_logps, reference_logps_for
 from ..logging_config import logger
 from ..exceptions import TrainingError
 
@@ -113,6 +114,8 @@ class DPOStrategy:
                 "Install with: pip install trl"
             ) from e
 
+        precompute = config.get("precompute_ref_logps", True)
+
         # Create DPO config
         training_args = DPOConfig(
             output_dir=config.get("output_dir", "./checkpoints"),
@@ -129,12 +132,15 @@ class DPOStrategy:
             logging_steps=config.get("logging_steps", 10),
             save_steps=config.get("save_steps", 100),
             # DPO-specific settings
-            beta=config.get("beta", 0.1),  # DPO temperature parameter
+            beta=config.get("beta") or 0.1,  # DPO temperature parameter
             loss_type=config.get("loss_type", "sigmoid"),  # sigmoid or hinge
             max_length=config.get("max_seq_length", 512),
             max_prompt_length=config.get("max_prompt_length", 128),
+            # Reference log-probs are computed once before training (below), so
+            # no reference model copy is created and steps need a single forward
+            precompute_ref_log_probs=precompute,
             # Evaluation settings
-            evaluation_strategy="steps" if eval_dataset else "no",
+            eval_strategy="steps" if eval_dataset else "no",
             eval_steps=config.get("eval_steps", 100),
             save_strategy="steps",
             load_best_model_at_end=True if eval_dataset else False,
@@ -145,21 +151,59 @@ class DPOStrategy:
         )
 
         # Create trainer
-        # Note: DPOTrainer needs a reference model for computing KL divergence
-        # We'll use the same model as reference (it will be frozen internally)
+        # The reference is the base model: a LoRA model with its adapters
+        # disabled, or (when computed on the fly) a frozen copy of the model
         trainer = DPOTrainer(
             model=model,
-            ref_model=None,  # DPOTrainer will create a copy
+            ref_model=None,
             args=training_args,
             train_dataset=train_dataset,
             eval_dataset=eval_dataset,
-            tokenizer=tokenizer,
+            processing_class=tokenizer,
             callbacks=callbacks or [],
         )
 
+        if precompute:
+            config["reference_logps"] = attach_reference_logps(
+                trainer,
+                train_dataset,
+                eval_dataset,
+                config,
+                cache_dir=config.get("reference_logps_dir"),
+                batch_size=config.get("precompute_ref_batch_size") or config.get("per_device_eval_batch_size", 1),
+            )
+
         logger.info("DPOTrainer created successfully")
         return trainer
 
+    def prepare_eval_dataset(self, trainer: Any, dataset: Any, config: Dict) -> Any:
+        """
+        Tokenize an extra eval split the way DPOTrainer tokenized its own.
+
+        DPOTrainer tokenizes its datasets when created, so a split passed to
+        ``evaluate`` later must be tokenized here first. With precomputed
+        reference log-probs, they are attached as well.
+
+        Args:
+            trainer: DPOTrainer returned by create_trainer
+            dataset: Untokenized eval split
+            config: Training configuration
+
+        Returns:
+            Tokenized eval split
+        """
+        tokenized = trainer._prepare_dataset(dataset, trainer.processing_class, trainer.args, "eval")
+        if config.get("precompute_ref_logps", True):
+            tokenized = reference_logps_for(
+                trainer,
+                tokenized,
+                dataset,
+                config,
+                cache_dir=config.get("reference_logps_dir"),
+                batch_size=config.get("precompute_ref_batch_size") or config.get("per_device_eval_batch_size", 1),
+            )
+        return tokenized
+
     def get_required_dataset_fields(self) -> list:
         """
         Get required dataset fields for DPO.
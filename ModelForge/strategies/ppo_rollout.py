@@ -0,0 +1,175 @@
+"""
+Batched rollout generation for PPO.
+
+Each PPO step samples a response from the policy for every prompt in the
+rollout batch. Generating them one prompt at a time leaves the accelerator
+idle. RolloutEngine generates them in batches instead:
+
+- Prompts are bucketed by token length, so the prompts in a generate() call
+  are of similar length and left padding wastes little compute.
+- Batches are left-padded, so all rows start generating at the same position,
+  and decoded with the KV cache.
+- Generation stops at EOS, at any of the stop strings, or after
+  max_new_tokens. Finished rows are padded until the whole batch is done.
+
+A callback receives each batch as soon as it is generated, so the trainer can
+queue it for reward scoring while the next batch is being generated.
+"""
+import time
+from typing import Any, Callable, List, Optional, Sequence
+
+from ..logging_config import logger
+
+
+class Rollout:
+    """Prompts and sampled responses of one rollout batch, in prompt order."""
+
+    def __init__(self, prompts: List[str], queries: List[List[int]], responses: List[List[int]], texts: List[str], seconds: float):
+        """
+        Args:
+            prompts: Prompt texts
+            queries: Prompt token ids (truncated, unpadded)
+            responses: Response token ids (unpadded, ending with EOS if generated)
+            texts: Decoded responses without special tokens
+            seconds: Wall time spent generating
+        """
+        self.prompts = prompts
+        self.queries = queries
+        self.responses = responses
+        self.texts = texts
+        self.seconds = seconds
+
+    def __len__(self) -> int:
+        return len(self.prompts)
+
+
+class RolloutEngine:
+    """Generates responses for batches of prompts."""
+
+    def __init__(
+        self,
+        model: Any,
+        tokenizer: Any,
+        max_new_tokens: int = 128,
+        batch_size: int = 16,
+        temperature: float = 1.0,
+        top_p: float = 1.0,
+        stop_sequences: Optional[Sequence[str]] = None,
+        max_prompt_length: Optional[int] = None,
+    ):
+        """
+        Args:
+            model: Causal LM (or value-head wrapper) with generate()
+            tokenizer: The model's tokenizer
+            max_new_tokens: Maximum response length in tokens
+            batch_size: Prompts per generate() call
+            temperature: Sampling temperature; 0 decodes greedily
+            top_p: Nucleus sampling probability mass
+            stop_sequences: Strings that end a response, besides EOS
+            max_prompt_length: Prompts are truncated to their last this many tokens
+        """
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_new_tokens = max_new_tokens
+        self.batch_size = batch_size
+        self.temperature = temperature
+        self.top_p = top_p
+        self.stop_sequences = list(stop_sequences or [])
+        self.max_prompt_length = max_prompt_length
+
+        if self.tokenizer.pad_token_id is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+
+    def _device(self) -> Any:
+        return next(self.model.parameters()).device
+
+    def _stopping_criteria(self) -> Any:
+        from transformers import StoppingCriteriaList, StopStringCriteria
+
+        if not self.stop_sequences:
+            return None
+        return StoppingCriteriaList([StopStringCriteria(self.tokenizer, self.stop_sequences)])
+
+    def _trim(self, tokens: List[int]) -> List[int]:
+        """Cut a generated row after its first EOS and drop trailing padding."""
+        eos, pad = self.tokenizer.eos_token_id, self.tokenizer.pad_token_id
+        if eos is not None and eos in tokens:
+            return tokens[:tokens.index(eos) + 1]
+        end = len(tokens)
+        while end > 1 and tokens[end - 1] == pad:
+            end -= 1
+        return tokens[:end]
+
+    def generate(
+        self,
+        prompts: Sequence[str],
+        on_batch: Optional[Callable[[List[int], List[str]], None]] = None,
+    ) -> Rollout:
+        """
+        Sample one response per prompt.
+
+        Args:
+            prompts: Prompt texts
+            on_batch: Called with (prompt indices, response texts) after each
+                generate() call
+
+        Returns:
+            Rollout with responses in prompt order
+        """
+        import torch
+
+        start = time.perf_counter()
+        prompts = list(prompts)
+        queries = self.tokenizer(prompts, add_special_tokens=True, return_attention_mask=False)["input_ids"]
+        if self.max_prompt_length:
+            queries = [ids[-self.max_prompt_length:] for ids in queries]
+
+        # Length buckets: similar prompt lengths share a batch
+        order = sorted(range(len(prompts)), key=lambda i: len(queries[i]))
+        responses: List[Optional[List[int]]] = [None] * len(prompts)
+        texts: List[Optional[str]] = [None] * len(prompts)
+
+        device = self._device()
+        stopping_criteria = self._stopping_criteria()
+        sampling = {"do_sample": False}
+        if self.temperature > 0:
+            sampling = {"do_sample": True, "temperature": self.temperature, "top_p": self.top_p, "top_k": 0}
+
+        was_training = self.model.training
+        self.model.eval()
+        try:
+            for first in range(0, len(order), self.batch_size):
+                batch = order[first:first + self.batch_size]
+                width = max(len(queries[i]) for i in batch)
+                input_ids = torch.full((len(batch), width), self.tokenizer.pad_token_id, dtype=torch.long)
+                attention_mask = torch.zeros((len(batch), width), dtype=torch.long)
+                for row, i in enumerate(batch):
+                    input_ids[row, width - len(queries[i]):] = torch.tensor(queries[i])
+                    attention_mask[row, width - len(queries[i]):] = 1
+
+                with torch.no_grad():
+                    output = self.model.generate(
+                        input_ids=input_ids.to(device),
+                        attention_mask=attention_mask.to(device),
+                        max_new_tokens=self.max_new_tokens,
+                        use_cache=True,
+                        pad_token_id=self.tokenizer.pad_token_id,
+                        eos_token_id=self.tokenizer.eos_token_id,
+                        stopping_criteria=stopping_criteria,
+                        **sampling,
+                    )
+
+                generated = output[:, width:].tolist()
+                batch_texts = []
+                for i, tokens in zip(batch, generated):
+                    responses[i] = self._trim(tokens)
+                    texts[i] = self.tokenizer.decode(responses[i], skip_special_tokens=True)
+                    batch_texts.append(texts[i])
+                if on_batch is not None:
+                    on_batch(batch, batch_texts)
+        finally:
+            self.model.train(was_training)
+
+        seconds = time.perf_counter() - start
+        logger.debug(f"Generated {len(prompts)} rollouts in {seconds:.2f}s")
+        return Rollout(prompts, queries, responses, texts, seconds)
@@ -0,0 +1,403 @@
+"""
+PPO training loop fed by batched rollouts.
+
+Each PPO step has three phases, timed separately:
+
+1. Rollout: RolloutEngine samples a response for every prompt of the batch.
+   Each generated batch is queued for reward scoring right away, so scoring
+   overlaps the rest of the generation.
+2. Reward: waiting for the RewardScorer to finish the last batches.
+3. Optimization: one no-grad pass for the old log-probabilities, values and
+   reference log-probabilities, then ppo_epochs of clipped policy and value
+   updates over mini-batches.
+
+The reference model is the policy with its LoRA adapters disabled, so no copy
+of the model is kept. The per-token reward is the KL penalty against the
+reference plus the reward model's score on the last response token;
+advantages are computed with GAE.
+
+The trainer reports to the usual TrainerCallbacks (progress, early stopping,
+run metrics, TensorBoard), so the training service drives it like the TRL
+trainers.
+"""
+import copy
+import math
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .ppo_rollout import RolloutEngine
+from .reward_scoring import RewardScorer
+from ..logging_config import logger
+
+
+class RolloutPPOTrainer:
+    """PPO on a value-head policy with batched rollouts and reward scoring."""
+
+    def __init__(
+        self,
+        model: Any,
+        tokenizer: Any,
+        train_dataset: Any,
+        reward_scorer: RewardScorer,
+        config: Dict[str, Any],
+        eval_dataset: Optional[Any] = None,
+        callbacks: Optional[list] = None,
+    ):
+        """
+        Args:
+            model: AutoModelForCausalLMWithValueHead wrapping the (LoRA) policy
+            tokenizer: Policy tokenizer
+            train_dataset: Dataset with a "prompt" column
+            reward_scorer: Scorer for generated responses
+            config: Training configuration
+            eval_dataset: Dataset with a "prompt" column, for evaluate()
+            callbacks: TrainerCallbacks
+        """
+        import torch
+        from transformers import DefaultFlowCallback, TrainerControl, TrainerState, TrainingArguments
+        from transformers.integrations import TensorBoardCallback
+        from transformers.trainer_callback import CallbackHandler
+
+        self.model = model
+        self.tokenizer = tokenizer
+        self.train_dataset = train_dataset
+        self.eval_dataset = eval_dataset
+        self.reward_scorer = reward_scorer
+        self.config = config
+
+        self.batch_size = config.get("rollout_batch_size", 64)
+        self.mini_batch_size = config.get("mini_batch_size", 4)
+        self.gradient_accumulation_steps = config.get("gradient_accumulation_steps", 1)
+        self.ppo_epochs = config.get("ppo_epochs", 4)
+        self.kl_coef = config.get("kl_coef", 0.05)
+        self.cliprange = config.get("cliprange", 0.2)
+        self.cliprange_value = config.get("cliprange_value", 0.2)
+        self.vf_coef = config.get("vf_coef", 0.1)
+        self.gamma = config.get("gamma", 1.0)
+        self.lam = config.get("lam", 0.95)
+        self.target_kl = config.get("target_kl")
+        self.max_grad_norm = config.get("max_grad_norm", 1.0)
+
+        self.engine = RolloutEngine(
+            model,
+            tokenizer,
+            max_new_tokens=config.get("max_new_tokens", 128),
+            batch_size=config.get("generation_batch_size", 16),
+            temperature=config.get("temperature", 1.0),
+            top_p=config.get("top_p", 1.0),
+            stop_sequences=config.get("stop_sequences"),
+            max_prompt_length=config.get("max_prompt_length"),
+        )
+
+        # Without adapters to disable, the reference is a frozen copy
+        self.ref_model = None
+        if not getattr(model, "is_peft_model", False):
+            self.ref_model = copy.deepcopy(model.pretrained_model).eval().requires_grad_(False)
+
+        # Dropout would make the PPO ratio differ from 1 before any update
+        for module in model.modules():
+            if isinstance(module, torch.nn.Dropout):
+                module.p = 0.0
+
+        if config.get("gradient_checkpointing"):
+            model.pretrained_model.gradient_checkpointing_enable()
+            if getattr(model, "is_peft_model", False):
+                model.pretrained_model.enable_input_require_grads()
+
+        self.optimizer = torch.optim.AdamW(
+            [p for p in model.parameters() if p.requires_grad],
+            lr=config.get("learning_rate", 1.41e-5),
+            weight_decay=config.get("weight_decay", 0.0),
+        )
+        self.device = next(model.parameters()).device
+        self.autocast_dtype = torch.bfloat16 if config.get("bf16") and self.device.type == "cuda" else None
+        self.generator = np.random.default_rng(config.get("seed", 0))
+        torch.manual_seed(config.get("seed", 0))
+
+        steps_per_epoch = math.ceil(len(train_dataset) / self.batch_size)
+        max_steps = steps_per_epoch * config.get("num_train_epochs", 1)
+        if config.get("max_steps", -1) > 0:
+            max_steps = min(max_steps, config["max_steps"])
+        self.steps_per_epoch = steps_per_epoch
+
+        self.args = TrainingArguments(
+            output_dir=config.get("output_dir", "./checkpoints"),
+            logging_dir=config.get("logging_dir", "./training_logs"),
+            logging_steps=config.get("logging_steps", 1),
+            report_to=[],
+        )
+        self.state = TrainerState(max_steps=max_steps, logging_steps=self.args.logging_steps)
+        self.control = TrainerControl()
+        self.callback_handler = CallbackHandler(
+            [DefaultFlowCallback(), TensorBoardCallback()] + list(callbacks or []),
+            model,
+            tokenizer,
+            self.optimizer,
+            None,
+        )
+
+        # Wall time per phase, summed over all steps
+        self.phase_timings = {"ppo_rollout": 0.0, "ppo_reward": 0.0, "ppo_optimization": 0.0}
+
+    def _forward(self, queries: List[List[int]], responses: List[List[int]], reference: bool = False) -> Any:
+        """
+        Log-probabilities (and values) of the response tokens.
+
+        Args:
+            queries: Prompt token ids
+            responses: Response token ids
+            reference: Use the reference model instead of the policy
+
+        Returns:
+            Tuple of (logprobs, values, mask), each [batch, longest response];
+            values is None for the reference model
+        """
+        import torch
+
+        width = max(len(q) + len(r) for q, r in zip(queries, responses))
+        longest = max(len(r) for r in responses)
+        input_ids = torch.full((len(queries), width), self.tokenizer.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(queries), width), dtype=torch.long)
+        # Position of the logits (and value) that predict each response token
+        positions = torch.zeros((len(queries), longest), dtype=torch.long)
+        mask = torch.zeros((len(queries), longest), dtype=torch.bool)
+        for row, (query, response) in enumerate(zip(queries, responses)):
+            length = len(query) + len(response)
+            input_ids[row, :length] = torch.tensor(query + response)
+            attention_mask[row, :length] = 1
+            positions[row, :len(response)] = torch.arange(len(query) - 1, length - 1)
+            mask[row, :len(response)] = True
+        input_ids, attention_mask = input_ids.to(self.device), attention_mask.to(self.device)
+        positions, mask = positions.to(self.device), mask.to(self.device)
+
+        with torch.autocast(self.device.type, dtype=self.autocast_dtype, enabled=self.autocast_dtype is not None):
+            values = None
+            if not reference:
+                logits, _, values = self.model(input_ids=input_ids, attention_mask=attention_mask)
+            elif self.ref_model is not None:
+                logits = self.ref_model(input_ids=input_ids, attention_mask=attention_mask).logits
+            else:
+                with self.model.pretrained_model.disable_adapter():
+                    logits = self.model.pretrained_model(input_ids=input_ids, attention_mask=attention_mask).logits
+
+        logits = logits.float()
+        targets = torch.cat([input_ids[:, 1:], input_ids[:, -1:]], dim=1)
+        token_logps = logits.gather(-1, targets.unsqueeze(-1)).squeeze(-1) - torch.logsumexp(logits, dim=-1)
+        logprobs = token_logps.gather(1, positions)
+        if values is not None:
+            values = values.float().gather(1, positions)
+        return logprobs, values, mask
+
+    def _advantages(self, rewards: Any, values: Any, mask: Any) -> Any:
+        """GAE advantages and returns over the response tokens."""
+        import torch
+
+        advantages = torch.zeros_like(rewards)
+        last = torch.zeros(rewards.shape[0], device=rewards.device)
+        for t in reversed(range(rewards.shape[1])):
+            next_value = values[:, t + 1] * mask[:, t + 1] if t + 1 < rewards.shape[1] else 0.0
+            delta = rewards[:, t] + self.gamma * next_value - values[:, t]
+            last = (delta + self.gamma * self.lam * last) * mask[:, t]
+            advantages[:, t] = last
+        returns = advantages + values
+
+        # Whitened over the valid tokens
+        valid = advantages[mask]
+        advantages = (advantages - valid.mean()) / (valid.std() + 1e-8) * mask
+        return advantages, returns
+
+    def step(self, prompts: List[str]) -> Dict[str, float]:
+        """
+        Run one PPO step on a batch of prompts.
+
+        Args:
+            prompts: Prompt texts
+
+        Returns:
+            Step metrics
+        """
+        import torch
+
+        # Rollout; each generated batch is queued for scoring immediately
+        pending = []
+        rollout = self.engine.generate(
+            prompts,
+            on_batch=lambda indices, texts: pending.append(
+                (indices, self.reward_scorer.submit([prompts[i] for i in indices], texts))
+            ),
+        )
+
+        start = time.perf_counter()
+        scores = np.zeros(len(prompts), dtype=np.float32)
+        for indices, future in pending:
+            scores[indices] = future.result()
+        reward_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        queries, responses = rollout.queries, rollout.responses
+        longest = max(len(r) for r in responses)
+        n = len(prompts)
+        old_logprobs = torch.zeros((n, longest), device=self.device)
+        ref_logprobs = torch.zeros((n, longest), device=self.device)
+        old_values = torch.zeros((n, longest), device=self.device)
+        mask = torch.zeros((n, longest), dtype=torch.bool, device=self.device)
+
+        self.model.eval()
+        with torch.no_grad():
+            for first in range(0, n, self.mini_batch_size):
+                rows = slice(first, first + self.mini_batch_size)
+                logprobs, values, batch_mask = self._forward(queries[rows], responses[rows])
+                ref, _, _ = self._forward(queries[rows], responses[rows], reference=True)
+                width = batch_mask.shape[1]
+                old_logprobs[rows, :width] = logprobs
+                old_values[rows, :width] = values
+                ref_logprobs[rows, :width] = ref
+                mask[rows, :width] = batch_mask
+
+        # KL penalty on every token, the score on the last one
+        kl = (old_logprobs - ref_logprobs) * mask
+        rewards = -self.kl_coef * kl
+        last = torch.tensor([len(r) - 1 for r in responses], device=self.device)
+        rewards[torch.arange(n, device=self.device), last] += torch.as_tensor(scores, device=self.device)
+        advantages, returns = self._advantages(rewards, old_values * mask, mask)
+
+        self.model.train()
+        losses, grad_norms, approx_kls, clipfracs = [], [], [], []
+        micro_steps = 0
+        for _ in range(self.ppo_epochs):
+            order = self.generator.permutation(n)
+            for first in range(0, n, self.mini_batch_size):
+                rows = order[first:first + self.mini_batch_size]
+                logprobs, values, batch_mask = self._forward([queries[i] for i in rows], [responses[i] for i in rows])
+                width = batch_mask.shape[1]
+                rows_t = torch.as_tensor(rows, device=self.device)
+                batch_advantages = advantages[rows_t, :width]
+                batch_returns = returns[rows_t, :width]
+                batch_old_values = old_values[rows_t, :width]
+                batch_old_logprobs = old_logprobs[rows_t, :width]
+                tokens = batch_mask.sum().clamp(min=1)
+
+                ratio = torch.exp(logprobs - batch_old_logprobs)
+                pg_losses = torch.max(
+                    -batch_advantages * ratio,
+                    -batch_advantages * torch.clamp(ratio, 1 - self.cliprange, 1 + self.cliprange),
+                )
+                pg_loss = (pg_losses * batch_mask).sum() / tokens
+                clipped_values = batch_old_values + torch.clamp(
+                    values - batch_old_values, -self.cliprange_value, self.cliprange_value
+                )
+                vf_losses = torch.max((values - batch_returns) ** 2, (clipped_values - batch_returns) ** 2)
+                vf_loss = 0.5 * (vf_losses * batch_mask).sum() / tokens
+                loss = pg_loss + self.vf_coef * vf_loss
+
+                (loss / self.gradient_accumulation_steps).backward()
+                micro_steps += 1
+                if micro_steps % self.gradient_accumulation_steps == 0:
+                    grad_norms.append(float(torch.nn.utils.clip_grad_norm_(
+                        [p for p in self.model.parameters() if p.requires_grad], self.max_grad_norm
+                    )))
+                    self.optimizer.step()
+                    self.optimizer.zero_grad(set_to_none=True)
+
+                with torch.no_grad():
+                    losses.append(float(loss))
+                    approx_kls.append(float(0.5 * (((logprobs - batch_old_logprobs) ** 2) * batch_mask).sum() / tokens))
+                    clipfracs.append(float((((ratio - 1).abs() > self.cliprange) & batch_mask).sum() / tokens))
+
+            # Stop the PPO epochs once the policy moved too far from the rollout policy
+            if self.target_kl is not None and np.mean(approx_kls[-math.ceil(n / self.mini_batch_size):]) > 1.5 * self.target_kl:
+                break
+
+        if micro_steps % self.gradient_accumulation_steps:
+            grad_norms.append(float(torch.nn.utils.clip_grad_norm_(
+                [p for p in self.model.parameters() if p.requires_grad], self.max_grad_norm
+            )))
+            self.optimizer.step()
+            self.optimizer.zero_grad(set_to_none=True)
+        optimization_seconds = time.perf_counter() - start
+
+        self.phase_timings["ppo_rollout"] += rollout.seconds
+        self.phase_timings["ppo_reward"] += reward_seconds
+        self.phase_timings["ppo_optimization"] += optimization_seconds
+
+        return {
+            "loss": float(np.mean(losses)),
+            "grad_norm": float(np.mean(grad_norms)),
+            "learning_rate": self.optimizer.param_groups[0]["lr"],
+            "reward": float(scores.mean()),
+            "reward_std": float(scores.std()),
+            "kl": float((kl.sum(dim=1)).mean()),
+            "approx_kl": float(np.mean(approx_kls)),
+            "clipfrac": float(np.mean(clipfracs)),
+            "response_length": float(mask.sum(dim=1).float().mean()),
+            "rollout_seconds": round(rollout.seconds, 3),
+            "reward_seconds": round(reward_seconds, 3),
+            "optimization_seconds": round(optimization_seconds, 3),
+        }
+
+    def train(self) -> Any:
+        """
+        Run PPO for num_train_epochs over the prompts (or max_steps steps).
+
+        Returns:
+            TrainOutput with the mean loss and phase timings
+        """
+        from transformers.trainer_utils import TrainOutput
+
+        self.control = self.callback_handler.on_train_begin(self.args, self.state, self.control)
+        losses = []
+        try:
+            while self.state.global_step < self.state.max_steps and not self.control.should_training_stop:
+                order = self.generator.permutation(len(self.train_dataset))
+                for first in range(0, len(order), self.batch_size):
+                    if self.state.global_step >= self.state.max_steps or self.control.should_training_stop:
+                        break
+                    self.control = self.callback_handler.on_step_begin(self.args, self.state, self.control)
+                    prompts = self.train_dataset.select(order[first:first + self.batch_size])["prompt"]
+                    logs = self.step(prompts)
+                    losses.append(logs["loss"])
+
+                    self.state.global_step += 1
+                    self.state.epoch = self.state.global_step / self.steps_per_epoch
+                    self.control = self.callback_handler.on_step_end(self.args, self.state, self.control)
+                    if self.state.global_step % self.args.logging_steps == 0:
+                        logs["epoch"] = round(self.state.epoch, 4)
+                        self.state.log_history.append({**logs, "step": self.state.global_step})
+                        self.control = self.callback_handler.on_log(self.args, self.state, self.control, logs)
+        finally:
+            self.reward_scorer.close()
+
+        self.control = self.callback_handler.on_train_end(self.args, self.state, self.control)
+        timings = {phase: round(seconds, 3) for phase, seconds in self.phase_timings.items()}
+        logger.info(f"PPO finished {self.state.global_step} steps; phase timings (s): {timings}")
+        return TrainOutput(self.state.global_step, float(np.mean(losses)) if losses else 0.0, timings)
+
+    def evaluate(self, eval_dataset: Optional[Any] = None) -> Dict[str, float]:
+        """
+        Generate responses for the eval prompts and score them.
+
+        Args:
+            eval_dataset: Dataset with a "prompt" column (default: the eval split)
+
+        Returns:
+            Mean and standard deviation of the reward, and the runtime
+        """
+        dataset = eval_dataset if eval_dataset is not None else self.eval_dataset
+        if dataset is None:
+            return {}
+        start = time.perf_counter()
+        prompts = dataset["prompt"]
+        try:
+            rollout = self.engine.generate(prompts)
+            scores = np.asarray(self.reward_scorer.score(rollout.prompts, rollout.texts), dtype=np.float32)
+        finally:
+            self.reward_scorer.close()
+        metrics = {
+            "eval_reward": float(scores.mean()),
+            "eval_reward_std": float(scores.std()),
+            "eval_runtime": round(time.perf_counter() - start, 3),
+        }
+        self.control = self.callback_handler.on_evaluate(self.args, self.state, self.control, metrics)
+        return metrics
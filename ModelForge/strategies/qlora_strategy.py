@@ -12,8 +12,11 @@ try:
 except ImportError:
     pass
 
-from transformers import Trainer, TrainingArguments, DataCollatorForLanguageModeling
+from transformers import Trainer, TrainingArguments, DataCollatorForLanguageModeling, default_data_collator
 
+from ..formatters.batched_formatters import format_dataset
+from ..formatters.chat_templates import resolve_prompt_format, tokenize_chat_dataset
+from ..formatters.completion_masking import tokenize_with_completion_mask, has_completion_tokens
 from ..logging_config import logger
 
 
@@ -103,79 +106,72 @@ class QLoRAStrategy:
         eos_token = tokenizer.eos_token or tokenizer.sep_token or ""
         task = config.get("task", "text-generation")
         max_seq_length = config.get("max_seq_length", 2048)
+        completion_only = config.get("completion_only_loss", False)
 
         # Handle max_seq_length = -1 (use model's maximum)
         if max_seq_length == -1:
             max_seq_length = 2048  # Fallback default
 
-        def create_text_field(example):
-            """Consolidate all fields into a single 'text' field with EOS token."""
-            if task == "text-generation":
-                # Fields: prompt, completion (renamed in training_service._format_dataset)
-                prompt = example.get('prompt', '')
-                completion = example.get('completion', '')
-                text = f"USER: {prompt}\nASSISTANT: {completion}{eos_token}"
-
-            elif task == "summarization":
-                # Fields: input, output (renamed in training_service._format_dataset)
-                input_text = example.get('input', '')
-                output_text = example.get('output', '')
-                text = f"Summarize the following document:\n{input_text}\n\nSummary:\n{output_text}{eos_token}"
-
-            elif task == "extractive-question-answering":
-                # Fields: context, question, answers
-                context = example.get('context', '')
-                question = example.get('question', '')
-                answers = example.get('answers', {})
-
-                # Extract answer text from answers dict
-                if isinstance(answers, dict):
-                    answer_text = answers.get("text", [""])[0] if "text" in answers else ""
-                else:
-                    answer_text = str(answers)
-
-                text = f"Context: {context}\n\nQuestion: {question}\n\nAnswer: {answer_text}{eos_token}"
-
-            else:
-                # Fallback: concatenate all string fields
-                logger.warning(f"Unknown task type: {task}, using raw field concatenation")
-                text = " ".join(str(v) for v in example.values() if isinstance(v, str))
-                text += eos_token
-
-            return {"text": text}
-
-        # Step 1: Create text field
-        dataset = dataset.map(
-            create_text_field,
-            remove_columns=dataset.column_names,
-            num_proc=1
-        )
-
-        # Step 2: Tokenize text
-        def tokenize_function(examples):
-            """Tokenize text and create labels for causal LM."""
-            # Tokenize with truncation and padding
-            tokenized = tokenizer(
-                examples["text"],
-                truncation=True,
-                max_length=max_seq_length,
-                padding="max_length",  # Pad to max_length for consistency
-                return_tensors=None,  # Return lists, not tensors (datasets handles this)
+        if resolve_prompt_format(tokenizer, config) == "chat_template":
+            # Render with the base model's chat template; the fixed template parts
+            # are pre-tokenized once, so only user and assistant text is encoded
+            dataset = tokenize_chat_dataset(
+                dataset,
+                tokenizer,
+                task,
+                max_seq_length,
+                completion_only=completion_only,
+                system_prompt=config.get("system_prompt"),
+            )
+        else:
+            # Step 1: Build the text field (prompt + completion + EOS) and record the
+            # prompt length for completion-only masking, in column batches
+            dataset = format_dataset(dataset, task, eos_token)
+
+            # Step 2: Tokenize text
+            def tokenize_function(examples):
+                """Tokenize text and create labels for causal LM."""
+                if completion_only:
+                    # Labels cover only the completion; prompt and padding are ignored
+                    return tokenize_with_completion_mask(
+                        tokenizer,
+                        examples["text"],
+                        examples["prompt_length"],
+                        max_seq_length,
+                    )
+
+                # Tokenize with truncation and padding
+                tokenized = tokenizer(
+                    examples["text"],
+                    truncation=True,
+                    max_length=max_seq_length,
+                    padding="max_length",  # Pad to max_length for consistency
+                    return_tensors=None,  # Return lists, not tensors (datasets handles this)
+                )
+
+                # For causal LM: labels = input_ids
+                # The model will shift internally for next-token prediction
+                tokenized["labels"] = tokenized["input_ids"].copy()
+
+                return tokenized
+
+            # Apply tokenization
+            dataset = dataset.map(
+                tokenize_function,
+                batched=True,
+                remove_columns=["text", "prompt_length"],  # Keep only tokenized fields
+                num_proc=1,
             )
 
-            # For causal LM: labels = input_ids
-            # The model will shift internally for next-token prediction
-            tokenized["labels"] = tokenized["input_ids"].copy()
-
-            return tokenized
-
-        # Apply tokenization
-        dataset = dataset.map(
-            tokenize_function,
-            batched=True,
-            remove_columns=["text"],  # Remove text field, keep only tokenized
-            num_proc=1,
-        )
+        if completion_only:
+            # Drop examples whose completion was truncated away entirely
+            num_examples = len(dataset)
+            dataset = dataset.filter(has_completion_tokens, num_proc=1)
+            if len(dataset) < num_examples:
+                logger.warning(
+                    f"Dropped {num_examples - len(dataset)} examples with no completion tokens "
+                    f"within max_length={max_seq_length}"
+                )
 
         logger.info(f"Dataset tokenized: {len(dataset)} examples with max_length={max_seq_length}")
         return dataset
@@ -244,10 +240,15 @@ class QLoRAStrategy:
         )
 
         # Create data collator for causal language modeling
-        data_collator = DataCollatorForLanguageModeling(
-            tokenizer=tokenizer,
-            mlm=False,  # Causal LM
-        )
+        if config.get("completion_only_loss", False):
+            # Labels already carry the completion mask; DataCollatorForLanguageModeling
+            # would rebuild them from input_ids (and mask EOS when pad == eos)
+            data_collator = default_data_collator
+        else:
+            data_collator = DataCollatorForLanguageModeling(
+                tokenizer=tokenizer,
+                mlm=False,  # Causal LM
+            )
 
         # Create standard Trainer
         trainer = Trainer(
@@ -0,0 +1,316 @@
+"""
+Precomputed reference log-probabilities for DPO.
+
+The DPO loss compares the policy's log-probabilities of the chosen and
+rejected responses with those of the frozen reference model. Computing the
+reference side on the fly costs a second forward pass on every step. Instead,
+it is computed once, in one batched inference pass before training, and
+attached to the tokenized datasets as the ``ref_chosen_logps`` and
+``ref_rejected_logps`` columns, which DPOTrainer uses in place of the
+reference forward.
+
+Results are cached on disk per example, keyed by a hash of its prompt, chosen
+and rejected text, in one file per reference configuration (base model,
+quantization, precision and truncation lengths). Every epoch, trainer retry
+and later job on the same data and base model reuses them; only examples not
+seen before are computed.
+"""
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from ..logging_config import logger
+
+
+# Bumped when the computation changes, so cached values are recomputed
+_CACHE_VERSION = 1
+
+# Config keys that change the reference model's outputs
+_REFERENCE_CONFIG_KEYS = (
+    "model_name",
+    "use_4bit",
+    "use_8bit",
+    "bnb_4bit_compute_dtype",
+    "bnb_4bit_quant_type",
+    "use_nested_quant",
+    "fp16",
+    "bf16",
+    "max_seq_length",
+    "max_prompt_length",
+    "max_completion_length",
+)
+
+HASH_BATCH_SIZE = 1000
+
+
+def row_hashes(dataset: Any) -> np.ndarray:
+    """
+    Hash the prompt, chosen and rejected text of every example to 64 bits.
+
+    Args:
+        dataset: Untokenized preference dataset
+
+    Returns:
+        Array of uint64 hashes, one per example
+    """
+    hashes = np.empty(len(dataset), dtype=np.uint64)
+    position = 0
+    columns = dataset.select_columns(["prompt", "chosen", "rejected"])
+    for batch in columns.iter(batch_size=HASH_BATCH_SIZE):
+        for row in zip(batch["prompt"], batch["chosen"], batch["rejected"]):
+            digest = hashlib.blake2b(json.dumps(row, ensure_ascii=False).encode("utf-8"), digest_size=8).digest()
+            hashes[position] = int.from_bytes(digest, "little")
+            position += 1
+    return hashes
+
+
+def reference_cache_path(cache_dir: str, config: Dict[str, Any]) -> str:
+    """
+    Get the cache file for a reference configuration.
+
+    Args:
+        cache_dir: Cache directory
+        config: Training configuration
+
+    Returns:
+        Path of the .npz cache file
+    """
+    key = json.dumps([_CACHE_VERSION] + [config.get(name) for name in _REFERENCE_CONFIG_KEYS])
+    return os.path.join(cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".npz")
+
+
+class ReferenceLogpsCache:
+    """Reference log-probabilities per example hash, stored in one .npz file."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Load the cache.
+
+        Args:
+            path: Cache file (None keeps the cache in memory only)
+        """
+        self.path = path
+        self.hashes = np.zeros(0, dtype=np.uint64)
+        self.chosen = np.zeros(0, dtype=np.float32)
+        self.rejected = np.zeros(0, dtype=np.float32)
+        if path and os.path.exists(path):
+            try:
+                with np.load(path) as cached:
+                    self.hashes, self.chosen, self.rejected = cached["hashes"], cached["chosen"], cached["rejected"]
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable reference log-prob cache {path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def lookup(self, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Look up examples by hash.
+
+        Args:
+            hashes: Example hashes
+
+        Returns:
+            Tuple of (chosen logps, rejected logps, found mask); values are 0
+            where not found
+        """
+        if len(self.hashes) == 0:
+            return (
+                np.zeros(len(hashes), dtype=np.float32),
+                np.zeros(len(hashes), dtype=np.float32),
+                np.zeros(len(hashes), dtype=bool),
+            )
+        positions = np.minimum(np.searchsorted(self.hashes, hashes), len(self.hashes) - 1)
+        found = self.hashes[positions] == hashes
+        chosen = np.where(found, self.chosen[positions], 0).astype(np.float32)
+        rejected = np.where(found, self.rejected[positions], 0).astype(np.float32)
+        return chosen, rejected, found
+
+    def update(self, hashes: np.ndarray, chosen: np.ndarray, rejected: np.ndarray):
+        """
+        Add examples and save the cache.
+
+        Args:
+            hashes: Example hashes
+            chosen: Reference log-probabilities of the chosen responses
+            rejected: Reference log-probabilities of the rejected responses
+        """
+        all_hashes = np.concatenate([self.hashes, hashes])
+        all_chosen = np.concatenate([self.chosen, chosen.astype(np.float32)])
+        all_rejected = np.concatenate([self.rejected, rejected.astype(np.float32)])
+        self.hashes, first = np.unique(all_hashes, return_index=True)
+        self.chosen, self.rejected = all_chosen[first], all_rejected[first]
+
+        if self.path:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary = self.path + ".tmp"
+            with open(temporary, "wb") as f:
+                np.savez(f, hashes=self.hashes, chosen=self.chosen, rejected=self.rejected)
+            os.replace(temporary, self.path)
+
+
+def compute_reference_logps(trainer: Any, dataset: Any, batch_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute reference log-probabilities with one inference pass.
+
+    Examples are batched in order of length, so batches need little padding.
+
+    Args:
+        trainer: DPOTrainer whose reference (the base model with adapters
+            disabled, or its ref_model) is used
+        dataset: Tokenized preference dataset
+        batch_size: Examples per forward pass
+
+    Returns:
+        Tuple of (chosen logps, rejected logps), in dataset order
+    """
+    import torch
+    from torch.utils.data import DataLoader
+
+    lengths = np.fromiter(
+        (
+            len(prompt) + max(len(chosen), len(rejected))
+            for prompt, chosen, rejected in zip(
+                dataset["prompt_input_ids"], dataset["chosen_input_ids"], dataset["rejected_input_ids"]
+            )
+        ),
+        dtype=np.int64,
+        count=len(dataset),
+    )
+    order = np.argsort(-lengths, kind="stable")
+
+    loader = trainer.accelerator.prepare(
+        DataLoader(
+            dataset.select(order),
+            batch_size=batch_size,
+            collate_fn=trainer.data_collator,
+            shuffle=False,
+        )
+    )
+
+    chosen_parts, rejected_parts = [], []
+    for batch in loader:
+        chosen, rejected = trainer.compute_ref_log_probs(batch)
+        chosen, rejected = trainer.accelerator.gather_for_metrics((chosen, rejected))
+        chosen_parts.append(chosen.float().cpu())
+        rejected_parts.append(rejected.float().cpu())
+
+    chosen = np.empty(len(dataset), dtype=np.float32)
+    rejected = np.empty(len(dataset), dtype=np.float32)
+    chosen[order] = torch.cat(chosen_parts).numpy()
+    rejected[order] = torch.cat(rejected_parts).numpy()
+    return chosen, rejected
+
+
+def _attach(trainer: Any, tokenized: Any, raw: Any, cache: ReferenceLogpsCache, batch_size: int) -> Tuple[Any, Dict[str, int]]:
+    """Add reference log-prob columns to one tokenized split, computing uncached examples."""
+    hashes = row_hashes(raw)
+    chosen, rejected, found = cache.lookup(hashes)
+
+    missing = np.flatnonzero(~found)
+    computed = 0
+    if len(missing):
+        # Identical examples are computed once
+        unique_hashes, first = np.unique(hashes[missing], return_index=True)
+        to_compute = missing[first]
+        new_chosen, new_rejected = compute_reference_logps(trainer, tokenized.select(to_compute), batch_size)
+        cache.update(unique_hashes, new_chosen, new_rejected)
+        chosen, rejected, _ = cache.lookup(hashes)
+        computed = len(to_compute)
+
+    for column in ("ref_chosen_logps", "ref_rejected_logps"):
+        if column in tokenized.column_names:
+            tokenized = tokenized.remove_columns(column)
+    tokenized = tokenized.add_column("ref_chosen_logps", chosen)
+    tokenized = tokenized.add_column("ref_rejected_logps", rejected)
+    return tokenized, {"examples": len(hashes), "cached": int(found.sum()), "computed": computed}
+
+
+def reference_logps_for(
+    trainer: Any,
+    tokenized: Any,
+    raw: Any,
+    config: Dict[str, Any],
+    cache_dir: Optional[str] = None,
+    batch_size: int = 8,
+) -> Any:
+    """
+    Attach reference log-probabilities to another tokenized split.
+
+    Used for splits evaluated after the trainer was created, such as the full
+    eval split when periodic evaluations ran on a subset. Examples already
+    cached (for instance those of the subset) are not recomputed.
+
+    Args:
+        trainer: DPOTrainer
+        tokenized: Split tokenized by the trainer
+        raw: The same split, untokenized
+        config: Training configuration (identifies the reference model)
+        cache_dir: Directory of the on-disk cache (None for no disk cache)
+        batch_size: Examples per reference forward pass
+
+    Returns:
+        The tokenized split with ``ref_chosen_logps`` and ``ref_rejected_logps`` columns
+    """
+    cache = ReferenceLogpsCache(reference_cache_path(cache_dir, config) if cache_dir else None)
+
+    was_training = trainer.model.training
+    trainer.model.eval()
+    try:
+        tokenized, stats = _attach(trainer, tokenized, raw, cache, batch_size)
+    finally:
+        trainer.model.train(was_training)
+
+    logger.info(f"Reference log-probs attached to {len(tokenized)} examples: {stats}")
+    return tokenized
+
+
+def attach_reference_logps(
+    trainer: Any,
+    train_dataset: Any,
+    eval_dataset: Optional[Any],
+    config: Dict[str, Any],
+    cache_dir: Optional[str] = None,
+    batch_size: int = 8,
+) -> Dict[str, Any]:
+    """
+    Precompute reference log-probabilities and attach them to a DPOTrainer's datasets.
+
+    The trainer must have been created with ``precompute_ref_log_probs=True``
+    (so no reference model copy is made); its own precomputation is marked as
+    done, so the attached values are used for every epoch.
+
+    Args:
+        trainer: DPOTrainer
+        train_dataset: Untokenized train split the trainer was created with
+        eval_dataset: Untokenized eval split, or None
+        config: Training configuration (identifies the reference model)
+        cache_dir: Directory of the on-disk cache (None for no disk cache)
+        batch_size: Examples per reference forward pass
+
+    Returns:
+        Statistics with cached and computed example counts per split
+    """
+    start = time.perf_counter()
+    cache = ReferenceLogpsCache(reference_cache_path(cache_dir, config) if cache_dir else None)
+
+    was_training = trainer.model.training
+    trainer.model.eval()
+    try:
+        trainer.train_dataset, train_stats = _attach(trainer, trainer.train_dataset, train_dataset, cache, batch_size)
+        stats = {"train": train_stats}
+        if eval_dataset is not None and trainer.eval_dataset is not None:
+            trainer.eval_dataset, stats["eval"] = _attach(trainer, trainer.eval_dataset, eval_dataset, cache, batch_size)
+    finally:
+        trainer.model.train(was_training)
+
+    trainer._precomputed_train_ref_log_probs = True
+    trainer._precomputed_eval_ref_log_probs = True
+
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    logger.info(f"Reference log-probs attached: {stats}")
+    return stats
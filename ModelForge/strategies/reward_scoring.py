@@ -0,0 +1,370 @@
+"""
+Batched reward-model scoring for RLHF.
+
+PPO needs a scalar reward for every generated response. Scoring responses one
+at a time leaves the reward model mostly idle and serializes rollouts behind
+it. RewardScorer runs the reward model on a worker thread instead:
+
+- Callers submit (prompt, response) pairs and get a Future back, so the
+  policy can generate the next batch while the current one is scored. The
+  request queue is bounded; submit() blocks when it is full, which keeps
+  memory use flat if generation outpaces scoring.
+- Pending requests are merged and split into batches by token budget, longest
+  first, so a batch holds many short pairs or a few long ones, with little
+  padding either way.
+- Scores are cached per (prompt, response) pair, so repeated pairs (PPO
+  epochs, duplicate prompts, identical greedy responses) are scored once.
+
+The reward model has its own tokenizer and device, so it may be larger or
+smaller than the policy and live on another GPU or on the CPU.
+"""
+import hashlib
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..exceptions import TrainingError
+from ..logging_config import logger
+from ..utilities.model_registry import is_offline_mode, resolve_model_path
+
+
+# Padded tokens (batch size x longest sequence) per reward forward pass
+DEFAULT_MAX_BATCH_TOKENS = 16_384
+
+# Pairs per reward forward pass, whatever their length
+DEFAULT_MAX_BATCH_SIZE = 64
+
+# Submitted requests waiting to be scored before submit() blocks
+DEFAULT_QUEUE_SIZE = 8
+
+# Cached pair scores
+DEFAULT_CACHE_SIZE = 100_000
+
+# Reward model inputs are truncated to this many tokens
+DEFAULT_MAX_LENGTH = 1024
+
+_STOP = object()
+
+
+def pair_key(prompt: str, response: str) -> bytes:
+    """
+    Hash a (prompt, response) pair for the score cache.
+
+    Args:
+        prompt: Prompt text
+        response: Response text
+
+    Returns:
+        16-byte digest
+    """
+    return hashlib.blake2b(json.dumps([prompt, response], ensure_ascii=False).encode("utf-8"), digest_size=16).digest()
+
+
+def token_budget_batches(lengths: Sequence[int], max_batch_tokens: int, max_batch_size: int) -> List[List[int]]:
+    """
+    Split items into batches whose padded size fits a token budget.
+
+    Items are taken longest first, so each batch pads to its first item.
+    An item longer than the budget gets a batch of its own.
+
+    Args:
+        lengths: Token count of each item
+        max_batch_tokens: Budget of batch size x longest item
+        max_batch_size: Maximum items per batch
+
+    Returns:
+        Batches of item indices
+    """
+    order = sorted(range(len(lengths)), key=lambda i: -lengths[i])
+    batches, current, longest = [], [], 0
+    for i in order:
+        longest_if_added = max(longest, lengths[i])
+        if current and (len(current) >= max_batch_size or (len(current) + 1) * longest_if_added > max_batch_tokens):
+            batches.append(current)
+            current, longest_if_added = [], lengths[i]
+        current.append(i)
+        longest = longest_if_added
+    if current:
+        batches.append(current)
+    return batches
+
+
+class RewardScorer:
+    """Scores (prompt, response) pairs with a reward model on a worker thread."""
+
+    def __init__(
+        self,
+        model: Any,
+        tokenizer: Any,
+        device: Optional[str] = None,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_length: int = DEFAULT_MAX_LENGTH,
+    ):
+        """
+        Start the scorer.
+
+        Args:
+            model: Sequence classification model with one output (the reward)
+            tokenizer: The reward model's tokenizer
+            device: Device the reward model runs on (default: the model's device)
+            max_batch_tokens: Padded tokens per forward pass
+            max_batch_size: Pairs per forward pass
+            queue_size: Pending requests before submit() blocks
+            cache_size: Cached pair scores (0 disables the cache)
+            max_length: Reward model inputs are truncated to this many tokens
+        """
+        self.model = model
+        self.tokenizer = tokenizer
+        self.device = device or str(next(model.parameters()).device)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.cache_size = cache_size
+        self.max_length = max_length
+
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        # Sequence classification heads find the last token through the pad id
+        if getattr(self.model.config, "pad_token_id", None) is None:
+            self.model.config.pad_token_id = self.tokenizer.pad_token_id
+        self.model.eval()
+
+        self._cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._stats = {"requests": 0, "pairs": 0, "cache_hits": 0, "scored": 0, "batches": 0, "seconds": 0.0}
+        self._stats_lock = threading.Lock()
+        # Started on the first submit() and stopped by close()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RewardScorer":
+        """
+        Load the reward model named in a training configuration.
+
+        Args:
+            config: Training configuration with reward_model and optional
+                reward_device, reward_batch_tokens, max_seq_length and precision
+
+        Returns:
+            RewardScorer
+
+        Raises:
+            TrainingError: If no reward model is configured or it cannot be loaded
+        """
+        model_name = config.get("reward_model")
+        if not model_name:
+            raise TrainingError("RLHF requires a reward model. Set reward_model in the training config.")
+
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        device = config.get("reward_device") or ("cuda" if torch.cuda.is_available() else "cpu")
+        dtype = torch.float32
+        if device != "cpu":
+            if config.get("bf16"):
+                dtype = torch.bfloat16
+            elif config.get("fp16"):
+                dtype = torch.float16
+
+        logger.info(f"Loading reward model {model_name} on {device}")
+        try:
+            # Registered local copies are used, and offline mode never reaches the Hub
+            model_path = resolve_model_path(model_name)
+            offline = is_offline_mode()
+            tokenizer = AutoTokenizer.from_pretrained(model_path, local_files_only=offline)
+            model = AutoModelForSequenceClassification.from_pretrained(
+                model_path, num_labels=1, torch_dtype=dtype, local_files_only=offline
+            )
+        except Exception as e:
+            raise TrainingError(f"Failed to load reward model {model_name}: {e}") from e
+
+        return cls(
+            model.to(device),
+            tokenizer,
+            device=device,
+            max_batch_tokens=config.get("reward_batch_tokens") or DEFAULT_MAX_BATCH_TOKENS,
+            max_length=config.get("max_seq_length") or DEFAULT_MAX_LENGTH,
+        )
+
+    def submit(self, prompts: Sequence[str], responses: Sequence[str]) -> Future:
+        """
+        Queue pairs for scoring.
+
+        Blocks while the queue is full.
+
+        Args:
+            prompts: Prompt texts
+            responses: Generated responses, one per prompt
+
+        Returns:
+            Future resolving to the list of rewards, in input order
+        """
+        if len(prompts) != len(responses):
+            raise ValueError(f"Got {len(prompts)} prompts but {len(responses)} responses")
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="reward-scorer", daemon=True)
+                self._worker.start()
+        future: Future = Future()
+        self._queue.put((list(prompts), list(responses), future))
+        return future
+
+    def score(self, prompts: Sequence[str], responses: Sequence[str]) -> List[float]:
+        """
+        Score pairs and wait for the result.
+
+        Args:
+            prompts: Prompt texts
+            responses: Generated responses, one per prompt
+
+        Returns:
+            Rewards, in input order
+        """
+        return self.submit(prompts, responses).result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Request, cache and batch counts, and time spent in the reward model."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["seconds"] = round(stats["seconds"], 3)
+        stats["cached"] = len(self._cache)
+        return stats
+
+    def close(self):
+        """
+        Score what is queued, then stop the worker thread.
+
+        The reward model stays loaded; a later submit() starts a new worker.
+        """
+        with self._worker_lock:
+            if self._worker is not None:
+                self._queue.put(_STOP)
+                self._worker.join()
+                self._worker = None
+
+    def __enter__(self) -> "RewardScorer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self):
+        """Worker loop: merge pending requests and score them together."""
+        stop = False
+        while not stop:
+            requests = [self._queue.get()]
+            # Everything already waiting joins this round
+            while True:
+                try:
+                    requests.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _STOP in requests:
+                stop = True
+                requests = [request for request in requests if request is not _STOP]
+            if not requests:
+                continue
+            try:
+                rewards = self._score_requests(requests)
+            except Exception as e:
+                logger.error(f"Reward scoring failed: {e}", exc_info=True)
+                for _, _, future in requests:
+                    future.set_exception(e)
+                continue
+            for (_, _, future), request_rewards in zip(requests, rewards):
+                future.set_result(request_rewards)
+
+    def _score_requests(self, requests: List[Tuple[List[str], List[str], Future]]) -> List[List[float]]:
+        """Score the pairs of several requests, computing each uncached pair once."""
+        keys = [[pair_key(prompt, response) for prompt, response in zip(prompts, responses)] for prompts, responses, _ in requests]
+
+        missing: Dict[bytes, Tuple[str, str]] = {}
+        scores: Dict[bytes, float] = {}
+        hits = 0
+        for (prompts, responses, _), request_keys in zip(requests, keys):
+            for key, prompt, response in zip(request_keys, prompts, responses):
+                if key in scores or key in missing:
+                    continue
+                cached = self._cache.get(key)
+                if cached is None:
+                    missing[key] = (prompt, response)
+                else:
+                    self._cache.move_to_end(key)
+                    scores[key] = cached
+                    hits += 1
+
+        start = time.perf_counter()
+        batches = 0
+        if missing:
+            missing_keys = list(missing)
+            rewards, batches = self._forward([missing[key] for key in missing_keys])
+            for key, reward in zip(missing_keys, rewards):
+                scores[key] = reward
+                self._remember(key, reward)
+
+        with self._stats_lock:
+            self._stats["requests"] += len(requests)
+            self._stats["pairs"] += sum(len(request_keys) for request_keys in keys)
+            self._stats["cache_hits"] += hits
+            self._stats["scored"] += len(missing)
+            self._stats["batches"] += batches
+            self._stats["seconds"] += time.perf_counter() - start
+
+        return [[scores[key] for key in request_keys] for request_keys in keys]
+
+    def _remember(self, key: bytes, reward: float):
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = reward
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _texts(self, pairs: List[Tuple[str, str]]) -> List[str]:
+        """Reward model inputs: its chat template if it has one, else prompt + response."""
+        if getattr(self.tokenizer, "chat_template", None):
+            return [
+                self.tokenizer.apply_chat_template(
+                    [{"role": "user", "content": prompt}, {"role": "assistant", "content": response}],
+                    tokenize=False,
+                )
+                for prompt, response in pairs
+            ]
+        return [prompt + response for prompt, response in pairs]
+
+    def _forward(self, pairs: List[Tuple[str, str]]) -> Tuple[List[float], int]:
+        """Run the reward model over pairs in token-budget batches."""
+        import torch
+
+        encoded = self.tokenizer(
+            self._texts(pairs),
+            truncation=True,
+            max_length=self.max_length,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )["input_ids"]
+        batches = token_budget_batches([len(ids) for ids in encoded], self.max_batch_tokens, self.max_batch_size)
+
+        rewards = [0.0] * len(pairs)
+        with torch.inference_mode():
+            for batch in batches:
+                # Right-padded to the longest pair, which batches start with
+                width = len(encoded[batch[0]])
+                input_ids = torch.full((len(batch), width), self.tokenizer.pad_token_id, dtype=torch.long)
+                attention_mask = torch.zeros((len(batch), width), dtype=torch.long)
+                for row, i in enumerate(batch):
+                    input_ids[row, :len(encoded[i])] = torch.tensor(encoded[i])
+                    attention_mask[row, :len(encoded[i])] = 1
+                logits = self.model(
+                    input_ids=input_ids.to(self.device),
+                    attention_mask=attention_mask.to(self.device),
+                ).logits[:, 0].float().cpu().tolist()
+                for i, reward in zip(batch, logits):
+                    rewards[i] = reward
+        return rewards, len(batches)
@@ -1,10 +1,11 @@
 """
 Reinforcement Learning from Human Feedback (RLHF) strategy implementation.
-Uses TRL's PPOTrainer for RLHF-based fine-tuning.
+Uses PPO on TRL's value-head model, with batched rollouts and reward scoring.
 """
 from typing import Any, Dict
 from peft import LoraConfig, get_peft_model, TaskType, prepare_model_for_kbit_training
 
+from .reward_scoring import RewardScorer
 from ..logging_config import logger
 from ..exceptions import TrainingError
 
@@ -101,55 +102,58 @@ class RLHFStrategy:
         callbacks: list = None,
     ) -> Any:
         """
-        Create PPOTrainer for RLHF.
+        Create the PPO trainer for RLHF.
+
+        Rollouts are generated in batches by RolloutEngine and scored by the
+        reward model's RewardScorer; the PPO updates run on the value-head model.
 
         Args:
             model: Model with value head
-            train_dataset: Training dataset
-            eval_dataset: Evaluation dataset (not used in PPO)
+            train_dataset: Training dataset (the prompt column is used)
+            eval_dataset: Evaluation dataset (scored by evaluate())
             tokenizer: Tokenizer instance
             config: Training configuration
             callbacks: Training callbacks
 
         Returns:
-            PPOTrainer instance
+            RolloutPPOTrainer instance
         """
-        logger.info("Creating PPOTrainer for RLHF")
+        logger.info("Creating PPO trainer for RLHF")
 
-        try:
-            from trl import PPOTrainer, PPOConfig
-        except ImportError as e:
-            raise TrainingError(
-                "TRL is not installed with RLHF support. "
-                "Install with: pip install trl[rlhf]"
-            ) from e
+        from .ppo_trainer import RolloutPPOTrainer
 
-        # Create PPO config
-        ppo_config = PPOConfig(
-            model_name=config.get("model_name", "model"),
-            learning_rate=config.get("learning_rate", 1.41e-5),
-            batch_size=config.get("batch_size", 128),
-            mini_batch_size=config.get("mini_batch_size", 4),
-            gradient_accumulation_steps=config.get("gradient_accumulation_steps", 1),
-            optimize_cuda_cache=True,
-            early_stopping=config.get("early_stopping", False),
-            target_kl=config.get("target_kl", 0.1),
-            ppo_epochs=config.get("ppo_epochs", 4),
-            seed=config.get("seed", 0),
-            log_with="tensorboard",
-        )
+        # Rollouts are scored in batches on the reward model's own device
+        reward_scorer = self.create_reward_scorer(config)
 
-        # Create trainer
-        trainer = PPOTrainer(
+        trainer = RolloutPPOTrainer(
             model=model,
-            config=ppo_config,
-            dataset=train_dataset,
             tokenizer=tokenizer,
+            train_dataset=train_dataset,
+            reward_scorer=reward_scorer,
+            config=config,
+            eval_dataset=eval_dataset,
+            callbacks=callbacks,
         )
 
-        logger.info("PPOTrainer created successfully")
+        logger.info("PPO trainer created successfully")
         return trainer
 
+    def create_reward_scorer(self, config: Dict) -> RewardScorer:
+        """
+        Load the reward model and start its batched scorer.
+
+        Args:
+            config: Training configuration with reward_model and optional
+                reward_device and reward_batch_tokens
+
+        Returns:
+            RewardScorer; close() it when training ends
+
+        Raises:
+            TrainingError: If no reward model is configured or it cannot be loaded
+        """
+        return RewardScorer.from_config(config)
+
     def get_required_dataset_fields(self) -> list:
         """
         Get required dataset fields for RLHF.
@@ -0,0 +1,192 @@
+"""
+Simple Preference Optimization (SimPO) strategy implementation.
+SimPO uses the length-normalized log-probability of a response as its
+implicit reward, so it needs no reference model.
+"""
+from typing import Any, Dict
+from peft import LoraConfig, get_peft_model, TaskType, prepare_model_for_kbit_training
+
+from ..logging_config import logger
+from ..exceptions import TrainingError
+
+
+class SimPOStrategy:
+    """Simple Preference Optimization strategy (reference-free)."""
+
+    def get_strategy_name(self) -> str:
+        """Get the strategy name."""
+        return "simpo"
+
+    def prepare_model(self, model: Any, config: Dict) -> Any:
+        """
+        Prepare model for SimPO training.
+
+        Args:
+            model: Base model instance
+            config: Configuration with LoRA settings
+
+        Returns:
+            Model prepared for SimPO
+        """
+        logger.info("Preparing model for SimPO")
+
+        # If quantized, prepare for kbit training
+        if config.get("use_4bit") or config.get("use_8bit"):
+            model = prepare_model_for_kbit_training(model)
+
+        # Apply LoRA
+        if config.get("use_lora", True):
+            peft_config = LoraConfig(
+                r=config.get("lora_r", 16),
+                lora_alpha=config.get("lora_alpha", 32),
+                lora_dropout=config.get("lora_dropout", 0.1),
+                bias="none",
+                task_type=TaskType.CAUSAL_LM,
+                target_modules=config.get("target_modules", "all-linear"),
+            )
+            model = get_peft_model(model, peft_config)
+
+        logger.info("Model prepared for SimPO with LoRA")
+        return model
+
+    def prepare_dataset(self, dataset: Any, tokenizer: Any, config: Dict) -> Any:
+        """
+        Prepare dataset for SimPO.
+
+        SimPO uses the same preference pairs as DPO:
+        - prompt: Input prompt
+        - chosen: Preferred response
+        - rejected: Non-preferred response
+
+        Args:
+            dataset: Raw dataset with preference fields
+            tokenizer: Tokenizer instance
+            config: Configuration dictionary
+
+        Returns:
+            Prepared dataset
+        """
+        logger.info("Preparing dataset for SimPO")
+
+        # Validate required fields
+        required_fields = self.get_required_dataset_fields()
+        missing_fields = [f for f in required_fields if f not in dataset.column_names]
+
+        if missing_fields:
+            raise TrainingError(
+                f"SimPO dataset missing required fields: {missing_fields}. "
+                f"Required fields: {required_fields}"
+            )
+
+        logger.info(f"SimPO dataset prepared: {len(dataset)} examples")
+        return dataset
+
+    def create_trainer(
+        self,
+        model: Any,
+        train_dataset: Any,
+        eval_dataset: Any,
+        tokenizer: Any,
+        config: Dict,
+        callbacks: list = None,
+    ) -> Any:
+        """
+        Create a CPOTrainer with the SimPO loss.
+
+        Args:
+            model: Prepared model
+            train_dataset: Training dataset
+            eval_dataset: Evaluation dataset
+            tokenizer: Tokenizer instance
+            config: Training configuration
+            callbacks: Training callbacks
+
+        Returns:
+            CPOTrainer instance
+        """
+        logger.info("Creating CPOTrainer with SimPO loss")
+
+        try:
+            from trl import CPOTrainer, CPOConfig
+        except ImportError as e:
+            raise TrainingError(
+                "TRL with SimPO support is not installed. "
+                "Install with: pip install trl"
+            ) from e
+
+        # Create SimPO config
+        training_args = CPOConfig(
+            output_dir=config.get("output_dir", "./checkpoints"),
+            num_train_epochs=config.get("num_train_epochs", 1),
+            per_device_train_batch_size=config.get("per_device_train_batch_size", 1),
+            per_device_eval_batch_size=config.get("per_device_eval_batch_size", 1),
+            gradient_accumulation_steps=config.get("gradient_accumulation_steps", 4),
+            learning_rate=config.get("learning_rate", 1e-6),
+            warmup_ratio=config.get("warmup_ratio", 0.1),
+            weight_decay=config.get("weight_decay", 0.05),
+            fp16=config.get("fp16", False),
+            bf16=config.get("bf16", False),
+            max_grad_norm=config.get("max_grad_norm", 0.3),
+            logging_steps=config.get("logging_steps", 10),
+            save_steps=config.get("save_steps", 100),
+            # SimPO-specific settings
+            loss_type="simpo",
+            beta=config.get("beta") or 2.0,  # Scale of the length-normalized reward
+            simpo_gamma=config.get("simpo_gamma", 0.5),  # Target reward margin
+            cpo_alpha=0.0,  # No behavior-cloning term: pure SimPO
+            max_length=config.get("max_seq_length") or 512,
+            max_prompt_length=config.get("max_prompt_length", 128),
+            # Evaluation settings
+            eval_strategy="steps" if eval_dataset else "no",
+            eval_steps=config.get("eval_steps", 100),
+            save_strategy="steps",
+            load_best_model_at_end=True if eval_dataset else False,
+            report_to="tensorboard",
+            logging_dir=config.get("logging_dir", "./training_logs"),
+            # Disable distributed training for Unsloth (required when using device_map='auto')
+            ddp_find_unused_parameters=False,
+        )
+
+        # Chosen and rejected go through the policy in one concatenated
+        # forward; there is no reference model
+        trainer = CPOTrainer(
+            model=model,
+            args=training_args,
+            train_dataset=train_dataset,
+            eval_dataset=eval_dataset,
+            processing_class=tokenizer,
+            callbacks=callbacks or [],
+        )
+
+        logger.info("CPOTrainer created successfully")
+        return trainer
+
+    def prepare_eval_dataset(self, trainer: Any, dataset: Any, config: Dict) -> Any:
+        """
+        Tokenize an extra eval split the way CPOTrainer tokenized its own.
+
+        CPOTrainer tokenizes its datasets when created, so a split passed to
+        ``evaluate`` later must be tokenized here first.
+
+        Args:
+            trainer: CPOTrainer returned by create_trainer
+            dataset: Untokenized eval split
+            config: Training configuration
+
+        Returns:
+            Tokenized eval split
+        """
+        from trl.data_utils import maybe_apply_chat_template, maybe_extract_prompt
+
+        dataset = dataset.map(maybe_extract_prompt)
+        dataset = dataset.map(maybe_apply_chat_template, fn_kwargs={"tokenizer": trainer.processing_class})
+        return dataset.map(trainer.tokenize_row)
+
+    def get_required_dataset_fields(self) -> list:
+        """
+        Get required dataset fields for SimPO.
+
+        Returns:
+            List of required fields
+        """
+        return ["prompt", "chosen", "rejected"]
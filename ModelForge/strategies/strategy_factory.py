@@ -1,10 +1,9 @@
 """
 Strategy factory for creating training strategy instances.
 """
-from .sft_strategy import SFTStrategy
-from .rlhf_strategy import RLHFStrategy
-from .dpo_strategy import DPOStrategy
-from .qlora_strategy import QLoRAStrategy
+import importlib
+from typing import Union
+
 from ..exceptions import ConfigurationError
 from ..logging_config import logger
 
@@ -12,20 +11,43 @@ from ..logging_config import logger
 class StrategyFactory:
     """Factory for creating training strategy instances."""
 
+    # Strategies are registered as "module:Class" import paths and resolved on
+    # first use, so importing the factory does not pull in peft/trl/unsloth.
     _strategies = {
-        "sft": SFTStrategy,
-        "rlhf": RLHFStrategy,
-        "dpo": DPOStrategy,
-        "qlora": QLoRAStrategy,
+        "sft": ".sft_strategy:SFTStrategy",
+        "rlhf": ".rlhf_strategy:RLHFStrategy",
+        "dpo": ".dpo_strategy:DPOStrategy",
+        "orpo": ".orpo_strategy:ORPOStrategy",
+        "simpo": ".simpo_strategy:SimPOStrategy",
+        "qlora": ".qlora_strategy:QLoRAStrategy",
     }
 
+    @classmethod
+    def _resolve_strategy_class(cls, strategy_name: str):
+        """
+        Resolve a registered strategy to its class, importing it if needed.
+
+        Args:
+            strategy_name: Registered strategy name
+
+        Returns:
+            Strategy class
+        """
+        strategy_class = cls._strategies[strategy_name]
+        if isinstance(strategy_class, str):
+            module_path, class_name = strategy_class.split(":")
+            module = importlib.import_module(module_path, package=__package__)
+            strategy_class = getattr(module, class_name)
+            cls._strategies[strategy_name] = strategy_class
+        return strategy_class
+
     @classmethod
     def create_strategy(cls, strategy_name: str = "sft"):
         """
         Create a strategy instance by name.
 
         Args:
-            strategy_name: Name of the strategy ("sft", "rlhf", "dpo", "qlora")
+            strategy_name: Name of the strategy ("sft", "rlhf", "dpo", "orpo", "simpo", "qlora")
 
         Returns:
             Strategy instance
@@ -43,7 +65,7 @@ class StrategyFactory:
                 f"Available strategies: {list(cls._strategies.keys())}"
             )
 
-        strategy_class = cls._strategies[strategy_name]
+        strategy_class = cls._resolve_strategy_class(strategy_name)
         return strategy_class()
 
     @classmethod
@@ -57,13 +79,14 @@ class StrategyFactory:
         return list(cls._strategies.keys())
 
     @classmethod
-    def register_strategy(cls, name: str, strategy_class):
+    def register_strategy(cls, name: str, strategy_class: Union[type, str]):
         """
         Register a new strategy.
 
         Args:
             name: Strategy name
-            strategy_class: Strategy class
+            strategy_class: Strategy class, or a "module:Class" import path
+                that is resolved lazily on first use
         """
         logger.info(f"Registering strategy: {name}")
         cls._strategies[name.lower()] = strategy_class
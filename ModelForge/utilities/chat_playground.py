@@ -14,6 +14,9 @@ from pydantic import BaseModel, field_validator
 import traceback
 import peft
 
+from ModelForge.formatters.batched_formatters import TASK_TEMPLATES
+from ModelForge.formatters.chat_templates import format_user_message, get_chat_formatter
+
 class ModelForgeConfig(BaseModel):
     model_class: str
     pipeline_task: str
@@ -47,6 +50,10 @@ class PlaygroundModel:
             with open(file_path, "r") as f:
                 self.modelforge_config = json.loads(f.read())
 
+            # Prompts must be formatted exactly as during training
+            self.prompt_format = self.modelforge_config.get("prompt_format", "plain")
+            self.system_prompt = self.modelforge_config.get("system_prompt")
+
             config = PeftConfig.from_pretrained(model_path)
             tokenizer = AutoTokenizer.from_pretrained(config.base_model_name_or_path, trust_remote_code=True)
             streamer = TextStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True)
@@ -69,13 +76,27 @@ class PlaygroundModel:
             print(traceback.format_exc())
             exit(1)
 
+    def format_prompt(self, user_input: str) -> str:
+        """Wrap user input in the prompt template or chat template used for training."""
+        task = self.modelforge_config["pipeline_task"]
+        fields = {"prompt": user_input, "input": user_input}
+        if self.prompt_format == "chat_template":
+            formatter = get_chat_formatter(self.generator.tokenizer, self.system_prompt)
+            return formatter.render_generation_prompt(format_user_message(task, fields))
+        prompt_template = TASK_TEMPLATES.get(task, ("{prompt}", ""))[0]
+        return prompt_template.format_map(fields)
+
     def generate_response(self, prompt: str, context=None, temperature=0.2, top_p=0.92, top_k=50,
                           repetition_penalty=1.3):
         try:
             tokenizer = self.generator.tokenizer
             model_config = self.generator.model.config
             max_length = getattr(model_config, "max_position_embeddings", 2048)
-            input_ids = tokenizer(prompt, return_tensors="pt").input_ids
+            if context is None:
+                prompt = self.format_prompt(prompt)
+            # The chat template already contains the special tokens (e.g. BOS)
+            add_special_tokens = self.prompt_format != "chat_template"
+            input_ids = tokenizer(prompt, return_tensors="pt", add_special_tokens=add_special_tokens).input_ids
             input_len = input_ids.shape[1]
             max_new_tokens = max(self.MIN_CONTEXT_LENGTH, max_length - input_len)
 
@@ -84,6 +105,9 @@ class PlaygroundModel:
                 print("Prompt truncated to fit model context window.")
 
             if context is None:
+                generate_kwargs = {}
+                if self.modelforge_config["pipeline_task"] == "text-generation":
+                    generate_kwargs = {"return_full_text": False, "add_special_tokens": add_special_tokens}
                 response = self.generator(
                     prompt,
                     max_new_tokens=max_new_tokens,
@@ -92,6 +116,7 @@ class PlaygroundModel:
                     top_p=top_p,
                     top_k=top_k,
                     repetition_penalty=repetition_penalty,
+                    **generate_kwargs,
                 )[0]['generated_text']
             else:
                 response = self.generator(
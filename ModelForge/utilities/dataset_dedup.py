@@ -0,0 +1,373 @@
+"""
+Exact and near-duplicate detection for training datasets.
+
+Exact duplicates are found by hashing the task's text fields of each example
+to 64 bits. Near duplicates are found with MinHash signatures over word
+shingles and locality-sensitive hashing (LSH): each signature is split into
+bands, examples sharing a band bucket are candidates, and candidates whose
+estimated Jaccard similarity reaches the threshold are merged into clusters.
+The first example of every cluster is kept.
+
+Memory stays bounded for millions of rows: examples are read in batches,
+signatures are written to a memory-mapped file on disk, and only a few
+per-example arrays (8-16 bytes each) are held in RAM.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..logging_config import logger
+
+
+DEDUP_MODES = ["off", "exact", "near"]
+DEFAULT_THRESHOLD = 0.85
+DEFAULT_NUM_PERM = 128
+
+# Probability that a pair exactly at the threshold becomes an LSH candidate
+MIN_RECALL = 0.99
+
+# Words per shingle
+SHINGLE_SIZE = 5
+
+# Examples read from the dataset per batch
+BATCH_SIZE = 10_000
+
+# Upper bound on keys processed at once
+_MAX_SHINGLES = 1 << 20
+
+# Shingles hashed per block; shingles x permutations x 8 bytes stays in the CPU cache
+_SIGNATURE_BLOCK = 1 << 11
+
+_SHIFT = np.uint64(32)
+
+# Bumped when the algorithm changes, so cached results are recomputed
+_CACHE_VERSION = 3
+
+
+def example_text(values: Sequence[Any]) -> str:
+    """Join an example's field values into one string; non-strings are JSON-encoded."""
+    return "\n".join(
+        value if isinstance(value, str) else json.dumps(value, sort_keys=True, ensure_ascii=False)
+        for value in values
+    )
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose the LSH band count and rows per band for a similarity threshold.
+
+    Pairs with Jaccard similarity s become candidates with probability
+    1 - (1 - s^rows)^bands. Candidates are verified against the full
+    signatures, so a false positive only costs a comparison while a false
+    negative is a missed duplicate. Of the splits under which a pair at the
+    threshold becomes a candidate with probability at least MIN_RECALL, the
+    one producing the fewest candidates below the threshold is used; the
+    S-curve's midpoint then lies well below the threshold.
+
+    Args:
+        threshold: Jaccard similarity above which examples are near duplicates
+        num_perm: Number of MinHash permutations
+
+    Returns:
+        Tuple of (bands, rows per band); bands * rows may be below num_perm
+    """
+    below = np.linspace(0.0, threshold, 201)
+    best, best_key = (num_perm, 1), None
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        recall = 1 - (1 - threshold ** rows) ** bands
+        false_positives = float(np.mean(1 - (1 - below ** rows) ** bands))
+        # Splits reaching the recall target first, then fewest false positives;
+        # if none reaches it, the highest recall
+        key = (0, false_positives) if recall >= MIN_RECALL else (1, -recall)
+        if best_key is None or key < best_key:
+            best, best_key = (bands, rows), key
+    return best
+
+
+class MinHasher:
+    """Vectorized MinHash over word shingles."""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, shingle_size: int = SHINGLE_SIZE, seed: int = 1):
+        """
+        Initialize the permutations.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            shingle_size: Words per shingle
+            seed: Random seed of the permutations
+        """
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Multiply-shift hashing: the high 32 bits of a * x + b (mod 2^64), a odd
+        self.a = rng.randint(1, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.b = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64)
+        self.shingle_weights = rng.randint(1, 1 << 62, size=shingle_size, dtype=np.uint64) | np.uint64(1)
+
+    def signatures(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Compute MinHash signatures.
+
+        Args:
+            texts: Example texts
+
+        Returns:
+            Array of shape (len(texts), num_perm), dtype uint32
+        """
+        words: List[bytes] = []
+        counts = np.empty(len(texts), dtype=np.int64)
+        for i, text in enumerate(texts):
+            text_words = text.lower().encode("utf-8").split()
+            counts[i] = len(text_words)
+            words.extend(text_words)
+        tokens = np.fromiter(map(zlib.crc32, words), dtype=np.uint64, count=len(words))
+        # Padding read by windows that run past the last word
+        padded = np.append(tokens, np.uint64(0))
+
+        # Every example gets at least one shingle (all its words if it is short)
+        starts = np.cumsum(counts) - counts
+        num_shingles = np.maximum(counts - self.shingle_size + 1, 1)
+        ends = np.cumsum(num_shingles)
+
+        result = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        first = 0
+        while first < len(texts):
+            # Rows whose shingles fit in one block (at least one row)
+            limit = (ends[first - 1] if first else 0) + _SIGNATURE_BLOCK
+            last = max(int(np.searchsorted(ends, limit, side="right")), first + 1)
+            result[first:last] = self._rows(
+                padded,
+                starts[first:last],
+                counts[first:last],
+                num_shingles[first:last],
+            )
+            first = last
+        return result
+
+    def _rows(self, tokens: np.ndarray, starts: np.ndarray, counts: np.ndarray, num_shingles: np.ndarray) -> np.ndarray:
+        total = int(num_shingles.sum())
+        row_offsets = np.cumsum(num_shingles) - num_shingles
+        rows = np.repeat(np.arange(len(starts)), num_shingles)
+        positions = starts[rows] + (np.arange(total) - row_offsets[rows])
+
+        # Hash each window of shingle_size words, ignoring words past the end of the row
+        window = positions[:, None] + np.arange(self.shingle_size)
+        valid = window < (starts + counts)[rows][:, None]
+        values = np.where(valid, tokens[np.where(valid, window, len(tokens) - 1)], np.uint64(0))
+        shingles = (values * self.shingle_weights).sum(axis=1, dtype=np.uint64) >> np.uint64(32)
+
+        hashed = shingles[:, None] * self.a
+        hashed += self.b
+        hashed >>= _SHIFT
+        return np.minimum.reduceat(hashed.astype(np.uint32), row_offsets, axis=0)
+
+
+def _band_keys(band: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Hash the rows of one signature band to 64-bit keys."""
+    keys = (band.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+    keys ^= keys >> np.uint64(31)
+    return keys
+
+
+def _components(size: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Label each node with the smallest node of its connected component."""
+    labels = np.arange(size)
+    if len(left) == 0:
+        return labels
+    while True:
+        previous = labels.copy()
+        np.minimum.at(labels, left, labels[right])
+        np.minimum.at(labels, right, labels[left])
+        # Labels are node indices no larger than the node, so jumping to the
+        # label's label converges on the component minimum
+        labels = labels[labels]
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def find_duplicates(
+    dataset: Any,
+    text_fields: Sequence[str],
+    near: bool = True,
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    work_dir: Optional[str] = None,
+    max_examples: int = 5,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Find exact and (optionally) near-duplicate examples.
+
+    Args:
+        dataset: `datasets.Dataset`
+        text_fields: Fields compared between examples
+        near: Also find near duplicates
+        threshold: Estimated Jaccard similarity of word shingles from which
+            examples are near duplicates
+        num_perm: MinHash signature length
+        work_dir: Directory for the temporary signature file
+        max_examples: Number of (kept, removed) near-duplicate index pairs
+            reported as examples
+
+    Returns:
+        Tuple of (sorted indices of the examples to keep, statistics)
+    """
+    start = time.perf_counter()
+    total = len(dataset)
+    columns = dataset.select_columns(list(text_fields))
+    hasher = MinHasher(num_perm) if near else None
+    bands, rows_per_band = lsh_params(threshold, num_perm) if near else (0, 0)
+
+    temp_dir = tempfile.mkdtemp(prefix="dedup-", dir=work_dir)
+    try:
+        digests = np.empty(total, dtype=np.uint64)
+        signatures = None
+        if near and total:
+            signatures = np.lib.format.open_memmap(
+                os.path.join(temp_dir, "signatures.npy"), mode="w+", dtype=np.uint32, shape=(total, num_perm)
+            )
+
+        offset = 0
+        for batch in columns.iter(batch_size=BATCH_SIZE):
+            texts = [example_text(values) for values in zip(*(batch[field] for field in text_fields))]
+            digests[offset:offset + len(texts)] = np.fromiter(
+                (int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+                 for text in texts),
+                dtype=np.uint64,
+                count=len(texts),
+            )
+            if signatures is not None:
+                signatures[offset:offset + len(texts)] = hasher.signatures(texts)
+            offset += len(texts)
+
+        # Exact duplicates: keep the first example of every digest
+        _, first_indices = np.unique(digests, return_index=True)
+        candidates = np.sort(first_indices)
+        exact_duplicates = total - len(candidates)
+        del digests
+
+        near_duplicates = 0
+        examples: List[Dict[str, int]] = []
+        keep = candidates
+        if signatures is not None and len(candidates) > 1:
+            left, right = [], []
+            weights = np.random.RandomState(2).randint(1, 1 << 62, size=rows_per_band, dtype=np.uint64) | np.uint64(1)
+            for band in range(bands):
+                columns_slice = slice(band * rows_per_band, (band + 1) * rows_per_band)
+                keys = np.empty(len(candidates), dtype=np.uint64)
+                for i in range(0, len(candidates), _MAX_SHINGLES):
+                    keys[i:i + _MAX_SHINGLES] = _band_keys(signatures[candidates[i:i + _MAX_SHINGLES], columns_slice], weights)
+
+                # Within a bucket, pair every example with the bucket's first one
+                order = np.argsort(keys, kind="stable")
+                sorted_keys = keys[order]
+                is_start = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+                leaders = order[np.flatnonzero(is_start)[np.cumsum(is_start) - 1]]
+                members = order[~is_start]
+                leaders = leaders[~is_start]
+                del keys, order, sorted_keys, is_start
+
+                # Verify candidate pairs with the full signatures
+                for i in range(0, len(members), _MAX_SHINGLES // 4):
+                    a = leaders[i:i + _MAX_SHINGLES // 4]
+                    b = members[i:i + _MAX_SHINGLES // 4]
+                    similarity = (signatures[candidates[a]] == signatures[candidates[b]]).mean(axis=1)
+                    similar = similarity >= threshold
+                    left.append(a[similar])
+                    right.append(b[similar])
+
+            left = np.concatenate(left) if left else np.empty(0, dtype=np.int64)
+            right = np.concatenate(right) if right else np.empty(0, dtype=np.int64)
+            labels = _components(len(candidates), left, right)
+            is_kept = labels == np.arange(len(candidates))
+            keep = candidates[is_kept]
+            near_duplicates = len(candidates) - len(keep)
+            removed = np.flatnonzero(~is_kept)[:max_examples]
+            examples = [
+                {"kept": int(candidates[labels[i]]), "removed": int(candidates[i])}
+                for i in removed
+            ]
+        del signatures
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    stats = {
+        "total": total,
+        "exact_duplicates": int(exact_duplicates),
+        "near_duplicates": int(near_duplicates),
+        "kept": int(len(keep)),
+        "removed_fraction": round(1 - len(keep) / total, 4) if total else 0.0,
+        "fields": list(text_fields),
+        "mode": "near" if near else "exact",
+        "threshold": threshold if near else None,
+        "num_perm": num_perm if near else None,
+        "bands": bands if near else None,
+        "rows_per_band": rows_per_band if near else None,
+        "near_duplicate_examples": examples,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    logger.info(
+        f"Dedup: {total} examples, {exact_duplicates} exact and {near_duplicates} near duplicates "
+        f"removed in {stats['seconds']}s"
+    )
+    return keep, stats
+
+
+def deduplicate(
+    dataset: Any,
+    dataset_path: str,
+    text_fields: Sequence[str],
+    mode: str = "near",
+    threshold: float = DEFAULT_THRESHOLD,
+    cache_dir: Optional[str] = None,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Find the examples to keep, reusing cached results for the same file and settings.
+
+    Args:
+        dataset: `datasets.Dataset` loaded from dataset_path
+        dataset_path: Dataset file path; identifies the cache entry
+        text_fields: Fields compared between examples
+        mode: "exact" or "near" (near also removes exact duplicates)
+        threshold: Near-duplicate Jaccard similarity threshold
+        cache_dir: Directory for cached results (None disables caching)
+
+    Returns:
+        Tuple of (sorted indices of the examples to keep, statistics)
+    """
+    if mode not in ("exact", "near"):
+        raise ValueError(f"Invalid dedup mode: {mode}. Must be 'exact' or 'near'")
+
+    cache_path = None
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        stat = os.stat(dataset_path)
+        key = json.dumps([
+            _CACHE_VERSION, os.path.abspath(dataset_path), stat.st_size, stat.st_mtime_ns,
+            list(text_fields), mode, threshold if mode == "near" else None, DEFAULT_NUM_PERM,
+        ])
+        cache_path = os.path.join(cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".npz")
+        if os.path.exists(cache_path):
+            with np.load(cache_path) as cached:
+                stats = json.loads(str(cached["stats"]))
+                stats["cached"] = True
+                return cached["keep"], stats
+
+    keep, stats = find_duplicates(
+        dataset,
+        text_fields,
+        near=mode == "near",
+        threshold=threshold,
+        work_dir=cache_dir,
+    )
+    if cache_path:
+        np.savez(cache_path, keep=keep, stats=np.array(json.dumps(stats)))
+    stats["cached"] = False
+    return keep, stats
@@ -0,0 +1,183 @@
+"""
+Dataset file formats.
+
+Datasets can be JSON/JSONL, gzip- or zstd-compressed JSONL, Parquet or Arrow
+(IPC stream or file format, which includes Feather v2). Every file is loaded
+through the `datasets` library, so the prepared splits are cached in the
+HuggingFace datasets cache like plain JSONL; compressed JSONL is decompressed
+once into that cache. Columnar files are projected onto the fields a task
+needs, so other columns are never read from disk.
+"""
+import os
+from typing import Any, List, Optional, Sequence, Tuple
+
+from ..exceptions import DatasetValidationError
+from ..logging_config import logger
+
+
+# File extension -> (datasets builder, compression)
+DATASET_EXTENSIONS = {
+    ".json": ("json", None),
+    ".jsonl": ("json", None),
+    ".json.gz": ("json", "gzip"),
+    ".jsonl.gz": ("json", "gzip"),
+    ".json.zst": ("json", "zstd"),
+    ".jsonl.zst": ("json", "zstd"),
+    ".parquet": ("parquet", None),
+    ".arrow": ("arrow", None),
+    ".feather": ("arrow", None),
+}
+
+COLUMNAR_BUILDERS = ("parquet", "arrow")
+
+
+def get_dataset_extension(filename: Optional[str]) -> Optional[str]:
+    """
+    Get the supported dataset extension of a file name.
+
+    Args:
+        filename: File name or path
+
+    Returns:
+        Extension such as ".jsonl.gz", or None if the format is not supported
+    """
+    if not filename:
+        return None
+    name = filename.lower()
+    matches = [ext for ext in DATASET_EXTENSIONS if name.endswith(ext)]
+    return max(matches, key=len) if matches else None
+
+
+def get_dataset_format(path: str) -> Tuple[str, Optional[str]]:
+    """
+    Get the datasets builder and compression of a dataset file.
+
+    Args:
+        path: Dataset file path
+
+    Returns:
+        Tuple of (builder, compression); builder is "json", "parquet" or
+        "arrow" and compression is "gzip", "zstd" or None
+
+    Raises:
+        DatasetValidationError: If the format is not supported
+    """
+    extension = get_dataset_extension(path)
+    if extension is None:
+        supported = ", ".join(DATASET_EXTENSIONS)
+        raise DatasetValidationError(f"Unsupported dataset format: {os.path.basename(path)}. Supported: {supported}")
+    return DATASET_EXTENSIONS[extension]
+
+
+def _open_arrow(path: str):
+    """Open an Arrow IPC stream or file, memory-mapped; returns a record batch reader."""
+    import pyarrow as pa
+
+    source = pa.memory_map(path)
+    try:
+        return pa.ipc.open_stream(source)
+    except pa.ArrowInvalid:
+        source.seek(0)
+        reader = pa.ipc.open_file(source)
+        return pa.RecordBatchReader.from_batches(
+            reader.schema, (reader.get_batch(i) for i in range(reader.num_record_batches))
+        )
+
+
+def read_columnar_metadata(path: str, builder: Optional[str] = None) -> Tuple[int, List[str]]:
+    """
+    Read the row count and columns of a Parquet or Arrow file without loading its data.
+
+    Args:
+        path: Parquet or Arrow file path
+        builder: "parquet" or "arrow" (default: from the file extension)
+
+    Returns:
+        Tuple of (number of rows, column names)
+
+    Raises:
+        DatasetValidationError: If the file cannot be read
+    """
+    if builder is None:
+        builder, _ = get_dataset_format(path)
+    try:
+        if builder == "parquet":
+            import pyarrow.parquet as pq
+
+            metadata = pq.read_metadata(path)
+            return metadata.num_rows, list(metadata.schema.to_arrow_schema().names)
+
+        reader = _open_arrow(path)
+        num_rows = sum(batch.num_rows for batch in reader)
+        return num_rows, list(reader.schema.names)
+
+    except DatasetValidationError:
+        raise
+    except Exception as e:
+        raise DatasetValidationError(f"Could not read {builder} file: {e}") from e
+
+
+def load_dataset_file(path: str, columns: Optional[Sequence[str]] = None) -> Any:
+    """
+    Load a dataset file as a `datasets.Dataset`.
+
+    Args:
+        path: Dataset file path
+        columns: Columns to keep (None for all). Columns missing from the file
+            are ignored, so callers can report them.
+
+    Returns:
+        Dataset with the requested columns
+
+    Raises:
+        DatasetValidationError: If the format is not supported
+    """
+    from datasets import Dataset, load_dataset
+
+    builder, compression = get_dataset_format(path)
+
+    if builder in COLUMNAR_BUILDERS and columns:
+        _, available = read_columnar_metadata(path)
+        columns = [column for column in columns if column in available]
+
+    if builder == "parquet":
+        # Projection is pushed down to the Parquet reader
+        dataset = load_dataset("parquet", data_files=path, split="train", columns=columns or None)
+    elif builder == "arrow":
+        try:
+            # Arrow IPC streams (the datasets cache format) are memory-mapped in place
+            dataset = Dataset.from_file(path)
+        except Exception:
+            dataset = load_dataset("arrow", data_files=path, split="train")
+    else:
+        dataset = load_dataset("json", data_files=path, split="train")
+
+    if columns:
+        keep = [column for column in columns if column in dataset.column_names]
+        if keep != dataset.column_names:
+            dataset = dataset.select_columns(keep)
+
+    logger.info(
+        f"Loaded dataset {os.path.basename(path)} ({builder}"
+        f"{', ' + compression if compression else ''}): {len(dataset)} rows, columns {dataset.column_names}"
+    )
+    return dataset
+
+
+def describe_dataset_file(path: str) -> Tuple[int, List[str]]:
+    """
+    Get the row count and columns of a dataset file.
+
+    Columnar files are described from their metadata; JSON files are loaded.
+
+    Args:
+        path: Dataset file path
+
+    Returns:
+        Tuple of (number of rows, column names)
+    """
+    builder, _ = get_dataset_format(path)
+    if builder in COLUMNAR_BUILDERS:
+        return read_columnar_metadata(path)
+    dataset = load_dataset_file(path)
+    return len(dataset), dataset.column_names
@@ -1,8 +1,7 @@
 import logging
 import re
 from typing import Dict, Any
-from huggingface_hub import model_info, HfApi
-from huggingface_hub.utils import RepositoryNotFoundError, GatedRepoError
+from ..hub_cache import HubMetadataCache, get_hub_cache
 
 
 class ModelValidator:
@@ -11,9 +10,14 @@ class ModelValidator:
     Performs basic checks without complex memory or compatibility analysis.
     """
     
-    def __init__(self):
-        """Initialize the ModelValidator with HuggingFace API client."""
-        self.hf_api = HfApi()
+    def __init__(self, hub_cache: HubMetadataCache = None):
+        """
+        Initialize the ModelValidator.
+        
+        Args:
+            hub_cache: Hub metadata cache. Defaults to the shared process-wide cache.
+        """
+        self.hub_cache = hub_cache or get_hub_cache()
         
     def validate_repo_name(self, repo_name: str) -> Dict[str, Any]:
         """
@@ -75,20 +79,12 @@ class ModelValidator:
         }
         
         try:
-            # Try to get model info
-            info = model_info(repo_name)
-            result["exists"] = True
-            result["accessible"] = True
-            result["is_gated"] = getattr(info, 'gated', False)
-            
-        except RepositoryNotFoundError:
-            result["error"] = "Model not found on HuggingFace Hub"
-            
-        except GatedRepoError:
-            result["exists"] = True
-            result["accessible"] = False
-            result["is_gated"] = True
-            result["error"] = "Model exists but requires access approval"
+            # Served from the shared Hub metadata cache when fresh
+            entry = self.hub_cache.lookup(repo_name)
+            result["exists"] = entry["exists"]
+            result["accessible"] = entry["accessible"]
+            result["is_gated"] = entry["is_gated"]
+            result["error"] = entry["error"]
             
         except Exception as e:
             result["error"] = f"Unable to check model: {str(e)}"
@@ -115,22 +111,15 @@ class ModelValidator:
         }
         
         try:
-            model_data = model_info(repo_name)
+            entry = self.hub_cache.lookup(repo_name)
             
-            # Extract basic info from model metadata
-            if hasattr(model_data, 'config') and model_data.config:
-                config = model_data.config
-                info["model_type"] = config.get("model_type")
-                info["architecture"] = config.get("architectures", [None])[0] if config.get("architectures") else None
-                
-            if hasattr(model_data, 'library_name'):
-                info["library"] = model_data.library_name
-                
-            if hasattr(model_data, 'tags'):
-                info["tags"] = model_data.tags or []
-                
-            if hasattr(model_data, 'pipeline_tag'):
-                info["pipeline_tag"] = model_data.pipeline_tag
+            # Extract basic info from cached model metadata
+            config = entry.get("config") or {}
+            info["model_type"] = config.get("model_type")
+            info["architecture"] = config.get("architectures", [None])[0] if config.get("architectures") else None
+            info["library"] = entry.get("library_name")
+            info["tags"] = entry.get("tags") or []
+            info["pipeline_tag"] = entry.get("pipeline_tag")
                 
         except Exception as e:
             logging.warning(f"Could not get detailed info for {repo_name}: {e}")
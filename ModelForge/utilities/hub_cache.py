@@ -0,0 +1,329 @@
+"""
+Persistent TTL cache for HuggingFace Hub model metadata.
+
+Model existence, gated status and config metadata are looked up once and
+shared by every provider and validator. Entries are persisted to disk so the
+setup wizard stays instant across restarts, the cache is bounded in size with
+least-recently-used eviction, and definitive "not found" answers are cached
+for a shorter negative TTL. Network failures are never cached: a stale entry
+is served instead when one exists, so validation degrades gracefully offline.
+In offline mode, lookups are answered from the local model registry only.
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .model_registry import get_model_registry, is_offline_mode
+from ..logging_config import logger
+
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_NEGATIVE_TTL_SECONDS = 10 * 60
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+# Config keys kept from the Hub's model metadata (enough for validation and
+# recommendations without storing the full config.json).
+CONFIG_METADATA_KEYS = ("model_type", "architectures")
+
+
+class HubMetadataCache:
+    """
+    Disk-backed, size-bounded TTL cache for Hub model metadata.
+
+    Each entry has the shape::
+
+        {
+            "model_id": str,
+            "exists": bool,
+            "accessible": bool,
+            "is_gated": bool,
+            "config": {"model_type": ..., "architectures": [...]} or None,
+            "library_name": str or None,
+            "pipeline_tag": str or None,
+            "tags": list,
+            "error": str or None,
+            "fetched_at": float,
+            "expires_at": float,
+        }
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: int = DEFAULT_NEGATIVE_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        endpoint: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        fetch_fn: Optional[Callable[[str], Dict[str, Any]]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: JSON file used for persistence. None keeps the cache in memory only.
+            ttl_seconds: Lifetime of positive entries (model exists and is accessible)
+            negative_ttl_seconds: Lifetime of negative entries (not found or no access)
+            max_entries: Maximum number of entries kept; least recently used are evicted
+            endpoint: Hub endpoint URL. Defaults to MODELFORGE_HUB_ENDPOINT / HF_ENDPOINT,
+                so a local stand-in Hub can be used for testing.
+            timeout: Network timeout for Hub requests in seconds
+            fetch_fn: Optional replacement for the Hub lookup. Must return an entry dict
+                (without timestamps) or raise ConnectionError when the Hub is unreachable.
+        """
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.endpoint = endpoint or os.environ.get("MODELFORGE_HUB_ENDPOINT") or os.environ.get("HF_ENDPOINT")
+        self.timeout = timeout
+        self.fetch_fn = fetch_fn or self._fetch_from_hub
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._last_access: Dict[str, float] = {}
+        self._load()
+
+    def lookup(self, model_id: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get metadata for a model, querying the Hub only when needed.
+
+        Args:
+            model_id: HuggingFace model identifier
+            force_refresh: Ignore any fresh cached entry
+
+        Returns:
+            Metadata entry. When the Hub is unreachable and nothing is cached,
+            the entry has exists/accessible False and "offline" True.
+        """
+        if is_offline_mode():
+            return self._lookup_local(model_id)
+
+        now = time.time()
+
+        with self._lock:
+            cached = self._entries.get(model_id)
+            if cached is not None:
+                self._last_access[model_id] = now
+                if not force_refresh and cached["expires_at"] > now:
+                    logger.debug(f"Hub metadata cache hit: {model_id}")
+                    return dict(cached)
+
+        try:
+            fetched = self.fetch_fn(model_id)
+        except ConnectionError as e:
+            if cached is not None:
+                logger.warning(f"Hub unreachable, using stale metadata for {model_id}: {e}")
+                return dict(cached, stale=True)
+            logger.warning(f"Hub unreachable and no cached metadata for {model_id}: {e}")
+            return self._empty_entry(model_id, error=f"Hub unreachable: {e}", offline=True)
+
+        # Gated-without-access is cached briefly too, so approvals show up quickly
+        accessible = fetched.get("exists") and fetched.get("accessible")
+        ttl = self.ttl_seconds if accessible else self.negative_ttl_seconds
+        entry = dict(self._empty_entry(model_id), **fetched)
+        entry["fetched_at"] = now
+        entry["expires_at"] = now + ttl
+
+        with self._lock:
+            self._entries[model_id] = entry
+            self._last_access[model_id] = now
+            self._evict()
+            self._save()
+
+        return dict(entry)
+
+    def is_accessible(self, model_id: str) -> bool:
+        """
+        Check whether a model exists and the current user can access it.
+
+        Args:
+            model_id: HuggingFace model identifier
+
+        Returns:
+            True if the model is accessible
+        """
+        entry = self.lookup(model_id)
+        return bool(entry["exists"] and entry["accessible"])
+
+    def invalidate(self, model_id: Optional[str] = None):
+        """
+        Drop cached metadata.
+
+        Args:
+            model_id: Model to drop. None clears the whole cache.
+        """
+        with self._lock:
+            if model_id is None:
+                self._entries.clear()
+                self._last_access.clear()
+            else:
+                self._entries.pop(model_id, None)
+                self._last_access.pop(model_id, None)
+            self._save()
+
+    def _empty_entry(self, model_id: str, error: Optional[str] = None, offline: bool = False) -> Dict[str, Any]:
+        """Build an entry for a model with no known metadata."""
+        entry = {
+            "model_id": model_id,
+            "exists": False,
+            "accessible": False,
+            "is_gated": False,
+            "config": None,
+            "library_name": None,
+            "pipeline_tag": None,
+            "tags": [],
+            "error": error,
+        }
+        if offline:
+            entry["offline"] = True
+        return entry
+
+    def _lookup_local(self, model_id: str) -> Dict[str, Any]:
+        """
+        Build an entry from the local model registry (offline mode).
+
+        Args:
+            model_id: Model identifier or local path
+
+        Returns:
+            Metadata entry; the model "exists" only if it is available locally
+        """
+        registry = get_model_registry()
+        config = registry.get_config(model_id)
+        if config is None:
+            return self._empty_entry(model_id, error="Model is not available locally (offline mode)", offline=True)
+
+        entry = self._empty_entry(model_id, offline=True)
+        entry.update({
+            "exists": True,
+            "accessible": True,
+            "config": {key: config.get(key) for key in CONFIG_METADATA_KEYS},
+            "local_path": registry.resolve(model_id),
+        })
+        return entry
+
+    def _fetch_from_hub(self, model_id: str) -> Dict[str, Any]:
+        """
+        Query the Hub for model metadata.
+
+        Raises:
+            ConnectionError: If the Hub cannot be reached
+        """
+        from huggingface_hub import HfApi
+        from huggingface_hub.utils import GatedRepoError, RepositoryNotFoundError, HfHubHTTPError
+
+        api = HfApi(endpoint=self.endpoint)
+
+        try:
+            info = api.model_info(model_id, timeout=self.timeout)
+        except GatedRepoError:
+            return {
+                "exists": True,
+                "accessible": False,
+                "is_gated": True,
+                "error": "Model exists but requires access approval",
+            }
+        except RepositoryNotFoundError:
+            return {"exists": False, "accessible": False, "error": "Model not found on HuggingFace Hub"}
+        except HfHubHTTPError as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if status is not None and status < 500:
+                return {"exists": False, "accessible": False, "error": f"Unable to check model: {e}"}
+            raise ConnectionError(str(e)) from e
+        except ValueError as e:
+            # Malformed repo id (HFValidationError)
+            return {"exists": False, "accessible": False, "error": f"Invalid model id: {e}"}
+        except OSError as e:
+            # requests' ConnectionError/Timeout derive from OSError
+            raise ConnectionError(str(e)) from e
+
+        config = getattr(info, "config", None) or {}
+        is_gated = bool(getattr(info, "gated", False))
+        entry = {
+            "exists": True,
+            "accessible": True,
+            "is_gated": is_gated,
+            "config": {key: config.get(key) for key in CONFIG_METADATA_KEYS} if config else None,
+            "library_name": getattr(info, "library_name", None),
+            "pipeline_tag": getattr(info, "pipeline_tag", None),
+            "tags": list(getattr(info, "tags", None) or []),
+        }
+
+        if is_gated:
+            # model_info succeeds for gated repos; check whether files can be read
+            try:
+                api.auth_check(model_id)
+            except RepositoryNotFoundError:
+                # GatedRepoError is a subclass: no access to the repository files
+                entry["accessible"] = False
+                entry["error"] = "Model exists but requires access approval"
+            except OSError as e:
+                raise ConnectionError(str(e)) from e
+
+        return entry
+
+    def _evict(self):
+        """Evict least recently used entries beyond max_entries. Caller holds the lock."""
+        overflow = len(self._entries) - self.max_entries
+        if overflow <= 0:
+            return
+        for model_id in sorted(self._last_access, key=self._last_access.get)[:overflow]:
+            self._entries.pop(model_id, None)
+            self._last_access.pop(model_id, None)
+
+    def _load(self):
+        """Load persisted entries, ignoring a missing or corrupt file."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+            self._entries = data.get("entries", {})
+            self._last_access = {
+                model_id: data.get("last_access", {}).get(model_id, entry.get("fetched_at", 0.0))
+                for model_id, entry in self._entries.items()
+            }
+            self._evict()
+            logger.info(f"Loaded {len(self._entries)} cached Hub metadata entries")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Hub metadata cache {self.cache_path}: {e}")
+            self._entries = {}
+            self._last_access = {}
+
+    def _save(self):
+        """Persist entries atomically. Caller holds the lock."""
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"entries": self._entries, "last_access": self._last_access}, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.warning(f"Could not persist Hub metadata cache: {e}")
+
+
+_hub_cache: Optional[HubMetadataCache] = None
+_hub_cache_lock = threading.Lock()
+
+
+def get_hub_cache() -> HubMetadataCache:
+    """
+    Get the process-wide Hub metadata cache shared by providers and validators.
+
+    Returns:
+        HubMetadataCache instance persisted under the ModelForge cache directory
+    """
+    global _hub_cache
+    if _hub_cache is None:
+        with _hub_cache_lock:
+            if _hub_cache is None:
+                from .settings_managers.FileManager import FileManager
+                cache_dir = FileManager.return_default_dirs()["cache"]
+                _hub_cache = HubMetadataCache(cache_path=os.path.join(cache_dir, "hub_metadata.json"))
+    return _hub_cache
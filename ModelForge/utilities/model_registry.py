@@ -0,0 +1,257 @@
+"""
+Local registry of pre-downloaded base models and offline mode support.
+
+On machines without internet access, base models are resolved from disk
+instead of the HuggingFace Hub. A model is available locally when it is:
+
+- listed in ``<base_models dir>/registry.json`` as ``{"model/name": "/path/to/model"}``,
+- a directory under ``<base_models dir>`` named ``org--name`` (or ``name``)
+  that contains a ``config.json``, or
+- a complete snapshot in the HuggingFace cache.
+
+Offline mode is enabled with ``modelforge --offline`` or by setting
+``MODELFORGE_OFFLINE=1`` (``HF_HUB_OFFLINE=1`` is honoured too).
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from ..logging_config import logger
+
+
+OFFLINE_ENV_VARS = ("MODELFORGE_OFFLINE", "HF_HUB_OFFLINE", "TRANSFORMERS_OFFLINE")
+
+
+def is_offline_mode() -> bool:
+    """
+    Check whether ModelForge runs without Hub access.
+
+    Returns:
+        True if any offline environment variable is set to a truthy value
+    """
+    return any(
+        os.environ.get(var, "").strip().lower() in ("1", "true", "yes", "on")
+        for var in OFFLINE_ENV_VARS
+    )
+
+
+def enable_offline_mode():
+    """Enable offline mode for ModelForge and the HuggingFace libraries."""
+    for var in OFFLINE_ENV_VARS:
+        os.environ[var] = "1"
+    logger.info("Offline mode enabled: models are resolved from the local registry only")
+
+
+class LocalModelRegistry:
+    """Registry of base models available on local disk."""
+
+    REGISTRY_FILENAME = "registry.json"
+
+    def __init__(self, models_dir: str, scan_hf_cache: bool = True):
+        """
+        Initialize the registry.
+
+        Args:
+            models_dir: Directory holding pre-downloaded base models and registry.json
+            scan_hf_cache: Whether to include complete snapshots from the HuggingFace cache
+        """
+        self.models_dir = models_dir
+        self.scan_hf_cache = scan_hf_cache
+        self._lock = threading.Lock()
+        self._local_models: Optional[Dict[str, str]] = None
+        self._hf_cache_models: Optional[Dict[str, str]] = None
+
+    def refresh(self):
+        """Forget discovered models so the next lookup rescans the disk."""
+        with self._lock:
+            self._local_models = None
+            self._hf_cache_models = None
+
+    def _discover_local(self) -> Dict[str, str]:
+        """
+        Discover models in the base_models directory and registry.json.
+
+        Returns:
+            Mapping of model name to local directory
+        """
+        models: Dict[str, str] = {}
+
+        if os.path.isdir(self.models_dir):
+            for entry in sorted(os.listdir(self.models_dir)):
+                path = os.path.join(self.models_dir, entry)
+                if os.path.isfile(os.path.join(path, "config.json")):
+                    models[entry.replace("--", "/")] = path
+
+        # Explicit registry entries take precedence over directory names
+        registry_path = os.path.join(self.models_dir, self.REGISTRY_FILENAME)
+        if os.path.exists(registry_path):
+            try:
+                with open(registry_path, "r") as f:
+                    for name, path in json.load(f).items():
+                        if os.path.isfile(os.path.join(path, "config.json")):
+                            models[name] = os.path.abspath(path)
+                        else:
+                            logger.warning(f"Registered model {name} has no config.json at {path}")
+            except Exception as e:
+                logger.error(f"Could not read model registry {registry_path}: {e}")
+
+        return models
+
+    def _scan_hf_cache(self) -> Dict[str, str]:
+        """Find complete model snapshots in the HuggingFace cache."""
+        models: Dict[str, str] = {}
+        if not self.scan_hf_cache:
+            return models
+
+        try:
+            from huggingface_hub import scan_cache_dir
+            cache_info = scan_cache_dir()
+        except Exception as e:
+            logger.debug(f"Skipping HuggingFace cache scan: {e}")
+            return models
+
+        for repo in cache_info.repos:
+            if repo.repo_type != "model":
+                continue
+            # Prefer the most recently modified snapshot that has a config
+            for revision in sorted(repo.revisions, key=lambda r: r.last_modified, reverse=True):
+                snapshot = str(revision.snapshot_path)
+                if os.path.isfile(os.path.join(snapshot, "config.json")):
+                    models[repo.repo_id] = snapshot
+                    break
+        return models
+
+    def _get_models(self, include_hf_cache: bool = True) -> Dict[str, str]:
+        with self._lock:
+            if self._local_models is None:
+                self._local_models = self._discover_local()
+                logger.info(f"Local model registry: {len(self._local_models)} models in {self.models_dir}")
+            if not include_hf_cache:
+                return self._local_models
+            if self._hf_cache_models is None:
+                self._hf_cache_models = self._scan_hf_cache()
+            return {**self._hf_cache_models, **self._local_models}
+
+    def list_models(self) -> List[str]:
+        """
+        List locally available model names.
+
+        Returns:
+            Sorted list of model names
+        """
+        return sorted(self._get_models().keys())
+
+    def has_model(self, model_name: str) -> bool:
+        """Check whether a model is available locally."""
+        return self.resolve(model_name) is not None
+
+    def resolve(self, model_name: str, include_hf_cache: bool = True) -> Optional[str]:
+        """
+        Resolve a model name to its local directory.
+
+        Args:
+            model_name: Hub model identifier or a local path
+            include_hf_cache: Whether snapshots in the HuggingFace cache count as local
+
+        Returns:
+            Local directory, or None if the model is not available locally
+        """
+        if os.path.isfile(os.path.join(model_name, "config.json")):
+            return os.path.abspath(model_name)
+        return self._get_models(include_hf_cache).get(model_name)
+
+    def get_config(self, model_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the config.json of a locally available model.
+
+        Args:
+            model_name: Hub model identifier or a local path
+
+        Returns:
+            Parsed config dictionary, or None if unavailable
+        """
+        path = self.resolve(model_name)
+        if path is None:
+            return None
+        try:
+            with open(os.path.join(path, "config.json"), "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Could not read config for {model_name}: {e}")
+            return None
+
+    def register(self, model_name: str, path: str):
+        """
+        Add a model to registry.json.
+
+        Args:
+            model_name: Name used in training configs (e.g. "meta-llama/Llama-3.2-1B")
+            path: Directory containing the model files and config.json
+        """
+        if not os.path.isfile(os.path.join(path, "config.json")):
+            raise ValueError(f"No config.json found in {path}")
+
+        os.makedirs(self.models_dir, exist_ok=True)
+        registry_path = os.path.join(self.models_dir, self.REGISTRY_FILENAME)
+        with self._lock:
+            registry = {}
+            if os.path.exists(registry_path):
+                with open(registry_path, "r") as f:
+                    registry = json.load(f)
+            registry[model_name] = os.path.abspath(path)
+            with open(registry_path, "w") as f:
+                json.dump(registry, f, indent=4)
+            self._local_models = None
+
+        logger.info(f"Registered local model {model_name} at {path}")
+
+
+_model_registry: Optional[LocalModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> LocalModelRegistry:
+    """
+    Get the process-wide local model registry.
+
+    Returns:
+        LocalModelRegistry rooted at the ModelForge base_models directory
+    """
+    global _model_registry
+    if _model_registry is None:
+        with _model_registry_lock:
+            if _model_registry is None:
+                from .settings_managers.FileManager import FileManager
+                _model_registry = LocalModelRegistry(FileManager.return_default_dirs()["base_models"])
+    return _model_registry
+
+
+def resolve_model_path(model_name: str) -> str:
+    """
+    Resolve a model name to what should be passed to from_pretrained.
+
+    Models in the base_models directory or registry.json are always loaded
+    from disk. In offline mode, HuggingFace cache snapshots are used too, and
+    a model that is not available locally is an error instead of a network
+    timeout. Online, other names are returned unchanged for the Hub to resolve.
+
+    Args:
+        model_name: Hub model identifier or a local path
+
+    Returns:
+        Local directory if available, otherwise the model name unchanged
+
+    Raises:
+        FileNotFoundError: In offline mode, if the model is not available locally
+    """
+    offline = is_offline_mode()
+    local_path = get_model_registry().resolve(model_name, include_hf_cache=offline)
+    if local_path is not None:
+        return local_path
+    if offline:
+        raise FileNotFoundError(
+            f"Model {model_name} is not available locally and ModelForge is in offline mode. "
+            f"Copy it to the base_models directory or add it to registry.json."
+        )
+    return model_name
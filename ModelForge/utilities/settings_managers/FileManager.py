@@ -18,6 +18,8 @@ class FileManager:
         "logs": os.path.abspath(os.path.join(dirs_base, "logs")),
         "database": os.path.abspath(os.path.join(dirs_base, "database")),
         "model_checkpoints": os.path.abspath(os.path.join(dirs_base, "model_checkpoints")),
+        "cache": os.path.abspath(os.path.join(dirs_base, "cache")),
+        "base_models": os.path.abspath(os.path.join(dirs_base, "base_models")),
     }
 
     def __new__(cls, *args, **kwargs):
@@ -0,0 +1,222 @@
+"""
+Token length profiling for training datasets.
+
+Examples are formatted exactly as the training strategies format them (task
+prompt template or the model's chat template, plus EOS) and tokenized with
+the model's tokenizer. The resulting length distribution shows how much of
+the dataset a max_seq_length truncates and how much compute padding to it
+wastes, since sequences are padded to max_seq_length during training.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..formatters.batched_formatters import create_batched_formatter
+from ..formatters.chat_templates import _user_and_assistant_columns, get_chat_formatter
+
+
+# Candidate max_seq_length values reported in every profile
+CANDIDATE_LENGTHS = [128, 256, 512, 1024, 2048, 4096, 8192]
+
+# Rows tokenized when no sample size is given
+DEFAULT_SAMPLE_SIZE = 20_000
+
+# Recommended lengths are rounded up to a multiple of this
+LENGTH_MULTIPLE = 64
+
+# The recommendation keeps at least this fraction of examples untruncated
+RECOMMENDED_COVERAGE = 0.99
+
+HISTOGRAM_BINS = 40
+
+# Rows per tokenizer call; fast tokenizers encode a batch on all cores
+BATCH_SIZE = 1000
+
+# tokenizer.model_max_length above this means the model does not declare one
+_UNSET_MODEL_MAX_LENGTH = 1_000_000
+
+PREFERENCE_STRATEGIES = ("dpo", "rlhf", "orpo", "simpo")
+
+
+def _token_counts(tokenizer: Any, texts: List[str], add_special_tokens: bool = True) -> np.ndarray:
+    """Number of tokens of each text."""
+    if not texts:
+        return np.zeros(0, dtype=np.int64)
+    encoded = tokenizer(
+        texts,
+        add_special_tokens=add_special_tokens,
+        return_attention_mask=False,
+        return_token_type_ids=False,
+    )["input_ids"]
+    return np.fromiter(map(len, encoded), dtype=np.int64, count=len(texts))
+
+
+def _plain_batch(tokenizer: Any, batch: Dict[str, List[Any]], formatter: Any) -> Tuple[np.ndarray, np.ndarray]:
+    formatted = formatter(batch)
+    texts = formatted["text"]
+    prompts = [text[:length] for text, length in zip(texts, formatted["prompt_length"])]
+    return _token_counts(tokenizer, texts), _token_counts(tokenizer, prompts)
+
+
+def _chat_batch(task: str, batch: Dict[str, List[Any]], formatter: Any) -> Tuple[np.ndarray, np.ndarray]:
+    users, assistants = _user_and_assistant_columns(task, batch)
+    lengths, prompt_lengths = formatter.sequence_lengths(users, assistants)
+    return np.asarray(lengths, dtype=np.int64), np.asarray(prompt_lengths, dtype=np.int64)
+
+
+def _preference_batch(tokenizer: Any, batch: Dict[str, List[Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    # The trainer pads chosen and rejected to the longer of the two
+    prompts = _token_counts(tokenizer, [str(value or "") for value in batch["prompt"]])
+    chosen = _token_counts(tokenizer, [str(value or "") for value in batch["chosen"]], add_special_tokens=False)
+    rejected = _token_counts(tokenizer, [str(value or "") for value in batch["rejected"]], add_special_tokens=False)
+    # +1 for the EOS token appended to each response
+    return prompts + np.maximum(chosen, rejected) + 1, prompts
+
+
+def sequence_lengths(
+    dataset: Any,
+    tokenizer: Any,
+    task: str,
+    strategy: str = "sft",
+    prompt_format: str = "plain",
+    system_prompt: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tokenize a dataset the way training does and return the sequence lengths.
+
+    Args:
+        dataset: datasets.Dataset with task fields (after _format_dataset)
+        tokenizer: Tokenizer instance
+        task: Task type
+        strategy: Training strategy
+        prompt_format: "plain" or "chat_template" (already resolved for the tokenizer)
+        system_prompt: System message for the chat template
+
+    Returns:
+        Tuple of (sequence lengths, prompt lengths) in tokens, one per example
+    """
+    lengths, prompt_lengths = [], []
+
+    if strategy in PREFERENCE_STRATEGIES:
+        for batch in dataset.iter(batch_size=BATCH_SIZE):
+            batch_lengths, batch_prompts = _preference_batch(tokenizer, batch)
+            lengths.append(batch_lengths)
+            prompt_lengths.append(batch_prompts)
+
+    elif prompt_format == "chat_template":
+        formatter = get_chat_formatter(tokenizer, system_prompt)
+        for batch in dataset.iter(batch_size=BATCH_SIZE):
+            batch_lengths, batch_prompts = _chat_batch(task, batch, formatter)
+            lengths.append(batch_lengths)
+            prompt_lengths.append(batch_prompts)
+
+    else:
+        formatter = create_batched_formatter(task, tokenizer.eos_token or tokenizer.sep_token or "")
+        for batch in dataset.iter(batch_size=BATCH_SIZE):
+            batch_lengths, batch_prompts = _plain_batch(tokenizer, batch, formatter)
+            lengths.append(batch_lengths)
+            prompt_lengths.append(batch_prompts)
+
+    if not lengths:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(lengths), np.concatenate(prompt_lengths)
+
+
+def model_max_length(tokenizer: Any) -> Optional[int]:
+    """The maximum length declared by the tokenizer, or None if it declares none."""
+    value = getattr(tokenizer, "model_max_length", None)
+    if not value or value > _UNSET_MODEL_MAX_LENGTH:
+        return None
+    return int(value)
+
+
+def recommend_max_length(lengths: np.ndarray, max_length: Optional[int] = None) -> int:
+    """
+    Recommend a max_seq_length for a length distribution.
+
+    The smallest multiple of LENGTH_MULTIPLE that keeps RECOMMENDED_COVERAGE
+    of the examples untruncated, capped at the model's maximum length.
+
+    Args:
+        lengths: Sequence lengths in tokens
+        max_length: Model's maximum length, if known
+
+    Returns:
+        Recommended max_seq_length
+    """
+    if len(lengths) == 0:
+        return LENGTH_MULTIPLE
+    covered = int(np.ceil(np.quantile(lengths, RECOMMENDED_COVERAGE)))
+    recommended = max(LENGTH_MULTIPLE, -(-covered // LENGTH_MULTIPLE) * LENGTH_MULTIPLE)
+    if max_length is not None:
+        recommended = min(recommended, max_length)
+    return recommended
+
+
+def _length_stats(lengths: np.ndarray) -> Dict[str, Any]:
+    if len(lengths) == 0:
+        return {"min": 0, "max": 0, "mean": 0.0, "p50": 0, "p90": 0, "p95": 0, "p99": 0}
+    p50, p90, p95, p99 = np.quantile(lengths, [0.5, 0.9, 0.95, 0.99])
+    return {
+        "min": int(lengths.min()),
+        "max": int(lengths.max()),
+        "mean": round(float(lengths.mean()), 1),
+        "p50": int(np.ceil(p50)),
+        "p90": int(np.ceil(p90)),
+        "p95": int(np.ceil(p95)),
+        "p99": int(np.ceil(p99)),
+    }
+
+
+def _candidate_stats(lengths: np.ndarray, prompt_lengths: np.ndarray, max_length: int) -> Dict[str, Any]:
+    """Truncation and padding at one max_seq_length."""
+    total = max(len(lengths), 1)
+    kept_tokens = np.minimum(lengths, max_length)
+    return {
+        "max_seq_length": int(max_length),
+        "truncated": int((lengths > max_length).sum()),
+        "truncation_rate": round(float((lengths > max_length).sum()) / total, 4),
+        # Examples with no completion tokens left; dropped with completion_only_loss
+        "no_completion_rate": round(float((prompt_lengths >= max_length).sum()) / total, 4),
+        "truncated_token_fraction": round(1 - float(kept_tokens.sum()) / max(float(lengths.sum()), 1.0), 4),
+        # Share of the padded batch that is padding
+        "padding_waste": round(1 - float(kept_tokens.sum()) / (total * max_length), 4),
+    }
+
+
+def summarize_lengths(
+    lengths: np.ndarray,
+    prompt_lengths: np.ndarray,
+    max_length: Optional[int] = None,
+    candidates: Sequence[int] = CANDIDATE_LENGTHS,
+) -> Dict[str, Any]:
+    """
+    Summarize a token length distribution.
+
+    Args:
+        lengths: Sequence lengths in tokens
+        prompt_lengths: Prompt lengths in tokens
+        max_length: Model's maximum length; longer candidates are left out
+        candidates: Candidate max_seq_length values
+
+    Returns:
+        Dictionary with length percentiles, prompt percentiles, a histogram,
+        truncation rate and padding waste per candidate, and the recommended
+        max_seq_length with its stats
+    """
+    recommended = recommend_max_length(lengths, max_length)
+    sizes = sorted({size for size in candidates if max_length is None or size <= max_length} | {recommended})
+
+    counts, edges = np.histogram(lengths, bins=HISTOGRAM_BINS) if len(lengths) else ([], [])
+    return {
+        "lengths": _length_stats(lengths),
+        "prompt_lengths": _length_stats(prompt_lengths),
+        "histogram": {
+            "edges": [int(np.ceil(edge)) for edge in edges],
+            "counts": [int(count) for count in counts],
+        },
+        "candidates": [_candidate_stats(lengths, prompt_lengths, size) for size in sizes],
+        "model_max_length": max_length,
+        "recommended_max_seq_length": recommended,
+        "recommended": _candidate_stats(lengths, prompt_lengths, recommended),
+    }
@@ -0,0 +1,188 @@
+"""
+Concurrency benchmark for the /models listing endpoint.
+
+Fills a temporary database with synthetic models, serves the models router
+from a separate uvicorn process, fires parallel GET /models/ requests at it
+and reports latency percentiles and throughput for two data layers:
+
+- blocking: the route handlers run the synchronous DatabaseManager queries
+  directly, as the models router did before the async data layer (every
+  query blocks the event loop),
+- async: AsyncDatabaseManager (aiosqlite), the router's default.
+
+Both use the same router, so only the data layer differs. A share of the
+requests (--slow-fraction) are large unindexed pages, to show how one slow
+query affects the latency of the fast ones.
+
+Usage:
+    python benchmarks/bench_api_concurrency.py
+    python benchmarks/bench_api_concurrency.py --rows 100000 --concurrency 64 --requests 4000
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from bench_db_queries import TASKS, make_rows, populate  # noqa: E402
+
+SLOW_PARAMS = {"limit": 500, "sort_by": "name", "include_config": "true"}
+
+
+def serve(db_path: str, mode: str, port: int):
+    """Run the models router on `port` (in a child process)."""
+    import uvicorn
+    from fastapi import FastAPI
+
+    from ModelForge.database.async_database_manager import AsyncDatabaseManager
+    from ModelForge.database.database_manager import DatabaseManager
+    from ModelForge.dependencies import get_model_service
+    from ModelForge.routers import models_router
+    from ModelForge.services.model_service import ModelService
+
+    class BlockingModelService(ModelService):
+        """Runs the sync queries on the event loop."""
+
+        async def list_models_async(self, **kwargs):
+            return self.list_models(**kwargs)
+
+        async def get_models_etag_async(self, *parts):
+            return self.get_models_etag(*parts)
+
+    logging.getLogger("modelforge").setLevel(logging.WARNING)
+    db = DatabaseManager(db_path)
+    if mode == "async":
+        service = ModelService(db, AsyncDatabaseManager(db_path))
+    else:
+        service = BlockingModelService(db)
+
+    app = FastAPI()
+    app.include_router(models_router.router)
+    app.dependency_overrides[get_model_service] = lambda: service
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="error")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server on port {port} did not start")
+
+
+async def run_load(port: int, concurrency: int, total_requests: int, slow_fraction: float) -> Dict[str, Any]:
+    """Send total_requests requests from `concurrency` parallel workers."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total_requests))
+    slow_every = int(1 / slow_fraction) if slow_fraction > 0 else 0
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal errors
+        for i in counter:
+            slow = slow_every and i % slow_every == 0
+            if slow:
+                params = SLOW_PARAMS
+            else:
+                params = {"limit": 50}
+                if i % 2:
+                    params["task"] = TASKS[i % len(TASKS)]
+            start = time.perf_counter()
+            response = await client.get("/models/", params=params)
+            if not slow:
+                latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=120) as client:
+        await client.get("/models/")  # warm up
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+    return {
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "rps": total_requests / elapsed,
+        "errors": errors,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ModelForge /models concurrency benchmark")
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of synthetic model rows")
+    parser.add_argument("--concurrency", type=int, default=32, help="Parallel clients")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests per data layer")
+    parser.add_argument(
+        "--slow-fraction",
+        type=float,
+        default=0.01,
+        help="Fraction of requests that are large unindexed pages (excluded from the percentiles)",
+    )
+    args = parser.parse_args()
+
+    from ModelForge.database.database_manager import DatabaseManager
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.sqlite")
+        db = DatabaseManager(db_path)
+        populate(db, make_rows(args.rows))
+        db.close()
+
+        context = multiprocessing.get_context("spawn")
+        for mode in ("blocking", "async"):
+            port = free_port()
+            server = context.Process(target=serve, args=(db_path, mode, port), daemon=True)
+            server.start()
+            try:
+                wait_for_port(port)
+                results[mode] = asyncio.run(
+                    run_load(port, args.concurrency, args.requests, args.slow_fraction)
+                )
+            finally:
+                server.terminate()
+                server.join()
+
+    print("=" * 68)
+    print(
+        f"GET /models/: {args.rows:,} rows, {args.concurrency} clients, {args.requests} requests, "
+        f"{args.slow_fraction:.0%} slow"
+    )
+    print("-" * 68)
+    print(f"{'data layer':10s} {'p50 ms':>10s} {'p95 ms':>10s} {'p99 ms':>10s} {'req/s':>10s} {'errors':>8s}")
+    for mode, result in results.items():
+        print(
+            f"{mode:10s} {result['p50']:10.1f} {result['p95']:10.1f} {result['p99']:10.1f} "
+            f"{result['rps']:10.0f} {result['errors']:8d}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
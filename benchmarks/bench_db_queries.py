@@ -0,0 +1,155 @@
+"""
+Benchmark for model list/filter queries on a large models table.
+
+Fills a temporary database with synthetic model rows and times the
+DatabaseManager listing methods plus paged queries (newest N models, newest
+N for a task), once with the listing indexes and once with them dropped.
+The query plans are printed so the index use can be checked.
+
+Usage:
+    python benchmarks/bench_db_queries.py
+    python benchmarks/bench_db_queries.py --rows 100000 --repeats 5
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, text  # noqa: E402
+
+from ModelForge.database.database_manager import DatabaseManager  # noqa: E402
+from ModelForge.database.models import Model  # noqa: E402
+
+TASKS = ["text-generation", "summarization", "extractive-question-answering"]
+STRATEGIES = ["sft", "qlora", "dpo", "rlhf"]
+PAGE_SIZE = 50
+INSERT_BATCH_SIZE = 10_000
+
+PAGED_QUERIES = {
+    "newest page": (
+        "SELECT * FROM models WHERE is_active = 1 ORDER BY created_at DESC LIMIT :limit",
+        {},
+    ),
+    "newest page by task": (
+        "SELECT * FROM models WHERE task = :task AND is_active = 1 ORDER BY created_at DESC LIMIT :limit",
+        {"task": "summarization"},
+    ),
+    "count by task": (
+        "SELECT COUNT(*) FROM models WHERE task = :task AND is_active = 1",
+        {"task": "summarization"},
+    ),
+}
+
+
+def make_rows(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Build synthetic model rows; about 10% are soft-deleted."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    rows = []
+    for i in range(count):
+        created_at = start + timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+        task = rng.choice(TASKS)
+        rows.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "name": f"model_{i}_finetuned",
+            "base_model": f"org/base-{rng.randint(0, 50)}",
+            "task": task,
+            "strategy": rng.choice(STRATEGIES),
+            "provider": "huggingface",
+            "path": f"/models/model_{i}",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "compute_profile": "mid_range",
+            "config": '{"num_train_epochs": 1}',
+            "is_active": rng.random() > 0.1,
+        })
+    return rows
+
+
+def populate(db: DatabaseManager, rows: List[Dict[str, Any]]):
+    with db.engine.begin() as connection:
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            connection.execute(insert(Model), rows[start:start + INSERT_BATCH_SIZE])
+        connection.execute(text("ANALYZE models"))
+
+
+def time_call(fn: Callable[[], Any], repeats: int) -> Tuple[float, Any]:
+    """Return (best seconds, result) over several runs."""
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_queries(db: DatabaseManager, sample_id: str, repeats: int) -> Dict[str, float]:
+    timings = {}
+    timings["get_all_models"], _ = time_call(db.get_all_models, repeats)
+    timings["get_models_by_task"], _ = time_call(lambda: db.get_models_by_task("summarization"), repeats)
+    timings["get_model_by_id"], _ = time_call(lambda: db.get_model_by_id(sample_id), repeats)
+
+    with db.engine.connect() as connection:
+        for name, (sql, params) in PAGED_QUERIES.items():
+            statement = text(sql)
+            timings[name], _ = time_call(
+                lambda: connection.execute(statement, {"limit": PAGE_SIZE, **params}).fetchall(),
+                repeats,
+            )
+    return timings
+
+
+def print_plans(db: DatabaseManager):
+    with db.engine.connect() as connection:
+        for name, (sql, params) in PAGED_QUERIES.items():
+            plan = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"), {"limit": PAGE_SIZE, **params}).fetchall()
+            print(f"  {name:22s} {' | '.join(row[-1] for row in plan)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ModelForge database query benchmark")
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of synthetic model rows")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per query; the best is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = DatabaseManager(os.path.join(tmp_dir, "bench.sqlite"))
+        rows = make_rows(args.rows)
+        start = time.perf_counter()
+        populate(db, rows)
+        print(f"Inserted {args.rows:,} rows in {time.perf_counter() - start:.2f}s")
+        sample_id = rows[len(rows) // 2]["id"]
+
+        print("Query plans (indexed):")
+        print_plans(db)
+        indexed = run_queries(db, sample_id, args.repeats)
+
+        with db.engine.begin() as connection:
+            connection.execute(text("DROP INDEX ix_models_active_created"))
+            connection.execute(text("DROP INDEX ix_models_task_active_created"))
+            connection.execute(text("ANALYZE models"))
+        print("Query plans (no indexes):")
+        print_plans(db)
+        unindexed = run_queries(db, sample_id, args.repeats)
+        db.close()
+
+    print("=" * 68)
+    print(f"{'query':22s} {'no indexes':>14s} {'indexed':>14s} {'speedup':>10s}")
+    print("-" * 68)
+    for name in indexed:
+        print(
+            f"{name:22s} {unindexed[name] * 1000:11.2f} ms {indexed[name] * 1000:11.2f} ms "
+            f"{unindexed[name] / indexed[name]:9.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Import-time benchmark for ModelForge cold start.
+
+Runs ``python -X importtime`` on the CLI and API entry modules in a fresh
+interpreter, reports the cumulative import cost and the slowest imports, and
+exits non-zero when the cold start exceeds the budget or when a heavy ML
+library (torch, transformers, ...) is imported eagerly.
+
+Usage:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --module ModelForge.cli --budget-ms 800
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+DEFAULT_MODULES = ["ModelForge.cli", "ModelForge.app"]
+
+# Libraries that must only be imported once a training job or model load starts
+HEAVY_MODULES = [
+    "torch",
+    "transformers",
+    "datasets",
+    "peft",
+    "trl",
+    "unsloth",
+    "bitsandbytes",
+    "accelerate",
+]
+
+
+def run_importtime(module: str) -> List[Tuple[int, int, str]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module: Dotted module name to import
+
+    Returns:
+        List of (self_us, cumulative_us, name) tuples; name keeps its indentation
+    """
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = repo_root + os.pathsep + env.get("PYTHONPATH", "")
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=repo_root,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-4000:]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        # The name column is prefixed by one space, then two per nesting level
+        entries.append((int(self_us), int(cumulative_us), name[1:].rstrip()))
+    return entries
+
+
+def summarize(entries: List[Tuple[int, int, str]]) -> Dict:
+    """
+    Summarize importtime entries.
+
+    Args:
+        entries: Parsed importtime entries
+
+    Returns:
+        Dictionary with total time, heavy modules imported and slowest imports
+    """
+    # Top-level entries (no indentation) are imported directly by the command
+    # and their cumulative times add up to the full cold-start cost.
+    total_us = sum(cum for _, cum, name in entries if not name.startswith(" "))
+    imported = {name.strip() for _, _, name in entries}
+    heavy = sorted(m for m in HEAVY_MODULES if m in imported)
+    slowest = sorted(entries, key=lambda e: e[0], reverse=True)[:15]
+
+    return {
+        "total_ms": total_us / 1000.0,
+        "heavy_modules": heavy,
+        "slowest": [(self_us / 1000.0, name.strip()) for self_us, _, name in slowest],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ModelForge import-time benchmark")
+    parser.add_argument(
+        "--module",
+        action="append",
+        help="Module to benchmark (repeatable). Defaults to the CLI and API entry points.",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.environ.get("MODELFORGE_IMPORT_BUDGET_MS", 1500)),
+        help="Maximum allowed cold-start import time per module in milliseconds",
+    )
+    parser.add_argument(
+        "--allow-heavy",
+        action="store_true",
+        help="Do not fail when heavy ML libraries are imported eagerly",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.module or DEFAULT_MODULES:
+        summary = summarize(run_importtime(module))
+
+        print("=" * 80)
+        print(f"{module}: {summary['total_ms']:.1f} ms (budget {args.budget_ms:.0f} ms)")
+        print("-" * 80)
+        for self_ms, name in summary["slowest"]:
+            print(f"  {self_ms:8.1f} ms  {name}")
+
+        if summary["total_ms"] > args.budget_ms:
+            print(f"FAIL: {module} cold start exceeds budget")
+            failed = True
+
+        if summary["heavy_modules"] and not args.allow_heavy:
+            print(f"FAIL: {module} eagerly imports {summary['heavy_modules']}")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
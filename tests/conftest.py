@@ -0,0 +1,62 @@
+"""
+Shared fixtures for the ModelForge tests.
+
+ModelForge resolves its data directory when first imported, so it is pointed
+at a temporary directory before any test module imports it.
+"""
+import json
+import os
+import tempfile
+
+import pytest
+
+os.environ["XDG_DATA_HOME"] = tempfile.mkdtemp(prefix="modelforge-tests-")
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+
+
+@pytest.fixture(scope="session")
+def tiny_model_dir(tmp_path_factory):
+    """A tiny randomly initialized GPT-2 with a byte-level BPE tokenizer, saved to disk."""
+    import numpy as np
+    from tokenizers import Tokenizer, decoders, models, pre_tokenizers, trainers
+    from transformers import GPT2Config, GPT2LMHeadModel, PreTrainedTokenizerFast
+
+    path = tmp_path_factory.mktemp("tiny-gpt2")
+    rng = np.random.RandomState(0)
+    vocab = [f"w{i}" for i in range(300)]
+
+    tokenizer = Tokenizer(models.BPE())
+    tokenizer.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+    tokenizer.decoder = decoders.ByteLevel()
+    tokenizer.train_from_iterator(
+        [" ".join(rng.choice(vocab, 50)) for _ in range(200)],
+        trainers.BpeTrainer(
+            vocab_size=600,
+            special_tokens=["</s>", "<pad>"],
+            initial_alphabet=pre_tokenizers.ByteLevel.alphabet(),
+        ),
+    )
+    tokenizer = PreTrainedTokenizerFast(tokenizer_object=tokenizer, eos_token="</s>", pad_token="<pad>")
+    tokenizer.save_pretrained(path)
+
+    config = GPT2Config(vocab_size=len(tokenizer), n_embd=32, n_layer=2, n_head=2, n_positions=128)
+    GPT2LMHeadModel(config).save_pretrained(path)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def preference_dataset(tmp_path_factory):
+    """A JSONL preference dataset with prompt, chosen and rejected fields."""
+    import numpy as np
+
+    rng = np.random.RandomState(1)
+    vocab = [f"w{i}" for i in range(300)]
+    path = tmp_path_factory.mktemp("datasets") / "preferences.jsonl"
+    with open(path, "w") as f:
+        for _ in range(40):
+            f.write(json.dumps({
+                "prompt": " ".join(rng.choice(vocab, rng.randint(3, 10))),
+                "chosen": " ".join(rng.choice(vocab, rng.randint(3, 10))),
+                "rejected": " ".join(rng.choice(vocab, rng.randint(3, 10))),
+            }) + "\n")
+    return str(path)
@@ -0,0 +1,64 @@
+"""Tests for exact and near-duplicate detection."""
+import numpy as np
+import pytest
+from datasets import Dataset
+
+from ModelForge.utilities.dataset_dedup import MIN_RECALL, SHINGLE_SIZE, MinHasher, find_duplicates, lsh_params
+
+
+def _shingles(text):
+    words = text.split()
+    return {tuple(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def _jaccard(a, b):
+    a, b = _shingles(a), _shingles(b)
+    return len(a & b) / len(a | b)
+
+
+def _near_duplicates(num_pairs, changed_words, seed=0):
+    """Random documents, each followed by a copy with a few words replaced."""
+    rng = np.random.RandomState(seed)
+    vocab = [f"w{i}" for i in range(5000)]
+    texts = []
+    for _ in range(num_pairs):
+        words = list(rng.choice(vocab, 300))
+        copy = list(words)
+        # Spaced replacements, so each one changes its own SHINGLE_SIZE shingles
+        for position in rng.choice(np.arange(SHINGLE_SIZE, 300 - SHINGLE_SIZE, SHINGLE_SIZE * 2), changed_words, replace=False):
+            copy[position] = f"x{rng.randint(10 ** 6)}"
+        texts.extend([" ".join(words), " ".join(copy)])
+    return texts
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.8, 0.85, 0.9, 0.95])
+def test_lsh_params_reach_recall_target_at_threshold(threshold):
+    bands, rows = lsh_params(threshold, 128)
+    assert bands * rows <= 128
+    assert 1 - (1 - threshold ** rows) ** bands >= MIN_RECALL
+
+
+def test_near_duplicates_above_threshold_are_removed():
+    texts = _near_duplicates(num_pairs=60, changed_words=5)
+    similarities = [_jaccard(texts[i], texts[i + 1]) for i in range(0, len(texts), 2)]
+    assert 0.83 < min(similarities) and max(similarities) < 0.87
+
+    keep, stats = find_duplicates(Dataset.from_dict({"text": texts}), ["text"], threshold=0.8)
+
+    # Every copy whose estimated similarity reaches the threshold must be found;
+    # MinHash noise (about +-0.03 here) puts a few of them below it
+    signatures = MinHasher().signatures(texts)
+    copies = [i + 1 for i in range(0, len(texts), 2) if (signatures[i] == signatures[i + 1]).mean() >= 0.8]
+    assert len(copies) >= 50
+    assert stats["near_duplicates"] == len(copies)
+    assert not set(copies) & set(keep.tolist())
+
+
+def test_dissimilar_examples_are_kept():
+    texts = _near_duplicates(num_pairs=30, changed_words=20)
+    assert max(_jaccard(texts[i], texts[i + 1]) for i in range(0, len(texts), 2)) < 0.6
+
+    keep, stats = find_duplicates(Dataset.from_dict({"text": texts}), ["text"], threshold=0.8)
+
+    assert stats["near_duplicates"] == 0
+    assert len(keep) == len(texts)
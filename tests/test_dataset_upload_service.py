@@ -0,0 +1,72 @@
+"""Tests for streaming JSONL upload validation."""
+import gzip
+import tracemalloc
+import zlib
+
+import pytest
+import zstandard
+
+from ModelForge.exceptions import DatasetValidationError
+from ModelForge.services import dataset_upload_service
+from ModelForge.services.dataset_upload_service import UPLOAD_CHUNK_SIZE, JsonlValidator
+
+
+def _compress(data, compression):
+    if compression == "gzip":
+        return gzip.compress(data)
+    return zstandard.ZstdCompressor().compress(data)
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_chunks_split_on_frame_boundary(compression):
+    first = _compress(b'{"a": 1}\n' * 100, compression)
+    second = _compress(b'{"a": 2}\n' * 50, compression)
+
+    validator = JsonlValidator(compression)
+    validator.feed(first)
+    validator.feed(second)
+    validator.close()
+
+    assert validator.records == 150
+    assert validator.fields == ["a"]
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_truncated_compressed_upload_is_rejected(compression):
+    data = _compress(b'{"a": 1}\n' * 100, compression) + _compress(b'{"a": 2}\n' * 50, compression)
+
+    validator = JsonlValidator(compression)
+    validator.feed(data[:-3])
+    with pytest.raises(DatasetValidationError, match="truncated"):
+        validator.close()
+
+
+def _bomb(compression, size):
+    """Compress `size` bytes of one endless line of zeros, without holding them in memory."""
+    block = b"0" * (1 << 20)
+    if compression == "gzip":
+        compressor = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+        parts = [compressor.compress(block) for _ in range(size >> 20)]
+        return b"".join(parts) + compressor.flush()
+    compressor = zstandard.ZstdCompressor(level=19).compressobj()
+    parts = [compressor.compress(block) for _ in range(size >> 20)]
+    return b"".join(parts) + compressor.flush()
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_decompression_bomb_is_rejected_without_expanding(compression, monkeypatch):
+    monkeypatch.setattr(dataset_upload_service, "MAX_LINE_BYTES", 1 << 20)
+    data = _bomb(compression, 256 << 20)
+    assert len(data) < UPLOAD_CHUNK_SIZE
+
+    validator = JsonlValidator(compression)
+    tracemalloc.start()
+    try:
+        with pytest.raises(DatasetValidationError, match="longer than"):
+            validator.feed(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # A few decompressed pieces (at most 16 MB each), not the 256 MB
+    assert peak < 64 << 20
@@ -0,0 +1,77 @@
+"""Tests for BaseModelCache."""
+import pytest
+
+from ModelForge.services.model_cache import BaseModelCache
+from ModelForge.strategies.sft_strategy import SFTStrategy
+
+
+@pytest.fixture
+def cached_model(tiny_model_dir):
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+    cache = BaseModelCache(max_memory_bytes=1 << 30)
+    key = cache.make_key({"model_name": tiny_model_dir, "use_4bit": False}, "AutoModelForCausalLM")
+    model = AutoModelForCausalLM.from_pretrained(tiny_model_dir)
+    tokenizer = AutoTokenizer.from_pretrained(tiny_model_dir)
+    return cache, key, model, tokenizer
+
+
+def _train_lora(model, tokenizer, steps=3):
+    """Wrap the model in fresh LoRA adapters and take a few optimizer steps."""
+    import torch
+
+    # Mirror prepare_model_for_kbit_training(), which hooks the embeddings.
+    model.enable_input_require_grads()
+    model = SFTStrategy().prepare_model(
+        model, {"task": "text-generation", "lora_r": 4, "lora_alpha": 8, "target_modules": ["c_attn"]}
+    )
+    model.train()
+    optimizer = torch.optim.AdamW([p for p in model.parameters() if p.requires_grad], lr=1e-2)
+    batch = tokenizer(["w1 w2 w3 w4 w5 w6", "w7 w8 w9 w10 w11 w12"], return_tensors="pt", padding=True)
+    for _ in range(steps):
+        loss = model(**batch, labels=batch["input_ids"]).loss
+        loss.backward()
+        optimizer.step()
+        optimizer.zero_grad()
+    return model
+
+
+def _snapshot(model):
+    return {name: tensor.detach().clone() for name, tensor in model.state_dict().items()}
+
+
+def test_released_lora_model_is_reacquired_clean(cached_model):
+    """Adapters are unloaded on release and the cached base weights are untouched."""
+    import torch
+
+    cache, key, model, tokenizer = cached_model
+    before = _snapshot(model)
+
+    assert cache.release(key, _train_lora(model, tokenizer), tokenizer)
+    acquired = cache.acquire(key)
+    assert acquired is not None
+    base_model, _ = acquired
+
+    assert base_model is model
+    assert not [name for name, _ in base_model.named_modules() if "lora_" in name]
+    assert not hasattr(base_model, "peft_config")
+    assert not base_model.get_input_embeddings()._forward_hooks
+    assert not any(param.requires_grad for param in base_model.parameters())
+    after = base_model.state_dict()
+    assert after.keys() == before.keys()
+    for name, tensor in before.items():
+        assert torch.equal(after[name], tensor), name
+
+    # A second job on the cached instance is put back as well.
+    assert cache.release(key, _train_lora(base_model, tokenizer), tokenizer)
+    assert cache.acquire(key) is not None
+
+
+def test_trained_base_weights_are_evicted(cached_model):
+    """Base parameters left trainable by a job fail the checks and are not cached."""
+    cache, key, model, tokenizer = cached_model
+    model = _train_lora(model, tokenizer)
+    model.get_base_model().lm_head.weight.requires_grad_(True)
+
+    assert not cache.release(key, model, tokenizer)
+    assert cache.acquire(key) is None
@@ -0,0 +1,47 @@
+"""Tests for TrainingService.train_model."""
+import pytest
+
+from ModelForge.dependencies import get_training_service, reset_services
+from ModelForge.schemas.training_schemas import TrainingConfig
+
+
+@pytest.fixture
+def training_service():
+    reset_services()
+    yield get_training_service()
+    reset_services()
+
+
+@pytest.mark.parametrize("strategy", ["dpo", "orpo", "simpo"])
+def test_preference_strategy_with_eval_subset_runs_final_full_eval(
+    training_service, tiny_model_dir, preference_dataset, strategy
+):
+    """Periodic evals on a subset, then the full eval split once training ends."""
+    config = TrainingConfig(
+        task="text-generation",
+        model_name=tiny_model_dir,
+        dataset=preference_dataset,
+        compute_specs="low_end",
+        strategy=strategy,
+        use_4bit=False,
+        optim="adamw_torch",
+        gradient_checkpointing=False,
+        per_device_train_batch_size=4,
+        per_device_eval_batch_size=4,
+        gradient_accumulation_steps=1,
+        max_steps=2,
+        eval_steps=1,
+        max_seq_length=64,
+        eval_split=0.25,
+        eval_max_samples=4,
+        group_by_length=False,
+    ).model_dump()
+
+    result = training_service.train_model(config)
+
+    assert result["success"], result
+    assert training_service.training_status["status"] == "completed"
+    assert "eval_full" in result["phase_timings"]
+    assert "eval_loss" in result["eval_metrics"]
+    assert result["eval_count"] >= 1
+    assert "eval_count" not in result["phase_timings"]